@@ -1,6 +1,10 @@
 """API endpoints for audit logs."""
 
+from datetime import datetime
+from typing import AsyncIterator, Any, Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import StreamingResponse
 from api.schemas.audit_log import AuditLogOut, AuditLogListResponse
 from api.deps import get_current_user, enforce_rate_limit
 from application.services.core.audit_service import AuditService
@@ -9,6 +13,52 @@ from models import User, Permission
 router = APIRouter(prefix="/audit-logs", tags=["audit-logs"])
 
 
+async def _list_page(
+    cursor: Optional[str],
+    limit: int,
+    offset: int,
+    user_id: Optional[int],
+    action: Optional[str],
+    organization_id: Optional[int],
+) -> AuditLogListResponse:
+    """Fetch one page of audit logs with the approximate total."""
+    service = AuditService()
+    try:
+        logs, next_cursor = await service.list_audit_logs_page(
+            cursor=cursor,
+            limit=limit,
+            offset=offset,
+            user_id=user_id,
+            action=action,
+            organization_id=organization_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    total = await service.count_audit_logs(
+        user_id=user_id, action=action, organization_id=organization_id
+    )
+    items = [AuditLogOut.model_validate(log) for log in logs]
+    return AuditLogListResponse(
+        items=items, count=len(items), total=total, next_cursor=next_cursor
+    )
+
+
+async def _ndjson_lines(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    """Serialize audit log rows as newline-delimited JSON."""
+    async for row in rows:
+        yield AuditLogOut.model_validate(row).model_dump_json() + "\n"
+
+
+def _export_response(rows: AsyncIterator[dict[str, Any]]) -> StreamingResponse:
+    """Stream audit log rows as an NDJSON download."""
+    return StreamingResponse(
+        _ndjson_lines(rows),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="audit-logs.ndjson"'},
+    )
+
+
 @router.get(
     "/",
     response_model=AuditLogListResponse,
@@ -20,7 +70,10 @@ async def list_audit_logs(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of logs to return"
     ),
-    offset: int = Query(0, ge=0, description="Number of logs to skip"),
+    offset: int = Query(0, ge=0, description="Number of logs to skip (prefer cursor)"),
+    cursor: str | None = Query(
+        None, description="Cursor from the previous page's next_cursor"
+    ),
     user_id: int | None = Query(None, description="Filter by user ID"),
     action: str | None = Query(None, description="Filter by action"),
     organization_id: int | None = Query(None, description="Filter by organization ID"),
@@ -34,6 +87,7 @@ async def list_audit_logs(
     Args:
         limit: Maximum number of logs to return
         offset: Number of logs to skip
+        cursor: Optional cursor of the page to fetch
         user_id: Optional user ID filter
         action: Optional action filter
         organization_id: Optional organization ID filter
@@ -43,13 +97,13 @@ async def list_audit_logs(
         AuditLogListResponse: List of audit logs
 
     Raises:
-        HTTPException: 403 if not authorized
+        HTTPException: 400 if the cursor is invalid, 403 if not authorized
     """
     if not current_user.has_permission(Permission.SUPERADMIN):
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    service = AuditService()
-    logs, total = await service.list_audit_logs(
+    return await _list_page(
+        cursor=cursor,
         limit=limit,
         offset=offset,
         user_id=user_id,
@@ -57,8 +111,61 @@ async def list_audit_logs(
         organization_id=organization_id,
     )
 
-    items = [AuditLogOut.model_validate(log) for log in logs]
-    return AuditLogListResponse(items=items, count=len(items), total=total)
+
+@router.get(
+    "/export",
+    dependencies=[Depends(enforce_rate_limit)],
+    summary="Export Audit Logs",
+    description=(
+        "Stream audit logs as newline-delimited JSON (one AuditLogOut per line), "
+        "newest first. Requires SUPERADMIN permission."
+    ),
+    response_class=StreamingResponse,
+)
+async def export_audit_logs(
+    user_id: int | None = Query(None, description="Filter by user ID"),
+    action: str | None = Query(None, description="Filter by action"),
+    organization_id: int | None = Query(None, description="Filter by organization ID"),
+    since: datetime | None = Query(
+        None, description="Only include logs created at or after this time"
+    ),
+    until: datetime | None = Query(
+        None, description="Only include logs created before this time"
+    ),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Export audit logs as NDJSON.
+
+    Only SUPERADMIN users can export audit logs.
+
+    Args:
+        user_id: Optional user ID filter
+        action: Optional action filter
+        organization_id: Optional organization ID filter
+        since: Optional start of the range (inclusive)
+        until: Optional end of the range (exclusive)
+        current_user: Authenticated user
+
+    Returns:
+        StreamingResponse: NDJSON stream of audit logs
+
+    Raises:
+        HTTPException: 403 if not authorized
+    """
+    if not current_user.has_permission(Permission.SUPERADMIN):
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+
+    service = AuditService()
+    return _export_response(
+        service.export_audit_logs(
+            user_id=user_id,
+            action=action,
+            organization_id=organization_id,
+            since=since,
+            until=until,
+        )
+    )
 
 
 @router.get(
@@ -73,7 +180,10 @@ async def list_organization_audit_logs(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of logs to return"
     ),
-    offset: int = Query(0, ge=0, description="Number of logs to skip"),
+    offset: int = Query(0, ge=0, description="Number of logs to skip (prefer cursor)"),
+    cursor: str | None = Query(
+        None, description="Cursor from the previous page's next_cursor"
+    ),
     user_id: int | None = Query(None, description="Filter by user ID"),
     action: str | None = Query(None, description="Filter by action"),
     current_user: User = Depends(get_current_user),
@@ -87,6 +197,7 @@ async def list_organization_audit_logs(
         organization_id: Organization ID
         limit: Maximum number of logs to return
         offset: Number of logs to skip
+        cursor: Optional cursor of the page to fetch
         user_id: Optional user ID filter
         action: Optional action filter
         current_user: Authenticated user
@@ -95,7 +206,7 @@ async def list_organization_audit_logs(
         AuditLogListResponse: List of audit logs
 
     Raises:
-        HTTPException: 403 if not authorized
+        HTTPException: 400 if the cursor is invalid, 403 if not authorized
     """
     # Check authorization
     from application.services.organizations.organization_service import (
@@ -107,8 +218,8 @@ async def list_organization_audit_logs(
     if not can_admin:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    service = AuditService()
-    logs, total = await service.list_audit_logs(
+    return await _list_page(
+        cursor=cursor,
         limit=limit,
         offset=offset,
         user_id=user_id,
@@ -116,8 +227,67 @@ async def list_organization_audit_logs(
         organization_id=organization_id,
     )
 
-    items = [AuditLogOut.model_validate(log) for log in logs]
-    return AuditLogListResponse(items=items, count=len(items), total=total)
+
+@router.get(
+    "/organizations/{organization_id}/export",
+    dependencies=[Depends(enforce_rate_limit)],
+    summary="Export Organization Audit Logs",
+    description=(
+        "Stream an organization's audit logs as newline-delimited JSON, "
+        "newest first."
+    ),
+    response_class=StreamingResponse,
+)
+async def export_organization_audit_logs(
+    organization_id: int = Path(..., description="Organization ID"),
+    user_id: int | None = Query(None, description="Filter by user ID"),
+    action: str | None = Query(None, description="Filter by action"),
+    since: datetime | None = Query(
+        None, description="Only include logs created at or after this time"
+    ),
+    until: datetime | None = Query(
+        None, description="Only include logs created before this time"
+    ),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Export an organization's audit logs as NDJSON.
+
+    User must be able to admin the organization.
+
+    Args:
+        organization_id: Organization ID
+        user_id: Optional user ID filter
+        action: Optional action filter
+        since: Optional start of the range (inclusive)
+        until: Optional end of the range (exclusive)
+        current_user: Authenticated user
+
+    Returns:
+        StreamingResponse: NDJSON stream of audit logs
+
+    Raises:
+        HTTPException: 403 if not authorized
+    """
+    from application.services.organizations.organization_service import (
+        OrganizationService,
+    )
+
+    org_service = OrganizationService()
+    can_admin = await org_service.user_can_admin_org(current_user, organization_id)
+    if not can_admin:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+
+    service = AuditService()
+    return _export_response(
+        service.export_audit_logs(
+            user_id=user_id,
+            action=action,
+            organization_id=organization_id,
+            since=since,
+            until=until,
+        )
+    )
 
 
 @router.get(
@@ -132,7 +302,10 @@ async def list_user_audit_logs(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of logs to return"
     ),
-    offset: int = Query(0, ge=0, description="Number of logs to skip"),
+    offset: int = Query(0, ge=0, description="Number of logs to skip (prefer cursor)"),
+    cursor: str | None = Query(
+        None, description="Cursor from the previous page's next_cursor"
+    ),
     action: str | None = Query(None, description="Filter by action"),
     organization_id: int | None = Query(None, description="Filter by organization ID"),
     current_user: User = Depends(get_current_user),
@@ -146,6 +319,7 @@ async def list_user_audit_logs(
         user_id: User ID
         limit: Maximum number of logs to return
         offset: Number of logs to skip
+        cursor: Optional cursor of the page to fetch
         action: Optional action filter
         organization_id: Optional organization ID filter
         current_user: Authenticated user
@@ -154,7 +328,7 @@ async def list_user_audit_logs(
         AuditLogListResponse: List of audit logs
 
     Raises:
-        HTTPException: 403 if not authorized
+        HTTPException: 400 if the cursor is invalid, 403 if not authorized
     """
     # Users can view their own logs, SUPERADMIN can view any
     if current_user.id != user_id and not current_user.has_permission(
@@ -162,14 +336,11 @@ async def list_user_audit_logs(
     ):
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    service = AuditService()
-    logs, total = await service.list_audit_logs(
+    return await _list_page(
+        cursor=cursor,
         limit=limit,
         offset=offset,
         user_id=user_id,
         action=action,
         organization_id=organization_id,
     )
-
-    items = [AuditLogOut.model_validate(log) for log in logs]
-    return AuditLogListResponse(items=items, count=len(items), total=total)
@@ -4,9 +4,13 @@ import logging
 from fastapi import APIRouter, HTTPException, Query
 from api.schemas.common import HealthResponse, ServiceStatus
 from config import settings
+from application.utils.startup_profile import get_startup_profile
+from application.utils.oauth_clients import get_oauth_http_stats
 from tortoise import Tortoise
 from discordbot.client import get_bot_instance
-from racetime.client import get_all_racetime_bot_instances
+from discordbot.interactions import get_interaction_metrics
+from racetime.client import get_all_racetime_bot_instances, get_racetime_readiness
+from racetime.handler_metrics import get_race_handler_metrics
 import sentry_sdk
 
 logger = logging.getLogger(__name__)
@@ -48,7 +52,11 @@ async def check_discord_health() -> ServiceStatus:
             )
 
         if bot.is_ready():
-            return ServiceStatus(status="ok", message="Discord bot connected and ready")
+            return ServiceStatus(
+                status="ok",
+                message="Discord bot connected and ready",
+                details={"interactions": get_interaction_metrics().snapshot()},
+            )
         else:
             return ServiceStatus(
                 status="error", message="Discord bot not ready or disconnected"
@@ -78,9 +86,16 @@ async def check_racetime_health() -> ServiceStatus:
         bot_count = len(bots)
         categories = ", ".join(bots.keys())
 
+        # Startup readiness: open rooms rejoined after a restart
+        readiness = get_racetime_readiness()
+        rooms = f"{readiness['rooms_attached']}/{readiness['rooms_expected']} open rooms attached"
+        if not readiness["rejoin_complete"]:
+            rooms += " (rejoin in progress)"
+
         return ServiceStatus(
             status="ok",
-            message=f"{bot_count} RaceTime bot(s) running for categories: {categories}",
+            message=f"{bot_count} RaceTime bot(s) running for categories: {categories}; {rooms}",
+            details={**readiness, "handlers": get_race_handler_metrics().snapshot()},
         )
     except Exception as e:
         logger.error("RaceTime health check failed: %s", e)
@@ -89,6 +104,26 @@ async def check_racetime_health() -> ServiceStatus:
         )
 
 
+def check_oauth_health() -> ServiceStatus:
+    """
+    Report OAuth provider request metrics.
+
+    Returns:
+        ServiceStatus: Request counts and latency per OAuth provider
+    """
+    stats = get_oauth_http_stats()
+    if not stats:
+        return ServiceStatus(status="ok", message="No OAuth requests yet")
+
+    requests = sum(provider["requests"] for provider in stats.values())
+    errors = sum(provider["errors"] for provider in stats.values())
+    return ServiceStatus(
+        status="ok",
+        message=f"{requests} OAuth request(s), {errors} error(s)",
+        details=stats,
+    )
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -113,7 +148,26 @@ async def check_racetime_health() -> ServiceStatus:
                             },
                             "racetime": {
                                 "status": "ok",
-                                "message": "2 RaceTime bot(s) running for categories: alttpr, smz3",
+                                "message": "2 RaceTime bot(s) running for categories: alttpr, smz3; 5/5 open rooms attached",
+                                "details": {
+                                    "bots_expected": 2,
+                                    "bots_running": 2,
+                                    "rooms_expected": 5,
+                                    "rooms_attached": 5,
+                                    "rejoin_complete": True,
+                                    "categories": {
+                                        "alttpr": {
+                                            "expected": 3,
+                                            "attached": 3,
+                                            "complete": True,
+                                        },
+                                        "smz3": {
+                                            "expected": 2,
+                                            "attached": 2,
+                                            "complete": True,
+                                        },
+                                    },
+                                },
                             },
                         },
                     }
@@ -150,6 +204,7 @@ async def health(
     db_status = await check_database_health()
     discord_status = await check_discord_health()
     racetime_status = await check_racetime_health()
+    oauth_status = check_oauth_health()
 
     # Determine overall status
     overall_status = "ok"
@@ -157,6 +212,7 @@ async def health(
         "database": db_status,
         "discord": discord_status,
         "racetime": racetime_status,
+        "oauth": oauth_status,
     }
 
     # If any service has an error, overall status is degraded
@@ -165,7 +221,15 @@ async def health(
             overall_status = "degraded"
             break
 
-    return HealthResponse(status=overall_status, version="0.1.0", services=services)
+    profile = get_startup_profile()
+    profile.record_health_ok()
+
+    return HealthResponse(
+        status=overall_status,
+        version="0.1.0",
+        services=services,
+        startup=profile.as_dict(),
+    )
 
 
 @router.get(
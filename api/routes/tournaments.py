@@ -1,6 +1,9 @@
 """Tournament-related API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response
 from api.schemas.tournament import (
     TournamentOut,
     TournamentListResponse,
@@ -17,6 +20,7 @@ from api.schemas.tournament import (
     CrewApprovalRequest,
 )
 from api.deps import get_current_user, enforce_rate_limit
+from application.utils.pagination import etag_matches, weak_etag
 from modules.tournament.services.tournament_service import TournamentService
 from models import User
 
@@ -364,15 +368,41 @@ async def unregister_player(
     response_model=MatchListResponse,
     dependencies=[Depends(enforce_rate_limit)],
     summary="List Matches",
-    description="List all matches for an organization.",
+    description=(
+        "List matches for an organization ordered by scheduled time, one keyset "
+        "page at a time. Use next_cursor to fetch the following page and "
+        "updated_since (e.g. a previous synced_at) to poll for changes only. "
+        "Responses carry a weak ETag; send it as If-None-Match to get 304 when "
+        "the page is unchanged."
+    ),
     responses={
         200: {"description": "Matches retrieved successfully"},
+        304: {"description": "Page unchanged since the ETag sent in If-None-Match"},
+        400: {"description": "Invalid cursor or state filter"},
         401: {"description": "Invalid or missing authentication token"},
         429: {"description": "Rate limit exceeded"},
     },
 )
 async def list_matches(
+    response: Response,
     organization_id: int = Path(..., description="Organization ID"),
+    state: Optional[list[str]] = Query(
+        None,
+        description="Filter by state (pending, scheduled, checked_in, in_progress, finished); repeatable",
+    ),
+    tournament_id: Optional[list[int]] = Query(
+        None, description="Filter by tournament ID; repeatable"
+    ),
+    updated_since: Optional[datetime] = Query(
+        None, description="Only return matches updated at or after this time"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page's next_cursor"
+    ),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of matches to return"
+    ),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(
         get_current_user
     ),  # noqa: ARG001 - authentication required
@@ -380,19 +410,52 @@ async def list_matches(
     """
     List organization matches.
 
-    Returns all matches for the specified organization.
+    Returns one page of matches for the specified organization.
 
     Args:
+        response: Outgoing response (for the ETag header)
         organization_id: ID of the organization
+        state: Optional state filters
+        tournament_id: Optional tournament filters
+        updated_since: Optional delta-sync timestamp
+        cursor: Optional cursor of the page to fetch
+        limit: Page size
+        if_none_match: ETag of the client's cached copy
         current_user: Authenticated user making the request
 
     Returns:
-        MatchListResponse: List of matches
+        MatchListResponse: Page of matches (or 304 Not Modified)
+
+    Raises:
+        HTTPException: 400 if the cursor or a state filter is invalid
     """
+    synced_at = datetime.now(timezone.utc)
     service = TournamentService()
-    matches = await service.list_org_matches(organization_id)
+    try:
+        matches, next_cursor = await service.list_org_matches_page(
+            organization_id,
+            states=state,
+            tournament_ids=tournament_id,
+            updated_since=updated_since,
+            cursor=cursor,
+            limit=limit,
+            prefetch=False,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    etag = weak_etag(
+        [organization_id, state, tournament_id, updated_since, cursor, limit]
+        + [(match.id, match.updated_at) for match in matches]
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     items = [MatchOut.model_validate(match) for match in matches]
-    return MatchListResponse(items=items, count=len(items))
+    return MatchListResponse(
+        items=items, count=len(items), next_cursor=next_cursor, synced_at=synced_at
+    )
 
 
 @router.post(
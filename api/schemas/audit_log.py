@@ -24,4 +24,5 @@ class AuditLogListResponse(BaseModel):
 
     items: list[AuditLogOut]
     count: int
-    total: int  # Total matching records before pagination
+    total: int  # Approximate matching records before pagination (cached)
+    next_cursor: Optional[str] = None  # Cursor for the next page (None on the last)
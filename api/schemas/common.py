@@ -1,7 +1,7 @@
 """Common Pydantic schemas for API responses."""
 
 from pydantic import BaseModel, Field
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 
 class ServiceStatus(BaseModel):
@@ -11,6 +11,9 @@ class ServiceStatus(BaseModel):
     message: Optional[str] = Field(
         None, description="Optional status message or error details"
     )
+    details: Optional[Dict[str, Any]] = Field(
+        None, description="Optional structured metrics for the service"
+    )
 
 
 class HealthResponse(BaseModel):
@@ -26,3 +29,7 @@ class HealthResponse(BaseModel):
         default_factory=dict,
         description="Health status of individual upstream services",
     )
+    startup: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Startup phase timings (ms) and time to first healthy response",
+    )
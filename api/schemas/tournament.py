@@ -104,6 +104,13 @@ class MatchListResponse(BaseModel):
 
     items: list[MatchOut] = Field(..., description="List of match objects")
     count: int = Field(..., description="Total number of matches in the result")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (null on the last page)"
+    )
+    synced_at: Optional[datetime] = Field(
+        None,
+        description="Server time the page was read; pass as updated_since to poll for changes",
+    )
 
 
 class MatchCreateRequest(BaseModel):
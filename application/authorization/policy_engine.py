@@ -13,11 +13,13 @@ Evaluation uses DENY-wins logic: if any policy denies, access is denied.
 import logging
 import fnmatch
 from dataclasses import dataclass
-from typing import List
-from models import User, Permission, OrganizationMember, OrganizationMemberRole
+from typing import List, Optional, Tuple
+from models import Permission, OrganizationMember, OrganizationMemberRole
 from models import PolicyStatement, RolePolicy, UserPolicy
 from application.authorization.builtin_roles import get_builtin_role_actions
 from application.authorization.policy_cache import PolicyCache
+from application.repositories.user_repository import UserRepository
+from application.utils.request_scope import scoped_get
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +105,7 @@ class PolicyEngine:
                 )
 
         # Step 1: Load user
-        user = await User.get_or_none(id=context.user_id)
+        user = await UserRepository().get_by_id(context.user_id)
         if not user:
             return PolicyEvaluationResult(
                 allowed=False, reason="User not found", matched_policies=[]
@@ -235,11 +237,39 @@ class PolicyEngine:
         Returns:
             True if user is a member
         """
-        member = await OrganizationMember.get_or_none(
-            organization_id=organization_id, user_id=user_id
-        )
+        member, _ = await self._load_membership(user_id, organization_id)
         return member is not None
 
+    async def _load_membership(
+        self, user_id: int, organization_id: int
+    ) -> Tuple[Optional[OrganizationMember], List[OrganizationMemberRole]]:
+        """
+        Load the member record and its role assignments (with roles).
+
+        Membership, built-in role and custom role checks all need these rows,
+        so they are loaded once and memoized for the current request.
+
+        Args:
+            user_id: User ID
+            organization_id: Organization ID
+
+        Returns:
+            Tuple of (member or None, role assignments)
+        """
+
+        async def load():
+            member = await OrganizationMember.get_or_none(
+                organization_id=organization_id, user_id=user_id
+            )
+            if not member:
+                return None, []
+            role_assignments = await OrganizationMemberRole.filter(
+                member=member
+            ).prefetch_related("role")
+            return member, role_assignments
+
+        return await scoped_get("policy_member", (organization_id, user_id), load)
+
     async def _collect_policies(
         self, context: AuthorizationContext
     ) -> List[PolicyStatement]:
@@ -309,19 +339,12 @@ class PolicyEngine:
         Returns:
             List of built-in role names (e.g., ["Admin", "Tournament Manager"])
         """
-        # Get member record
-        member = await OrganizationMember.get_or_none(
-            organization_id=organization_id, user_id=user_id
-        )
+        # Get member record and role assignments
+        member, role_assignments = await self._load_membership(user_id, organization_id)
 
         if not member:
             return []
 
-        # Get role assignments
-        role_assignments = await OrganizationMemberRole.filter(
-            member=member
-        ).prefetch_related("role")
-
         # Filter for built-in roles
         builtin_role_names = []
         for assignment in role_assignments:
@@ -343,19 +366,12 @@ class PolicyEngine:
         Returns:
             List of PolicyStatement objects from custom roles
         """
-        # Get member record
-        member = await OrganizationMember.get_or_none(
-            organization_id=organization_id, user_id=user_id
-        )
+        # Get member record and role assignments
+        member, role_assignments = await self._load_membership(user_id, organization_id)
 
         if not member:
             return []
 
-        # Get role assignments for custom roles
-        role_assignments = await OrganizationMemberRole.filter(
-            member=member
-        ).prefetch_related("role__policies__policy_statement")
-
         # Collect policies from custom roles only
         policies = []
         for assignment in role_assignments:
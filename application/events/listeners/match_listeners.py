@@ -20,20 +20,11 @@ async def log_match_settings_submitted(
 ) -> None:
     """Log tournament match settings submission to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
 
-    # Get the user who submitted
-    user = (
-        await user_repo.get_by_id(event.submitted_by_user_id)
-        if event.submitted_by_user_id
-        else None
-    )
-
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.submitted_by_user_id,
         action="tournament_match_settings_submitted",
         details={
             "entity_id": event.entity_id,
@@ -56,16 +47,11 @@ async def log_match_settings_submitted(
 async def log_match_finished(event: MatchFinishedEvent) -> None:
     """Log match finish to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who finished the match
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="match_finished",
         details={
             "entity_id": event.entity_id,
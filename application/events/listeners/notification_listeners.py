@@ -800,16 +800,11 @@ async def notify_live_race_cancelled(event: AsyncLiveRaceCancelledEvent) -> None
 async def log_async_live_race_updated(event: AsyncLiveRaceUpdatedEvent) -> None:
     """Log async live race update to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who updated the live race
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="async_live_race_updated",
         details={
             "entity_id": event.entity_id,
@@ -22,16 +22,11 @@ logger = logging.getLogger(__name__)
 async def log_organization_created(event: OrganizationCreatedEvent) -> None:
     """Log organization creation to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
 
-    # Get the user who created the organization
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
-
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="organization_created",
         details={
             "entity_id": event.entity_id,
@@ -46,20 +41,11 @@ async def log_organization_created(event: OrganizationCreatedEvent) -> None:
 async def log_organization_member_added(event: OrganizationMemberAddedEvent) -> None:
     """Log member addition to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who added the member
-    user = (
-        await user_repo.get_by_id(event.added_by_user_id)
-        if event.added_by_user_id
-        else None
-    )
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.added_by_user_id,
         action="organization_member_added",
         details={
             "member_user_id": event.member_user_id,
@@ -80,20 +66,11 @@ async def log_organization_member_removed(
 ) -> None:
     """Log member removal to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who removed the member
-    user = (
-        await user_repo.get_by_id(event.removed_by_user_id)
-        if event.removed_by_user_id
-        else None
-    )
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.removed_by_user_id,
         action="organization_member_removed",
         details={
             "member_user_id": event.member_user_id,
@@ -113,16 +90,11 @@ async def log_organization_member_removed(
 async def log_organization_updated(event: OrganizationUpdatedEvent) -> None:
     """Log organization update to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who updated the organization
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="organization_updated",
         details={
             "entity_id": event.entity_id,
@@ -137,16 +109,11 @@ async def log_organization_updated(event: OrganizationUpdatedEvent) -> None:
 async def log_organization_deleted(event: OrganizationDeletedEvent) -> None:
     """Log organization deletion to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
 
-    # Get the user who deleted the organization
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
-
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="organization_deleted",
         details={
             "entity_id": event.entity_id,
@@ -162,16 +129,11 @@ async def log_organization_member_permission_changed(
 ) -> None:
     """Log member permission change to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who changed the permission
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="organization_member_permission_changed",
         details={
             "member_user_id": event.member_user_id,
@@ -19,18 +19,11 @@ logger = logging.getLogger(__name__)
 async def log_race_submitted(event: RaceSubmittedEvent) -> None:
     """Log race submission to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
 
-    # Get the racer who submitted
-    user = (
-        await user_repo.get_by_id(event.racer_user_id) if event.racer_user_id else None
-    )
-
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.racer_user_id,
         action="race_submitted",
         details={
             "entity_id": event.entity_id,
@@ -51,20 +44,11 @@ async def log_race_submitted(event: RaceSubmittedEvent) -> None:
 async def log_race_approved(event: RaceApprovedEvent) -> None:
     """Log race approval to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the reviewer who approved
-    user = (
-        await user_repo.get_by_id(event.reviewer_user_id)
-        if event.reviewer_user_id
-        else None
-    )
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.reviewer_user_id,
         action="race_approved",
         details={
             "entity_id": event.entity_id,
@@ -84,20 +68,11 @@ async def log_race_approved(event: RaceApprovedEvent) -> None:
 async def log_race_rejected(event: RaceRejectedEvent) -> None:
     """Log race rejection to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the reviewer who rejected
-    user = (
-        await user_repo.get_by_id(event.reviewer_user_id)
-        if event.reviewer_user_id
-        else None
-    )
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.reviewer_user_id,
         action="race_rejected",
         details={
             "entity_id": event.entity_id,
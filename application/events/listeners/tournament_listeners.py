@@ -21,16 +21,11 @@ logger = logging.getLogger(__name__)
 async def log_tournament_created(event: TournamentCreatedEvent) -> None:
     """Log tournament creation to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
 
-    # Get the user who created the tournament
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
-
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="tournament_created",
         details={
             "entity_id": event.entity_id,
@@ -46,16 +41,11 @@ async def log_tournament_created(event: TournamentCreatedEvent) -> None:
 async def log_tournament_updated(event: TournamentUpdatedEvent) -> None:
     """Log tournament update to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who updated the tournament
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="tournament_updated",
         details={
             "entity_id": event.entity_id,
@@ -70,16 +60,11 @@ async def log_tournament_updated(event: TournamentUpdatedEvent) -> None:
 async def log_tournament_deleted(event: TournamentDeletedEvent) -> None:
     """Log tournament deletion to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who deleted the tournament
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="tournament_deleted",
         details={
             "entity_id": event.entity_id,
@@ -93,16 +78,11 @@ async def log_tournament_deleted(event: TournamentDeletedEvent) -> None:
 async def log_tournament_started(event: TournamentStartedEvent) -> None:
     """Log tournament start to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
 
-    # Get the user who started the tournament
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
-
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="tournament_started",
         details={
             "entity_id": event.entity_id,
@@ -116,16 +96,11 @@ async def log_tournament_started(event: TournamentStartedEvent) -> None:
 async def log_tournament_ended(event: TournamentEndedEvent) -> None:
     """Log tournament end to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who ended the tournament
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="tournament_ended",
         details={
             "entity_id": event.entity_id,
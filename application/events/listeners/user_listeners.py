@@ -20,16 +20,11 @@ logger = logging.getLogger(__name__)
 async def log_user_created(event: UserCreatedEvent) -> None:
     """Log user creation to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
 
-    # Get the user who performed the action (may be system/None for self-registration)
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
-
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="user_created",
         details={
             "entity_id": event.entity_id,
@@ -45,16 +40,11 @@ async def log_user_created(event: UserCreatedEvent) -> None:
 async def log_user_permission_changed(event: UserPermissionChangedEvent) -> None:
     """Log user permission changes to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who performed the action
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="user_permission_changed",
         details={
             "entity_id": event.entity_id,
@@ -75,16 +65,11 @@ async def log_user_permission_changed(event: UserPermissionChangedEvent) -> None
 async def log_user_updated(event: UserUpdatedEvent) -> None:
     """Log user update to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
 
-    # Get the user who performed the action
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
-
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="user_updated",
         details={
             "entity_id": event.entity_id,
@@ -99,16 +84,11 @@ async def log_user_updated(event: UserUpdatedEvent) -> None:
 async def log_user_deleted(event: UserDeletedEvent) -> None:
     """Log user deletion to audit log."""
     from application.services.core.audit_service import AuditService
-    from application.repositories.user_repository import UserRepository
 
     audit_service = AuditService()
-    user_repo = UserRepository()
-
-    # Get the user who performed the action
-    user = await user_repo.get_by_id(event.user_id) if event.user_id else None
 
-    await audit_service.log_action(
-        user=user,
+    await audit_service.record(
+        user_id=event.user_id,
         action="user_deleted",
         details={
             "entity_id": event.entity_id,
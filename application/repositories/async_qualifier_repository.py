@@ -1,15 +1,18 @@
 """Repository for async qualifier data access."""
 
 from __future__ import annotations
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
 from datetime import datetime, timezone, timedelta
 import logging
 
+from config import settings
+from models.user import is_system_user_id
 from modules.async_qualifier.models.async_qualifier import (
     AsyncQualifier,
     AsyncQualifierPool,
     AsyncQualifierPermalink,
     AsyncQualifierRace,
+    AsyncQualifierParticipantStats,
     AsyncQualifierAuditLog,
 )
 
@@ -29,6 +32,10 @@ class AsyncQualifierRepository:
             organization_id=organization_id, is_active=True
         ).all()
 
+    async def list_ids(self) -> List[int]:
+        """List the IDs of all async qualifiers."""
+        return list(await AsyncQualifier.all().values_list("id", flat=True))
+
     async def get_by_id(
         self, tournament_id: int, organization_id: int
     ) -> Optional[AsyncQualifier]:
@@ -335,12 +342,19 @@ class AsyncQualifierRepository:
         if not tournament:
             return None
 
+        thread_open_time = datetime.now(timezone.utc) if discord_thread_id else None
         race = await AsyncQualifierRace.create(
             tournament_id=tournament_id,
             permalink_id=permalink_id,
             user_id=user_id,
             discord_thread_id=discord_thread_id,
-            thread_open_time=datetime.now(timezone.utc) if discord_thread_id else None,
+            thread_open_time=thread_open_time,
+            thread_timeout_time=(
+                thread_open_time
+                + timedelta(minutes=settings.ASYNC_RACE_PENDING_TIMEOUT_MINUTES)
+                if thread_open_time
+                else None
+            ),
         )
         logger.info(
             "Created race %s for user %s in tournament %s",
@@ -381,6 +395,9 @@ class AsyncQualifierRepository:
         user_id: Optional[int] = None,
     ) -> AsyncQualifierAuditLog:
         """Create an audit log entry."""
+        # The system user has no row; its actions are stored without a user
+        if is_system_user_id(user_id):
+            user_id = None
         audit_log = await AsyncQualifierAuditLog.create(
             tournament_id=tournament_id,
             action=action,
@@ -542,3 +559,136 @@ class AsyncQualifierRepository:
         await race.save()
         logger.info("Marked race %s as reattempted", race_id)
         return race
+
+    # Participant stats methods
+
+    async def get_pool_layout(
+        self, tournament_id: int
+    ) -> Optional[Tuple[int, List[int]]]:
+        """
+        Get the scoring layout of a tournament.
+
+        Args:
+            tournament_id: Tournament ID
+
+        Returns:
+            Tuple of (runs_per_pool, pool IDs), or None if not found
+        """
+        runs_per_pool = await AsyncQualifier.filter(id=tournament_id).values_list(
+            "runs_per_pool", flat=True
+        )
+        if not runs_per_pool:
+            return None
+        pool_ids = await AsyncQualifierPool.filter(
+            tournament_id=tournament_id
+        ).values_list("id", flat=True)
+        return runs_per_pool[0], sorted(pool_ids)
+
+    async def list_participant_races(
+        self, tournament_id: int, user_ids: Optional[Iterable[int]] = None
+    ) -> List[AsyncQualifierRace]:
+        """
+        List the races of participants with their permalinks.
+
+        Args:
+            tournament_id: Tournament ID
+            user_ids: Participants to include (default: everyone)
+
+        Returns:
+            List of races
+        """
+        query = AsyncQualifierRace.filter(tournament_id=tournament_id)
+        if user_ids is not None:
+            query = query.filter(user_id__in=list(user_ids))
+        return list(await query.select_related("permalink"))
+
+    async def list_participant_stats(
+        self,
+        tournament_id: int,
+        user_ids: Optional[Iterable[int]] = None,
+        with_users: bool = False,
+    ) -> List[AsyncQualifierParticipantStats]:
+        """
+        List participant stats of a tournament, best score first.
+
+        Args:
+            tournament_id: Tournament ID
+            user_ids: Participants to include (default: everyone)
+            with_users: Also load each participant's user
+
+        Returns:
+            List of participant stats
+        """
+        query = AsyncQualifierParticipantStats.filter(tournament_id=tournament_id)
+        if user_ids is not None:
+            query = query.filter(user_id__in=list(user_ids))
+        if with_users:
+            query = query.select_related("user")
+        return list(await query.order_by("-score", "id"))
+
+    async def get_participant_stats(
+        self, tournament_id: int, user_id: int
+    ) -> Optional[AsyncQualifierParticipantStats]:
+        """Get the stats of one participant in a tournament."""
+        return await AsyncQualifierParticipantStats.get_or_none(
+            tournament_id=tournament_id, user_id=user_id
+        )
+
+    async def count_participant_stats(self, tournament_id: int) -> int:
+        """Count the participants of a tournament with stats."""
+        return await AsyncQualifierParticipantStats.filter(
+            tournament_id=tournament_id
+        ).count()
+
+    async def list_participant_pairs(self) -> List[Tuple[int, int]]:
+        """List the distinct (tournament ID, user ID) pairs of all races."""
+        return list(
+            await AsyncQualifierRace.all()
+            .distinct()
+            .values_list("tournament_id", "user_id")
+        )
+
+    async def list_participant_stats_pairs(self) -> List[Tuple[int, int]]:
+        """List the (tournament ID, user ID) pairs of all participant stats."""
+        return list(
+            await AsyncQualifierParticipantStats.all().values_list(
+                "tournament_id", "user_id"
+            )
+        )
+
+    async def save_participant_stats(
+        self,
+        created: List[AsyncQualifierParticipantStats],
+        updated: List[AsyncQualifierParticipantStats],
+        fields: Iterable[str],
+    ) -> None:
+        """
+        Write recomputed participant stats.
+
+        Rows created concurrently by another refresh are skipped; that
+        refresh computed them from the same races.
+
+        Args:
+            created: New rows
+            updated: Existing rows with changed values
+            fields: Fields to write on the existing rows
+        """
+        if created:
+            await AsyncQualifierParticipantStats.bulk_create(
+                created, ignore_conflicts=True
+            )
+        if updated:
+            now = datetime.now(timezone.utc)
+            for stats in updated:
+                stats.updated_at = now
+            await AsyncQualifierParticipantStats.bulk_update(
+                updated, fields=[*fields, "updated_at"]
+            )
+
+    async def delete_participant_stats(
+        self, tournament_id: int, user_ids: Iterable[int]
+    ) -> int:
+        """Delete the stats of participants who no longer have races."""
+        return await AsyncQualifierParticipantStats.filter(
+            tournament_id=tournament_id, user_id__in=list(user_ids)
+        ).delete()
@@ -4,8 +4,44 @@ Audit log repository for data access.
 This module provides data access methods for AuditLog model.
 """
 
+from datetime import datetime, timezone
+from tortoise import Tortoise
+from tortoise.expressions import Q
+from application.utils.versioned_cache import VersionedCache
+from config import settings
 from models import AuditLog, User
-from typing import Optional, Any
+from models.user import is_system_user_id
+from typing import AsyncIterator, Iterable, Optional, Any
+
+# Detail keys copied into their own indexed columns
+PROMOTED_DETAIL_KEYS = ("tournament_id", "match_id")
+
+# Columns included in exports
+EXPORT_FIELDS = (
+    "id",
+    "user_id",
+    "action",
+    "details",
+    "ip_address",
+    "organization_id",
+    "created_at",
+)
+
+# Approximate totals, partitioned by organization (None for unscoped queries)
+_count_cache = VersionedCache(
+    "audit_log_counts", settings.AUDIT_COUNT_CACHE_TTL_SECONDS
+)
+
+
+def _promoted_columns(details: Optional[dict[str, Any]]) -> dict[str, Optional[int]]:
+    """Get the indexed column values for the promoted detail keys."""
+    columns: dict[str, Optional[int]] = {}
+    for key in PROMOTED_DETAIL_KEYS:
+        value = details.get(key) if details else None
+        columns[key] = (
+            value if isinstance(value, int) and not isinstance(value, bool) else None
+        )
+    return columns
 
 
 class AuditRepository:
@@ -41,8 +77,60 @@ class AuditRepository:
             details=details,
             ip_address=ip_address,
             organization_id=organization_id,
+            **_promoted_columns(details),
+        )
+
+    def build(
+        self,
+        action: str,
+        user_id: Optional[int] = None,
+        details: Optional[dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        organization_id: Optional[int] = None,
+        created_at: Optional[datetime] = None,
+    ) -> AuditLog:
+        """
+        Build an unsaved audit log entry (see create_many).
+
+        Args:
+            action: Action name/type
+            user_id: ID of the user who performed the action
+            details: Additional details about the action
+            ip_address: IP address of the user
+            organization_id: Organization context
+            created_at: When the action happened (default: now)
+
+        Returns:
+            AuditLog: Unsaved audit log entry
+        """
+        # The system user has no row; its actions are stored without a user
+        if is_system_user_id(user_id):
+            user_id = None
+        return AuditLog(
+            user_id=user_id,
+            action=action,
+            details=details,
+            ip_address=ip_address,
+            organization_id=organization_id,
+            created_at=created_at or datetime.now(timezone.utc),
+            **_promoted_columns(details),
         )
 
+    async def create_many(self, entries: Iterable[AuditLog]) -> int:
+        """
+        Insert built audit log entries in one batch.
+
+        Args:
+            entries: Entries from build()
+
+        Returns:
+            int: Number of entries written
+        """
+        entries = list(entries)
+        if entries:
+            await AuditLog.bulk_create(entries)
+        return len(entries)
+
     async def get_recent(self, limit: int = 100) -> list[AuditLog]:
         """
         Get recent audit logs.
@@ -124,45 +212,167 @@ class AuditRepository:
             await AuditLog.filter(action=action).prefetch_related("user").limit(limit)
         )
 
-    async def list_with_filters(
+    async def list_page(
         self,
-        limit: int = 100,
+        limit: Optional[int] = 100,
+        after: Optional[tuple[datetime, int]] = None,
         offset: int = 0,
         user_id: Optional[int] = None,
         action: Optional[str] = None,
         organization_id: Optional[int] = None,
-    ) -> tuple[list[AuditLog], int]:
+        prefetch: bool = True,
+    ) -> list[AuditLog]:
         """
-        List audit logs with optional filters and pagination.
+        List one keyset page of audit logs, newest first.
+
+        Ordered by (created_at, id) descending, which the per-filter composite
+        indexes serve without a sort, so every page costs the same however
+        deep it is.
 
         Args:
-            limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            limit: Maximum number of logs to return (None for all)
+            after: Keyset (created_at, id) of the last log on the previous page
+            offset: Number of logs to skip (prefer ``after``)
             user_id: Optional user ID filter
             action: Optional action filter
             organization_id: Optional organization ID filter
+            prefetch: Whether to prefetch the user who performed each action
 
         Returns:
-            Tuple of (logs, total_count)
+            list[AuditLog]: Audit log entries
+        """
+        query = AuditLog.filter(self._log_filter(user_id, action, organization_id))
+        if after is not None:
+            query = query.filter(self._before_keyset(after))
+
+        query = query.order_by("-created_at", "-id")
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        if prefetch:
+            query = query.prefetch_related("user")
+        return await query
+
+    async def count_with_filters(
+        self,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        organization_id: Optional[int] = None,
+    ) -> int:
         """
-        query = AuditLog.all()
+        Count audit logs matching the filters (approximate).
 
+        Totals are cached per filter combination for
+        AUDIT_COUNT_CACHE_TTL_SECONDS and not invalidated by new entries. On
+        MySQL the unfiltered total is read from the table statistics instead
+        of counting every row.
+
+        Args:
+            user_id: Optional user ID filter
+            action: Optional action filter
+            organization_id: Optional organization ID filter
+
+        Returns:
+            int: Approximate number of matching logs
+        """
+
+        async def load() -> int:
+            if user_id is None and action is None and organization_id is None:
+                estimate = await self._estimate_table_rows()
+                if estimate is not None:
+                    return estimate
+            return await AuditLog.filter(
+                self._log_filter(user_id, action, organization_id)
+            ).count()
+
+        return await _count_cache.get_or_load(organization_id, (user_id, action), load)
+
+    async def iter_export(
+        self,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        organization_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over matching audit logs as plain rows, newest first.
+
+        Reads the range in keyset chunks of ``chunk_size`` rows, so only one
+        chunk is held in memory at a time.
+
+        Args:
+            user_id: Optional user ID filter
+            action: Optional action filter
+            organization_id: Optional organization ID filter
+            since: Only include logs created at or after this time
+            until: Only include logs created before this time
+            chunk_size: Rows per query (default: AUDIT_EXPORT_CHUNK_SIZE)
+
+        Yields:
+            dict: Audit log column values
+        """
+        chunk_size = chunk_size or settings.AUDIT_EXPORT_CHUNK_SIZE
+        condition = self._log_filter(user_id, action, organization_id)
+        if since is not None:
+            condition &= Q(created_at__gte=since)
+        if until is not None:
+            condition &= Q(created_at__lt=until)
+
+        after = None
+        while True:
+            query = AuditLog.filter(condition)
+            if after is not None:
+                query = query.filter(self._before_keyset(after))
+            rows = (
+                await query.order_by("-created_at", "-id")
+                .limit(chunk_size)
+                .values(*EXPORT_FIELDS)
+            )
+            for row in rows:
+                yield row
+            if len(rows) < chunk_size:
+                return
+            after = (rows[-1]["created_at"], rows[-1]["id"])
+
+    @staticmethod
+    def _log_filter(
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        organization_id: Optional[int] = None,
+    ) -> Q:
+        """Build the filter shared by listing, counting and export."""
+        condition = Q()
         if user_id is not None:
-            query = query.filter(user_id=user_id)
+            condition &= Q(user_id=user_id)
         if action is not None:
-            query = query.filter(action=action)
+            condition &= Q(action=action)
         if organization_id is not None:
-            query = query.filter(organization_id=organization_id)
-
-        total = await query.count()
-        logs = (
-            await query.prefetch_related("user")
-            .order_by("-created_at")
-            .offset(offset)
-            .limit(limit)
+            condition &= Q(organization_id=organization_id)
+        return condition
+
+    @staticmethod
+    def _before_keyset(after: tuple[datetime, int]) -> Q:
+        """Condition for rows that sort after ``after`` in newest-first order."""
+        created_at, log_id = after
+        return Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=log_id)
+
+    @staticmethod
+    async def _estimate_table_rows() -> Optional[int]:
+        """Row count from the MySQL table statistics (None on other databases)."""
+        conn = Tortoise.get_connection("default")
+        if conn.capabilities.dialect != "mysql":
+            return None
+        _, rows = await conn.execute_query(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            [AuditLog._meta.db_table],
         )
-
-        return logs, total
+        if not rows or rows[0]["TABLE_ROWS"] is None:
+            return None
+        return int(rows[0]["TABLE_ROWS"])
 
     async def get_speedgaming_sync_logs_for_tournament(
         self, organization_id: int, tournament_id: int, limit: int = 10
@@ -170,10 +380,6 @@ class AuditRepository:
         """
         Get SpeedGaming sync logs for a specific tournament.
 
-        Note: Since details is a JSON field and Tortoise ORM doesn't support
-        JSON field queries, we fetch recent sync logs for the organization
-        and filter in Python.
-
         Args:
             organization_id: Organization ID
             tournament_id: Tournament ID
@@ -182,21 +388,12 @@ class AuditRepository:
         Returns:
             list[AuditLog]: SpeedGaming sync logs for the tournament
         """
-        # Fetch recent sync logs for the organization (fetch more to account for filtering)
-        all_sync_logs = (
+        return (
             await AuditLog.filter(
-                action="speedgaming_sync", organization_id=organization_id
+                action="speedgaming_sync",
+                organization_id=organization_id,
+                tournament_id=tournament_id,
             )
             .order_by("-created_at")
-            .limit(50)
-            .all()
+            .limit(limit)
         )
-
-        # Filter for this tournament in Python
-        tournament_logs = [
-            log
-            for log in all_sync_logs
-            if log.details and log.details.get("tournament_id") == tournament_id
-        ][:limit]
-
-        return tournament_logs
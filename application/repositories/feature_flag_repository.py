@@ -1,9 +1,19 @@
 """
 Feature flag repository for data access.
+
+Enabled-flag checks are served from a versioned in-process cache partitioned
+by organization. Writes through this repository invalidate the organization's
+entry immediately; SETTINGS_CACHE_TTL_SECONDS bounds out-of-band edits.
 """
 
 from typing import Optional
+from config import settings
 from models import OrganizationFeatureFlag, FeatureFlag
+from application.utils.versioned_cache import VersionedCache
+
+_enabled_flags_cache = VersionedCache(
+    "feature_flags", settings.SETTINGS_CACHE_TTL_SECONDS
+)
 
 
 class FeatureFlagRepository:
@@ -128,7 +138,10 @@ class FeatureFlagRepository:
             data["enabled_at"] = datetime.now(timezone.utc)
             data["enabled_by_id"] = enabled_by_id
 
-        return await OrganizationFeatureFlag.create(**data)
+        try:
+            return await OrganizationFeatureFlag.create(**data)
+        finally:
+            _enabled_flags_cache.invalidate(organization_id)
 
     async def update(
         self,
@@ -170,7 +183,10 @@ class FeatureFlagRepository:
             updates["notes"] = notes
 
         if updates:
-            await flag.update_from_dict(updates).save()
+            try:
+                await flag.update_from_dict(updates).save()
+            finally:
+                _enabled_flags_cache.invalidate(flag.organization_id)
 
         return flag
 
@@ -188,9 +204,31 @@ class FeatureFlagRepository:
         if not flag:
             return False
 
-        await flag.delete()
+        try:
+            await flag.delete()
+        finally:
+            _enabled_flags_cache.invalidate(flag.organization_id)
         return True
 
+    async def get_enabled_keys(self, organization_id: int) -> frozenset[FeatureFlag]:
+        """
+        Get the enabled feature keys for an organization (cached).
+
+        Args:
+            organization_id: Organization ID
+
+        Returns:
+            Set of enabled feature flag enums
+        """
+
+        async def load() -> frozenset[FeatureFlag]:
+            keys = await OrganizationFeatureFlag.filter(
+                organization_id=organization_id, enabled=True
+            ).values_list("feature_key", flat=True)
+            return frozenset(FeatureFlag(key) for key in keys)
+
+        return await _enabled_flags_cache.get_or_load(organization_id, "enabled", load)
+
     async def is_feature_enabled(self, organization_id: int, feature_key: str) -> bool:
         """
         Check if a feature is enabled for an organization.
@@ -202,5 +240,4 @@ class FeatureFlagRepository:
         Returns:
             True if enabled, False otherwise (including if flag doesn't exist)
         """
-        flag = await self.get_by_org_and_key(organization_id, feature_key)
-        return flag.enabled if flag else False
+        return feature_key in await self.get_enabled_keys(organization_id)
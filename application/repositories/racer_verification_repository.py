@@ -74,6 +74,16 @@ class RacerVerificationRepository:
             query = query.filter(is_active=True)
         return await query.order_by("-created_at").all()
 
+    async def list_active_guild_ids(self) -> list[int]:
+        """List Discord guilds that have at least one active racer verification."""
+        return sorted(
+            set(
+                await RacerVerification.filter(is_active=True).values_list(
+                    "guild_id", flat=True
+                )
+            )
+        )
+
     async def update(
         self, verification_id: int, **updates
     ) -> Optional[RacerVerification]:
@@ -159,6 +169,39 @@ class UserRacerVerificationRepository:
             await query.prefetch_related("verification").order_by("-verified_at").all()
         )
 
+    async def list_verified_for_verifications(
+        self, verification_ids: list[int]
+    ) -> list[UserRacerVerification]:
+        """List verified users of several racer verifications (with users)."""
+        if not verification_ids:
+            return []
+        return (
+            await UserRacerVerification.filter(
+                verification_id__in=verification_ids, is_verified=True
+            )
+            .select_related("user")
+            .order_by("user_id", "verification_id")
+            .all()
+        )
+
+    async def save_checks(
+        self, user_verifications: list[UserRacerVerification]
+    ) -> None:
+        """Write the results of a re-verification run in bulk."""
+        if not user_verifications:
+            return
+        await UserRacerVerification.bulk_update(
+            user_verifications,
+            fields=[
+                "race_count",
+                "last_checked_at",
+                "last_check_error",
+                "role_granted",
+                "role_granted_at",
+                "updated_at",
+            ],
+        )
+
     async def update(
         self, user_verification_id: int, **updates
     ) -> Optional[UserRacerVerification]:
@@ -5,10 +5,12 @@ This module handles all database operations for randomizer presets.
 """
 
 import logging
+from collections import Counter
 from typing import Optional
 from tortoise.expressions import Q
 from models.randomizer_preset import RandomizerPreset
 from models.preset_namespace import PresetNamespace
+from modules.tournament.models.match_schedule import Tournament
 
 logger = logging.getLogger(__name__)
 
@@ -307,3 +309,36 @@ class RandomizerPresetRepository:
         if randomizer:
             query = query.filter(randomizer=randomizer)
         return await query.count()
+
+    async def list_by_ids(self, preset_ids: list[int]) -> list[RandomizerPreset]:
+        """
+        Get multiple presets by ID in one query.
+
+        Args:
+            preset_ids: Preset IDs
+
+        Returns:
+            List of presets found (order not guaranteed)
+        """
+        if not preset_ids:
+            return []
+        return await RandomizerPreset.filter(id__in=preset_ids).all()
+
+    async def list_popular_public_presets(self, limit: int) -> list[RandomizerPreset]:
+        """
+        Get the public presets used as default by the most active tournaments.
+
+        Args:
+            limit: Maximum number of presets to return
+
+        Returns:
+            List of presets, most used first
+        """
+        preset_ids = await Tournament.filter(
+            is_active=True,
+            randomizer_preset__is_public=True,
+        ).values_list("randomizer_preset_id", flat=True)
+
+        ranked = [preset_id for preset_id, _ in Counter(preset_ids).most_common(limit)]
+        presets = {p.id: p for p in await self.list_by_ids(ranked)}
+        return [presets[preset_id] for preset_id in ranked if preset_id in presets]
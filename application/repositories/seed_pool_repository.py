@@ -0,0 +1,181 @@
+"""
+Seed pool repository for data access.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from tortoise.expressions import Q
+
+from models import PooledSeed
+
+
+class SeedPoolRepository:
+    """Repository for pre-generated seed data access."""
+
+    # How many candidates to try per round when racing other claimers
+    CLAIM_CANDIDATES = 5
+
+    async def create(self, **fields: Any) -> PooledSeed:
+        """
+        Store a newly generated seed in the pool.
+
+        Args:
+            **fields: PooledSeed field values
+
+        Returns:
+            Created seed
+        """
+        return await PooledSeed.create(**fields)
+
+    async def claim(
+        self,
+        randomizer: str,
+        settings_hash: str,
+        match_id: Optional[int] = None,
+    ) -> Optional[PooledSeed]:
+        """
+        Atomically claim one available seed.
+
+        With match_id, only seeds reserved for that match with the same
+        settings hash are considered. Otherwise only unreserved seeds for the
+        pool key are considered. The claim is a conditional UPDATE on
+        claimed_at IS NULL, so two concurrent claimers can never receive the
+        same seed.
+
+        Args:
+            randomizer: Randomizer type
+            settings_hash: Pool settings hash
+            match_id: Match to claim a reserved seed for
+
+        Returns:
+            Claimed seed, or None if the pool is empty
+        """
+        query = PooledSeed.filter(
+            randomizer=randomizer, settings_hash=settings_hash, claimed_at__isnull=True
+        )
+        if match_id is not None:
+            query = query.filter(match_id=match_id)
+        else:
+            query = query.filter(match_id__isnull=True)
+
+        while True:
+            candidate_ids = (
+                await query.order_by("id")
+                .limit(self.CLAIM_CANDIDATES)
+                .values_list("id", flat=True)
+            )
+            if not candidate_ids:
+                return None
+
+            for seed_id in candidate_ids:
+                now = datetime.now(timezone.utc)
+                updated = await PooledSeed.filter(
+                    id=seed_id, claimed_at__isnull=True
+                ).update(claimed_at=now)
+                if updated:
+                    return await PooledSeed.get(id=seed_id)
+
+    async def count_available(self, randomizer: str, settings_hash: str) -> int:
+        """
+        Count unreserved, unclaimed seeds for a pool key.
+
+        Args:
+            randomizer: Randomizer type
+            settings_hash: Pool settings hash
+
+        Returns:
+            Number of available seeds
+        """
+        return await PooledSeed.filter(
+            randomizer=randomizer,
+            settings_hash=settings_hash,
+            match_id__isnull=True,
+            claimed_at__isnull=True,
+        ).count()
+
+    async def get_reservations(self, match_ids: list[int]) -> dict[int, str]:
+        """
+        Get the settings hash of the unclaimed reserved seed of each match.
+
+        Args:
+            match_ids: Match IDs to check
+
+        Returns:
+            Dict mapping match ID to the reserved seed's settings hash, for
+            matches with a reservation
+        """
+        if not match_ids:
+            return {}
+        rows = await PooledSeed.filter(
+            match_id__in=match_ids, claimed_at__isnull=True
+        ).values_list("match_id", "settings_hash")
+        return dict(rows)
+
+    async def delete_reservations(
+        self, match_id: int, keep_settings_hash: Optional[str] = None
+    ) -> int:
+        """
+        Release the unclaimed seeds reserved for a match.
+
+        Args:
+            match_id: Match ID
+            keep_settings_hash: Keep reservations with this settings hash
+
+        Returns:
+            Number of seeds deleted
+        """
+        query = PooledSeed.filter(match_id=match_id, claimed_at__isnull=True)
+        if keep_settings_hash is not None:
+            query = query.exclude(settings_hash=keep_settings_hash)
+        return await query.delete()
+
+    async def list_pool_entries(self, since_days: int) -> list[dict]:
+        """
+        List pool key, state and latency for unclaimed and recently created seeds.
+
+        Args:
+            since_days: Include claimed seeds created within this many days
+
+        Returns:
+            List of dicts with randomizer, settings_hash, preset_id, match_id,
+            generation_ms and claimed_at
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
+        return await PooledSeed.filter(
+            Q(claimed_at__isnull=True) | Q(created_at__gte=cutoff)
+        ).values(
+            "randomizer",
+            "settings_hash",
+            "preset_id",
+            "match_id",
+            "generation_ms",
+            "claimed_at",
+        )
+
+    async def delete_claimed_before(self, days: int) -> int:
+        """
+        Delete seeds claimed more than the given number of days ago.
+
+        Args:
+            days: Retention period in days
+
+        Returns:
+            Number of seeds deleted
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        return await PooledSeed.filter(claimed_at__lt=cutoff).delete()
+
+    async def delete_stale_reservations(self) -> int:
+        """
+        Delete unclaimed seeds reserved for matches that have already finished.
+
+        Returns:
+            Number of seeds deleted
+        """
+        stale_ids = await PooledSeed.filter(
+            claimed_at__isnull=True, match__finished_at__isnull=False
+        ).values_list("id", flat=True)
+        if not stale_ids:
+            return 0
+        return await PooledSeed.filter(id__in=stale_ids).delete()
@@ -1,10 +1,21 @@
 """
 Settings repository providing data access for GlobalSetting and OrganizationSetting.
+
+Single-key reads are served from a versioned in-process cache (settings are
+read on every page load but rarely change). Writes through this repository
+invalidate it immediately; SETTINGS_CACHE_TTL_SECONDS bounds how long edits
+made elsewhere take to show up.
 """
 
 from __future__ import annotations
 from typing import Optional
+from config import settings
 from models import GlobalSetting, OrganizationSetting
+from application.utils.versioned_cache import VersionedCache
+
+# Partition "global" holds global settings; organization settings are
+# partitioned by organization ID
+_settings_cache = VersionedCache("settings", settings.SETTINGS_CACHE_TTL_SECONDS)
 
 
 class SettingsRepository:
@@ -15,7 +26,10 @@ class SettingsRepository:
         return await GlobalSetting.all().order_by("key")
 
     async def get_global(self, key: str) -> Optional[GlobalSetting]:
-        return await GlobalSetting.get_or_none(key=key)
+        """Get a global setting (cached; do not mutate the returned row)."""
+        return await _settings_cache.get_or_load(
+            "global", key, lambda: GlobalSetting.get_or_none(key=key)
+        )
 
     async def set_global(
         self,
@@ -24,22 +38,28 @@ class SettingsRepository:
         description: Optional[str] = None,
         is_public: bool = False,
     ) -> GlobalSetting:
-        existing = await self.get_global(key)
-        if existing:
-            existing.value = value
-            if description is not None:
-                existing.description = description
-            existing.is_public = (
-                is_public if is_public is not None else existing.is_public
+        try:
+            existing = await GlobalSetting.get_or_none(key=key)
+            if existing:
+                existing.value = value
+                if description is not None:
+                    existing.description = description
+                existing.is_public = (
+                    is_public if is_public is not None else existing.is_public
+                )
+                await existing.save()
+                return existing
+            return await GlobalSetting.create(
+                key=key, value=value, description=description, is_public=is_public
             )
-            await existing.save()
-            return existing
-        return await GlobalSetting.create(
-            key=key, value=value, description=description, is_public=is_public
-        )
+        finally:
+            _settings_cache.invalidate("global")
 
     async def delete_global(self, key: str) -> int:
-        return await GlobalSetting.filter(key=key).delete()
+        try:
+            return await GlobalSetting.filter(key=key).delete()
+        finally:
+            _settings_cache.invalidate("global")
 
     # Organization settings
     async def list_org(self, organization_id: int) -> list[OrganizationSetting]:
@@ -50,8 +70,13 @@ class SettingsRepository:
     async def get_org(
         self, organization_id: int, key: str
     ) -> Optional[OrganizationSetting]:
-        return await OrganizationSetting.get_or_none(
-            organization_id=organization_id, key=key
+        """Get an organization setting (cached; do not mutate the returned row)."""
+        return await _settings_cache.get_or_load(
+            organization_id,
+            key,
+            lambda: OrganizationSetting.get_or_none(
+                organization_id=organization_id, key=key
+            ),
         )
 
     async def set_org(
@@ -61,21 +86,29 @@ class SettingsRepository:
         value: str,
         description: Optional[str] = None,
     ) -> OrganizationSetting:
-        existing = await self.get_org(organization_id, key)
-        if existing:
-            existing.value = value
-            if description is not None:
-                existing.description = description
-            await existing.save()
-            return existing
-        return await OrganizationSetting.create(
-            organization_id=organization_id,
-            key=key,
-            value=value,
-            description=description,
-        )
+        try:
+            existing = await OrganizationSetting.get_or_none(
+                organization_id=organization_id, key=key
+            )
+            if existing:
+                existing.value = value
+                if description is not None:
+                    existing.description = description
+                await existing.save()
+                return existing
+            return await OrganizationSetting.create(
+                organization_id=organization_id,
+                key=key,
+                value=value,
+                description=description,
+            )
+        finally:
+            _settings_cache.invalidate(organization_id)
 
     async def delete_org(self, organization_id: int, key: str) -> int:
-        return await OrganizationSetting.filter(
-            organization_id=organization_id, key=key
-        ).delete()
+        try:
+            return await OrganizationSetting.filter(
+                organization_id=organization_id, key=key
+            ).delete()
+        finally:
+            _settings_cache.invalidate(organization_id)
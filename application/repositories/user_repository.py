@@ -6,6 +6,7 @@ This module provides data access methods for User model.
 
 from models import User, Permission
 from typing import Optional
+from application.utils.request_scope import scoped_get
 
 
 class UserRepository:
@@ -20,13 +21,17 @@ class UserRepository:
         """
         Get user by ID.
 
+        Memoized for the current request (see application/utils/request_scope.py).
+
         Args:
             user_id: User ID
 
         Returns:
             Optional[User]: User if found, None otherwise
         """
-        return await User.filter(id=user_id).first()
+        return await scoped_get(
+            "user", user_id, lambda: User.filter(id=user_id).first()
+        )
 
     async def get_by_discord_id(self, discord_id: int) -> Optional[User]:
         """
@@ -10,8 +10,12 @@ from application.services.async_qualifiers.async_qualifier_service import (
 from application.services.async_qualifiers.async_live_race_service import (
     AsyncLiveRaceService,
 )
+from application.services.async_qualifiers.participant_stats_service import (
+    ParticipantStatsService,
+)
 
 __all__ = [
     "AsyncQualifierService",
     "AsyncLiveRaceService",
+    "ParticipantStatsService",
 ]
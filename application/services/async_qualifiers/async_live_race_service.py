@@ -22,6 +22,9 @@ from application.repositories.async_qualifier_repository import (
     AsyncQualifierRepository,
 )
 from application.services.organizations.organization_service import OrganizationService
+from application.services.async_qualifiers.participant_stats_service import (
+    ParticipantStatsService,
+)
 from application.services.authorization.authorization_service_v2 import (
     AuthorizationServiceV2,
 )
@@ -55,6 +58,7 @@ class AsyncLiveRaceService:
         self.tournament_repo = AsyncQualifierRepository()
         self.org_service = OrganizationService()
         self.auth = AuthorizationServiceV2()
+        self.stats = ParticipantStatsService()
 
     async def can_manage_live_races(
         self, user: Optional[User], organization_id: int
@@ -588,6 +592,7 @@ class AsyncLiveRaceService:
             await self.repo.create_participant_races(
                 live_race_id, [u.id for u in users]
             )
+            await self.stats.refresh(live_race.tournament_id, [u.id for u in users])
 
         # Update status to in_progress
         updated = await self.repo.update_live_race(live_race_id, status="in_progress")
@@ -650,6 +655,7 @@ class AsyncLiveRaceService:
 
         # Update race records with results
         finisher_count = 0
+        updated_user_ids = []
         for racetime_id, finish_time_seconds, status in results:
             user = users_map.get(racetime_id)
             if not user:
@@ -674,10 +680,13 @@ class AsyncLiveRaceService:
             race.elapsed_time = timedelta(seconds=finish_time_seconds)
             race.status = status  # 'finished', 'forfeit', 'disqualified'
             await race.save()
+            updated_user_ids.append(user.id)
 
             if status == "finished":
                 finisher_count += 1
 
+        await self.stats.refresh(live_race.tournament_id, updated_user_ids)
+
         # Update live race status to finished
         updated = await self.repo.update_live_race(live_race_id, status="finished")
 
@@ -8,8 +8,6 @@ Contains org-scoped business logic, authorization checks, and scoring algorithms
 from __future__ import annotations
 from typing import Optional, List, Tuple
 from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass
-from functools import cached_property
 import logging
 import asyncio
 
@@ -19,6 +17,7 @@ from modules.async_qualifier.models.async_qualifier import (
     AsyncQualifierPool,
     AsyncQualifierPermalink,
     AsyncQualifierRace,
+    AsyncQualifierParticipantStats,
 )
 from application.repositories.async_qualifier_repository import (
     AsyncQualifierRepository,
@@ -28,6 +27,13 @@ from application.services.authorization.authorization_service_v2 import (
     AuthorizationServiceV2,
 )
 from application.services.discord.discord_guild_service import DiscordGuildService
+from application.services.async_qualifiers.race_deadline_scheduler import (
+    get_race_deadline_scheduler,
+)
+from application.services.async_qualifiers.participant_stats_service import (
+    ParticipantStatsService,
+)
+from application.utils.query_stats import track_queries
 from application.events import (
     EventBus,
     TournamentCreatedEvent,
@@ -53,57 +59,6 @@ def _get_actor_user_id(user: Optional[User]) -> int:
     return user.id if user else SYSTEM_USER_ID
 
 
-@dataclass
-class LeaderboardEntry:
-    """Represents a leaderboard entry for a user."""
-
-    user: User
-    races: List[Optional[AsyncQualifierRace]]
-
-    @cached_property
-    def score(self) -> float:
-        """Average score of all races (including unfinished as 0)."""
-        scores = [
-            r.score if r is not None and r.score is not None else 0 for r in self.races
-        ]
-        if not scores:
-            return 0.0
-        return sum(scores) / len(scores)
-
-    @cached_property
-    def estimate(self) -> float:
-        """Estimated score averaging only finished races."""
-        scores = [
-            r.score
-            for r in self.races
-            if r is not None and r.status == "finished" and r.score is not None
-        ]
-        if not scores:
-            return 0.0
-        return sum(scores) / len(scores)
-
-    @cached_property
-    def finished_race_count(self) -> int:
-        """Count of finished races."""
-        return len([r for r in self.races if r is not None and r.status == "finished"])
-
-    @cached_property
-    def unattempted_race_count(self) -> int:
-        """Count of unattempted races."""
-        return len([r for r in self.races if r is None])
-
-    @cached_property
-    def forfeited_race_count(self) -> int:
-        """Count of forfeited or disqualified races."""
-        return len(
-            [
-                r
-                for r in self.races
-                if r is not None and r.status in ["forfeit", "disqualified"]
-            ]
-        )
-
-
 class AsyncQualifierService:
     """Business logic for async qualifiers with organization scoping."""
 
@@ -111,6 +66,7 @@ class AsyncQualifierService:
         self.repo = AsyncQualifierRepository()
         self.org_service: OrganizationService = OrganizationService()
         self.auth = AuthorizationServiceV2()
+        self.stats = ParticipantStatsService()
 
     async def can_manage_async_tournaments(
         self, user: Optional[User], organization_id: int
@@ -363,6 +319,9 @@ class AsyncQualifierService:
 
         tournament = await self.repo.update(qualifier_id, organization_id, **fields)
         if tournament:
+            if "runs_per_pool" in fields:
+                # Every participant's counted and unattempted races change
+                await self.stats.refresh(qualifier_id)
             await self.repo.create_audit_log(
                 tournament_id=qualifier_id,
                 action="update_tournament",
@@ -417,6 +376,8 @@ class AsyncQualifierService:
             qualifier_id, organization_id, name, description
         )
         if pool:
+            # Adds unattempted runs for every participant
+            await self.stats.refresh(qualifier_id)
             await self.repo.create_audit_log(
                 tournament_id=qualifier_id,
                 action="create_pool",
@@ -471,6 +432,7 @@ class AsyncQualifierService:
 
         success = await self.repo.delete_pool(pool_id, organization_id)
         if success:
+            await self.stats.refresh(qualifier_id)
             await self.repo.create_audit_log(
                 tournament_id=qualifier_id,
                 action="delete_pool",
@@ -575,6 +537,7 @@ class AsyncQualifierService:
 
         success = await self.repo.delete_permalink(permalink_id, organization_id)
         if success:
+            await self.stats.refresh(qualifier_id)
             await self.repo.create_audit_log(
                 tournament_id=qualifier_id,
                 action="delete_permalink",
@@ -702,6 +665,8 @@ class AsyncQualifierService:
         )
 
         if race:
+            get_race_deadline_scheduler().arm(race)
+            await self.stats.refresh(qualifier_id, [user.id])
             await self.repo.create_audit_log(
                 tournament_id=qualifier_id,
                 action="create_race",
@@ -734,6 +699,9 @@ class AsyncQualifierService:
         )
 
         if race:
+            # Replaces the pending timeout with the maximum race duration
+            get_race_deadline_scheduler().arm(race)
+            await self.stats.refresh(race.tournament_id, [race.user_id])
             await self.repo.create_audit_log(
                 tournament_id=race.tournament_id,
                 action="start_race",
@@ -766,6 +734,8 @@ class AsyncQualifierService:
         )
 
         if race:
+            get_race_deadline_scheduler().disarm(race.id)
+            await self.stats.refresh(race.tournament_id, [race.user_id])
             await self.repo.create_audit_log(
                 tournament_id=race.tournament_id,
                 action="finish_race",
@@ -819,6 +789,8 @@ class AsyncQualifierService:
         )
 
         if race:
+            get_race_deadline_scheduler().disarm(race.id)
+            await self.stats.refresh(race.tournament_id, [race.user_id])
             await self.repo.create_audit_log(
                 tournament_id=race.tournament_id,
                 action="forfeit_race",
@@ -880,6 +852,7 @@ class AsyncQualifierService:
             reattempted=False,
         )
 
+        rescored_user_ids = set()
         for race in all_races:
             if race.status == "finished" and race.elapsed_time:
                 score = self._calculate_qualifier_score(
@@ -888,10 +861,14 @@ class AsyncQualifierService:
             else:
                 score = 0.0
 
+            if race.score != score:
+                rescored_user_ids.add(race.user_id)
             race.score = score
             race.score_updated_at = datetime.now(timezone.utc)
             await race.save(update_fields=["score", "score_updated_at"])
 
+        await self.stats.refresh(permalink.pool.tournament_id, rescored_user_ids)
+
         logger.info(
             "Updated scores for permalink %s (par: %s)", permalink_id, par_time_delta
         )
@@ -937,10 +914,17 @@ class AsyncQualifierService:
             logger.info("Recalculated all scores for tournament %s", qualifier_id)
             return True
 
+    @track_queries
     async def get_leaderboard(
         self, user: Optional[User], organization_id: int, qualifier_id: int
-    ) -> List[LeaderboardEntry]:
-        """Get leaderboard for a tournament."""
+    ) -> List[AsyncQualifierParticipantStats]:
+        """
+        Get leaderboard for a tournament.
+
+        Reads the materialized participant stats, one row per participant
+        with the user loaded, best score first. A tournament without rows
+        (e.g. not backfilled yet) is materialized on first read.
+        """
         is_member = await self.org_service.is_member(user, organization_id)
         if not is_member:
             logger.warning(
@@ -952,49 +936,13 @@ class AsyncQualifierService:
         if not tournament:
             return []
 
-        await tournament.fetch_related("pools")
-
-        # Get all user IDs who have participated
-        all_races = await AsyncQualifierRace.filter(
-            tournament_id=qualifier_id
-        ).values("user_id")
-        user_ids = list(set(r["user_id"] for r in all_races))
-
-        # Batch fetch all users to avoid N+1 queries
-        users_dict = {u.id: u for u in await User.filter(id__in=user_ids).all()}
-
-        leaderboard: List[LeaderboardEntry] = []
-
-        for user_id in user_ids:
-            races_list: List[Optional[AsyncQualifierRace]] = []
-
-            # For each pool, get runs_per_pool races
-            for pool in tournament.pools:
-                pool_races = (
-                    await AsyncQualifierRace.filter(
-                        user_id=user_id,
-                        tournament_id=qualifier_id,
-                        permalink__pool_id=pool.id,
-                        status__in=["finished", "forfeit", "disqualified"],
-                        reattempted=False,
-                    )
-                    .order_by("-score")
-                    .limit(tournament.runs_per_pool)
-                )
-
-                for i in range(tournament.runs_per_pool):
-                    try:
-                        races_list.append(pool_races[i])
-                    except IndexError:
-                        races_list.append(None)
-
-            participant_user = users_dict.get(user_id)
-            if participant_user:
-                entry = LeaderboardEntry(user=participant_user, races=races_list)
-                leaderboard.append(entry)
-
-        # Sort by score descending
-        leaderboard.sort(key=lambda e: e.score, reverse=True)
+        leaderboard = await self.repo.list_participant_stats(
+            qualifier_id, with_users=True
+        )
+        if not leaderboard and await self.stats.refresh(qualifier_id):
+            leaderboard = await self.repo.list_participant_stats(
+                qualifier_id, with_users=True
+            )
 
         logger.info(
             "Generated leaderboard for tournament %s with %s entries",
@@ -1003,6 +951,38 @@ class AsyncQualifierService:
         )
         return leaderboard
 
+    async def get_participant_stats(
+        self,
+        user: Optional[User],
+        organization_id: int,
+        qualifier_id: int,
+        player_id: int,
+    ) -> Optional[AsyncQualifierParticipantStats]:
+        """
+        Get a participant's materialized stats in a tournament.
+
+        Args:
+            user: User making the request
+            organization_id: Organization ID
+            qualifier_id: Tournament ID
+            player_id: Participant's user ID
+
+        Returns:
+            Stats row, or None if unauthorized or the player has no races
+        """
+        is_member = await self.org_service.is_member(user, organization_id)
+        if not is_member or not user:
+            return None
+
+        tournament = await self.repo.get_by_id(qualifier_id, organization_id)
+        if not tournament:
+            return None
+
+        stats = await self.repo.get_participant_stats(qualifier_id, player_id)
+        if stats is None and await self.stats.refresh(qualifier_id, [player_id]):
+            stats = await self.repo.get_participant_stats(qualifier_id, player_id)
+        return stats
+
     # Review operations
 
     async def get_review_queue(
@@ -1202,6 +1182,9 @@ class AsyncQualifierService:
 
             # If elapsed time was corrected, recalculate scores
             if elapsed_time_override:
+                await self.stats.refresh(
+                    updated_race.tournament_id, [updated_race.user_id]
+                )
                 await self.calculate_permalink_scores(
                     updated_race.permalink_id, organization_id
                 )
@@ -1492,6 +1475,7 @@ class AsyncQualifierService:
         )
 
         # Recalculate scores since this race is now excluded
+        await self.stats.refresh(race.tournament_id, [race.user_id])
         await race.fetch_related("permalink")
         await self.calculate_permalink_scores(race.permalink_id, organization_id)
 
@@ -0,0 +1,274 @@
+"""Materialized per-qualifier participant statistics.
+
+Each participant of an async qualifier has one AsyncQualifierParticipantStats
+row holding their leaderboard values (score, estimate, finished, forfeited and
+unattempted counts) and dashboard values (active races, reattempts, total
+score, personal best, pool progress).
+
+Rows are recomputed from the participant's races whenever a race is created,
+started, finished, forfeited, reviewed, reattempted or rescored; callers pass
+the tournament and the affected users to refresh(). rebuild() recomputes every
+participant and reports rows that had drifted from their races.
+
+Rows are backfilled without a manual rebuild: backfill_missing() runs in the
+background on startup and refreshes every tournament whose participants do
+not all have a row, and the leaderboard and participant reads refresh a
+tournament or participant whose rows are missing.
+"""
+
+from __future__ import annotations
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+import logging
+
+from modules.async_qualifier.models.async_qualifier import (
+    AsyncQualifierParticipantStats,
+    AsyncQualifierRace,
+)
+from application.repositories.async_qualifier_repository import (
+    AsyncQualifierRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Races that count towards the leaderboard
+SCORED_STATUSES = ("finished", "forfeit", "disqualified")
+ACTIVE_STATUSES = ("pending", "in_progress")
+
+# Stored values, in the order they are compared and written
+STAT_FIELDS = (
+    "score",
+    "estimate",
+    "finished_race_count",
+    "forfeited_race_count",
+    "unattempted_race_count",
+    "active_race_count",
+    "reattempted_race_count",
+    "total_score",
+    "best_race_id",
+    "best_elapsed_seconds",
+    "pool_progress",
+)
+
+
+@dataclass
+class StatsRebuildResult:
+    """Outcome of a participant stats rebuild."""
+
+    tournaments: int = 0
+    participants: int = 0
+    drifted: Dict[int, List[int]] = field(default_factory=dict)  # Tournament -> users
+
+    @property
+    def drift_count(self) -> int:
+        """Number of rows that were missing, stale or orphaned."""
+        return sum(len(user_ids) for user_ids in self.drifted.values())
+
+
+def compute_participant_stats(
+    races: List[AsyncQualifierRace], pool_ids: List[int], runs_per_pool: int
+) -> dict:
+    """
+    Compute the stat values of one participant.
+
+    The counted races are the best ``runs_per_pool`` completed, non-reattempted
+    races of each pool (by score); missing runs are unattempted and score 0.
+
+    Args:
+        races: All of the participant's races in the tournament (with permalink)
+        pool_ids: Pool IDs of the tournament
+        runs_per_pool: Runs each participant may count per pool
+
+    Returns:
+        dict: Values for STAT_FIELDS
+    """
+    scored_by_pool: Dict[int, List[AsyncQualifierRace]] = defaultdict(list)
+    pool_progress: Dict[str, int] = {}
+    finished: List[AsyncQualifierRace] = []
+
+    for race in races:
+        if race.reattempted:
+            continue
+        if race.status in SCORED_STATUSES:
+            scored_by_pool[race.permalink.pool_id].append(race)
+        if race.status == "finished":
+            finished.append(race)
+            key = str(race.permalink.pool_id)
+            pool_progress[key] = pool_progress.get(key, 0) + 1
+
+    counted: List[Optional[AsyncQualifierRace]] = []
+    for pool_id in pool_ids:
+        pool_races = sorted(
+            scored_by_pool.get(pool_id, []),
+            key=lambda r: (r.score is not None, r.score or 0, -r.id),
+            reverse=True,
+        )[:runs_per_pool]
+        counted.extend(pool_races)
+        counted.extend([None] * (runs_per_pool - len(pool_races)))
+
+    attempted = [r for r in counted if r is not None]
+    finished_scores = [
+        r.score for r in attempted if r.status == "finished" and r.score is not None
+    ]
+    timed = [r for r in finished if r.elapsed_time is not None]
+    best_race = min(timed, key=lambda r: (r.elapsed_time, r.id)) if timed else None
+
+    return {
+        "score": (
+            sum(r.score or 0 for r in attempted) / len(counted) if counted else 0.0
+        ),
+        "estimate": (
+            sum(finished_scores) / len(finished_scores) if finished_scores else 0.0
+        ),
+        "finished_race_count": len([r for r in attempted if r.status == "finished"]),
+        "forfeited_race_count": len(
+            [r for r in attempted if r.status in ("forfeit", "disqualified")]
+        ),
+        "unattempted_race_count": len(counted) - len(attempted),
+        "active_race_count": len([r for r in races if r.status in ACTIVE_STATUSES]),
+        "reattempted_race_count": len([r for r in races if r.reattempted]),
+        "total_score": sum(r.score or 0 for r in finished),
+        "best_race_id": best_race.id if best_race else None,
+        "best_elapsed_seconds": (
+            best_race.elapsed_time.total_seconds() if best_race else None
+        ),
+        "pool_progress": pool_progress,
+    }
+
+
+class ParticipantStatsService:
+    """Maintains the materialized participant stats of async qualifiers."""
+
+    def __init__(self) -> None:
+        self.repo = AsyncQualifierRepository()
+
+    async def refresh(
+        self, tournament_id: int, user_ids: Optional[Iterable[int]] = None
+    ) -> List[int]:
+        """
+        Recompute the stats of participants from their races.
+
+        Participants without races lose their row. Rows whose values did not
+        change are not written.
+
+        Args:
+            tournament_id: Tournament ID
+            user_ids: Affected participants (default: everyone in the tournament)
+
+        Returns:
+            List[int]: IDs of users whose row was created, changed or deleted
+        """
+        if user_ids is not None:
+            user_ids = set(user_ids)
+            if not user_ids:
+                return []
+
+        layout = await self.repo.get_pool_layout(tournament_id)
+        if layout is None:
+            return []
+        runs_per_pool, pool_ids = layout
+
+        races_by_user: Dict[int, List[AsyncQualifierRace]] = defaultdict(list)
+        for race in await self.repo.list_participant_races(tournament_id, user_ids):
+            races_by_user[race.user_id].append(race)
+
+        existing = {
+            stats.user_id: stats
+            for stats in await self.repo.list_participant_stats(tournament_id, user_ids)
+        }
+
+        created: List[AsyncQualifierParticipantStats] = []
+        updated: List[AsyncQualifierParticipantStats] = []
+        for user_id, races in races_by_user.items():
+            values = compute_participant_stats(races, pool_ids, runs_per_pool)
+            stats = existing.get(user_id)
+            if stats is None:
+                created.append(
+                    AsyncQualifierParticipantStats(
+                        tournament_id=tournament_id, user_id=user_id, **values
+                    )
+                )
+            elif any(getattr(stats, name) != values[name] for name in STAT_FIELDS):
+                for name, value in values.items():
+                    setattr(stats, name, value)
+                updated.append(stats)
+
+        orphaned = [user_id for user_id in existing if user_id not in races_by_user]
+
+        await self.repo.save_participant_stats(created, updated, STAT_FIELDS)
+        if orphaned:
+            await self.repo.delete_participant_stats(tournament_id, orphaned)
+
+        return [s.user_id for s in created] + [s.user_id for s in updated] + orphaned
+
+    async def backfill_missing(self) -> List[int]:
+        """
+        Refresh every tournament whose participant rows are incomplete.
+
+        Compares the participants with races against the stats rows, so a
+        consistent table costs two queries and writes nothing.
+
+        Returns:
+            List[int]: IDs of the tournaments that were refreshed
+        """
+        participants: Dict[int, set] = defaultdict(set)
+        for tournament_id, user_id in await self.repo.list_participant_pairs():
+            participants[tournament_id].add(user_id)
+        materialized: Dict[int, set] = defaultdict(set)
+        for tournament_id, user_id in await self.repo.list_participant_stats_pairs():
+            materialized[tournament_id].add(user_id)
+
+        tournament_ids = sorted(
+            tournament_id
+            for tournament_id in participants.keys() | materialized.keys()
+            if participants[tournament_id] != materialized[tournament_id]
+        )
+        for tournament_id in tournament_ids:
+            await self.refresh(tournament_id)
+
+        if tournament_ids:
+            logger.info(
+                "Backfilled participant stats of %d tournament(s)", len(tournament_ids)
+            )
+        return tournament_ids
+
+    async def rebuild(self, tournament_id: Optional[int] = None) -> StatsRebuildResult:
+        """
+        Recompute every participant's stats and report drift.
+
+        A consistent table rebuilds without changes; any row that was missing,
+        stale or orphaned is reported and repaired.
+
+        Args:
+            tournament_id: Tournament to rebuild (default: all tournaments)
+
+        Returns:
+            StatsRebuildResult: Per-tournament users whose rows drifted
+        """
+        if tournament_id is not None:
+            tournament_ids = [tournament_id]
+        else:
+            tournament_ids = await self.repo.list_ids()
+
+        result = StatsRebuildResult()
+        for qualifier_id in tournament_ids:
+            drifted = await self.refresh(qualifier_id)
+            result.tournaments += 1
+            result.participants += await self.repo.count_participant_stats(qualifier_id)
+            if drifted:
+                result.drifted[qualifier_id] = sorted(drifted)
+                logger.warning(
+                    "Participant stats of tournament %s drifted for %d user(s): %s",
+                    qualifier_id,
+                    len(drifted),
+                    sorted(drifted),
+                )
+
+        logger.info(
+            "Rebuilt participant stats of %d tournament(s), %d participant(s), %d drifted",
+            result.tournaments,
+            result.participants,
+            result.drift_count,
+        )
+        return result
@@ -0,0 +1,456 @@
+"""
+Deadline scheduler for async qualifier race timeouts.
+
+Every active race with a Discord thread has at most two deadlines: a pending
+race gets a warning ASYNC_RACE_WARNING_MINUTES before its thread times out and
+is forfeited at ``thread_timeout_time``; an in-progress race is forfeited
+ASYNC_RACE_MAX_HOURS after ``start_time``. Instead of scanning every active
+race once a minute, the scheduler keeps the deadlines of every race in memory
+and a single background loop sleeps until the earliest one is due.
+
+Races are armed when they are created, started or have their timeout
+extended, and disarmed when they finish or are forfeited. On startup the
+deadlines are rebuilt from a single query over the active races. When a
+deadline fires the race is re-read, so a race whose status or deadline
+changed elsewhere is re-armed instead of being forfeited. Stopping the
+scheduler waits for deadlines being handled instead of cancelling them.
+
+Like the legacy timeout tasks, deadlines are skipped while the Discord bot
+is disabled, and a race is never forfeited without notifying its thread: a
+forfeit whose thread cannot be resolved is retried every
+THREAD_RETRY_SECONDS instead.
+
+When the scheduler is not running (tests, scripts), arm() and disarm() do
+nothing.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import discord
+
+from application.repositories.async_qualifier_repository import (
+    AsyncQualifierRepository,
+)
+from application.services.async_qualifiers.participant_stats_service import (
+    ParticipantStatsService,
+)
+from application.utils.background_worker import BackgroundWorker
+from config import settings
+from discordbot.client import get_bot_instance
+from models import SYSTEM_USER_ID
+from modules.async_qualifier.models.async_qualifier import AsyncQualifierRace
+
+logger = logging.getLogger(__name__)
+
+# Statuses that can time out
+ACTIVE_STATUSES = ("pending", "in_progress")
+
+# Columns needed to compute deadlines
+DEADLINE_FIELDS = (
+    "id",
+    "status",
+    "discord_thread_id",
+    "thread_open_time",
+    "thread_timeout_time",
+    "start_time",
+)
+
+WARNING = "warning"
+FORFEIT = "forfeit"
+
+# How long to wait for the Discord bot to become ready before giving up
+BOT_READY_TIMEOUT_SECONDS = 60
+
+# Delay before retrying a forfeit whose thread could not be resolved
+THREAD_RETRY_SECONDS = 300
+
+# How long the loop sleeps when no race is armed (arming wakes it)
+IDLE_SECONDS = 3600.0
+
+
+class ThreadUnavailable(Exception):
+    """The Discord bot or the race thread is not available."""
+
+
+@dataclass(frozen=True)
+class RaceDeadline:
+    """A point in time at which a race is warned or forfeited."""
+
+    when: datetime
+    kind: str  # WARNING or FORFEIT
+
+
+class RaceDeadlineScheduler(BackgroundWorker):
+    """
+    In-memory deadlines of every active async qualifier race.
+
+    The background loop sleeps until the earliest deadline and hands each due
+    deadline to its own task, so a slow Discord call does not hold up the
+    deadlines of other races.
+    """
+
+    name = "Race deadline scheduler"
+
+    def __init__(
+        self,
+        warning_minutes: Optional[int] = None,
+        pending_timeout_minutes: Optional[int] = None,
+        max_hours: Optional[int] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            warning_minutes: Minutes before a pending race's timeout to warn
+                (default: ASYNC_RACE_WARNING_MINUTES)
+            pending_timeout_minutes: Timeout for pending races without an
+                explicit thread_timeout_time
+                (default: ASYNC_RACE_PENDING_TIMEOUT_MINUTES)
+            max_hours: Hours an in-progress race may run
+                (default: ASYNC_RACE_MAX_HOURS)
+        """
+        super().__init__()
+        self.warning_minutes = (
+            warning_minutes
+            if warning_minutes is not None
+            else settings.ASYNC_RACE_WARNING_MINUTES
+        )
+        self.pending_timeout_minutes = (
+            pending_timeout_minutes
+            if pending_timeout_minutes is not None
+            else settings.ASYNC_RACE_PENDING_TIMEOUT_MINUTES
+        )
+        self.max_hours = (
+            max_hours if max_hours is not None else settings.ASYNC_RACE_MAX_HOURS
+        )
+        self.repo = AsyncQualifierRepository()
+        self.stats = ParticipantStatsService()
+        # Remaining deadlines per race, earliest first
+        self._armed: Dict[int, List[RaceDeadline]] = {}
+        # Deferred forfeits whose thread could not be resolved
+        self._retry_at: Dict[int, datetime] = {}
+        # Races whose next deadline is being handled
+        self._firing: Dict[int, asyncio.Task] = {}
+
+    @property
+    def armed_count(self) -> int:
+        """Number of races with armed deadlines."""
+        return len(self._armed)
+
+    def deadlines_for(self, race: AsyncQualifierRace) -> List[RaceDeadline]:
+        """
+        Compute the remaining deadlines of a race, earliest first.
+
+        Args:
+            race: Race (needs the DEADLINE_FIELDS columns)
+
+        Returns:
+            List of deadlines (empty if the race cannot time out)
+        """
+        if race.discord_thread_id is None:
+            return []
+
+        if race.status == "pending":
+            timeout = race.thread_timeout_time
+            if timeout is None and race.thread_open_time is not None:
+                timeout = race.thread_open_time + timedelta(
+                    minutes=self.pending_timeout_minutes
+                )
+            if timeout is None:
+                return []
+            return [
+                RaceDeadline(
+                    timeout - timedelta(minutes=self.warning_minutes), WARNING
+                ),
+                RaceDeadline(timeout, FORFEIT),
+            ]
+
+        if race.status == "in_progress" and race.start_time is not None:
+            return [
+                RaceDeadline(race.start_time + timedelta(hours=self.max_hours), FORFEIT)
+            ]
+
+        return []
+
+    def arm(self, race: AsyncQualifierRace) -> None:
+        """
+        Arm (or re-arm) the deadlines of a race from its current state.
+
+        Replaces any deadlines already armed for the race; a race that can no
+        longer time out is disarmed.
+
+        Args:
+            race: Race (needs the DEADLINE_FIELDS columns)
+        """
+        if not self._running:
+            return
+
+        self.disarm(race.id)
+        deadlines = self.deadlines_for(race)
+        if deadlines:
+            self._armed[race.id] = deadlines
+            self.wake()
+
+    def disarm(self, race_id: int) -> None:
+        """
+        Drop the deadlines of a race, if any.
+
+        Args:
+            race_id: Race ID
+        """
+        self._armed.pop(race_id, None)
+        self._retry_at.pop(race_id, None)
+
+    async def rebuild(self) -> int:
+        """
+        Re-arm every active race from the database.
+
+        Returns:
+            int: Number of races armed
+        """
+        self._armed.clear()
+        self._retry_at.clear()
+
+        races = await AsyncQualifierRace.filter(
+            status__in=ACTIVE_STATUSES, discord_thread_id__isnull=False
+        ).only(*DEADLINE_FIELDS)
+        for race in races:
+            self.arm(race)
+        return self.armed_count
+
+    async def start(self) -> bool:
+        """Start the scheduler and arm all active races."""
+        if not await super().start():
+            return False
+        armed = await self.rebuild()
+        logger.info("Race deadline scheduler started (%d race(s) armed)", armed)
+        return True
+
+    async def stop(self) -> bool:
+        """Stop the scheduler once the deadlines being handled are done."""
+        if not await super().stop():
+            return False
+
+        await asyncio.gather(*self._firing.values(), return_exceptions=True)
+        self._armed.clear()
+        self._retry_at.clear()
+        logger.info("Race deadline scheduler stopped")
+        return True
+
+    async def sweep_overdue(self) -> int:
+        """
+        Forfeit every active race whose forfeit deadline has passed.
+
+        Used by the legacy timeout task types; does not need the scheduler to
+        be running.
+
+        Returns:
+            int: Number of races forfeited
+        """
+        if get_bot_instance() is None:
+            logger.warning("Discord bot not available, skipping timeout sweep")
+            return 0
+
+        now = datetime.now(timezone.utc)
+        races = await AsyncQualifierRace.filter(
+            status__in=ACTIVE_STATUSES, discord_thread_id__isnull=False
+        ).only(*DEADLINE_FIELDS)
+
+        forfeited = 0
+        for race in races:
+            deadlines = self.deadlines_for(race)
+            if deadlines and deadlines[-1].when <= now:
+                try:
+                    forfeited += await self._fire(race.id, deadlines[-1])
+                except ThreadUnavailable as e:
+                    logger.warning("Skipping timeout of race %s: %s", race.id, e)
+        return forfeited
+
+    def _due_at(self, race_id: int) -> datetime:
+        """When the next deadline of an armed race is to be handled."""
+        return self._retry_at.get(race_id, self._armed[race_id][0].when)
+
+    def next_delay(self) -> float:
+        """Sleep until the earliest deadline not already being handled."""
+        due = [
+            self._due_at(race_id)
+            for race_id in self._armed
+            if race_id not in self._firing
+        ]
+        if not due:
+            return IDLE_SECONDS
+        return max(0.0, (min(due) - datetime.now(timezone.utc)).total_seconds())
+
+    async def run_once(self) -> None:
+        """Hand every due deadline to its own task."""
+        now = datetime.now(timezone.utc)
+        for race_id, deadlines in list(self._armed.items()):
+            if race_id in self._firing or self._due_at(race_id) > now:
+                continue
+            if deadlines[0].kind == WARNING and deadlines[-1].when <= now:
+                # Too late to warn, the race is forfeited right away
+                deadlines.pop(0)
+            self._firing[race_id] = asyncio.create_task(
+                self._handle(race_id, deadlines)
+            )
+
+    async def _handle(self, race_id: int, deadlines: List[RaceDeadline]) -> None:
+        """Fire the next deadline of a race and move on to the following one."""
+        deadline = deadlines[0]
+        done = True
+        try:
+            await self._fire(race_id, deadline)
+        except ThreadUnavailable as e:
+            if deadline.kind == FORFEIT:
+                logger.warning(
+                    "Deferring timeout of race %s by %ds: %s",
+                    race_id,
+                    THREAD_RETRY_SECONDS,
+                    e,
+                )
+                done = False
+            else:
+                logger.warning("Skipping warning of race %s: %s", race_id, e)
+        except Exception as e:
+            logger.exception(
+                "Error handling %s deadline of race %s: %s",
+                deadline.kind,
+                race_id,
+                str(e),
+            )
+        finally:
+            self._firing.pop(race_id, None)
+
+        # Re-armed (or disarmed) while handling the deadline
+        if self._armed.get(race_id) is deadlines:
+            if done:
+                self._retry_at.pop(race_id, None)
+                deadlines.pop(0)
+                if not deadlines:
+                    del self._armed[race_id]
+            else:
+                self._retry_at[race_id] = datetime.now(timezone.utc) + timedelta(
+                    seconds=THREAD_RETRY_SECONDS
+                )
+        self.wake()
+
+    @staticmethod
+    async def _resolve_thread(thread_id: int):
+        """
+        Resolve a race thread once the Discord bot is ready.
+
+        Raises:
+            ThreadUnavailable: If the bot is disabled, not ready or the thread
+                cannot be fetched
+        """
+        bot = get_bot_instance()
+        if bot is None:
+            raise ThreadUnavailable("Discord bot not available")
+
+        if not bot.is_ready():
+            try:
+                await asyncio.wait_for(
+                    bot.wait_until_ready(), timeout=BOT_READY_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                raise ThreadUnavailable("Discord bot not ready") from None
+
+        thread = bot.get_channel(thread_id)
+        if thread is None:
+            try:
+                thread = await bot.fetch_channel(thread_id)
+            except discord.DiscordException as e:
+                raise ThreadUnavailable(f"cannot access thread {thread_id}: {e}") from e
+        return thread
+
+    async def _fire(self, race_id: int, deadline: RaceDeadline) -> int:
+        """
+        Act on a due deadline after re-reading the race.
+
+        Returns:
+            int: 1 if the race was forfeited, else 0
+
+        Raises:
+            ThreadUnavailable: If the race thread cannot be notified
+        """
+        race = await AsyncQualifierRace.get_or_none(id=race_id).prefetch_related("user")
+        if race is None:
+            return 0
+
+        if deadline not in self.deadlines_for(race):
+            # Started, finished or extended without going through arm()
+            self.arm(race)
+            return 0
+
+        thread = await self._resolve_thread(race.discord_thread_id)
+
+        if deadline.kind == WARNING:
+            forfeit_time = self.deadlines_for(race)[-1].when
+            await self._send(
+                thread,
+                f"<@{race.user.discord_id}>, your race will be forfeited on "
+                f"{discord.utils.format_dt(forfeit_time, 'f')} "
+                f"({discord.utils.format_dt(forfeit_time, 'R')}) if you don't start it.",
+            )
+            return 0
+
+        # Conditional update, so a race started at the last second is kept
+        forfeited = await AsyncQualifierRace.filter(
+            id=race.id, status=race.status
+        ).update(status="forfeit")
+        if not forfeited:
+            return 0
+        await self.stats.refresh(race.tournament_id, [race.user_id])
+
+        if race.status == "pending":
+            message = f"<@{race.user.discord_id}>, this race has been automatically forfeited due to timeout."
+            reason = "pending timeout"
+        else:
+            message = f"<@{race.user.discord_id}>, this race has exceeded {self.max_hours} hours and has been forfeited."
+            reason = f"{self.max_hours} hour timeout"
+        await self._send(thread, message)
+
+        await self.repo.create_audit_log(
+            tournament_id=race.tournament_id,
+            action="auto_forfeit",
+            details=f"Race {race.id} automatically forfeited ({reason})",
+            user_id=SYSTEM_USER_ID,
+        )
+        logger.info("Race %s automatically forfeited (%s)", race.id, reason)
+        return 1
+
+    @staticmethod
+    async def _send(thread, message: str) -> None:
+        """Post a message mentioning the racer in the race thread."""
+        try:
+            await thread.send(
+                message, allowed_mentions=discord.AllowedMentions(users=True)
+            )
+        except discord.DiscordException as e:
+            logger.warning("Failed to post to race thread %s: %s", thread.id, e)
+
+
+# Global scheduler instance
+_scheduler: Optional[RaceDeadlineScheduler] = None
+
+
+def get_race_deadline_scheduler() -> RaceDeadlineScheduler:
+    """Get the global race deadline scheduler instance."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RaceDeadlineScheduler()
+    return _scheduler
+
+
+async def start_race_deadline_scheduler():
+    """Start the race deadline scheduler (called from app lifespan)."""
+    await get_race_deadline_scheduler().start()
+
+
+async def stop_race_deadline_scheduler():
+    """Stop the race deadline scheduler (called from app lifespan)."""
+    await get_race_deadline_scheduler().stop()
@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
 
 from models import User
+from application.utils.query_stats import track_queries
 from application.services.authorization.authorization_service_v2 import (
     AuthorizationServiceV2,
 )
@@ -71,6 +72,7 @@ class UIAuthorizationHelper:
     def __init__(self):
         self.auth = AuthorizationServiceV2()
 
+    @track_queries
     async def get_organization_permissions(
         self, user: Optional[User], organization_id: int
     ) -> UIPermissions:
@@ -286,12 +288,12 @@ class UIAuthorizationHelper:
 
     async def _check_membership(self, user: User, organization_id: int) -> bool:
         """Check if user is a member of the organization."""
-        from models import OrganizationMember
-
-        member = await OrganizationMember.get_or_none(
-            organization_id=organization_id, user_id=user.id
+        from application.services.organizations.organization_service import (
+            OrganizationService,
         )
-        return member is not None
+
+        # Shares the request-scoped member lookup with page-level is_member checks
+        return await OrganizationService().is_member(user, organization_id)
 
     async def _is_organization_admin(self, user: User, organization_id: int) -> bool:
         """Check if user is an organization admin."""
@@ -5,9 +5,16 @@ This module provides centralized audit logging for tracking user actions.
 """
 
 import logging
+from datetime import datetime
 from models import User, AuditLog
-from typing import Optional, Any
+from typing import AsyncIterator, Optional, Any
 from application.repositories.audit_repository import AuditRepository
+from application.services.core.audit_writer import get_audit_writer
+from application.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    parse_cursor_datetime,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +68,54 @@ class AuditService:
             )
             raise
 
+    async def record(
+        self,
+        action: str,
+        user_id: Optional[int] = None,
+        details: Optional[dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        organization_id: Optional[int] = None,
+    ) -> None:
+        """
+        Record an action without waiting for the database write.
+
+        Use this instead of log_action() when the created entry is not needed
+        (event listeners, background jobs). Entries are queued on the audit
+        log writer and inserted in batches; if the writer is not running,
+        the entry is written immediately.
+
+        Args:
+            action: Action name/type
+            user_id: ID of the user who performed the action (SYSTEM_USER_ID
+                for system actions, None for unknown)
+            details: Additional details about the action
+            ip_address: IP address of the user
+            organization_id: Organization context
+        """
+        entry = self.audit_repository.build(
+            action=action,
+            user_id=user_id,
+            details=details,
+            ip_address=ip_address,
+            organization_id=organization_id,
+        )
+        writer = get_audit_writer()
+        if writer.running:
+            writer.enqueue(entry)
+            return
+
+        try:
+            await self.audit_repository.create_many([entry])
+        except Exception as e:
+            logger.error(
+                "Failed to create audit log: action=%s, user_id=%s, error=%s",
+                action,
+                user_id,
+                e,
+                exc_info=True,
+            )
+            raise
+
     async def log_login(
         self,
         user: User,
@@ -211,31 +266,108 @@ class AuditService:
             organization_id=organization_id,
         )
 
-    async def list_audit_logs(
+    async def list_audit_logs_page(
         self,
+        cursor: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
         user_id: Optional[int] = None,
         action: Optional[str] = None,
         organization_id: Optional[int] = None,
-    ) -> tuple[list[AuditLog], int]:
+    ) -> tuple[list[AuditLog], Optional[str]]:
         """
-        List audit logs with optional filters and pagination.
+        List one keyset page of audit logs, newest first.
 
         Args:
-            limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            cursor: Cursor returned with the previous page
+            limit: Page size
+            offset: Number of logs to skip (for clients not using cursors)
             user_id: Optional user ID filter
             action: Optional action filter
             organization_id: Optional organization ID filter
 
         Returns:
-            Tuple of (logs, total_count)
+            Tuple of (logs, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
-        return await self.audit_repository.list_with_filters(
-            limit=limit,
+        after = None
+        if cursor:
+            created_at, log_id = decode_cursor(cursor, 2)
+            if created_at is None or not isinstance(log_id, int):
+                raise ValueError("Invalid cursor")
+            after = (parse_cursor_datetime(created_at), log_id)
+
+        # Fetch one extra row to know whether another page exists
+        logs = await self.audit_repository.list_page(
+            limit=limit + 1,
+            after=after,
             offset=offset,
             user_id=user_id,
             action=action,
             organization_id=organization_id,
         )
+
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            last = logs[-1]
+            next_cursor = encode_cursor([last.created_at, last.id])
+        return logs, next_cursor
+
+    async def count_audit_logs(
+        self,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        organization_id: Optional[int] = None,
+    ) -> int:
+        """
+        Get the approximate number of audit logs matching the filters.
+
+        Totals are cached for AUDIT_COUNT_CACHE_TTL_SECONDS, so recent entries
+        may not be included yet.
+
+        Args:
+            user_id: Optional user ID filter
+            action: Optional action filter
+            organization_id: Optional organization ID filter
+
+        Returns:
+            int: Approximate total
+        """
+        return await self.audit_repository.count_with_filters(
+            user_id=user_id, action=action, organization_id=organization_id
+        )
+
+    def export_audit_logs(
+        self,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        organization_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over every matching audit log, newest first.
+
+        Rows are read in chunks of AUDIT_EXPORT_CHUNK_SIZE, so arbitrarily
+        large ranges can be streamed without loading them into memory.
+
+        Args:
+            user_id: Optional user ID filter
+            action: Optional action filter
+            organization_id: Optional organization ID filter
+            since: Only include logs created at or after this time
+            until: Only include logs created before this time
+
+        Returns:
+            Async iterator of audit log rows (dicts of column values)
+        """
+        return self.audit_repository.iter_export(
+            user_id=user_id,
+            action=action,
+            organization_id=organization_id,
+            since=since,
+            until=until,
+        )
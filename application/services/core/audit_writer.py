@@ -0,0 +1,210 @@
+"""
+Buffered audit log writer.
+
+Most audit entries are written from event listeners and background jobs that
+do not need the created row back. Instead of one INSERT per action, entries
+are queued in memory and written with a single bulk insert every
+AUDIT_FLUSH_SECONDS, or as soon as AUDIT_FLUSH_MAX_ROWS entries are waiting.
+Runs as a background task in the application lifecycle and flushes whatever
+is left on shutdown.
+
+When the writer is not running (tests, scripts), AuditService.record() writes
+entries immediately instead.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from application.repositories.audit_repository import AuditRepository
+from application.utils.background_worker import BackgroundWorker
+from config import settings
+from models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogWriter(BackgroundWorker):
+    """
+    In-memory queue of audit log entries flushed as bulk inserts.
+
+    Entries queued while a flush is running are kept for the next flush.
+    """
+
+    name = "Audit log writer"
+
+    def __init__(
+        self, flush_interval: Optional[float] = None, max_rows: Optional[int] = None
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            flush_interval: Seconds between flushes (default: AUDIT_FLUSH_SECONDS)
+            max_rows: Queued entries that trigger an early flush
+                (default: AUDIT_FLUSH_MAX_ROWS)
+        """
+        super().__init__()
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.AUDIT_FLUSH_SECONDS
+        )
+        self.max_rows = (
+            max_rows if max_rows is not None else settings.AUDIT_FLUSH_MAX_ROWS
+        )
+        self.repository = AuditRepository()
+        self._pending: List[AuditLog] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of entries waiting to be flushed."""
+        return len(self._pending)
+
+    def enqueue(self, entry: AuditLog) -> None:
+        """
+        Queue an entry built with AuditRepository.build().
+
+        Args:
+            entry: Unsaved audit log entry
+        """
+        self._pending.append(entry)
+        if len(self._pending) >= self.max_rows:
+            self.wake()
+
+    async def flush(self) -> int:
+        """
+        Write all queued entries in one bulk insert.
+
+        If the bulk insert fails, entries are written one by one so a single
+        bad entry is dropped instead of blocking the queue (entries of a user
+        deleted meanwhile are kept without the user). If none can be written, the batch is
+        put back in front of any entries queued meanwhile and retried on the
+        next flush.
+
+        Returns:
+            int: Number of entries written
+        """
+        async with self._lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, []
+            try:
+                written = await self.repository.create_many(batch)
+            except Exception as e:
+                logger.warning(
+                    "Bulk audit log insert of %d entr(ies) failed, "
+                    "writing individually: %s",
+                    len(batch),
+                    e,
+                )
+                written = await self._write_individually(batch)
+
+            logger.debug("Flushed %d audit log entr(ies)", written)
+            return written
+
+    async def _write_individually(self, batch: List[AuditLog]) -> int:
+        """
+        Write entries one at a time, dropping those that fail.
+
+        An entry whose user was deleted meanwhile fails on the user foreign
+        key; it is retried without a user (as a direct insert stores it)
+        before being dropped.
+        """
+        written = 0
+        failed: List[AuditLog] = []
+        last_error: Optional[Exception] = None
+        for entry in batch:
+            try:
+                written += await self.repository.create_many([entry])
+                continue
+            except Exception as e:
+                last_error = e
+
+            if entry.user_id is not None:
+                user_id, entry.user_id = entry.user_id, None
+                try:
+                    written += await self.repository.create_many([entry])
+                    logger.warning(
+                        "Stored audit log entry without its user: "
+                        "action=%s, user_id=%s",
+                        entry.action,
+                        user_id,
+                    )
+                    continue
+                except Exception as e:
+                    entry.user_id = user_id
+                    last_error = e
+            failed.append(entry)
+
+        if failed and not written:
+            # Most likely the database is unavailable; keep everything
+            self._pending = batch + self._pending
+            raise last_error
+
+        for entry in failed:
+            logger.error(
+                "Dropped audit log entry: action=%s, user_id=%s",
+                entry.action,
+                entry.user_id,
+            )
+        return written
+
+    def next_delay(self) -> float:
+        """Flush every flush_interval seconds (or early when max_rows are queued)."""
+        return self.flush_interval
+
+    async def run_once(self) -> None:
+        """Flush queued entries."""
+        await self.flush()
+
+    async def start(self) -> bool:
+        """Start the background flush loop."""
+        if not await super().start():
+            return False
+        logger.info(
+            "Audit log writer started (flush interval: %ss, max rows: %d)",
+            self.flush_interval,
+            self.max_rows,
+        )
+        return True
+
+    async def stop(self) -> bool:
+        """Stop the background flush loop and flush remaining entries."""
+        if not await super().stop():
+            return False
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(
+                "Error flushing %d audit log entr(ies) on shutdown: %s",
+                self.pending_count,
+                e,
+            )
+        logger.info("Audit log writer stopped")
+        return True
+
+
+# Global writer instance
+_writer: Optional[AuditLogWriter] = None
+
+
+def get_audit_writer() -> AuditLogWriter:
+    """Get the global audit log writer instance."""
+    global _writer
+    if _writer is None:
+        _writer = AuditLogWriter()
+    return _writer
+
+
+async def start_audit_writer():
+    """Start the audit log writer (called from app lifespan)."""
+    await get_audit_writer().start()
+
+
+async def stop_audit_writer():
+    """Stop the audit log writer (called from app lifespan)."""
+    await get_audit_writer().stop()
@@ -0,0 +1,476 @@
+"""
+OAuth token manager.
+
+Discord, RaceTime.gg and Twitch access tokens are refreshed through a single
+manager so that:
+
+- Concurrent callers needing the same (provider, user) token share one
+  in-flight refresh instead of each firing their own. Providers that rotate
+  refresh tokens (Discord) would otherwise invalidate each other's refresh
+  and log the user out.
+- An in-memory expiry index remembers the expiry of every token the process
+  has seen. A caller holding a User loaded before another caller's refresh
+  reloads the new tokens instead of refreshing with the rotated-out one.
+- Tokens of recently used accounts are refreshed in the background ahead of
+  expiry (TOKEN_REFRESH_LEAD_SECONDS), so page loads and API calls only wait
+  on a refresh when a token has actually run out.
+
+When the manager is not running (tests, scripts) nothing happens in the
+background and refreshes run inline, single-flight as usual.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from application.utils.background_worker import BackgroundWorker
+from config import settings
+from models import User
+
+logger = logging.getLogger(__name__)
+
+DISCORD = "discord"
+RACETIME = "racetime"
+TWITCH = "twitch"
+
+# Tokens closer than this to expiry are refreshed before use, even in the
+# background mode: a request made with them could fail in flight
+MIN_VALIDITY = timedelta(seconds=30)
+
+# Upper bound on how long the background loop sleeps between scans
+MAX_SCAN_INTERVAL_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class TokenProvider:
+    """Where a provider's tokens live on User and how they are refreshed."""
+
+    name: str
+    access_field: str
+    refresh_field: str
+    expires_field: str
+    refresh_method: str  # UserService method that refreshes and saves
+
+    @property
+    def fields(self) -> Tuple[str, str, str]:
+        """Token columns, in the order they are copied between users."""
+        return (self.access_field, self.refresh_field, self.expires_field)
+
+
+PROVIDERS: Dict[str, TokenProvider] = {
+    DISCORD: TokenProvider(
+        DISCORD,
+        "discord_access_token",
+        "discord_refresh_token",
+        "discord_token_expires_at",
+        "refresh_discord_token",
+    ),
+    RACETIME: TokenProvider(
+        RACETIME,
+        "racetime_access_token",
+        "racetime_refresh_token",
+        "racetime_token_expires_at",
+        "refresh_racetime_token",
+    ),
+    TWITCH: TokenProvider(
+        TWITCH,
+        "twitch_access_token",
+        "twitch_refresh_token",
+        "twitch_token_expires_at",
+        "refresh_twitch_token",
+    ),
+}
+
+
+@dataclass
+class TrackedToken:
+    """Expiry index entry of one (provider, user) token."""
+
+    expires_at: Optional[datetime]
+    last_used: float  # time.monotonic() of the last ensure_valid()/track()
+    error: Optional[str] = None  # Last background refresh failure
+
+
+class TokenManager(BackgroundWorker):
+    """Single-flight, proactive OAuth token refresh for every provider."""
+
+    name = "Token manager"
+
+    def __init__(self, lead_seconds: Optional[float] = None):
+        """
+        Initialize the manager.
+
+        Args:
+            lead_seconds: Refresh tokens this long before expiry
+                (default: TOKEN_REFRESH_LEAD_SECONDS)
+        """
+        super().__init__()
+        self.lead = timedelta(
+            seconds=(
+                lead_seconds
+                if lead_seconds is not None
+                else settings.TOKEN_REFRESH_LEAD_SECONDS
+            )
+        )
+        self._index: Dict[Tuple[str, int], TrackedToken] = {}
+        self._inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+        self.refreshes = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    def track(self, provider: str, user: User) -> None:
+        """
+        Record the current expiry of a user's token in the index.
+
+        Call after storing new tokens (login, account linking); clears any
+        recorded refresh failure.
+
+        Args:
+            provider: Provider name (DISCORD, RACETIME or TWITCH)
+            user: User holding the token
+        """
+        spec = PROVIDERS[provider]
+        expires_at = getattr(user, spec.expires_field)
+        key = (provider, user.id)
+        entry = self._index.get(key)
+        if entry is None:
+            self._index[key] = TrackedToken(expires_at, time.monotonic())
+        else:
+            entry.expires_at = expires_at
+            entry.last_used = time.monotonic()
+            entry.error = None
+        if self._running:
+            self.wake()
+
+    def forget(self, provider: str, user_id: int) -> None:
+        """
+        Drop a token from the index (account unlinked).
+
+        Args:
+            provider: Provider name
+            user_id: User ID
+        """
+        self._index.pop((provider, user_id), None)
+
+    def refresh_error(self, provider: str, user_id: int) -> Optional[str]:
+        """
+        Get the error of a failed background refresh, if any.
+
+        Args:
+            provider: Provider name
+            user_id: User ID
+
+        Returns:
+            Error message, or None if the last refresh did not fail
+        """
+        entry = self._index.get((provider, user_id))
+        return entry.error if entry else None
+
+    def is_due(self, provider: str, user: User, margin: timedelta) -> bool:
+        """
+        Check whether a user's token expires within a margin.
+
+        Tokens without an expiry are always due.
+
+        Args:
+            provider: Provider name
+            user: User holding the token
+            margin: How far ahead to look
+
+        Returns:
+            bool: True if the token should be refreshed
+        """
+        expires_at = getattr(user, PROVIDERS[provider].expires_field)
+        return expires_at is None or expires_at <= datetime.now(timezone.utc) + margin
+
+    async def ensure_valid(self, provider: str, user: User) -> User:
+        """
+        Make sure a user's token is usable, refreshing only if it must.
+
+        A token inside the refresh lead time is returned as is and refreshed
+        in the background; only a token that has (nearly) run out is
+        refreshed before returning. When the manager is not running, tokens
+        inside the lead time are refreshed inline.
+
+        Args:
+            provider: Provider name
+            user: User holding the token (updated in place)
+
+        Returns:
+            User: The same user, with a valid token
+
+        Raises:
+            ValueError: If the account or refresh token is missing
+            httpx.HTTPError: If a required refresh fails
+        """
+        await self._sync_from_index(provider, user)
+        self._touch(provider, user)
+
+        if not self.is_due(provider, user, self.lead):
+            return user
+
+        if self._running and not self.is_due(provider, user, MIN_VALIDITY):
+            if not self.refresh_error(provider, user.id):
+                self._start_refresh(provider, user)
+            return user
+
+        return await self.refresh(provider, user)
+
+    def refresh_soon(self, provider: str, user: User) -> bool:
+        """
+        Start a background refresh if a user's token is inside the lead time.
+
+        Never waits; used on page loads, where a stale token only matters to
+        the few calls that use it.
+
+        Args:
+            provider: Provider name
+            user: User holding the token
+
+        Returns:
+            bool: True if a refresh is running for the token
+        """
+        self._touch(provider, user)
+        if not self.is_due(provider, user, self.lead):
+            return False
+        if self.refresh_error(provider, user.id):
+            return False
+        self._start_refresh(provider, user)
+        return True
+
+    async def refresh(self, provider: str, user: User) -> User:
+        """
+        Refresh a user's token, sharing a refresh already in flight.
+
+        Args:
+            provider: Provider name
+            user: User holding the token (updated in place)
+
+        Returns:
+            User: The same user, with the refreshed token
+
+        Raises:
+            ValueError: If the account or refresh token is missing
+            httpx.HTTPError: If the refresh fails
+        """
+        key = (provider, user.id)
+        if key in self._inflight:
+            self.coalesced += 1
+        task = self._start_refresh(provider, user)
+        tokens = await asyncio.shield(task)
+        for name, value in zip(PROVIDERS[provider].fields, tokens):
+            setattr(user, name, value)
+        return user
+
+    def _start_refresh(self, provider: str, user: User) -> asyncio.Task:
+        """Get the in-flight refresh of a token, starting one if needed."""
+        key = (provider, user.id)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh(provider, user))
+            # Background refreshes may have no awaiter; failures are logged
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+        return task
+
+    async def _refresh(self, provider: str, user: User) -> tuple:
+        """Refresh and store a token; returns the new token column values."""
+        from application.services.core.user_service import UserService
+
+        spec = PROVIDERS[provider]
+        key = (provider, user.id)
+        try:
+            user = await getattr(UserService(), spec.refresh_method)(user)
+        except Exception as e:
+            self.failures += 1
+            entry = self._index.get(key)
+            if entry is not None:
+                entry.error = str(e) or type(e).__name__
+            logger.warning(
+                "Failed to refresh %s token for user %s: %s", provider, user.id, e
+            )
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        self.refreshes += 1
+        self.track(provider, user)
+        return tuple(getattr(user, name) for name in spec.fields)
+
+    async def _sync_from_index(self, provider: str, user: User) -> None:
+        """Reload a user's tokens if the index knows of a newer refresh."""
+        entry = self._index.get((provider, user.id))
+        if entry is None or entry.expires_at is None:
+            return
+        spec = PROVIDERS[provider]
+        expires_at = getattr(user, spec.expires_field)
+        if expires_at is not None and expires_at >= entry.expires_at:
+            return
+
+        # Loaded before a refresh that rotated the tokens
+        fresh = await User.filter(id=user.id).values(*spec.fields)
+        if fresh:
+            for name in spec.fields:
+                setattr(user, name, fresh[0][name])
+
+    def _touch(self, provider: str, user: User) -> None:
+        """Mark a token as in use, adding it to the index if needed."""
+        entry = self._index.get((provider, user.id))
+        expires_at = getattr(user, PROVIDERS[provider].expires_field)
+        if entry is None:
+            self.track(provider, user)
+            return
+        entry.last_used = time.monotonic()
+        if expires_at is not None and (
+            entry.expires_at is None or expires_at > entry.expires_at
+        ):
+            # Refreshed elsewhere (another process, or a new login)
+            entry.expires_at = expires_at
+
+    async def refresh_due(self) -> int:
+        """
+        Start background refreshes of every recently used token due soon.
+
+        Tokens unused for TOKEN_REFRESH_ACTIVE_SECONDS leave the index
+        instead of being refreshed.
+
+        Returns:
+            int: Number of refreshes started
+        """
+        horizon = datetime.now(timezone.utc) + self.lead
+        idle_before = time.monotonic() - settings.TOKEN_REFRESH_ACTIVE_SECONDS
+
+        due = []
+        for key, entry in list(self._index.items()):
+            if entry.error or key in self._inflight:
+                continue
+            if entry.expires_at is not None and entry.expires_at > horizon:
+                continue
+            if entry.last_used < idle_before:
+                del self._index[key]
+                continue
+            due.append(key)
+
+        if not due:
+            return 0
+
+        started = 0
+        users = {u.id: u for u in await User.filter(id__in={k[1] for k in due})}
+        for provider, user_id in due:
+            user = users.get(user_id)
+            if user is None:
+                self._index.pop((provider, user_id), None)
+                continue
+            spec = PROVIDERS[provider]
+            entry = self._index[(provider, user_id)]
+            expires_at = getattr(user, spec.expires_field)
+            if expires_at is not None and expires_at > horizon:
+                # Already refreshed by another process
+                entry.expires_at = expires_at
+                continue
+            if getattr(user, spec.refresh_field) is None:
+                # Cannot be refreshed ahead of time; callers handle expiry
+                entry.error = "No refresh token"
+                continue
+            self._start_refresh(provider, user)
+            started += 1
+        return started
+
+    def _seconds_until_next_due(self) -> float:
+        """Seconds until the earliest tracked token enters the lead time."""
+        now = datetime.now(timezone.utc)
+        upcoming = [
+            (entry.expires_at - self.lead - now).total_seconds()
+            for entry in self._index.values()
+            if entry.expires_at is not None and entry.error is None
+        ]
+        return max(0.0, min(upcoming + [MAX_SCAN_INTERVAL_SECONDS]))
+
+    def next_delay(self) -> float:
+        """Sleep until the next tracked token enters the lead time."""
+        return max(1.0, self._seconds_until_next_due())
+
+    async def run_once(self) -> None:
+        """Refresh tokens that entered the lead time."""
+        await self.refresh_due()
+
+    async def start(self) -> bool:
+        """Start background refresh."""
+        if not await super().start():
+            return False
+        # Refresh tokens already due without waiting for the first delay
+        self.wake()
+        logger.info(
+            "Token manager started (refresh lead %ss)", self.lead.total_seconds()
+        )
+        return True
+
+    async def stop(self) -> bool:
+        """Stop background refresh and wait for refreshes in flight."""
+        if not await super().stop():
+            return False
+
+        await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+        logger.info("Token manager stopped")
+        return True
+
+    def reset(self) -> None:
+        """Forget every tracked token and reset counters (tests)."""
+        self._index.clear()
+        self.refreshes = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get token manager statistics.
+
+        Returns:
+            Dict with tracked tokens per provider and refresh counters
+        """
+        tracked: Dict[str, int] = {name: 0 for name in PROVIDERS}
+        failed = 0
+        for (provider, _user_id), entry in self._index.items():
+            tracked[provider] += 1
+            if entry.error:
+                failed += 1
+        return {
+            "running": self._running,
+            "tracked": tracked,
+            "in_flight": len(self._inflight),
+            "refreshes": self.refreshes,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "failed_tokens": failed,
+        }
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Mark a background refresh's failure as handled (it is already logged)."""
+    if not task.cancelled():
+        task.exception()
+
+
+# Global token manager instance
+_manager: Optional[TokenManager] = None
+
+
+def get_token_manager() -> TokenManager:
+    """Get the global token manager instance."""
+    global _manager
+    if _manager is None:
+        _manager = TokenManager()
+    return _manager
+
+
+async def start_token_manager():
+    """Start background token refresh (called from app lifespan)."""
+    await get_token_manager().start()
+
+
+async def stop_token_manager():
+    """Stop background token refresh (called from app lifespan)."""
+    await get_token_manager().stop()
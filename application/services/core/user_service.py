@@ -9,6 +9,12 @@ from datetime import datetime
 from models import User, Permission, SYSTEM_USER_ID
 from typing import Optional
 from application.repositories.user_repository import UserRepository
+from application.services.core.token_manager import (
+    DISCORD,
+    RACETIME,
+    TWITCH,
+    get_token_manager,
+)
 from application.events import EventBus, UserCreatedEvent, UserPermissionChangedEvent
 
 logger = logging.getLogger(__name__)
@@ -348,6 +354,7 @@ class UserService:
         user.racetime_refresh_token = refresh_token
         user.racetime_token_expires_at = expires_at
         await user.save()
+        get_token_manager().track(RACETIME, user)
 
         logger.info("Linked RaceTime account %s to user %s", racetime_id, user.id)
         return user
@@ -356,6 +363,9 @@ class UserService:
         """
         Refresh RaceTime.gg access token for a user.
 
+        Only saves the token columns. Callers should go through
+        TokenManager.refresh(), which shares concurrent refreshes.
+
         Args:
             user: User with linked RaceTime account
 
@@ -389,7 +399,14 @@ class UserService:
                 token_response["expires_in"]
             )
 
-        await user.save()
+        await user.save(
+            update_fields=[
+                "racetime_access_token",
+                "racetime_refresh_token",
+                "racetime_token_expires_at",
+                "updated_at",
+            ]
+        )
 
         logger.info("Refreshed RaceTime token for user %s", user.id)
         return user
@@ -410,6 +427,7 @@ class UserService:
         user.racetime_refresh_token = None
         user.racetime_token_expires_at = None
         await user.save()
+        get_token_manager().forget(RACETIME, user.id)
 
         logger.info("Unlinked RaceTime account from user %s", user.id)
         return user
@@ -482,6 +500,7 @@ class UserService:
         user.discord_refresh_token = refresh_token
         user.discord_token_expires_at = expires_at
         await user.save()
+        get_token_manager().track(DISCORD, user)
 
         logger.info("Updated Discord tokens for user %s", user.id)
         return user
@@ -490,6 +509,9 @@ class UserService:
         """
         Refresh Discord access token for a user.
 
+        Only saves the token columns. Callers should go through
+        TokenManager.refresh(), which shares concurrent refreshes.
+
         Args:
             user: User with Discord OAuth2 tokens
 
@@ -524,7 +546,14 @@ class UserService:
             )
             user.discord_token_expires_at = expires_at
 
-        await user.save()
+        await user.save(
+            update_fields=[
+                "discord_access_token",
+                "discord_refresh_token",
+                "discord_token_expires_at",
+                "updated_at",
+            ]
+        )
 
         logger.info("Refreshed Discord token for user %s", user.id)
         return user
@@ -688,6 +717,7 @@ class UserService:
         user.twitch_refresh_token = refresh_token
         user.twitch_token_expires_at = expires_at
         await user.save()
+        get_token_manager().track(TWITCH, user)
 
         logger.info("Linked Twitch account %s to user %s", twitch_id, user.id)
         return user
@@ -696,6 +726,9 @@ class UserService:
         """
         Refresh Twitch access token for a user.
 
+        Only saves the token columns. Callers should go through
+        TokenManager.refresh(), which shares concurrent refreshes.
+
         Args:
             user: User with linked Twitch account
 
@@ -729,7 +762,14 @@ class UserService:
                 token_response["expires_in"]
             )
 
-        await user.save()
+        await user.save(
+            update_fields=[
+                "twitch_access_token",
+                "twitch_refresh_token",
+                "twitch_token_expires_at",
+                "updated_at",
+            ]
+        )
 
         logger.info("Refreshed Twitch token for user %s", user.id)
         return user
@@ -751,6 +791,7 @@ class UserService:
         user.twitch_refresh_token = None
         user.twitch_token_expires_at = None
         await user.save()
+        get_token_manager().forget(TWITCH, user.id)
 
         logger.info("Unlinked Twitch account from user %s", user.id)
         return user
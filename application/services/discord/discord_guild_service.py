@@ -6,8 +6,8 @@ Handles linking Discord servers to organizations with permission verification.
 from __future__ import annotations
 from typing import Optional, List
 from dataclasses import dataclass
+import asyncio
 import logging
-import httpx
 from urllib.parse import urlencode
 import discord
 
@@ -23,6 +23,7 @@ from application.events import (
     DiscordGuildLinkedEvent,
     DiscordGuildUnlinkedEvent,
 )
+from application.utils.oauth_clients import DISCORD, get_oauth_client
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -103,7 +104,8 @@ class DiscordGuildService:
             Error codes: 'no_membership', 'oauth_failed', 'no_access_token',
                         'guild_not_found', 'no_admin_permissions', 'already_linked'
         """
-        # Verify user is organization admin
+        # Verify user is organization admin before redeeming the
+        # single-use code, so an unauthorized caller cannot consume it
         if not await self.org_service.user_can_admin_org(user, organization_id):
             logger.warning(
                 "User %s attempted to link guild to org %s without admin permission",
@@ -132,8 +134,16 @@ class DiscordGuildService:
 
         logger.debug("Successfully obtained access token")
 
-        # Get user's guilds to verify they have admin permissions
-        guild_info = await self._get_user_guild_info(access_token, guild_id)
+        # Get user's guilds to verify they have admin permissions. When the
+        # guild is known up front, look up an existing link at the same time.
+        if guild_id and str(guild_id).isdigit():
+            guild_info, existing = await asyncio.gather(
+                self._get_user_guild_info(access_token, guild_id),
+                self.repo.get_guild(organization_id, int(guild_id)),
+            )
+        else:
+            guild_info = await self._get_user_guild_info(access_token, guild_id)
+            existing = None
         if not guild_info:
             logger.error(
                 "Failed to get guild info from Discord API (guild_id=%s)",
@@ -159,7 +169,8 @@ class DiscordGuildService:
             return None, "no_admin_permissions"
 
         # Check if this organization already has this guild linked
-        existing = await self.repo.get_guild(organization_id, int(actual_guild_id))
+        if existing is None and str(actual_guild_id) != str(guild_id):
+            existing = await self.repo.get_guild(organization_id, int(actual_guild_id))
         if existing:
             logger.warning(
                 "Guild %s is already linked to org %s", actual_guild_id, organization_id
@@ -199,24 +210,23 @@ class DiscordGuildService:
 
     async def _exchange_code(self, code: str, redirect_uri: str) -> Optional[dict]:
         """Exchange OAuth2 code for access token."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{DISCORD_API_BASE}/oauth2/token",
-                    data={
-                        "client_id": settings.DISCORD_CLIENT_ID,
-                        "client_secret": settings.DISCORD_CLIENT_SECRET,
-                        "grant_type": "authorization_code",
-                        "code": code,
-                        "redirect_uri": redirect_uri,
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                logger.error("Error exchanging OAuth2 code: %s", e)
-                return None
+        try:
+            response = await get_oauth_client(DISCORD).post(
+                f"{DISCORD_API_BASE}/oauth2/token",
+                data={
+                    "client_id": settings.DISCORD_CLIENT_ID,
+                    "client_secret": settings.DISCORD_CLIENT_SECRET,
+                    "grant_type": "authorization_code",
+                    "code": code,
+                    "redirect_uri": redirect_uri,
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.error("Error exchanging OAuth2 code: %s", e)
+            return None
 
     async def _get_user_guild_info(
         self, access_token: str, guild_id: Optional[str] = None
@@ -231,32 +241,31 @@ class DiscordGuildService:
         Returns:
             Guild info dict or None if not found/error
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                # Get user's guilds
-                response = await client.get(
-                    f"{DISCORD_API_BASE}/users/@me/guilds",
-                    headers={"Authorization": f"Bearer {access_token}"},
-                )
-                response.raise_for_status()
-                guilds = response.json()
-
-                # If guild_id provided, find that specific guild
-                if guild_id:
-                    for guild in guilds:
-                        if str(guild.get("id")) == str(guild_id):
-                            return guild
-                    logger.warning("Guild %s not found in user's guild list", guild_id)
-                    return None
+        try:
+            # Get user's guilds
+            response = await get_oauth_client(DISCORD).get(
+                f"{DISCORD_API_BASE}/users/@me/guilds",
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            response.raise_for_status()
+            guilds = response.json()
+
+            # If guild_id provided, find that specific guild
+            if guild_id:
+                for guild in guilds:
+                    if str(guild.get("id")) == str(guild_id):
+                        return guild
+                logger.warning("Guild %s not found in user's guild list", guild_id)
+                return None
 
-                # Otherwise return the first guild (fallback for old flow)
-                if guilds:
-                    return guilds[0]
+            # Otherwise return the first guild (fallback for old flow)
+            if guilds:
+                return guilds[0]
 
-                return None
-            except Exception as e:
-                logger.error("Error fetching guild info: %s", e)
-                return None
+            return None
+        except Exception as e:
+            logger.error("Error fetching guild info: %s", e)
+            return None
 
     async def list_guilds(
         self, user: Optional[User], organization_id: int
@@ -79,8 +79,7 @@ class FeatureFlagService:
         Returns:
             List of enabled feature flag enums
         """
-        flags = await self.repository.list_enabled_by_organization(organization_id)
-        return [flag.feature_key for flag in flags]
+        return sorted(await self.repository.get_enabled_keys(organization_id))
 
     async def enable_feature(
         self,
@@ -14,6 +14,7 @@ from models.authorization import OrganizationRole, OrganizationMemberRole
 from models.organizations import OrganizationMember
 from application.repositories.organization_repository import OrganizationRepository
 from application.authorization.builtin_roles import get_builtin_role_definitions
+from application.utils.request_scope import invalidate_scoped, scoped_get
 from application.events import (
     EventBus,
     OrganizationCreatedEvent,
@@ -177,6 +178,7 @@ class OrganizationService:
         assignment = await OrganizationMemberRole.create(
             member=member, role=role, assigned_by=assigned_by
         )
+        self._invalidate_member_cache()
 
         logger.info(
             "Assigned role %s to member %s in organization %s",
@@ -538,6 +540,7 @@ class OrganizationService:
         self._validate_permission_names(permission_names)
         normalized = [self._normalize_name(n) for n in permission_names]
         await self.repo.add_permissions_to_member(organization_id, user_id, normalized)
+        self._invalidate_member_cache()
 
     async def set_permissions_for_member(
         self,
@@ -577,6 +580,7 @@ class OrganizationService:
         self._validate_permission_names(permission_names)
         normalized = [self._normalize_name(n) for n in permission_names]
         await self.repo.set_permissions_for_member(organization_id, user_id, normalized)
+        self._invalidate_member_cache()
         return True
 
     async def remove_permissions_from_member(
@@ -588,6 +592,7 @@ class OrganizationService:
         await self.repo.remove_permissions_from_member(
             organization_id, user_id, normalized
         )
+        self._invalidate_member_cache()
 
     # --- Members management ---
 
@@ -608,8 +613,18 @@ class OrganizationService:
         return await self.repo.count_members(organization_id)
 
     async def get_member(self, organization_id: int, user_id: int):
-        """Get a specific member with permissions loaded."""
-        return await self.repo.get_member(organization_id, user_id)
+        """Get a specific member with permissions loaded (memoized per request)."""
+        return await scoped_get(
+            "org_member",
+            (organization_id, user_id),
+            lambda: self.repo.get_member(organization_id, user_id),
+        )
+
+    @staticmethod
+    def _invalidate_member_cache() -> None:
+        """Drop request-scoped membership lookups after a membership write."""
+        invalidate_scoped("org_member")
+        invalidate_scoped("policy_member")
 
     async def is_member(self, user, organization_id: int) -> bool:
         """
@@ -636,6 +651,7 @@ class OrganizationService:
         Future: this will create an invite that must be accepted.
         """
         member = await self.repo.add_member(organization_id, user_id)
+        self._invalidate_member_cache()
 
         # Emit member added event
         if member:
@@ -5,9 +5,14 @@ Business logic for racer verification system allowing organization admins
 to configure Discord roles granted based on RaceTime race completion requirements.
 """
 
+import asyncio
 import logging
+from collections import Counter
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
+from config import settings
 from models import User, RacerVerification, UserRacerVerification
 from application.repositories.racer_verification_repository import (
     RacerVerificationRepository,
@@ -19,10 +24,130 @@ from application.services.authorization.authorization_service_v2 import (
 )
 from application.services.racetime.racetime_api_service import RacetimeApiService
 from application.services.core.audit_service import AuditService
+from application.utils.versioned_cache import VersionedCache
 from discordbot.client import get_bot_instance
 
 logger = logging.getLogger(__name__)
 
+# Race history per RaceTime user, partitioned by racetime_id. The cached
+# RaceHistory is extended in place (under its lock) as later checks need more
+# pages; it is never replaced until it expires.
+_race_history_cache = VersionedCache(
+    "racer_verification_history", settings.RACER_VERIFICATION_CACHE_TTL_SECONDS
+)
+
+
+@dataclass
+class RaceHistory:
+    """
+    A RaceTime user's race history, loaded page by page.
+
+    Only the per-(category, entrant status) race counts are kept, so every
+    verification can be evaluated against the same history in one lookup per
+    category instead of re-scanning the races.
+
+    The history is listed newest first and paginated by page number, so races
+    finished since the first page was loaded push older races onto later
+    pages. Counted race names are kept so a resumed load skips races it has
+    already counted on an earlier page.
+    """
+
+    racetime_id: str
+    counts: Counter = field(default_factory=Counter)
+    race_names: set[str] = field(default_factory=set)
+    pages_loaded: int = 0
+    num_pages: Optional[int] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every page of the history has been loaded."""
+        return self.num_pages is not None and self.pages_loaded >= self.num_pages
+
+    def add_page(self, races: list[dict]) -> None:
+        """
+        Count the user's result in every race of a page not counted yet.
+
+        Args:
+            races: Races from /user/{id}/races/data (with entrants)
+        """
+        for race in races:
+            name = race.get("name")
+            if name is not None:
+                if name in self.race_names:
+                    continue
+                self.race_names.add(name)
+            category = race.get("category", {}).get("slug")
+            for entrant in race.get("entrants", []):
+                if entrant.get("user", {}).get("id") == self.racetime_id:
+                    status = entrant.get("status", {}).get("value", "")
+                    self.counts[(category, status)] += 1
+                    break
+        self.pages_loaded += 1
+
+
+@dataclass
+class GuildReverificationResult:
+    """Outcome of re-verifying every verified racer of a guild."""
+
+    verifications: int = 0
+    users: int = 0
+    records: int = 0
+    roles_granted: int = 0
+    errors: int = 0
+
+
+def qualifying_statuses(verification: RacerVerification) -> tuple[str, ...]:
+    """
+    Get the entrant statuses that count towards a verification.
+
+    Args:
+        verification: Racer verification configuration
+
+    Returns:
+        Tuple of RaceTime entrant status values
+    """
+    statuses = ["done"]
+    if verification.count_forfeits:
+        statuses.append("dnf")
+    if verification.count_dq:
+        statuses.append("dq")
+    return tuple(statuses)
+
+
+def count_qualifying_races(
+    history: RaceHistory, verification: RacerVerification
+) -> int:
+    """
+    Count the races of a history that qualify for a verification.
+
+    Args:
+        history: Loaded race history
+        verification: Racer verification configuration
+
+    Returns:
+        Number of qualifying races across all of the verification's categories
+    """
+    statuses = qualifying_statuses(verification)
+    return sum(
+        history.counts[(category, status)]
+        for category in verification.categories
+        for status in statuses
+    )
+
+
+def clear_race_history_cache(racetime_id: Optional[str] = None) -> None:
+    """
+    Drop cached race histories.
+
+    Args:
+        racetime_id: RaceTime user to drop (default: everyone)
+    """
+    if racetime_id is None:
+        _race_history_cache.clear()
+    else:
+        _race_history_cache.invalidate(racetime_id)
+
 
 class RacerVerificationService:
     """Business logic for racer verification system."""
@@ -266,45 +391,12 @@ class RacerVerificationService:
                 "error": "No RaceTime account linked",
             }
 
-        # Fetch race data from RaceTime.gg (from all categories)
         try:
-            all_races = []
-            for category in verification.categories:
-                races = await self.racetime_api.get_user_races(
-                    user=user, category=category, show_entrants=False
-                )
-                all_races.extend(races)
-
-            # Count qualifying races
-            qualifying_races = 0
-            for race in all_races:
-                # Get user's entrant data from the race
-                entrant = next(
-                    (
-                        e
-                        for e in race.get("entrants", [])
-                        if e.get("user", {}).get("id") == user.racetime_id
-                    ),
-                    None,
-                )
-
-                if not entrant:
-                    continue
-
-                status = entrant.get("status", {}).get("value", "")
-
-                # Count based on configuration
-                if status == "done":
-                    qualifying_races += 1
-                elif status == "dnf" and verification.count_forfeits:
-                    qualifying_races += 1
-                elif status == "dq" and verification.count_dq:
-                    qualifying_races += 1
-
-            is_eligible = qualifying_races >= verification.minimum_races
+            counts = await self.count_races(user, [verification])
+            qualifying_races = counts[verification.id]
 
             return {
-                "is_eligible": is_eligible,
+                "is_eligible": qualifying_races >= verification.minimum_races,
                 "race_count": qualifying_races,
                 "minimum_required": verification.minimum_races,
                 "has_racetime_account": True,
@@ -326,6 +418,169 @@ class RacerVerificationService:
                 "error": f"Error fetching race data: {str(e)}",
             }
 
+    async def count_races(
+        self, user: User, verifications: list[RacerVerification]
+    ) -> dict[int, int]:
+        """
+        Count a user's qualifying races for several verifications at once.
+
+        The user's race history is fetched once and shared (for a short TTL)
+        with every other check of the same RaceTime account. Pages are only
+        fetched until every verification's minimum is met, so a count may stop
+        at the minimum rather than the user's full total.
+
+        Args:
+            user: User with a linked RaceTime account
+            verifications: Verifications to count races for
+
+        Returns:
+            Dict mapping verification ID to qualifying race count
+
+        Raises:
+            ValueError: If user has no linked account
+            httpx.HTTPError: If fetching the race history fails
+        """
+        history = await _race_history_cache.get_or_load(
+            user.racetime_id,
+            "history",
+            lambda: self._new_history(user.racetime_id),
+        )
+
+        def counts() -> dict[int, int]:
+            return {v.id: count_qualifying_races(history, v) for v in verifications}
+
+        def satisfied() -> bool:
+            current = counts()
+            return all(current[v.id] >= v.minimum_races for v in verifications)
+
+        if history.complete or satisfied():
+            return counts()
+
+        async with history.lock:
+            # Another check may have loaded the pages while we waited
+            if not history.complete and not satisfied():
+                pages = self.racetime_api.iter_user_race_pages(
+                    user, start_page=history.pages_loaded + 1
+                )
+                async with aclosing(pages):
+                    async for _page, num_pages, races in pages:
+                        history.num_pages = num_pages
+                        history.add_page(races)
+                        if satisfied():
+                            break
+
+                logger.debug(
+                    "Loaded %d of %s race history pages for RaceTime user %s",
+                    history.pages_loaded,
+                    history.num_pages,
+                    user.racetime_id,
+                )
+
+        return counts()
+
+    async def _new_history(self, racetime_id: str) -> RaceHistory:
+        """Create an empty race history (cache loader)."""
+        return RaceHistory(racetime_id=racetime_id)
+
+    async def reverify_guild(
+        self, guild_id: int, concurrency: Optional[int] = None
+    ) -> GuildReverificationResult:
+        """
+        Re-check every verified racer of a Discord guild.
+
+        Each user's race history is fetched once for all of the guild's
+        verifications (and reused from the cache where possible), with up to
+        ``concurrency`` users checked in parallel. Race counts and check
+        errors are recorded, and roles that failed to be granted earlier are
+        granted again. Verified users are never un-verified.
+
+        Args:
+            guild_id: Discord guild ID
+            concurrency: Users checked in parallel (default from settings)
+
+        Returns:
+            GuildReverificationResult: Counts of users, records and grants
+        """
+        result = GuildReverificationResult()
+        verifications = {v.id: v for v in await self.repository.list_by_guild(guild_id)}
+        result.verifications = len(verifications)
+        if not verifications:
+            return result
+
+        records_by_user: dict[int, list[UserRacerVerification]] = {}
+        for (
+            record
+        ) in await self.user_verification_repository.list_verified_for_verifications(
+            list(verifications)
+        ):
+            records_by_user.setdefault(record.user_id, []).append(record)
+        result.users = len(records_by_user)
+
+        semaphore = asyncio.Semaphore(
+            max(1, concurrency or settings.RACER_VERIFICATION_CONCURRENCY)
+        )
+
+        async def check(records: list[UserRacerVerification]) -> None:
+            user = records[0].user
+            user_verifications = [verifications[r.verification_id] for r in records]
+            error = None
+            counts: dict[int, int] = {}
+
+            async with semaphore:
+                if not user.racetime_id:
+                    error = "No RaceTime account linked"
+                else:
+                    try:
+                        counts = await self.count_races(user, user_verifications)
+                    except Exception as e:
+                        logger.warning(
+                            "Error re-verifying user %s in guild %s: %s",
+                            user.id,
+                            guild_id,
+                            e,
+                        )
+                        error = f"Error fetching race data: {str(e)}"
+
+            now = datetime.now(timezone.utc)
+            for record in records:
+                verification = verifications[record.verification_id]
+                record.last_checked_at = now
+                record.updated_at = now
+                record.last_check_error = error
+                if error:
+                    result.errors += 1
+                    continue
+
+                record.race_count = counts[verification.id]
+                if record.role_granted:
+                    continue
+                if record.race_count >= verification.minimum_races and (
+                    await self._grant_discord_role(
+                        user=user,
+                        guild_id=verification.guild_id,
+                        role_id=verification.role_id,
+                    )
+                ):
+                    record.role_granted = True
+                    record.role_granted_at = now
+                    result.roles_granted += 1
+
+        await asyncio.gather(*(check(records) for records in records_by_user.values()))
+
+        checked = [r for records in records_by_user.values() for r in records]
+        await self.user_verification_repository.save_checks(checked)
+        result.records = len(checked)
+
+        logger.info(
+            "Re-verified %d user(s) in guild %s: %d record(s), %d role(s) granted, %d error(s)",
+            result.users,
+            guild_id,
+            result.records,
+            result.roles_granted,
+            result.errors,
+        )
+        return result
+
     async def verify_user(
         self, user: User, verification_id: int
     ) -> Optional[UserRacerVerification]:
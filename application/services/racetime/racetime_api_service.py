@@ -7,10 +7,11 @@ with automatic token refresh when tokens are expired.
 
 import httpx
 import logging
-from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 from models import User
 from config import settings
+from application.services.core.token_manager import RACETIME, get_token_manager
 
 logger = logging.getLogger(__name__)
 
@@ -26,14 +27,14 @@ class RacetimeApiService:
     def __init__(self):
         """Initialize the RaceTime API service."""
         self.racetime_url = settings.RACETIME_URL
-        self.token_refresh_buffer = timedelta(
-            minutes=5
-        )  # Refresh if expiring within 5 minutes
 
     async def _ensure_valid_token(self, user: User) -> str:
         """
         Ensure user has a valid access token, refreshing if necessary.
 
+        Tokens close to expiry are refreshed in the background by the token
+        manager; this only waits when the token has actually run out.
+
         Args:
             user: User with linked RaceTime account
 
@@ -44,36 +45,26 @@ class RacetimeApiService:
             ValueError: If user has no linked account
             httpx.HTTPError: If token refresh fails
         """
-        from application.services.core.user_service import UserService
-
         if not user.racetime_id or not user.racetime_access_token:
             raise ValueError("User has no linked RaceTime account")
 
-        # Check if token is expired or expiring soon
-        if user.racetime_token_expires_at:
-            now = datetime.now(timezone.utc)
-            if user.racetime_token_expires_at <= now + self.token_refresh_buffer:
-                logger.info(
-                    "RaceTime token for user %s is expired or expiring soon, refreshing",
-                    user.id,
+        # Nothing to refresh with: use the token for as long as it lasts
+        if not user.racetime_refresh_token:
+            if user.racetime_token_expires_at and (
+                user.racetime_token_expires_at <= datetime.now(timezone.utc)
+            ):
+                logger.warning(
+                    "User %s has expired token but no refresh token", user.id
                 )
-
-                # Check if we have a refresh token
-                if not user.racetime_refresh_token:
-                    logger.warning(
-                        "User %s has expired token but no refresh token", user.id
-                    )
-                    raise ValueError(
-                        "RaceTime token is expired and no refresh token available"
-                    )
-
-                # Refresh the token
-                user_service = UserService()
-                user = await user_service.refresh_racetime_token(user)
-                logger.info(
-                    "Successfully refreshed RaceTime token for user %s", user.id
+                raise ValueError(
+                    "RaceTime token is expired and no refresh token available"
                 )
+            return user.racetime_access_token
 
+        if not user.racetime_token_expires_at:
+            return user.racetime_access_token
+
+        user = await get_token_manager().ensure_valid(RACETIME, user)
         return user.racetime_access_token
 
     async def _make_api_request(
@@ -98,30 +89,55 @@ class RacetimeApiService:
         # Ensure we have a valid token
         access_token = await self._ensure_valid_token(user)
 
-        # Make the API request
+        async with httpx.AsyncClient() as client:
+            return await self._send(client, access_token, method, endpoint, **kwargs)
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        access_token: str,
+        method: str,
+        endpoint: str,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Send an API request with an already validated access token.
+
+        Args:
+            client: HTTP client to send the request with
+            access_token: Valid RaceTime access token
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (without base URL)
+            **kwargs: Additional arguments to pass to httpx request
+
+        Returns:
+            Dict[str, Any]: JSON response from API
+
+        Raises:
+            httpx.HTTPError: If API request fails
+        """
         url = f"{self.racetime_url}{endpoint}"
         headers = kwargs.pop("headers", {})
         headers["Authorization"] = f"Bearer {access_token}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method, url=url, headers=headers, **kwargs
-            )
+        response = await client.request(
+            method=method, url=url, headers=headers, **kwargs
+        )
 
-            if response.status_code != 200:
-                logger.error(
-                    "RaceTime API request failed: %s %s - status %s",
-                    method,
-                    endpoint,
-                    response.status_code,
-                )
-                raise httpx.HTTPStatusError(
-                    f"RaceTime API request failed",
-                    request=response.request,
-                    response=response,
-                )
+        if response.status_code != 200:
+            logger.error(
+                "RaceTime API request failed: %s %s - status %s",
+                method,
+                endpoint,
+                response.status_code,
+            )
+            raise httpx.HTTPStatusError(
+                f"RaceTime API request failed",
+                request=response.request,
+                response=response,
+            )
 
-            return response.json()
+        return response.json()
 
     async def get_user_data(self, user: User) -> Dict[str, Any]:
         """
@@ -175,6 +191,51 @@ class RacetimeApiService:
 
         return races
 
+    async def iter_user_race_pages(
+        self, user: User, start_page: int = 1, show_entrants: bool = True
+    ) -> AsyncIterator[Tuple[int, int, List[Dict[str, Any]]]]:
+        """
+        Stream a RaceTime user's race history one page at a time.
+
+        The token is validated once and every page is fetched over the same
+        connection, so callers that stop iterating early (e.g. once enough
+        races have been counted) skip the remaining pages entirely.
+
+        Args:
+            user: User with linked RaceTime account
+            start_page: First page to fetch (1-based)
+            show_entrants: Include entrant details in response
+
+        Yields:
+            Tuple of (page number, total pages, races on the page)
+
+        Raises:
+            ValueError: If user has no linked account
+            httpx.HTTPError: If API request fails
+        """
+        if not user.racetime_id:
+            raise ValueError("User has no linked RaceTime account")
+
+        access_token = await self._ensure_valid_token(user)
+        endpoint = f"/user/{user.racetime_id}/races/data"
+
+        async with httpx.AsyncClient() as client:
+            page = start_page
+            while True:
+                params = {"page": page}
+                if show_entrants:
+                    params["show_entrants"] = "true"
+
+                response = await self._send(
+                    client, access_token, "GET", endpoint, params=params
+                )
+                num_pages = response.get("num_pages") or 1
+                yield page, num_pages, response.get("races", [])
+
+                if page >= num_pages:
+                    return
+                page += 1
+
     async def get_user_stats(self, user: User, category: str) -> Dict[str, Any]:
         """
         Get statistics for a user in a specific category.
@@ -11,9 +11,11 @@ rather than from environment settings.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Iterable, Optional, Tuple
 
+from config import settings
 from models import RacetimeBot
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,7 @@ class RacetimeService:
         Start racetime bots for all configured categories.
 
         If no configs are provided, loads active bots from the database.
+        Bots are started concurrently, bounded by RACETIME_STARTUP_CONCURRENCY.
 
         Args:
             configs: Optional iterable of (category, client_id, client_secret).
@@ -39,9 +42,7 @@ class RacetimeService:
             int: Number of bots started successfully.
         """
         # Lazy import to avoid circular dependency
-        from racetime.client import start_racetime_bot
-
-        started = 0
+        from racetime.client import start_racetime_bot, set_expected_bot_count
 
         # Load configs from database if not provided
         if configs is None:
@@ -63,48 +64,68 @@ class RacetimeService:
                 (cat, cid, csec, None, "SahaRaceHandler") for cat, cid, csec in configs
             ]
 
+        set_expected_bot_count(len(cfgs))
+
         if not cfgs:
             logger.info("No racetime bots configured")
             return 0
 
         logger.info("Starting %d racetime bot(s)", len(cfgs))
 
-        for category, client_id, client_secret, bot_id, handler_class_name in cfgs:
-            try:
-                await start_racetime_bot(
-                    category,
-                    client_id,
-                    client_secret,
-                    bot_id=bot_id,
-                    handler_class_name=handler_class_name,
-                )
-                logger.info(
-                    "Racetime bot started for category: %s (bot_id=%s, handler=%s)",
-                    category,
-                    bot_id,
-                    handler_class_name,
-                )
-                started += 1
-            except Exception as e:
-                logger.error(
-                    "Failed to start Racetime bot for category %s: %s",
-                    category,
-                    e,
-                    exc_info=True,
-                )
-                logger.warning(
-                    "Application will continue without Racetime bot for %s",
-                    category,
-                )
-        return started
+        semaphore = asyncio.Semaphore(max(1, settings.RACETIME_STARTUP_CONCURRENCY))
+
+        async def start_one(
+            category: str,
+            client_id: str,
+            client_secret: str,
+            bot_id: Optional[int],
+            handler_class_name: str,
+        ) -> bool:
+            async with semaphore:
+                try:
+                    await start_racetime_bot(
+                        category,
+                        client_id,
+                        client_secret,
+                        bot_id=bot_id,
+                        handler_class_name=handler_class_name,
+                    )
+                    logger.info(
+                        "Racetime bot started for category: %s (bot_id=%s, handler=%s)",
+                        category,
+                        bot_id,
+                        handler_class_name,
+                    )
+                    return True
+                except Exception as e:
+                    logger.error(
+                        "Failed to start Racetime bot for category %s: %s",
+                        category,
+                        e,
+                        exc_info=True,
+                    )
+                    logger.warning(
+                        "Application will continue without Racetime bot for %s",
+                        category,
+                    )
+                    return False
+
+        results = await asyncio.gather(*(start_one(*cfg) for cfg in cfgs))
+        return sum(1 for started in results if started)
 
     @staticmethod
     async def stop_all() -> None:
         """Stop all running racetime bots (best-effort)."""
         # Lazy import to avoid circular dependency
         from racetime.client import stop_all_racetime_bots
+        from application.utils.aiohttp_pool import close_pool
 
         try:
             await stop_all_racetime_bots()
         except Exception as e:
             logger.error("Error stopping Racetime bots: %s", e, exc_info=True)
+
+        try:
+            await close_pool()
+        except Exception as e:
+            logger.error("Error closing shared HTTP pool: %s", e, exc_info=True)
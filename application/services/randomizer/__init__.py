@@ -5,19 +5,26 @@ This package contains services for various game randomizers.
 Each randomizer has its own service class that handles generation and configuration.
 """
 
-from .randomizer_service import RandomizerService
-from .alttpr_service import ALTTPRService
-from .alttpr_mystery_service import ALTTPRMysteryService
-from .aosr_service import AOSRService
-from .z1r_service import Z1RService
-from .ootr_service import OOTRService
-from .ffr_service import FFRService
-from .smb3r_service import SMB3RService
-from .sm_service import SMService
-from .smz3_service import SMZ3Service
-from .ctjets_service import CTJetsService
-from .bingosync_service import BingosyncService
-from .avianart_service import AvianartService
+import importlib
+
+# Service classes are imported on first access: most processes only ever use
+# one or two randomizers, and importing all of them slows down startup.
+_EXPORTS = {
+    "RandomizerService": "randomizer_service",
+    "ALTTPRService": "alttpr_service",
+    "ALTTPRMysteryService": "alttpr_mystery_service",
+    "AOSRService": "aosr_service",
+    "Z1RService": "z1r_service",
+    "OOTRService": "ootr_service",
+    "FFRService": "ffr_service",
+    "SMB3RService": "smb3r_service",
+    "SMService": "sm_service",
+    "SMZ3Service": "smz3_service",
+    "CTJetsService": "ctjets_service",
+    "BingosyncService": "bingosync_service",
+    "AvianartService": "avianart_service",
+    "SeedPoolService": "seed_pool_service",
+}
 
 __all__ = [
     "RandomizerService",
@@ -33,4 +40,15 @@ __all__ = [
     "CTJetsService",
     "BingosyncService",
     "AvianartService",
+    "SeedPoolService",
 ]
+
+
+def __getattr__(name: str):
+    """Import service classes lazily (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -6,8 +6,8 @@ This service handles generation of ALTTPR seeds via the official API.
 
 import logging
 from typing import Dict, Any, Optional
-import httpx
 from config import settings
+from application.utils.http_client import get_randomizer_client
 from .randomizer_service import RandomizerResult
 
 logger = logging.getLogger(__name__)
@@ -72,10 +72,10 @@ class ALTTPRService:
 
         logger.info("Generating ALTTPR seed with endpoint %s", endpoint)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=settings_dict, timeout=60.0)
-            response.raise_for_status()
-            result = response.json()
+        client = get_randomizer_client("alttpr")
+        response = await client.post(url, json=settings_dict, timeout=60.0)
+        response.raise_for_status()
+        result = response.json()
 
         # Extract data from response
         hash_id = result.get("hash", result.get("seed", {}).get("hash", "unknown"))
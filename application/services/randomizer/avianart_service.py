@@ -7,7 +7,7 @@ Avianart API (Hi, I'm Cody's door randomizer generator).
 
 import logging
 import asyncio
-import httpx
+from application.utils.http_client import get_randomizer_client
 from .randomizer_service import RandomizerResult
 
 logger = logging.getLogger(__name__)
@@ -54,59 +54,63 @@ class AvianartService:
         # Prepare payload for generation
         payload = [{"args": {"race": race}}]
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Step 1: Initiate seed generation
-            response = await client.post(
-                f"{self.BASE_URL}/api.php?action=generate&preset={preset}", json=payload
+        client = get_randomizer_client("avianart")
+
+        # Step 1: Initiate seed generation
+        response = await client.post(
+            f"{self.BASE_URL}/api.php?action=generate&preset={preset}",
+            json=payload,
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        result = response.json()
+
+        hash_id = result["response"]["hash"]
+        logger.info("Avianart seed generation started with hash %s", hash_id)
+
+        # Step 2: Poll until generation is complete
+        attempts = 0
+        while attempts < self.MAX_POLL_ATTEMPTS:
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+            attempts += 1
+
+            response = await client.get(
+                f"{self.BASE_URL}/api.php?action=permlink&hash={hash_id}",
+                timeout=60.0,
             )
             response.raise_for_status()
             result = response.json()
 
-            hash_id = result["response"]["hash"]
-            logger.info("Avianart seed generation started with hash %s", hash_id)
-
-            # Step 2: Poll until generation is complete
-            attempts = 0
-            while attempts < self.MAX_POLL_ATTEMPTS:
-                await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
-                attempts += 1
+            status = result["response"].get("status", "finished")
 
-                response = await client.get(
-                    f"{self.BASE_URL}/api.php?action=permlink&hash={hash_id}"
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                status = result["response"].get("status", "finished")
-
-                if status == "finished":
-                    logger.info(
-                        "Avianart seed %s generated successfully after %s attempts",
-                        hash_id,
-                        attempts,
-                    )
-                    break
-
-                if status == "failure":
-                    error_msg = result["response"].get("message", "Unknown error")
-                    logger.error("Avianart seed generation failed: %s", error_msg)
-                    raise ValueError(f"Failed to generate Avianart seed: {error_msg}")
-
-                logger.debug(
-                    "Avianart seed %s still generating (attempt %s/%s, status=%s)",
+            if status == "finished":
+                logger.info(
+                    "Avianart seed %s generated successfully after %s attempts",
                     hash_id,
                     attempts,
-                    self.MAX_POLL_ATTEMPTS,
-                    status,
                 )
+                break
+
+            if status == "failure":
+                error_msg = result["response"].get("message", "Unknown error")
+                logger.error("Avianart seed generation failed: %s", error_msg)
+                raise ValueError(f"Failed to generate Avianart seed: {error_msg}")
+
+            logger.debug(
+                "Avianart seed %s still generating (attempt %s/%s, status=%s)",
+                hash_id,
+                attempts,
+                self.MAX_POLL_ATTEMPTS,
+                status,
+            )
 
-            if attempts >= self.MAX_POLL_ATTEMPTS:
-                logger.error(
-                    "Avianart seed generation timed out after %s attempts", attempts
-                )
-                raise TimeoutError(
-                    f"Seed generation timed out after {attempts * self.POLL_INTERVAL_SECONDS} seconds"
-                )
+        if attempts >= self.MAX_POLL_ATTEMPTS:
+            logger.error(
+                "Avianart seed generation timed out after %s attempts", attempts
+            )
+            raise TimeoutError(
+                f"Seed generation timed out after {attempts * self.POLL_INTERVAL_SECONDS} seconds"
+            )
 
         # Extract file select code from spoiler
         try:
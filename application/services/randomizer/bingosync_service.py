@@ -6,8 +6,8 @@ This service handles creation of Bingosync rooms and bingo card generation.
 
 import logging
 from typing import Optional, Dict, Any
-import httpx
 from bs4 import BeautifulSoup
+from application.utils.http_client import get_randomizer_client
 from .randomizer_service import RandomizerResult
 
 logger = logging.getLogger(__name__)
@@ -90,43 +90,43 @@ class BingosyncService:
 
         logger.info("Creating Bingosync room: %s", room_name)
 
-        async with httpx.AsyncClient(
-            cookies=self.cookies, follow_redirects=False
-        ) as client:
-            response = await client.post(
-                self.BASE_URL,
-                data=data,
-                headers={"Origin": self.BASE_URL, "Referer": self.BASE_URL},
+        client = get_randomizer_client("bingosync")
+        response = await client.post(
+            self.BASE_URL,
+            data=data,
+            headers={"Origin": self.BASE_URL, "Referer": self.BASE_URL},
+            cookies=self.cookies,
+            follow_redirects=False,
+        )
+
+        # Store cookies for future requests
+        self.cookies.update(response.cookies)
+
+        if response.status_code == 302:
+            room_id = response.headers["Location"].split("/")[-1]
+            room_url = f"{self.BASE_URL}/room/{room_id}"
+
+            logger.info("Created Bingosync room %s", room_id)
+
+            return RandomizerResult(
+                url=room_url,
+                hash_id=room_id,
+                settings={
+                    "game_type": game_type,
+                    "variant_type": variant_type,
+                    "seed": seed,
+                    "lockout_mode": lockout_mode,
+                },
+                randomizer="bingosync",
+                permalink=room_url,
+                metadata={
+                    "room_id": room_id,
+                    "password": passphrase,
+                    "room_name": room_name,
+                },
             )
-
-            # Store cookies for future requests
-            self.cookies.update(response.cookies)
-
-            if response.status_code == 302:
-                room_id = response.headers["Location"].split("/")[-1]
-                room_url = f"{self.BASE_URL}/room/{room_id}"
-
-                logger.info("Created Bingosync room %s", room_id)
-
-                return RandomizerResult(
-                    url=room_url,
-                    hash_id=room_id,
-                    settings={
-                        "game_type": game_type,
-                        "variant_type": variant_type,
-                        "seed": seed,
-                        "lockout_mode": lockout_mode,
-                    },
-                    randomizer="bingosync",
-                    permalink=room_url,
-                    metadata={
-                        "room_id": room_id,
-                        "password": passphrase,
-                        "room_name": room_name,
-                    },
-                )
-            else:
-                raise ValueError("Failed to create Bingosync room")
+        else:
+            raise ValueError("Failed to create Bingosync room")
 
     async def new_card(
         self,
@@ -168,10 +168,12 @@ class BingosyncService:
         if variant_type is not None:
             data["variant_type"] = variant_type
 
-        async with httpx.AsyncClient(cookies=self.cookies) as client:
-            response = await client.put(f"{self.BASE_URL}/api/new-card", json=data)
-            response.raise_for_status()
-            return response.json()
+        client = get_randomizer_client("bingosync")
+        response = await client.put(
+            f"{self.BASE_URL}/api/new-card", json=data, cookies=self.cookies
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def _get_csrf_token(self) -> str:
         """
@@ -183,17 +185,17 @@ class BingosyncService:
         Raises:
             ValueError: If CSRF token cannot be found
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.BASE_URL)
-            response.raise_for_status()
+        client = get_randomizer_client("bingosync")
+        response = await client.get(self.BASE_URL)
+        response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, features="html.parser")
-            csrf_input = soup.find("input", {"name": "csrfmiddlewaretoken"})
+        soup = BeautifulSoup(response.text, features="html.parser")
+        csrf_input = soup.find("input", {"name": "csrfmiddlewaretoken"})
 
-            if not csrf_input:
-                raise ValueError("Could not find CSRF token")
+        if not csrf_input:
+            raise ValueError("Could not find CSRF token")
 
-            # Store cookies for subsequent requests
-            self.cookies.update(response.cookies)
+        # Store cookies for subsequent requests
+        self.cookies.update(response.cookies)
 
-            return csrf_input.get("value")
+        return csrf_input.get("value")
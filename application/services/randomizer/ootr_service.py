@@ -6,7 +6,7 @@ This service handles generation of Ocarina of Time randomizer seeds via API.
 
 import logging
 from typing import Dict, Any, Optional
-import httpx
+from application.utils.http_client import get_randomizer_client
 from config import settings
 from .randomizer_service import RandomizerResult
 
@@ -55,15 +55,15 @@ class OOTRService:
         if api_key:
             params["key"] = api_key
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/api/sglive/seed/create",
-                json=settings_dict,
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            result = response.json()
+        client = get_randomizer_client("ootr")
+        response = await client.post(
+            f"{self.BASE_URL}/api/sglive/seed/create",
+            json=settings_dict,
+            params=params,
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        result = response.json()
 
         logger.info("Generated OOTR seed with version %s", version)
 
@@ -0,0 +1,446 @@
+"""
+Seed pool service.
+
+Pre-generates randomizer seeds so race rooms and commands can hand one out
+instantly instead of waiting 10-60 seconds on an external generator.
+
+Seeds are pooled by (randomizer, settings hash):
+- Upcoming matches get a seed pre-rolled and reserved for them, using the
+  preset chosen by PresetSelectionService.select_presets_for_matches(). A
+  reservation is only handed out for the same settings; one whose preset
+  changed since it was rolled is released and rolled again.
+- Popular public presets keep a small warm buffer of unreserved seeds.
+
+Consumers call get_seed(), which claims a pooled seed atomically (so it is
+never reused) and falls back to live generation when the pool is empty.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from application.repositories.randomizer_preset_repository import (
+    RandomizerPresetRepository,
+)
+from application.repositories.seed_pool_repository import SeedPoolRepository
+from application.services.randomizer.randomizer_service import (
+    RandomizerResult,
+    RandomizerService,
+)
+from models import Permission, PooledSeed, RandomizerPreset, User
+from modules.tournament.models.match_schedule import Match, MatchSeed
+
+logger = logging.getLogger(__name__)
+
+# Async callable (randomizer, settings_dict) -> RandomizerResult
+SeedGenerator = Callable[[str, Dict[str, Any]], Awaitable[RandomizerResult]]
+
+
+async def generate_with_randomizer(
+    randomizer: str, settings_dict: Dict[str, Any]
+) -> RandomizerResult:
+    """
+    Default seed generator: call the randomizer's generate() with settings.
+
+    Args:
+        randomizer: Randomizer type
+        settings_dict: Randomizer settings
+
+    Returns:
+        RandomizerResult: The generated seed
+    """
+    service = RandomizerService().get_randomizer(randomizer)
+    # Some generators mutate the settings they are given
+    return await service.generate(dict(settings_dict))
+
+
+def preset_settings(preset: RandomizerPreset) -> Dict[str, Any]:
+    """
+    Extract generator settings from a preset.
+
+    Args:
+        preset: Randomizer preset
+
+    Returns:
+        Settings dictionary for the generator
+    """
+    return preset.settings.get("settings", preset.settings)
+
+
+class SeedPoolService:
+    """Service for pre-generating and claiming pooled seeds."""
+
+    def __init__(self, generator: Optional[SeedGenerator] = None):
+        """
+        Initialize the seed pool service.
+
+        Args:
+            generator: Seed generator to use (default: the real randomizer
+                services; tests pass a local stub)
+        """
+        self.repository = SeedPoolRepository()
+        self.preset_repository = RandomizerPresetRepository()
+        self.generator = generator or generate_with_randomizer
+
+    @staticmethod
+    def settings_hash(settings_dict: Dict[str, Any]) -> str:
+        """
+        Compute the pool key hash for a settings dictionary.
+
+        Args:
+            settings_dict: Randomizer settings
+
+        Returns:
+            Hex SHA-256 of the canonical JSON form of the settings
+        """
+        canonical = json.dumps(settings_dict, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    async def get_seed(
+        self,
+        randomizer: str,
+        settings_dict: Dict[str, Any],
+        match_id: Optional[int] = None,
+    ) -> RandomizerResult:
+        """
+        Get a seed, preferring the pool over live generation.
+
+        Claims, in order: a seed pre-rolled for the match with these
+        settings, an unreserved seed from the (randomizer, settings) pool, and
+        finally generates one live. Reservations for the match rolled with
+        other settings are released.
+
+        Args:
+            randomizer: Randomizer type
+            settings_dict: Settings the seed must be generated with
+            match_id: Optional match the seed is for
+
+        Returns:
+            RandomizerResult: The claimed or generated seed
+        """
+        randomizer = randomizer.lower()
+        settings_hash = self.settings_hash(settings_dict)
+        seed = None
+        if match_id is not None:
+            seed = await self.repository.claim(
+                randomizer, settings_hash, match_id=match_id
+            )
+            released = await self.repository.delete_reservations(
+                match_id, keep_settings_hash=settings_hash
+            )
+            if released:
+                logger.info(
+                    "Released %d stale seed reservation(s) for match %s",
+                    released,
+                    match_id,
+                )
+        if seed is None:
+            seed = await self.repository.claim(randomizer, settings_hash)
+
+        if seed is not None:
+            logger.info(
+                "Claimed pooled %s seed %s (match=%s)", randomizer, seed.id, match_id
+            )
+            return self._to_result(seed)
+
+        logger.info("Seed pool empty for %s, generating live", randomizer)
+        result, elapsed_ms = await self._generate(randomizer, settings_dict)
+        logger.info("Generated %s seed live in %dms", randomizer, elapsed_ms)
+        return result
+
+    async def fill(
+        self,
+        randomizer: str,
+        settings_dict: Dict[str, Any],
+        count: int,
+        preset_id: Optional[int] = None,
+        match_id: Optional[int] = None,
+    ) -> int:
+        """
+        Generate seeds and add them to the pool.
+
+        Stops at the first generator failure so an unavailable generator is
+        not hammered.
+
+        Args:
+            randomizer: Randomizer type
+            settings_dict: Settings to generate with
+            count: Number of seeds to generate
+            preset_id: Preset the settings came from (if any)
+            match_id: Match to reserve the seeds for (if any)
+
+        Returns:
+            Number of seeds added
+        """
+        randomizer = randomizer.lower()
+        settings_hash = self.settings_hash(settings_dict)
+        added = 0
+
+        for _ in range(count):
+            try:
+                result, elapsed_ms = await self._generate(randomizer, settings_dict)
+            except Exception as e:
+                logger.error(
+                    "Failed to pre-generate %s seed (preset=%s, match=%s): %s",
+                    randomizer,
+                    preset_id,
+                    match_id,
+                    e,
+                )
+                break
+
+            await self.repository.create(
+                randomizer=randomizer,
+                settings_hash=settings_hash,
+                preset_id=preset_id,
+                match_id=match_id,
+                url=result.url,
+                hash_id=str(result.hash_id),
+                permalink=result.permalink,
+                spoiler_url=result.spoiler_url,
+                settings=settings_dict,
+                metadata=result.metadata,
+                generation_ms=elapsed_ms,
+            )
+            added += 1
+
+        return added
+
+    async def prefill_upcoming_matches(
+        self, lookahead_hours: int, concurrency: int = 3
+    ) -> int:
+        """
+        Pre-roll a reserved seed for each match scheduled in the lookahead window.
+
+        Matches that already have a seed or a reservation for their current
+        preset settings, or whose tournament has no randomizer or no preset,
+        are skipped. A reservation rolled with other settings (the preset was
+        edited or another preset is now selected) is released and rolled
+        again.
+
+        Args:
+            lookahead_hours: How far ahead to look for scheduled matches
+            concurrency: Maximum seeds generated in parallel
+
+        Returns:
+            Number of seeds generated
+        """
+        from modules.tournament.services.preset_selection_service import (
+            PresetSelectionService,
+        )
+
+        now = datetime.now(timezone.utc)
+        matches = await Match.filter(
+            scheduled_at__gte=now,
+            scheduled_at__lte=now + timedelta(hours=lookahead_hours),
+            finished_at__isnull=True,
+            tournament__randomizer__isnull=False,
+        ).select_related("tournament")
+
+        match_ids = [m.id for m in matches]
+        seeded = set(
+            await MatchSeed.filter(match_id__in=match_ids).values_list(
+                "match_id", flat=True
+            )
+        )
+        pending = [m for m in matches if m.id not in seeded]
+        if not pending:
+            return 0
+
+        preset_ids = await PresetSelectionService().select_presets_for_matches(pending)
+        selections = [
+            (match, preset_ids[match.id]) for match in pending if preset_ids[match.id]
+        ]
+
+        presets = {
+            p.id: p
+            for p in await self.preset_repository.list_by_ids(
+                list({preset_id for _, preset_id in selections})
+            )
+        }
+
+        reservations = await self.repository.get_reservations(
+            [match.id for match, _ in selections]
+        )
+        stale = []
+        for match, preset_id in selections:
+            reserved_hash = reservations.get(match.id)
+            if reserved_hash is None or preset_id not in presets:
+                continue
+            if reserved_hash == self.settings_hash(preset_settings(presets[preset_id])):
+                continue
+            await self.repository.delete_reservations(match.id)
+            stale.append(match.id)
+        if stale:
+            logger.info(
+                "Released stale seed reservations for %d match(es)", len(stale)
+            )
+        selections = [
+            (match, preset_id)
+            for match, preset_id in selections
+            if match.id not in reservations or match.id in stale
+        ]
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def prefill(match: Match, preset: RandomizerPreset) -> int:
+            async with semaphore:
+                return await self.fill(
+                    match.tournament.randomizer,
+                    preset_settings(preset),
+                    1,
+                    preset_id=preset.id,
+                    match_id=match.id,
+                )
+
+        results = await asyncio.gather(
+            *(
+                prefill(match, presets[preset_id])
+                for match, preset_id in selections
+                if preset_id in presets
+            )
+        )
+        return sum(results)
+
+    async def top_up_popular_presets(
+        self, preset_limit: int, depth: int, concurrency: int = 3
+    ) -> int:
+        """
+        Keep a warm buffer of unreserved seeds for popular public presets.
+
+        Args:
+            preset_limit: Number of popular presets to keep warm
+            depth: Target number of available seeds per preset
+            concurrency: Maximum presets topped up in parallel
+
+        Returns:
+            Number of seeds generated
+        """
+        presets = await self.preset_repository.list_popular_public_presets(preset_limit)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def top_up(preset: RandomizerPreset) -> int:
+            settings_dict = preset_settings(preset)
+            available = await self.repository.count_available(
+                preset.randomizer, self.settings_hash(settings_dict)
+            )
+            if available >= depth:
+                return 0
+            async with semaphore:
+                return await self.fill(
+                    preset.randomizer,
+                    settings_dict,
+                    depth - available,
+                    preset_id=preset.id,
+                )
+
+        results = await asyncio.gather(*(top_up(preset) for preset in presets))
+        return sum(results)
+
+    async def purge(self, retention_days: int) -> int:
+        """
+        Remove old claimed seeds and reservations for finished matches.
+
+        Args:
+            retention_days: Days to keep claimed seeds
+
+        Returns:
+            Number of seeds removed
+        """
+        removed = await self.repository.delete_claimed_before(retention_days)
+        removed += await self.repository.delete_stale_reservations()
+        return removed
+
+    async def get_pool_stats(
+        self, current_user: Optional[User], since_days: int = 7
+    ) -> list[dict]:
+        """
+        Get pool depth and generation latency per pool key.
+
+        Authorization: Only ADMIN and SUPERADMIN can view pool stats.
+
+        Args:
+            current_user: Current user
+            since_days: Window for claimed-seed and latency statistics
+
+        Returns:
+            List of dicts (randomizer, preset_id, preset_name, available,
+            reserved, claimed, avg_generation_ms, max_generation_ms), or an
+            empty list if unauthorized
+        """
+        if not current_user or not current_user.has_permission(Permission.ADMIN):
+            logger.warning(
+                "Unauthorized access attempt to view seed pool stats by user %s",
+                current_user.id if current_user else None,
+            )
+            return []
+
+        entries = await self.repository.list_pool_entries(since_days)
+
+        pools: dict[tuple, dict] = defaultdict(
+            lambda: {"available": 0, "reserved": 0, "claimed": 0, "latencies": []}
+        )
+        for entry in entries:
+            pool = pools[
+                (entry["randomizer"], entry["settings_hash"], entry["preset_id"])
+            ]
+            if entry["claimed_at"] is not None:
+                pool["claimed"] += 1
+            elif entry["match_id"] is not None:
+                pool["reserved"] += 1
+            else:
+                pool["available"] += 1
+            pool["latencies"].append(entry["generation_ms"])
+
+        preset_names = {
+            p.id: p.name
+            for p in await self.preset_repository.list_by_ids(
+                list({key[2] for key in pools if key[2] is not None})
+            )
+        }
+
+        stats = []
+        for (randomizer, settings_hash, preset_id), pool in pools.items():
+            latencies = pool.pop("latencies")
+            stats.append(
+                {
+                    "randomizer": randomizer,
+                    "settings_hash": settings_hash,
+                    "preset_id": preset_id,
+                    "preset_name": preset_names.get(preset_id),
+                    **pool,
+                    "avg_generation_ms": int(sum(latencies) / len(latencies)),
+                    "max_generation_ms": max(latencies),
+                }
+            )
+        stats.sort(key=lambda s: (s["randomizer"], s["preset_name"] or ""))
+        return stats
+
+    async def _generate(
+        self, randomizer: str, settings_dict: Dict[str, Any]
+    ) -> tuple[RandomizerResult, int]:
+        """Run the generator and measure how long it took (in milliseconds)."""
+        started = time.perf_counter()
+        result = await self.generator(randomizer, settings_dict)
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return result, elapsed_ms
+
+    @staticmethod
+    def _to_result(seed: PooledSeed) -> RandomizerResult:
+        """Convert a pooled seed to a RandomizerResult."""
+        return RandomizerResult(
+            url=seed.url,
+            hash_id=seed.hash_id,
+            settings=seed.settings,
+            randomizer=seed.randomizer,
+            permalink=seed.permalink,
+            spoiler_url=seed.spoiler_url,
+            metadata=seed.metadata,
+        )
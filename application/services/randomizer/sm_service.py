@@ -8,7 +8,7 @@ This service handles generation of Super Metroid randomizer seeds via:
 
 import logging
 from typing import Dict, Any, Optional, Literal
-import httpx
+from application.utils.http_client import get_randomizer_client
 from .randomizer_service import RandomizerResult
 
 logger = logging.getLogger(__name__)
@@ -64,12 +64,12 @@ class SMService:
 
         logger.info("Generating VARIA seed with race=%s", tournament)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.varia_baseurl}/api/randomize", json=settings, timeout=60.0
-            )
-            response.raise_for_status()
-            result = response.json()
+        client = get_randomizer_client("sm-varia")
+        response = await client.post(
+            f"{self.varia_baseurl}/api/randomize", json=settings, timeout=60.0
+        )
+        response.raise_for_status()
+        result = response.json()
 
         # Extract data from response
         slug_id = result.get("slug", result.get("id", "unknown"))
@@ -118,12 +118,12 @@ class SMService:
 
         logger.info("Generating DASH seed with race=%s", tournament)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.dash_baseurl}/api/generate", json=payload, timeout=60.0
-            )
-            response.raise_for_status()
-            result = response.json()
+        client = get_randomizer_client("sm-dash")
+        response = await client.post(
+            f"{self.dash_baseurl}/api/generate", json=payload, timeout=60.0
+        )
+        response.raise_for_status()
+        result = response.json()
 
         # Extract data from response
         seed_id = result.get("id", result.get("seed", "unknown"))
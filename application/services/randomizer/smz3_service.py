@@ -6,7 +6,7 @@ This service handles generation of SMZ3 combo randomizer seeds via samus.link AP
 
 import logging
 from typing import Dict, Any, Optional
-import httpx
+from application.utils.http_client import get_randomizer_client
 from .randomizer_service import RandomizerResult
 
 logger = logging.getLogger(__name__)
@@ -76,12 +76,12 @@ class SMZ3Service:
 
         logger.info("Generating SMZ3 seed with race=%s", tournament)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{baseurl}/api/randomize", json=settings, timeout=60.0
-            )
-            response.raise_for_status()
-            result = response.json()
+        client = get_randomizer_client("smz3")
+        response = await client.post(
+            f"{baseurl}/api/randomize", json=settings, timeout=60.0
+        )
+        response.raise_for_status()
+        result = response.json()
 
         # Extract data from response
         slug_id = result.get("slug", result.get("id", "unknown"))
@@ -2,12 +2,13 @@
 SpeedGaming ETL (Extract, Transform, Load) service.
 
 This service handles importing SpeedGaming episodes into the Match table,
-including player and crew member matching/creation.
+including player and crew member matching/creation. Player and crew identity
+resolution is batched per import run via SpeedGamingIdentityResolver.
 """
 
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
 from models import User
 from modules.tournament.models.match_schedule import (
@@ -18,8 +19,6 @@ from modules.tournament.models.match_schedule import (
     CrewRole,
     StreamChannel,
 )
-from models.organizations import OrganizationMember
-from models.audit_log import AuditLog
 from models.racetime_room import RacetimeRoom
 from application.services.speedgaming.speedgaming_service import (
     SpeedGamingService,
@@ -28,8 +27,12 @@ from application.services.speedgaming.speedgaming_service import (
     SpeedGamingCrewMember,
     SpeedGamingChannel,
 )
+from application.services.speedgaming.speedgaming_identity_resolver import (
+    SpeedGamingIdentityResolver,
+)
 from modules.tournament.repositories.tournament_repository import TournamentRepository
 from application.repositories.user_repository import UserRepository
+from application.services.core.audit_service import AuditService
 from modules.tournament.repositories.stream_channel_repository import StreamChannelRepository
 
 logger = logging.getLogger(__name__)
@@ -51,534 +54,7 @@ class SpeedGamingETLService:
         self.tournament_repo = TournamentRepository()
         self.user_repo = UserRepository()
         self.stream_channel_repo = StreamChannelRepository()
-
-    async def _find_or_create_user(
-        self,
-        organization_id: int,
-        sg_player: SpeedGamingPlayer,
-    ) -> User:
-        """
-        Find existing user by Discord ID, username, or SpeedGaming ID, or create user.
-
-        Priority:
-        1. Match by discord_id (if available)
-        2. Match by discord_username (from discord_tag if available)
-        3. Match by speedgaming_id (for existing placeholders)
-        4. Create new user with Discord ID if available, otherwise placeholder
-
-        Args:
-            organization_id: Organization ID to add user to
-            sg_player: SpeedGaming player data
-
-        Returns:
-            User object (existing or newly created)
-        """
-        # Try to find user by Discord ID
-        if sg_player.discord_id_int:
-            user = await User.get_or_none(discord_id=sg_player.discord_id_int)
-            if user:
-                logger.info(
-                    "Matched player '%s' to existing user %s by Discord ID",
-                    sg_player.display_name,
-                    user.id,
-                )
-
-                # Ensure user is a member of the organization
-                member = await OrganizationMember.get_or_none(
-                    organization_id=organization_id, user_id=user.id
-                )
-                if not member:
-                    await OrganizationMember.create(
-                        organization_id=organization_id, user_id=user.id
-                    )
-                    logger.info(
-                        "Added user %s to organization %s", user.id, organization_id
-                    )
-
-                return user
-
-        # Try to find user by Discord username (from discord_tag)
-        if sg_player.discord_tag:
-            # Parse username from discord_tag (format: "username#discriminator")
-            discord_username = (
-                sg_player.discord_tag.split("#")[0]
-                if "#" in sg_player.discord_tag
-                else sg_player.discord_tag
-            )
-
-            if discord_username:
-                user = await User.get_or_none(discord_username=discord_username)
-                if user:
-                    logger.info(
-                        "Matched player '%s' to existing user %s by Discord username '%s'",
-                        sg_player.display_name,
-                        user.id,
-                        discord_username,
-                    )
-
-                    # Ensure user is a member of the organization
-                    member = await OrganizationMember.get_or_none(
-                        organization_id=organization_id, user_id=user.id
-                    )
-                    if not member:
-                        await OrganizationMember.create(
-                            organization_id=organization_id, user_id=user.id
-                        )
-                        logger.info(
-                            "Added user %s to organization %s", user.id, organization_id
-                        )
-
-                    return user
-
-        # Try to find placeholder user by SpeedGaming ID (might need to upgrade to full user)
-        user = await User.get_or_none(is_placeholder=True, speedgaming_id=sg_player.id)
-
-        if user:
-            # If we now have a Discord ID, check if a real user with that ID already exists
-            if sg_player.discord_id_int:
-                # Check if there's already a real user with this Discord ID
-                existing_real_user = await User.get_or_none(
-                    discord_id=sg_player.discord_id_int, is_placeholder=False
-                )
-
-                if existing_real_user:
-                    # A real user with this Discord ID exists - use that instead
-                    logger.info(
-                        "Found existing real user %s with Discord ID %s for placeholder %s (SG player %s)",
-                        existing_real_user.id,
-                        sg_player.discord_id_int,
-                        user.id,
-                        sg_player.id,
-                    )
-
-                    # TODO: In the future, we could merge the placeholder into the real user
-                    # For now, we'll use the real user and leave the placeholder
-
-                    # Ensure real user is a member of the organization
-                    member = await OrganizationMember.get_or_none(
-                        organization_id=organization_id, user_id=existing_real_user.id
-                    )
-                    if not member:
-                        await OrganizationMember.create(
-                            organization_id=organization_id,
-                            user_id=existing_real_user.id,
-                        )
-                        logger.info(
-                            "Added existing real user %s to organization %s",
-                            existing_real_user.id,
-                            organization_id,
-                        )
-
-                    return existing_real_user
-
-                # No existing real user - upgrade the placeholder
-                if not user.discord_id:
-                    logger.info(
-                        "Upgrading placeholder user %s to full user with Discord ID %s",
-                        user.id,
-                        sg_player.discord_id_int,
-                    )
-
-                    # Best-effort username from discord_tag
-                    discord_username = None
-                    if sg_player.discord_tag:
-                        discord_username = (
-                            sg_player.discord_tag.split("#")[0]
-                            if "#" in sg_player.discord_tag
-                            else sg_player.discord_tag
-                        )
-
-                    if not discord_username:
-                        # Fallback: use display name or streaming username
-                        discord_username = (
-                            sg_player.streaming_from
-                            or sg_player.display_name
-                            or f"user_{sg_player.discord_id_int}"
-                        )
-
-                    user.discord_id = sg_player.discord_id_int
-                    user.discord_username = discord_username
-                    user.is_placeholder = False  # No longer a placeholder
-                    await user.save()
-
-                    logger.info(
-                        "Upgraded user %s: discord_id=%s, username=%s",
-                        user.id,
-                        user.discord_id,
-                        user.discord_username,
-                    )
-                    return user
-
-            # Still a placeholder (no Discord ID provided), just update display name if needed
-            logger.info(
-                "Found existing placeholder user for SG player %s", sg_player.id
-            )
-
-            # Update display name if it has changed
-            new_display_name = (
-                sg_player.streaming_from
-                or sg_player.public_stream
-                or sg_player.display_name
-                or f"sg_{sg_player.id}"
-            )
-
-            if user.display_name != new_display_name:
-                logger.info(
-                    "Updating placeholder user %s display name: %s -> %s",
-                    user.id,
-                    user.display_name,
-                    new_display_name,
-                )
-                user.display_name = new_display_name
-                await user.save()
-
-            return user
-
-        # Create new user
-        # If we have a Discord ID, create full user; otherwise create placeholder
-
-        # Determine username
-        if sg_player.discord_id_int:
-            # We have Discord ID - create full user with best-effort username
-            discord_id = sg_player.discord_id_int
-
-            # Try to extract username from discord_tag
-            if sg_player.discord_tag:
-                discord_username = (
-                    sg_player.discord_tag.split("#")[0]
-                    if "#" in sg_player.discord_tag
-                    else sg_player.discord_tag
-                )
-            else:
-                # Best effort: use streaming name, display name, or generic fallback
-                discord_username = (
-                    sg_player.streaming_from
-                    or sg_player.display_name
-                    or f"user_{discord_id}"
-                )
-
-            is_placeholder = False
-            logger.info(
-                "Creating full user with Discord ID %s (username: %s) for SpeedGaming player '%s'",
-                discord_id,
-                discord_username,
-                sg_player.display_name,
-            )
-        else:
-            # No Discord ID - create placeholder
-            discord_id = None
-            discord_username = f"sg_{sg_player.id}"
-            is_placeholder = True
-            logger.info(
-                "Creating placeholder user for SpeedGaming player '%s' (no Discord ID available)",
-                sg_player.display_name,
-            )
-
-        # Determine best display name
-        # Priority: streaming_from (Twitch), public_stream, display_name
-        display_name = (
-            sg_player.streaming_from
-            or sg_player.public_stream
-            or sg_player.display_name
-            or discord_username
-        )
-
-        # Create user
-        user = await User.create(
-            discord_id=discord_id,
-            discord_username=discord_username,
-            discord_discriminator=(
-                "0000"
-                if sg_player.discord_tag and "#" in sg_player.discord_tag
-                else None
-            ),
-            discord_avatar=None,
-            discord_email=None,
-            display_name=display_name,
-            is_placeholder=is_placeholder,
-            speedgaming_id=sg_player.id,  # Store SpeedGaming ID for tracking
-        )
-
-        user_type = "placeholder" if is_placeholder else "full"
-        logger.info(
-            "Created %s user %s for SpeedGaming player '%s' "
-            "(SG ID: %s, discord_id: %s, display_name: %s)",
-            user_type,
-            user.id,
-            sg_player.display_name,
-            sg_player.id,
-            discord_id,
-            display_name,
-        )
-
-        # Add to organization
-        await OrganizationMember.create(
-            organization_id=organization_id, user_id=user.id
-        )
-        logger.info("Added user %s to organization %s", user.id, organization_id)
-
-        return user
-
-    async def _find_or_create_crew_user(
-        self,
-        organization_id: int,
-        sg_crew: SpeedGamingCrewMember,
-    ) -> User:
-        """
-        Find existing user by Discord ID, username, or SpeedGaming ID, or create user for crew.
-
-        Priority:
-        1. Match by discord_id (if available)
-        2. Match by discord_username (from discord_tag if available)
-        3. Match by speedgaming_id (for existing placeholders)
-        4. Create new user with Discord ID if available, otherwise placeholder
-
-        Args:
-            organization_id: Organization ID to add user to
-            sg_crew: SpeedGaming crew member data
-
-        Returns:
-            User object (existing or newly created)
-        """
-        # Try to find user by Discord ID
-        if sg_crew.discord_id_int:
-            user = await User.get_or_none(discord_id=sg_crew.discord_id_int)
-            if user:
-                logger.info(
-                    "Matched crew '%s' to existing user %s by Discord ID",
-                    sg_crew.display_name,
-                    user.id,
-                )
-
-                # Ensure user is a member of the organization
-                member = await OrganizationMember.get_or_none(
-                    organization_id=organization_id, user_id=user.id
-                )
-                if not member:
-                    await OrganizationMember.create(
-                        organization_id=organization_id, user_id=user.id
-                    )
-                    logger.info(
-                        "Added crew user %s to organization %s",
-                        user.id,
-                        organization_id,
-                    )
-
-                return user
-
-        # Try to find user by Discord username (from discord_tag)
-        if sg_crew.discord_tag:
-            # Parse username from discord_tag (format: "username#discriminator")
-            discord_username = (
-                sg_crew.discord_tag.split("#")[0]
-                if "#" in sg_crew.discord_tag
-                else sg_crew.discord_tag
-            )
-
-            if discord_username:
-                user = await User.get_or_none(discord_username=discord_username)
-                if user:
-                    logger.info(
-                        "Matched crew '%s' to existing user %s by Discord username '%s'",
-                        sg_crew.display_name,
-                        user.id,
-                        discord_username,
-                    )
-
-                    # Ensure user is a member of the organization
-                    member = await OrganizationMember.get_or_none(
-                        organization_id=organization_id, user_id=user.id
-                    )
-                    if not member:
-                        await OrganizationMember.create(
-                            organization_id=organization_id, user_id=user.id
-                        )
-                        logger.info(
-                            "Added crew user %s to organization %s",
-                            user.id,
-                            organization_id,
-                        )
-
-                    return user
-
-        # Try to find placeholder user by SpeedGaming ID (might need to upgrade to full user)
-        user = await User.get_or_none(is_placeholder=True, speedgaming_id=sg_crew.id)
-
-        if user:
-            # If we now have a Discord ID, check if a real user with that ID already exists
-            if sg_crew.discord_id_int:
-                # Check if there's already a real user with this Discord ID
-                existing_real_user = await User.get_or_none(
-                    discord_id=sg_crew.discord_id_int, is_placeholder=False
-                )
-
-                if existing_real_user:
-                    # A real user with this Discord ID exists - use that instead
-                    logger.info(
-                        "Found existing real user %s with Discord ID %s for placeholder %s (SG crew %s)",
-                        existing_real_user.id,
-                        sg_crew.discord_id_int,
-                        user.id,
-                        sg_crew.id,
-                    )
-
-                    # TODO: In the future, we could merge the placeholder into the real user
-                    # For now, we'll use the real user and leave the placeholder
-
-                    # Ensure real user is a member of the organization
-                    member = await OrganizationMember.get_or_none(
-                        organization_id=organization_id, user_id=existing_real_user.id
-                    )
-                    if not member:
-                        await OrganizationMember.create(
-                            organization_id=organization_id,
-                            user_id=existing_real_user.id,
-                        )
-                        logger.info(
-                            "Added existing real user %s to organization %s",
-                            existing_real_user.id,
-                            organization_id,
-                        )
-
-                    return existing_real_user
-
-                # No existing real user - upgrade the placeholder
-                if not user.discord_id:
-                    logger.info(
-                        "Upgrading placeholder crew user %s to full user with Discord ID %s",
-                        user.id,
-                        sg_crew.discord_id_int,
-                    )
-
-                    # Best-effort username from discord_tag
-                    discord_username = None
-                    if sg_crew.discord_tag:
-                        discord_username = (
-                            sg_crew.discord_tag.split("#")[0]
-                            if "#" in sg_crew.discord_tag
-                            else sg_crew.discord_tag
-                        )
-
-                    if not discord_username:
-                        # Fallback: use display name or streaming username
-                        discord_username = (
-                            sg_crew.public_stream
-                            or sg_crew.display_name
-                            or f"user_{sg_crew.discord_id_int}"
-                        )
-
-                    user.discord_id = sg_crew.discord_id_int
-                    user.discord_username = discord_username
-                    user.is_placeholder = False  # No longer a placeholder
-                    await user.save()
-
-                    logger.info(
-                        "Upgraded crew user %s: discord_id=%s, username=%s",
-                        user.id,
-                        user.discord_id,
-                        user.discord_username,
-                    )
-                    return user
-
-            # Still a placeholder (no Discord ID provided), just update display name if needed
-            logger.info(
-                "Found existing placeholder crew user for SG crew %s", sg_crew.id
-            )
-
-            # Update display name if it has changed
-            new_display_name = (
-                sg_crew.public_stream or sg_crew.display_name or f"sg_crew_{sg_crew.id}"
-            )
-
-            if user.display_name != new_display_name:
-                logger.info(
-                    "Updating placeholder crew user %s display name: %s -> %s",
-                    user.id,
-                    user.display_name,
-                    new_display_name,
-                )
-                user.display_name = new_display_name
-                await user.save()
-
-            return user
-
-        # Create new user
-        # If we have a Discord ID, create full user; otherwise create placeholder
-
-        # Determine username
-        if sg_crew.discord_id_int:
-            # We have Discord ID - create full user with best-effort username
-            discord_id = sg_crew.discord_id_int
-
-            # Try to extract username from discord_tag
-            if sg_crew.discord_tag:
-                discord_username = (
-                    sg_crew.discord_tag.split("#")[0]
-                    if "#" in sg_crew.discord_tag
-                    else sg_crew.discord_tag
-                )
-            else:
-                # Best effort: use streaming name, display name, or generic fallback
-                discord_username = (
-                    sg_crew.public_stream
-                    or sg_crew.display_name
-                    or f"user_{discord_id}"
-                )
-
-            is_placeholder = False
-            logger.info(
-                "Creating full crew user with Discord ID %s (username: %s) for SpeedGaming crew '%s'",
-                discord_id,
-                discord_username,
-                sg_crew.display_name,
-            )
-        else:
-            # No Discord ID - create placeholder
-            discord_id = None
-            discord_username = f"sg_crew_{sg_crew.id}"
-            is_placeholder = True
-            logger.info(
-                "Creating placeholder crew user for SpeedGaming crew '%s' (no Discord ID available)",
-                sg_crew.display_name,
-            )
-
-        # Determine best display name
-        # Priority: public_stream (Twitch), display_name
-        display_name = sg_crew.public_stream or sg_crew.display_name or discord_username
-
-        # Create user
-        user = await User.create(
-            discord_id=discord_id,
-            discord_username=discord_username,
-            discord_discriminator=(
-                "0000" if sg_crew.discord_tag and "#" in sg_crew.discord_tag else None
-            ),
-            discord_avatar=None,
-            discord_email=None,
-            display_name=display_name,
-            is_placeholder=is_placeholder,
-            speedgaming_id=sg_crew.id,  # Store SpeedGaming ID for tracking
-        )
-
-        user_type = "placeholder" if is_placeholder else "full"
-        logger.info(
-            "Created %s crew user %s for SpeedGaming crew '%s' "
-            "(SG ID: %s, discord_id: %s, display_name: %s)",
-            user_type,
-            user.id,
-            sg_crew.display_name,
-            sg_crew.id,
-            discord_id,
-            display_name,
-        )
-
-        # Add to organization
-        await OrganizationMember.create(
-            organization_id=organization_id, user_id=user.id
-        )
-        logger.info("Added crew user %s to organization %s", user.id, organization_id)
-
-        return user
+        self.audit_service = AuditService()
 
     async def _find_or_create_stream_channel(
         self,
@@ -630,7 +106,11 @@ class SpeedGamingETLService:
         return channel
 
     async def _sync_match_players(
-        self, match: Match, sg_players: List[SpeedGamingPlayer], organization_id: int
+        self,
+        match: Match,
+        sg_players: List[SpeedGamingPlayer],
+        organization_id: int,
+        resolver: SpeedGamingIdentityResolver,
     ) -> None:
         """
         Sync match players with SpeedGaming data.
@@ -641,72 +121,51 @@ class SpeedGamingETLService:
             match: Match to sync
             sg_players: Current players from SpeedGaming
             organization_id: Organization ID
+            resolver: Identity resolver for the current import run
         """
         # Get current players
         current_players = (
             await MatchPlayers.filter(match=match).prefetch_related("user").all()
         )
 
-        # Build set of current user IDs (both real and placeholder via SG ID)
-        current_user_ids = set()
+        # Build set of placeholder SpeedGaming IDs and real-user Discord IDs
         current_sg_ids = set()
+        current_discord_ids = set()
 
         for mp in current_players:
-            current_user_ids.add(mp.user_id)
             if mp.user.is_placeholder and mp.user.speedgaming_id:
                 current_sg_ids.add(mp.user.speedgaming_id)
             elif not mp.user.is_placeholder and mp.user.discord_id:
-                # Track by discord_id for real users
-                pass
+                current_discord_ids.add(mp.user.discord_id)
 
         # Build set of new player SpeedGaming IDs and Discord IDs
         new_sg_ids = {p.id for p in sg_players}
         new_discord_ids = {p.discord_id_int for p in sg_players if p.discord_id_int}
 
         # Find players to add (in SG but not in current)
-        for sg_player in sg_players:
-            # Check if this player is already in the match
-            already_exists = False
-
-            # Check by Discord ID first
-            if sg_player.discord_id_int:
-                for mp in current_players:
-                    if (
-                        not mp.user.is_placeholder
-                        and mp.user.discord_id == sg_player.discord_id_int
-                    ):
-                        already_exists = True
-                        break
-
-            # Check by SpeedGaming ID for placeholders
-            if not already_exists and sg_player.id in current_sg_ids:
-                already_exists = True
-
-            if not already_exists:
-                # Add new player
-                user = await self._find_or_create_user(organization_id, sg_player)
-
-                # Register player with tournament (if not already registered)
-                # Skip RaceTime account requirement - register all players
-                await match.fetch_related("tournament")
-                await self.tournament_repo.register_user_for_tournament(
-                    organization_id=organization_id,
-                    tournament_id=match.tournament_id,
-                    user_id=user.id,
-                )
-                logger.info(
-                    "Registered player %s with tournament %s",
-                    user.id,
-                    match.tournament_id,
-                )
-
-                await MatchPlayers.create(match=match, user=user)
-                logger.info(
-                    "Added new player %s to match %s (SG player %s)",
-                    user.id,
-                    match.id,
-                    sg_player.id,
-                )
+        players_to_add = [
+            sg_player
+            for sg_player in sg_players
+            if not (
+                (
+                    sg_player.discord_id_int
+                    and sg_player.discord_id_int in current_discord_ids
+                )
+                or sg_player.id in current_sg_ids
+            )
+        ]
+
+        if players_to_add:
+            await resolver.resolve(players=players_to_add)
+            await self._add_match_players(
+                match,
+                match.tournament_id,
+                organization_id,
+                [
+                    (sg_player, resolver.get_user(resolver.PLAYER, sg_player))
+                    for sg_player in players_to_add
+                ],
+            )
 
         # Find players to remove (in current but not in SG)
         for mp in current_players:
@@ -734,7 +193,7 @@ class SpeedGamingETLService:
         match: Match,
         sg_commentators: List[SpeedGamingCrewMember],
         sg_trackers: List[SpeedGamingCrewMember],
-        organization_id: int,
+        resolver: SpeedGamingIdentityResolver,
     ) -> None:
         """
         Sync match crew with SpeedGaming data.
@@ -746,7 +205,7 @@ class SpeedGamingETLService:
             match: Match to sync
             sg_commentators: Current commentators from SpeedGaming
             sg_trackers: Current trackers from SpeedGaming
-            organization_id: Organization ID
+            resolver: Identity resolver for the current import run
         """
         # Get current crew
         current_crew = await Crew.filter(match=match).prefetch_related("user").all()
@@ -754,77 +213,45 @@ class SpeedGamingETLService:
         # Build current crew sets by role and SG ID
         current_commentator_sg_ids = set()
         current_tracker_sg_ids = set()
-        current_crew_by_user = {}
 
         for crew in current_crew:
-            current_crew_by_user[crew.user_id] = crew
             if crew.user.is_placeholder and crew.user.speedgaming_id:
                 if crew.role == CrewRole.COMMENTATOR:
                     current_commentator_sg_ids.add(crew.user.speedgaming_id)
                 elif crew.role == CrewRole.TRACKER:
                     current_tracker_sg_ids.add(crew.user.speedgaming_id)
 
-        # Sync commentators (approved only)
+        # Sync commentators and trackers (approved only)
         approved_commentators = [c for c in sg_commentators if c.approved]
-        for sg_comm in approved_commentators:
-            # Check if already exists
-            already_exists = False
-
-            if sg_comm.discord_id_int:
-                for crew in current_crew:
-                    if (
-                        crew.role == CrewRole.COMMENTATOR
-                        and not crew.user.is_placeholder
-                        and crew.user.discord_id == sg_comm.discord_id_int
-                    ):
-                        already_exists = True
-                        break
-
-            if not already_exists and sg_comm.id in current_commentator_sg_ids:
-                already_exists = True
-
-            if not already_exists:
-                user = await self._find_or_create_crew_user(organization_id, sg_comm)
-                await Crew.create(
-                    match=match, user=user, role=CrewRole.COMMENTATOR, approved=True
-                )
-                logger.info(
-                    "Added new commentator %s to match %s (SG crew %s)",
-                    user.id,
-                    match.id,
-                    sg_comm.id,
-                )
-
-        # Sync trackers (approved only)
         approved_trackers = [t for t in sg_trackers if t.approved]
-        for sg_tracker in approved_trackers:
-            # Check if already exists
-            already_exists = False
-
-            if sg_tracker.discord_id_int:
-                for crew in current_crew:
-                    if (
-                        crew.role == CrewRole.TRACKER
-                        and not crew.user.is_placeholder
-                        and crew.user.discord_id == sg_tracker.discord_id_int
-                    ):
-                        already_exists = True
-                        break
-
-            if not already_exists and sg_tracker.id in current_tracker_sg_ids:
-                already_exists = True
-
-            if not already_exists:
-                user = await self._find_or_create_crew_user(organization_id, sg_tracker)
-                await Crew.create(
-                    match=match, user=user, role=CrewRole.TRACKER, approved=True
-                )
-                logger.info(
-                    "Added new tracker %s to match %s (SG crew %s)",
-                    user.id,
-                    match.id,
-                    sg_tracker.id,
-                )
+
+        crew_to_add: List[Tuple[SpeedGamingCrewMember, CrewRole]] = []
+        for role, approved_crew, current_role_sg_ids in (
+            (CrewRole.COMMENTATOR, approved_commentators, current_commentator_sg_ids),
+            (CrewRole.TRACKER, approved_trackers, current_tracker_sg_ids),
+        ):
+            current_role_discord_ids = {
+                crew.user.discord_id
+                for crew in current_crew
+                if crew.role == role and not crew.user.is_placeholder
+            }
+            for sg_crew in approved_crew:
+                already_exists = (
+                    sg_crew.discord_id_int
+                    and sg_crew.discord_id_int in current_role_discord_ids
+                ) or sg_crew.id in current_role_sg_ids
+                if not already_exists:
+                    crew_to_add.append((sg_crew, role))
+
+        if crew_to_add:
+            await resolver.resolve(crew=[sg_crew for sg_crew, _ in crew_to_add])
+            await self._add_match_crew(
+                match,
+                [
+                    (sg_crew, role, resolver.get_user(resolver.CREW, sg_crew))
+                    for sg_crew, role in crew_to_add
+                ],
+            )
 
         # Remove crew no longer in SpeedGaming
         approved_comm_sg_ids = {c.id for c in approved_commentators}
@@ -864,10 +291,81 @@ class SpeedGamingETLService:
                 )
                 await crew.delete()
 
+    async def _add_match_players(
+        self,
+        match: Match,
+        tournament_id: int,
+        organization_id: int,
+        players: List[Tuple[SpeedGamingPlayer, User]],
+    ) -> None:
+        """
+        Register resolved players with the tournament and add them to a match.
+
+        Args:
+            match: Match to add players to
+            tournament_id: Tournament ID the players are registered with
+            organization_id: Organization ID
+            players: (SpeedGaming player, resolved user) pairs
+        """
+        unique_players: Dict[int, SpeedGamingPlayer] = {}
+        for sg_player, user in players:
+            unique_players.setdefault(user.id, sg_player)
+
+        # Register players with tournament (if not already registered)
+        # Skip RaceTime account requirement - register all players
+        await self.tournament_repo.register_users_for_tournament(
+            organization_id=organization_id,
+            tournament_id=tournament_id,
+            user_ids=list(unique_players),
+        )
+
+        await MatchPlayers.bulk_create(
+            [MatchPlayers(match=match, user_id=user_id) for user_id in unique_players]
+        )
+        for user_id, sg_player in unique_players.items():
+            logger.info(
+                "Added player %s to match %s (SG player %s)",
+                user_id,
+                match.id,
+                sg_player.id,
+            )
+
+    async def _add_match_crew(
+        self,
+        match: Match,
+        crew: List[Tuple[SpeedGamingCrewMember, CrewRole, User]],
+    ) -> None:
+        """
+        Add resolved, approved crew members to a match.
+
+        Args:
+            match: Match to add crew to
+            crew: (SpeedGaming crew member, role, resolved user) triples
+        """
+        unique_crew: Dict[Tuple[int, CrewRole], SpeedGamingCrewMember] = {}
+        for sg_crew, role, user in crew:
+            unique_crew.setdefault((user.id, role), sg_crew)
+
+        await Crew.bulk_create(
+            [
+                Crew(match=match, user_id=user_id, role=role, approved=True)
+                for user_id, role in unique_crew
+            ]
+        )
+        for (user_id, role), sg_crew in unique_crew.items():
+            logger.info(
+                "Added %s %s to match %s (SG crew %s)",
+                role.value,
+                user_id,
+                match.id,
+                sg_crew.id,
+            )
+
     async def import_episode(
         self,
         tournament: Tournament,
         episode: SpeedGamingEpisode,
+        resolver: Optional[SpeedGamingIdentityResolver] = None,
     ) -> Optional[Match]:
         """
         Import or update a SpeedGaming episode as a Match record.
@@ -880,6 +378,8 @@ class SpeedGamingETLService:
         Args:
             tournament: Tournament to import into
             episode: SpeedGaming episode data
+            resolver: Identity resolver shared across the import run
+                (a new one is created if not provided)
 
         Returns:
             Match object if successful, None if episode should be skipped
@@ -897,8 +397,9 @@ class SpeedGamingETLService:
             return existing_match
 
         # Get organization ID from tournament
-        await tournament.fetch_related("organization")
         organization_id = tournament.organization_id
+        if resolver is None:
+            resolver = SpeedGamingIdentityResolver(organization_id)
 
         # Check if match should be auto-finished (more than 4 hours in the past)
         # Only auto-finish if no manual status has been set
@@ -1005,11 +506,13 @@ class SpeedGamingETLService:
                 )
 
             # Check for player changes
-            await self._sync_match_players(existing_match, all_players, organization_id)
+            await self._sync_match_players(
+                existing_match, all_players, organization_id, resolver
+            )
 
             # Check for crew changes
             await self._sync_match_crew(
-                existing_match, episode.commentators, episode.trackers, organization_id
+                existing_match, episode.commentators, episode.trackers, resolver
             )
 
             return existing_match
@@ -1026,70 +529,47 @@ class SpeedGamingETLService:
         )
         logger.info("Created match %s for episode %s", match.id, episode.id)
 
-        # Add players
-        for sg_player in all_players:
-            user = await self._find_or_create_user(organization_id, sg_player)
-
-            # Register player with tournament (if not already registered)
-            # Skip RaceTime account requirement - register all players
-            await self.tournament_repo.register_user_for_tournament(
-                organization_id=organization_id,
-                tournament_id=tournament.id,
-                user_id=user.id,
-            )
-            logger.info(
-                "Registered player %s with tournament %s", user.id, tournament.id
-            )
-
-            await MatchPlayers.create(
-                match=match,
-                user=user,
-            )
-            logger.info("Added player %s to match %s", user.id, match.id)
-
-        # Add commentators (only if approved)
-        approved_commentators = 0
-        for sg_commentator in episode.commentators:
-            if not sg_commentator.approved:
-                logger.info(
-                    "Skipping unapproved commentator '%s' for match %s",
-                    sg_commentator.display_name,
-                    match.id,
-                )
-                continue
-
-            user = await self._find_or_create_crew_user(organization_id, sg_commentator)
-
-            await Crew.create(
-                match=match,
-                user=user,
-                role=CrewRole.COMMENTATOR,
-                approved=True,
-            )
-            approved_commentators += 1
-            logger.info("Added commentator %s to match %s", user.id, match.id)
-
-        # Add trackers (only if approved)
-        approved_trackers = 0
-        for sg_tracker in episode.trackers:
-            if not sg_tracker.approved:
+        # Resolve all players and approved crew in one batch
+        for sg_crew in episode.commentators + episode.trackers:
+            if not sg_crew.approved:
                 logger.info(
-                    "Skipping unapproved tracker '%s' for match %s",
-                    sg_tracker.display_name,
+                    "Skipping unapproved crew member '%s' for match %s",
+                    sg_crew.display_name,
                     match.id,
                 )
-                continue
+        approved_commentators = [c for c in episode.commentators if c.approved]
+        approved_trackers = [t for t in episode.trackers if t.approved]
+        await resolver.resolve(
+            players=all_players, crew=approved_commentators + approved_trackers
+        )
 
-            user = await self._find_or_create_crew_user(organization_id, sg_tracker)
+        # Add players
+        await self._add_match_players(
+            match,
+            tournament.id,
+            organization_id,
+            [
+                (sg_player, resolver.get_user(resolver.PLAYER, sg_player))
+                for sg_player in all_players
+            ],
+        )
 
-            await Crew.create(
-                match=match,
-                user=user,
-                role=CrewRole.TRACKER,
-                approved=True,
-            )
-            approved_trackers += 1
-            logger.info("Added tracker %s to match %s", user.id, match.id)
+        # Add commentators and trackers (only if approved)
+        await self._add_match_crew(
+            match,
+            [
+                (
+                    sg_crew,
+                    CrewRole.COMMENTATOR,
+                    resolver.get_user(resolver.CREW, sg_crew),
+                )
+                for sg_crew in approved_commentators
+            ]
+            + [
+                (sg_crew, CrewRole.TRACKER, resolver.get_user(resolver.CREW, sg_crew))
+                for sg_crew in approved_trackers
+            ],
+        )
 
         logger.info(
             "Successfully imported episode %s as match %s with %s players, "
@@ -1097,8 +577,8 @@ class SpeedGamingETLService:
             episode.id,
             match.id,
             len(all_players),
-            approved_commentators,
-            approved_trackers,
+            len(approved_commentators),
+            len(approved_trackers),
             f", stream channel: {stream_channel.name}" if stream_channel else "",
         )
 
@@ -1171,6 +651,41 @@ class SpeedGamingETLService:
         # Track episode IDs from SpeedGaming
         sg_episode_ids = {episode.id for episode in episodes}
 
+        # Resolve every player and approved crew member in the fetched batch
+        # up front; the resolver's identity map is reused by every episode
+        resolver = SpeedGamingIdentityResolver(tournament.organization_id)
+        try:
+            await resolver.resolve(
+                players=[
+                    player
+                    for episode in episodes
+                    for sg_match in (episode.match1, episode.match2)
+                    if sg_match
+                    for player in sg_match.players
+                ],
+                crew=[
+                    crew
+                    for episode in episodes
+                    for crew in episode.commentators + episode.trackers
+                    if crew.approved
+                ],
+            )
+        except Exception as e:
+            # Fall back to per-episode resolution so one bad record does not
+            # block the whole import
+            logger.error(
+                "Failed to batch resolve SpeedGaming identities for tournament %s: %s",
+                tournament_id,
+                e,
+            )
+
+        # Existing episode IDs, used to distinguish imports from updates
+        existing_episode_ids = set(
+            await Match.filter(
+                speedgaming_episode_id__in=list(sg_episode_ids)
+            ).values_list("speedgaming_episode_id", flat=True)
+        )
+
         # Import/update episodes
         imported_count = 0
         updated_count = 0
@@ -1178,13 +693,10 @@ class SpeedGamingETLService:
 
         for episode in episodes:
             try:
-                # Check if episode already exists
-                existing = await Match.get_or_none(speedgaming_episode_id=episode.id)
-
-                match = await self.import_episode(tournament, episode)
+                match = await self.import_episode(tournament, episode, resolver)
 
                 if match:
-                    if existing:
+                    if episode.id in existing_episode_ids:
                         updated_count += 1
                     else:
                         imported_count += 1
@@ -1248,7 +760,7 @@ class SpeedGamingETLService:
         if start_time:
             duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
-        await AuditLog.create(
+        await self.audit_service.record(
             user_id=None,  # System action, no actual user
             organization_id=organization_id,
             action="speedgaming_sync",
@@ -1288,7 +800,7 @@ class SpeedGamingETLService:
         if start_time:
             duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
-        await AuditLog.create(
+        await self.audit_service.record(
             user_id=None,  # System action, no actual user
             organization_id=None,  # System-wide, not specific to an organization
             action="speedgaming_sync_all",
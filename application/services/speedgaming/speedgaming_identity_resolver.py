@@ -0,0 +1,425 @@
+"""
+SpeedGaming identity resolver.
+
+Resolves SpeedGaming players and crew members to local User records in
+batches. Instead of running a cascade of single-row lookups per person, the
+resolver collects every person in a fetched batch and resolves them with three
+``__in`` queries (Discord ID, Discord username, placeholder SpeedGaming ID).
+Missing placeholder/full users and organization memberships are created with
+``bulk_create``.
+
+A resolver instance is meant to live for a single import run and keeps an
+identity map, so a person appearing in several episodes is only resolved once.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from tortoise.expressions import Q
+
+from models import User
+from models.organizations import OrganizationMember
+from application.services.speedgaming.speedgaming_service import (
+    SpeedGamingPlayer,
+    SpeedGamingCrewMember,
+)
+
+logger = logging.getLogger(__name__)
+
+SpeedGamingPerson = Union[SpeedGamingPlayer, SpeedGamingCrewMember]
+
+# Identity map key: (kind, SpeedGaming ID)
+IdentityKey = Tuple[str, int]
+
+
+def parse_discord_username(discord_tag: Optional[str]) -> Optional[str]:
+    """
+    Extract the Discord username from a SpeedGaming discord tag.
+
+    Args:
+        discord_tag: Tag in "username#discriminator" or "username" format
+
+    Returns:
+        Username portion of the tag, or None if not available
+    """
+    if not discord_tag:
+        return None
+    username = discord_tag.split("#")[0] if "#" in discord_tag else discord_tag
+    return username or None
+
+
+class SpeedGamingIdentityResolver:
+    """
+    Batched resolver mapping SpeedGaming people to User records.
+
+    Resolution priority per person (same as the original per-person lookup):
+    1. Match by discord_id (if available)
+    2. Match by discord_username (from discord_tag if available)
+    3. Match by speedgaming_id (existing placeholders, upgraded when a
+       Discord ID becomes available)
+    4. Create new user with Discord ID if available, otherwise placeholder
+
+    Every resolved user is guaranteed to be a member of the organization.
+    """
+
+    PLAYER = "player"
+    CREW = "crew"
+
+    def __init__(self, organization_id: int):
+        """
+        Initialize the resolver for a single import run.
+
+        Args:
+            organization_id: Organization that resolved users are added to
+        """
+        self.organization_id = organization_id
+        self._identity_map: Dict[IdentityKey, User] = {}
+        self._member_user_ids: Set[int] = set()
+
+    def get_user(self, kind: str, person: SpeedGamingPerson) -> Optional[User]:
+        """
+        Get an already resolved user from the identity map.
+
+        Args:
+            kind: PLAYER or CREW
+            person: SpeedGaming player or crew member
+
+        Returns:
+            Resolved User, or None if the person has not been resolved yet
+        """
+        return self._identity_map.get((kind, person.id))
+
+    async def get_or_resolve(self, kind: str, person: SpeedGamingPerson) -> User:
+        """
+        Get a user from the identity map, resolving the person if needed.
+
+        Args:
+            kind: PLAYER or CREW
+            person: SpeedGaming player or crew member
+
+        Returns:
+            Resolved User
+        """
+        user = self.get_user(kind, person)
+        if user is None:
+            if kind == self.PLAYER:
+                await self.resolve(players=[person])
+            else:
+                await self.resolve(crew=[person])
+            user = self._identity_map[(kind, person.id)]
+        return user
+
+    async def resolve(
+        self,
+        players: Iterable[SpeedGamingPlayer] = (),
+        crew: Iterable[SpeedGamingCrewMember] = (),
+    ) -> None:
+        """
+        Resolve a batch of SpeedGaming players and crew members to users.
+
+        People already present in the identity map are skipped.
+
+        Args:
+            players: SpeedGaming players to resolve
+            crew: SpeedGaming crew members to resolve
+        """
+        pending: List[Tuple[str, SpeedGamingPerson]] = []
+        seen: Set[IdentityKey] = set()
+        for kind, people in ((self.PLAYER, players), (self.CREW, crew)):
+            for person in people:
+                key = (kind, person.id)
+                if key in self._identity_map or key in seen:
+                    continue
+                seen.add(key)
+                pending.append((kind, person))
+
+        if not pending:
+            return
+
+        by_discord_id, by_username, placeholders_by_sg_id = await self._load_candidates(
+            pending
+        )
+
+        # Users created in this batch are tracked as unsaved instances and
+        # swapped for their persisted rows after bulk_create
+        new_users: List[User] = []
+        upgraded_users: Dict[int, User] = {}
+        renamed_users: Dict[int, User] = {}
+        resolved: Dict[IdentityKey, User] = {}
+
+        for kind, person in pending:
+            discord_id = person.discord_id_int
+
+            # 1. Match by Discord ID
+            if discord_id and discord_id in by_discord_id:
+                user = by_discord_id[discord_id]
+                logger.info(
+                    "Matched SG %s '%s' to user %s by Discord ID",
+                    kind,
+                    person.display_name,
+                    user.id,
+                )
+                resolved[(kind, person.id)] = user
+                continue
+
+            # 2. Match by Discord username
+            discord_username = parse_discord_username(person.discord_tag)
+            if discord_username and discord_username in by_username:
+                user = by_username[discord_username]
+                logger.info(
+                    "Matched SG %s '%s' to user %s by Discord username '%s'",
+                    kind,
+                    person.display_name,
+                    user.id,
+                    discord_username,
+                )
+                resolved[(kind, person.id)] = user
+                continue
+
+            # 3. Match existing placeholder by SpeedGaming ID
+            placeholder = placeholders_by_sg_id.get(person.id)
+            if placeholder is not None:
+                if discord_id and not placeholder.discord_id:
+                    # Upgrade the placeholder now that a Discord ID is known
+                    placeholder.discord_id = discord_id
+                    placeholder.discord_username = (
+                        discord_username or self._fallback_username(kind, person)
+                    )
+                    placeholder.is_placeholder = False
+                    del placeholders_by_sg_id[person.id]
+                    by_discord_id[discord_id] = placeholder
+                    by_username.setdefault(placeholder.discord_username, placeholder)
+                    if placeholder.pk is not None:
+                        upgraded_users[placeholder.pk] = placeholder
+                    logger.info(
+                        "Upgrading placeholder user %s to full user with Discord ID %s",
+                        placeholder.id,
+                        discord_id,
+                    )
+                else:
+                    new_display_name = self._placeholder_display_name(kind, person)
+                    if placeholder.display_name != new_display_name:
+                        logger.info(
+                            "Updating placeholder user %s display name: %s -> %s",
+                            placeholder.id,
+                            placeholder.display_name,
+                            new_display_name,
+                        )
+                        placeholder.display_name = new_display_name
+                        if placeholder.pk is not None:
+                            renamed_users[placeholder.pk] = placeholder
+                resolved[(kind, person.id)] = placeholder
+                continue
+
+            # 4. Create a new full user (Discord ID known) or placeholder
+            user = self._build_user(kind, person, discord_username)
+            new_users.append(user)
+            by_username.setdefault(user.discord_username, user)
+            if user.discord_id:
+                by_discord_id[user.discord_id] = user
+            else:
+                placeholders_by_sg_id[person.id] = user
+            resolved[(kind, person.id)] = user
+
+        if upgraded_users:
+            await User.bulk_update(
+                list(upgraded_users.values()),
+                fields=["discord_id", "discord_username", "is_placeholder"],
+            )
+        if renamed_users:
+            await User.bulk_update(
+                list(renamed_users.values()), fields=["display_name"]
+            )
+
+        if new_users:
+            persisted = await self._create_users(new_users)
+            for key, user in resolved.items():
+                if user.pk is None:
+                    resolved[key] = persisted[id(user)]
+
+        self._identity_map.update(resolved)
+        await self._ensure_memberships({user.id for user in resolved.values()})
+
+    async def _load_candidates(
+        self, pending: List[Tuple[str, SpeedGamingPerson]]
+    ) -> Tuple[Dict[int, User], Dict[str, User], Dict[int, User]]:
+        """
+        Load every candidate user for a batch with one query per lookup key.
+
+        Args:
+            pending: (kind, person) pairs to resolve
+
+        Returns:
+            Tuple of (users by discord_id, users by discord_username,
+            placeholder users by speedgaming_id)
+        """
+        discord_ids = {p.discord_id_int for _, p in pending if p.discord_id_int}
+        usernames = {
+            username
+            for _, p in pending
+            if (username := parse_discord_username(p.discord_tag))
+        }
+        sg_ids = {p.id for _, p in pending}
+
+        by_discord_id: Dict[int, User] = {}
+        if discord_ids:
+            for user in await User.filter(discord_id__in=discord_ids):
+                by_discord_id[user.discord_id] = user
+
+        by_username: Dict[str, User] = {}
+        if usernames:
+            for user in await User.filter(discord_username__in=usernames).order_by(
+                "id"
+            ):
+                by_username.setdefault(user.discord_username, user)
+
+        placeholders_by_sg_id: Dict[int, User] = {}
+        if sg_ids:
+            for user in await User.filter(
+                is_placeholder=True, speedgaming_id__in=sg_ids
+            ).order_by("id"):
+                placeholders_by_sg_id.setdefault(user.speedgaming_id, user)
+
+        return by_discord_id, by_username, placeholders_by_sg_id
+
+    async def _create_users(self, new_users: List[User]) -> Dict[int, User]:
+        """
+        Bulk create users and load their persisted rows.
+
+        bulk_create does not populate primary keys on every backend, so the
+        rows are re-read by their unique Discord ID or placeholder SG ID.
+
+        Args:
+            new_users: Unsaved User instances
+
+        Returns:
+            Mapping of id(unsaved instance) to persisted User
+        """
+        await User.bulk_create(new_users)
+
+        full_ids = [u.discord_id for u in new_users if u.discord_id]
+        placeholder_sg_ids = [u.speedgaming_id for u in new_users if not u.discord_id]
+        query = Q(discord_id__in=full_ids) | Q(
+            is_placeholder=True, speedgaming_id__in=placeholder_sg_ids
+        )
+        created = await User.filter(query).order_by("id")
+
+        created_by_discord_id = {u.discord_id: u for u in created if u.discord_id}
+        created_by_sg_id: Dict[int, User] = {}
+        for user in created:
+            if not user.discord_id:
+                created_by_sg_id.setdefault(user.speedgaming_id, user)
+
+        persisted: Dict[int, User] = {}
+        for user in new_users:
+            if user.discord_id:
+                persisted[id(user)] = created_by_discord_id[user.discord_id]
+            else:
+                persisted[id(user)] = created_by_sg_id[user.speedgaming_id]
+            logger.info(
+                "Created %s user %s for SpeedGaming person (SG ID: %s, discord_id: %s)",
+                "placeholder" if user.is_placeholder else "full",
+                persisted[id(user)].id,
+                user.speedgaming_id,
+                user.discord_id,
+            )
+        return persisted
+
+    async def _ensure_memberships(self, user_ids: Set[int]) -> None:
+        """
+        Ensure all users are members of the organization.
+
+        Args:
+            user_ids: User IDs that must be organization members
+        """
+        missing = user_ids - self._member_user_ids
+        if not missing:
+            return
+
+        existing = set(
+            await OrganizationMember.filter(
+                organization_id=self.organization_id, user_id__in=missing
+            ).values_list("user_id", flat=True)
+        )
+        to_create = sorted(missing - existing)
+        if to_create:
+            await OrganizationMember.bulk_create(
+                [
+                    OrganizationMember(
+                        organization_id=self.organization_id, user_id=user_id
+                    )
+                    for user_id in to_create
+                ]
+            )
+            logger.info(
+                "Added %s users to organization %s",
+                len(to_create),
+                self.organization_id,
+            )
+        self._member_user_ids.update(missing)
+
+    def _build_user(
+        self, kind: str, person: SpeedGamingPerson, discord_username: Optional[str]
+    ) -> User:
+        """
+        Build an unsaved User for a SpeedGaming person.
+
+        Args:
+            kind: PLAYER or CREW
+            person: SpeedGaming player or crew member
+            discord_username: Username parsed from the person's discord tag
+
+        Returns:
+            Unsaved User instance
+        """
+        discord_id = person.discord_id_int
+        if discord_id:
+            username = discord_username or self._fallback_username(kind, person)
+            is_placeholder = False
+        else:
+            username = (
+                f"sg_{person.id}" if kind == self.PLAYER else f"sg_crew_{person.id}"
+            )
+            is_placeholder = True
+
+        if kind == self.PLAYER:
+            display_name = (
+                person.streaming_from
+                or person.public_stream
+                or person.display_name
+                or username
+            )
+        else:
+            display_name = person.public_stream or person.display_name or username
+
+        return User(
+            discord_id=discord_id,
+            discord_username=username,
+            discord_discriminator=(
+                "0000" if person.discord_tag and "#" in person.discord_tag else None
+            ),
+            discord_avatar=None,
+            discord_email=None,
+            display_name=display_name,
+            is_placeholder=is_placeholder,
+            speedgaming_id=person.id,
+        )
+
+    def _fallback_username(self, kind: str, person: SpeedGamingPerson) -> str:
+        """Best-effort username for a person with a Discord ID but no tag."""
+        if kind == self.PLAYER:
+            preferred = person.streaming_from
+        else:
+            preferred = person.public_stream
+        return preferred or person.display_name or f"user_{person.discord_id_int}"
+
+    def _placeholder_display_name(self, kind: str, person: SpeedGamingPerson) -> str:
+        """Current display name for an existing placeholder user."""
+        if kind == self.PLAYER:
+            return (
+                person.streaming_from
+                or person.public_stream
+                or person.display_name
+                or f"sg_{person.id}"
+            )
+        return person.public_stream or person.display_name or f"sg_crew_{person.id}"
@@ -81,33 +81,6 @@ BUILTIN_TASKS: Dict[str, BuiltInTask] = {
         },
         is_active=True,
     ),
-    "async_tournament_timeout_pending": BuiltInTask(
-        task_id="async_tournament_timeout_pending",
-        name="Async Tournament - Timeout Pending Races",
-        description="Checks pending async tournament races and sends warnings or auto-forfeits races that exceed timeout",
-        task_type=TaskType.ASYNC_TOURNAMENT_TIMEOUT_PENDING,
-        schedule_type=ScheduleType.INTERVAL,
-        is_global=True,
-        interval_seconds=60,  # Every minute
-        task_config={
-            "warning_minutes": 10,
-            "timeout_minutes": 20,
-        },
-        is_active=True,
-    ),
-    "async_tournament_timeout_in_progress": BuiltInTask(
-        task_id="async_tournament_timeout_in_progress",
-        name="Async Tournament - Timeout In-Progress Races",
-        description="Checks in-progress async tournament races and auto-forfeits those exceeding maximum allowed time",
-        task_type=TaskType.ASYNC_TOURNAMENT_TIMEOUT_IN_PROGRESS,
-        schedule_type=ScheduleType.INTERVAL,
-        is_global=True,
-        interval_seconds=60,  # Every minute
-        task_config={
-            "max_hours": 12,
-        },
-        is_active=True,
-    ),
     "async_tournament_score_calculation": BuiltInTask(
         task_id="async_tournament_score_calculation",
         name="Async Tournament - Score Calculation",
@@ -156,6 +129,37 @@ BUILTIN_TASKS: Dict[str, BuiltInTask] = {
         },
         is_active=True,
     ),
+    "seed_pool_refill": BuiltInTask(
+        task_id="seed_pool_refill",
+        name="Seed Pool Refill",
+        description="Pre-generates seeds for upcoming matches and keeps a warm buffer for popular public presets",
+        task_type=TaskType.SEED_POOL_REFILL,
+        schedule_type=ScheduleType.INTERVAL,
+        is_global=True,
+        interval_seconds=600,  # Every 10 minutes
+        task_config={
+            "lookahead_hours": 6,  # Pre-roll seeds for matches starting within 6 hours
+            "warm_presets": 5,  # Number of popular public presets to keep warm
+            "warm_depth": 2,  # Available seeds to keep per warm preset
+            "concurrency": 3,  # Maximum seeds generated in parallel
+            "retention_days": 7,  # Keep claimed seeds for 7 days
+        },
+        is_active=True,
+    ),
+    "racer_reverification": BuiltInTask(
+        task_id="racer_reverification",
+        name="Racer Verification - Re-verify Guilds",
+        description="Re-checks the RaceTime race counts of verified racers in every guild and retries failed Discord role grants",
+        task_type=TaskType.RACER_REVERIFICATION,
+        schedule_type=ScheduleType.CRON,
+        is_global=True,
+        cron_expression="0 4 * * *",  # Daily at 4 AM UTC
+        task_config={
+            "guild_id": None,  # Re-verify every guild with an active verification
+            "concurrency": 4,  # Users checked in parallel
+        },
+        is_active=True,
+    ),
     # Example of a disabled built-in task
     "example_builtin_log": BuiltInTask(
         task_id="example_builtin_log",
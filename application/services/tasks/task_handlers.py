@@ -7,12 +7,9 @@ when a task of that type is due to run.
 """
 
 import logging
-import discord
 import httpx
-from datetime import datetime, timedelta, timezone
 from models.scheduled_task import ScheduledTask, TaskType
-from modules.async_qualifier.models.async_qualifier import AsyncQualifier, AsyncQualifierRace
-from models import SYSTEM_USER_ID
+from modules.async_qualifier.models.async_qualifier import AsyncQualifier
 from application.services.tasks.task_scheduler_service import TaskSchedulerService
 from application.services.async_qualifiers.async_qualifier_service import (
     AsyncQualifierService,
@@ -20,7 +17,9 @@ from application.services.async_qualifiers.async_qualifier_service import (
 from application.services.async_qualifiers.async_live_race_service import (
     AsyncLiveRaceService,
 )
-from discordbot.client import get_bot_instance
+from application.services.async_qualifiers.race_deadline_scheduler import (
+    get_race_deadline_scheduler,
+)
 from racetime.client import get_all_racetime_bot_instances
 
 logger = logging.getLogger(__name__)
@@ -187,166 +186,29 @@ async def handle_async_tournament_timeout_pending(task: ScheduledTask) -> None:
     """
     Handler for timing out pending async tournament races.
 
-    This task checks all pending races with Discord threads and sends warnings
-    or auto-forfeits races that have exceeded their timeout period.
-
-    Expected task_config:
-    {
-        "warning_minutes": 10,  # Minutes before forfeit to send warning (default: 10)
-        "timeout_minutes": 20,  # Minutes until forfeit (default: 20)
-    }
+    Timeouts are enforced on time by the race deadline scheduler; this task
+    type only forfeits races whose deadline has already passed (e.g. after
+    downtime). Timeouts are configured with ASYNC_RACE_* settings.
 
     Args:
         task: ScheduledTask to execute
     """
-    logger.info("Starting async tournament pending race timeout task: %s", task.name)
-
-    # Get Discord bot instance
-    bot = get_bot_instance()
-    if not bot:
-        logger.warning("Discord bot not available, skipping timeout task")
-        return
-
-    # Extract configuration
-    config = task.task_config or {}
-    warning_minutes = config.get("warning_minutes", 10)
-    timeout_minutes = config.get("timeout_minutes", 20)
-
+    logger.info("Starting async tournament race timeout sweep: %s", task.name)
     try:
-        pending_races = await AsyncQualifierRace.filter(
-            status="pending", discord_thread_id__isnull=False
-        ).prefetch_related("user")
-
-        for race in pending_races:
-            # Set default timeout if not set
-            if not race.thread_timeout_time:
-                if race.thread_open_time:
-                    race.thread_timeout_time = race.thread_open_time + timedelta(
-                        minutes=timeout_minutes
-                    )
-                    await race.save()
-
-            if not race.thread_timeout_time:
-                continue
-
-            warning_time = race.thread_timeout_time - timedelta(minutes=warning_minutes)
-            forfeit_time = race.thread_timeout_time
-
-            thread = bot.get_channel(race.discord_thread_id)
-            if not thread:
-                logger.warning("Cannot access thread for race %s", race.id)
-                continue
-
-            now = datetime.now(timezone.utc)
-
-            # Send warning only if not already sent
-            if warning_time <= now < forfeit_time and not getattr(
-                race, "warning_sent", False
-            ):
-                await thread.send(
-                    f"<@{race.user.discord_id}>, your race will be forfeited on "
-                    f"{discord.utils.format_dt(forfeit_time, 'f')} "
-                    f"({discord.utils.format_dt(forfeit_time, 'R')}) if you don't start it.",
-                    allowed_mentions=discord.AllowedMentions(users=True),
-                )
-                race.warning_sent = True
-                await race.save()
-
-            # Auto-forfeit
-            if forfeit_time <= now:
-                await thread.send(
-                    f"<@{race.user.discord_id}>, this race has been automatically forfeited due to timeout.",
-                    allowed_mentions=discord.AllowedMentions(users=True),
-                )
-                race.status = "forfeit"
-                await race.save()
-
-                # Create audit log
-                tournament_service = AsyncQualifierService()
-                await tournament_service.repo.create_audit_log(
-                    tournament_id=race.tournament_id,
-                    action="auto_forfeit",
-                    details=f"Race {race.id} automatically forfeited (pending timeout)",
-                    user_id=SYSTEM_USER_ID,
-                )
-
-        logger.info("Completed async tournament pending race timeout task")
+        forfeited = await get_race_deadline_scheduler().sweep_overdue()
+        logger.info(
+            "Completed async tournament race timeout sweep: %d race(s) forfeited",
+            forfeited,
+        )
     except Exception as e:
         logger.error(
-            "Error during async tournament pending race timeout: %s", e, exc_info=True
+            "Error during async tournament race timeout sweep: %s", e, exc_info=True
         )
         raise
 
 
-async def handle_async_tournament_timeout_in_progress(task: ScheduledTask) -> None:
-    """
-    Handler for timing out in-progress async tournament races.
-
-    This task checks all in-progress races and auto-forfeits those that have
-    exceeded the maximum allowed time.
-
-    Expected task_config:
-    {
-        "max_hours": 12,  # Maximum hours allowed (default: 12)
-    }
-
-    Args:
-        task: ScheduledTask to execute
-    """
-    logger.info(
-        "Starting async tournament in-progress race timeout task: %s", task.name
-    )
-
-    # Get Discord bot instance
-    bot = get_bot_instance()
-    if not bot:
-        logger.warning("Discord bot not available, skipping timeout task")
-        return
-
-    # Extract configuration
-    config = task.task_config or {}
-    max_hours = config.get("max_hours", 12)
-
-    try:
-        in_progress = await AsyncQualifierRace.filter(
-            status="in_progress", discord_thread_id__isnull=False
-        ).prefetch_related("user")
-
-        for race in in_progress:
-            if not race.start_time:
-                continue
-
-            # Calculate timeout time
-            timeout_time = race.start_time + timedelta(hours=max_hours)
-
-            if datetime.now(timezone.utc) >= timeout_time:
-                thread = bot.get_channel(race.discord_thread_id)
-                if thread:
-                    await thread.send(
-                        f"<@{race.user.discord_id}>, this race has exceeded {max_hours} hours and has been forfeited.",
-                        allowed_mentions=discord.AllowedMentions(users=True),
-                    )
-
-                race.status = "forfeit"
-                await race.save()
-
-                # Create audit log
-                tournament_service = AsyncQualifierService()
-                await tournament_service.repo.create_audit_log(
-                    tournament_id=race.tournament_id,
-                    action="auto_forfeit",
-                    details=f"Race {race.id} automatically forfeited ({max_hours} hour timeout)",
-                    user_id=SYSTEM_USER_ID,
-                )
-
-        logger.info("Completed async tournament in-progress race timeout task")
-    except Exception as e:
-        logger.error(
-            "Error during async tournament in-progress race timeout: %s",
-            e,
-            exc_info=True,
-        )
-        raise
+# Both timeouts are handled by the same sweep
+handle_async_tournament_timeout_in_progress = handle_async_tournament_timeout_pending
 
 
 async def handle_async_tournament_score_calculation(task: ScheduledTask) -> None:
@@ -685,6 +547,115 @@ async def handle_racetime_poll_open_rooms(task: ScheduledTask) -> None:
         raise
 
 
+async def handle_seed_pool_refill(task: ScheduledTask) -> None:
+    """
+    Handler for refilling the seed pool.
+
+    Pre-rolls a reserved seed for every match scheduled within the lookahead
+    window, keeps a warm buffer of seeds for popular public presets, and
+    purges old claimed seeds.
+
+    Expected task_config:
+    {
+        "lookahead_hours": 6,  # Pre-roll for matches starting within N hours (default: 6)
+        "warm_presets": 5,  # Popular public presets to keep warm (default: 5)
+        "warm_depth": 2,  # Available seeds per warm preset (default: 2)
+        "concurrency": 3,  # Maximum seeds generated in parallel (default: 3)
+        "retention_days": 7  # Days to keep claimed seeds (default: 7)
+    }
+
+    Args:
+        task: ScheduledTask to execute
+    """
+    from application.services.randomizer.seed_pool_service import SeedPoolService
+
+    logger.info("Starting seed pool refill task: %s", task.name)
+
+    config = task.task_config or {}
+    lookahead_hours = config.get("lookahead_hours", 6)
+    warm_presets = config.get("warm_presets", 5)
+    warm_depth = config.get("warm_depth", 2)
+    concurrency = config.get("concurrency", 3)
+    retention_days = config.get("retention_days", 7)
+
+    try:
+        pool_service = SeedPoolService()
+        purged = await pool_service.purge(retention_days)
+        reserved = await pool_service.prefill_upcoming_matches(
+            lookahead_hours, concurrency=concurrency
+        )
+        warmed = await pool_service.top_up_popular_presets(
+            warm_presets, warm_depth, concurrency=concurrency
+        )
+
+        logger.info(
+            "Completed seed pool refill: %d match seeds, %d warm seeds, %d purged",
+            reserved,
+            warmed,
+            purged,
+        )
+
+    except Exception as e:
+        logger.error("Error during seed pool refill: %s", e, exc_info=True)
+        raise
+
+
+async def handle_racer_reverification(task: ScheduledTask) -> None:
+    """
+    Handler for re-verifying racers.
+
+    Re-checks every verified racer of the configured guild (or of every guild
+    with an active racer verification), recording race counts and retrying
+    Discord role grants that failed earlier.
+
+    Expected task_config:
+    {
+        "guild_id": 123456789,  # Guild to re-verify (default: all guilds)
+        "concurrency": 4  # Users checked in parallel (default: from settings)
+    }
+
+    Args:
+        task: ScheduledTask to execute
+    """
+    from application.services.racetime.racer_verification_service import (
+        RacerVerificationService,
+    )
+
+    logger.info("Starting racer re-verification task: %s", task.name)
+
+    config = task.task_config or {}
+    guild_id = config.get("guild_id")
+    concurrency = config.get("concurrency")
+
+    try:
+        service = RacerVerificationService()
+        if guild_id is not None:
+            guild_ids = [int(guild_id)]
+        else:
+            guild_ids = await service.repository.list_active_guild_ids()
+
+        users = 0
+        granted = 0
+        errors = 0
+        for gid in guild_ids:
+            result = await service.reverify_guild(gid, concurrency=concurrency)
+            users += result.users
+            granted += result.roles_granted
+            errors += result.errors
+
+        logger.info(
+            "Completed racer re-verification of %d guild(s): %d users, %d roles granted, %d errors",
+            len(guild_ids),
+            users,
+            granted,
+            errors,
+        )
+
+    except Exception as e:
+        logger.error("Error during racer re-verification: %s", e, exc_info=True)
+        raise
+
+
 def register_task_handlers() -> None:
     """
     Register all task handlers with the TaskSchedulerService.
@@ -723,5 +694,11 @@ def register_task_handlers() -> None:
     TaskSchedulerService.register_task_handler(
         TaskType.RACETIME_POLL_OPEN_ROOMS, handle_racetime_poll_open_rooms
     )
+    TaskSchedulerService.register_task_handler(
+        TaskType.SEED_POOL_REFILL, handle_seed_pool_refill
+    )
+    TaskSchedulerService.register_task_handler(
+        TaskType.RACER_REVERIFICATION, handle_racer_reverification
+    )
     TaskSchedulerService.register_task_handler(TaskType.CUSTOM, handle_custom_task)
     logger.info("All task handlers registered")
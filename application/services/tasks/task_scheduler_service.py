@@ -29,6 +29,7 @@ from application.services.tasks.builtin_tasks import (
     get_builtin_task,
 )
 from application.events import EventBus, BuiltinTaskOverrideUpdatedEvent
+from application.utils.query_stats import query_caller
 
 logger = logging.getLogger(__name__)
 
@@ -881,7 +882,8 @@ class TaskSchedulerService:
             pseudo_task = PseudoTask(builtin)
 
             # Execute the handler
-            await handler(pseudo_task)
+            with query_caller(f"task:{builtin.name}"):
+                await handler(pseudo_task)
 
             # Update last run time
             cls._builtin_tasks_last_run[builtin.task_id] = now
@@ -945,7 +947,8 @@ class TaskSchedulerService:
                 )
 
             # Execute the handler
-            await handler(task)
+            with query_caller(f"task:{task.name}"):
+                await handler(task)
 
             # Calculate next run time
             next_run_at = cls._calculate_next_run(
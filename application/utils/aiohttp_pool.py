@@ -0,0 +1,113 @@
+"""
+Shared aiohttp connection pool.
+
+All RaceTime bots and services share a single keep-alive TCPConnector instead of
+opening a fresh ClientSession (and TCP+TLS handshake) per request. Bots get
+their own lightweight ClientSession on top of the shared connector so closing a
+bot's session never tears down connections used by others.
+
+The pool is bound to the running event loop and is recreated transparently if
+the loop changes (e.g. between test cases).
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_connector: Optional[aiohttp.TCPConnector] = None
+_session: Optional[aiohttp.ClientSession] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _pool_is_current() -> bool:
+    """Check whether the existing connector belongs to the running loop."""
+    return (
+        _connector is not None
+        and not _connector.closed
+        and _loop is asyncio.get_running_loop()
+    )
+
+
+def get_connector() -> aiohttp.TCPConnector:
+    """
+    Get the shared keep-alive connector, creating it if needed.
+
+    Must be called from within a running event loop.
+
+    Returns:
+        Shared aiohttp TCPConnector
+    """
+    global _connector, _session, _loop
+
+    if not _pool_is_current():
+        _connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_LIMIT,
+            limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=settings.HTTP_POOL_KEEPALIVE_SECONDS,
+        )
+        _session = None
+        _loop = asyncio.get_running_loop()
+        logger.debug(
+            "Created shared aiohttp connector (limit=%s, per_host=%s)",
+            settings.HTTP_POOL_LIMIT,
+            settings.HTTP_POOL_LIMIT_PER_HOST,
+        )
+    return _connector
+
+
+def create_session(**kwargs) -> aiohttp.ClientSession:
+    """
+    Create a ClientSession that uses the shared connector.
+
+    The session does not own the connector, so closing it leaves pooled
+    connections available to everyone else.
+
+    Args:
+        **kwargs: Extra arguments passed to aiohttp.ClientSession
+
+    Returns:
+        New ClientSession backed by the shared connector
+    """
+    return aiohttp.ClientSession(
+        connector=get_connector(), connector_owner=False, **kwargs
+    )
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide shared ClientSession.
+
+    Use this for one-off requests from services; do not close the returned
+    session.
+
+    Returns:
+        Shared ClientSession backed by the shared connector
+    """
+    global _session
+
+    get_connector()
+    if _session is None or _session.closed:
+        _session = create_session(
+            timeout=aiohttp.ClientTimeout(total=settings.HTTP_POOL_TIMEOUT_SECONDS)
+        )
+    return _session
+
+
+async def close_pool() -> None:
+    """Close the shared session and connector (called on application shutdown)."""
+    global _connector, _session, _loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    if _connector is not None and not _connector.closed:
+        await _connector.close()
+        logger.info("Closed shared aiohttp connection pool")
+    _connector = None
+    _session = None
+    _loop = None
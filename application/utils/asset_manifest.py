@@ -0,0 +1,247 @@
+"""
+Static asset manifest.
+
+Maps every file under static/ to a short content hash used for cache-busting
+URLs (``/static/css/main.css?v=<hash>``). The manifest is built once: from
+static/manifest.json when a build step produced it, otherwise by hashing the
+files at first use. Page renders then only do dictionary lookups.
+
+In debug mode the manifest re-checks file modification times (at most every
+couple of seconds) and re-hashes changed files, so edits show up without a
+restart.
+
+Build the manifest ahead of deployment with:
+    python tools/build_asset_manifest.py
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = Path(__file__).resolve().parent.parent.parent / "static"
+MANIFEST_FILE = STATIC_DIR / "manifest.json"
+
+# Version used when a file is missing from the manifest
+FALLBACK_VERSION = "1"
+
+# Minimum seconds between modification-time scans in debug mode
+DEV_RECHECK_SECONDS = 2.0
+
+
+def hash_file(path: Path) -> str:
+    """
+    Compute the cache-busting hash of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        First 8 hex characters of the MD5 of the file content
+    """
+    return hashlib.md5(path.read_bytes(), usedforsecurity=False).hexdigest()[:8]
+
+
+class AssetManifest:
+    """Content hashes for files under the static directory."""
+
+    def __init__(self, static_dir: Path = STATIC_DIR, watch: bool = False):
+        """
+        Initialize an empty manifest.
+
+        Args:
+            static_dir: Directory whose files are versioned
+            watch: Re-hash changed files on lookup (debug mode)
+        """
+        self.static_dir = static_dir
+        self.manifest_file = static_dir / MANIFEST_FILE.name
+        self.watch = watch
+        self._versions: Dict[str, str] = {}
+        self._mtimes: Dict[str, float] = {}
+        self._loaded = False
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def version(self, path: str) -> str:
+        """
+        Get the content hash for a static file.
+
+        Args:
+            path: Path relative to the static directory (e.g. "css/main.css")
+
+        Returns:
+            Content hash, or FALLBACK_VERSION if the file is unknown
+        """
+        self._ensure_current()
+        return self._versions.get(path, FALLBACK_VERSION)
+
+    def url(self, path: str) -> str:
+        """
+        Get the versioned URL for a static file.
+
+        Args:
+            path: Path relative to the static directory (e.g. "css/main.css")
+
+        Returns:
+            URL with a cache-busting version parameter
+        """
+        return f"/static/{path}?v={self.version(path)}"
+
+    def is_current(self, path: str, version: Optional[str]) -> bool:
+        """
+        Check whether a requested version matches the file's current hash.
+
+        Args:
+            path: Path relative to the static directory
+            version: Version from the request's ``v`` query parameter
+
+        Returns:
+            True if the URL is a current hashed URL (safe to cache forever)
+        """
+        if not version:
+            return False
+        self._ensure_current()
+        return self._versions.get(path) == version
+
+    def build(self) -> Dict[str, str]:
+        """
+        Hash every file under the static directory.
+
+        Returns:
+            Mapping of relative path to content hash
+        """
+        versions, mtimes = self._scan({}, {})
+        with self._lock:
+            self._versions, self._mtimes = versions, mtimes
+            self._loaded = True
+            self._checked_at = time.monotonic()
+        logger.info("Built asset manifest (%d files)", len(versions))
+        return dict(versions)
+
+    def load(self, manifest_file: Optional[Path] = None) -> bool:
+        """
+        Load a manifest written by write().
+
+        Args:
+            manifest_file: Manifest JSON file (default: manifest.json in the
+                static directory)
+
+        Returns:
+            True if the file was loaded, False if it was missing or invalid
+        """
+        manifest_file = manifest_file or self.manifest_file
+        try:
+            versions = json.loads(manifest_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable asset manifest %s: %s", manifest_file, e
+            )
+            return False
+
+        with self._lock:
+            self._versions = {str(k): str(v) for k, v in versions.items()}
+            self._mtimes = {}
+            self._loaded = True
+            self._checked_at = time.monotonic()
+        logger.info("Loaded asset manifest (%d files)", len(self._versions))
+        return True
+
+    def write(self, manifest_file: Optional[Path] = None) -> int:
+        """
+        Build the manifest and write it as JSON.
+
+        Args:
+            manifest_file: Destination file (default: manifest.json in the
+                static directory)
+
+        Returns:
+            Number of files in the manifest
+        """
+        versions = self.build()
+        (manifest_file or self.manifest_file).write_text(
+            json.dumps(versions, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        return len(versions)
+
+    def ensure_loaded(self) -> None:
+        """Load (or build) the manifest now instead of on the first lookup."""
+        self._ensure_current()
+
+    def _ensure_current(self) -> None:
+        """Load the manifest on first use; re-hash changed files when watching."""
+        if not self._loaded:
+            # A prebuilt manifest is only trusted when not watching for edits
+            if self.watch or not self.load():
+                self.build()
+            return
+
+        if not self.watch:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < DEV_RECHECK_SECONDS:
+            return
+
+        with self._lock:
+            self._checked_at = now
+            versions, mtimes = self._scan(self._versions, self._mtimes)
+            if versions != self._versions:
+                logger.debug("Static assets changed, manifest updated")
+            self._versions, self._mtimes = versions, mtimes
+
+    def _scan(
+        self, versions: Dict[str, str], mtimes: Dict[str, float]
+    ) -> Tuple[Dict[str, str], Dict[str, float]]:
+        """Hash new or modified files, reusing hashes of unchanged ones."""
+        new_versions: Dict[str, str] = {}
+        new_mtimes: Dict[str, float] = {}
+        if not self.static_dir.is_dir():
+            return new_versions, new_mtimes
+
+        for file in self.static_dir.rglob("*"):
+            if not file.is_file() or file == self.manifest_file:
+                continue
+            path = file.relative_to(self.static_dir).as_posix()
+            try:
+                mtime = file.stat().st_mtime
+                if path in versions and mtimes.get(path) == mtime:
+                    new_versions[path] = versions[path]
+                else:
+                    new_versions[path] = hash_file(file)
+                new_mtimes[path] = mtime
+            except OSError as e:
+                logger.warning("Could not hash static asset %s: %s", path, e)
+        return new_versions, new_mtimes
+
+
+# Global manifest instance
+_manifest: Optional[AssetManifest] = None
+
+
+def get_asset_manifest() -> AssetManifest:
+    """Get the global asset manifest (watches for changes in debug mode)."""
+    global _manifest
+    if _manifest is None:
+        _manifest = AssetManifest(watch=settings.DEBUG)
+    return _manifest
+
+
+def asset_url(path: str) -> str:
+    """
+    Get the versioned URL for a static file.
+
+    Args:
+        path: Path relative to static/ (e.g. "js/core/dark-mode.js")
+
+    Returns:
+        URL with a cache-busting version parameter
+    """
+    return get_asset_manifest().url(path)
@@ -0,0 +1,107 @@
+"""
+Background worker with cooperative shutdown.
+
+Services that do periodic work in the application lifecycle (buffered
+writers, token refresh, deadline timers) share this loop instead of each
+managing their own task. The loop sleeps for next_delay() seconds, or until
+wake() is called, and then calls run_once().
+
+stop() never cancels the loop: it clears the running flag, wakes the loop and
+waits for the iteration in progress to finish. Work that was already taken
+out of a queue when shutdown started is therefore completed instead of being
+dropped half-way. Subclasses run their final flush after stop() returns.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundWorker:
+    """
+    Base class for services running a periodic loop in the background.
+
+    Subclasses implement run_once() and next_delay(), and extend start() and
+    stop() (both return whether they changed state) for their own logging
+    and shutdown work.
+    """
+
+    # Name used in log messages
+    name = "Background worker"
+
+    def __init__(self):
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background loop is running."""
+        return self._running
+
+    def wake(self) -> None:
+        """Run the next iteration now instead of after next_delay()."""
+        self._wakeup.set()
+
+    async def run_once(self) -> None:
+        """Do one iteration of work (errors are logged, the loop continues)."""
+        raise NotImplementedError
+
+    def next_delay(self) -> float:
+        """Seconds to sleep before the next iteration."""
+        raise NotImplementedError
+
+    async def start(self) -> bool:
+        """
+        Start the background loop.
+
+        Returns:
+            bool: False if the loop was already running
+        """
+        if self._running:
+            logger.warning("%s already running", self.name)
+            return False
+
+        self._running = True
+        # Bind the event to the running loop; keep a wakeup requested earlier
+        woken = self._wakeup.is_set()
+        self._wakeup = asyncio.Event()
+        if woken:
+            self._wakeup.set()
+        self._task = asyncio.create_task(self._loop())
+        return True
+
+    async def stop(self) -> bool:
+        """
+        Stop the loop after the iteration in progress has finished.
+
+        Returns:
+            bool: False if the loop was not running
+        """
+        if not self._running:
+            return False
+
+        self._running = False
+        self.wake()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        return True
+
+    async def _loop(self) -> None:
+        """Sleep until the next iteration is due (or woken), then run it."""
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.next_delay())
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self._running:
+                break
+
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.exception("Error in %s: %s", self.name, str(e))
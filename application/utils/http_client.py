@@ -0,0 +1,485 @@
+"""
+Shared resilient HTTP client layer for randomizer services.
+
+Randomizer services used to open a fresh httpx.AsyncClient (and pay a full
+TCP+TLS handshake) for every call, with ad-hoc timeouts and no retry. This
+module keeps one pooled client per upstream host and wraps every request with:
+
+- HTTP/2 when the optional ``h2`` package is installed
+- Jittered exponential retry on 5xx responses, timeouts and transport errors
+  for idempotent requests; non-idempotent requests (seed generation POSTs)
+  are only retried when the upstream cannot have accepted them
+- A per-host concurrency limit
+- A per-host circuit breaker that fails fast while an upstream is down
+- Latency histograms and error counters per randomizer
+
+Usage:
+    client = get_randomizer_client("alttpr")
+    response = await client.post(url, json=settings, timeout=60.0)
+    response.raise_for_status()
+
+Like the aiohttp pool, clients are bound to the running event loop and are
+recreated transparently if the loop changes (e.g. between test cases).
+LoopBoundPool, create_pooled_client() and backoff_delay() are shared with the
+OAuth provider clients.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from bisect import bisect_left
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Callable, Dict, Generic, Optional, Sequence, TypeVar, Union
+from urllib.parse import urlsplit
+
+import httpx
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Methods retried on any transport error or 5xx response
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Failures after which a non-idempotent request was never accepted upstream.
+# 502 and 504 are not among them: the gateway may have forwarded the request
+# and the upstream may still be generating.
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+UNAVAILABLE_STATUS_CODES = frozenset({503})
+
+# Latency histogram bucket upper bounds, in milliseconds
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised when a request is rejected because the host's circuit is open."""
+
+
+class LatencyHistogram:
+    """Cumulative request latency histogram with fixed buckets."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Ascending bucket upper bounds in milliseconds
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        """
+        Record one request duration.
+
+        Args:
+            elapsed_ms: Request duration in milliseconds
+        """
+        self.counts[bisect_left(self.buckets, elapsed_ms)] += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, fraction: float) -> Optional[int]:
+        """
+        Estimate a percentile as the upper bound of the bucket containing it.
+
+        Args:
+            fraction: Percentile as a fraction (e.g. 0.95)
+
+        Returns:
+            Bucket upper bound in milliseconds (max observed for the overflow
+            bucket), or None if nothing was recorded
+        """
+        count = sum(self.counts)
+        if not count:
+            return None
+        threshold = fraction * count
+        running = 0
+        for index, bucket_count in enumerate(self.counts):
+            running += bucket_count
+            if running >= threshold:
+                if index < len(self.buckets):
+                    return self.buckets[index]
+                break
+        return int(self.max_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable view of the histogram.
+
+        Returns:
+            Dictionary with count, avg/max/p50/p95 and per-bucket counts
+        """
+        count = sum(self.counts)
+        labels = [f"<={bound}ms" for bound in self.buckets] + [
+            f">{self.buckets[-1]}ms"
+        ]
+        return {
+            "count": count,
+            "avg_ms": int(self.total_ms / count) if count else None,
+            "max_ms": int(self.max_ms) if count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+def create_pooled_client(
+    timeout: Union[float, httpx.Timeout], max_connections: int
+) -> httpx.AsyncClient:
+    """
+    Create a long-lived client shared by every caller of an upstream.
+
+    Args:
+        timeout: Request timeout
+        max_connections: Connection (and keep-alive) limit
+
+    Returns:
+        httpx.AsyncClient using HTTP/2 when available
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        ),
+        # Shared clients must never carry one caller's cookies to another
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+    )
+
+
+def backoff_delay(base: float, attempt: int, cap: float) -> float:
+    """
+    Full-jitter exponential backoff for a retry attempt.
+
+    Args:
+        base: Backoff of the first retry, in seconds
+        attempt: Retry attempt (0-based)
+        cap: Upper bound of the delay, in seconds
+
+    Returns:
+        float: Seconds to wait before the retry
+    """
+    return random.uniform(0, min(base * (2**attempt), cap))
+
+
+class LoopBoundPool(Generic[T]):
+    """
+    Pooled clients by key, bound to the running event loop.
+
+    Clients from another loop cannot be reused (or closed), so the pool is
+    emptied when the running loop changes. Pooled objects must have an
+    async aclose() method.
+    """
+
+    def __init__(self, factory: Callable[[str], T], description: str):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Creates the client for a key
+            description: What the clients are, for log messages
+        """
+        self.factory = factory
+        self.description = description
+        self.pooled: Dict[str, T] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self, key: str) -> T:
+        """Get (or create) the client for a key."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.pooled.clear()
+            self._loop = loop
+
+        item = self.pooled.get(key)
+        if item is None:
+            item = self.factory(key)
+            self.pooled[key] = item
+            logger.debug(
+                "Created pooled %s for %s (http2=%s)",
+                self.description,
+                key,
+                HTTP2_AVAILABLE,
+            )
+        return item
+
+    async def close(self) -> None:
+        """Close every pooled client (called on application shutdown)."""
+        for item in list(self.pooled.values()):
+            await item.aclose()
+        if self.pooled:
+            logger.info("Closed %d pooled %s(s)", len(self.pooled), self.description)
+        self.pooled.clear()
+        self._loop = None
+
+
+class _RandomizerStats:
+    """Request counters and latency for one randomizer."""
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.rejected = 0
+        self.latency = LatencyHistogram()
+
+
+class _HostPool:
+    """Pooled client, concurrency limit and circuit breaker for one host."""
+
+    def __init__(self, host: str):
+        limit = settings.RANDOMIZER_HTTP_MAX_CONCURRENCY_PER_HOST
+        self.host = host
+        self.client = create_pooled_client(
+            settings.RANDOMIZER_HTTP_TIMEOUT_SECONDS, limit
+        )
+        self.semaphore = asyncio.Semaphore(limit)
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+    async def aclose(self) -> None:
+        """Close the pooled client."""
+        await self.client.aclose()
+
+    def check_circuit(self) -> None:
+        """Raise CircuitOpenError while the circuit is open."""
+        if time.monotonic() < self.open_until:
+            raise CircuitOpenError(
+                f"Circuit open for {self.host} after "
+                f"{self.consecutive_failures} consecutive failures"
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit once the threshold is reached."""
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= settings.RANDOMIZER_HTTP_BREAKER_THRESHOLD:
+            self.open_until = (
+                time.monotonic() + settings.RANDOMIZER_HTTP_BREAKER_COOLDOWN_SECONDS
+            )
+            logger.warning(
+                "Opening circuit for %s for %ss after %d consecutive failures",
+                self.host,
+                settings.RANDOMIZER_HTTP_BREAKER_COOLDOWN_SECONDS,
+                self.consecutive_failures,
+            )
+
+
+_hosts: LoopBoundPool[_HostPool] = LoopBoundPool(_HostPool, "randomizer HTTP client")
+_stats: Dict[str, _RandomizerStats] = {}
+
+
+def _get_host_pool(url: str) -> _HostPool:
+    """Get (or create) the pool for the URL's scheme and host."""
+    parts = urlsplit(url)
+    return _hosts.get(f"{parts.scheme}://{parts.netloc}")
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Backoff before the given retry attempt (0-based)."""
+    return backoff_delay(settings.RANDOMIZER_HTTP_RETRY_BACKOFF_SECONDS, attempt, 10.0)
+
+
+class RandomizerHttpClient:
+    """
+    HTTP client facade used by randomizer services.
+
+    Routes every request through the shared per-host pool and records
+    metrics under the randomizer's name.
+    """
+
+    def __init__(self, randomizer: str):
+        """
+        Initialize the client.
+
+        Args:
+            randomizer: Randomizer name used to label metrics
+        """
+        self.randomizer = randomizer
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retries: Optional[int] = None,
+        idempotent: Optional[bool] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request with retry, concurrency limiting and circuit breaking.
+
+        Idempotent requests are retried on any transport error and 5xx
+        response. A non-idempotent request may still be running upstream
+        after a read timeout or 500, and retrying it would generate a
+        duplicate seed, so it is only retried on connect-phase errors and
+        503. If retries are exhausted the last response is returned
+        so callers can raise_for_status() as before.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            retries: Retry count override (default: RANDOMIZER_HTTP_MAX_RETRIES)
+            idempotent: Whether the request is safe to repeat (default: by
+                method, see IDEMPOTENT_METHODS)
+            cookies: Cookies to send with this request only
+            **kwargs: Passed to httpx.AsyncClient.request (json, data, timeout, ...)
+
+        Returns:
+            httpx.Response: The response
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+            httpx.HTTPError: If the request fails after all retries
+        """
+        if cookies:
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
+            kwargs["headers"] = headers
+
+        pool = _get_host_pool(url)
+        stats = _stats.setdefault(self.randomizer, _RandomizerStats())
+        max_retries = (
+            settings.RANDOMIZER_HTTP_MAX_RETRIES if retries is None else retries
+        )
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(max_retries + 1):
+            try:
+                pool.check_circuit()
+            except CircuitOpenError:
+                stats.rejected += 1
+                raise
+
+            if attempt:
+                stats.retries += 1
+            stats.requests += 1
+            started = time.perf_counter()
+            try:
+                async with pool.semaphore:
+                    response = await pool.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                stats.latency.observe((time.perf_counter() - started) * 1000)
+                stats.failures += 1
+                pool.record_failure()
+                if attempt >= max_retries or not (
+                    idempotent or isinstance(e, CONNECT_ERRORS)
+                ):
+                    raise
+                logger.warning(
+                    "%s %s failed (%s), retrying (%d/%d)",
+                    method,
+                    url,
+                    type(e).__name__,
+                    attempt + 1,
+                    max_retries,
+                )
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+
+            stats.latency.observe((time.perf_counter() - started) * 1000)
+            if response.status_code >= 500:
+                stats.failures += 1
+                pool.record_failure()
+                if attempt < max_retries and (
+                    idempotent or response.status_code in UNAVAILABLE_STATUS_CODES
+                ):
+                    logger.warning(
+                        "%s %s returned %d, retrying (%d/%d)",
+                        method,
+                        url,
+                        response.status_code,
+                        attempt + 1,
+                        max_retries,
+                    )
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    continue
+            else:
+                pool.record_success()
+            return response
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request (see request())."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request (see request())."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a PUT request (see request())."""
+        return await self.request("PUT", url, **kwargs)
+
+
+def get_randomizer_client(randomizer: str) -> RandomizerHttpClient:
+    """
+    Get an HTTP client for a randomizer service.
+
+    Args:
+        randomizer: Randomizer name used to label metrics
+
+    Returns:
+        RandomizerHttpClient backed by the shared per-host pools
+    """
+    return RandomizerHttpClient(randomizer)
+
+
+def get_randomizer_http_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get request counters and latency histograms per randomizer.
+
+    Returns:
+        Dictionary of randomizer name -> stats (requests, failures, retries,
+        rejected, latency)
+    """
+    return {
+        name: {
+            "requests": stats.requests,
+            "failures": stats.failures,
+            "retries": stats.retries,
+            "rejected": stats.rejected,
+            "latency": stats.latency.snapshot(),
+        }
+        for name, stats in sorted(_stats.items())
+    }
+
+
+def get_circuit_states() -> Dict[str, Dict[str, Any]]:
+    """
+    Get circuit breaker state per upstream host.
+
+    Returns:
+        Dictionary of host -> {"open": bool, "consecutive_failures": int}
+    """
+    now = time.monotonic()
+    return {
+        host: {
+            "open": now < pool.open_until,
+            "consecutive_failures": pool.consecutive_failures,
+        }
+        for host, pool in _hosts.pooled.items()
+    }
+
+
+async def close_http_clients() -> None:
+    """Close all pooled clients (called on application shutdown)."""
+    await _hosts.close()
@@ -0,0 +1,200 @@
+"""
+Long-lived HTTP clients for OAuth providers.
+
+The Discord, RaceTime.gg and Twitch OAuth services used to open a fresh
+httpx.AsyncClient for every token exchange, user info lookup and refresh, so
+a login paid one TCP+TLS handshake per step. This module keeps one pooled
+client per provider with:
+
+- Provider timeouts (OAUTH_HTTP_TIMEOUT_SECONDS)
+- Retry with jittered backoff when the connection could not be established.
+  Nothing was sent in that case, so single-use authorization codes are safe
+  to retry; any other error is raised to the caller unchanged.
+- Request, error and retry counters and a latency histogram per provider
+
+Usage:
+    client = get_oauth_client("discord")
+    response = await client.post(url, data=data, headers=headers)
+
+Like the randomizer clients, pooled clients are bound to the running event
+loop and are recreated transparently if the loop changes (e.g. between test
+cases). They are closed on application shutdown by close_oauth_clients().
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict
+
+import httpx
+
+from application.utils.http_client import (
+    LatencyHistogram,
+    LoopBoundPool,
+    backoff_delay,
+    create_pooled_client,
+)
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+DISCORD = "discord"
+RACETIME = "racetime"
+TWITCH = "twitch"
+
+# Errors raised before the request reached the provider
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class _ProviderStats:
+    """Request counters and latency for one provider."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.latency = LatencyHistogram()
+
+
+def _create_client(provider: str) -> httpx.AsyncClient:
+    """Create the pooled client for a provider."""
+    return create_pooled_client(
+        httpx.Timeout(
+            settings.OAUTH_HTTP_TIMEOUT_SECONDS,
+            connect=settings.OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+        settings.OAUTH_HTTP_MAX_CONNECTIONS,
+    )
+
+
+_clients: LoopBoundPool[httpx.AsyncClient] = LoopBoundPool(
+    _create_client, "OAuth HTTP client"
+)
+_stats: Dict[str, _ProviderStats] = {}
+
+
+def _get_pooled_client(provider: str) -> httpx.AsyncClient:
+    """Get (or create) the pooled client for a provider."""
+    return _clients.get(provider)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Backoff before the given retry attempt (0-based)."""
+    return backoff_delay(settings.OAUTH_HTTP_RETRY_BACKOFF_SECONDS, attempt, 5.0)
+
+
+class OAuthHttpClient:
+    """
+    HTTP client facade used by the OAuth services.
+
+    Routes every request through the provider's pooled client and records
+    metrics under the provider's name.
+    """
+
+    def __init__(self, provider: str):
+        """
+        Initialize the client.
+
+        Args:
+            provider: Provider name (DISCORD, RACETIME or TWITCH)
+        """
+        self.provider = provider
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, retrying connection failures.
+
+        Responses are returned whatever their status; callers check it as
+        before.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed to httpx.AsyncClient (data, headers, timeout, ...)
+
+        Returns:
+            httpx.Response: The response
+
+        Raises:
+            httpx.HTTPError: If the request fails (after retries for
+                connection failures)
+        """
+        stats = _stats.setdefault(self.provider, _ProviderStats())
+        max_retries = settings.OAUTH_HTTP_CONNECT_RETRIES
+        send = getattr(_get_pooled_client(self.provider), method.lower())
+
+        for attempt in range(max_retries + 1):
+            if attempt:
+                stats.retries += 1
+            stats.requests += 1
+            started = time.perf_counter()
+            try:
+                response = await send(url, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                stats.latency.observe((time.perf_counter() - started) * 1000)
+                stats.errors += 1
+                if attempt >= max_retries:
+                    raise
+                logger.warning(
+                    "%s OAuth request to %s failed to connect (%s), retrying (%d/%d)",
+                    self.provider,
+                    url,
+                    type(e).__name__,
+                    attempt + 1,
+                    max_retries,
+                )
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+            except httpx.HTTPError:
+                stats.latency.observe((time.perf_counter() - started) * 1000)
+                stats.errors += 1
+                raise
+
+            stats.latency.observe((time.perf_counter() - started) * 1000)
+            if response.status_code >= 500:
+                stats.errors += 1
+            return response
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request (see request())."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request (see request())."""
+        return await self.request("POST", url, **kwargs)
+
+
+def get_oauth_client(provider: str) -> OAuthHttpClient:
+    """
+    Get the HTTP client for an OAuth provider.
+
+    Args:
+        provider: Provider name (DISCORD, RACETIME or TWITCH)
+
+    Returns:
+        OAuthHttpClient backed by the provider's pooled client
+    """
+    return OAuthHttpClient(provider)
+
+
+def get_oauth_http_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get request counters and latency histograms per OAuth provider.
+
+    Returns:
+        Dictionary of provider -> stats (requests, errors, retries, latency)
+    """
+    return {
+        provider: {
+            "requests": stats.requests,
+            "errors": stats.errors,
+            "retries": stats.retries,
+            "latency": stats.latency.snapshot(),
+        }
+        for provider, stats in sorted(_stats.items())
+    }
+
+
+async def close_oauth_clients() -> None:
+    """Close all pooled OAuth clients (called on application shutdown)."""
+    await _clients.close()
@@ -0,0 +1,115 @@
+"""
+Keyset pagination helpers.
+
+Cursors are opaque, URL-safe tokens encoding the sort key of the last row of
+a page (e.g. ``(scheduled_at, id)``). The next page is fetched with a
+``WHERE (sort_key) > (cursor)`` condition instead of OFFSET, so every page
+costs the same regardless of how deep the client has paged.
+"""
+
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Sequence
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode sort key values into an opaque cursor.
+
+    Args:
+        values: Sort key values of the last row (datetimes are ISO-encoded)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string
+        length: Expected number of sort key values
+
+    Returns:
+        List of sort key values (datetimes remain ISO strings)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def parse_cursor_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a datetime sort key value decoded from a cursor.
+
+    Args:
+        value: ISO datetime string or None
+
+    Returns:
+        datetime or None
+
+    Raises:
+        ValueError: If the value is not a valid ISO datetime
+    """
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError("Invalid cursor")
+    return datetime.fromisoformat(value)
+
+
+def weak_etag(parts: Iterable[Any]) -> str:
+    """
+    Build a weak ETag from the values that identify a response's content.
+
+    Args:
+        parts: Values that change whenever the response would change
+            (e.g. row IDs and updated_at timestamps plus the query)
+
+    Returns:
+        Weak ETag header value (W/"...")
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: If-None-Match request header value
+        etag: Current ETag
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
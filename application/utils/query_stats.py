@@ -0,0 +1,471 @@
+"""
+Process-wide SQL statistics.
+
+Every statement issued through the instrumented Tortoise connection (see
+install_query_counter() in request_scope.py) is recorded here under its
+fingerprint - the SQL with literals and placeholders replaced by ``?`` - with
+its count, latency distribution and the callers that issued it.
+
+The caller is the innermost ``query_caller`` label (a service method, a
+scheduled task), falling back to the request scope label (an API route or
+NiceGUI page, a Discord command). Statements slower than SLOW_QUERY_MS are
+logged, and an ``EXPLAIN`` of one such statement per fingerprint is captured
+in the background at most every QUERY_EXPLAIN_INTERVAL_SECONDS.
+
+Tests can assert query budgets:
+
+    with assert_max_queries(3):
+        await service.get_leaderboard(...)
+"""
+
+import asyncio
+import contextvars
+import logging
+import re
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from tortoise import Tortoise
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Latencies kept per fingerprint for percentiles
+LATENCY_SAMPLES = 512
+
+# Distinct fingerprints tracked; statements beyond this are grouped together
+MAX_FINGERPRINTS = 1000
+OVERFLOW_FINGERPRINT = "<other statements>"
+
+# Caller used outside any query_caller() or request scope
+UNSCOPED_CALLER = "unscoped"
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\$\d+|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUE_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """
+    Normalize a statement so executions with different values group together.
+
+    Literals and placeholders become ``?``, value lists (``IN (?, ?, ?)``,
+    multi-row ``VALUES``) collapse to one element and whitespace is collapsed.
+
+    Args:
+        sql: SQL statement
+
+    Returns:
+        Fingerprint string
+    """
+    normalized = _STRING_LITERAL.sub("?", sql)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?)", normalized)
+    normalized = _VALUE_ROWS.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class FingerprintStats:
+    """
+    Aggregated statistics of one statement fingerprint.
+
+    Attributes:
+        fingerprint: Normalized statement
+        count: Executions recorded
+        total_ms: Summed latency
+        max_ms: Slowest execution
+        slow_count: Executions slower than SLOW_QUERY_MS
+        callers: Executions per caller
+        example: Most recent raw statement
+        explain: Plan of a sampled slow execution (list of rows), if any
+    """
+
+    def __init__(self, fingerprint: str):
+        """
+        Initialize empty statistics.
+
+        Args:
+            fingerprint: Normalized statement
+        """
+        self.fingerprint = fingerprint
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow_count = 0
+        self.callers: Counter = Counter()
+        self.example = ""
+        self.explain: Optional[List[dict]] = None
+        self.explained_at = 0.0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    @property
+    def avg_ms(self) -> float:
+        """Mean latency."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        Latency percentile over the most recent executions.
+
+        Args:
+            pct: Percentile (0-100)
+
+        Returns:
+            Latency in milliseconds
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> dict:
+        """Convert to a dictionary for display."""
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.avg_ms, 2),
+            "p50_ms": round(self.percentile(50), 2),
+            "p95_ms": round(self.percentile(95), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "max_ms": round(self.max_ms, 2),
+            "slow_count": self.slow_count,
+            "callers": self.callers.most_common(5),
+            "example": self.example,
+            "explain": self.explain,
+        }
+
+
+class QueryStats:
+    """In-memory registry of statement statistics for this process."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._fingerprints: Dict[str, FingerprintStats] = {}
+        self._callers: Dict[str, List[float]] = {}  # caller -> [count, total_ms]
+        self.started_at = time.time()
+
+    def record(
+        self,
+        sql: str,
+        elapsed_ms: float,
+        caller: str,
+        values: Any = None,
+    ) -> FingerprintStats:
+        """
+        Record one executed statement.
+
+        Args:
+            sql: Statement as sent to the database
+            elapsed_ms: Execution time
+            caller: Who issued it (see current_caller())
+            values: Bound parameters (used to EXPLAIN slow statements)
+
+        Returns:
+            FingerprintStats: Statistics the statement was recorded under
+        """
+        key = fingerprint(sql)
+        stats = self._fingerprints.get(key)
+        if stats is None:
+            if len(self._fingerprints) >= MAX_FINGERPRINTS:
+                key = OVERFLOW_FINGERPRINT
+                stats = self._fingerprints.get(key)
+            if stats is None:
+                stats = self._fingerprints[key] = FingerprintStats(key)
+
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        stats.latencies.append(elapsed_ms)
+        stats.callers[caller] += 1
+        stats.example = sql
+
+        caller_totals = self._callers.setdefault(caller, [0, 0.0])
+        caller_totals[0] += 1
+        caller_totals[1] += elapsed_ms
+
+        if settings.SLOW_QUERY_MS and elapsed_ms >= settings.SLOW_QUERY_MS:
+            stats.slow_count += 1
+            logger.warning(
+                "Slow query (%.1fms) from %s: %s", elapsed_ms, caller, key[:500]
+            )
+            self._maybe_explain(stats, sql, values)
+        return stats
+
+    def _maybe_explain(self, stats: FingerprintStats, sql: str, values: Any) -> None:
+        """Capture the plan of a slow SELECT in the background (rate-limited)."""
+        if sql.lstrip()[:6].upper() != "SELECT":
+            return
+        now = time.monotonic()
+        if (
+            stats.explained_at
+            and now - stats.explained_at < settings.QUERY_EXPLAIN_INTERVAL_SECONDS
+        ):
+            return
+        stats.explained_at = now
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # A fresh context: not counted against the request, not recorded itself
+        loop.create_task(_explain(stats, sql, values), context=contextvars.Context())
+
+    def fingerprints(self, order_by: str = "total_ms", limit: int = 50) -> List[dict]:
+        """
+        Get per-fingerprint statistics, largest first.
+
+        Args:
+            order_by: to_dict() key to sort by (e.g. total_ms, count, p95_ms)
+            limit: Maximum number of fingerprints
+
+        Returns:
+            List of to_dict() results
+        """
+        rows = [stats.to_dict() for stats in self._fingerprints.values()]
+        rows.sort(key=lambda row: row[order_by], reverse=True)
+        return rows[:limit]
+
+    def callers(self, limit: int = 50) -> List[dict]:
+        """
+        Get per-caller totals, by total time.
+
+        Args:
+            limit: Maximum number of callers
+
+        Returns:
+            List of dicts with caller, count and total_ms
+        """
+        rows = [
+            {"caller": caller, "count": int(count), "total_ms": round(total, 2)}
+            for caller, (count, total) in self._callers.items()
+        ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:limit]
+
+    def slow_queries(self, limit: int = 20) -> List[dict]:
+        """
+        Get fingerprints that had slow executions, slowest first.
+
+        Args:
+            limit: Maximum number of fingerprints
+
+        Returns:
+            List of to_dict() results
+        """
+        rows = [
+            stats.to_dict() for stats in self._fingerprints.values() if stats.slow_count
+        ]
+        rows.sort(key=lambda row: row["max_ms"], reverse=True)
+        return rows[:limit]
+
+    def summary(self) -> dict:
+        """
+        Get totals since the last reset.
+
+        Returns:
+            Dict with statement count, total time, distinct fingerprints,
+            slow statement count and collection start time
+        """
+        stats = self._fingerprints.values()
+        return {
+            "count": sum(s.count for s in stats),
+            "total_ms": round(sum(s.total_ms for s in stats), 2),
+            "fingerprints": len(self._fingerprints),
+            "slow_count": sum(s.slow_count for s in stats),
+            "started_at": self.started_at,
+        }
+
+    def reset(self) -> None:
+        """Discard all statistics."""
+        self._fingerprints.clear()
+        self._callers.clear()
+        self.started_at = time.time()
+
+
+async def _explain(stats: FingerprintStats, sql: str, values: Any) -> None:
+    """Run EXPLAIN for a sampled slow statement and store the plan."""
+    _suppressed.set(True)
+    try:
+        # Not the issuing client: it may be a transaction that has since ended
+        connection = Tortoise.get_connection("default")
+        prefix = (
+            "EXPLAIN QUERY PLAN"
+            if connection.capabilities.dialect == "sqlite"
+            else "EXPLAIN"
+        )
+        rows = await connection.execute_query_dict(
+            f"{prefix} {sql}", list(values) if values else None
+        )
+        stats.explain = [dict(row) for row in rows]
+    except Exception as e:
+        logger.debug("Could not EXPLAIN slow query: %s", e)
+
+
+# Global registry
+_stats = QueryStats()
+
+_caller: ContextVar[Optional[str]] = ContextVar("query_caller", default=None)
+_suppressed: ContextVar[bool] = ContextVar("query_stats_suppressed", default=False)
+_recorders: ContextVar[Tuple["QueryRecorder", ...]] = ContextVar(
+    "query_recorders", default=()
+)
+
+
+def get_query_stats() -> QueryStats:
+    """Get the process-wide query statistics registry."""
+    return _stats
+
+
+def current_caller(scope_label: Optional[str] = None) -> str:
+    """
+    Get the caller statements are attributed to.
+
+    Args:
+        scope_label: Label of the active request scope, if any
+
+    Returns:
+        Innermost query_caller() label, else the scope label, else "unscoped"
+    """
+    return _caller.get() or scope_label or UNSCOPED_CALLER
+
+
+@contextmanager
+def query_caller(label: str) -> Iterator[None]:
+    """
+    Attribute statements issued in the enclosed code to ``label``.
+
+    Args:
+        label: Caller name (e.g. "task:Speedgaming Import")
+    """
+    token = _caller.set(label)
+    try:
+        yield
+    finally:
+        _caller.reset(token)
+
+
+def track_queries(func: Callable) -> Callable:
+    """
+    Decorator attributing an async function's statements to its qualified name.
+
+    Args:
+        func: Coroutine function (e.g. a service method)
+
+    Returns:
+        Wrapped coroutine function
+    """
+    label = func.__qualname__
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _caller.set(label)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _caller.reset(token)
+
+    return wrapper
+
+
+def record_query(
+    sql: Optional[str],
+    elapsed_ms: float,
+    scope_label: Optional[str] = None,
+    values: Any = None,
+) -> None:
+    """
+    Record a statement run by the instrumented connection.
+
+    Args:
+        sql: Statement text
+        elapsed_ms: Execution time
+        scope_label: Label of the active request scope, if any
+        values: Bound parameters
+    """
+    if _suppressed.get() or not isinstance(sql, str):
+        return
+    caller = current_caller(scope_label)
+    for recorder in _recorders.get():
+        recorder.queries.append((fingerprint(sql), sql, elapsed_ms))
+    if settings.QUERY_STATS_ENABLED:
+        _stats.record(sql, elapsed_ms, caller, values)
+
+
+class QueryRecorder:
+    """
+    Statements issued while capture_queries() is active.
+
+    Attributes:
+        queries: (fingerprint, sql, elapsed_ms) per statement, in order
+    """
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self.queries: List[Tuple[str, str, float]] = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements captured."""
+        return len(self.queries)
+
+    def by_fingerprint(self) -> Counter:
+        """Statement counts per fingerprint."""
+        return Counter(fp for fp, _, _ in self.queries)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryRecorder]:
+    """
+    Capture the statements issued in the enclosed code (and tasks it starts).
+
+    Yields:
+        QueryRecorder: Filled as statements run
+    """
+    recorder = QueryRecorder()
+    token = _recorders.set(_recorders.get() + (recorder,))
+    try:
+        yield recorder
+    finally:
+        _recorders.reset(token)
+
+
+@contextmanager
+def assert_max_queries(budget: int) -> Iterator[QueryRecorder]:
+    """
+    Fail if the enclosed code issues more than ``budget`` statements.
+
+    The failure message lists the repeated fingerprints, which usually point
+    straight at an N+1 pattern.
+
+    Args:
+        budget: Maximum number of statements
+
+    Yields:
+        QueryRecorder: The captured statements
+
+    Raises:
+        AssertionError: If the budget is exceeded
+    """
+    with capture_queries() as recorder:
+        yield recorder
+
+    if recorder.count > budget:
+        lines = [
+            f"  {count}x {fp[:200]}"
+            for fp, count in recorder.by_fingerprint().most_common(10)
+        ]
+        raise AssertionError(
+            f"Issued {recorder.count} queries (budget {budget}):\n" + "\n".join(lines)
+        )
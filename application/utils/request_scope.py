@@ -0,0 +1,238 @@
+"""
+Request-scoped identity cache and query counter.
+
+A single page render or API request looks up the same User, OrganizationMember
+and role rows many times (current user, membership checks, every policy
+evaluation). A RequestScope, bound to a contextvar for the duration of one
+HTTP request, memoizes those lookups so each row is loaded at most once per
+request, and counts the SQL statements the request issues. Every statement is
+also timed and recorded in the process-wide query statistics (query_stats.py).
+
+Outside a scope (websocket event handlers, background tasks, the bot) lookups
+go straight to the loader, so nothing is ever cached longer than one request.
+
+Usage:
+    user = await scoped_get("user", user_id, lambda: User.get_or_none(id=user_id))
+
+    with request_scope("test") as scope:
+        ...
+    assert scope.query_count <= 5
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional
+
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from application.utils.query_stats import record_query
+
+logger = logging.getLogger(__name__)
+
+# Client methods that send a statement to the database
+_QUERY_METHODS = (
+    "execute_query",
+    "execute_query_dict",
+    "execute_insert",
+    "execute_many",
+    "execute_script",
+)
+
+
+class RequestScope:
+    """
+    Per-request memo of identity lookups plus a SQL statement counter.
+
+    Attributes:
+        label: What the scope covers (e.g. "GET /org/1")
+        query_count: SQL statements issued while the scope was active
+        cache_hits: Lookups answered from the scope instead of the database
+        cache_misses: Lookups that went to the database
+    """
+
+    def __init__(self, label: str = ""):
+        """
+        Initialize an empty scope.
+
+        Args:
+            label: What the scope covers (used in logs)
+        """
+        self.label = label
+        self.query_count = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.closed = False
+        self._started = time.perf_counter()
+        self._entries: Dict[tuple, Any] = {}
+
+    @property
+    def elapsed_ms(self) -> int:
+        """Milliseconds since the scope was opened."""
+        return int((time.perf_counter() - self._started) * 1000)
+
+    def invalidate(self, namespace: str, key: Optional[Hashable] = None) -> None:
+        """
+        Drop memoized lookups.
+
+        Args:
+            namespace: Lookup namespace (e.g. "user", "org_member")
+            key: Key within the namespace (None drops the whole namespace)
+        """
+        if key is not None:
+            self._entries.pop((namespace, key), None)
+            return
+        for entry in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[entry]
+
+
+_current_scope: ContextVar[Optional[RequestScope]] = ContextVar(
+    "request_scope", default=None
+)
+
+
+def get_request_scope() -> Optional[RequestScope]:
+    """
+    Get the active request scope.
+
+    Returns:
+        The open RequestScope, or None outside a request
+    """
+    scope = _current_scope.get()
+    if scope is None or scope.closed:
+        return None
+    return scope
+
+
+@contextmanager
+def request_scope(label: str = "") -> Iterator[RequestScope]:
+    """
+    Open a request scope for the enclosed code.
+
+    Tasks created inside inherit the scope; it is closed on exit so timers and
+    background work started during a render stop using it afterwards.
+
+    Args:
+        label: What the scope covers (used in logs)
+
+    Yields:
+        RequestScope: The new scope
+    """
+    scope = RequestScope(label)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        scope.closed = True
+        _current_scope.reset(token)
+
+
+async def scoped_get(
+    namespace: str, key: Hashable, loader: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Load a value at most once per request scope.
+
+    None results are memoized too (e.g. "not a member").
+
+    Args:
+        namespace: Lookup namespace (e.g. "user", "org_member")
+        key: Key within the namespace
+        loader: Coroutine factory that loads the value
+
+    Returns:
+        The memoized or freshly loaded value
+    """
+    scope = get_request_scope()
+    if scope is None:
+        return await loader()
+
+    entry = (namespace, key)
+    if entry in scope._entries:
+        scope.cache_hits += 1
+        return scope._entries[entry]
+
+    scope.cache_misses += 1
+    value = await loader()
+    scope._entries[entry] = value
+    return value
+
+
+def invalidate_scoped(namespace: str, key: Optional[Hashable] = None) -> None:
+    """
+    Drop memoized lookups from the active scope (no-op outside a request).
+
+    Call after writes that change a memoized row.
+
+    Args:
+        namespace: Lookup namespace
+        key: Key within the namespace (None drops the whole namespace)
+    """
+    scope = get_request_scope()
+    if scope is not None:
+        scope.invalidate(namespace, key)
+
+
+# Set while a counted client call runs, so delegating methods
+# (e.g. execute_query_dict -> execute_query) count once
+_in_query: ContextVar[bool] = ContextVar("request_scope_in_query", default=False)
+
+
+def _counted(method: Callable) -> Callable:
+    """Wrap a client method to count it against the active scope and time it."""
+
+    @wraps(method)
+    async def wrapper(*args, **kwargs):
+        if _in_query.get():
+            return await method(*args, **kwargs)
+        scope = get_request_scope()
+        if scope is not None:
+            scope.query_count += 1
+        token = _in_query.set(True)
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _in_query.reset(token)
+            record_query(
+                args[1] if len(args) > 1 else kwargs.get("query", kwargs.get("sql")),
+                (time.perf_counter() - started) * 1000,
+                scope.label if scope is not None else None,
+                args[2] if len(args) > 2 else kwargs.get("values"),
+            )
+
+    wrapper._request_scope_counted = True
+    return wrapper
+
+
+def _client_classes(root: type) -> Iterator[type]:
+    """Yield a client class and all of its subclasses."""
+    yield root
+    for subclass in root.__subclasses__():
+        yield from _client_classes(subclass)
+
+
+def install_query_counter(connection: Optional[BaseDBAsyncClient] = None) -> None:
+    """
+    Count SQL statements issued through a Tortoise connection.
+
+    Patches the connection's client class (and its transaction subclasses);
+    safe to call more than once.
+
+    Args:
+        connection: Connection to instrument (default: the "default" connection)
+    """
+    if connection is None:
+        connection = Tortoise.get_connection("default")
+
+    for client_class in _client_classes(type(connection)):
+        for name in _QUERY_METHODS:
+            method = client_class.__dict__.get(name)
+            if method is None or getattr(method, "_request_scope_counted", False):
+                continue
+            setattr(client_class, name, _counted(method))
+
+    logger.debug("Request query counter installed on %s", type(connection).__name__)
@@ -0,0 +1,106 @@
+"""
+Startup profiling.
+
+Records how long each application startup phase takes (imports, database,
+Discord bot, scheduler, ...) and the time until the first successful
+/api/health response, which is the number that matters when the app is
+restarted in the middle of an event.
+
+Phases are recorded with checkpoint(): each checkpoint measures the time
+since the previous one. The profile is logged when startup completes and
+included in the health check response.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """Per-phase startup timings for this process."""
+
+    def __init__(self, started_at: Optional[float] = None):
+        """
+        Initialize the profile.
+
+        Args:
+            started_at: time.monotonic() value startup is measured from
+                (default: now)
+        """
+        self.started_at = time.monotonic() if started_at is None else started_at
+        self._last = self.started_at
+        self.phases: List[Tuple[str, float]] = []
+        self.ready_ms: Optional[int] = None
+        self.first_health_ok_ms: Optional[int] = None
+
+    def checkpoint(self, name: str) -> float:
+        """
+        Record a phase ending now (it began at the previous checkpoint).
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Phase duration in milliseconds
+        """
+        now = time.monotonic()
+        duration_ms = (now - self._last) * 1000
+        self._last = now
+        self.phases.append((name, duration_ms))
+        logger.info("Startup phase %s took %.0fms", name, duration_ms)
+        return duration_ms
+
+    def mark_ready(self) -> None:
+        """Record that startup has finished and log the profile."""
+        self.ready_ms = self._elapsed_ms()
+        logger.info(
+            "Startup complete in %dms (%s)",
+            self.ready_ms,
+            ", ".join(f"{name}={ms:.0f}ms" for name, ms in self.phases),
+        )
+
+    def record_health_ok(self) -> None:
+        """Record the first successful health check (only the first counts)."""
+        if self.first_health_ok_ms is not None:
+            return
+        self.first_health_ok_ms = self._elapsed_ms()
+        target_ms = settings.STARTUP_HEALTH_TARGET_SECONDS * 1000
+        if target_ms and self.first_health_ok_ms > target_ms:
+            logger.warning(
+                "First healthy response after %dms (target %dms)",
+                self.first_health_ok_ms,
+                target_ms,
+            )
+        else:
+            logger.info("First healthy response after %dms", self.first_health_ok_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the profile as a JSON-serializable dict.
+
+        Returns:
+            Dict with phases (name -> ms), ready_ms and first_health_ok_ms
+        """
+        return {
+            "phases": {name: round(ms) for name, ms in self.phases},
+            "ready_ms": self.ready_ms,
+            "first_health_ok_ms": self.first_health_ok_ms,
+            "target_ms": round(settings.STARTUP_HEALTH_TARGET_SECONDS * 1000),
+        }
+
+    def _elapsed_ms(self) -> int:
+        """Milliseconds since startup began."""
+        return int((time.monotonic() - self.started_at) * 1000)
+
+
+# Global profile, created when main.py first imports this module
+_profile = StartupProfile()
+
+
+def get_startup_profile() -> StartupProfile:
+    """Get the startup profile for this process."""
+    return _profile
@@ -0,0 +1,142 @@
+"""
+Versioned in-process read cache.
+
+For rows that are read on nearly every request but rarely written (global and
+organization settings, feature flags). Entries are grouped into partitions
+(e.g. "global", or an organization ID); each partition has a version that is
+bumped on invalidation. A load records the version it started under and is
+only stored if no invalidation happened meanwhile, so a read racing a write
+can never re-populate the cache with the old value.
+
+Writes made through this process invalidate immediately; entries also expire
+after a TTL so edits made by other processes (or directly in the database)
+are picked up eventually.
+"""
+
+import logging
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# All caches, so tests and admin tooling can reset them together
+_registry: "weakref.WeakSet[VersionedCache]" = weakref.WeakSet()
+
+
+class VersionedCache:
+    """
+    Partitioned TTL cache with version-checked loads.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            name: Cache name (used in logs and stats)
+            ttl_seconds: Seconds before an entry is reloaded (0 disables caching)
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[Hashable, Hashable], Tuple[tuple, float, Any]] = {}
+        self._versions: Dict[Hashable, int] = {}
+        self._epoch = 0  # Bumped by clear(), invalidates every partition
+        self._hits = 0
+        self._misses = 0
+        _registry.add(self)
+
+    async def get_or_load(
+        self,
+        partition: Hashable,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Get a cached value, loading it on a miss.
+
+        Args:
+            partition: Invalidation group the key belongs to
+            key: Key within the partition
+            loader: Coroutine factory that loads the value
+
+        Returns:
+            The cached or freshly loaded value (None is cached too)
+        """
+        if self.ttl_seconds <= 0:
+            return await loader()
+
+        version = self._version(partition)
+        entry = self._entries.get((partition, key))
+        if entry is not None:
+            entry_version, expires_at, value = entry
+            if entry_version == version and time.monotonic() < expires_at:
+                self._hits += 1
+                return value
+
+        self._misses += 1
+        value = await loader()
+        # Only store if nothing invalidated the partition while loading
+        if self._version(partition) == version:
+            self._entries[(partition, key)] = (
+                version,
+                time.monotonic() + self.ttl_seconds,
+                value,
+            )
+        return value
+
+    def invalidate(self, partition: Hashable) -> None:
+        """
+        Invalidate every entry in a partition.
+
+        Args:
+            partition: Invalidation group to drop
+        """
+        self._versions[partition] = self._versions.get(partition, 0) + 1
+        for entry in [k for k in self._entries if k[0] == partition]:
+            del self._entries[entry]
+        logger.debug("Invalidated %s cache partition %s", self.name, partition)
+
+    def clear(self) -> None:
+        """Invalidate every partition."""
+        self._epoch += 1
+        self._entries.clear()
+
+    def _version(self, partition: Hashable) -> tuple:
+        """Current version of a partition."""
+        return (self._epoch, self._versions.get(partition, 0))
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entry count, hits, misses and TTL
+        """
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+def clear_all_caches() -> None:
+    """Clear every VersionedCache in the process."""
+    for cache in list(_registry):
+        cache.clear()
+
+
+def get_all_cache_stats() -> list[dict]:
+    """
+    Get statistics for every VersionedCache in the process.
+
+    Returns:
+        List of per-cache stats dicts, sorted by name
+    """
+    return sorted(
+        (cache.get_stats() for cache in list(_registry)), key=lambda s: s["name"]
+    )
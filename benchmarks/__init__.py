@@ -0,0 +1 @@
+"""Benchmarks for hot service paths (run with: pytest benchmarks)."""
@@ -0,0 +1,180 @@
+"""
+Benchmark configuration and fixtures.
+
+Run with:
+    python -m pytest benchmarks
+    python -m pytest benchmarks --benchmark-update     # rewrite baselines
+    python -m pytest benchmarks --benchmark-snapshot snapshots/production.db
+"""
+
+from pathlib import Path
+from typing import AsyncGenerator, List
+
+import pytest
+from tortoise import Tortoise
+
+from application.utils.request_scope import install_query_counter
+from application.utils.versioned_cache import clear_all_caches
+from benchmarks.dataset import DEFAULT_DATASET, build_snapshot
+from benchmarks.runner import (
+    DEFAULT_ROUNDS,
+    DEFAULT_WARMUP,
+    TOLERANCE_ENV,
+    BenchmarkResult,
+    load_baselines,
+    run_benchmark,
+    save_baselines,
+    tolerance_from_env,
+)
+from config import settings
+from migrations.tortoise_config import get_model_modules
+from tools.generate_mock_data import import_snapshot
+
+# Results of this session, reported in the terminal summary
+_results: List[BenchmarkResult] = []
+
+
+def pytest_addoption(parser):
+    """Register benchmark command line options."""
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-update",
+        action="store_true",
+        default=False,
+        help="Store this run's results as the new baselines",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=None,
+        help="Fail when median wall time exceeds the baseline by this factor "
+        f"(default: {TOLERANCE_ENV}, else wall time is only reported)",
+    )
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=DEFAULT_ROUNDS,
+        help=f"Measured rounds per benchmark (default: {DEFAULT_ROUNDS})",
+    )
+    group.addoption(
+        "--benchmark-snapshot",
+        default=None,
+        help="SQLite snapshot from tools/generate_mock_data.py --export-snapshot "
+        "to run against instead of the built-in dataset",
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """Mark every test in this directory as a benchmark."""
+    for item in items:
+        if Path(str(item.fspath)).parent == Path(__file__).parent:
+            item.add_marker(pytest.mark.benchmark)
+
+
+def _dataset_label(config) -> str:
+    """Label of the dataset in baselines.json."""
+    snapshot = config.getoption("--benchmark-snapshot")
+    return Path(snapshot).stem if snapshot else DEFAULT_DATASET
+
+
+@pytest.fixture(scope="session")
+def dataset_snapshot(request, tmp_path_factory) -> Path:
+    """
+    SQLite snapshot every benchmark starts from.
+
+    Benchmarks run on the SQLite test configuration; they are skipped when
+    the configured database is not SQLite.
+    """
+    if not settings.database_url.startswith("sqlite://"):
+        pytest.skip("Benchmarks require the SQLite test database configuration")
+
+    snapshot = request.config.getoption("--benchmark-snapshot")
+    if snapshot:
+        return Path(snapshot)
+    return build_snapshot(tmp_path_factory.mktemp("benchmark") / "dataset.db")
+
+
+@pytest.fixture
+async def bench_db(dataset_snapshot, tmp_path) -> AsyncGenerator:
+    """Initialize Tortoise on a fresh copy of the benchmark dataset."""
+    db_url = f"sqlite://{tmp_path / 'benchmark.db'}"
+    import_snapshot(dataset_snapshot, db_url)
+    await Tortoise.init(
+        db_url=db_url,
+        modules={"models": get_model_modules()},
+        use_tz=True,
+        timezone="UTC",
+    )
+    install_query_counter()
+    clear_all_caches()
+
+    yield
+
+    await Tortoise.close_connections()
+
+
+@pytest.fixture
+def benchmark(request, bench_db):
+    """
+    Measure an async callable and compare it against its baseline.
+
+    Usage:
+        result = await benchmark("service.method", lambda: service.method(...))
+    """
+    config = request.config
+    baselines = load_baselines().get(_dataset_label(config), {})
+
+    async def run(name, func, setup=None, rounds=None, warmup=DEFAULT_WARMUP):
+        result = await run_benchmark(
+            name,
+            func,
+            rounds=rounds or config.getoption("--benchmark-rounds"),
+            warmup=warmup,
+            setup=setup,
+        )
+        result.baseline = baselines.get(name)
+        _results.append(result)
+        if not config.getoption("--benchmark-update"):
+            tolerance = config.getoption("--benchmark-tolerance")
+            if tolerance is None:
+                tolerance = tolerance_from_env()
+            failures = result.compare(tolerance)
+            if failures:
+                pytest.fail("; ".join(failures))
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session):
+    """Store baselines when running with --benchmark-update."""
+    if _results and session.config.getoption("--benchmark-update"):
+        save_baselines(_dataset_label(session.config), _results)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print a table of benchmark results."""
+    if not _results:
+        return
+    terminalreporter.section(f"benchmarks ({_dataset_label(config)} dataset)")
+    terminalreporter.write_line(
+        f"{'benchmark':<50} {'median ms':>10} {'min ms':>10} {'queries':>8} "
+        f"{'base ms':>10} {'base q':>7}  status"
+    )
+    for result in _results:
+        baseline = result.baseline or {}
+        if config.getoption("--benchmark-update"):
+            status = "updated"
+        elif not baseline:
+            status = "new"
+        else:
+            status = (
+                "REGRESSED"
+                if result.failures
+                else "slower" if result.slower else "ok"
+            )
+        terminalreporter.write_line(
+            f"{result.name:<50} {result.median_ms:>10.1f} {result.min_ms:>10.1f} "
+            f"{result.queries:>8} {baseline.get('median_ms', '-'):>10} "
+            f"{baseline.get('queries', '-'):>7}  {status}"
+        )
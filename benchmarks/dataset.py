@@ -0,0 +1,95 @@
+"""
+Benchmark dataset.
+
+Benchmarks run against a deterministic dataset generated once per session
+with tools/generate_mock_data.py and saved as a SQLite snapshot; every
+benchmark then starts from a fresh copy of that snapshot. A larger dataset
+(e.g. the "production" preset) can be used instead with --benchmark-snapshot.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from models import OrganizationMember, Permission, User
+from tools.generate_mock_data import (
+    MockDataGenerator,
+    close_db,
+    export_snapshot,
+    init_db,
+)
+
+# Label of the built-in dataset in baselines.json
+DEFAULT_DATASET = "default"
+
+# Generator configuration of the built-in dataset (changing it invalidates
+# the stored baselines)
+DATASET_CONFIG = {
+    "num_users": 500,
+    "num_orgs": 3,
+    "num_tournaments": 6,
+    "num_async_tournaments": 3,
+    "num_matches_per_tournament": 60,
+    "max_racers_per_permalink": 80,
+    "seed": 42,
+}
+
+# Fixed "now" so generated schedules do not depend on the day the suite runs
+REFERENCE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+async def _generate(snapshot: Path) -> None:
+    """Generate the built-in dataset into a SQLite file and export it."""
+    work_file = snapshot.with_name(snapshot.stem + ".work.db")
+    db_url = f"sqlite://{work_file}"
+    await init_db(db_url)
+    try:
+        counts = await MockDataGenerator(
+            reference_time=REFERENCE_TIME, **DATASET_CONFIG
+        ).generate_all(print_summary=False)
+    finally:
+        await close_db()
+    export_snapshot(db_url, snapshot, metadata={**DATASET_CONFIG, "rows": counts})
+    work_file.unlink()
+
+
+def build_snapshot(snapshot: Path) -> Path:
+    """
+    Generate the built-in dataset and save it as a snapshot.
+
+    Runs on a private event loop so it can be called from a synchronous
+    session fixture.
+
+    Args:
+        snapshot: Snapshot file to write
+
+    Returns:
+        The snapshot path
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_generate(snapshot))
+    finally:
+        loop.close()
+    return snapshot
+
+
+async def find_member(organization_id: int, admin: bool = False) -> Optional[User]:
+    """
+    Find a deterministic member of an organization.
+
+    Args:
+        organization_id: Organization ID
+        admin: Whether to pick a global admin (otherwise a regular user)
+
+    Returns:
+        The member with the lowest membership ID, or None
+    """
+    query = OrganizationMember.filter(organization_id=organization_id)
+    if admin:
+        query = query.filter(user__permission__gte=Permission.ADMIN)
+    else:
+        query = query.filter(user__permission=Permission.USER)
+    member = await query.order_by("id").prefetch_related("user").first()
+    return member.user if member else None
@@ -0,0 +1,193 @@
+"""
+Benchmark runner and baselines.
+
+Each benchmark awaits a callable for a number of rounds (after warm-up
+rounds that are not measured). Every round runs in its own request scope,
+like one page load or API request, so the SQL statements it issues are
+counted. Results are compared against benchmarks/baselines.json:
+
+- query count must not exceed the baseline (query counts are deterministic
+  on a fixed dataset, so any increase is a real regression)
+- median wall time is reported next to the baseline but only fails the run
+  when a wall time tolerance is given (--benchmark-tolerance or the
+  BENCHMARK_WALL_TIME_TOLERANCE environment variable), since wall times
+  depend on the machine; use it on dedicated benchmark hardware
+"""
+
+import inspect
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from application.utils.request_scope import request_scope
+
+BASELINES_FILE = Path(__file__).parent / "baselines.json"
+
+# Median wall time may be this many times the baseline before it is reported
+# as slower (and fails the run, when a tolerance is given)
+DEFAULT_TOLERANCE = 2.0
+
+# Environment variable enabling wall time gating with the given tolerance
+TOLERANCE_ENV = "BENCHMARK_WALL_TIME_TOLERANCE"
+
+# Slack for sub-millisecond benchmarks, where the tolerance factor is noise
+NOISE_FLOOR_MS = 1.0
+
+DEFAULT_ROUNDS = 5
+DEFAULT_WARMUP = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings and query counts of one benchmark."""
+
+    name: str
+    timings_ms: List[float]
+    query_counts: List[int]
+    baseline: Optional[Dict[str, Any]] = None
+    failures: List[str] = field(default_factory=list)
+    slower: Optional[str] = None  # Wall time note when not gated
+
+    @property
+    def median_ms(self) -> float:
+        """Median wall time per round."""
+        return statistics.median(self.timings_ms)
+
+    @property
+    def min_ms(self) -> float:
+        """Fastest round."""
+        return min(self.timings_ms)
+
+    @property
+    def queries(self) -> int:
+        """Most SQL statements issued by a single round."""
+        return max(self.query_counts)
+
+    def as_baseline(self) -> Dict[str, Any]:
+        """Get the values stored in baselines.json."""
+        return {"median_ms": round(self.median_ms, 2), "queries": self.queries}
+
+    def compare(self, tolerance: Optional[float] = None) -> List[str]:
+        """
+        Compare against the stored baseline.
+
+        Args:
+            tolerance: Allowed factor between median wall time and baseline;
+                None only reports a slower wall time in self.slower
+
+        Returns:
+            Regression messages (empty if within the baseline)
+        """
+        self.failures = []
+        self.slower = None
+        if not self.baseline:
+            return self.failures
+        if self.queries > self.baseline["queries"]:
+            self.failures.append(
+                f"{self.name}: {self.queries} queries "
+                f"(baseline {self.baseline['queries']})"
+            )
+        limit_ms = max(
+            self.baseline["median_ms"] * (tolerance or DEFAULT_TOLERANCE),
+            self.baseline["median_ms"] + NOISE_FLOOR_MS,
+        )
+        if self.median_ms > limit_ms:
+            message = (
+                f"{self.name}: median {self.median_ms:.1f}ms exceeds "
+                f"{limit_ms:.1f}ms (baseline {self.baseline['median_ms']:.1f}ms)"
+            )
+            if tolerance is None:
+                self.slower = message
+            else:
+                self.failures.append(message)
+        return self.failures
+
+
+def tolerance_from_env() -> Optional[float]:
+    """
+    Get the wall time tolerance from the environment.
+
+    Returns:
+        Tolerance factor, or None if wall time gating is not enabled
+    """
+    value = os.environ.get(TOLERANCE_ENV)
+    return float(value) if value else None
+
+
+def load_baselines(path: Path = BASELINES_FILE) -> Dict[str, Dict[str, Any]]:
+    """
+    Load stored baselines.
+
+    Args:
+        path: Baselines file
+
+    Returns:
+        Mapping of dataset label to benchmark name to baseline values
+    """
+    if not path.is_file():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baselines(
+    dataset: str, results: List[BenchmarkResult], path: Path = BASELINES_FILE
+) -> None:
+    """
+    Store this run's results as the baselines for a dataset.
+
+    Baselines of benchmarks that did not run are kept.
+
+    Args:
+        dataset: Dataset label
+        results: Benchmark results
+        path: Baselines file
+    """
+    baselines = load_baselines(path)
+    entries = baselines.setdefault(dataset, {})
+    for result in results:
+        entries[result.name] = result.as_baseline()
+    baselines[dataset] = dict(sorted(entries.items()))
+    path.write_text(
+        json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+async def run_benchmark(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    rounds: int = DEFAULT_ROUNDS,
+    warmup: int = DEFAULT_WARMUP,
+    setup: Optional[Callable[[], Any]] = None,
+) -> BenchmarkResult:
+    """
+    Time an async callable and count its queries.
+
+    Args:
+        name: Benchmark name (key in baselines.json)
+        func: Coroutine factory to measure
+        rounds: Measured rounds
+        warmup: Unmeasured rounds run first
+        setup: Called (and awaited if async) before every round, untimed
+
+    Returns:
+        BenchmarkResult with per-round timings and query counts
+    """
+    timings: List[float] = []
+    query_counts: List[int] = []
+    for round_number in range(warmup + rounds):
+        if setup is not None:
+            value = setup()
+            if inspect.isawaitable(value):
+                await value
+        with request_scope(f"benchmark:{name}") as scope:
+            started = time.perf_counter()
+            await func()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        if round_number >= warmup:
+            timings.append(elapsed_ms)
+            query_counts.append(scope.query_count)
+    return BenchmarkResult(name=name, timings_ms=timings, query_counts=query_counts)
@@ -0,0 +1,22 @@
+"""Benchmarks for async qualifier reads."""
+
+from application.services.async_qualifiers.async_qualifier_service import (
+    AsyncQualifierService,
+)
+from benchmarks.dataset import find_member
+from models import AsyncQualifier
+
+
+async def test_get_leaderboard(benchmark):
+    """Leaderboard of the first qualifier, viewed by a regular member."""
+    qualifier = await AsyncQualifier.all().order_by("id").first()
+    viewer = await find_member(qualifier.organization_id)
+    service = AsyncQualifierService()
+
+    result = await benchmark(
+        "async_qualifier.get_leaderboard",
+        lambda: service.get_leaderboard(
+            viewer, qualifier.organization_id, qualifier.id
+        ),
+    )
+    assert result.queries > 0
@@ -0,0 +1,56 @@
+"""Benchmarks for authorization checks."""
+
+from application.authorization.policy_cache import get_cache
+from application.authorization.policy_engine import AuthorizationContext, PolicyEngine
+from application.services.authorization.ui_authorization_helper import (
+    UIAuthorizationHelper,
+)
+from benchmarks.dataset import find_member
+from models import Tournament
+
+
+async def _member_context() -> AuthorizationContext:
+    """Tournament update check for a regular member of the first organization."""
+    tournament = await Tournament.all().order_by("id").first()
+    member = await find_member(tournament.organization_id)
+    return AuthorizationContext(
+        user_id=member.id,
+        action="tournament:update",
+        resource=f"tournament:{tournament.id}",
+        organization_id=tournament.organization_id,
+    )
+
+
+async def test_policy_engine_evaluate(benchmark):
+    """Uncached evaluation (membership, roles and policies loaded every round)."""
+    context = await _member_context()
+
+    await benchmark(
+        "policy_engine.evaluate",
+        lambda: PolicyEngine().evaluate(context),
+    )
+
+
+async def test_policy_engine_evaluate_cached(benchmark):
+    """Evaluation answered from the policy cache."""
+    context = await _member_context()
+    engine = PolicyEngine()
+
+    result = await benchmark(
+        "policy_engine.evaluate_cached",
+        lambda: engine.evaluate(context),
+    )
+    assert result.queries == 0
+
+
+async def test_get_organization_permissions(benchmark):
+    """Every UI permission flag for a regular member, with a cold policy cache."""
+    tournament = await Tournament.all().order_by("id").first()
+    member = await find_member(tournament.organization_id)
+    helper = UIAuthorizationHelper()
+
+    await benchmark(
+        "ui_authorization.get_organization_permissions",
+        lambda: helper.get_organization_permissions(member, tournament.organization_id),
+        setup=get_cache().clear,
+    )
@@ -0,0 +1,26 @@
+"""Benchmarks for event dispatch through the registered listeners."""
+
+from application.events import EventBus
+from application.events.types import MatchScheduledEvent
+from models import Match, MatchPlayers
+
+# Importing the listeners registers them, as at application startup
+import application.events.listeners  # noqa: F401
+
+
+async def test_emit_match_scheduled(benchmark):
+    """MatchScheduledEvent through the notification and Discord listeners."""
+    match = await Match.all().order_by("id").prefetch_related("tournament").first()
+    participant_ids = await MatchPlayers.filter(match_id=match.id).values_list(
+        "user_id", flat=True
+    )
+    event = MatchScheduledEvent(
+        user_id=participant_ids[0],
+        organization_id=match.tournament.organization_id,
+        entity_id=match.id,
+        tournament_id=match.tournament_id,
+        scheduled_time=match.scheduled_at.isoformat() if match.scheduled_at else None,
+        participant_ids=list(participant_ids),
+    )
+
+    await benchmark("event_bus.emit.match_scheduled", lambda: EventBus.emit(event))
@@ -0,0 +1,41 @@
+"""Benchmarks for notification queueing."""
+
+from application.services.notifications.notification_service import (
+    NotificationService,
+)
+from models import Organization, OrganizationMember
+from models.notification_subscription import (
+    NotificationEventType,
+    NotificationMethod,
+    NotificationSubscription,
+)
+
+
+async def test_queue_broadcast_notification(benchmark):
+    """Tournament-created broadcast to every member of an organization."""
+    organization = await Organization.all().order_by("id").first()
+    user_ids = await OrganizationMember.filter(
+        organization_id=organization.id
+    ).values_list("user_id", flat=True)
+    await NotificationSubscription.bulk_create(
+        [
+            NotificationSubscription(
+                user_id=user_id,
+                event_type=NotificationEventType.TOURNAMENT_CREATED,
+                notification_method=NotificationMethod.DISCORD_DM,
+                organization_id=organization.id,
+            )
+            for user_id in user_ids
+        ]
+    )
+    service = NotificationService()
+
+    result = await benchmark(
+        "notification_service.queue_broadcast_notification",
+        lambda: service.queue_broadcast_notification(
+            event_type=NotificationEventType.TOURNAMENT_CREATED,
+            event_data={"tournament_name": "Benchmark Cup", "tournament_id": 1},
+            organization_id=organization.id,
+        ),
+    )
+    assert result.queries > 0
@@ -0,0 +1,35 @@
+"""Benchmarks for RaceTime race handlers replaying a large race."""
+
+from models import Match
+from racetime.handler_metrics import get_race_handler_metrics
+from racetime.handlers.alttpr_handler import ALTTPRRaceHandler
+from racetime.handlers.base_handler import SahaRaceHandler
+from racetime.handlers.match_race_handler import create_match_handler_class
+from racetime.replay import generate_race_frames, replay_frames
+
+# Importing the listeners registers them, as at application startup
+import application.events.listeners  # noqa: F401
+
+# 60 entrants joining, 150 ready/not ready flips, start, 60 finishes
+FRAMES = generate_race_frames(entrants=60, status_flips=150, seed=1)
+
+
+async def test_replay_race(benchmark):
+    """A full race's race.data frames through SahaRaceHandler."""
+    get_race_handler_metrics().reset()
+
+    await benchmark(
+        "race_handler.replay_race", lambda: replay_frames(SahaRaceHandler, FRAMES)
+    )
+
+
+async def test_replay_match_race(benchmark):
+    """A full race's race.data frames through a match handler, with finish."""
+    get_race_handler_metrics().reset()
+    match = await Match.all().order_by("id").first()
+    handler_class = create_match_handler_class(ALTTPRRaceHandler)
+
+    await benchmark(
+        "race_handler.replay_match_race",
+        lambda: replay_frames(handler_class, FRAMES, match_id=match.id),
+    )
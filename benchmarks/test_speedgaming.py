@@ -0,0 +1,99 @@
+"""Benchmarks for the SpeedGaming import (with a stubbed API)."""
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from application.services.speedgaming.speedgaming_etl_service import (
+    SpeedGamingETLService,
+)
+from application.services.speedgaming.speedgaming_service import SpeedGamingEpisode
+from models import OrganizationMember, Tournament
+
+# Episodes returned by the stubbed schedule endpoint
+EPISODE_COUNT = 25
+
+
+class StubSpeedGamingService:
+    """Serves a fixed schedule instead of calling the SpeedGaming API."""
+
+    def __init__(self, episodes: List[SpeedGamingEpisode]):
+        self.episodes = {episode.id: episode for episode in episodes}
+
+    async def get_upcoming_episodes_by_event(
+        self, event_slug: str, from_datetime=None, to_datetime=None
+    ) -> List[SpeedGamingEpisode]:
+        return list(self.episodes.values())
+
+    async def get_episode(self, episode_id: int) -> Optional[SpeedGamingEpisode]:
+        return self.episodes.get(episode_id)
+
+
+def _person(sg_id: int, user) -> dict:
+    """API representation of a player or crew member."""
+    return {
+        "id": sg_id,
+        "displayName": user.discord_username,
+        "discordId": str(user.discord_id),
+        "discordTag": user.discord_username,
+        "publicStream": user.discord_username,
+        "streamingFrom": user.discord_username,
+        "approved": True,
+        "ready": True,
+        "language": "en",
+    }
+
+
+def _episodes(users: list) -> List[SpeedGamingEpisode]:
+    """A schedule of 1v1 episodes between organization members."""
+    starts = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    episodes = []
+    for i in range(EPISODE_COUNT):
+        player1, player2, commentator = (
+            users[(i * 3 + n) % len(users)] for n in range(3)
+        )
+        episodes.append(
+            SpeedGamingEpisode.from_dict(
+                {
+                    "id": 900000 + i,
+                    "title": f"Benchmark Episode {i}",
+                    "when": (starts + timedelta(days=1, hours=i)).isoformat(),
+                    "approved": True,
+                    "length": 120,
+                    "match1": {
+                        "id": 800000 + i,
+                        "title": "Standard",
+                        "players": [
+                            _person(700000 + i * 2, player1),
+                            _person(700001 + i * 2, player2),
+                        ],
+                    },
+                    "event": {"id": 1, "name": "Benchmark", "slug": "benchmark"},
+                    "channels": [
+                        {"id": 1, "name": "SpeedGaming", "slug": "speedgaming"}
+                    ],
+                    "commentators": [_person(600000 + i, commentator)],
+                }
+            )
+        )
+    return episodes
+
+
+async def test_import_episodes_for_tournament(benchmark):
+    """Re-import of a 25-episode schedule (first import happens in warm-up)."""
+    tournament = await Tournament.all().order_by("id").first()
+    tournament.speedgaming_enabled = True
+    tournament.speedgaming_event_slug = "benchmark"
+    await tournament.save()
+
+    members = (
+        await OrganizationMember.filter(organization_id=tournament.organization_id)
+        .order_by("id")
+        .prefetch_related("user")
+    )
+    service = SpeedGamingETLService()
+    service.sg_service = StubSpeedGamingService(_episodes([m.user for m in members]))
+
+    await benchmark(
+        "speedgaming_etl.import_episodes_for_tournament",
+        lambda: service.import_episodes_for_tournament(tournament.id),
+    )
@@ -0,0 +1,17 @@
+"""Benchmarks for tournament and match reads."""
+
+from models import Organization
+from modules.tournament.repositories.tournament_repository import (
+    TournamentRepository,
+)
+
+
+async def test_list_matches_for_org(benchmark):
+    """All matches of the first organization with their related rows."""
+    organization = await Organization.all().order_by("id").first()
+    repository = TournamentRepository()
+
+    await benchmark(
+        "tournament_repository.list_matches_for_org",
+        lambda: repository.list_matches_for_org(organization.id),
+    )
@@ -7,9 +7,8 @@ including a header with branding, user info, and navigation menu.
 
 from __future__ import annotations
 from typing import Optional, Callable, Awaitable
-import hashlib
-from pathlib import Path
 from nicegui import ui
+from application.utils.asset_manifest import get_asset_manifest
 from middleware.auth import DiscordAuthService
 from models import User, Permission
 from components.header import Header
@@ -23,22 +22,9 @@ def get_css_version() -> str:
     Get CSS cache-busting version based on main.css content hash.
 
     Returns:
-        Version string (MD5 hash of main.css content, first 8 chars)
+        Version string from the asset manifest (first 8 chars of the MD5 hash)
     """
-    try:
-        css_file = Path(__file__).parent.parent / "static" / "css" / "main.css"
-        if not css_file.exists():
-            return "1"
-
-        # Calculate MD5 hash of file content
-        content = css_file.read_bytes()
-        hash_digest = hashlib.md5(content).hexdigest()
-
-        # Return first 8 characters of hash (sufficient for cache busting)
-        return hash_digest[:8]
-    except Exception:
-        # Fallback to static version if anything goes wrong
-        return "1"
+    return get_asset_manifest().version("css/main.css")
 
 
 def get_js_version(filename: str) -> str:
@@ -49,22 +35,9 @@ def get_js_version(filename: str) -> str:
         filename: Relative path to JS file from static/js/ directory
 
     Returns:
-        Version string (MD5 hash of file content, first 8 chars)
+        Version string from the asset manifest (first 8 chars of the MD5 hash)
     """
-    try:
-        js_file = Path(__file__).parent.parent / "static" / "js" / filename
-        if not js_file.exists():
-            return "1"
-
-        # Calculate MD5 hash of file content
-        content = js_file.read_bytes()
-        hash_digest = hashlib.md5(content).hexdigest()
-
-        # Return first 8 characters of hash (sufficient for cache busting)
-        return hash_digest[:8]
-    except Exception:
-        # Fallback to static version if anything goes wrong
-        return "1"
+    return get_asset_manifest().version(f"js/{filename}")
 
 
 class BasePage:
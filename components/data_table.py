@@ -8,11 +8,17 @@ implemented in `static/css/responsive.css`.
 Columns can either specify a `key` to render a value from each row or a
 `cell_render` callable to fully control cell content. The component sets
 `data-label` on each cell to support the mobile stacked layout.
+
+For large result sets use `PaginatedTable` with a `TableDataProvider`: only
+the rows of the current page are fetched and turned into elements, so the
+per-client element tree stays small regardless of the total row count.
 """
 
 from __future__ import annotations
-from typing import Any, Callable, Optional, Sequence
+from typing import Any, Awaitable, Callable, Optional, Sequence
+import asyncio
 import inspect
+import math
 from nicegui import ui
 
 
@@ -68,35 +74,203 @@ class ResponsiveTable:
         """
         classes = f"data-table {self.table_classes}".strip()
         with ui.element("table").classes(classes).props('role="table"'):
-            # Header
-            with ui.element("thead").props('role="rowgroup"'):
-                with ui.element("tr").props('role="row"'):
-                    for col in self.columns:
-                        with ui.element("th").classes(col.header_classes).props(
-                            'role="columnheader" scope="col"'
-                        ):
-                            ui.label(col.label)
+            self._render_header()
 
             # Body
             with ui.element("tbody").props('role="rowgroup"'):
-                for row in self.rows:
-                    with ui.element("tr").props('role="row"'):
-                        for col in self.columns:
-                            with ui.element("td").props(
-                                f'data-label="{col.label}" role="cell"'
-                            ).classes(col.cell_classes):
-                                if col.cell_render is not None:
-                                    result = col.cell_render(row)
-                                    if inspect.iscoroutine(result):
-                                        await result
-                                elif col.key is not None:
-                                    # Render from attribute or mapping key
-                                    value = None
-                                    if isinstance(row, dict):
-                                        value = row.get(col.key)
-                                    else:
-                                        value = getattr(row, col.key, None)
-                                    ui.label("" if value is None else str(value))
-                                else:
-                                    # Empty cell if neither renderer nor key provided
-                                    ui.label("")
+                await self._render_rows(self.rows)
+
+    def _render_header(self) -> None:
+        """Render the table header row."""
+        with ui.element("thead").props('role="rowgroup"'):
+            with ui.element("tr").props('role="row"'):
+                for col in self.columns:
+                    with ui.element("th").classes(col.header_classes).props(
+                        'role="columnheader" scope="col"'
+                    ):
+                        ui.label(col.label)
+
+    async def _render_rows(self, rows: Sequence[Any]) -> None:
+        """Render body rows into the current container.
+
+        Async cell renderers are awaited concurrently once all rows have been
+        laid out; each runs inside its own cell, so ordering is unaffected.
+        """
+        pending: list[Awaitable[None]] = []
+        for row in rows:
+            with ui.element("tr").props('role="row"'):
+                for col in self.columns:
+                    with ui.element("td").props(
+                        f'data-label="{col.label}" role="cell"'
+                    ).classes(col.cell_classes) as cell:
+                        if col.cell_render is not None:
+                            result = col.cell_render(row)
+                            if inspect.iscoroutine(result):
+                                pending.append(self._render_in(cell, result))
+                        elif col.key is not None:
+                            # Render from attribute or mapping key
+                            value = None
+                            if isinstance(row, dict):
+                                value = row.get(col.key)
+                            else:
+                                value = getattr(row, col.key, None)
+                            ui.label("" if value is None else str(value))
+                        else:
+                            # Empty cell if neither renderer nor key provided
+                            ui.label("")
+
+        if pending:
+            await asyncio.gather(*pending)
+
+    @staticmethod
+    async def _render_in(cell: ui.element, coro: Awaitable[Any]) -> None:
+        """Await a cell renderer with its cell as the current container."""
+        with cell:
+            await coro
+
+
+class TableDataProvider:
+    """Async row source for PaginatedTable.
+
+    Subclasses return the total row count and one window of rows at a time.
+    """
+
+    async def count(self) -> int:
+        """Return the total number of rows."""
+        raise NotImplementedError
+
+    async def fetch(self, offset: int, limit: int) -> Sequence[Any]:
+        """Return up to `limit` rows starting at `offset`."""
+        raise NotImplementedError
+
+
+class ListDataProvider(TableDataProvider):
+    """Data provider over rows that are already in memory."""
+
+    def __init__(self, rows: Sequence[Any]) -> None:
+        self.rows = list(rows)
+
+    async def count(self) -> int:
+        return len(self.rows)
+
+    async def fetch(self, offset: int, limit: int) -> Sequence[Any]:
+        return self.rows[offset : offset + limit]
+
+
+class CallbackDataProvider(TableDataProvider):
+    """Data provider backed by async callables (typically service methods).
+
+    Usage:
+        provider = CallbackDataProvider(
+            count=lambda: service.count_things(user),
+            fetch=lambda offset, limit: service.list_things(user, offset, limit),
+        )
+    """
+
+    def __init__(
+        self,
+        count: Callable[[], Awaitable[int]],
+        fetch: Callable[[int, int], Awaitable[Sequence[Any]]],
+    ) -> None:
+        self._count = count
+        self._fetch = fetch
+
+    async def count(self) -> int:
+        return await self._count()
+
+    async def fetch(self, offset: int, limit: int) -> Sequence[Any]:
+        return await self._fetch(offset, limit)
+
+
+class PaginatedTable(ResponsiveTable):
+    """ResponsiveTable that renders one page of rows from a data provider.
+
+    Changing page only fetches and re-renders the table body; the header and
+    pagination controls are kept.
+
+    Usage:
+        table = PaginatedTable(columns=[...], provider=ListDataProvider(rows))
+        await table.render()
+        ...
+        await table.refresh()  # After the underlying data changes
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[TableColumn],
+        provider: TableDataProvider,
+        page_size: int = 25,
+        table_classes: str = "",
+    ) -> None:
+        super().__init__(columns=columns, rows=[], table_classes=table_classes)
+        self.provider = provider
+        self.page_size = page_size
+        self.page = 1
+        self.total = 0
+        self._body: Optional[ui.element] = None
+        self._pager: Optional[ui.pagination] = None
+        self._summary: Optional[ui.label] = None
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages (at least 1)."""
+        return max(1, math.ceil(self.total / self.page_size))
+
+    async def render(self) -> None:
+        """Render the table and the first page of rows."""
+        self.total = await self.provider.count()
+        classes = f"data-table {self.table_classes}".strip()
+        with ui.column().classes("full-width gap-sm"):
+            with ui.element("table").classes(classes).props('role="table"'):
+                self._render_header()
+                self._body = ui.element("tbody").props('role="rowgroup"')
+
+            with ui.row().classes("full-width items-center justify-between"):
+                self._summary = ui.label().classes("text-sm text-secondary")
+                self._pager = ui.pagination(
+                    1,
+                    self.page_count,
+                    direction_links=True,
+                    on_change=lambda e: self.set_page(e.value),
+                ).props("max-pages=7 boundary-numbers")
+
+        await self._load_page()
+
+    async def set_page(self, page: int) -> None:
+        """Show the given page (1-based)."""
+        page = min(max(1, page or 1), self.page_count)
+        if page == self.page and self.rows:
+            return
+        self.page = page
+        await self._load_page()
+
+    async def refresh(self) -> None:
+        """Re-count rows and reload the current page."""
+        self.total = await self.provider.count()
+        self.page = min(self.page, self.page_count)
+        await self._load_page()
+
+    async def _load_page(self) -> None:
+        """Fetch the current page and replace the table body."""
+        if self._body is None:
+            return
+
+        offset = (self.page - 1) * self.page_size
+        self.rows = list(await self.provider.fetch(offset, self.page_size))
+
+        self._body.clear()
+        with self._body:
+            await self._render_rows(self.rows)
+
+        if self._pager is not None:
+            self._pager.max = self.page_count
+            self._pager.value = self.page
+            self._pager.set_visibility(self.page_count > 1)
+            self._pager.update()
+        if self._summary is not None:
+            if self.rows:
+                self._summary.set_text(
+                    f"{offset + 1}-{offset + len(self.rows)} of {self.total}"
+                )
+            else:
+                self._summary.set_text(f"0 of {self.total}")
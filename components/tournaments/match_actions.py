@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Callable, Awaitable, Optional
 from nicegui import ui
 from modules.tournament.models.match_schedule import Match
 from components.dialogs import MatchSeedDialog, EditMatchDialog
-from application.services.randomizer.randomizer_service import RandomizerService
+from application.services.randomizer.seed_pool_service import SeedPoolService
 from config import Settings
 
 if TYPE_CHECKING:
@@ -71,11 +71,6 @@ class MatchActions:
             button.disable()
 
         try:
-            randomizer_service = RandomizerService()
-
-            # Get the randomizer
-            randomizer = randomizer_service.get_randomizer(randomizer_type)
-
             # Prepare settings
             settings_dict = {}
             description = f"Generated {randomizer_type} seed"
@@ -99,8 +94,11 @@ class MatchActions:
                         randomizer_preset_id,
                     )
 
-            # Generate the seed with settings
-            result = await randomizer.generate(settings_dict)
+            # Claim a pre-generated seed (reserved for this match or from the
+            # pool for these settings), falling back to live generation
+            result = await SeedPoolService().get_seed(
+                randomizer_type, settings_dict, match_id=match_id
+            )
 
             # Set the seed for the match
             await self.service.set_match_seed(
@@ -51,6 +51,8 @@ class Settings(BaseSettings):
     DB_USER: str = "sahabot2"
     DB_PASSWORD: Optional[str] = None  # Required for MySQL, not needed for SQLite
     DB_NAME: str = "sahabot2"
+    # Apply migrations on startup: "auto" (only when behind), "always", "never"
+    DB_MIGRATE_ON_STARTUP: str = "auto"
 
     # Discord OAuth2 Configuration
     DISCORD_CLIENT_ID: str
@@ -77,6 +79,24 @@ class Settings(BaseSettings):
     )
     RACETIME_URL: str = "https://racetime.gg"
 
+    # Racetime.gg bot startup (bounded parallelism for bot start and room rejoin)
+    RACETIME_STARTUP_CONCURRENCY: int = 4
+    RACETIME_REJOIN_CONCURRENCY: int = 8
+
+    # Racer verification (cached race history per RaceTime user, 0 disables caching)
+    RACER_VERIFICATION_CACHE_TTL_SECONDS: float = 300.0
+    RACER_VERIFICATION_CONCURRENCY: int = 4
+
+    # Shared aiohttp connection pool (RaceTime bots and services)
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 20
+    HTTP_POOL_KEEPALIVE_SECONDS: float = 60.0
+    HTTP_POOL_TIMEOUT_SECONDS: float = 30.0
+
+    # OAuth token refresh (background refresh ahead of expiry for accounts in use)
+    TOKEN_REFRESH_LEAD_SECONDS: float = 600.0
+    TOKEN_REFRESH_ACTIVE_SECONDS: float = 3600.0
+
     # Twitch OAuth2 Configuration (for user account linking)
     TWITCH_CLIENT_ID: str = ""
     TWITCH_CLIENT_SECRET: str = ""
@@ -91,6 +111,16 @@ class Settings(BaseSettings):
     BASE_URL: str = "http://localhost:8080"  # Base URL for the application
     # Secret for authenticating health check endpoint
     HEALTH_CHECK_SECRET: str
+    # Per-request SQL statement budget reported in debug mode (0 = no budget)
+    REQUEST_QUERY_BUDGET: int = 0
+    # Per-fingerprint SQL statistics shown on /admin/query-stats
+    QUERY_STATS_ENABLED: bool = True
+    # Statements slower than this are logged and sampled for EXPLAIN (0 = off)
+    SLOW_QUERY_MS: float = 200.0
+    # Minimum seconds between EXPLAIN captures of the same statement
+    QUERY_EXPLAIN_INTERVAL_SECONDS: float = 300.0
+    # Target seconds from process start to the first healthy /api/health
+    STARTUP_HEALTH_TARGET_SECONDS: float = 10.0
 
     # Server Configuration
     HOST: str = "0.0.0.0"
@@ -100,10 +130,43 @@ class Settings(BaseSettings):
     API_RATE_LIMIT_WINDOW_SECONDS: int = 60
     API_DEFAULT_RATE_LIMIT_PER_MINUTE: int = 60
 
+    # Tournament usage tracking (buffered page-view writes, flushed in batches)
+    TOURNAMENT_USAGE_FLUSH_SECONDS: float = 5.0
+
+    # Audit log writer (buffered inserts, flushed every N seconds or rows)
+    AUDIT_FLUSH_SECONDS: float = 0.5
+    AUDIT_FLUSH_MAX_ROWS: int = 200
+    # Audit log browsing (cached approximate totals, rows per export query)
+    AUDIT_COUNT_CACHE_TTL_SECONDS: float = 60.0
+    AUDIT_EXPORT_CHUNK_SIZE: int = 1000
+
+    # Async qualifier race timeouts (enforced by the race deadline scheduler)
+    ASYNC_RACE_WARNING_MINUTES: int = 10
+    ASYNC_RACE_PENDING_TIMEOUT_MINUTES: int = 20
+    ASYNC_RACE_MAX_HOURS: int = 12
+
+    # Settings and feature flag read cache (0 disables caching)
+    SETTINGS_CACHE_TTL_SECONDS: float = 60.0
+
     # Randomizer Configuration
     ALTTPR_BASEURL: str = "https://alttpr.com"
     OOTR_API_KEY: Optional[str] = None
 
+    # Shared randomizer HTTP client (pooling, retry and circuit breaker per host)
+    RANDOMIZER_HTTP_TIMEOUT_SECONDS: float = 30.0
+    RANDOMIZER_HTTP_MAX_RETRIES: int = 2
+    RANDOMIZER_HTTP_RETRY_BACKOFF_SECONDS: float = 0.5
+    RANDOMIZER_HTTP_MAX_CONCURRENCY_PER_HOST: int = 8
+    RANDOMIZER_HTTP_BREAKER_THRESHOLD: int = 5
+    RANDOMIZER_HTTP_BREAKER_COOLDOWN_SECONDS: float = 30.0
+
+    # Pooled OAuth provider clients (Discord, RaceTime.gg, Twitch)
+    OAUTH_HTTP_TIMEOUT_SECONDS: float = 15.0
+    OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    OAUTH_HTTP_CONNECT_RETRIES: int = 2
+    OAUTH_HTTP_RETRY_BACKOFF_SECONDS: float = 0.2
+    OAUTH_HTTP_MAX_CONNECTIONS: int = 20
+
     # Sentry Configuration
     SENTRY_DSN: Optional[str] = None
     SENTRY_ENVIRONMENT: Optional[str] = None
@@ -2,23 +2,55 @@
 Database initialization and management utilities.
 """
 
+import logging
+from pathlib import Path
+
 from tortoise import Tortoise
+from tortoise.exceptions import DBConnectionError, OperationalError
 from config import settings
 from migrations.tortoise_config import TORTOISE_ORM, get_model_modules
 from aerich import Command
+from aerich.models import Aerich
+from application.utils.request_scope import install_query_counter
 
+logger = logging.getLogger(__name__)
 
-async def init_db() -> None:
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations" / "models"
+
+
+def get_migration_files() -> list[str]:
     """
-    Initialize database connection.
+    Get the migration file names aerich would apply.
 
-    This should be called during application startup.
+    Returns:
+        Migration file names (e.g. "0_20251028224134_init.py"), in apply order
     """
-    command = Command(
-        tortoise_config=TORTOISE_ORM, app="models", location="./migrations"
-    )
-    await command.init()
-    await command.upgrade()
+    files = [f for f in MIGRATIONS_DIR.glob("*.py") if not f.stem.startswith("_")]
+    return [f.name for f in sorted(files, key=lambda f: int(f.stem.split("_", 1)[0]))]
+
+
+async def get_pending_migrations() -> list[str]:
+    """
+    Get migration files not yet recorded in the aerich table.
+
+    Requires Tortoise to be initialized. A missing aerich table (fresh
+    database) counts as every migration pending.
+
+    Returns:
+        Pending migration file names, in apply order
+    """
+    try:
+        applied = set(
+            await Aerich.filter(app="models").values_list("version", flat=True)
+        )
+    except (OperationalError, DBConnectionError) as e:
+        logger.info("Could not read applied migrations (%s), assuming none", e)
+        applied = set()
+    return [name for name in get_migration_files() if name not in applied]
+
+
+async def _init_tortoise() -> None:
+    """Initialize Tortoise with the application models."""
     await Tortoise.init(
         db_url=settings.database_url,
         modules={"models": get_model_modules()},
@@ -27,6 +59,41 @@ async def init_db() -> None:
     )
 
 
+async def _run_migrations() -> None:
+    """Apply pending migrations with aerich."""
+    command = Command(
+        tortoise_config=TORTOISE_ORM, app="models", location="./migrations"
+    )
+    await command.init()
+    applied = await command.upgrade()
+    logger.info("Applied %d migration(s)", len(applied))
+
+
+async def init_db() -> None:
+    """
+    Initialize database connection.
+
+    This should be called during application startup. Migrations are applied
+    according to DB_MIGRATE_ON_STARTUP: "auto" only runs aerich when the
+    database is behind the migration files, "always" runs it unconditionally
+    and "never" leaves migrations to a separate deploy step.
+    """
+    mode = settings.DB_MIGRATE_ON_STARTUP.lower()
+    await _init_tortoise()
+
+    if mode == "never":
+        logger.info("Skipping migrations (DB_MIGRATE_ON_STARTUP=never)")
+    elif mode == "always" or await get_pending_migrations():
+        # aerich initializes Tortoise with its own config; re-init afterwards
+        await Tortoise.close_connections()
+        await _run_migrations()
+        await _init_tortoise()
+    else:
+        logger.info("Database schema is current, skipping migrations")
+
+    install_query_counter()
+
+
 async def close_db() -> None:
     """
     Close database connections.
@@ -16,8 +16,14 @@ from modules.async_qualifier.models.async_qualifier import AsyncQualifier, Async
 from application.services.async_qualifiers.async_qualifier_service import (
     AsyncQualifierService,
 )
-from application.services.organizations.organization_service import OrganizationService
 from config import settings
+from discordbot.interactions import (
+    defer,
+    interaction_handler,
+    load_qualifier_context,
+    load_race_for_thread,
+    respond,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,29 +40,32 @@ class AsyncQualifierMainView(ui.View):
         emoji="🏁",
         custom_id="async_qualifier:new_race",
     )
+    @interaction_handler("async_qualifier:new_race")
     async def new_race(self, interaction: discord.Interaction, button: ui.Button):
         """Handle new race button click."""
-        # Get tournament for this channel
-        qualifier = await AsyncQualifier.get_or_none(
-            discord_channel_id=interaction.channel_id
-        )
+        await defer(interaction)
+
+        # Qualifier for this channel, user and membership in one pass
+        context = await load_qualifier_context(interaction)
+        qualifier, user = context.qualifier, context.user
 
         if not qualifier:
-            await interaction.response.send_message(
-                "This channel is not configured for async qualifiers.", ephemeral=True
+            await respond(
+                interaction,
+                "This channel is not configured for async qualifiers.",
+                ephemeral=True,
             )
             return
 
         if not qualifier.is_active:
-            await interaction.response.send_message(
-                "This qualifier is not currently active.", ephemeral=True
+            await respond(
+                interaction, "This qualifier is not currently active.", ephemeral=True
             )
             return
 
-        # Get user
-        user = await User.get_or_none(discord_id=interaction.user.id)
         if not user:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 "You must link your account first. Please log in to the web application.",
                 ephemeral=True,
             )
@@ -66,7 +75,8 @@ class AsyncQualifierMainView(ui.View):
         if qualifier.require_racetime_for_async_runs:
             if not user.racetime_id:
                 profile_url = f"{settings.BASE_URL}/profile/racetime"
-                await interaction.response.send_message(
+                await respond(
+                    interaction,
                     f"⚠️ **RaceTime.gg Account Required**\n\n"
                     f"This tournament requires you to link your RaceTime.gg account before starting async runs.\n\n"
                     f"Please visit your profile page to link your account:\n{profile_url}\n\n"
@@ -75,46 +85,41 @@ class AsyncQualifierMainView(ui.View):
                 )
                 return
 
-        # Get service
-        service = AsyncQualifierService()
-
-        # Check if user is in the organization
-        org_service = OrganizationService()
-        is_member = await org_service.is_member(user, qualifier.organization_id)
-
-        if not is_member:
-            await interaction.response.send_message(
+        if not context.is_member:
+            await respond(
+                interaction,
                 "You must be a member of this qualifier's organization to participate.",
                 ephemeral=True,
             )
             return
 
-        # Check if user already has an active race
-        existing_races = await service.get_active_races_for_user(
-            user=user,
-            organization_id=qualifier.organization_id,
-            qualifier_id=qualifier.id,
+        # Active races, race history and pools are independent lookups
+        service = AsyncQualifierService()
+        existing_races, user_races, _ = await asyncio.gather(
+            service.get_active_races_for_user(
+                user=user,
+                organization_id=qualifier.organization_id,
+                qualifier_id=qualifier.id,
+            ),
+            service.get_user_races(user, qualifier.organization_id, qualifier.id),
+            qualifier.fetch_related("pools"),
         )
 
         if existing_races:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 "You already have an active race. Please complete or forfeit it before starting a new one.",
                 ephemeral=True,
             )
             return
 
-        # Get user's race history
-        user_races = await service.get_user_races(
-            user, qualifier.organization_id, qualifier.id
-        )
-
-        # Get pools
-        await qualifier.fetch_related("pools")
         pools = list(qualifier.pools)
 
         if not pools:
-            await interaction.response.send_message(
-                "This tournament has no pools configured yet.", ephemeral=True
+            await respond(
+                interaction,
+                "This tournament has no pools configured yet.",
+                ephemeral=True,
             )
             return
 
@@ -138,7 +143,8 @@ class AsyncQualifierMainView(ui.View):
         ]
 
         if not available_pools:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 "You have completed all available pools for this qualifier.",
                 ephemeral=True,
             )
@@ -146,7 +152,8 @@ class AsyncQualifierMainView(ui.View):
 
         # Show pool selection
         view = PoolSelectionView(available_pools, qualifier, user)
-        await interaction.response.send_message(
+        await respond(
+            interaction,
             "You must start your race within 10 minutes of clicking 'Confirm'.\n"
             "Failure to do so will result in a forfeit.\n\n"
             "**Please be absolutely certain you're ready to begin.**\n\n"
@@ -176,6 +183,7 @@ class PoolSelectionView(ui.View):
         select.callback = self.pool_selected
         self.add_item(select)
 
+    @interaction_handler("async_qualifier:pool_select")
     async def pool_selected(self, interaction: discord.Interaction):
         """Handle pool selection."""
         pool_id = int(interaction.data["values"][0])
@@ -200,15 +208,14 @@ class PoolSelectionView(ui.View):
         disabled=True,
         row=1,
     )
+    @interaction_handler("async_qualifier:confirm_race")
     async def confirm_race(self, interaction: discord.Interaction, button: ui.Button):
         """Confirm race creation."""
         if not self.selected_pool:
-            await interaction.response.send_message(
-                "Please select a pool first.", ephemeral=True
-            )
+            await respond(interaction, "Please select a pool first.", ephemeral=True)
             return
 
-        await interaction.response.defer(ephemeral=True)
+        await defer(interaction)
 
         # Get a random eligible permalink from the selected pool
         service = AsyncQualifierService()
@@ -217,18 +224,18 @@ class PoolSelectionView(ui.View):
             MAX_POOL_IMBALANCE,
         )
 
-        await self.selected_pool.fetch_related("permalinks")
+        # Pool permalinks and the user's race history for this pool
+        _, played_permalinks = await asyncio.gather(
+            self.selected_pool.fetch_related("permalinks"),
+            AsyncQualifierRace.filter(
+                user_id=self.user.id,
+                tournament_id=self.qualifier.id,
+                permalink__pool_id=self.selected_pool.id,
+                reattempted=False,
+            ).values_list("permalink_id", flat=True),
+        )
         all_permalinks = list(self.selected_pool.permalinks)
-
-        # Get user's race history for this pool
-        user_pool_races = await AsyncQualifierRace.filter(
-            user_id=self.user.id,
-            tournament_id=self.qualifier.id,
-            permalink__pool_id=self.selected_pool.id,
-            reattempted=False,
-        ).prefetch_related("permalink")
-
-        played_permalinks = {r.permalink_id for r in user_pool_races}
+        played_permalinks = set(played_permalinks)
         eligible_permalinks = [
             p for p in all_permalinks if p.id not in played_permalinks
         ]
@@ -300,6 +307,7 @@ Good luck and have fun!"""
         custom_id="cancel_race",
         row=1,
     )
+    @interaction_handler("async_qualifier:cancel_race")
     async def cancel_race(self, interaction: discord.Interaction, button: ui.Button):
         """Cancel race creation."""
         await interaction.response.edit_message(
@@ -319,33 +327,36 @@ class RaceReadyView(ui.View):
         emoji="✅",
         custom_id="async_race:ready",
     )
+    @interaction_handler("async_race:ready")
     async def ready(self, interaction: discord.Interaction, button: ui.Button):
         """Start the race countdown."""
+        await defer(interaction)
+
         # Get race for this thread
-        race = await AsyncQualifierRace.get_or_none(
-            discord_thread_id=interaction.channel.id
-        ).prefetch_related("user", "tournament")
+        race = await load_race_for_thread(interaction)
 
         if not race:
-            await interaction.response.send_message(
-                "This thread is not a valid race thread.", ephemeral=True
+            await respond(
+                interaction, "This thread is not a valid race thread.", ephemeral=True
             )
             return
 
         if race.user.discord_id != interaction.user.id:
-            await interaction.response.send_message(
-                "Only the race participant can start this race.", ephemeral=True
+            await respond(
+                interaction,
+                "Only the race participant can start this race.",
+                ephemeral=True,
             )
             return
 
         if race.status != "pending":
-            await interaction.response.send_message(
-                "This race must be in pending state to start.", ephemeral=True
+            await respond(
+                interaction,
+                "This race must be in pending state to start.",
+                ephemeral=True,
             )
             return
 
-        await interaction.response.defer()
-
         # Disable buttons
         for item in self.children:
             item.disabled = True
@@ -381,29 +392,28 @@ class RaceReadyView(ui.View):
         emoji="🏳️",
         custom_id="async_race:forfeit_ready",
     )
+    @interaction_handler("async_race:forfeit_ready")
     async def forfeit(self, interaction: discord.Interaction, button: ui.Button):
         """Forfeit the race."""
         await self._handle_forfeit(interaction)
 
     async def _handle_forfeit(self, interaction: discord.Interaction):
         """Common forfeit logic."""
-        race = await AsyncQualifierRace.get_or_none(
-            discord_thread_id=interaction.channel.id
-        ).prefetch_related("user", "tournament")
+        await defer(interaction)
+        race = await load_race_for_thread(interaction)
 
         if not race:
-            await interaction.response.send_message(
-                "Invalid race thread.", ephemeral=True
-            )
+            await respond(interaction, "Invalid race thread.", ephemeral=True)
             return
 
         if race.user.discord_id != interaction.user.id:
-            await interaction.response.send_message(
-                "Only the race participant can forfeit.", ephemeral=True
+            await respond(
+                interaction, "Only the race participant can forfeit.", ephemeral=True
             )
             return
 
-        await interaction.response.send_message(
+        await respond(
+            interaction,
             "Are you sure you wish to forfeit? This action **cannot be undone**. "
             "This race will be scored as **zero**.",
             view=ForfeitConfirmView(),
@@ -423,32 +433,29 @@ class RaceInProgressView(ui.View):
         emoji="✅",
         custom_id="async_race:finish",
     )
+    @interaction_handler("async_race:finish")
     async def finish(self, interaction: discord.Interaction, button: ui.Button):
         """Finish the race."""
-        race = await AsyncQualifierRace.get_or_none(
-            discord_thread_id=interaction.channel.id
-        ).prefetch_related("user", "tournament")
+        # Acknowledge first so the finish time is not delayed by lookups
+        await defer(interaction)
+        race = await load_race_for_thread(interaction)
 
         if not race:
-            await interaction.response.send_message(
-                "Invalid race thread.", ephemeral=True
-            )
+            await respond(interaction, "Invalid race thread.", ephemeral=True)
             return
 
         if race.user.discord_id != interaction.user.id:
-            await interaction.response.send_message(
-                "Only the race participant can finish.", ephemeral=True
+            await respond(
+                interaction, "Only the race participant can finish.", ephemeral=True
             )
             return
 
         if race.status != "in_progress":
-            await interaction.response.send_message(
-                "Race must be in progress to finish.", ephemeral=True
+            await respond(
+                interaction, "Race must be in progress to finish.", ephemeral=True
             )
             return
 
-        await interaction.response.defer()
-
         # Finish the race
         service = AsyncQualifierService()
         race = await service.finish_race(
@@ -477,6 +484,7 @@ class RaceInProgressView(ui.View):
         emoji="🏳️",
         custom_id="async_race:forfeit_progress",
     )
+    @interaction_handler("async_race:forfeit_progress")
     async def forfeit(self, interaction: discord.Interaction, button: ui.Button):
         """Forfeit the race."""
         await RaceReadyView()._handle_forfeit(interaction)
@@ -487,6 +495,7 @@ class RaceInProgressView(ui.View):
         emoji="⏱️",
         custom_id="async_race:timer",
     )
+    @interaction_handler("async_race:timer")
     async def get_timer(self, interaction: discord.Interaction, button: ui.Button):
         """Get current elapsed time."""
         race = await AsyncQualifierRace.get_or_none(
@@ -494,9 +503,7 @@ class RaceInProgressView(ui.View):
         )
 
         if not race or not race.start_time:
-            await interaction.response.send_message(
-                "Timer not available.", ephemeral=True
-            )
+            await respond(interaction, "Timer not available.", ephemeral=True)
             return
 
         # Calculate elapsed time for in-progress races
@@ -506,9 +513,7 @@ class RaceInProgressView(ui.View):
             elapsed = race.elapsed_time
 
         if not elapsed:
-            await interaction.response.send_message(
-                "Timer not available.", ephemeral=True
-            )
+            await respond(interaction, "Timer not available.", ephemeral=True)
             return
 
         # Format elapsed time as H:MM:SS
@@ -520,9 +525,7 @@ class RaceInProgressView(ui.View):
 
         formatted = format_timedelta(elapsed)
 
-        await interaction.response.send_message(
-            f"Timer: **{formatted}**", ephemeral=True
-        )
+        await respond(interaction, f"Timer: **{formatted}**", ephemeral=True)
 
 
 class ForfeitConfirmView(ui.View):
@@ -532,21 +535,19 @@ class ForfeitConfirmView(ui.View):
         super().__init__(timeout=60)
 
     @ui.button(label="Confirm Forfeit", style=discord.ButtonStyle.red, emoji="🏳️")
+    @interaction_handler("async_race:forfeit_confirm")
     async def confirm(self, interaction: discord.Interaction, button: ui.Button):
         """Confirm forfeit."""
-        race = await AsyncQualifierRace.get_or_none(
-            discord_thread_id=interaction.channel.id
-        ).prefetch_related("user", "tournament")
+        await defer(interaction)
+        race = await load_race_for_thread(interaction)
 
         if not race:
-            await interaction.response.send_message(
-                "Invalid race thread.", ephemeral=True
-            )
+            await respond(interaction, "Invalid race thread.", ephemeral=True)
             return
 
         if race.user.discord_id != interaction.user.id:
-            await interaction.response.send_message(
-                "Only the race participant can forfeit.", ephemeral=True
+            await respond(
+                interaction, "Only the race participant can forfeit.", ephemeral=True
             )
             return
 
@@ -558,16 +559,24 @@ class ForfeitConfirmView(ui.View):
             race_id=race.id,
         )
 
-        await interaction.response.send_message(
-            f"This run has been forfeited by {interaction.user.mention}."
+        await respond(
+            interaction, f"This run has been forfeited by {interaction.user.mention}."
         )
 
-        # Disable all buttons in parent message
+        # Disable all buttons in the confirmation message
         for item in self.children:
             item.disabled = True
         await interaction.edit_original_response(view=self)
 
 
+async def _is_race_participant(interaction: discord.Interaction) -> bool:
+    """Check that the interaction's thread is a race run by the interacting user."""
+    return await AsyncQualifierRace.filter(
+        discord_thread_id=interaction.channel_id,
+        user__discord_id=interaction.user.id,
+    ).exists()
+
+
 class RaceCompletedView(ui.View):
     """View for completed races with submission options."""
 
@@ -580,27 +589,18 @@ class RaceCompletedView(ui.View):
         emoji="🗒️",
         custom_id="async_race:submit_vod",
     )
+    @interaction_handler("async_race:submit_vod", auto_defer=False)
     async def submit_vod(self, interaction: discord.Interaction, button: ui.Button):
         """Open modal to submit VOD and notes."""
-        # Get user from database
-        user = await User.get_or_none(discord_id=interaction.user.id)
-        if not user:
-            await interaction.response.send_message(
-                "User not found. Please log in to the web application first.",
+        # A modal must be the initial response, so validate in one query
+        if not await _is_race_participant(interaction):
+            await respond(
+                interaction,
+                "Invalid race thread or you are not the participant.",
                 ephemeral=True,
             )
             return
 
-        # Get race via service (validates user is participant)
-        service = AsyncQualifierService()
-        race = await service.get_race_by_thread_id(user, interaction.channel.id)
-
-        if not race:
-            await interaction.response.send_message(
-                "Invalid race thread or you are not the participant.", ephemeral=True
-            )
-            return
-
         await interaction.response.send_modal(SubmitVODModal())
 
     @ui.button(
@@ -609,27 +609,18 @@ class RaceCompletedView(ui.View):
         emoji="🚩",
         custom_id="async_race:flag_review",
     )
+    @interaction_handler("async_race:flag_review", auto_defer=False)
     async def flag_review(self, interaction: discord.Interaction, button: ui.Button):
         """Open modal to flag run for review."""
-        # Get user from database
-        user = await User.get_or_none(discord_id=interaction.user.id)
-        if not user:
-            await interaction.response.send_message(
-                "User not found. Please log in to the web application first.",
+        # A modal must be the initial response, so validate in one query
+        if not await _is_race_participant(interaction):
+            await respond(
+                interaction,
+                "Invalid race thread or you are not the participant.",
                 ephemeral=True,
             )
             return
 
-        # Get race via service (validates user is participant)
-        service = AsyncQualifierService()
-        race = await service.get_race_by_thread_id(user, interaction.channel.id)
-
-        if not race:
-            await interaction.response.send_message(
-                "Invalid race thread or you are not the participant.", ephemeral=True
-            )
-            return
-
         await interaction.response.send_modal(FlagForReviewModal())
 
 
@@ -651,26 +642,21 @@ class SubmitVODModal(ui.Modal, title="Submit VOD and Notes"):
         max_length=4000,
     )
 
+    @interaction_handler("async_race:submit_vod_modal")
     async def on_submit(self, interaction: discord.Interaction):
         """Handle modal submission."""
-        # Get user from database
-        user = await User.get_or_none(discord_id=interaction.user.id)
-        if not user:
-            await interaction.response.send_message(
-                "User not found. Please log in to the web application first.",
+        await defer(interaction)
+        race = await load_race_for_thread(interaction)
+
+        if not race or race.user.discord_id != interaction.user.id:
+            await respond(
+                interaction,
+                "Invalid race thread or you are not the participant.",
                 ephemeral=True,
             )
             return
-
-        # Get race via service (validates user is participant)
+        user = race.user
         service = AsyncQualifierService()
-        race = await service.get_race_by_thread_id(user, interaction.channel.id)
-
-        if not race:
-            await interaction.response.send_message(
-                "Invalid race thread or you are not the participant.", ephemeral=True
-            )
-            return
 
         # Update race submission via service
         updated_race = await service.update_race_submission(
@@ -684,9 +670,7 @@ class SubmitVODModal(ui.Modal, title="Submit VOD and Notes"):
         )
 
         if not updated_race:
-            await interaction.response.send_message(
-                "Failed to update submission.", ephemeral=True
-            )
+            await respond(interaction, "Failed to update submission.", ephemeral=True)
             return
 
         # Build response message
@@ -698,9 +682,7 @@ class SubmitVODModal(ui.Modal, title="Submit VOD and Notes"):
         if self.runner_notes.value:
             response_parts.append(f"**Notes:**\n{self.runner_notes.value}")
 
-        await interaction.response.send_message(
-            "\n".join(response_parts), ephemeral=False
-        )
+        await respond(interaction, "\n".join(response_parts), ephemeral=False)
 
 
 class FlagForReviewModal(ui.Modal, title="Flag Run for Review"):
@@ -714,26 +696,21 @@ class FlagForReviewModal(ui.Modal, title="Flag Run for Review"):
         max_length=4000,
     )
 
+    @interaction_handler("async_race:flag_review_modal")
     async def on_submit(self, interaction: discord.Interaction):
         """Handle modal submission."""
-        # Get user from database
-        user = await User.get_or_none(discord_id=interaction.user.id)
-        if not user:
-            await interaction.response.send_message(
-                "User not found. Please log in to the web application first.",
+        await defer(interaction)
+        race = await load_race_for_thread(interaction)
+
+        if not race or race.user.discord_id != interaction.user.id:
+            await respond(
+                interaction,
+                "Invalid race thread or you are not the participant.",
                 ephemeral=True,
             )
             return
-
-        # Get race via service (validates user is participant)
+        user = race.user
         service = AsyncQualifierService()
-        race = await service.get_race_by_thread_id(user, interaction.channel.id)
-
-        if not race:
-            await interaction.response.send_message(
-                "Invalid race thread or you are not the participant.", ephemeral=True
-            )
-            return
 
         # Update race to flag for review
         updated_race = await service.update_race_submission(
@@ -745,12 +722,11 @@ class FlagForReviewModal(ui.Modal, title="Flag Run for Review"):
         )
 
         if not updated_race:
-            await interaction.response.send_message(
-                "Failed to flag run for review.", ephemeral=True
-            )
+            await respond(interaction, "Failed to flag run for review.", ephemeral=True)
             return
 
-        await interaction.response.send_message(
+        await respond(
+            interaction,
             f"✅ **Run flagged for review**\n\n"
             f"**Reason:**\n{self.review_request_reason.value}\n\n"
             f"A reviewer will look at your run and may contact you if they need more information.",
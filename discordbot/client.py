@@ -295,8 +295,8 @@ async def start_bot() -> DiscordBot:
     # Start bot in background task
     _bot_task = asyncio.create_task(_run_bot())
 
-    # Wait a moment for the bot to start
-    await asyncio.sleep(1)
+    # Let the task start; readiness is reported by the health check
+    await asyncio.sleep(0)
 
     return _bot_instance
 
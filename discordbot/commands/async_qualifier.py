@@ -7,15 +7,27 @@ Admin commands for managing async qualifiers via Discord.
 import discord
 from discord import app_commands
 from discord.ext import commands
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 
-from models import User
-from modules.async_qualifier.models.async_qualifier import AsyncQualifier, AsyncQualifierRace
+from modules.async_qualifier.models.async_qualifier import AsyncQualifier
+from application.repositories.user_repository import UserRepository
 from application.services.async_qualifiers.async_qualifier_service import (
     AsyncQualifierService,
 )
+from application.services.async_qualifiers.race_deadline_scheduler import (
+    get_race_deadline_scheduler,
+)
+from config import settings
 from discordbot.async_qualifier_views import AsyncQualifierMainView
+from discordbot.interactions import (
+    defer,
+    interaction_handler,
+    load_qualifier_context,
+    load_race_for_thread,
+    respond,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +70,7 @@ class AsyncQualifierCommands(commands.Cog):
         description="Post the async qualifier embed in this channel",
     )
     @app_commands.default_permissions(administrator=True)
+    @interaction_handler("async_post_embed", ephemeral=False)
     async def post_embed(self, interaction: discord.Interaction):
         """Post the async qualifier embed with action buttons."""
         qualifier = await AsyncQualifier.get_or_none(
@@ -65,7 +78,8 @@ class AsyncQualifierCommands(commands.Cog):
         )
 
         if not qualifier:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 "This channel is not configured for async qualifiers. "
                 "Please configure it via the web interface first.",
                 ephemeral=True,
@@ -92,45 +106,48 @@ class AsyncQualifierCommands(commands.Cog):
         )
         embed.set_footer(text=f"Qualifier ID: {qualifier.id}")
 
-        await interaction.response.send_message(
-            embed=embed, view=AsyncQualifierMainView()
-        )
+        await respond(interaction, embed=embed, view=AsyncQualifierMainView())
 
     @app_commands.command(
         name="async_extend_timeout",
         description="Extend the timeout for a race in this thread",
     )
     @app_commands.describe(minutes="Number of minutes to extend")
+    @interaction_handler("async_extend_timeout", ephemeral=False)
     async def extend_timeout(self, interaction: discord.Interaction, minutes: int):
         """Extend the timeout for a pending race."""
-        race = await AsyncQualifierRace.get_or_none(
-            discord_thread_id=interaction.channel_id
-        ).prefetch_related("tournament")
+        race, user = await asyncio.gather(
+            load_race_for_thread(interaction),
+            UserRepository().get_by_discord_id(interaction.user.id),
+        )
 
         if not race:
-            await interaction.response.send_message(
-                "This is not a valid race thread.", ephemeral=True
+            await respond(
+                interaction, "This is not a valid race thread.", ephemeral=True
             )
             return
 
         if race.status != "pending":
-            await interaction.response.send_message(
-                "Can only extend timeout for pending races.", ephemeral=True
+            await respond(
+                interaction,
+                "Can only extend timeout for pending races.",
+                ephemeral=True,
             )
             return
 
         # Check if user can manage tournaments
-        user = await User.get_or_none(discord_id=interaction.user.id)
         if not user:
-            await interaction.response.send_message("User not found.", ephemeral=True)
+            await respond(interaction, "User not found.", ephemeral=True)
             return
 
         can_manage = await self.service.can_manage_async_tournaments(
             user, race.tournament.organization_id
         )
         if not can_manage:
-            await interaction.response.send_message(
-                "You don't have permission to manage this qualifier.", ephemeral=True
+            await respond(
+                interaction,
+                "You don't have permission to manage this qualifier.",
+                ephemeral=True,
             )
             return
 
@@ -139,10 +156,13 @@ class AsyncQualifierCommands(commands.Cog):
             new_timeout = race.thread_timeout_time + timedelta(minutes=minutes)
         else:
             base_time = race.thread_open_time or datetime.now(timezone.utc)
-            new_timeout = base_time + timedelta(minutes=20 + minutes)
+            new_timeout = base_time + timedelta(
+                minutes=settings.ASYNC_RACE_PENDING_TIMEOUT_MINUTES + minutes
+            )
 
         race.thread_timeout_time = new_timeout
         await race.save()
+        get_race_deadline_scheduler().arm(race)
 
         await self.service.repo.create_audit_log(
             tournament_id=race.tournament_id,
@@ -151,7 +171,8 @@ class AsyncQualifierCommands(commands.Cog):
             user_id=user.id,
         )
 
-        await interaction.response.send_message(
+        await respond(
+            interaction,
             f"Timeout extended to {discord.utils.format_dt(new_timeout, 'f')} "
             f"({discord.utils.format_dt(new_timeout, 'R')})"
         )
@@ -160,34 +181,37 @@ class AsyncQualifierCommands(commands.Cog):
         name="async_calculate_scores",
         description="Recalculate scores for this tournament",
     )
+    @interaction_handler("async_calculate_scores")
     async def calculate_scores(self, interaction: discord.Interaction):
         """Manually trigger score calculation."""
-        qualifier = await AsyncQualifier.get_or_none(
-            discord_channel_id=interaction.channel_id
-        )
+        await defer(interaction, ephemeral=True)
+
+        context = await load_qualifier_context(interaction)
+        qualifier, user = context.qualifier, context.user
 
         if not qualifier:
-            await interaction.response.send_message(
-                "This channel is not configured for async qualifiers.", ephemeral=True
+            await respond(
+                interaction,
+                "This channel is not configured for async qualifiers.",
+                ephemeral=True,
             )
             return
 
-        user = await User.get_or_none(discord_id=interaction.user.id)
         if not user:
-            await interaction.response.send_message("User not found.", ephemeral=True)
+            await respond(interaction, "User not found.", ephemeral=True)
             return
 
         can_manage = await self.service.can_manage_async_tournaments(
             user, qualifier.organization_id
         )
         if not can_manage:
-            await interaction.response.send_message(
-                "You don't have permission to manage this qualifier.", ephemeral=True
+            await respond(
+                interaction,
+                "You don't have permission to manage this qualifier.",
+                ephemeral=True,
             )
             return
 
-        await interaction.response.defer(ephemeral=True)
-
         success = await self.service.calculate_tournament_scores(
             user, qualifier.organization_id, qualifier.id
         )
@@ -7,6 +7,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from discordbot.interactions import defer, interaction_handler
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +28,7 @@ class MysteryCommands(commands.Cog):
         name="mystery", description="Generate an ALTTPR mystery seed from a preset"
     )
     @app_commands.describe(preset_name="Name of the mystery preset to use")
+    @interaction_handler("mystery")
     async def mystery_command(self, interaction: discord.Interaction, preset_name: str):
         """
         Generate an ALTTPR mystery seed from a named preset.
@@ -34,7 +37,7 @@ class MysteryCommands(commands.Cog):
             interaction: Discord interaction
             preset_name: Name of the mystery preset
         """
-        await interaction.response.defer(ephemeral=False)
+        await defer(interaction, ephemeral=False)
 
         try:
             from application.services.randomizer.alttpr_mystery_service import (
@@ -114,6 +117,7 @@ class MysteryCommands(commands.Cog):
     @app_commands.command(
         name="mysterylist", description="List available ALTTPR mystery presets"
     )
+    @interaction_handler("mysterylist")
     async def mystery_list_command(self, interaction: discord.Interaction):
         """
         List available mystery presets.
@@ -121,7 +125,7 @@ class MysteryCommands(commands.Cog):
         Args:
             interaction: Discord interaction
         """
-        await interaction.response.defer(ephemeral=True)
+        await defer(interaction, ephemeral=True)
 
         try:
             from application.repositories.randomizer_preset_repository import (
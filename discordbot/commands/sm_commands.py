@@ -15,6 +15,7 @@ from application.services.randomizer.sm_defaults import (
     get_varia_settings,
     get_dash_settings,
 )
+from discordbot.interactions import defer, interaction_handler
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ class SMCommands(commands.Cog):
         preset="Preset name (optional, default: standard)",
         spoilers="Generate spoiler log (default: False)",
     )
+    @interaction_handler("smvaria")
     async def smvaria(
         self,
         interaction: discord.Interaction,
@@ -55,7 +57,7 @@ class SMCommands(commands.Cog):
             preset: Preset name to use
             spoilers: Whether to generate spoiler log
         """
-        await interaction.response.defer()
+        await defer(interaction, ephemeral=False)
 
         try:
             # Get default settings for preset
@@ -110,6 +112,7 @@ class SMCommands(commands.Cog):
         area_rando="Enable area randomization (default: False)",
         spoilers="Generate spoiler log (default: False)",
     )
+    @interaction_handler("smdash")
     async def smdash(
         self,
         interaction: discord.Interaction,
@@ -126,7 +129,7 @@ class SMCommands(commands.Cog):
             area_rando: Enable area randomization
             spoilers: Whether to generate spoiler log
         """
-        await interaction.response.defer()
+        await defer(interaction, ephemeral=False)
 
         try:
             # Get default settings for preset and merge with options
@@ -186,6 +189,7 @@ class SMCommands(commands.Cog):
         preset="Preset name (optional, default: total)",
         spoilers="Generate spoiler log (default: False)",
     )
+    @interaction_handler("smtotal")
     async def smtotal(
         self,
         interaction: discord.Interaction,
@@ -200,7 +204,7 @@ class SMCommands(commands.Cog):
             preset: Preset name to use
             spoilers: Whether to generate spoiler log
         """
-        await interaction.response.defer()
+        await defer(interaction, ephemeral=False)
 
         try:
             # Total randomization with all features enabled
@@ -17,6 +17,7 @@ from application.services.randomizer.smz3_service import (
 from application.services.randomizer.randomizer_preset_service import (
     RandomizerPresetService,
 )
+from discordbot.interactions import defer, interaction_handler
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,7 @@ class SMZ3Commands(commands.Cog):
         preset="Optional preset name to use for seed generation",
         spoiler="Generate seed with spoiler log (default: False)",
     )
+    @interaction_handler("smz3")
     async def smz3_generate(
         self,
         interaction: discord.Interaction,
@@ -52,7 +54,7 @@ class SMZ3Commands(commands.Cog):
         spoiler: bool = False,
     ):
         """Generate an SMZ3 randomizer seed."""
-        await interaction.response.defer(thinking=True)
+        await defer(interaction, ephemeral=False)
 
         try:
             # Start with default settings
@@ -138,9 +140,10 @@ class SMZ3Commands(commands.Cog):
     @app_commands.command(
         name="smz3_presets", description="List available SMZ3 presets"
     )
+    @interaction_handler("smz3_presets")
     async def smz3_presets(self, interaction: discord.Interaction):
         """List available SMZ3 presets."""
-        await interaction.response.defer(thinking=True)
+        await defer(interaction, ephemeral=False)
 
         try:
             # Get all SMZ3 presets
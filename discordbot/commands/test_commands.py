@@ -9,6 +9,8 @@ from discord import app_commands
 from discord.ext import commands
 import logging
 
+from discordbot.interactions import interaction_handler
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +29,7 @@ class TestCommands(commands.Cog):
     @app_commands.command(
         name="test", description="Test command to verify bot is working"
     )
+    @interaction_handler("test")
     async def test(self, interaction: discord.Interaction):
         """
         Simple test command that responds with a confirmation message.
@@ -0,0 +1,335 @@
+"""
+Shared helpers for Discord interaction handlers.
+
+Discord fails an interaction ("This interaction failed") unless it is
+acknowledged within 3 seconds. Handlers that look up the user, membership and
+qualifier before answering can miss that deadline when the database is busy,
+so every button, modal and slash command handler goes through this module:
+
+- interaction_handler() wraps a handler in a request scope (repeated user and
+  membership lookups are memoized), defers it automatically if it has not
+  answered after DEFER_AFTER_SECONDS, and records per-command latency
+- defer() acknowledges an interaction right away; respond() answers with the
+  initial response or a followup, whichever is still available
+- load_qualifier_context() and load_race_for_thread() fetch the rows most
+  handlers need in as few round trips as possible
+
+Usage:
+    @ui.button(label="Start", custom_id="async_qualifier:new_race")
+    @interaction_handler("async_qualifier:new_race")
+    async def new_race(self, interaction, button):
+        await defer(interaction)
+        context = await load_qualifier_context(interaction)
+        await respond(interaction, "...", ephemeral=True)
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+import discord
+
+from application.repositories.user_repository import UserRepository
+from application.services.organizations.organization_service import (
+    OrganizationService,
+)
+from application.utils.http_client import LatencyHistogram
+from application.utils.request_scope import request_scope
+from models import User
+from modules.async_qualifier.models.async_qualifier import (
+    AsyncQualifier,
+    AsyncQualifierRace,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds a handler may run before it is deferred automatically
+DEFER_AFTER_SECONDS = 1.5
+
+# Acknowledgements slower than this are logged (Discord gives up at 3000ms)
+SLOW_ACK_MS = 2500
+
+
+class _CommandStats:
+    """Latency and error counters for one command or component."""
+
+    def __init__(self):
+        self.invocations = 0
+        self.errors = 0
+        self.auto_deferred = 0
+        self.ack = LatencyHistogram()
+        self.total = LatencyHistogram()
+
+
+class InteractionMetrics:
+    """Per-command interaction latency (time to acknowledge and to finish)."""
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._commands: Dict[str, _CommandStats] = {}
+
+    def observe(
+        self,
+        name: str,
+        ack_ms: float,
+        total_ms: float,
+        failed: bool = False,
+        auto_deferred: bool = False,
+    ) -> None:
+        """
+        Record one handled interaction.
+
+        Args:
+            name: Command or component name
+            ack_ms: Milliseconds until the interaction was acknowledged
+            total_ms: Milliseconds until the handler returned
+            failed: Whether the handler raised
+            auto_deferred: Whether the handler had to be deferred automatically
+        """
+        stats = self._commands.setdefault(name, _CommandStats())
+        stats.invocations += 1
+        stats.errors += int(failed)
+        stats.auto_deferred += int(auto_deferred)
+        stats.ack.observe(ack_ms)
+        stats.total.observe(total_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable view of the metrics.
+
+        Returns:
+            Mapping of command name to counters and ack/total latency
+            percentiles
+        """
+        return {
+            name: {
+                "invocations": stats.invocations,
+                "errors": stats.errors,
+                "auto_deferred": stats.auto_deferred,
+                "ack": stats.ack.snapshot(),
+                "total": stats.total.snapshot(),
+            }
+            for name, stats in sorted(self._commands.items())
+        }
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        self._commands.clear()
+
+
+_metrics = InteractionMetrics()
+
+
+def get_interaction_metrics() -> InteractionMetrics:
+    """Get the global interaction metrics."""
+    return _metrics
+
+
+class _HandlerState:
+    """Acknowledgement state of the interaction being handled."""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.acked_at: Optional[float] = None
+        self.auto_deferred = False
+        # Serializes the initial response between the handler and auto-defer
+        self.lock = asyncio.Lock()
+
+
+_current_handler: ContextVar[Optional[_HandlerState]] = ContextVar(
+    "discord_interaction_handler", default=None
+)
+
+
+async def defer(interaction: discord.Interaction, ephemeral: bool = True) -> None:
+    """
+    Acknowledge an interaction so the handler can take longer than 3 seconds.
+
+    Slash commands show a "thinking" placeholder (ephemeral or not, which also
+    decides the visibility of the first followup); buttons and modals are
+    deferred silently. Does nothing if the interaction was already answered.
+
+    Args:
+        interaction: Interaction to acknowledge
+        ephemeral: Whether a slash command's placeholder is ephemeral
+    """
+    state = _current_handler.get()
+    if state is None:
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=ephemeral)
+        return
+
+    async with state.lock:
+        if interaction.response.is_done():
+            return
+        await interaction.response.defer(ephemeral=ephemeral)
+        if state.acked_at is None:
+            state.acked_at = time.monotonic()
+
+
+async def respond(
+    interaction: discord.Interaction, content: Optional[str] = None, **kwargs
+) -> None:
+    """
+    Answer an interaction, whether or not it was deferred.
+
+    Args:
+        interaction: Interaction to answer
+        content: Message content
+        **kwargs: Passed to send_message / followup.send (embed, view,
+            ephemeral, ...)
+    """
+    state = _current_handler.get()
+    if state is None:
+        if interaction.response.is_done():
+            await interaction.followup.send(content, **kwargs)
+        else:
+            await interaction.response.send_message(content, **kwargs)
+        return
+
+    async with state.lock:
+        if not interaction.response.is_done():
+            await interaction.response.send_message(content, **kwargs)
+            if state.acked_at is None:
+                state.acked_at = time.monotonic()
+            return
+    await interaction.followup.send(content, **kwargs)
+
+
+async def _auto_defer(
+    interaction: discord.Interaction, state: _HandlerState, ephemeral: bool
+) -> None:
+    """Defer the interaction if the handler has not answered in time."""
+    await asyncio.sleep(DEFER_AFTER_SECONDS)
+    async with state.lock:
+        if interaction.response.is_done():
+            return
+        try:
+            await interaction.response.defer(ephemeral=ephemeral)
+        except discord.HTTPException as e:
+            logger.warning("Could not auto-defer interaction: %s", e)
+            return
+        state.acked_at = time.monotonic()
+        state.auto_deferred = True
+
+
+def interaction_handler(
+    name: str, auto_defer: bool = True, ephemeral: bool = True
+) -> Callable:
+    """
+    Decorate a Discord interaction handler (button, select, modal or command).
+
+    Apply below @ui.button / @app_commands.command so the registered callback
+    is the wrapped one.
+
+    Args:
+        name: Command or component name used in metrics and logs
+        auto_defer: Defer automatically if the handler has not answered after
+            DEFER_AFTER_SECONDS (disable for handlers that open a modal, which
+            must be the initial response)
+        ephemeral: Whether an automatic slash command deferral is ephemeral
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = next(
+                (arg for arg in args if isinstance(arg, discord.Interaction)), None
+            )
+            state = _HandlerState()
+            token = _current_handler.set(state)
+            watchdog = None
+            if auto_defer and interaction is not None:
+                watchdog = asyncio.create_task(
+                    _auto_defer(interaction, state, ephemeral)
+                )
+
+            failed = False
+            try:
+                with request_scope(f"discord:{name}"):
+                    return await func(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+                _current_handler.reset(token)
+                _record(name, state, failed)
+
+        return wrapper
+
+    return decorator
+
+
+def _record(name: str, state: _HandlerState, failed: bool) -> None:
+    """Record the latency of a finished handler."""
+    now = time.monotonic()
+    total_ms = (now - state.started_at) * 1000
+    # Handlers answering without respond()/defer() count as acknowledged on return
+    ack_ms = ((state.acked_at or now) - state.started_at) * 1000
+    _metrics.observe(
+        name, ack_ms, total_ms, failed=failed, auto_deferred=state.auto_deferred
+    )
+    if ack_ms > SLOW_ACK_MS:
+        logger.warning("Interaction %s acknowledged after %.0fms", name, ack_ms)
+
+
+@dataclass
+class QualifierContext:
+    """Rows a qualifier channel interaction needs."""
+
+    qualifier: Optional[AsyncQualifier]
+    user: Optional[User]
+    is_member: bool = False
+
+
+async def load_qualifier_context(
+    interaction: discord.Interaction,
+) -> QualifierContext:
+    """
+    Load the channel's qualifier, the interacting user and their membership.
+
+    The qualifier and user are loaded concurrently; membership is only
+    checked when both exist.
+
+    Args:
+        interaction: Interaction from a qualifier channel
+
+    Returns:
+        QualifierContext (qualifier/user are None when not found)
+    """
+    qualifier, user = await asyncio.gather(
+        AsyncQualifier.get_or_none(discord_channel_id=interaction.channel_id),
+        UserRepository().get_by_discord_id(interaction.user.id),
+    )
+    is_member = False
+    if qualifier and user:
+        is_member = await OrganizationService().is_member(
+            user, qualifier.organization_id
+        )
+    return QualifierContext(qualifier=qualifier, user=user, is_member=is_member)
+
+
+async def load_race_for_thread(
+    interaction: discord.Interaction,
+) -> Optional[AsyncQualifierRace]:
+    """
+    Load the race for the interaction's thread with its user and tournament.
+
+    Args:
+        interaction: Interaction from a race thread
+
+    Returns:
+        Race (with user and tournament joined in the same query), or None
+    """
+    return await AsyncQualifierRace.get_or_none(
+        discord_thread_id=interaction.channel_id
+    ).select_related("user", "tournament")
@@ -5,9 +5,12 @@ This module registers all NiceGUI pages and routes for the application.
 """
 
 import logging
+import os
+from urllib.parse import parse_qs
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from config import settings
+from application.utils.asset_manifest import get_asset_manifest
 from pages import (
     home,
     auth,
@@ -32,33 +35,62 @@ from modules.tournament.pages import (
 logger = logging.getLogger(__name__)
 
 
-class NoCacheStaticFiles(StaticFiles):
-    """StaticFiles subclass that disables caching in development mode."""
+class VersionedStaticFiles(StaticFiles):
+    """
+    StaticFiles subclass with cache headers based on the asset manifest.
+
+    - Development: caching is disabled for every file.
+    - Production: URLs carrying the file's current content hash (?v=<hash>)
+      are served as immutable for a year; other URLs keep the default
+      ETag/Last-Modified revalidation.
+    """
+
+    IMMUTABLE_CACHE_CONTROL = b"public, max-age=31536000, immutable"
 
     def __init__(self, *args, **kwargs):
         self.is_dev = settings.DEBUG
         super().__init__(*args, **kwargs)
 
     async def __call__(self, scope, receive, send):
-        if self.is_dev and scope["type"] == "http":
-            # Wrap the send function to add no-cache headers
-            async def send_wrapper(message):
-                if message["type"] == "http.response.start":
-                    headers = list(message.get("headers", []))
-                    # Remove any existing cache-control headers
-                    headers = [h for h in headers if h[0].lower() != b"cache-control"]
-                    # Add no-cache headers
-                    headers.append(
-                        (b"cache-control", b"no-cache, no-store, must-revalidate")
-                    )
-                    headers.append((b"pragma", b"no-cache"))
-                    headers.append((b"expires", b"0"))
-                    message["headers"] = headers
-                await send(message)
-
-            await super().__call__(scope, receive, send_wrapper)
+        if scope["type"] != "http":
+            await super().__call__(scope, receive, send)
+            return
+
+        if self.is_dev:
+            extra_headers = [
+                (b"cache-control", b"no-cache, no-store, must-revalidate"),
+                (b"pragma", b"no-cache"),
+                (b"expires", b"0"),
+            ]
+        elif self._is_hashed_url(scope):
+            extra_headers = [(b"cache-control", self.IMMUTABLE_CACHE_CONTROL)]
         else:
             await super().__call__(scope, receive, send)
+            return
+
+        # Wrap the send function to replace cache headers
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] in (
+                200,
+                304,
+            ):
+                headers = [
+                    h
+                    for h in message.get("headers", [])
+                    if h[0].lower() not in (b"cache-control", b"pragma", b"expires")
+                ]
+                message["headers"] = headers + extra_headers
+            await send(message)
+
+        await super().__call__(scope, receive, send_wrapper)
+
+    def _is_hashed_url(self, scope) -> bool:
+        """Check whether the request's ?v= matches the file's current hash."""
+        version = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("v")
+        if not version:
+            return False
+        path = self.get_path(scope).replace(os.sep, "/")
+        return get_asset_manifest().is_current(path, version[0])
 
 
 def register_routes(fastapi_app: FastAPI = None):
@@ -70,10 +102,10 @@ def register_routes(fastapi_app: FastAPI = None):
     Args:
         fastapi_app: The FastAPI application instance (optional, for mounting static files)
     """
-    # Mount static files directory with no-cache in development
+    # Mount static files: no-cache in development, immutable hashed URLs in production
     if fastapi_app:
         fastapi_app.mount(
-            "/static", NoCacheStaticFiles(directory="static"), name="static"
+            "/static", VersionedStaticFiles(directory="static"), name="static"
         )
 
     # Register pages
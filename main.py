@@ -7,6 +7,9 @@ This module initializes the FastAPI application with NiceGUI integration.
 import logging
 import asyncio
 
+# Start the startup clock before the heavy imports below
+from application.utils.startup_profile import get_startup_profile
+
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,11 +20,34 @@ from application.services.discord.discord_service import DiscordService
 from application.services.racetime.racetime_service import RacetimeService
 from application.services.tasks.task_scheduler_service import TaskSchedulerService
 from application.services.tasks.task_handlers import register_task_handlers
+from application.utils.http_client import close_http_clients
+from application.utils.oauth_clients import close_oauth_clients
+from application.utils.asset_manifest import get_asset_manifest
 from application.services.notifications.notification_processor import (
     start_notification_processor,
     stop_notification_processor,
 )
+from modules.tournament.services.tournament_usage_buffer import (
+    start_usage_buffer,
+    stop_usage_buffer,
+)
+from application.services.async_qualifiers.participant_stats_service import (
+    ParticipantStatsService,
+)
+from application.services.async_qualifiers.race_deadline_scheduler import (
+    start_race_deadline_scheduler,
+    stop_race_deadline_scheduler,
+)
+from application.services.core.audit_writer import (
+    start_audit_writer,
+    stop_audit_writer,
+)
+from application.services.core.token_manager import (
+    start_token_manager,
+    stop_token_manager,
+)
 from middleware.security import SecurityHeadersMiddleware, HTTPSRedirectMiddleware
+from middleware.request_scope import RequestScopeMiddleware
 from api import register_api
 import frontend
 
@@ -44,6 +70,9 @@ from application.utils.log_handler import init_log_handler
 
 init_log_handler(max_records=1000)
 
+startup_profile = get_startup_profile()
+startup_profile.checkpoint("imports")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -61,6 +90,10 @@ async def lifespan(app: FastAPI):
     # Initialize database
     await init_db()
     logger.info("Database initialized")
+    startup_profile.checkpoint("database")
+
+    # Start buffered audit log writes (before anything that logs actions)
+    await start_audit_writer()
 
     # Event system is automatically initialized via import
     logger.info("Event system initialized with registered listeners")
@@ -68,11 +101,16 @@ async def lifespan(app: FastAPI):
     # Configure NiceGUI storage
     nicegui_app.storage.secret = settings.SECRET_KEY
 
+    # Hash static assets once (or load the prebuilt manifest)
+    get_asset_manifest().ensure_loaded()
+    startup_profile.checkpoint("static_assets")
+
     # Start Discord bot via service (if enabled)
     if settings.DISCORD_BOT_ENABLED:
         await DiscordService.start()
     else:
         logger.info("Discord bot disabled by configuration")
+    startup_profile.checkpoint("discord")
 
     # Start Racetime bots in background (non-blocking) - they'll start after app is running
     async def start_racetime_bots_background():
@@ -88,6 +126,16 @@ async def lifespan(app: FastAPI):
     asyncio.create_task(start_racetime_bots_background())
     logger.info("Racetime bots scheduled to start in background")
 
+    # Backfill async qualifier participant stats in background (non-blocking)
+    async def backfill_participant_stats_background():
+        """Materialize missing participant stats without blocking startup."""
+        try:
+            await ParticipantStatsService().backfill_missing()
+        except Exception as e:
+            logger.error("Error backfilling participant stats: %s", e, exc_info=True)
+
+    asyncio.create_task(backfill_participant_stats_background())
+
     # Register task handlers
     register_task_handlers()
 
@@ -95,15 +143,30 @@ async def lifespan(app: FastAPI):
     await TaskSchedulerService.start_scheduler()
     logger.info("Task scheduler started")
 
+    # Arm async qualifier race timeouts
+    await start_race_deadline_scheduler()
+    startup_profile.checkpoint("scheduler")
+
     # Start notification processor
     await start_notification_processor()
     logger.info("Notification processor started")
 
+    # Start tournament usage write-behind buffer
+    await start_usage_buffer()
+
+    # Refresh OAuth tokens in the background ahead of expiry
+    await start_token_manager()
+    startup_profile.checkpoint("background_services")
+    startup_profile.mark_ready()
+
     yield
 
     # Shutdown
     logger.info("Shutting down SahaBot2...")
 
+    # Stop background token refresh
+    await stop_token_manager()
+
     # Stop notification processor
     await stop_notification_processor()
     logger.info("Notification processor stopped")
@@ -112,13 +175,28 @@ async def lifespan(app: FastAPI):
     await TaskSchedulerService.stop_scheduler()
     logger.info("Task scheduler stopped")
 
+    # Cancel async qualifier race timers
+    await stop_race_deadline_scheduler()
+
     # Stop all Racetime bots
     await RacetimeService.stop_all()
 
+    # Close pooled randomizer HTTP clients
+    await close_http_clients()
+
+    # Close pooled OAuth provider clients
+    await close_oauth_clients()
+
+    # Flush buffered tournament usage before the database closes
+    await stop_usage_buffer()
+
     # Stop Discord bot via service (if it was enabled)
     if settings.DISCORD_BOT_ENABLED:
         await DiscordService.stop()
 
+    # Flush buffered audit log entries last, after everything that logs actions
+    await stop_audit_writer()
+
     # Close database connections
     await close_db()
     logger.info("Database connections closed")
@@ -198,6 +276,9 @@ app.add_middleware(
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(HTTPSRedirectMiddleware)
 
+# Memoize identity lookups and count queries per request
+app.add_middleware(RequestScopeMiddleware)
+
 # Register API routes
 register_api(app)
 
@@ -206,6 +287,7 @@ frontend.register_routes(app)
 
 # Initialize NiceGUI with FastAPI
 ui.run_with(app, storage_secret=settings.SECRET_KEY, title="SahaBot2", favicon="🤖")
+startup_profile.checkpoint("routes")
 
 
 if __name__ in {"__main__", "__mp_main__"}:
@@ -13,7 +13,9 @@ from config import settings
 from nicegui import app, ui
 from application.services.core.user_service import UserService
 from application.services.core.audit_service import AuditService
+from application.services.core.token_manager import DISCORD, get_token_manager
 from application.repositories.user_repository import UserRepository
+from application.utils.oauth_clients import DISCORD as DISCORD_OAUTH, get_oauth_client
 from models import User
 
 
@@ -80,21 +82,19 @@ class DiscordAuthService:
 
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.DISCORD_TOKEN_URL, data=data, headers=headers
-            )
+        client = get_oauth_client(DISCORD_OAUTH)
+        response = await client.post(self.DISCORD_TOKEN_URL, data=data, headers=headers)
 
-            # Log error details if request fails
-            if response.status_code != 200:
-                error_text = response.text
-                raise httpx.HTTPStatusError(
-                    f"Discord token exchange failed: {error_text}",
-                    request=response.request,
-                    response=response,
-                )
+        # Log error details if request fails
+        if response.status_code != 200:
+            error_text = response.text
+            raise httpx.HTTPStatusError(
+                f"Discord token exchange failed: {error_text}",
+                request=response.request,
+                response=response,
+            )
 
-            return response.json()
+        return response.json()
 
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """
@@ -109,13 +109,13 @@ class DiscordAuthService:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.DISCORD_API_BASE}/users/@me",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_oauth_client(DISCORD_OAUTH)
+        response = await client.get(
+            f"{self.DISCORD_API_BASE}/users/@me",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def refresh_discord_token(self, refresh_token: str) -> Dict[str, Any]:
         """
@@ -139,21 +139,19 @@ class DiscordAuthService:
 
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.DISCORD_TOKEN_URL, data=data, headers=headers
-            )
+        client = get_oauth_client(DISCORD_OAUTH)
+        response = await client.post(self.DISCORD_TOKEN_URL, data=data, headers=headers)
 
-            # Log error details if request fails
-            if response.status_code != 200:
-                error_text = response.text
-                raise httpx.HTTPStatusError(
-                    f"Discord token refresh failed: {error_text}",
-                    request=response.request,
-                    response=response,
-                )
+        # Log error details if request fails
+        if response.status_code != 200:
+            error_text = response.text
+            raise httpx.HTTPStatusError(
+                f"Discord token refresh failed: {error_text}",
+                request=response.request,
+                response=response,
+            )
 
-            return response.json()
+        return response.json()
 
     @staticmethod
     def calculate_token_expiry(expires_in: int) -> datetime:
@@ -262,9 +260,11 @@ class DiscordAuthService:
         """
         Get current authenticated user from session with automatic token refresh.
 
-        This method automatically refreshes the Discord access token if it's expired
-        or expiring soon (within 5 minutes). If refresh fails, the user session is
-        cleared and None is returned.
+        The Discord access token is refreshed in the background by the token
+        manager when it is close to expiry, so page loads never wait for it
+        (when the manager is not running, an expired token is refreshed
+        inline). If a refresh fails, the user session is cleared and None is
+        returned.
 
         When impersonation is active, returns the impersonated user but maintains
         the original user session for stopping impersonation.
@@ -298,15 +298,26 @@ class DiscordAuthService:
             await DiscordAuthService.clear_current_user()
             return None
 
-        # Check if Discord token needs refresh
-        if DiscordAuthService.is_discord_token_expired(user):
+        # Refresh the Discord token ahead of expiry without holding up the page
+        token_manager = get_token_manager()
+        refresh_error = token_manager.refresh_error(DISCORD, user.id)
+        if refresh_error:
+            # Token refresh failed (invalid/revoked refresh token)
+            logger.warning(
+                "Discord token refresh failed for user %s: %s", user.id, refresh_error
+            )
+            # Clear session to force re-login
+            await DiscordAuthService.clear_current_user()
+            return None
+
+        if token_manager.running:
+            token_manager.refresh_soon(DISCORD, user)
+        elif DiscordAuthService.is_discord_token_expired(user):
             logger.info(
                 "Discord token expired for user %s, attempting refresh", user.id
             )
             try:
-                # Refresh the token
-                user_service = UserService()
-                user = await user_service.refresh_discord_token(user)
+                user = await token_manager.refresh(DISCORD, user)
                 logger.info("Successfully refreshed Discord token for user %s", user.id)
             except Exception as e:
                 # Token refresh failed (invalid/revoked refresh token)
@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 from config import settings
+from application.utils.oauth_clients import RACETIME, get_oauth_client
 
 logger = logging.getLogger(__name__)
 
@@ -71,27 +72,27 @@ class RacetimeOAuthService:
             "scope": "read",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.racetime_url}/o/token",
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+        client = get_oauth_client(RACETIME)
+        response = await client.post(
+            f"{self.racetime_url}/o/token",
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+        # Log error details if request fails
+        if response.status_code != 200:
+            # Don't log the full error response as it may contain sensitive info
+            logger.error(
+                "RaceTime.gg token exchange failed with status %s",
+                response.status_code,
+            )
+            raise httpx.HTTPStatusError(
+                "RaceTime.gg token exchange failed",
+                request=response.request,
+                response=response,
             )
 
-            # Log error details if request fails
-            if response.status_code != 200:
-                # Don't log the full error response as it may contain sensitive info
-                logger.error(
-                    "RaceTime.gg token exchange failed with status %s",
-                    response.status_code,
-                )
-                raise httpx.HTTPStatusError(
-                    "RaceTime.gg token exchange failed",
-                    request=response.request,
-                    response=response,
-                )
-
-            return response.json()
+        return response.json()
 
     async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """
@@ -113,25 +114,25 @@ class RacetimeOAuthService:
             "refresh_token": refresh_token,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.racetime_url}/o/token",
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+        client = get_oauth_client(RACETIME)
+        response = await client.post(
+            f"{self.racetime_url}/o/token",
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+        if response.status_code != 200:
+            logger.error(
+                "RaceTime.gg token refresh failed with status %s",
+                response.status_code,
+            )
+            raise httpx.HTTPStatusError(
+                "RaceTime.gg token refresh failed",
+                request=response.request,
+                response=response,
             )
 
-            if response.status_code != 200:
-                logger.error(
-                    "RaceTime.gg token refresh failed with status %s",
-                    response.status_code,
-                )
-                raise httpx.HTTPStatusError(
-                    "RaceTime.gg token refresh failed",
-                    request=response.request,
-                    response=response,
-                )
-
-            return response.json()
+        return response.json()
 
     def calculate_token_expiry(self, expires_in: int) -> datetime:
         """
@@ -158,22 +159,22 @@ class RacetimeOAuthService:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.racetime_url}/o/userinfo",
-                headers={"Authorization": f"Bearer {access_token}"},
+        client = get_oauth_client(RACETIME)
+        response = await client.get(
+            f"{self.racetime_url}/o/userinfo",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        if response.status_code != 200:
+            # Don't log the full error response as it may contain sensitive info
+            logger.error(
+                "RaceTime.gg userinfo request failed with status %s",
+                response.status_code,
+            )
+            raise httpx.HTTPStatusError(
+                "RaceTime.gg userinfo request failed",
+                request=response.request,
+                response=response,
             )
 
-            if response.status_code != 200:
-                # Don't log the full error response as it may contain sensitive info
-                logger.error(
-                    "RaceTime.gg userinfo request failed with status %s",
-                    response.status_code,
-                )
-                raise httpx.HTTPStatusError(
-                    "RaceTime.gg userinfo request failed",
-                    request=response.request,
-                    response=response,
-                )
-
-            return response.json()
+        return response.json()
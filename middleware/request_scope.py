@@ -0,0 +1,63 @@
+"""
+Request scope middleware.
+
+Opens a RequestScope (see application/utils/request_scope.py) around every
+HTTP request so identity lookups are memoized per request, and reports the
+request's SQL statement count in debug mode.
+"""
+
+import logging
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+from config import settings
+from application.utils.request_scope import request_scope
+
+logger = logging.getLogger(__name__)
+
+# Asset paths never touch the database; skip scoping them
+_UNSCOPED_PREFIXES = ("/_nicegui/", "/static/")
+
+
+class RequestScopeMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that binds a request scope to each HTTP request.
+
+    In debug mode, adds X-Query-Count and X-Identity-Cache-Hits headers and
+    warns when a request exceeds REQUEST_QUERY_BUDGET statements.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initialize the request scope middleware."""
+        super().__init__(app)
+        self.debug = settings.DEBUG
+        self.query_budget = settings.REQUEST_QUERY_BUDGET
+
+    async def dispatch(self, request: Request, call_next):
+        """Run the request inside a request scope."""
+        path = request.url.path
+        if path.startswith(_UNSCOPED_PREFIXES):
+            return await call_next(request)
+
+        with request_scope(f"{request.method} {path}") as scope:
+            response = await call_next(request)
+
+        if self.debug:
+            response.headers["X-Query-Count"] = str(scope.query_count)
+            response.headers["X-Identity-Cache-Hits"] = str(scope.cache_hits)
+            logger.debug(
+                "%s: %d queries, %d identity cache hits, %dms",
+                scope.label,
+                scope.query_count,
+                scope.cache_hits,
+                scope.elapsed_ms,
+            )
+            if self.query_budget and scope.query_count > self.query_budget:
+                logger.warning(
+                    "%s issued %d queries (budget %d)",
+                    scope.label,
+                    scope.query_count,
+                    self.query_budget,
+                )
+
+        return response
@@ -10,6 +10,7 @@ from typing import Dict, Any
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 from config import settings
+from application.utils.oauth_clients import TWITCH, get_oauth_client
 
 logger = logging.getLogger(__name__)
 
@@ -71,26 +72,26 @@ class TwitchOAuthService:
             "redirect_uri": self.redirect_uri,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.twitch_auth_url}/token",
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+        client = get_oauth_client(TWITCH)
+        response = await client.post(
+            f"{self.twitch_auth_url}/token",
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+        # Log error details if request fails
+        if response.status_code != 200:
+            # Don't log the full error response
+            logger.error(
+                "Twitch token exchange failed with status %s", response.status_code
+            )
+            raise httpx.HTTPStatusError(
+                "Twitch token exchange failed",
+                request=response.request,
+                response=response,
             )
 
-            # Log error details if request fails
-            if response.status_code != 200:
-                # Don't log the full error response
-                logger.error(
-                    "Twitch token exchange failed with status %s", response.status_code
-                )
-                raise httpx.HTTPStatusError(
-                    "Twitch token exchange failed",
-                    request=response.request,
-                    response=response,
-                )
-
-            return response.json()
+        return response.json()
 
     async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """
@@ -112,24 +113,24 @@ class TwitchOAuthService:
             "refresh_token": refresh_token,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.twitch_auth_url}/token",
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        client = get_oauth_client(TWITCH)
+        response = await client.post(
+            f"{self.twitch_auth_url}/token",
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
-            if response.status_code != 200:
-                logger.error(
-                    "Twitch token refresh failed with status %s", response.status_code
-                )
-                raise httpx.HTTPStatusError(
-                    "Twitch token refresh failed",
-                    request=response.request,
-                    response=response,
-                )
+        if response.status_code != 200:
+            logger.error(
+                "Twitch token refresh failed with status %s", response.status_code
+            )
+            raise httpx.HTTPStatusError(
+                "Twitch token refresh failed",
+                request=response.request,
+                response=response,
+            )
 
-            return response.json()
+        return response.json()
 
     def calculate_token_expiry(self, expires_in: int) -> datetime:
         """
@@ -156,31 +157,31 @@ class TwitchOAuthService:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.twitch_api_url}/users",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Client-Id": self.client_id,
-                },
+        client = get_oauth_client(TWITCH)
+        response = await client.get(
+            f"{self.twitch_api_url}/users",
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Client-Id": self.client_id,
+            },
+        )
+
+        if response.status_code != 200:
+            # Don't log the full error response
+            logger.error(
+                "Twitch userinfo request failed with status %s",
+                response.status_code,
+            )
+            raise httpx.HTTPStatusError(
+                "Twitch userinfo request failed",
+                request=response.request,
+                response=response,
             )
 
-            if response.status_code != 200:
-                # Don't log the full error response
-                logger.error(
-                    "Twitch userinfo request failed with status %s",
-                    response.status_code,
-                )
-                raise httpx.HTTPStatusError(
-                    "Twitch userinfo request failed",
-                    request=response.request,
-                    response=response,
-                )
-
-            data = response.json()
-            # Twitch returns data in a 'data' array with user info
-            if "data" in data and len(data["data"]) > 0:
-                return data["data"][0]
-            else:
-                logger.error("Twitch userinfo response missing data")
-                raise ValueError("Invalid Twitch userinfo response")
+        data = response.json()
+        # Twitch returns data in a 'data' array with user info
+        if "data" in data and len(data["data"]) > 0:
+            return data["data"][0]
+        else:
+            logger.error("Twitch userinfo response missing data")
+            raise ValueError("Invalid Twitch userinfo response")
@@ -0,0 +1,372 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `scheduled_tasks` MODIFY COLUMN `task_type` SMALLINT NOT NULL COMMENT 'EXAMPLE_LOG: 0\nRACETIME_OPEN_ROOM: 1\nCLEANUP_TOURNAMENT_USAGE: 2\nASYNC_TOURNAMENT_TIMEOUT_PENDING: 3\nASYNC_TOURNAMENT_TIMEOUT_IN_PROGRESS: 4\nASYNC_TOURNAMENT_SCORE_CALCULATION: 5\nASYNC_LIVE_RACE_OPEN: 6\nSPEEDGAMING_IMPORT: 7\nCLEANUP_PLACEHOLDER_USERS: 8\nRACETIME_POLL_OPEN_ROOMS: 9\nSEED_POOL_REFILL: 10\nCUSTOM: 99';
+        CREATE TABLE IF NOT EXISTS `seed_pool` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `randomizer` VARCHAR(50) NOT NULL COMMENT 'Randomizer type (alttpr, sm, smz3, etc.)',
+    `settings_hash` VARCHAR(64) NOT NULL COMMENT 'SHA-256 of the canonical settings JSON',
+    `url` VARCHAR(500) NOT NULL,
+    `hash_id` VARCHAR(255) NOT NULL,
+    `permalink` VARCHAR(500),
+    `spoiler_url` VARCHAR(500),
+    `settings` JSON NOT NULL COMMENT 'Settings used to generate the seed',
+    `metadata` JSON,
+    `generation_ms` INT NOT NULL COMMENT 'How long the external generator took, in milliseconds',
+    `claimed_at` DATETIME(6) COMMENT 'When the seed was handed out (null if available)',
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `match_id` INT COMMENT 'Match this seed was pre-rolled for (null for the warm buffer)',
+    `preset_id` INT COMMENT 'Preset the seed was generated from (if any)',
+    CONSTRAINT `fk_seed_poo_match_5b2c1e7a` FOREIGN KEY (`match_id`) REFERENCES `match` (`id`) ON DELETE CASCADE,
+    CONSTRAINT `fk_seed_poo_randomiz_8d41f0c3` FOREIGN KEY (`preset_id`) REFERENCES `randomizer_presets` (`id`) ON DELETE CASCADE,
+    KEY `idx_seed_pool_randomi_3f9a2d` (`randomizer`, `settings_hash`, `claimed_at`),
+    KEY `idx_seed_pool_match_i_c71e4b` (`match_id`, `claimed_at`)
+) CHARACTER SET utf8mb4 COMMENT='A pre-generated randomizer seed waiting to be claimed.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `scheduled_tasks` MODIFY COLUMN `task_type` SMALLINT NOT NULL COMMENT 'EXAMPLE_LOG: 0\nRACETIME_OPEN_ROOM: 1\nCLEANUP_TOURNAMENT_USAGE: 2\nASYNC_TOURNAMENT_TIMEOUT_PENDING: 3\nASYNC_TOURNAMENT_TIMEOUT_IN_PROGRESS: 4\nASYNC_TOURNAMENT_SCORE_CALCULATION: 5\nASYNC_LIVE_RACE_OPEN: 6\nSPEEDGAMING_IMPORT: 7\nCLEANUP_PLACEHOLDER_USERS: 8\nRACETIME_POLL_OPEN_ROOMS: 9\nCUSTOM: 99';
+        DROP TABLE IF EXISTS `seed_pool`;"""
+
+
+MODELS_STATE = (
+    "eJztfWtz20bS7l+Z4pfI51C2JVt2orPvW0VLtKNd3ZakshczhQLBEYkVCDC4SFG28t9P9w"
+    "zuGEAACZIANVu1jghMN4Bnrv10T89/OwtrSg3nbW+pj6wHanZOyX87prqg8EfmXpd01OUy"
+    "uoMXXHVisMLqUldcLMYuqxPHtVXNhTv3quFQuDSljmbrS1e38Cmd3u0FYeWJ6jiWpqsunZ"
+    "In3Z0TlXgOtd+imqmlgR7dnJWSGJtjc+haNnXgylx15sS6J+6c+lKPquHR/8cuLA1VN136"
+    "u+vf0h1imcYzcebWk0m8pWUSzaYqvit7D8/Uf/MofN+MgrgNb/P9V7ism1P6O3WCn8sH5V"
+    "6nxjQBoj5FBey64j4v2bUL0/3KCuInThTNMryFGRVePrtzywxLw5vi1Rk1qY3fDNdc20NI"
+    "Tc8wfPwDlPmbRkX4K8ZkpvRe9QysGJTO1EtwMQa8f0mzTKxTeBuHfeAMn3J4fPTx88cfP3"
+    "z6+CMUYW8SXvn8J/+86Nu5IEPgetT5k91XXZWXYDBGuLH/ZpA7m6u2GLqgfAo8eOU0eAFU"
+    "MfR8bELwgiIRelErrgm+hfq7YlBz5s7h59H79wVg/dIbnP3cGxxAqTf4MRb0LN7prv1bx/"
+    "weIhohyJq2gv2gCo5JqZXQ3H5bTID56WMJLD99zIUSbyWR1B0FxjL9UdAgv1iWQVUzpzvH"
+    "5VJQTkBwFSzLNM0Q3pXQLEDvy83NJb70wnF+M9iFi1EKxrurL31oqgxdKKS7NN7fI0zZ+E"
+    "qniupmQT2HO66+oGJUk5IpWKe+6Nvgj01hvGaLhW+Y3sCU49dWAeaji6v+cNS7uk0Af94b"
+    "9fHOMbv6nLp68CnVukMl5B8Xo58J/iT/vrnuMwQtx53Z7IlRudG/O/hOqudaimk9Keo01m"
+    "+DqwEwiYo1VMdVYD5epWrTsjVU7vaH9pbUZfDZhZVJf1/qoG6FqkxKyorccUXiAlmptBaN"
+    "Sby8IG3IqFrDmhQX8vcPwiUpIpIF8CsYHPrM/Bt9ZjhewBuppiaa8n176s5X0zz8/gzaQH"
+    "A16na2+hQaN/GmAZ8HH0X5LH/WG571zvsdBuJE1R6eVHuqJNDEO9axlboSls3eWhwv0ldU"
+    "U52x78evwHcODFXn2dT+7qmGDgJ2R2TKJkt0Cw1aLKv8FhQua9aiFAkfQZhigS0rLIYGLL"
+    "8TPZaohmE9ocX6jL9ci2jWYomIE3gTNHVRYG5bpuU5xnOXW8RU1eZjkwthOXgsWVJ7AVrN"
+    "B4fc29YC7GFbBxmyhJUoqHHRMtZtghbwEjS/JUON29I2HZuaamiewUzuiQoTNNjL5F43dT"
+    "CycfwmNoWbsNLFF1RB3uaXD9RHaOMzyixxa0lO3kh7+hXY07sY+xM24PHJSQkjEErlWoHs"
+    "XtJkib9ZBskR/T2nEabEWkJQFC1++v8cJdY9AWoHV71/vkmsfS5vrr8FxWMon13efJE29s"
+    "Zt7Lk+pQoM4fDGTkVY06JbRFY8szYM2qnuwOw4VbS5aprUEC6tv+iz3JlJLL/SQjs9Nmxp"
+    "pvrp+PjDh8/H7z98+vHk4+fPJz++D6es7K2iuevLxTfEN1EPWcBtz3QUWMIoS7/pJbEewt"
+    "LGyEU7I7w9i+ZobaA/HH/+FEKLP4rAHF71Li+z6OHkiLSZSxdL0VhQDF9Wenv4HTYDQJv+"
+    "5uk2DImwMsaVrXJv2Qo3EbBxVRxdS2iTA654wAUz0YS3ESD+1+HNdfFgG5dN4Xtnwld/n+"
+    "qa2yWG7ri/tm1Rhl9fvChLr7+6SZYJFaQXZWngYLqi2sNK1O4LqiRBuGOCUPpj9tQf4y2n"
+    "K1ZsUlJW7E4r1n/5qF4te6aa+h8sSKUasy+QlAx/BtMamP6blLrm4VmW8Rc0marMf4Sy6k"
+    "11VzEs0SLuiy/79W8DxigLOTMhm99DrZfWrF1AJ13n+iO3CWoF5hK0DlStoQN0KWCYi6JO"
+    "TG43aE5tAY/a20gL28f2PInhyPKiRzE+BpX2LCrJ8bCEjxHLEyhP7i2b+/8ihyFBNhzAEv"
+    "gcS4mhD3IEz39gnkfiwIQHBTTVdIMiRDfT0g5XqWmWZ8Jn6mDGP49N1ZySKZ14sxm8gfT7"
+    "7cbvxyutiucvkmin728jwbRT6qq6aA4q8vuFItLnJ/T5Sc5hL0zTLOfgWp6Nf5tuNcs0I/"
+    "ea7NLdhuvtYAvEZm35qC3VYMlnA8ea1wbL2vKZTia25NPNsQYUS0Y+7mzi24/Ax9Def9Fc"
+    "iTMD5c2VJEvxsrmCT2GxioQ+QqMTWR8Ca6WUFBorA7qEiQuK4K4/R5vTqWfQKRd9AiODMj"
+    "uGGvpMhw/C0ERX1/SligKsEG4IdACmselQEHT0BTQp1aQsnhLjHBGiEa4nZrO3ZMBjYjAq"
+    "kuAcuAA7W4MnPBObooOLTuGt7kxDfwCtoGYKteu/OI/XPIBmrD/qU/iKLjwbFwGHLKTyDX"
+    "oeH8OwTpuejs1DMgy/SHWJs6QaWmMsuNLB2zdLarKYy/g3RlZd/Gux+M8wz/PgzdhH+Zso"
+    "g48hPOyHYLU+YG1Iw20Xhhtd6g50xmqrgKRQm8KJals6hUPACmZFWlZ6pXfslYYBSZsrru"
+    "4alYKXU2ItMb9TIcylaIzjAhrjOEtjhAFHjuHNqiCaEawF0+1uDN4sojNLFcQllkA0EGxn"
+    "K91EoL1tWQvFgpWNEgyyVQbxrLQcxnc8jMNC2PUE5Gl+74gktkdCR9N/p67u8bFM7/iY3z"
+    "k+ZvqG5Ez3lDOVcVp7UbHZ2IVg22U1Sy4t9opI3XTkR0XgIonX6j3ApaXClkFL27rXjYok"
+    "Qp74K22C0pm1AoDSMbMVx4x4M9yaKLYvOC6NZGwOKIFhMNPWD2Rcc+PGydJgplYiLyOamU"
+    "BqQBb9FQNQeRtpbC2ieRPs6iHVMT9P/QHEJYNDm4P3FmNDoy7+orc1MRqUd7dGaVvKuVvD"
+    "x7xj7kzmN80EbLKkL1mnawVZdL32VW0epZUhGpSdcP/llEyeCfpR9aVBg+Q1b8loTqPcML"
+    "pDoqwyY1N1mCc2njCGpW5dkpN4phlHBpLuxh/p2ZXobb94O0NIT0p5Ck4KPAUnWU+Babmi"
+    "cTk/gDQUaIlnYNvhozCS5DgIvhqWmkcPxIRSuN6jVNuQPb+5+3LZJ7eD/tnF8MLfAx7SX+"
+    "wmXoq21g/6vUsBkKvTj1lp6W+Rm7kllyydBLJiSzsJJM29Nq8oubDVuLAy/MLOdyY3iFyQ"
+    "G3F3RrZgZ3yZZ/G7bAWKJdheXoJdgaLITcST6QpZEgG5UlqU5QGOES5IrMzVRxpjVPCNuw"
+    "R32AaZgRee40a5gVWiUduFahqbpreYgBJ4MuYW47l/KWNuAg5IwKZ8T7lpGOK/So5lsxyL"
+    "TNK7duygTNIrN+xK80Pala+yYjPrUxm7ssIMLWNXNha70gpbs0EwiwNV6k2FVSFIpUnIbM"
+    "/sLLeZuvpG6gp7qC/CPcN8zzKmYCphcpYTi6d8Ig6Ihi77H/BcGJb1G3cfq5Hp2gVVmuFN"
+    "8VwZmNfhP92xyfdscKsUk/3iTd0EG3chT1LdoVEZZF7me81XPqkgId6uUOAtH1XgI7XyBj"
+    "aRvHSp7til6lcKYm157jr1mlYhq3b3uxPt1Wo0KSkrctenlZrTlaoxLicrcfe9sQ17hWFy"
+    "nvrJcWoKOSwVcVgQcJjZRR+c2ENFK77i42kSkvIomsxRVPDlSuV4zrScdDIInQw+TI/WVK"
+    "kYc5yVbAnEW4g+RiOuWqRsKCHDZGMQrhEoK5KXy40dLzds+qjTJ6X6qiMj2OLFx3G5xEgF"
+    "eZGyiw9EZ6VukhKVPaQRPWSlBU9GsiXz8daXPHwswWMhKSboVCbPijjn7gvr9nw1chFfBD"
+    "keb+pUixjKVSDbuIwd2t8QExk7tKcVm38aWbXQobRYu1yF9SWu2mHar5bGXQntB1jCVEte"
+    "lRF8pQ1Qhv6tCeD2z2BpKWgyXnI7ub4akaeqwZhWT1S13XNtGgzdiwfbCBeGtTfEVm4ITW"
+    "OZXgCXyJcWrVm21xqbC2B2Cdeow5aKToMtd/7rWue9BsfyEOyzZU97FQuxfaYuiEw8lzqn"
+    "Y5PA//TpKbm19YVqP5MH+swvotgp8ZsiXsYzh7Chkae5hWHBGOVLpzyDF9PO5eLnhp+SG/"
+    "ZJqoGvFFcUPyedHLjUxNNmoZm49Hf3DVfElZ6SHvsvwSb/zmSHNuFd/6jNU/LX4c01YRXp"
+    "H2rEi/v3/Q9cog0MZjKUv7gl/t9BwjH8Ul4uop1OCZ6UBP1usQyKRYekyohmeabtJhbm29"
+    "gqm3OmLfainGDw3DNt70z4wO9TXXPxGDPH/bXJU5AIRPzoYtI7zW93k4wbKkiT3tFYU6W1"
+    "JqVa4k+QB19Imnkl/0F8jVCNbxFIbojsa+QEKY8LrpGpkkfcrsAExDtgDeDdpNQ1rduWxV"
+    "AwLjXJgo3DfEUxOdDAYoBm7Nmckt0i6zbx8QsmpNggVdLYvVLN50PXOoS3xyN1+V5mZ64v"
+    "yYS6T5SaCZuS8Ac4bM8pe0rWEl5bI0/HxK8LcjGxQv7W2rim/NRKXBXeRtlMWqWwAFz/Hi"
+    "sibcg6bUjHgbFppfVkSlQuKBu2oAzrp6rvOCv4itZGiWN3+bBdCbyEzGtyfyZPLq182Ja1"
+    "3vlaLQWtYCUezY41LievQqXNw7PssjLRw0p4laxaDt6Joxis/tqLYay7vYxgbD6QpqFoek"
+    "xAOOyPyPXd5WUTzJoyBk1FU6aCDTNgFgE6oLJWATmYWO6cTDzdcA/Z7SnRPMe1Fm+ypsuq"
+    "itBi+RLc4PbJge4orKxu/s8IKvfN6dg8JD1YRx36/Ch5mqdtITyih9/EwhgmokMbgHZCoO"
+    "3p0BQIbn/SNdUwntEC0gBDcmBaLv7ApfdEdegblD1TTbw8AbvJmqKvf9oFWwxrB/6wbMKb"
+    "0RRe8x6eqhiW9kCn/EVRfAgFiarZlgOGmWEk3tLBrz1jXy741q9YRfxjz/zvnDwnv1KdLn"
+    "TUIv7CR10lt5aha89D+FaKITvw5pgSh4l89fDbOfCgcMLblNDsS7Mlwpy62WLRx3CDUHCf"
+    "wyWtRJmQdy2nzVGpjcdHBRuPj7Ibj2VC3g1uqomNDRlsC7eKJQXl5rAMrP6QWhnVSE6CKh"
+    "24r4JvkxvA9qJiMxvAgm5XlUbNyL1SFnX3gQ37Rw7u1uPcYGKrtM9Z3MMlvyUYtyrTWxkP"
+    "CqfMkDNYM2d3vie+PU02uZsJKRV93RzvCAInZ1oGxSaJ0BRb1RHwoOki3SIalFXVM8t0RM"
+    "OmXClnOddAQg08OL9/f0819x0P6XfeDahjebZGnXdnFojm7GuoRSsyhrhkw2h/fsy5Vswf"
+    "vs3wqSDpk58sK3qaNfTJUPYkNn46jIKk7OVOybjTu7y8+ce4g9znuHPev/7XuIMF/K0Z/k"
+    "4G1bbVZ9xy4O9j4DDAC9K3s7dd8n0c20d4yoevMSCWuMzX2OPOr4xItQM40k8IbpAl5n60"
+    "zZyH/B+uP7Gv47/wC0bMP4NnaCHQ/kOsyX/gq3n1hDehAg1rBvAdWP62kDc5zKncTrFZkp"
+    "M3yio0ZyTRVqKzFM9ZQHOmWU6/32ZBzN9LEROpYS/F7ia3rW2mCMeuKignhCTOZXCOxu8q"
+    "QCel5O6gEkBL14jMNyZZSUk3v8qKDc3gTIDQS9wKi+Gq4Ry01pIHma1fNYCB7F0rwdgkkx"
+    "JrIQISJdl+8vkT1l7jfNfL3MklOx48HXaUSpWAz88SJOVFa2BBppb5g8v3w/hsjB8alb/5"
+    "JQhLTbNKgkgovvUFY57EhSULUCMLINdLezGtZtdL0o27ZibP1NhTMaGnWPo1uXPlBpkVQC"
+    "vwgcuNHetu7MgsJ9ZHU+BRay+YOYOWDCjYdkDBJo2bmMUnMG6S9mC+ccPsz2rGzbluozvQ"
+    "NxhiIRJopaA+sD0mz0u8Yc64oSHYG7OSFraV3zCsJ4fZO1js0FlSTb9P+XHRV2l5Lt/+gg"
+    "pUpgIUDDVriZnuLDwsOxAtt+8/yDGSDmIqYQoJRaURJI0gaQRJI0jGsrYDRGlJtjrnWUtB"
+    "K7AkZf5z2rqsZw1GcaUYdGmLS1v81dviX7ifbaQ6DzeP1Lb1Ke0IjHJRsW6Rde777xQXJB"
+    "TLFylppvsPIyhLAlnCHpK1xosKo9E9dKHFOeEdbn6HuStQCuz2ueoS1aaCIOozz7ah7RvP"
+    "xEKHpeMtl5YNpj414UvhFd5NdYf/xXV1QbfLcvVNKKG/uxTa33Rs4kMttMeDF0GciENdl4"
+    "VV45vMKbn3XM+meWa8jEberAnOmqoIvPxw5JhIPfHIG8dw88nddUfBAONHgafgpS3skdwW"
+    "t7BvLLhQ7mCX7FBXhhS+hoqtGlK4yRXdue5gINQ3WOIk1wWi+4VruCkvqcywaGkXC5MhTD"
+    "3B8EDfZSFIUZzyqpQTxDXdgC6hppjLRSWBINgJsLTia7m56sD6i+IqzjSp5gpVdcemih4Z"
+    "tnaD1dfEYtFq1pL1Er4mA12+XraHLC4euW/8A4Py3S9pu50BiuuGtLtFrulqXtOFSGfXIv"
+    "osF8C41KYIu80A+dPx8YcPn4/ff/j048nHz59PfnwfIpq9VQTtl4tviG5i+MyuSzhQVXOV"
+    "JaXauZFvI0tnv91p1Y6YSkq1ZFPOFtCEUZvle1RYmsWK1khWWGbVaredFw64DcYUliDQKe"
+    "7dFeyBlGgNBkGzduo1aP0ffHYpv7802Vtt2UmTfU8rNrOfjZucleN00mKvycEv43Rkzrn2"
+    "+PvDnioDTwTj1pbPiYslAXrE2IIo05NgOzEepDay8N+S1TMKtTXRCVdQRez9lRRjm/wadp"
+    "AcnYaFApaW4xhxtfeWzWrigeJcHUul5Vd4WFV+AV9PnPty57blzeYp8SwtLGw7cF1Js41/"
+    "lmGuh9qcTj2DTvuPOUnkxAW7ZbhsJ5DheJVktUd4ir0TUc2BEsKVxOjqCCeyUF0oJ8gkt5"
+    "Y25L9zJTGGAalsU0UDm18lzrPj0gXy2Umq3BmbPPBhuaSqHcQgjDsMTWfcgWIsUdRbMprr"
+    "Dg+pgNeA9gr/d1jhBcjCR43N8EBDzyZX+KbBdmx2Ooj/3B+c9BuTi/PcDduZnQgMgWC0Sk"
+    "0AbK92WMeu6nqO3KRQO5ue6jyVeXWxfD2LvS1hu2WCnePkGN6sCiOclGolI/yxTKK8j/mJ"
+    "8j5mjwNJjg4V4MxKbs9nEfWZTl3QHpeB9jgf2uMMtJLr2gtKRHJde1qxGa4rvpQquQyKi7"
+    "wmekZyXBs+dBXbVQ2MzFWgp3kIlqVkEgaO3Ay0cXJwN/F5ZzZ96ghIDXa9W8RhaEGJl/iK"
+    "fEjltoKtG83ipDlobfRNb5HpnZkURNu1N4RYds5urq7616Pe6GZwSjRrgYyU6lr22BwNem"
+    "d/6w+wVqB3ULgygLXJoN+7wouwYHFhEbXgZHkjToWE7mVbj7TqAXtxMRkJJM2/PbQSpPm3"
+    "pxWbMf+CwaxysENW8JVmJZEGtEydIVNntCh1hqQZVqQZYkP+9lpdc7M5ZGfAJnELvHUKyI"
+    "Ww2eazC2EPkfRC02aDbimffPVVelpWbhrY9aaBOdUwKk83VzGm08KyOndcnTAb2qvZz0lJ"
+    "WZE7rsh73dSd+Uo1mRKVVbnrIdYy73V7sRpdmZKVlbnzylyIM/fln2EYE2lJYFxRhW3i/E"
+    "JXd/M8VmJIQ4GWALqFvedQio0AysxSjSpYZgQlphlMdfNRd1V+dHdFN16uDrkRXYw1G365"
+    "m25VqFMqJNJJG2FJ6XSmLuBNFLrUHWta8ZiifAW1+GbawY9IZ/Se+SylM3pPKzbjjOYRQo"
+    "o2V02TGhXHPpHsK3VJZzZ4lsQwIyf9rCk8a/B7rbchuTnur0xjedmBmOyjNWA5ZArPIn2N"
+    "69pl0RQOX1X9idkdbtHO5tRyvcKp3LlbrNvTdtPLwidlQRcTaq+JTBCn3VIglob6vDYGzJ"
+    "18G2lqKxZov04VBwyoNQG5ZZqGlAcIb2tA6vCt9i5uz8ePIE+qQ5Y2PbQtw/BPVj9ASfYX"
+    "btiH71mQiXd/T2224KsJyOAgA8XxJsFJhusBGk2Y7BuH/gNa1tgqxXrE4RTGp/tiNyYdWf"
+    "BPyW667UZZbxcNWSTbshZ1YDLwFQ58fVvrqz3HsTRd5bmok2k9yIF+T1Tzed0uuUq0UDCK"
+    "5wUNxUb5F2KHYjOLDCFqmqHTLQgh4i5qxVbNhwoApqReqdXNj/+lPDmEcCdmvq9HJNtKd8"
+    "9JmX1aJ/nbtE5kRon9JPski7unFSszSsgNMU0hauXWjhW3dsidRGV3Eu1wNwcz3/OMs8C2"
+    "f8EyC/iElxNdfoOHMCrp3eDmiuh4buWCrU0Zg6QG5urR6RE/EIm9xZtsiss19EgDcOsGoG"
+    "dXilHzi7fz4J6TUkklTgqSSpxkk0rE3ywDZH4sakqsJbbftuNRpS24FyaDtAX3tGKbaQu2"
+    "YU7OGDVV1pkvGkCBT2TT5s8O0+VXNH7qW5onY1AEy/NMkEr+Ep1HgcTiY6T3pGkdtWjxXP"
+    "X0y3rPvdyDA+P9KKiKRkhSqiVL5y2gKY9llAnu5EK1Iy2QV1SxGQtEJuqWh9GtjWdZu6OG"
+    "fNMpW47WEZ7byAVQPZGSFY212OYLgaWW3JqRb6Yl94NIG61pQ1e3sTbaXtgV0sWxQReHNN"
+    "rqN9r8hPQKNfFLq+Z7F0hLfF9MEcGi9EWLl6qJIiJFMtl+CnYARrGW1FQWuum51FEm9B4W"
+    "3xUWBkUqtmfsfHq/6/VCDFT6m6fb0OqCpohHsFZtxnk6ZAvOGTj89149R1JaQUtWF1tYrf"
+    "mjqOi04wpNukCLbNQpJ0YKoxWXHUVq5PojaZAkzj2/1w1XFM1a7pylPF1bPOdVNVhtpjcN"
+    "Xl6eErg1NvmhSsrN9eW/Tonv/LJM43lsXt9c96EqLJN/185Pg+UgTj2bM2L+GqPC+iRfwf"
+    "ZWJ0fHDVqeJFJ8rTauiDXIUbwA6JWO3s7XIBcnmWwBGBXOVhcLNYvxX4c31zkY58inEL4z"
+    "4dO/T3XN7RJDd9xfG4l3AbyIQDHVlGaVuklHGipIU03wdGj+SlF2o8KRRCgvx5G0iWNOrY"
+    "X+R96KJM+uiUu1cryofyfwEtoyhVGUGlRjywEblseC1UT+cJGvQQ4YJQYMGfyyFzESMvhl"
+    "TytWBr90NsEIqxp3QihL27rXjYpJmfPEX2mWlJCxnVgVs5MKJF8thsHqUPFXNBWBFIu/Ij"
+    "RlcNsGg9vyunsNaAYp275YzWybZbEUjGXlsEzMJDUBivnvbiONrQZVNNOWQTY1ItaCbKDz"
+    "NlTZYmjFU0ZLolsbNKomGY06MvBGUavtT8PrOeqMKiziCnXVhMsdam0ZKmtGQec5R2eebo"
+    "gyHF+p5vPIwn9LDm9+VvBvqG8VaHe4VZh9gZKK/U5/j43ti06VpCsz4ro5hpbNauOBPseg"
+    "Zhj7A2RYYX6RTNZ8d25b3myeuhdUWlRdwpEWrisZ4P8sGQFfkO5VOKSUiYeXiV9bGhYvqd"
+    "29YAAltbunFZtZKckzflYaAWW+TXkwUvMORpLpN2mj029eW65+r2vM4Ly0Zh3BkjldpHDB"
+    "bMYKK4Y1K7dg7oBeYt0TB5rWO9V16WKJR0jElTnZ/JtlhMbm2Byh0e1ghGniJoGX1x+p/U"
+    "x8YYfn7fSmOkZeEdWcQpGJN5vBr5JZO7+HDT62eIQy3zvBw1gefM/hF33TC9v6r3LhX/PC"
+    "PwZuefySQq9pMoyP2olevIDGblVpgznSrxVMP9IbmmkWw/yArqRUDUFcq0Xs/+XeM1lAGZ"
+    "l4ugHjovMWH/u/nbVnzK3FdqVHXlFDLrF7Iqtlew06G6bfue1fn19cf4N7Y3PYvx6dkqOx"
+    "+bV3cdk/h5Y6Ngf90eBfrMCH9MRZ2Ow/HH/+FLZ4/FHU2IdXvctLQYu3bcuGnu8E7HQS7/"
+    "yN9BnBlsSHbnsrvU1daIma5YnMk/zoiKTULpvvzgZjyQbuBWmUZQPRClihVmNiNVRps0ae"
+    "BtVg8NmS0N3/vilwfUs+cl0+UvJo7eHRht4kDkEhoZYo2y3NrDkxsZIUG1Y9icsR1yLMyn"
+    "yJZystiWQbFnaIppqBxIRicWdJNSzpy7HWzxg2bW5ZDiVz6wmLQWGukk5B29BaUC4AZW1K"
+    "lqDaMlWDHNC3s7dd/4CdMJ0Ao++wfbzpEgsJOiY1NuPhnYdP+pQG8rEjav3VHdFNAsVzD+"
+    "mJ+L0kUZRDeSQibn/N5QqjDFdpVjB7Mx3EG7stGcSVjIOVGcSXSYNGsYmdu2F/oNz2B1cX"
+    "w+HFzbUCVuj1N6QLjt6/H5s3g2+964t/90Z466qPm0CV3vk5oxPy7g/6Vze/8BJHqRKi5x"
+    "y/Px6bo5u7wXXvqn89Us4GfVidwI0P+IDYDVhvDPwbR4kb/etzfjmp6O72PFD0YWxe9UZn"
+    "PyvDs5/753eMDvmI6vnVQT9x/Si4fnZzdXvZH/Grx+HV3vVZ/9IvG2nuj0YX19+GyvDuy9"
+    "XFyBf6ODYHvbN+4uLRe/9i7/Z2wJH6eHTkXxv0/9o/88vBEy8vfoFrTEPsDY9O4ncGNzdX"
+    "ys1t/5rf+5SQCjD7ePQ5fv3rxfXF8Gd+48f4jfjHHf00NqE2/hF/0eP3/rWwlj8ew7tfXP"
+    "9yMcK3P+tfsKsniK5/tXd21r8d8avxssGXniC2/tX+P28vBvzi9imqsgz3y328mWx35/xi"
+    "eHYzOFfOrxgz2L/qXVwyYvAf/S8/39z8DZCDCfZqCLW6dfBlJsj6d+NLYmsvjGfJiuxpxT"
+    "ZwB3M7NzhKZmkF0CSzVAOzlNd7a0Cv4l7a5m6nq+GciE3SdHGcv8Kyx7PpV0MVhr3lFe0W"
+    "kXSJz7/nUso9iJUk6fwHERRhdBbLYwcV826qO/wvkqCzQl7Nf5iAvqtBJxJ7PcOwnhwyvA"
+    "PLvnd+dXHNaD2eb+iRGs9cLSXq9BHb+jSUZs+MP8Dpjs2lzbgRfPbdBdEMz3WpnS1J3Lnq"
+    "EkwBicQemahO+lOFJF2md/o1gVuVsjRcYWnk3OIX4H6QW1ASbnUTbimgV7DGUxp2bYUHfU"
+    "+fYmOH77G3H4yzUi7NJuXP7Pxjzvo2DAa6E/R+An/6L8mGDShA0h25Kba5/54rmHBJySZF"
+    "KGClmAz1oEKe1KhGDlCG6PdE82wbmj6M33yyodM3a9dMkwy9UoENpiXMDZwfBxcK7Db+rX"
+    "PD/lJZ3Dz66yaW55Kn+bOozt8FFbx+/W4iZE7yY3tBo0h+bE8rNsOPBVPf5Lkaw5OR2y03"
+    "1okZTE9zK5whYzNnpSVhbdzZ7vnH/ePSZIa1zpq0kHgE2B4/2bx+XxbizLiXAHjYH5Hru8"
+    "vLJhBvF+YjN5UKOTe/VLcs3aZH5V+k2bhugodXMePxP5Zu8i2fCRsyy6VVEZS5XrbOH1U+"
+    "yGKdYyu2j14iC/3R+zJp6KFUbh56dk9GZmya/cFa85xKhwPFRV6va9epvMMtKfQqN7jR35"
+    "c62GCrcI0JySZxja9yN5QkrPaC15CE1Z5WbIawCrpdVcIqI/eayBTJSElGqj2MVNRVt8dI"
+    "NRjDzMjV1FCvAQXoHLfzAuUUFOuWDvGyuUTJ6K4r1JYJcuJ7D/GPQFuWdyotmdyC6V9mpG"
+    "NY1ronJn1KRWSRp7muzcnCg9ITOjbh+23rkU7J5Jmo8aCvCYW3oJlwCwzH8JsDjxZz4d0n"
+    "eKTt6dgk8D99ekpubX2h2s/kgT7zi1gXp8SHHR6W0Ig3ebEYjKckXmHxO7yoHeiCRnlK2M"
+    "5VZF/Dy5kX52I8qU/4Kv5vcrCk5hSqoEsCPLqg6j9UA01vggc+6vTJf16K8w3usYf6rxCX"
+    "UphbHT4p6Wa/t61FIGunP0t1T0kYehHUL7rhffRTb5VbPChRjqn83okDi72dBcbFc9nFX1"
+    "GGxtVObbL/ZpDLpzaD8ts73VvsBino3CX9nqmTvMsd5V10lneG9Yy/cgbi/CidlNiuY3Vy"
+    "xsVmhuPk5WIr4Orz8q5tsEl3/PG/k9uuSfRauz+UPj6rVGnIabldt+SC6bCZrTkx92WALy"
+    "Z10rKS1mkYXxdbS1Wv24So5NQlpy77qOTUZcWW5dTTVmemcguSnWYkd70ZqAQbUXIdWfep"
+    "uxGHURXktGCzgm1FBMz2IC6g5eOts41Ucn1tuSzXLOjPJU4/jdrn9lBuYGsuD3K6PzeV0e"
+    "+8QOWX5/BLUff5U7GM8nxlVOh2ozyPT07KsEQnJ/k0Ed7bP76zFvt1E1yQDKGVyc2kedeR"
+    "dvsrqtjwXO/MWlC8SowagOo8m5rym6caLDvGmgfG91Db3wNlzaz0vLV4ol+wQ+jC8/PWAA"
+    "T1+If2NXVmLkbChilzTRASIT6grsXtguUoW1qGrunrooLW7C1qem4xHtnT5FcH5Jzr+oaq"
+    "9gCSMC2+wjPo1wLOMFDaf2zdabap+AOYexeKNldN02cHVgdnyJSdcV0tBiU6D2FNQNp64H"
+    "E6a0/BgRurg1N0/Ec75+hMosN65upU1sWWNiO+L71GWKKN8S1FZEEXk7WX+nFErpjCFiOy"
+    "pPZCd5z1x5Y4Kreh0jYjAyYpdRX86SxVbd1+dMvUXQfaturNSQRoWk/wVHLgR/ST6Puqpc"
+    "d7wXYChYptWQtlaVv3+tqG1AD0DUDdLdfW4maFyNjKI7Wj06vWh8b+Jaav5eAgaaZMrHUX"
+    "ggNf1RfLbe/WsaThEJpVruo8rGs4BMpGoKu96z8YUjGTc41z15BrbFk72Zbz21/vvOACj1"
+    "ZF5Rzhi6i8dIfX2Fw27Q7HHFQruVASgtKDIl1jsmJfxbk/u6hOefCPTA2xazw3mhpCHqNE"
+    "1z6gO+n1VVTHAexqcEdkV8UtdAOvaVyUJBuvVPN5ZOG/K3T79RjHTa/DCxow+xalwJZKfp"
+    "mNLQ4WWCJC27JZdeD5M6mhJMLd7x5h3QkKc5V+QXduW95snlNG/Izc/gfXlUzV/Fna9owh"
+    "8YL9mcSsnA2afH9phzZtOdEtsENj7btqhLZAdMd5K8qjuvmkvDJcW54LI81syZ+8yoqV/E"
+    "ldc7ekAtp4nG2JsJm1bLbVY2eabK9FX5W21dLWb769ljDBimy1jGG3UXstJANyzbV0kIvA"
+    "ThPEweQbaMIYnCrZLrmCWJBLUYLLbGHMJxm+qkNUPIgYjwO24W9zmj4w2CJz9ZElqNRtDL"
+    "MhMAGwQ4ox16N17+t33pK+qs2jx7B8mRPKAnNY1kuqszNHVfYkeEj6jJexeTDxXMxRRSaW"
+    "O39TOe3lHetIsTeIDoklB/Tt7G2XPRrvEz9MCM8r8fNOTnVnaajPCtf1swet4fDe1qk55W"
+    "dt4s3cFJpBgq3YVUwLivvKw9fhcvgGMQGORRS7BO3X4am6ogAmLhiHKqYgkQQwPwjKB89R"
+    "lt7E0DWWw9I/AjaOGFa/7jpBnRLVpoRLAAiPuqNDC+aqosV6LB9mpCiTQDNaA+aWN1THJd"
+    "BdsMZKp9EM2NFfMWVmenZhF8OPlkk05c5xnmujaKBgQ0J6ON0dVREblaoAnZbbddbSgvF0"
+    "Faxl1tLcoNgw12PYuhufuzQaoTOwv7TDP5Lb9Q7/8FD12LDiZCbPtStAJgGQhE5XMnWvoW"
+    "IbyNQ1dPNG+6Oh6gP2roRFuT1UCzjS7Qb4NBHg2iKA8gaJ7VPPDR0gtkhPb2ATYopc3NE+"
+    "xE74AsjdOJTEvg+Pc4FFrmutVx2CnYpr75cyp9ZC/4PaHMStNuE4YHpAqpEJNSxzxojVA5"
+    "RjJO3MsCYwhPjfvO6exU3um8lvjC/T4mUjmNIEuZLqSutw5fFmW4U2T8gxahppcydWgA1S"
+    "rF5xwJhBC/Mp0K7PfnYZv8pHk7EZ7z4gYzHjkbPwTzo0GNOn3MMHVCTEmcwpGc1p5lviVD"
+    "TeZyz0hOLB6zNbNTH5bOztfMJXNRX+ORF5zOSQ5+c3QtqYvbvupB+IKjgSAhX8RhkVHECB"
+    "Cn7jRRUi5jr6XEZF+ygUUNcpgTLc9fdO1KD53BKS1xlaO1GS0diJspLErpHEjlp2Rf4pKb"
+    "hFAipn0DsT9sSwKTWKewqHghUwjwSbgXl26Gos5v5StjrmkWAzMM+O9c3EXHKs+0DFSY51"
+    "Tys2m6QstUQruZxKi+36aJT6bPX2c6s1wsq4v8BEyiDbCFo1MQ2uSf5Vz+7UyCZclv1Ld+"
+    "L93aRaS0PewgbWTRJZ6eRbAvpKkJ8rn7QSJwd7maoaUM9BHQSAvNdnns0pb18J46LwPUaw"
+    "GCD4DILPEFBXa+gRkhVpRwLDJs1USDJipemwqRF1297eJ09jadv2PpjKbBcHcVVwAlhuB0"
+    "9JbW8Zd3Sy664eywaNKQANfaELTMZc5JJC2wPu+GNzgHNYOnB4ooKHtOk2FcwthQSWWMHO"
+    "iaw6OnmNXBUzi1lPrQhvUnDXgZhNQxXdhADWIi/vSiGyGWGJbgLduT6lq4KbkZUDgqjpLm"
+    "3KTBttLuI6SzTftALZhAUoL/TpeiinFUiUBSibgAj0duQ9VkdapESind7REbxwNYSTgnJA"
+    "lt7EPXQ6SW/inlZsA3ds7KI6ZW6VTVB82w1eN/RHqtjrHxCTPEH0ErQOtnxOzNo4J0m8nR"
+    "zp1iAwNu2SSx76kuOUy5wMU+yWE5xMU8Ivh4IkLpjyrN1nc5gIvHKraMFA73N6r5vUIT5j"
+    "yVocK8xDxF0L7mgU+hNRffV0yvx6NsFkvxgR558xCerumMzCc1yezEUlhm4+gEDgEXw7mx"
+    "FV0yzPdFmQ+oJSlyx0U194C99bGHuP8k5Ddo6oPxixHMSCaGfpQ1xhguwW+BDjoKcGKH2W"
+    "C2BcalNLjc0A+dPx8YcPn4/ff/j048nHz59PfnwfIpq9VQTtl4tviG5isZi1woJ2XAndmF"
+    "DL1nG7QLeqFzwhJF3hsZBvl84sW3i29V+HN9d58d5xqRScdyZ85veprrldmEQc99dNgdv5"
+    "y71nsjRjZAJDk6ubzlt84P921l7ViBBGOIq95WnHeDdpLaKCtLfcn0HzFtK5o0VGbntjRo"
+    "Mc5mw5osCa557qlb07WWHJJorgnf62ErBcTEKa4b3BpoBFeXXaO5KTvgRJeu8fNypJ7z2t"
+    "WEl617X2kaT3jklvtlOhxkOskXZr+0HWm+R7xfgION9cIPN5X1aXK5O/F+ZUf9Snnp+i+Q"
+    "fHp1YTRC70MtcT7MSoIoxU7whuPzjkyc9n4WfInqsOmVBqRuwuErOxPTuM582nYh9TULG9"
+    "SpJ73TD3Civ5oL6q2wBxSWlaJc2AAJsVlosp0RrWi83a59Gg5WHw2YULfx6niDRChTEmKb"
+    "S9ZeH7XY81KWrcnwAqDi5pUTm65EO7wggjEJejzI5HGUzJpWhzqj2sVKUCcVmljalShdq2"
+    "Jdh6n7+9UyQr93jKIxz3l5iTjOueVmyGcW1zTp2drabj/Eg18ASSrwnEApo6zTmtSVO3nD"
+    "vtprhqQbvZ3xRDtaPX4DRCOOd9sdxOTrRycLv7UpwyS/YwsdwKEcosnQ+IJKOKxXHIOWWR"
+    "gh660KAcctPz3PkxJpFlJ6LBY1nIcfBuGCWM8rrf3JC+hg/j5wT6KcwP8ADHuFfm0NGsJZ"
+    "2+IXi6o38opOo40HqRxraSx03m0dmStt4sbe2H/AlyuuQHXcZldnugX9i4g1diB3sGh37+"
+    "oBquu7R/gL+cxR8ffljpdL+TMgfOneSfN3eSOW5OM3ToY8KVRwHmcaFdH+oXjBbsncjF+S"
+    "q4bibslaPkUBjIBKbOi/BGgs2COHqvRsDc0lxlna/BMZT4QmyCY+cETKzmQLsPOcw6omOR"
+    "yyG8bcZrL+I2O9GZzrw14wGU1MTnTNeGvc6cPSp0PljLawYsA6uMHxnB7Q0knaE6V3GZ8T"
+    "N/h04W/Vv2MoS9XHxk8bNt+i8fLkp6l6PR7SCmEtcnw6vMhX9/iF9aae2ykRGKx68IV9t9"
+    "01tkzNJ0PkBfeJeO3M6ZZ9s4rwJ6Jj/RnkRvVnpR/uH486dwPY4/ipbiw6ve5aUoxR0+Vl"
+    "lQxwEzs8qQn5Xc8ajfm051f9zn7wbmIvSEhX+Sm02Y+4XEXrh58wF3FvFWsYb3MKWgSf7D"
+    "DtpLUD+LJbHu+fFFjqeBSe/ce0asQ6xfPw2i0ss7Gf1exf2FK1a/QEfTWwDvr+yNX1/FS7"
+    "fnXnjHpNtzTys2DEfPcPsvxfW/+qQtudtzOBFfAzIxP0d7N5ckcOKGPTvRoSZs8CiJrc7w"
+    "UBmEOa7wZE/GCtj+KzR0Q0heKyp2rKUbXDknm5JwPJXzuPXC7oJrJpUkvGqu9XI6oKoKYg"
+    "fNJl4Xy3oOJc6SauhTRnknIBx0+Dca8d6xJAL5+0R82jOxw0xuE9n8NpF9IxyjqQR5x+gt"
+    "m0I7Bj7nFZaBKVG5DpQLfFmxW4hrxFm60gwTCbymgDy5+X6zUY3+CqmGYMZYJFjzUCwbiB"
+    "d1spejF2XeghwQa8hbsA1DjJmsBdZXYNKWMLlCQ7qEmcUWj4LjCgUGVW7R2M565LUpGlzW"
+    "kprxww8JrGBNMMPwF65afSIXvVT/sXRY8XXHJjfSgo/FrKuWPY0V9pWEjl64c6+bujPnej"
+    "Rs0YbBVLEyoTyv7Cl/0Tm7oFne0qDcTCcI0gNa7vc2/LpSXW3eJewICrh4OjYPyRfquizf"
+    "K9w39HuqPcMUzS1+lqgVy9za9BFjOdH3BgDYy7mKgZdMBqPkHCzUVx0dFEEnsZ/xiWibcm"
+    "AZTlgEP/4wNDcX1FXRuAFoYWHA3XgybHPrZiRWYJUIiqD8bsM1v8LVqAGmwjTfaWDGHk6h"
+    "ER0eHX/42KCIh2bEyK7OBmajZFMBsg0JjGVn6FbPABsT2jnS2LZZCJAFZlkIc2Nbdl4sT8"
+    "FAkhfAs+1okyCEh029vv/6AKf5LoF/pgBsl+gmHsmMZqnTDefmbjQzN6Td76X/ucMWR2yw"
+    "f1IFC6yS0O8LxfFKuKvOZSychL/nK6vonXNZzfAi1k1vLdAKqoZjXKQWJFdd9vYcx9J0Nv"
+    "xF7jnCXo8c6GBxmc9lZ6L947ua0VzXpMCG/RG5vru8rMbapFp3Fvobk44s+Kck8FeBlta1"
+    "67Lwx7t0mQpYkwozp9ZC/4PatzAZ0Jxdvqky3WJKLCiNZ+NC8ZK02BWqYk5+ZF2weUeaiK"
+    "8py5CVkkIOir8638yLm60Pg8Xav3pXl8k9w8G24FAPCLqgGhWN5vSZ6fApTlAANWkxe8hZ"
+    "YiwCOWAJLi07EdNArCdYD77hIQ8uvP7Ec6lzOjYJ/E+fnpJbW1+oYLU+0Gd+MdR4Sq6DP3"
+    "mP559FJtSw4KWgWXIBfOwpwa3w5GluhYtRpOV8iQMWQhEQb6yAZb/h0tHnnpKowgn2PnLA"
+    "TegucRb4/z8+dIllufCbutrbN9Hr8qcf3gt2oEXvwHskedLhW8zoK/9v9AK+xlj7OCWi3V"
+    "ZI5D3NVTeufmpRh4sHlXYa1rCLPReW6XiWBTlAIWiQmMfUl000Av8ldEdZehND105JFA8Q"
+    "Pg0q41F3dGj5LLzF4ClR/ReI7JbTiET1BWPWgl954XJXXJhFMENvCzNoCqNdQjSDQ6lCTP"
+    "EX69bp4JdCISj7PaUkSFTAboXoiEpGj5OsaI2saBLk0gxSQmrnFNLLAwwbWppBXbR1J3By"
+    "MPYHk+DlqsJ69L4MrlAqF1h2b583AgdTUNP3AwczYxby/FOz4jK7OjNLDD+b3aMZnE3yuB"
+    "bElOJ8rl+7FjZyelY0d2aq4aUgyUhu55luO78I1j9rAy4P2JHRc93XSC2/vorNUMlpc6Sk"
+    "hZAW2zGt/JLJTg5QjhnHfmoxn6zYIkm6L0k2OwWcRyMo57Bt1kA8cx7rOq5xbxp1WYY03d"
+    "f3N8/k+k27LKZrJKCUW1GFWyyXuIqfKg6l0zXRuGWahpQzf1vr7nyoYS0OP4LxkOHDedxm"
+    "PR6Qje66HGpzOvUAv5HqPHQE7o1kgW6Rb8MJiioulC3p2Aj1ExQiTG3WkSEshd6CAWXd3U"
+    "TfBb/nIuft5xqFKtU8rA64FL4duiSo/Qivg26IMKwVV7PMh4HvHijg+UsFuzPJQTLPqa/l"
+    "DYlG90SJ/7m2TIoOji94nvWhbrKX5Q4XaGkYDgPvBSb6lLKzvgxLnfrv7aq26y27BJOr+q"
+    "Y7lEQGdKI6uYeAZYhsQdR5tKOQEdQm/d1VbM/0l/6xu5KmXmkBmU9Tt5Q0LY+fTJO4iSl1"
+    "ayQoDk4cFFH3fjnJW0J+1wZQ/59gcV/2lcubb6fkPcwZvTNmxis3t/1rZXBzc3VKjsbm2W"
+    "W/d313q4xu7gbXvav+9Ui5G/a+9aH9js3e8F/XZ/FbqODmbqSAivOLa1D8oaDQxbVyO7j5"
+    "NugPh6fko6Dg8Oxm0FfOepdnd5e90cXN9Sk5CYpdXvzSV/Cd2fuekk9jc3jb759/613Bg5"
+    "WLq9ubweiUfI6+4PYSSv98c3neH8An9Afw0B9jn317c3kZfTvc/Ak0gkK4cXOpDPpfLy4v"
+    "0aUBCu+GI0Tnp58qWYq1ZMXzp+t1WmFGx65bInxmf/BL75K3twFWM7Stm+s+aymA1dZhDt"
+    "ZCmPfYMkVL8fzpXCC6W15pZztvNRs+mv6OS1FHOB8V7BLJirZkTtrG5oTIotBFC6ZiJjsr"
+    "3aQcfLXM/Q0ir4PPLnRLsHUBjySq4l9Nie3Kxdr5y71n8lyxEzTjdNN5i4/9385GandTjt"
+    "X2Z5+pA90avags5WdkOFcZo1KicoDa8QCV4kCqVGVKVFZlE5L5Yn1U3+IoEG3loqz+aL8Q"
+    "mdUOYU1ItgTSbXMvMiZnL0I3ZEzOnlZsxpUZdLvJc7UYkYzcK2VPdp+3rJ0YFsTU7Db3Vn"
+    "NCDrqrpt4S9+8aoCwZJNNcCDOjVpNyl8ViQQSxDMlIkYJABiihLH1So0TKMgw5OoxiPxJ7"
+    "I1lkiO6yDckWhhRohgpz9FSQzmwlNewEVwyiYaEEPKqGTJ7JQSTeDXf7KXPVmb95S0YsaI"
+    "VfI3iN6M7Y1KzF0guDVzCwhf4OHx6V9BweC2FbhhEGvoB2i9Apfzd1bPpxbzhh4rk/mmoY"
+    "zxi3sHSIZUz9j3H4MyYUhfB4LMwL4rl8Ayj/3IX6jN+J2uxHfCnLJmoUruHvMUbI8HWCAi"
+    "bxlvAdoHZssiIsIsOg9y7xzFCXzncQQnuDd/Du7+GtuPqltfQMNdgb+5bcQF8GYDjWsPzC"
+    "PY2JqB/4bdJHkI8+gqgz6D6l4zKSe88SNYUXomfzII34/uf4PRmisdIqRO4kbM5OwkzbLw"
+    "t6RnDXuA9/7h0en3zCLdg4UmiqaZk4EkZDafmdV0nUP30sgfqnj7mo461UbLttVMHaL97O"
+    "QKSTUts0Twq2aZ5kt2lio6t4lHNMpJ1AbsTbu6T2QjV086EKlAmhljCKW2iUztLS8bzUir"
+    "07JSbx3M9dwcP0ij54dLiwLTc3bdt5HaQerlILcZkaaqFR/oeNgOwDgAyJ6PSrXNshI7fr"
+    "aLufrSeCm698U9alNuYh8J+PeXcs6wEzhJKFbkD1R1FsOwggiyy5DOAv+HwSkk1yOnfCTD"
+    "3h/piYkcw3w+EGmUdVZ8+utk2m6X6DUi5q6erbC49QtmKbkKty9Y7LsgjyXaxh100RbdFe"
+    "1hSRtqMd2pywq4Z4QmbHkNe+m3DDDqZok+2a/hBR+sT2ol7WiZJoei97oHKSg1YGe9X0oI"
+    "0eSspinps5dMc+q29su6hvknUEbqtkgW6R54pvPVXilufL/iuun4BWQ9f47taQp4xyRT3Q"
+    "58NH1fAoWaq6LUg2upqa8ik/4Y9TcsfzY/qK8do7fYpn3ADY9thkmk+JjxXhDzqIns7fVp"
+    "RC82cPKugQVySIZTqRphs5zAoyX3LnEHuyv38Y9aE3zrTMQ3W60M2i7JeBbLn0l/HSZfJf"
+    "phxP0l+00ooj318ETbEK0+YX3+lpPE0if1lXzQKYH08aCrSFQd92HKncIL1BcPcjP2HD9t"
+    "FIOmRP6RAZ+bwXFRtmI8rYRtu3muIhqQW2k6hYoQWViBCtZkfdiDICRTYQS0xkPVLbBosF"
+    "o9LQJWFOg3RB4TEKGcOqJr3lLa04BqfEZxnwNroK428TM8yGQossPNBgSZMnPrzZjK22M+"
+    "vqeybkGhf46eMEpNG1R0ZXduKQVlfzJl9pde0RuNJA2It1pDQQ9rRiM1sjd7+1bwfT9j5v"
+    "7ds+nLVv7duNvRrlbGYu0SACsyOwWfOKdovs1ii5tMIdndVs1zAi1PEmC52lIvO3RKXPdR"
+    "Qk5y0vy3aroYXnkKWhPlP7kMm4fL+bFtuVxvzBKXHqvCW3TIwl6B2bXDgSMvSH8Fw4B2qe"
+    "5WrqEs0Dq5Jvg7HYFztddgIhc9vN4AG49y12uh2ZUHg8C4bVbX+n2YTOMN0Tbp1zYq+Jm+"
+    "6YxxN922A8jk20HtmnsIOv9dDYZN/+RcWAW3jCUJ2rjq3Ov1juDw6JavwbHgrIqrdLwLxd"
+    "ur6THMtD2eMfnLG5gG6lH4KNr+KJfbY21134Us/OzQX8PQogwK9VTG8xwfPrpHW6Wes0Dn"
+    "YGwOFCNYz8YNqk6PZCaY/WhrOW7J/7FG7f2EjvcOyt6MRKyMlccGJMV7Bl0rLSmpFmqqzY"
+    "bZyqZblUMNfk03WhgCTq8sIjHlVDtG58KToiFJPzSpqp16fcuK2cek8kKxuusOH6tlzFdh"
+    "uTkjE9QkBXmDKTkk3a2VZL623QDFlqr9outjTtYpFT88akaE1fNT2gQPI1gVhAgW97O8zu"
+    "qIAaNrXkNcYa8Nv6gY+1wyfoY810Gtw5KutTBc4CXqRb0knghaVf9A2M4PYDO7v8ByfOya"
+    "uaRh3O1NtUwyuxm3MdI7mes96CtbSVj2HDB5yS8IBQrt0/ITRSzMtGv09jVDwPrMMAsECY"
+    "l2aJrINLIIDnBrrqYon7hBYw6Qavz4tkI+oUfN+4241cnIfb32LffDClpsWS2/zhOwGW1L"
+    "7HK9Ap3wj0olxKM14qpSjWMriaGA4llOQ6HoKjZSP9GbfD9/jpqglwZVa72l0SSXwrrsgz"
+    "wtvhseqGeG9prFZEWzRxrZkLYtVzOoXCbQmV3EK8aWqaqQKtQFQCKwK2UsfPyL3Wbh9bg5"
+    "SELiYhI9MCQBplVe4oEi3WMF42yWML4/WhGyWUNa/TlkUwMyo1yShn7VNgiQftNt/8xoZR"
+    "Mh6PGa5MBZiT/hH3uB/pXHc0y54ewjJwjpc0lqmGKc6a2qsoKW9hT7kWZs76GpkONGf9bV"
+    "9dErQ3bjEaqkbnPAs8e9qbpCa8xq3PuD6TBejFy+F/4W10E9P4RYUTl9FghU/mnzZ5DgvB"
+    "Z8EnLF32QpjxHtZqE93Q3efUy6iPYEPFtPPfLFt+siBdqLoRlWM/CazZ7dD6D1Uy0wks5A"
+    "dqgqHeA/iPA96DXWQvFSjq3V7w3DgsOV5Sk03vQf08pcq/WlEXK41H0OogzHbB9eKvxG5w"
+    "NsENqY60Lgx4xLusMQzgB7Iib2ez/AaRFuT1nhbl1EOeTDk84zpFOITqyoJaWmEdyLpPOm"
+    "d4T8mI/fkipL6ET+NEMhxLw3qitqY6uXLQLDA0NynvX/SpILg2J5q61F2kg1QeZCvWVq6K"
+    "/KeIwPT1lK2blzXVUSlJjO44l6nNLRhgU1DB8G44BCce3DubHugw/6VpsQBmX/PStkzLM5"
+    "1Qa3CBHPDQZdXwSzpz60mJiodZiKzwDUJRVl/ILvqsazSiYvZsHrHtc6XRBWLQR2qE2Y74"
+    "4a/xbEdcHVYmPISdjMHLRAmSouEeGhJM8/i5LEsSls3MBkGgNM+7NlxSOv2m4kkeRF8sLd"
+    "vnah28PmPXWaeIl+Mh5e9Az1PAqWamnExdxjcL9/xvYdcSTSC7VfgSdwXzC/FiY/MsWvP4"
+    "0+dhbK5kmaEs02CHm1zfXV4iKEmwEB6EKxAeIWTUdDwMm4f2hFmlDP9r5uojBSyDcf7ivE"
+    "ue5jrMtzF9DjtLBdpZDksrw8A3y7lGlS8IK9FnuRAm5WpJULklKH86Pv7w4fPx+w+ffjz5"
+    "+PnzyY/vQ0yzt4rA/XLxDfFN8CBZ2z09rFahlUSyklfKQJtYW6+Cb0ZBSwLQkhiXOX0l//"
+    "CVzNkrSVtjFVgjyVbiudE2yyyxVUANBSWmmZYaW89XCUHNk28JwlvPIiGy81fBO6NAAl4I"
+    "eNo6rOoiL9IjQ1h3HMIaY6mqTAspsVp60B5kbE1QdyvhudZ6ey+nWSG1WWXcz1XQEoy3Pe"
+    "6Lyd+VEJdTbUXI151rCxXJyXbHk23ouKgU5BMXkhNtAsnKAVNJsZaMRtvDM+7EWQHXtLjE"
+    "N4XvqkuYHPGW4Lvt2VTkH10Bbbl4qQT3ukuXAjVy4bLjhcuq84KcEHIP9vYDEaqgGZdpJZ"
+    "JHpY6hPio4hvpIcAx1POhD4E0uzNqUlpWpCrLnz/PYlyyyF6bbN71FJg432WYTCrYXSf8+"
+    "g2znbtgfwI2xeXVz3h/0RjcDPBh9bPbOry6uWeMcm8O7W7jFLxy/f98p18jrS/IWRhVVbM"
+    "gJOZkmJpVuQ1fwuxVDX+iuAi1SWeim5wowzo07KdSx23NStxzTkzzvKYqoqt5gU8Jy6E3N"
+    "a4movgptNSv4ShuoTI2/F3t6s+aIzDm4FxVb9eys5JTOiALRgt+X/fq3ATXCHO7izWG9pT"
+    "4K2J3mVXTe1rDk6sZ5NjXlN0812OlSiupNYYFiWKJEwZWgQb1/D9T2UOulNWvkvFEBJ/SP"
+    "KTZ91OlTrfjg/pe2YxO1IURpF/A0to/V1ada34tsWNIrKtjzMxO3ojrKQp2KbNUKoMST81"
+    "xRzO4+gIe0F6Jg7YhQrdle4tC0GxTWbpaWoWs6dRQfovXAQUBuUeNze2Fh2+LrhQW3rLUd"
+    "lqluU80NgdkiIE2dgQzdfIAxZebpuBZeCw9/X9w3VNViRNTl0rYeARPc2rgeIme+hnZ2Fv"
+    "x+ZcEmTmeuL9dsHSWxaGqr4Lk/+abXNZFgmVBvI00tRSSWN6QWWKJ8Ku3HxrTwSGaNpyZb"
+    "f3l/HVNXbpXfCmAcbxI+qUaEhjG1LYbqHtZsnk2Ve0OdOQo18XXXXMLFl/1fufqvoH2bU1"
+    "QncoSyXLH+d7EUB/4Xl/ONVjKZdPNRF546sip6F0xhi1tXInmiTeHdHLdOo5Jr3CpAnTAB"
+    "sf89frNKH+JZl+XJyD5oXKB/pwhurG8GX8hQtKP32UATrBE4TvW0uGvyMzVZaJuzXJ8wvW"
+    "XqrgNtW21QrEdaT/A0cuCnsXYwrQ6JPu5NjS0q1KpE0UH1onebiDra8tA2s1XTH9QcSlKf"
+    "WNeoBh9pK4/UDpdTNbAkyNLbv8R0trh3BksK3kvXBGegmlN+WC5vZzuaL4NkUDjOL8MXqR"
+    "kwV3Ue1oRrqM3p1IPl4gh0tZdYiVnOwTmqSnScc21mdOZA65b2ONFBGnXgE57h0SJcMIZh"
+    "U7lWezBAaxhNncm26t/pFuVbVaMyLyVczYdBJkzbesI0mOrFUdj52wViIjJ7V9xvUAVEv3"
+    "g7AdzIfgt4oitMzZ1/DHlMRJ5Cng6bC04hrxAIV//08uf/B6lY6ME="
+)
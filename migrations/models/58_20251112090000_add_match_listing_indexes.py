@@ -0,0 +1,354 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `match` ADD INDEX `idx_match_tournam_8c3e5b` (`tournament_id`, `scheduled_at`, `id`);
+        ALTER TABLE `match` ADD INDEX `idx_match_tournam_2f6d90` (`tournament_id`, `updated_at`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `match` DROP INDEX `idx_match_tournam_2f6d90`;
+        ALTER TABLE `match` DROP INDEX `idx_match_tournam_8c3e5b`;"""
+
+
+MODELS_STATE = (
+    "eJztfWtz20bS7l+Z4pfI51C2JVt2orPvW0VLtKNd3ZakshczhQLBEYkVCDC4SFG28t9P9w"
+    "zuGEAACZIANVu1jghMN4Bnrv10T89/OwtrSg3nbW+pj6wHanZOyX87prqg8EfmXpd01OUy"
+    "uoMXXHVisMLqUldcLMYuqxPHtVXNhTv3quFQuDSljmbrS1e38Cmd3u0FYeWJ6jiWpqsunZ"
+    "In3Z0TlXgOtd+imqmlgR7dnJWSGJtjc+haNnXgylx15sS6J+6c+lKPquHR/8cuLA1VN136"
+    "u+vf0h1imcYzcebWk0m8pWUSzaYqvit7D8/Uf/MofN+MgrgNb/P9V7ism1P6O3WCn8sH5V"
+    "6nxjQBoj5FBey64j4v2bUL0/3KCuInThTNMryFGRVePrtzywxLw5vi1Rk1qY3fDNdc20NI"
+    "Tc8wfPwDlPmbRkX4K8ZkpvRe9QysGJTO1EtwMQa8f0mzTKxTeBuHfeAMn3J4fPTx88cfP3"
+    "z6+CMUYW8SXvn8J/+86Nu5IEPgetT5k91XXZWXYDBGuLH/ZpA7m6u2GLqgfAo8eOU0eAFU"
+    "MfR8bELwgiIRelErrgm+hfq7YlBz5s7h59H79wVg/dIbnP3cGxxAqTf4MRb0LN7prv1bx/"
+    "weIhohyJq2gv2gCo5JqZXQ3H5bTID56WMJLD99zIUSbyWR1B0FxjL9UdAgv1iWQVUzpzvH"
+    "5VJQTkBwFSzLNM0Q3pXQLEDvy83NJb70wnF+M9iFi1EKxrurL31oqgxdKKS7NN7fI0zZ+E"
+    "qniupmQT2HO66+oGJUk5IpWKe+6Nvgj01hvGaLhW+Y3sCU49dWAeaji6v+cNS7uk0Af94b"
+    "9fHOMbv6nLp68CnVukMl5B8Xo58J/iT/vrnuMwQtx53Z7IlRudG/O/hOqudaimk9Keo01m"
+    "+DqwEwiYo1VMdVYD5epWrTsjVU7vaH9pbUZfDZhZVJf1/qoG6FqkxKyorccUXiAlmptBaN"
+    "Sby8IG3IqFrDmhQX8vcPwiUpIpIF8CsYHPrM/Bt9ZjhewBuppiaa8n176s5X0zz8/gzaQH"
+    "A16na2+hQaN/GmAZ8HH0X5LH/WG571zvsdBuJE1R6eVHuqJNDEO9axlboSls3eWhwv0ldU"
+    "U52x78evwHcODFXn2dT+7qmGDgJ2R2TKJkt0Cw1aLKv8FhQua9aiFAkfQZhigS0rLIYGLL"
+    "8TPZaohmE9ocX6jL9ci2jWYomIE3gTNHVRYG5bpuU5xnOXW8RU1eZjkwthOXgsWVJ7AVrN"
+    "B4fc29YC7GFbBxmyhJUoqHHRMtZtghbwEjS/JUON29I2HZuaamiewUzuiQoTNNjL5F43dT"
+    "CycfwmNoWbsNLFF1RB3uaXD9RHaOMzyixxa0lO3kh7+hXY07sY+xM24PHJSQkjEErlWoHs"
+    "XtJkib9ZBskR/T2nEabEWkJQFC1++v8cJdY9AWoHV71/vkmsfS5vrr8FxWMon13efJE29s"
+    "Zt7Lk+pQoM4fDGTkVY06JbRFY8szYM2qnuwOw4VbS5aprUEC6tv+iz3JlJLL/SQjs9Nmxp"
+    "pvrp+PjDh8/H7z98+vHk4+fPJz++D6es7K2iuevLxTfEN1EPWcBtz3QUWMIoS7/pJbEewt"
+    "LGyEU7I7w9i+ZobaA/HH/+FEKLP4rAHF71Li+z6OHkiLSZSxdL0VhQDF9Wenv4HTYDQJv+"
+    "5uk2DImwMsaVrXJv2Qo3EbBxVRxdS2iTA654wAUz0YS3ESD+1+HNdfFgG5dN4Xtnwld/n+"
+    "qa2yWG7ri/tm1Rhl9fvChLr7+6SZYJFaQXZWngYLqi2sNK1O4LqiRBuGOCUPpj9tQf4y2n"
+    "K1ZsUlJW7E4r1n/5qF4te6aa+h8sSKUasy+QlAx/BtMamP6blLrm4VmW8Rc0marMf4Sy6k"
+    "11VzEs0SLuiy/79W8DxigLOTMhm99DrZfWrF1AJ13n+iO3CWoF5hK0DlStoQN0KWCYi6JO"
+    "TG43aE5tAY/a20gL28f2PInhyPKiRzE+BpX2LCrJ8bCEjxHLEyhP7i2b+/8ihyFBNhzAEv"
+    "gcS4mhD3IEz39gnkfiwIQHBTTVdIMiRDfT0g5XqWmWZ8Jn6mDGP49N1ZySKZ14sxm8gfT7"
+    "7cbvxyutiucvkmin728jwbRT6qq6aA4q8vuFItLnJ/T5Sc5hL0zTLOfgWp6Nf5tuNcs0I/"
+    "ea7NLdhuvtYAvEZm35qC3VYMlnA8ea1wbL2vKZTia25NPNsQYUS0Y+7mzi24/Ax9Def9Fc"
+    "iTMD5c2VJEvxsrmCT2GxioQ+QqMTWR8Ca6WUFBorA7qEiQuK4K4/R5vTqWfQKRd9AiODMj"
+    "uGGvpMhw/C0ERX1/SligKsEG4IdACmselQEHT0BTQp1aQsnhLjHBGiEa4nZrO3ZMBjYjAq"
+    "kuAcuAA7W4MnPBObooOLTuGt7kxDfwCtoGYKteu/OI/XPIBmrD/qU/iKLjwbFwGHLKTyDX"
+    "oeH8OwTpuejs1DMgy/SHWJs6QaWmMsuNLB2zdLarKYy/g3RlZd/Gux+M8wz/PgzdhH+Zso"
+    "g48hPOyHYLU+YG1Iw20Xhhtd6g50xmqrgKRQm8KJals6hUPACmZFWlZ6pXfslYYBSZsrru"
+    "4alYKXU2ItMb9TIcylaIzjAhrjOEtjhAFHjuHNqiCaEawF0+1uDN4sojNLFcQllkA0EGxn"
+    "K91EoL1tWQvFgpWNEgyyVQbxrLQcxnc8jMNC2PUE5Gl+74gktkdCR9N/p67u8bFM7/iY3z"
+    "k+ZvqG5Ez3lDOVcVp7UbHZ2IVg22U1Sy4t9opI3XTkR0XgIonX6j3ApaXClkFL27rXjYok"
+    "Qp74K22C0pm1AoDSMbMVx4x4M9yaKLYvOC6NZGwOKIFhMNPWD2Rcc+PGydJgplYiLyOamU"
+    "BqQBb9FQNQeRtpbC2ieRPs6iHVMT9P/QHEJYNDm4P3FmNDoy7+orc1MRqUd7dGaVvKuVvD"
+    "x7xj7kzmN80EbLKkL1mnawVZdL32VW0epZUhGpSdcP/llEyeCfpR9aVBg+Q1b8loTqPcML"
+    "pDoqwyY1N1mCc2njCGpW5dkpN4phlHBpLuxh/p2ZXobb94O0NIT0p5Ck4KPAUnWU+Babmi"
+    "cTk/gDQUaIlnYNvhozCS5DgIvhqWmkcPxIRSuN6jVNuQPb+5+3LZJ7eD/tnF8MLfAx7SX+"
+    "wmXoq21g/6vUsBkKvTj1lp6W+Rm7kllyydBLJiSzsJJM29Nq8oubDVuLAy/MLOdyY3iFyQ"
+    "G3F3RrZgZ3yZZ/G7bAWKJdheXoJdgaLITcST6QpZEgG5UlqU5QGOES5IrMzVRxpjVPCNuw"
+    "R32AaZgRee40a5gVWiUduFahqbpreYgBJ4MuYW47l/KWNuAg5IwKZ8T7lpGOK/So5lsxyL"
+    "TNK7duygTNIrN+xK80Pala+yYjPrUxm7ssIMLWNXNha70gpbs0EwiwNV6k2FVSFIpUnIbM"
+    "/sLLeZuvpG6gp7qC/CPcN8zzKmYCphcpYTi6d8Ig6Ihi77H/BcGJb1G3cfq5Hp2gVVmuFN"
+    "8VwZmNfhP92xyfdscKsUk/3iTd0EG3chT1LdoVEZZF7me81XPqkgId6uUOAtH1XgI7XyBj"
+    "aRvHSp7til6lcKYm157jr1mlYhq3b3uxPt1Wo0KSkrctenlZrTlaoxLicrcfe9sQ17hWFy"
+    "nvrJcWoKOSwVcVgQcJjZRR+c2ENFK77i42kSkvIomsxRVPDlSuV4zrScdDIInQw+TI/WVK"
+    "kYc5yVbAnEW4g+RiOuWqRsKCHDZGMQrhEoK5KXy40dLzds+qjTJ6X6qiMj2OLFx3G5xEgF"
+    "eZGyiw9EZ6VukhKVPaQRPWSlBU9GsiXz8daXPHwswWMhKSboVCbPijjn7gvr9nw1chFfBD"
+    "keb+pUixjKVSDbuIwd2t8QExk7tKcVm38aWbXQobRYu1yF9SWu2mHar5bGXQntB1jCVEte"
+    "lRF8pQ1Qhv6tCeD2z2BpKWgyXnI7ub4akaeqwZhWT1S13XNtGgzdiwfbCBeGtTfEVm4ITW"
+    "OZXgCXyJcWrVm21xqbC2B2Cdeow5aKToMtd/7rWue9BsfyEOyzZU97FQuxfaYuiEw8lzqn"
+    "Y5PA//TpKbm19YVqP5MH+swvotgp8ZsiXsYzh7Chkae5hWHBGOVLpzyDF9PO5eLnhp+SG/"
+    "ZJqoGvFFcUPyedHLjUxNNmoZm49Hf3DVfElZ6SHvsvwSb/zmSHNuFd/6jNU/LX4c01YRXp"
+    "H2rEi/v3/Q9cog0MZjKUv7gl/t9BwjH8Ul4uop1OCZ6UBP1usQyKRYekyohmeabtJhbm29"
+    "gqm3OmLfainGDw3DNt70z4wO9TXXPxGDPH/bXJU5AIRPzoYtI7zW93k4wbKkiT3tFYU6W1"
+    "JqVa4k+QB19Imnkl/0F8jVCNbxFIbojsa+QEKY8LrpGpkkfcrsAExDtgDeDdpNQ1rduWxV"
+    "AwLjXJgo3DfEUxOdDAYoBm7Nmckt0i6zbx8QsmpNggVdLYvVLN50PXOoS3xyN1+V5mZ64v"
+    "yYS6T5SaCZuS8Ac4bM8pe0rWEl5bI0/HxK8LcjGxQv7W2rim/NRKXBXeRtlMWqWwAFz/Hi"
+    "sibcg6bUjHgbFppfVkSlQuKBu2oAzrp6rvOCv4itZGiWN3+bBdCbyEzGtyfyZPLq182Ja1"
+    "3vlaLQWtYCUezY41LievQqXNw7PssjLRw0p4laxaDt6Joxis/tqLYay7vYxgbD6QpqFoek"
+    "xAOOyPyPXd5WUTzJoyBk1FU6aCDTNgFgE6oLJWATmYWO6cTDzdcA/Z7SnRPMe1Fm+ypsuq"
+    "itBi+RLc4PbJge4orKxu/s8IKvfN6dg8JD1YRx36/Ch5mqdtITyih9/EwhgmokMbgHZCoO"
+    "3p0BQIbn/SNdUwntEC0gBDcmBaLv7ApfdEdegblD1TTbw8AbvJmqKvf9oFWwxrB/6wbMKb"
+    "0RRe8x6eqhiW9kCn/EVRfAgFiarZlgOGmWEk3tLBrz1jXy741q9YRfxjz/zvnDwnv1KdLn"
+    "TUIv7CR10lt5aha89D+FaKITvw5pgSh4l89fDbOfCgcMLblNDsS7Mlwpy62WLRx3CDUHCf"
+    "wyWtRJmQdy2nzVGpjcdHBRuPj7Ibj2VC3g1uqomNDRlsC7eKJQXl5rAMrP6QWhnVSE6CKh"
+    "24r4JvkxvA9qJiMxvAgm5XlUbNyL1SFnX3gQ37Rw7u1uPcYGKrtM9Z3MMlvyUYtyrTWxkP"
+    "CqfMkDNYM2d3vie+PU02uZsJKRV93RzvCAInZ1oGxSaJ0BRb1RHwoOki3SIalFXVM8t0RM"
+    "OmXClnOddAQg08OL9/f0819x0P6XfeDahjebZGnXdnFojm7GuoRSsyhrhkw2h/fsy5Vswf"
+    "vs3wqSDpk58sK3qaNfTJUPYkNn46jIKk7OVOybjTu7y8+ce4g9znuHPev/7XuIMF/K0Z/k"
+    "4G1bbVZ9xy4O9j4DDAC9K3s7dd8n0c20d4yoevMSCWuMzX2OPOr4xItQM40k8IbpAl5n60"
+    "zZyH/B+uP7Gv47/wC0bMP4NnaCHQ/kOsyX/gq3n1hDehAg1rBvAdWP62kDc5zKncTrFZkp"
+    "M3yio0ZyTRVqKzFM9ZQHOmWU6/32ZBzN9LEROpYS/F7ia3rW2mCMeuKignhCTOZXCOxu8q"
+    "QCel5O6gEkBL14jMNyZZSUk3v8qKDc3gTIDQS9wKi+Gq4Ry01pIHma1fNYCB7F0rwdgkkx"
+    "JrIQISJdl+8vkT1l7jfNfL3MklOx48HXaUSpWAz88SJOVFa2BBppb5g8v3w/hsjB8alb/5"
+    "JQhLTbNKgkgovvUFY57EhSULUCMLINdLezGtZtdL0o27ZibP1NhTMaGnWPo1uXPlBpkVQC"
+    "vwgcuNHetu7MgsJ9ZHU+BRay+YOYOWDCjYdkDBJo2bmMUnMG6S9mC+ccPsz2rGzbluozvQ"
+    "NxhiIRJopaA+sD0mz0u8Yc64oSHYG7OSFraV3zCsJ4fZO1js0FlSTb9P+XHRV2l5Lt/+gg"
+    "pUpgIUDDVriZnuLDwsOxAtt+8/yDGSDmIqYQoJRaURJI0gaQRJI0jGsrYDRGlJtjrnWUtB"
+    "K7AkZf5z2rqsZw1GcaUYdGmLS1v81dviX7ifbaQ6DzeP1Lb1Ke0IjHJRsW6Rde777xQXJB"
+    "TLFylppvsPIyhLAlnCHpK1xosKo9E9dKHFOeEdbn6HuStQCuz2ueoS1aaCIOozz7ah7RvP"
+    "xEKHpeMtl5YNpj414UvhFd5NdYf/xXV1QbfLcvVNKKG/uxTa33Rs4kMttMeDF0GciENdl4"
+    "VV45vMKbn3XM+meWa8jEberAnOmqoIvPxw5JhIPfHIG8dw88nddUfBAONHgafgpS3skdwW"
+    "t7BvLLhQ7mCX7FBXhhS+hoqtGlK4yRXdue5gINQ3WOIk1wWi+4VruCkvqcywaGkXC5MhTD"
+    "3B8EDfZSFIUZzyqpQTxDXdgC6hppjLRSWBINgJsLTia7m56sD6i+IqzjSp5gpVdcemih4Z"
+    "tnaD1dfEYtFq1pL1Er4mA12+XraHLC4euW/8A4Py3S9pu50BiuuGtLtFrulqXtOFSGfXIv"
+    "osF8C41KYIu80A+dPx8YcPn4/ff/j048nHz59PfnwfIpq9VQTtl4tviG5i+MyuSzhQVXOV"
+    "JaXauZFvI0tnv91p1Y6YSkq1ZFPOFtCEUZvle1RYmsWK1khWWGbVaredFw64DcYUliDQKe"
+    "7dFeyBlGgNBkGzduo1aP0ffHYpv7802Vtt2UmTfU8rNrOfjZucleN00mKvycEv43Rkzrn2"
+    "+PvDnioDTwTj1pbPiYslAXrE2IIo05NgOzEepDay8N+S1TMKtTXRCVdQRez9lRRjm/wadp"
+    "AcnYaFApaW4xhxtfeWzWrigeJcHUul5Vd4WFV+AV9PnPty57blzeYp8SwtLGw7cF1Js41/"
+    "lmGuh9qcTj2DTvuPOUnkxAW7ZbhsJ5DheJVktUd4ir0TUc2BEsKVxOjqCCeyUF0oJ8gkt5"
+    "Y25L9zJTGGAalsU0UDm18lzrPj0gXy2Umq3BmbPPBhuaSqHcQgjDsMTWfcgWIsUdRbMprr"
+    "Dg+pgNeA9gr/d1jhBcjCR43N8EBDzyZX+KbBdmx2Ooj/3B+c9BuTi/PcDduZnQgMgWC0Sk"
+    "0AbK92WMeu6nqO3KRQO5ue6jyVeXWxfD2LvS1hu2WCnePkGN6sCiOclGolI/yxTKK8j/mJ"
+    "8j5mjwNJjg4V4MxKbs9nEfWZTl3QHpeB9jgf2uMMtJLr2gtKRHJde1qxGa4rvpQquQyKi7"
+    "wmekZyXBs+dBXbVQ2MzFWgp3kIlqVkEgaO3Ay0cXJwN/F5ZzZ96ghIDXa9W8RhaEGJl/iK"
+    "fEjltoKtG83ipDlobfRNb5HpnZkURNu1N4RYds5urq7616Pe6GZwSjRrgYyU6lr22BwNem"
+    "d/6w+wVqB3ULgygLXJoN+7wouwYHFhEbXgZHkjToWE7mVbj7TqAXtxMRkJJM2/PbQSpPm3"
+    "pxWbMf+CwaxysENW8JVmJZEGtEydIVNntCh1hqQZVqQZYkP+9lpdc7M5ZGfAJnELvHUKyI"
+    "Ww2eazC2EP2Si98D0biBJ5hflqMXDnZwrGFpXSt78533711X5aVm4+2PXmgznVMLpPN1cx"
+    "ytPCsjp3XJ0wq9qr2eFJSVmRO67Ie93UnflKNZkSlVW56yHWMu91e7Ea7ZmSlZW588pciD"
+    "MA5p+FGBNpSYBdUYVt4hxEV3fzPF9iSEOBlgC6hT3sUIqNAMrMUo0qWGYEJaYZTHXzUXdV"
+    "fgR4RXdgrg65oV2MNRt+ubtvVahTKiTSSRthSel0pi7gTRS61B1rWvG4o3wFtfh42sGPSK"
+    "f2nvk+pVN7Tys249TmkUaKNldNkxoVxz6R7Ct1bWdo95IYZuSkvzaFZw3+s/U2NjfHjZZp"
+    "LC87IpN9tAYsh0zhWaSvcV27LJrC4auqXzK7Uy7aIZ1arlc43Tt3q3Z72m56WfikLOhiQu"
+    "01kQnivVsKxNJQn9fGgLmlbyNNbcUC7dep4oABtSYgt0zTkPJA420NSB2+Zd/Fbf74EeRJ"
+    "dcjSpoe2ZRj+Ce0HKMn+wo3/8D0LMvHu76nNFnw1ARkciKA43iQ4EXE9QKMJk33j0H9Ayx"
+    "pbpZiROJzCOHdf7MakIwv+KdlNt90o6+2iIYtkW9aiDkwGvsKBr29rfbXnOJamqzyndTI9"
+    "CDnQ74lqPq/bJVeJOgpG8bzgo9go/0IMUmxmkTudmmbodAtCiLiLWrFV86ECgCmpV2p182"
+    "OEKU8yIdzRme/rEcm20t1zUma/10n+dq8TmZliP8k+yeLuacXKzBRyY01TiFq5RWTFLSJy"
+    "R1LZHUk73BXCzPc84yyw7V+wzAI+4eWEmd/gIYxKeje4uSI6nn+5YGtTxiCpgbl6dHrED1"
+    "Zib/EmmypzDT3SANy6AejZlWLU/OLtPADopFRyipOC5BQn2eQU8TfLAJkfi5oSa4ntt+14"
+    "VGkL7oXJIG3BPa3YZtqCbZiTM0ZNlXXmiwZQ4BPZtPmzw7T7FY2f+pbmyRgUwfI8E6SSv0"
+    "TnUSCx+BjpPWlaRy1aPFc9RbPe8zP34OB5PwqqohGSlGrJ0nkLaMrjHWWiPLlQ7UgL5BVV"
+    "bMYCkQm/5aF2a+NZ1u6oIW91ypajdYTnNnIBVE+kZEVjLbb5QmCpJbdm5Jtpyf0g0kZr2t"
+    "DVbayNthd2hXRxbNDFIY22+o02P7G9Qk380qp54wXSEt8XU0SwKH3R4qVqoohIkUzan4Id"
+    "gFGsJTWVhW56LnWUCb2HxXeFhUGRiu0ZO5/e73q9EAOV/ubpNrS6oCniUa5Vm3GeDtmCcw"
+    "YO/71Xz5GUVtCS1cUWVmv+KCo6NblCky7QIht1yomRwmjFZUeRGrn+SBokifPT73XDFUWz"
+    "ljuvKU/XFs+LVQ1Wm+lNg5eXpwRujU1+OJNyc335r1PiO78s03gem9c3132oCsvk37XzU2"
+    "U5iFPP5oyYv8aosD7JV7C91cnRcYOWJ4kUX6uNK2INchQvAHqlI7zzNcjFSSZbAEaFs9XF"
+    "Qs1i/NfhzXUOxjnyKYTvTPj071Ndc7vE0B3310biXQAvIlBMNaVZpW7SkYYK0lQTPB2av1"
+    "KU3ahwJBHKy3EkbeKYU2uh/5G3Ismza+JSrRwv6t8JvIS2TGEUpQbV2HLAhuWxYDWRP1zk"
+    "a5ADRokBQwa/7EWMhAx+2dOKlcEvnU0wwqrGnRDK0rbudaNiUuY88VeaJSVkbCdWxeykAs"
+    "lXi2GwOlT8FU1FIMXirwhNGdy2weC2vO5eA5pByrYvVjPbZlksBWNZOSwTM0lNgGL+u9tI"
+    "Y6tBFc20ZZBNjYi1IBvovA1Vthha8ZTRkujWBo2qSUajjgy8UdRq+9Pweo46owqLuEJdNe"
+    "Fyh1pbhsqaUdB5ztGZpxuiDMdXqvk8svDfksObnxX8G+pbBdodbhVmX6CkYr/T32Nj+6JT"
+    "JenKjLhujqFls9p4oM8xqBnG/gAZVphfJJM1353bljebp+4FlRZVl3CkhetKBvg/S0bAF6"
+    "R7FQ4pZeLhZeLXlobFS2p3LxhASe3uacVmVkryjJ+VRkCZb1MejNS8g5Fk+k3a6PSb15ar"
+    "3+saMzgvrVlHsGROFylcMJuxwophzcotmDugl1j3xIGm9U51XbpY4hEScWVONv9mGaGxOT"
+    "ZHaHQ7GGGauEng5fVHaj8TX9jheTu9qY6RV0Q1p1Bk4s1m8Ktk1s7vYYOPLR6hzPdO8DCW"
+    "B99z+EXf9MK2/qtc+Ne88I+BWx6/pNBrmgzjo3aiFy+gsVtV2mCO9GsF04/0hmaaxTA/oC"
+    "spVUMQ12oR+3+590wWUEYmnm7AuOi8xcf+b2ftGXNrsV3pkVfUkEvsnshq2V6Dzobpd277"
+    "1+cX19/g3tgc9q9Hp+RobH7tXVz2z6Gljs1BfzT4FyvwIT1xFjb7D8efP4UtHn8UNfbhVe"
+    "/yUtDibduyoec7ATudxDt/I31GsCXxodveSm9TF1qiZnki8yQ/OiIptcvmu7PBWLKBe0Ea"
+    "ZdlAtAJWqNWYWA1V2qyRp0E1GHy2JHT3v28KXN+Sj1yXj5Q8Wnt4tKE3iUNQSKglynZLM2"
+    "tOTKwkxYZVT+JyxLUIszJf4tlKSyLZhoUdoqlmIDGhWNxZUg1L+nKs9TOGTZtblkPJ3HrC"
+    "YlCYq6RT0Da0FpQLQFmbkiWotkzVIAf07ext1z9gJ0wnwOg7bB9vusRCgo5Jjc14eOfhkz"
+    "6lgXzsiFp/dUd0k0Dx3EN6In4vSRTlUB6JiNtfc7nCKMNVmhXM3kwH8cZuSwZxJeNgZQbx"
+    "ZdKgUWxi527YHyi3/cHVxXB4cXOtgBV6/Q3pgqP378fmzeBb7/ri370R3rrq4yZQpXd+zu"
+    "iEvPuD/tXNL7zEUaqE6DnH74/H5ujmbnDdu+pfj5SzQR9WJ3DjAz4gdgPWGwP/xlHiRv/6"
+    "nF9OKrq7PQ8UfRibV73R2c/K8Ozn/vkdo0M+onp+ddBPXD8Krp/dXN1e9kf86nF4tXd91r"
+    "/0y0aa+6PRxfW3oTK8+3J1MfKFPo7NQe+sn7h49N6/2Lu9HXCkPh4d+dcG/b/2z/xy8MTL"
+    "i1/gGtMQe8Ojk/idwc3NlXJz27/m9z4lpALMPh59jl//enF9MfyZ3/gxfiP+cUc/jU2ojX"
+    "/EX/T4vX8trOWPx/DuF9e/XIzw7c/6F+zqCaLrX+2dnfVvR/xqvGzwpSeIrX+1/8/biwG/"
+    "uH2KqizD/XIfbybb3Tm/GJ7dDM6V8yvGDPaveheXjBj8R//Lzzc3fwPkYIK9GkKtbh18mQ"
+    "my/t34ktjaC+NZsiJ7WrEN3MHczg2OkllaATTJLNXALOX13hrQq7iXtrnb6Wo4J2KTNF0c"
+    "56+w7PFs+tVQhWFveUW7RSRd4vPvuZRyD2IlSTr/QQRFGJ3F8thBxbyb6g7/iyTorJBX8x"
+    "8moO9q0InEXs8wrCeHDO/Asu+dX11cM1qP5xt6pMYzV0uJOn3Etj4Npdkz4w9wumNzaTNu"
+    "BJ99d0E0w3NdamdLEneuugRTQCKxRyaqk/5UIUmX6Z1+TeBWpSwNV1gaObf4Bbgf5BaUhF"
+    "vdhFsK6BWs8ZSGXVvhQd/Tp9jY4Xvs7QfjrJRLs0n5Mzv/mLO+DYOB7gS9n8Cf/kuyYQMK"
+    "kHRHbopt7r/nCiZcUrJJEQpYKSZDPaiQJzWqkQOUIfo90TzbhqYP4zefbOj0zdo10yRDr1"
+    "Rgg2kJcwPnx8GFAruNf+vcsL9UFjeP/rqJ5bnkaf4sqvN3QQWvX7+bCJmT/Nhe0CiSH9vT"
+    "is3wY8HUN3muxvBk5HbLjXViBtPT3ApnyNjMWWlJWBt3tnv+cf+4NJlhrbMmLSQeAbbHTz"
+    "av35eFODPuJQAe9kfk+u7ysgnE24X5yE2lQs7NL9UtS7fpUfkXaTaum+DhVcx4/I+lm3zL"
+    "Z8KGzHJpVQRlrpet80eVD7JY59iK7aOXyEJ/9L5MGnoolZuHnt2TkRmbZn+w1jyn0uFAcZ"
+    "HX69p1Ku9wSwq9yg1u9PelDjbYKlxjQrJJXOOr3A0lCau94DUkYbWnFZshrIJuV5Wwysi9"
+    "JjJFMlKSkWoPIxV11e0xUg3GMDNyNTXUa0ABOsftvEA5BcW6pUO8bC5RMrrrCrVlgpz43k"
+    "P8I9CW5Z1KSya3YPqXGekYlrXuiUmfUhFZ5Gmua3Oy8KD0hI5N+H7beqRTMnkmajzoa0Lh"
+    "LWgm3ALDMfzmwKPFXHj3CR5pezo2CfxPn56SW1tfqPYzeaDP/CLWxSnxYYeHJTTiTV4sBu"
+    "MpiVdY/A4vage6oFGeErZzFdnX8HLmxbkYT+oTvor/mxwsqTmFKuiSAI8uqPoP1UDTm+CB"
+    "jzp98p+X4nyDe+yh/ivEpRTmVodPSrrZ721rEcja6c9S3VMShl4E9YtueB/91FvlFg9KlG"
+    "Mqv3fiwGJvZ4Fx8Vx28VeUoXG1U5vsvxnk8qnNoPz2TvcWu0EKOndJv2fqJO9yR3kXneWd"
+    "YT3jr5yBOD9KJyW261idnHGxmeE4ebnYCrj6vLxrG2zSHX/87+S2axK91u4PpY/PKlUacl"
+    "pu1y25YDpsZmtOzH0Z4ItJnbSspHUaxtfF1lLV6zYhKjl1yanLPio5dVmxZTn1tNWZqdyC"
+    "ZKcZyV1vBirBRpRcR9Z96m7EYVQFOS3YrGBbEQGzPYgLaPl462wjlVxfWy7LNQv6c4nTT6"
+    "P2uT2UG9iay4Oc7s9NZfQ7L1D55Tn8UtR9/lQsozxfGRW63SjP45OTMizRyUk+TYT39o/v"
+    "rMV+3QQXJENoZXIzad51pN3+iio2PNc7sxYUrxKjBqA6z6am/OapBsuOseaB8T3U9vdAWT"
+    "MrPW8tnugX7BC68Py8NQBBPf6hfU2dmYuRsGHKXBOERIgPqGtxu2A5ypaWoWv6uqigNXuL"
+    "mp5bjEf2NPnVATnnur6hqj2AJEyLr/AM+rWAMwyU9h9bd5ptKv4A5t6Fos1V0/TZgdXBGT"
+    "JlZ1xXi0GJzkNYE5C2HnicztpTcODG6uAUHf/Rzjk6k+iwnrk6lXWxpc2I70uvEZZoY3xL"
+    "EVnQxWTtpX4ckSumsMWILKm90B1n/bEljsptqLTNyIBJSl0FfzpLVVu3H90yddeBtq16cx"
+    "IBmtYTPJUc+BH9JPq+aunxXrCdQKFiW9ZCWdrWvb62ITUAfQNQd8u1tbhZITK28kjt6PSq"
+    "9aGxf4npazk4SJopE2vdheDAV/XFctu7dSxpOIRmlas6D+saDoGyEehq7/oPhlTM5Fzj3D"
+    "XkGlvWTrbl/PbXOy+4wKNVUTlH+CIqL93hNTaXTbvDMQfVSi6UhKD0oEjXmKzYV3Huzy6q"
+    "Ux78I1ND7BrPjaaGkMco0bUP6E56fRXVcQC7GtwR2VVxC93AaxoXJcnGK9V8Hln47wrdfj"
+    "3GcdPr8IIGzL5FKbClkl9mY4uDBZaI0LZsVh14/kxqKIlw97tHWHeCwlylX9Cd25Y3m+eU"
+    "ET8jt//BdSVTNX+Wtj1jSLxgfyYxK2eDJt9f2qFNW050C+zQWPuuGqEtEN1x3oryqG4+Ka"
+    "8M15bnwkgzW/Inr7JiJX9S19wtqYA2HmdbImxmLZtt9diZJttr0VelbbW09ZtvryVMsCJb"
+    "LWPYbdReC8mAXHMtHeQisNMEcTD5BpowBqdKtkuuIBbkUpTgMlsY80mGr+oQFQ8ixuOAbf"
+    "jbnKYPDLbIXH1kCSp1G8NsCEwA7JBizPVo3fv6nbekr2rz6DEsX+aEssAclvWS6uzMUZU9"
+    "CR6SPuNlbB5MPBdzVJGJ5c7fVE57ecc6UuwNokNiyQF9O3vbZY/G+8QPE8LzSvy8k1PdWR"
+    "rqs8J1/exBazi8t3VqTvlZm3gzN4VmkGArdhXTguK+8vB1uBy+QUyAYxHFLkH7dXiqriiA"
+    "iQvGoYopSCQBzA+C8sFzlKU3MXSN5bD0j4CNI4bVr7tOUKdEtSnhEgDCo+7o0IK5qmixHs"
+    "uHGSnKJNCM1oC55Q3VcQl0F6yx0mk0A3b0V0yZmZ5d2MXwo2USTblznOfaKBoo2JCQHk53"
+    "R1XERqUqQKfldp21tGA8XQVrmbU0Nyg2zPUYtu7G5y6NRugM7C/t8I/kdr3DPzxUPTasOJ"
+    "nJc+0KkEkAJKHTlUzda6jYBjJ1Dd280f5oqPqAvSthUW4P1QKOdLsBPk0EuLYIoLxBYvvU"
+    "c0MHiC3S0xvYhJgiF3e0D7ETvgByNw4lse/D41xgketa61WHYKfi2vulzKm10P+gNgdxq0"
+    "04DpgekGpkQg3LnDFi9QDlGEk7M6wJDCH+N6+7Z3GT+2byG+PLtHjZCKY0Qa6kutI6XHm8"
+    "2VahzRNyjJpG2tyJFWCDFKtXHDBm0MJ8CrTrs59dxq/y0WRsxrsPyFjMeOQs/JMODcb0Kf"
+    "fwARUJcSZzSkZzmvmWOBWN9xkLPaF48PrMVk1MPht7O5/wVU2Ff05EHjM55Pn5jZA2Zu+u"
+    "O+kHogqOhEAFv1FGBQdQoILfeFGFiLmOPpdR0T4KBdR1SqAMd/29EzVoPreE5HWG1k6UZD"
+    "R2oqwksWsksaOWXZF/SgpukYDKGfTOhD0xbEqN4p7CoWAFzCPBZmCeHboai7m/lK2OeSTY"
+    "DMyzY30zMZcc6z5QcZJj3dOKzSYpSy3RSi6n0mK7PhqlPlu9/dxqjbAy7i8wkTLINoJWTU"
+    "yDa5J/1bM7NbIJl2X/0p14fzep1tKQt7CBdZNEVjr5loC+EuTnyietxMnBXqaqBtRzUAcB"
+    "IO/1mWdzyttXwrgofI8RLAYIPoPgMwTU1Rp6hGRF2pHAsEkzFZKMWGk6bGpE3ba398nTWN"
+    "q2vQ+mMtvFQVwVnACW28FTUttbxh2d7Lqrx7JBYwpAQ1/oApMxF7mk0PaAO/7YHOAclg4c"
+    "nqjgIW26TQVzSyGBJVawcyKrjk5eI1fFzGLWUyvCmxTcdSBm01BFNyGAtcjLu1KIbEZYop"
+    "tAd65P6argZmTlgCBqukubMtNGm4u4zhLNN61ANmEBygt9uh7KaQUSZQHKJiACvR15j9WR"
+    "FimRaKd3dAQvXA3hpKAckKU3cQ+dTtKbuKcV28AdG7uoTplbZRMU33aD1w39kSr2+gfEJE"
+    "8QvQStgy2fE7M2zkkSbydHujUIjE275JKHvuQ45TInwxS75QQn05Twy6EgiQumPGv32Rwm"
+    "Aq/cKlow0Puc3usmdYjPWLIWxwrzEHHXgjsahf5EVF89nTK/nk0w2S9GxPlnTIK6Oyaz8B"
+    "yXJ3NRiaGbDyAQeATfzmZE1TTLM10WpL6g1CUL3dQX3sL3Fsbeo7zTkJ0j6g9GLAexINpZ"
+    "+hBXmCC7BT7EOOipAUqf5QIYl9rUUmMzQP50fPzhw+fj9x8+/Xjy8fPnkx/fh4hmbxVB++"
+    "XiG6KbWCxmrbCgHVdCNybUsnXcLtCt6gVPCElXeCzk26Uzyxaebf3X4c11Xrx3XCoF550J"
+    "n/l9qmtuFyYRx/11U+B2/nLvmSzNGJnA0OTqpvMWH/i/nbVXNSKEEY5ib3naMd5NWouoIO"
+    "0t92fQvIV07miRkdvemNEghzlbjiiw5rmnemXvTlZYsokieKe/rQQsF5OQZnhvsClgUV6d"
+    "9o7kpC9Bkt77x41K0ntPK1aS3nWtfSTpvWPSm+1UqPEQa6Td2n6Q9Sb5XjE+As43F8h83p"
+    "fV5crk74U51R/1qeenaP7B8anVBJELvcz1BDsxqggj1TuC2w8OefLzWfgZsueqQyaUmhG7"
+    "i8RsbM8O43nzqdjHFFRsr5LkXjfMvcJKPqiv6jZAXFKaVkkzIMBmheViSrSG9WKz9nk0aH"
+    "kYfHbhwp/HKSKNUGGMSQptb1n4ftdjTYoa9yeAioNLWlSOLvnQrjDCCMTlKLPjUQZTcina"
+    "nGoPK1WpQFxWaWOqVKG2bQm23udv7xTJyj2e8gjH/SXmJOO6pxWbYVzbnFNnZ6vpOD9SDT"
+    "yB5GsCsYCmTnNOa9LULedOuymuWtBu9jfFUO3oNTiNEM55Xyy3kxOtHNzuvhSnzJI9TCy3"
+    "QoQyS+cDIsmoYnEcck5ZpKCHLjQoh9z0PHd+jElk2Ylo8FgWchy8G0YJo7zuNzekr+HD+D"
+    "mBfgrzAzzAMe6VOXQ0a0mnbwie7ugfCqk6DrRepLGt5HGTeXS2pK03S1v7IX+CnC75QZdx"
+    "md0e6Bc27uCV2MGewaGfP6iG6y7tH+AvZ/HHhx9WOt3vpMyBcyf5582dZI6b0wwd+phw5V"
+    "GAeVxo14f6BaMFeydycb4KrpsJe+UoORQGMoGp8yK8kWCzII7eqxEwtzRXWedrcAwlvhCb"
+    "4Ng5AROrOdDuQw6zjuhY5HIIb5vx2ou4zU50pjNvzXgAJTXxOdO1Ya8zZ48KnQ/W8poBy8"
+    "Aq40dGcHsDSWeozlVcZvzM36GTRf+WvQxhLxcfWfxsm/7Lh4uS3uVodDuIqcT1yfAqc+Hf"
+    "H+KXVlq7bGSE4vErwtV23/QWGbM0nQ/QF96lI7dz5tk2zquAnslPtCfRm5VelH84/vwpXI"
+    "/jj6Kl+PCqd3kpSnGHj1UW1HHAzKwy5Gcldzzq96ZT3R/3+buBuQg9YeGf5GYT5n4hsRdu"
+    "3nzAnUW8VazhPUwpaJL/sIP2EtTPYkmse358keNpYNI7954R6xDr10+DqPTyTka/V3F/4Y"
+    "rVL9DR9BbA+yt749dX8dLtuRfeMen23NOKDcPRM9z+S3H9rz5pS+72HE7E14BMzM/R3s0l"
+    "CZy4Yc9OdKgJGzxKYqszPFQGYY4rPNmTsQK2/woN3RCS14qKHWvpBlfOyaYkHE/lPG69sL"
+    "vgmkklCa+aa72cDqiqgthBs4nXxbKeQ4mzpBr6lFHeCQgHHf6NRrx3LIlA/j4Rn/ZM7DCT"
+    "20Q2v01k3wjHaCpB3jF6y6bQjoHPeYVlYEpUrgPlAl9W7BbiGnGWrjTDRAKvKSBPbr7fbF"
+    "Sjv0KqIZgxFgnWPBTLBuJFnezl6EWZtyAHxBryFmzDEGMma4H1FZi0JUyu0JAuYWaxxaPg"
+    "uEKBQZVbNLazHnltigaXtaRm/PBDAitYE8ww/IWrVp/IRS/VfywdVnzdscmNtOBjMeuqZU"
+    "9jhX0loaMX7tzrpu7MuR4NW7RhMFWsTCjPK3vKX3TOLmiWtzQoN9MJgvSAlvu9Db+uVFeb"
+    "dwk7ggIuno7NQ/KFui7L9wr3Df2eas8wRXOLnyVqxTK3Nn3EWE70vQEA9nKuYuAlk8EoOQ"
+    "cL9VVHB0XQSexnfCLaphxYhhMWwY8/DM3NBXVVNG4AWlgYcDeeDNvcuhmJFVglgiIov9tw"
+    "za9wNWqAqTDNdxqYsYdTaESHR8cfPjYo4qEZMbKrs4HZKNlUgGxDAmPZGbrVM8DGhHaONL"
+    "ZtFgJkgVkWwtzYlp0Xy1MwkOQF8Gw72iQI4WFTr++/PsBpvkvgnykA2yW6iUcyo1nqdMO5"
+    "uRvNzA1p93vpf+6wxREb7J9UwQKrJPT7QnG8Eu6qcxkLJ+Hv+coqeudcVjO8iHXTWwu0gq"
+    "rhGBepBclVl709x7E0nQ1/kXuOsNcjBzpYXOZz2Zlo//iuZjTXNSmwYX9Eru8uL6uxNqnW"
+    "nYX+xqQjC/4pCfxVoKV17bos/PEuXaYC1qTCzKm10P+g9i1MBjRnl2+qTLeYEgtK49m4UL"
+    "wkLXaFqpiTH1kXbN6RJuJryjJkpaSQg+Kvzjfz4mbrw2Cx9q/e1WVyz3CwLTjUA4IuqEZF"
+    "ozl9Zjp8ihMUQE1azB5ylhiLQA5YgkvLTsQ0EOsJ1oNveMiDC68/8VzqnI5NAv/Tp6fk1t"
+    "YXKlitD/SZXww1npLr4E/e4/lnkQk1LHgpaJZcAB97SnArPHmaW+FiFGk5X+KAhVAExBsr"
+    "YNlvuHT0uackqnCCvY8ccBO6S5wF/v+PD11iWS78pq729k30uvzph/eCHWjRO/AeSZ50+B"
+    "Yz+sr/G72ArzHWPk6JaLcVEnlPc9WNq59a1OHiQaWdhjXsYs+FZTqeZUEOUAgaJOYx9WUT"
+    "jcB/Cd1Rlt7E0LVTEsUDhE+DynjUHR1aPgtvMXhKVP8FIrvlNCJRfcGYteBXXrjcFRdmEc"
+    "zQ28IMmsJolxDN4FCqEFP8xbp1OvilUAjKfk8pCRIVsFshOqKS0eMkK1ojK5oEuTSDlJDa"
+    "OYX08gDDhpZmUBdt3QmcHIz9wSR4uaqwHr0vgyuUygWW3dvnjcDBFNT0/cDBzJiFPP/UrL"
+    "jMrs7MEsPPZvdoBmeTPK4FMaU4n+vXroWNnJ4VzZ2ZangpSDKS23mm284vgvXP2oDLA3Zk"
+    "9Fz3NVLLr69iM1Ry2hwpaSGkxXZMK79kspMDlGPGsZ9azCcrtkiS7kuSzU4B59EIyjlsmz"
+    "UQz5zHuo5r3JtGXZYhTff1/c0zuX7TLovpGgko5VZU4RbLJa7ip4pD6XRNNG6ZpiHlzN/W"
+    "ujsfaliLw49gPGT4cB63WY8HZKO7LofanE49wG+kOg8dgXsjWaBb5NtwgqKKC2VLOjZC/Q"
+    "SFCFObdWQIS6G3YEBZdzfRd8Hvuch5+7lGoUo1D6sDLoVvhy4Jaj/C66AbIgxrxdUs82Hg"
+    "uwcKeP5Swe5McpDMc+preUOi0T1R4n+uLZOig+MLnmd9qJvsZbnDBVoahsPAe4GJPqXsrC"
+    "/DUqf+e7uq7XrLLsHkqr7pDiWRAZ2oTu4hYBkiWxB1Hu0oZAS1SX93Fdsz/aV/7K6kqVda"
+    "QObT1C0lTcvjJ9MkbmJK3RoJioMTB0XUvV9O8paQ37UB1P8nWNyXfeXy5tspeQ9zRu+Mmf"
+    "HKzW3/Whnc3FydkqOxeXbZ713f3Sqjm7vBde+qfz1S7oa9b31ov2OzN/zX9Vn8Fiq4uRsp"
+    "oOL84hoUfygodHGt3A5uvg36w+Ep+SgoODy7GfSVs97l2d1lb3Rxc31KToJilxe/9BV8Z/"
+    "a+p+TT2Bze9vvn33pX8GDl4ur2ZjA6JZ+jL7i9hNI/31ye9wfwCf0BPPTH2Gff3lxeRt8O"
+    "N38CjaAQbtxcKoP+14vLS3RpgMK74QjR+emnSpZiLVnx/Ol6nVaY0bHrlgif2R/80rvk7W"
+    "2A1Qxt6+a6z1oKYLV1mIO1EOY9tkzRUjx/OheI7pZX2tnOW82Gj6a/41LUEc5HBbtEsqIt"
+    "mZO2sTkhsih00YKpmMnOSjcpB18tc3+DyOvgswvdEmxdwCOJqvhXU2K7crF2/nLvmTxX7A"
+    "TNON103uJj/7ezkdrdlGO1/dln6kC3Ri8qS/kZGc5VxqiUqBygdjxApTiQKlWZEpVV2YRk"
+    "vlgf1bc4CkRbuSirP9ovRGa1Q1gTki2BdNvci4zJ2YvQDRmTs6cVm3FlBt1u8lwtRiQj90"
+    "rZk93nLWsnhgUxNbvNvdWckIPuqqm3xP27BihLBsk0F8LMqNWk3GWxWBBBLEMyUqQgkAFK"
+    "KEuf1CiRsgxDjg6j2I/E3kgWGaK7bEOyhSEFmqHCHD0VpDNbSQ07wRWDaFgoAY+qIZNnch"
+    "CJd8PdfspcdeZv3pIRC1rh1wheI7ozNjVrsfTC4BUMbKG/w4dHJT2Hx0LYlmGEgS+g3SJ0"
+    "yt9NHZt+3BtOmHjuj6YaxjPGLSwdYhlT/2Mc/owJRSE8Hgvzgngu3wDKP3ehPuN3ojb7EV"
+    "/KsokahWv4e4wRMnydoIBJvCV8B6gdm6wIi8gw6L1LPDPUpfMdhNDe4B28+3t4K65+aS09"
+    "Qw32xr4lN9CXARiONSy/cE9jIuoHfpv0EeSjjyDqDLpP6biM5N6zRE3hhejZPEgjvv85fk"
+    "+GaKy0CpE7CZuzkzDT9suCnhHcNe7Dn3uHxyefcAs2jhSaalomjoTRUFp+51US9U8fS6D+"
+    "6WMu6ngrFdtuG1Ww9ou3MxDppNQ2zZOCbZon2W2a2OgqHuUcE2knkBvx9i6pvVAN3XyoAm"
+    "VCqCWM4hYapbO0dDwvtWLvTolJPPdzV/AwvaIPHh0ubMvNTdt2Xgeph6vUQlymhlpolP9h"
+    "IyD7ACBDIjr9Ktd2yMjtOtruZ+uJ4OYr35R1qY15CPznY94dy3rADKFkoRtQ/VEU2w4CyC"
+    "JLLgP4Cz6fhGSTnM6dMFNPuD8mZiTzzXC4QeZR1dmzq22TabrfoJSLWrr69sIjlK3YJuSq"
+    "XL3jsiyCfBdr2HVTRFu0lzVFpO1ohzYn7KohnpDZMeS17ybcsIMp2mS7pj9ElD6xvaiXda"
+    "Ikmt7LHqic5KCVwV41PWijh5KymOdmDt2xz+ob2y7qm2QdgdsqWaBb5LniW0+VuOX5sv+K"
+    "6yeg1dA1vrs15CmjXFEP9PnwUTU8SpaqbguSja6mpnzKT/jjlNzx/Ji+Yrz2Tp/iGTcAtj"
+    "02meZT4mNF+IMOoqfztxWl0PzZgwo6xBUJYplOpOlGDrOCzJfcOcSe7O8fRn3ojTMt81Cd"
+    "LnSzKPtlIFsu/WW8dJn8lynHk/QXrbTiyPcXQVOswrT5xXd6Gk+TyF/WVbMA5seThgJtYd"
+    "C3HUcqN0hvENz9yE/YsH00kg7ZUzpERj7vRcWG2YgyttH2raZ4SGqB7SQqVmhBJSJEq9lR"
+    "N6KMQJENxBITWY/UtsFiwag0dEmY0yBdUHiMQsawqklveUsrjsEp8VkGvI2uwvjbxAyzod"
+    "AiCw80WNLkiQ9vNmOr7cy6+p4JucYFfvo4AWl07ZHRlZ04pNXVvMlXWl17BK40EPZiHSkN"
+    "hD2t2MzWyN1v7dvBtL3PW/u2D2ftW/t2Y69GOZuZSzSIwOwIbNa8ot0iuzVKLq1wR2c12z"
+    "WMCHW8yUJnqcj8LVHpcx0FyXnLy7LdamjhOWRpqM/UPmQyLt/vpsV2pTF/cEqcOm/JLRNj"
+    "CXrHJheOhAz9ITwXzoGaZ7maukTzwKrk22As9sVOl51AyNx2M3gA7n2LnW5HJhQez4Jhdd"
+    "vfaTahM0z3hFvnnNhr4qY75vFE3zYYj2MTrUf2Kezgaz00Ntm3f1Ex4BaeMFTnqmOr8y+W"
+    "+4NDohr/hocCsurtEjBvl67vJMfyUPb4B2dsLqBb6Ydg46t4Yp+tzXUXvtSzc3MBf48CCP"
+    "BrFdNbTPD8OmmdbtY6jYOdAXC4UA0jP5g2Kbq9UNqjteGsJfvnPoXbNzbSOxx7KzqxEnIy"
+    "F5wY0xVsmbSstGakmSordhunalkuFcw1+XRdKCCJurzwiEfVEK0bX4qOCMXkvJJm6vUpN2"
+    "4rp94TycqGK2y4vi1Xsd3GpGRMjxDQFabMpGSTdrbV0nobNEOW2qu2iy1Nu1jk1LwxKVrT"
+    "V00PKJB8TSAWUODb3g6zOyqghk0teY2xBvy2fuBj7fAJ+lgznQZ3jsr6VIGzgBfplnQSeG"
+    "HpF30DI7j9wM4u/8GJc/KqplGHM/U21fBK7OZcx0iu56y3YC1t5WPY8AGnJDwglGv3TwiN"
+    "FPOy0e/TGBXPA+swACwQ5qVZIuvgEgjguYGuuljiPqEFTLrB6/Mi2Yg6Bd837nYjF+fh9r"
+    "fYNx9MqWmx5DZ/+E6AJbXv8Qp0yjcCvSiX0oyXSimKtQyuJoZDCSW5jofgaNlIf8bt8D1+"
+    "umoCXJnVrnaXRBLfiivyjPB2eKy6Id5bGqsV0RZNXGvmglj1nE6hcFtCJbcQb5qaZqpAKx"
+    "CVwIqArdTxM3KvtdvH1iAloYtJyMi0AJBGWZU7ikSLNYyXTfLYwnh96EYJZc3rtGURzIxK"
+    "TTLKWfsUWOJBu803v7FhlIzHY4YrUwHmpH/EPe5HOtcdzbKnh7AMnOMljWWqYYqzpvYqSs"
+    "pb2FOuhZmzvkamA81Zf9tXlwTtjVuMhqrROc8Cz572JqkJr3HrM67PZAF68XL4X3gb3cQ0"
+    "flHhxGU0WOGT+adNnsNC8FnwCUuXvRBmvIe12kQ3dPc59TLqI9hQMe38N8uWnyxIF6puRO"
+    "XYTwJrdju0/kOVzHQCC/mBmmCo9wD+44D3YBfZSwWKercXPDcOS46X1GTTe1A/T6nyr1bU"
+    "xUrjEbQ6CLNdcL34K7EbnE1wQ6ojrQsDHvEuawwD+IGsyNvZLL9BpAV5vadFOfWQJ1MOz7"
+    "hOEQ6hurKgllZYB7Luk84Z3lMyYn++CKkv4dM4kQzH0rCeqK2pTq4cNAsMzU3K+xd9Kgiu"
+    "zYmmLnUX6SCVB9mKtZWrIv8pIjB9PWXr5mVNdVRKEqM7zmVqcwsG2BRUMLwbDsGJB/fOpg"
+    "c6zH9pWiyA2de8tC3T8kwn1BpcIAc8dFk1/JLO3HpSouJhFiIrfINQlNUXsos+6xqNqJg9"
+    "m0ds+1xpdIEY9JEaYbYjfvhrPNsRV4eVCQ9hJ2PwMlGCpGi4h4YE0zx+LsuShGUzs0EQKM"
+    "3zrg2XlE6/qXiSB9EXS8v2uVoHr8/YddYp4uV4SPk70PMUcKqZKSdTl/HNwj3/W9i1RBPI"
+    "bhW+xF3B/EK82Ng8i9Y8/vR5GJsrWWYoyzTY4SbXd5eXCEoSLIQH4QqERwgZNR0Pw+ahPW"
+    "FWKcP/mrn6SAHLYJy/OO+Sp7kO821Mn8POUoF2lsPSyjDwzXKuUeULwkr0WS6ESblaElRu"
+    "Ccqfjo8/fPh8/P7Dpx9PPn7+fPLj+xDT7K0icL9cfEN8EzxI1nZPD6tVaCWRrOSVMtAm1t"
+    "ar4JtR0JIAtCTGZU5fyT98JXP2StLWWAXWSLKVeG60zTJLbBVQQ0GJaaalxtbzVUJQ8+Rb"
+    "gvDWs0iI7PxV8M4okIAXAp62Dqu6yIv0yBDWHYewxliqKtNCSqyWHrQHGVsT1N1KeK613t"
+    "7LaVZIbVYZ93MVtATjbY/7YvJ3JcTlVFsR8nXn2kJFcrLd8WQbOi4qBfnEheREm0CycsBU"
+    "Uqwlo9H28Iw7cVbANS0u8U3hu+oSJke8JfhuezYV+UdXQFsuXirBve7SpUCNXLjseOGy6r"
+    "wgJ4Tcg739QIQqaMZlWonkUaljqI8KjqE+EhxDHQ/6EHiTC7M2pWVlqoLs+fM89iWL7IXp"
+    "9k1vkYnDTbbZhILtRdK/zyDbuRv2B3BjbF7dnPcHvdHNAA9GH5u986uLa9Y4x+bw7hZu8Q"
+    "vH7993yjXy+pK8hVFFFRtyQk6miUml29AV/G7F0Be6q0CLVBa66bkCjHPjTgp17Pac1C3H"
+    "9CTPe4oiqqo32JSwHHpT81oiqq9CW80KvtIGKlPj78We3qw5InMO7kXFVj07KzmlM6JAtO"
+    "D3Zb/+bUCNMIe7eHNYb6mPAnaneRWdtzUsubpxnk1N+c1TDXa6lKJ6U1igGJYoUXAlaFDv"
+    "3wO1PdR6ac0aOW9UwAn9Y4pNH3X6VCs+uP+l7dhEbQhR2gU8je1jdfWp1vciG5b0igr2/M"
+    "zEraiOslCnIlu1Aijx5DxXFLO7D+Ah7YUoWDsiVGu2lzg07QaFtZulZeiaTh3Fh2g9cBCQ"
+    "W9T43F5Y2Lb4emHBLWtth2Wq21RzQ2C2CEhTZyBDNx9gTJl5Oq6F18LD3xf3DVW1GBF1ub"
+    "StR8AEtzauh8iZr6GdnQW/X1mwidOZ68s1W0dJLJraKnjuT77pdU0kWCbU20hTSxGJ5Q2p"
+    "BZYon0r7sTEtPJJZ46nJ1l/eX8fUlVvltwIYx5uET6oRoWFMbYuhuoc1m2dT5d5QZ45CTX"
+    "zdNZdw8WX/V67+K2jf5hTViRyhLFes/10sxYH/xeV8o5VMJt181IWnjqyK3gVT2OLWlUie"
+    "aFN4N8et06jkGrcKUCdMQOx/j9+s0od41mV5MrIPGhfo3ymCG+ubwRcyFO3ofTbQBGsEjl"
+    "M9Le6a/ExNFtrmLNcnTG+ZuutA21YbFOuR1hM8jRz4aawdTKtDoo97U2OLCrUqUXRQvejd"
+    "JqKOtjy0zWzV9Ac1h5LUJ9Y1qsFH2sojtcPlVA0sCbL09i8xnS3uncGSgvfSNcEZqOaUH5"
+    "bL29mO5ssgGRSO88vwRWoGzFWdhzXhGmpzOvVguTgCXe0lVmKWc3COqhId51ybGZ050Lql"
+    "PU50kEYd+IRneLQIF4xh2FSu1R4M0BpGU2eyrfp3ukX5VtWozEsJV/NhkAnTtp4wDaZ6cR"
+    "R2/naBmIjM3hX3G1QB0S/eTgA3st8CnugKU3PnH0MeE5GnkKfD5oJTyCsEwtU/vfz5/wEu"
+    "GAGD"
+)
@@ -0,0 +1,361 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `audit_logs` ADD `tournament_id` INT;
+        ALTER TABLE `audit_logs` ADD `match_id` INT;
+        UPDATE `audit_logs` SET `tournament_id` = CAST(JSON_EXTRACT(`details`, '$.tournament_id') AS SIGNED) WHERE JSON_TYPE(JSON_EXTRACT(`details`, '$.tournament_id')) = 'INTEGER';
+        UPDATE `audit_logs` SET `match_id` = CAST(JSON_EXTRACT(`details`, '$.match_id') AS SIGNED) WHERE JSON_TYPE(JSON_EXTRACT(`details`, '$.match_id')) = 'INTEGER';
+        ALTER TABLE `audit_logs` ADD INDEX `idx_audit_logs_tournam_6bd739` (`tournament_id`);
+        ALTER TABLE `audit_logs` ADD INDEX `idx_audit_logs_match_i_8a0146` (`match_id`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `audit_logs` DROP INDEX `idx_audit_logs_match_i_8a0146`;
+        ALTER TABLE `audit_logs` DROP INDEX `idx_audit_logs_tournam_6bd739`;
+        ALTER TABLE `audit_logs` DROP COLUMN `match_id`;
+        ALTER TABLE `audit_logs` DROP COLUMN `tournament_id`;"""
+
+
+MODELS_STATE = (
+    "eJztfWtz20bS7l+Z4pfI51C2JVt2orPvW0VLtKNd3ZakshczhQLBEYkVCDC4SFG28t9P9w"
+    "zuGEAACZIANVu1jghMN4Bnrv10T89/OwtrSg3nbW+pj6wHanZOyX87prqg8EfmXpd01OUy"
+    "uoMXXHVisMLqUldcLMYuqxPHtVXNhTv3quFQuDSljmbrS1e38Cmd3u0FYeWJ6jiWpqsunZ"
+    "In3Z0TlXgOtd+imqmlgR7dnJWSGJtjc+haNnXgylx15sS6J+6c+lKPquHR/8cuLA1VN136"
+    "u+vf0h1imcYzcebWk0m8pWUSzaYqvit7D8/Uf/MofN+MgrgNb/P9V7ism1P6O3WCn8sH5V"
+    "6nxjQBoj5FBey64j4v2bUL0/3KCuInThTNMryFGRVePrtzywxLw5vi1Rk1qY3fDNdc20NI"
+    "Tc8wfPwDlPmbRkX4K8ZkpvRe9QysGJTO1EtwMQa8f0mzTKxTeBuHfeAMn3J4fPTx88cfP3"
+    "z6+CMUYW8SXvn8J/+86Nu5IEPgetT5k91XXZWXYDBGuLH/ZpA7m6u2GLqgfAo8eOU0eAFU"
+    "MfR8bELwgiIRelErrgm+hfq7YlBz5s7h59H79wVg/dIbnP3cGxxAqTf4MRb0LN7prv1bx/"
+    "weIhohyJq2gv2gCo5JqZXQ3H5bTID56WMJLD99zIUSbyWR1B0FxjL9UdAgv1iWQVUzpzvH"
+    "5VJQTkBwFSzLNM0Q3pXQLEDvy83NJb70wnF+M9iFi1EKxrurL31oqgxdKKS7NN7fI0zZ+E"
+    "qniupmQT2HO66+oGJUk5IpWKe+6Nvgj01hvGaLhW+Y3sCU49dWAeaji6v+cNS7uk0Af94b"
+    "9fHOMbv6nLp68CnVukMl5B8Xo58J/iT/vrnuMwQtx53Z7IlRudG/O/hOqudaimk9Keo01m"
+    "+DqwEwiYo1VMdVYD5epWrTsjVU7vaH9pbUZfDZhZVJf1/qoG6FqkxKyorccUXiAlmptBaN"
+    "Sby8IG3IqFrDmhQX8vcPwiUpIpIF8CsYHPrM/Bt9ZjhewBuppiaa8n176s5X0zz8/gzaQH"
+    "A16na2+hQaN/GmAZ8HH0X5LH/WG571zvsdBuJE1R6eVHuqJNDEO9axlboSls3eWhwv0ldU"
+    "U52x78evwHcODFXn2dT+7qmGDgJ2R2TKJkt0Cw1aLKv8FhQua9aiFAkfQZhigS0rLIYGLL"
+    "8TPZaohmE9ocX6jL9ci2jWYomIE3gTNHVRYG5bpuU5xnOXW8RU1eZjkwthOXgsWVJ7AVrN"
+    "B4fc29YC7GFbBxmyhJUoqHHRMtZtghbwEjS/JUON29I2HZuaamiewUzuiQoTNNjL5F43dT"
+    "CycfwmNoWbsNLFF1RB3uaXD9RHaOMzyixxa0lO3kh7+hXY07sY+xM24PHJSQkjEErlWoHs"
+    "XtJkib9ZBskR/T2nEabEWkJQFC1++v8cJdY9AWoHV71/vkmsfS5vrr8FxWMon13efJE29s"
+    "Zt7Lk+pQoM4fDGTkVY06JbRFY8szYM2qnuwOw4VbS5aprUEC6tv+iz3JlJLL/SQjs9Nmxp"
+    "pvrp+PjDh8/H7z98+vHk4+fPJz++D6es7K2iuevLxTfEN1EPWcBtz3QUWMIoS7/pJbEewt"
+    "LGyEU7I7w9i+ZobaA/HH/+FEKLP4rAHF71Li+z6OHkiLSZSxdL0VhQDF9Wenv4HTYDQJv+"
+    "5uk2DImwMsaVrXJv2Qo3EbBxVRxdS2iTA654wAUz0YS3ESD+1+HNdfFgG5dN4Xtnwld/n+"
+    "qa2yWG7ri/tm1Rhl9fvChLr7+6SZYJFaQXZWngYLqi2sNK1O4LqiRBuGOCUPpj9tQf4y2n"
+    "K1ZsUlJW7E4r1n/5qF4te6aa+h8sSKUasy+QlAx/BtMamP6blLrm4VmW8Rc0marMf4Sy6k"
+    "11VzEs0SLuiy/79W8DxigLOTMhm99DrZfWrF1AJ13n+iO3CWoF5hK0DlStoQN0KWCYi6JO"
+    "TG43aE5tAY/a20gL28f2PInhyPKiRzE+BpX2LCrJ8bCEjxHLEyhP7i2b+/8ihyFBNhzAEv"
+    "gcS4mhD3IEz39gnkfiwIQHBTTVdIMiRDfT0g5XqWmWZ8Jn6mDGP49N1ZySKZ14sxm8gfT7"
+    "7cbvxyutiucvkmin728jwbRT6qq6aA4q8vuFItLnJ/T5Sc5hL0zTLOfgWp6Nf5tuNcs0I/"
+    "ea7NLdhuvtYAvEZm35qC3VYMlnA8ea1wbL2vKZTia25NPNsQYUS0Y+7mzi24/Ax9Def9Fc"
+    "iTMD5c2VJEvxsrmCT2GxioQ+QqMTWR8Ca6WUFBorA7qEiQuK4K4/R5vTqWfQKRd9AiODMj"
+    "uGGvpMhw/C0ERX1/SligKsEG4IdACmselQEHT0BTQp1aQsnhLjHBGiEa4nZrO3ZMBjYjAq"
+    "kuAcuAA7W4MnPBObooOLTuGt7kxDfwCtoGYKteu/OI/XPIBmrD/qU/iKLjwbFwGHLKTyDX"
+    "oeH8OwTpuejs1DMgy/SHWJs6QaWmMsuNLB2zdLarKYy/g3RlZd/Gux+M8wz/PgzdhH+Zso"
+    "g48hPOyHYLU+YG1Iw20Xhhtd6g50xmqrgKRQm8KJals6hUPACmZFWlZ6pXfslYYBSZsrru"
+    "4alYKXU2ItMb9TIcylaIzjAhrjOEtjhAFHjuHNqiCaEawF0+1uDN4sojNLFcQllkA0EGxn"
+    "K91EoL1tWQvFgpWNEgyyVQbxrLQcxnc8jMNC2PUE5Gl+74gktkdCR9N/p67u8bFM7/iY3z"
+    "k+ZvqG5Ez3lDOVcVp7UbHZ2IVg22U1Sy4t9opI3XTkR0XgIonX6j3ApaXClkFL27rXjYok"
+    "Qp74K22C0pm1AoDSMbMVx4x4M9yaKLYvOC6NZGwOKIFhMNPWD2Rcc+PGydJgplYiLyOamU"
+    "BqQBb9FQNQeRtpbC2ieRPs6iHVMT9P/QHEJYNDm4P3FmNDoy7+orc1MRqUd7dGaVvKuVvD"
+    "x7xj7kzmN80EbLKkL1mnawVZdL32VW0epZUhGpSdcP/llEyeCfpR9aVBg+Q1b8loTqPcML"
+    "pDoqwyY1N1mCc2njCGpW5dkpN4phlHBpLuxh/p2ZXobb94O0NIT0p5Ck4KPAUnWU+Babmi"
+    "cTk/gDQUaIlnYNvhozCS5DgIvhqWmkcPxIRSuN6jVNuQPb+5+3LZJ7eD/tnF8MLfAx7SX+"
+    "wmXoq21g/6vUsBkKvTj1lp6W+Rm7kllyydBLJiSzsJJM29Nq8oubDVuLAy/MLOdyY3iFyQ"
+    "G3F3RrZgZ3yZZ/G7bAWKJdheXoJdgaLITcST6QpZEgG5UlqU5QGOES5IrMzVRxpjVPCNuw"
+    "R32AaZgRee40a5gVWiUduFahqbpreYgBJ4MuYW47l/KWNuAg5IwKZ8T7lpGOK/So5lsxyL"
+    "TNK7duygTNIrN+xK80Pala+yYjPrUxm7ssIMLWNXNha70gpbs0EwiwNV6k2FVSFIpUnIbM"
+    "/sLLeZuvpG6gp7qC/CPcN8zzKmYCphcpYTi6d8Ig6Ihi77H/BcGJb1G3cfq5Hp2gVVmuFN"
+    "8VwZmNfhP92xyfdscKsUk/3iTd0EG3chT1LdoVEZZF7me81XPqkgId6uUOAtH1XgI7XyBj"
+    "aRvHSp7til6lcKYm157jr1mlYhq3b3uxPt1Wo0KSkrctenlZrTlaoxLicrcfe9sQ17hWFy"
+    "nvrJcWoKOSwVcVgQcJjZRR+c2ENFK77i42kSkvIomsxRVPDlSuV4zrScdDIInQw+TI/WVK"
+    "kYc5yVbAnEW4g+RiOuWqRsKCHDZGMQrhEoK5KXy40dLzds+qjTJ6X6qiMj2OLFx3G5xEgF"
+    "eZGyiw9EZ6VukhKVPaQRPWSlBU9GsiXz8daXPHwswWMhKSboVCbPijjn7gvr9nw1chFfBD"
+    "keb+pUixjKVSDbuIwd2t8QExk7tKcVm38aWbXQobRYu1yF9SWu2mHar5bGXQntB1jCVEte"
+    "lRF8pQ1Qhv6tCeD2z2BpKWgyXnI7ub4akaeqwZhWT1S13XNtGgzdiwfbCBeGtTfEVm4ITW"
+    "OZXgCXyJcWrVm21xqbC2B2Cdeow5aKToMtd/7rWue9BsfyEOyzZU97FQuxfaYuiEw8lzqn"
+    "Y5PA//TpKbm19YVqP5MH+swvotgp8ZsiXsYzh7Chkae5hWHBGOVLpzyDF9PO5eLnhp+SG/"
+    "ZJqoGvFFcUPyedHLjUxNNmoZm49Hf3DVfElZ6SHvsvwSb/zmSHNuFd/6jNU/LX4c01YRXp"
+    "H2rEi/v3eeHE1HtKRuHP2Nvj0zVqmw450KyljrnQcNusr8d/J37KCOq4wr+qiutLtMXBXI"
+    "f3vrgl/t9B4jNEnJeL6C94WcyA5qqLZVAsOqxVRlbLs3U3YSBsY8tuztm62JtzgtJzz9a9"
+    "M+EDv091zcXj1Bz31yZPhSIQ8aOLyfc0z95NMn+oIE2+75YMeBnfRnb89DFUlZCLi7xO0K"
+    "L5rcoImZRqiS9NHvoiXSwr+c7i6+Nq44tA8nUOM/Ko7LVZWnm88wosWLwD1gDeTUpd07pt"
+    "WQwF41KT2Js4zFcUE2MNLAZohsvJKdktYnYSH79gQooNUiWJnivVfD50rUN4ezxOmu/jd+"
+    "b6kkyo+0SpmeBTCH+Aw/Zbs6dkWaC1NfJUZPy6IA8ZK+RvK49ryk8rxlXhbZTNpBQLC8D1"
+    "77Eikreok7dwHBibVlpPpkTlgrJhC8qwfqrGTWQFX9HaKGHr82G7mrEfl3lNrv/kqb2VD5"
+    "qz1jtbrqWgFazEo9mxxuXkVai0eXiWXVYmelgJj6q/VKsRxWD1114MY93tZQRj84E0DUXT"
+    "YwLCYX9Eru8uL5tg1pQxaCqaMhVsmAGzCND5mrUKyMHEcudk4umGe8huT4nmOa61eJM1XV"
+    "ZVhBbLl+AGt08OdEdhZXXzf0ZQuW9Ox+Yh6cE66tDnR8nTPG0L4fFU/CYWxhApHdoAtBMC"
+    "bU+HpkBw65+uqYbxjBaQBhiSA9Ny8QcuvSeqQ9+g7Jlq4uUJ2E3WFONcpl2wxbB24A/LJr"
+    "wZTeE17+GpimFpD3TKXxTFh1CQqJptOWCYGUbiLR382jP25YJv/YpVxD/2zP/OyXPyK9Xp"
+    "Qkct4i981FVyaxm69jyEb6XMSW5TTAfFRL56+O0ceFA44W1KaPal2RJhPulssehjuEEouM"
+    "/hklaiTEa9ltPmqNSm+6OCTfdH2U33Mhn1BjeUxcaGDLaF2ySTgnJjZAZWf0itjGokJ0GV"
+    "DtxXwbfJzY97UbGZzY9Bt6tKo2bkXimLuvvAhv0jB3frcW4wsVXa5yzu4ZLfEoxblemtjA"
+    "eFU2bIGayZrz7fE9+eJpvcyYeUir7u+QYIAidnWgbFJonQFFvVEfCg6SLdIhqUVdUzy/JF"
+    "w6ZcKV8/10BCDXxjSv/+nmruO76dxXk3oI7l2Rp13p1ZIJqzp6cWrcgY4pINd5hM2eYgrZ"
+    "g/fJvhU0HSJz/ZiQBp1tAnQ9mT2PjpMAqSspc7JeNO7/Ly5h/jDnKf4855//pf4w4W8Lcl"
+    "+bt4VNtWn3Gbi7+lhsMAL0jfzt52yfdxLDj9lA9fY0AscZmvscedXxmRagdwpJ8Q3CBLzH"
+    "vKtu2IHvJ/uP7Enqb/wi8YMf8MnqGFQPsPsSb/ga/m1RPehAo0rBnAd2D5W6Le5DCncgvP"
+    "ZklO3iir0JyRRFuJzlI8ZwHNmWY5/X6bBTF//05MpIb9O7ub3La2gSccu6qgnBCSOJfBOR"
+    "q/qwCdlJI70koALV0jMteeZCUl3fwqKzY0gzMBQi9xKyyGq4YzAFtLHmS2ftUABrJ3rQRj"
+    "k0xKrIUISJRk+8nnT1h7jfNdL3Mnl1ihmbCjVJoQfH6WICkvWgMLMrXMH1y+H8ZnY/zQqP"
+    "zNL0FYappVEkRC8a0vGPMkLixZgBpZALle2otpNbtekm7cNbPYpsaeislsxdKvyZ0rN8is"
+    "AFqBD1xu7Fh3Y0dmObE+mgKPWnvBzBm0ZEDBtgMKNmncxCw+gXGTtAfzjRtmf1Yzbs51G9"
+    "2BvsEQC5FAKwX1ge0xeV7iDXPGDQ3B3piVtLCt/IZhPTnM3sFih86Savp9yo+LvkrLc/n2"
+    "F1SgMhWgYKhZS8zyaOFB8YFouX3/QY6RdBBTCVNIKCqNIGkESSNIGkEylrUdIEpLstU5z1"
+    "oKWoElKXP/09ZlPWswiivFoEtbXNrir94W/8L9bCPVebh5pLatT2lHYJSLinWLrHPff6e4"
+    "IKFYvkhJM91/GEFZEsgS9pCsNV5UGI3uoQstzgnvcPM7zF2BUmC3z1WXqDYVBFGfebYNbd"
+    "94JhY6LB1vubRsMPWpCV8Kr/Buqjv8L66rC7pdlqtvQgn93aXQ/qZjEx9qoT0evAjiRBzq"
+    "uiysGt9kTsm953o2zTPjZTTyZk1w1lRF4OWHI8dE6olH3jiGmz9QQHcUDDB+FHgKXtrCHs"
+    "ltcQv7xoIL5Q52yQ51ZUjha6jYqiGFm1zRnesOBkJ9gyVOcl0gul+4hpvyksoMi5Z2sTAZ"
+    "wtQTDA/0XRaCFMUpr0o5QVzTDegSaoq5XFQSCIKdAEsrvpabqw6svyg7CsqkmitU1R2bKn"
+    "pk2NoNVl8Ti0WrWUvWS/iaDHT5etkesrh45L7xD8vKd7+k7XYGKK4b0u4WuaareU0XIp1d"
+    "i+izXADjUpsi7DYD5E/Hxx8+fD5+/+HTjycfP38++fF9iGj2VhG0Xy6+IbqJ4TO7LuFAVc"
+    "1VlpRq50a+jSyd/XanVTvWLCnVkk05W0ATRm2W71FhaRYrWiNZYZlVq912XjjgNhhTWIJA"
+    "p7h3V7AHUqI1GATN2qnXoPV/8Nml/P7SZG+1ZSdN9j2t2Mx+Nm5yVo7TSYu9Jge/jNOROe"
+    "fa4+8Pe6oMPBGMW1s+Jy6WBOgRYwuiTE+C7cR4kNrIwn9LVk90rHwTnXAFVcTeX0kxtsmv"
+    "YQfJ0WlYKGBpOY4RV3tv2awmHijO1dnDpMOq8gv4euLclzu3LW82T4lnaWFh24HrSppt/L"
+    "MMcz3U5nTqGXTaf8xJIicu2C3DZTuBDMerJKs9gtsPTkQ1B0oIVxKjqyOcCDuEWnQu4Fra"
+    "kP/OlcQYBqSyTRUNbH6VOM+OSxfIZyepcmds8sCH5ZKqdhCDMO4wNJ1xB4qxRFFvyWiuOz"
+    "ykAl4D2iv832GFFyALHzU2wwMNPZtc4ZsG27HZ6SD+c39w0m9MLs5zN2xndiLED/VOTwBs"
+    "r3ZYx67qeo7cpFA7m57qPJV5dbF8PYu9LWG7ZYKd4+QY3qwKI5yUaiUj/LFMoryP+YnyPm"
+    "aPA0mODhXgzEpuz2cR9ZlOXdAel4H2OB/a4wy0kuvaC0pEcl17WrEZriu+lCq5DIqLvCZ6"
+    "RnJcGz50FdtVDYzMVaCneQiWpWQSBo7cDLRxcnA38XlnNn3qCEgNdr1bxGFoQYmX+Ip8SO"
+    "W2gq0bzeKkOWht9E1vkemdmRRE27U3hFh2zm6urvrXo97oZnBKNGuBjJTqWvbYHA16Z3/r"
+    "D7BWoHdQuDKAtcmg37vCi7BgcWERteBkeSNOhYTuZVuPtOoBe3ExGQkkzb89tBKk+benFZ"
+    "sx/4LBrHKwQ1bwlWYlkQa0TJ0hU2e0KHWGpBlWpBliQ/72Wl1zszlkZ8AmcQu8dQrIhbDZ"
+    "5rMLYQ/ZKL3wPRuIEnmF+WoxcOdnCsYWldK3vznffvXVflpWbj7Y9eaDOdUwuk83VzHK08"
+    "KyOndcnTCr2qvZ4UlJWZE7rsh73dSd+Uo1mRKVVbnrIdYy73V7sRrtmZKVlbnzylyIMwDm"
+    "n4UYE2lJgF1RhW3iHERXd/M8X2JIQ4GWALqFPexQio0AysxSjSpYZgQlphlMdfNRd1V+BH"
+    "hFd2CuDrmhXYw1G365u29VqFMqJNJJG2FJ6XSmLuBNFLrUHWta8bijfAW1+HjawY9Ip/ae"
+    "+T6lU3tPKzbj1OaRRoo2V02TGhXHPpHsK3VtZ2j3khhm5KS/NoVnDf6z9TY2N8eNlmksLz"
+    "sik320BiyHTOFZpK9xXbssmsLhq6pfMrtTLtohnVquVzjdO3erdnvabnpZ+KQs6GJC7TWR"
+    "CeK9WwrE0lCf18aAuaVvI01txQLt16nigAG1JiC3TNOQ8kDjbQ1IHb5l38Vt/vgR5El1yN"
+    "Kmh7ZlGP4J7Qcoyf7Cjf/wPQsy8e7vqc0WfDUBGRyIoDjeJDgRcT1AowmTfePQf0DLGlul"
+    "mJE4nMI4d1/sxqQjC/4p2U233Sjr7aIhi2Rb1qIOTAa+woGvb2t9tec4lqarPKd1Mj0IOd"
+    "DviWo+r9slV4k6CkbxvOCj2Cj/QgxSbGaRO52aZuh0C0KIuItasVXzoQKAKalXanXzY4Qp"
+    "TzIh3NGZ7+sRybbS3XNSZr/XSf52rxOZmWI/yT7J4u5pxcrMFHJjTVOIWrlFZMUtInJHUt"
+    "kdSTvcFcLM9zzjLLDtX7DMAj7h5YSZ3+AhjEp6N7i5Ijqef7lga1PGIKmBuXp0esQPVmJv"
+    "8SabKnMNPdIA3LoB6NmVYtT84u08AOikVHKKk4LkFCfZ5BTxN8sAmR+LmhJrie237XhUaQ"
+    "vuhckgbcE9rdhm2oJtmJMzRk2VdeaLBlDgE9m0+bPDtPsVjZ/6lubJGBTB8jwTpJK/ROdR"
+    "ILH4GOk9aVpHLVo8Vz1Fs97zM/fg4Hk/CqqiEZKUasnSeQtoyuMdZaI8uVDtSAvkFVVsxg"
+    "KRCb/loXZr41nW7qghb3XKlqN1hOc2cgFUT6RkRWMttvlCYKklt2bkm2nJ/SDSRmva0NVt"
+    "rI22F3aFdHFs0MUhjbb6jTY/sb1CTfzSqnnjBdIS3xdTRLAofdHipWqiiEiRTNqfgh2AUa"
+    "wlNZWFbnoudZQJvYfFd4WFQZGK7Rk7n97ver0QA5X+5uk2tLqgKeJRrlWbcZ4O2YJzBg7/"
+    "vVfPkZRW0JLVxRZWa/4oKjo1uUKTLtAiG3XKiZHCaMVlR5Eauf5IGiSJ89PvdcMVRbOWO6"
+    "8pT9cWz4tVDVab6U2Dl5enBG6NTX44k3JzffmvU+I7vyzTeB6b1zfXfagKy+TftfNTZTmI"
+    "U8/mjJi/xqiwPslXsL3VydFxg5YniRRfq40rYg1yFC8AeqUjvPM1yMVJJlsARoWz1cVCzW"
+    "L81+HNdQ7GOfIphO9M+PTvU11zu8TQHffXRuJdAC8iUEw1pVmlbtKRhgrSVBM8HZq/UpTd"
+    "qHAkEcrLcSRt4phTa6H/kbciybNr4lKtHC/q3wm8hLZMYRSlBtXYcsCG5bFgNZE/XORrkA"
+    "NGiQFDBr/sRYyEDH7Z04qVwS+dTTDCqsadEMrStu51o2JS5jzxV5olJWRsJ1bF7KQCyVeL"
+    "YbA6VPwVTUUgxeKvCE0Z3LbB4La87l4DmkHKti9WM9tmWSwFY1k5LBMzSU2AYv6720hjq0"
+    "EVzbRlkE2NiLUgG+i8DVW2GFrxlNGS6NYGjapJRqOODLxR1Gr70/B6jjqjCou4Ql014XKH"
+    "WluGyppR0HnO0ZmnG6IMx1eq+Tyy8N+Sw5ufFfwb6lsF2h1uFWZfoKRiv9PfY2P7olMl6c"
+    "qMuG6OoWWz2nigzzGoGcb+ABlWmF8kkzXfnduWN5un7gWVFlWXcKSF60oG+D9LRsAXpHsV"
+    "Dill4uFl4teWhsVLancvGEBJ7e5pxWZWSvKMn5VGQJlvUx6M1LyDkWT6Tdro9JvXlqvf6x"
+    "ozOC+tWUewZE4XKVwwm7HCimHNyi2YO6CXWPfEgab1TnVduljiERJxZU42/2YZobE5Nkdo"
+    "dDsYYZq4SeDl9UdqPxNf2OF5O72pjpFXRDWnUGTizWbwq2TWzu9hg48tHqHM907wMJYH33"
+    "P4Rd/0wrb+q1z417zwj4FbHr+k0GuaDOOjdqIXL6CxW1XaYI70awXTj/SGZprFMD+gKylV"
+    "QxDXahH7f7n3TBZQRiaebsC46LzFx/5vZ+0Zc2uxXemRV9SQS+yeyGrZXoPOhul3bvvX5x"
+    "fX3+De2Bz2r0en5Ghsfu1dXPbPoaWOzUF/NPgXK/AhPXEWNvsPx58/hS0efxQ19uFV7/JS"
+    "0OJt27Kh5zsBO53EO38jfUawJfGh295Kb1MXWqJmeSLzJD86Iim1y+a7s8FYsoF7QRpl2U"
+    "C0Alao1ZhYDVXarJGnQTUYfLYkdPe/bwpc35KPXJePlDxae3i0oTeJQ1BIqCXKdksza05M"
+    "rCTFhlVP4nLEtQizMl/i2UpLItmGhR2iqWYgMaFY3FlSDUv6cqz1M4ZNm1uWQ8ncesJiUJ"
+    "irpFPQNrQWlAtAWZuSJai2TNUgB/Tt7G3XP2AnTCfA6DtsH2+6xEKCjkmNzXh45+GTPqWB"
+    "fOyIWn91R3STQPHcQ3oifi9JFOVQHomI219zucIow1WaFczeTAfxxm5LBnEl42BlBvFl0q"
+    "BRbGLnbtgfKLf9wdXFcHhxc62AFXr9DemCo/fvx+bN4Fvv+uLfvRHeuurjJlCld37O6IS8"
+    "+4P+1c0vvMRRqoToOcfvj8fm6OZucN276l+PlLNBH1YncOMDPiB2A9YbA//GUeJG//qcX0"
+    "4qurs9DxR9GJtXvdHZz8rw7Of++R2jQz6ien510E9cPwqun91c3V72R/zqcXi1d33Wv/TL"
+    "Rpr7o9HF9behMrz7cnUx8oU+js1B76yfuHj03r/Yu70dcKQ+Hh351wb9v/bP/HLwxMuLX+"
+    "Aa0xB7w6OT+J3Bzc2VcnPbv+b3PiWkAsw+Hn2OX/96cX0x/Jnf+DF+I/5xRz+NTaiNf8Rf"
+    "9Pi9fy2s5Y/H8O4X179cjPDtz/oX7OoJoutf7Z2d9W9H/Gq8bPClJ4itf7X/z9uLAb+4fY"
+    "qqLMP9ch9vJtvdOb8Ynt0MzpXzK8YM9q96F5eMGPxH/8vPNzd/A+Rggr0aQq1uHXyZCbL+"
+    "3fiS2NoL41myIntasQ3cwdzODY6SWVoBNMks1cAs5fXeGtCruJe2udvpajgnYpM0XRznr7"
+    "Ds8Wz61VCFYW95RbtFJF3i8++5lHIPYiVJOv9BBEUYncXy2EHFvJvqDv+LJOiskFfzHyag"
+    "72rQicRezzCsJ4cM78Cy751fXVwzWo/nG3qkxjNXS4k6fcS2Pg2l2TPjD3C6Y3NpM24En3"
+    "13QTTDc11qZ0sSd666BFNAIrFHJqqT/lQhSZfpnX5N4FalLA1XWBo5t/gFuB/kFpSEW92E"
+    "WwroFazxlIZdW+FB39On2Njhe+ztB+OslEuzSfkzO/+Ys74Ng4HuBL2fwJ/+S7JhAwqQdE"
+    "duim3uv+cKJlxSskkRClgpJkM9qJAnNaqRA5Qh+j3RPNuGpg/jN59s6PTN2jXTJEOvVGCD"
+    "aQlzA+fHwYUCu41/69ywv1QWN4/+uonlueRp/iyq83dBBa9fv5sImZP82F7QKJIf29OKzf"
+    "BjwdQ3ea7G8GTkdsuNdWIG09PcCmfI2MxZaUlYG3e2e/5x/7g0mWGtsyYtJB4BtsdPNq/f"
+    "l4U4M+4lAB72R+T67vKyCcTbhfnITaVCzs0v1S1Lt+lR+RdpNq6b4OFVzHj8j6WbfMtnwo"
+    "bMcmlVBGWul63zR5UPsljn2Irto5fIQn/0vkwaeiiVm4ee3ZORGZtmf7DWPKfS4UBxkdfr"
+    "2nUq73BLCr3KDW7096UONtgqXGNCsklc46vcDSUJq73gNSRhtacVmyGsgm5XlbDKyL0mMk"
+    "UyUpKRag8jFXXV7TFSDcYwM3I1NdRrQAE6x+28QDkFxbqlQ7xsLlEyuusKtWWCnPjeQ/wj"
+    "0JblnUpLJrdg+pcZ6RiWte6JSZ9SEVnkaa5rc7LwoPSEjk34ftt6pFMyeSZqPOhrQuEtaC"
+    "bcAsMx/ObAo8VcePcJHml7OjYJ/E+fnpJbW1+o9jN5oM/8ItbFKfFhh4clNOJNXiwG4ymJ"
+    "V1j8Di9qB7qgUZ4StnMV2dfwcubFuRhP6hO+iv+bHCypOYUq6JIAjy6o+g/VQNOb4IGPOn"
+    "3yn5fifIN77KH+K8SlFOZWh09KutnvbWsRyNrpz1LdUxKGXgT1i254H/3UW+UWD0qUYyq/"
+    "d+LAYm9ngXHxXHbxV5ShcbVTm+y/GeTyqc2g/PZO9xa7QQo6d0m/Z+ok73JHeRed5Z1hPe"
+    "OvnIE4P0onJbbrWJ2ccbGZ4Th5udgKuPq8vGsbbNIdf/zv5LZrEr3W7g+lj88qVRpyWm7X"
+    "LblgOmxma07MfRngi0mdtKykdRrG18XWUtXrNiEqOXXJqcs+Kjl1WbFlOfW01Zmp3IJkpx"
+    "nJXW8GKsFGlFxH1n3qbsRhVAU5LdisYFsRAbM9iAto+XjrbCOVXF9bLss1C/pzidNPo/a5"
+    "PZQb2JrLg5zuz01l9DsvUPnlOfxS1H3+VCyjPF8ZFbrdKM/jk5MyLNHJST5NhPf2j++sxX"
+    "7dBBckQ2hlcjNp3nWk3f6KKjY81zuzFhSvEqMGoDrPpqb85qkGy46x5oHxPdT290BZMys9"
+    "by2e6BfsELrw/Lw1AEE9/qF9TZ2Zi5GwYcpcE4REiA+oa3G7YDnKlpaha/q6qKA1e4uanl"
+    "uMR/Y0+dUBOee6vqGqPYAkTIuv8Az6tYAzDJT2H1t3mm0q/gDm3oWizVXT9NmB1cEZMmVn"
+    "XFeLQYnOQ1gTkLYeeJzO2lNw4Mbq4BQd/9HOOTqT6LCeuTqVdbGlzYjvS68RlmhjfEsRWd"
+    "DFZO2lfhyRK6awxYgsqb3QHWf9sSWOym2otM3IgElKXQV/OktVW7cf3TJ114G2rXpzEgGa"
+    "1hM8lRz4Ef0k+r5q6fFesJ1AoWJb1kJZ2ta9vrYhNQB9A1B3y7W1uFkhMrbySO3o9Kr1ob"
+    "F/ielrOThImikTa92F4MBX9cVy27t1LGk4hGaVqzoP6xoOgbIR6Grv+g+GVMzkXOPcNeQa"
+    "W9ZOtuX89tc7L7jAo1VROUf4Iiov3eE1NpdNu8MxB9VKLpSEoPSgSNeYrNhXce7PLqpTHv"
+    "wjU0PsGs+NpoaQxyjRtQ/oTnp9FdVxALsa3BHZVXEL3cBrGhclycYr1XweWfjvCt1+PcZx"
+    "0+vwggbMvkUpsKWSX2Zji4MFlojQtmxWHXj+TGooiXD3u0dYd4LCXKVf0J3bljeb55QRPy"
+    "O3/8F1JVM1f5a2PWNIvGB/JjErZ4Mm31/aoU1bTnQL7NBY+64aoS0Q3XHeivKobj4prwzX"
+    "lufCSDNb8ievsmIlf1LX3C2pgDYeZ1sibGYtm2312Jkm22vRV6VttbT1m2+vJUywIlstY9"
+    "ht1F4LyYBccy0d5CKw0wRxMPkGmjAGp0q2S64gFuRSlOAyWxjzSYav6hAVDyLG44Bt+Nuc"
+    "pg8MtshcfWQJKnUbw2wITADskGLM9Wjd+/qdt6SvavPoMSxf5oSywByW9ZLq7MxRlT0JHp"
+    "I+42VsHkw8F3NUkYnlzt9UTnt5xzpS7A2iQ2LJAX07e9tlj8b7xA8TwvNK/LyTU91ZGuqz"
+    "wnX97EFrOLy3dWpO+VmbeDM3hWaQYCt2FdOC4r7y8HW4HL5BTIBjEcUuQft1eKquKICJC8"
+    "ahiilIJAHMD4LywXOUpTcxdI3lsPSPgI0jhtWvu05Qp0S1KeESAMKj7ujQgrmqaLEey4cZ"
+    "Kcok0IzWgLnlDdVxCXQXrLHSaTQDdvRXTJmZnl3YxfCjZRJNuXOc59ooGijYkJAeTndHVc"
+    "RGpSpAp+V2nbW0YDxdBWuZtTQ3KDbM9Ri27sbnLo1G6AzsL+3wj+R2vcM/PFQ9Nqw4mclz"
+    "7QqQSQAkodOVTN1rqNgGMnUN3bzR/mio+oC9K2FRbg/VAo50uwE+TQS4tgigvEFi+9RzQw"
+    "eILdLTG9iEmCIXd7QPsRO+AHI3DiWx78PjXGCR61rrVYdgp+La+6XMqbXQ/6A2B3GrTTgO"
+    "mB6QamRCDcucMWL1AOUYSTszrAkMIf43r7tncZP7ZvIb48u0eNkIpjRBrqS60jpcebzZVq"
+    "HNE3KMmkba3IkVYIMUq1ccMGbQwnwKtOuzn13Gr/LRZGzGuw/IWMx45Cz8kw4NxvQp9/AB"
+    "FQlxJnNKRnOa+ZY4FY33GQs9oXjw+sxWTUw+G3s7n/BVTYV/TkQeMznk+fmNkDZm76476Q"
+    "eiCo6EQAW/UUYFB1Cggt94UYWIuY4+l1HRPgoF1HVKoAx3/b0TNWg+t4TkdYbWTpRkNHai"
+    "rCSxaySxo5ZdkX9KCm6RgMoZ9M6EPTFsSo3insKhYAXMI8FmYJ4duhqLub+UrY55JNgMzL"
+    "NjfTMxlxzrPlBxkmPd04rNJilLLdFKLqfSYrs+GqU+W7393GqNsDLuLzCRMsg2glZNTINr"
+    "kn/Vszs1sgmXZf/SnXh/N6nW0pC3sIF1k0RWOvmWgL4S5OfKJ63EycFepqoG1HNQBwEg7/"
+    "WZZ3PK21fCuCh8jxEsBgg+g+AzBNTVGnqEZEXakcCwSTMVkoxYaTpsakTdtrf3ydNY2ra9"
+    "D6Yy28VBXBWcAJbbwVNS21vGHZ3suqvHskFjCkBDX+gCkzEXuaTQ9oA7/tgc4ByWDhyeqO"
+    "AhbbpNBXNLIYElVrBzIquOTl4jV8XMYtZTK8KbFNx1IGbTUEU3IYC1yMu7UohsRliim0B3"
+    "rk/pquBmZOWAIGq6S5sy00abi7jOEs03rUA2YQHKC326HsppBRJlAcomIAK9HXmP1ZEWKZ"
+    "Fop3d0BC9cDeGkoByQpTdxD51O0pu4pxXbwB0bu6hOmVtlExTfdoPXDf2RKvb6B8QkTxC9"
+    "BK2DLZ8TszbOSRJvJ0e6NQiMTbvkkoe+5DjlMifDFLvlBCfTlPDLoSCJC6Y8a/fZHCYCr9"
+    "wqWjDQ+5ze6yZ1iM9YshbHCvMQcdeCOxqF/kRUXz2dMr+eTTDZL0bE+WdMgro7JrPwHJcn"
+    "c1GJoZsPIBB4BN/OZkTVNMszXRakvqDUJQvd1BfewvcWxt6jvNOQnSPqD0YsB7Eg2ln6EF"
+    "eYILsFPsQ46KkBSp/lAhiX2tRSYzNA/nR8/OHD5+P3Hz79ePLx8+eTH9+HiGZvFUH75eIb"
+    "optYLGatsKAdV0I3JtSyddwu0K3qBU8ISVd4LOTbpTPLFp5t/dfhzXVevHdcKgXnnQmf+X"
+    "2qa24XJhHH/XVT4Hb+cu+ZLM0YmcDQ5Oqm8xYf+L+dtVc1IoQRjmJvedox3k1ai6gg7S33"
+    "Z9C8hXTuaJGR296Y0SCHOVuOKLDmuad6Ze9OVliyiSJ4p7+tBCwXk5BmeG+wKWBRXp32ju"
+    "SkL0GS3vvHjUrSe08rVpLeda19JOm9Y9Kb7VSo8RBrpN3afpD1JvleMT4CzjcXyHzel9Xl"
+    "yuTvhTnVH/Wp56do/sHxqdUEkQu9zPUEOzGqCCPVO4LbDw558vNZ+Bmy56pDJpSaEbuLxG"
+    "xszw7jefOp2McUVGyvkuReN8y9wko+qK/qNkBcUppWSTMgwGaF5WJKtIb1YrP2eTRoeRh8"
+    "duHCn8cpIo1QYYxJCm1vWfh+12NNihr3J4CKg0taVI4u+dCuMMIIxOUos+NRBlNyKdqcag"
+    "8rValAXFZpY6pUobZtCbbe52/vFMnKPZ7yCMf9JeYk47qnFZthXNucU2dnq+k4P1INPIHk"
+    "awKxgKZOc05r0tQt5067Ka5a0G72N8VQ7eg1OI0QznlfLLeTE60c3O6+FKfMkj1MLLdChD"
+    "JL5wMiyahicRxyTlmkoIcuNCiH3PQ8d36MSWTZiWjwWBZyHLwbRgmjvO43N6Sv4cP4OYF+"
+    "CvMDPMAx7pU5dDRrSadvCJ7u6B8KqToOtF6ksa3kcZN5dLakrTdLW/shf4KcLvlBl3GZ3R"
+    "7oFzbu4JXYwZ7BoZ8/qIbrLu0f4C9n8ceHH1Y63e+kzIFzJ/nnzZ1kjpvTDB36mHDlUYB5"
+    "XGjXh/oFowV7J3Jxvgqumwl75Sg5FAYyganzIryRYLMgjt6rETC3NFdZ52twDCW+EJvg2D"
+    "kBE6s50O5DDrOO6Fjkcghvm/Hai7jNTnSmM2/NeAAlNfE507VhrzNnjwqdD9bymgHLwCrj"
+    "R0ZwewNJZ6jOVVxm/MzfoZNF/5a9DGEvFx9Z/Gyb/suHi5Le5Wh0O4ipxPXJ8Cpz4d8f4p"
+    "dWWrtsZITi8SvC1Xbf9BYZszSdD9AX3qUjt3Pm2TbOq4CeyU+0J9GblV6Ufzj+/Clcj+OP"
+    "oqX48Kp3eSlKcYePVRbUccDMrDLkZyV3POr3plPdH/f5u4G5CD1h4Z/kZhPmfiGxF27efM"
+    "CdRbxVrOE9TClokv+wg/YS1M9iSax7fnyR42lg0jv3nhHrEOvXT4Oo9PJORr9XcX/hitUv"
+    "0NH0FsD7K3vj11fx0u25F94x6fbc04oNw9Ez3P5Lcf2vPmlL7vYcTsTXgEzMz9HezSUJnL"
+    "hhz050qAkbPEpiqzM8VAZhjis82ZOxArb/Cg3dEJLXiooda+kGV87JpiQcT+U8br2wu+Ca"
+    "SSUJr5prvZwOqKqC2EGzidfFsp5DibOkGvqUUd4JCAcd/o1GvHcsiUD+PhGf9kzsMJPbRD"
+    "a/TWTfCMdoKkHeMXrLptCOgc95hWVgSlSuA+UCX1bsFuIacZauNMNEAq8pIE9uvt9sVKO/"
+    "QqohmDEWCdY8FMsG4kWd7OXoRZm3IAfEGvIWbMMQYyZrgfUVmLQlTK7QkC5hZrHFo+C4Qo"
+    "FBlVs0trMeeW2KBpe1pGb88EMCK1gTzDD8hatWn8hFL9V/LB1WfN2xyY204GMx66plT2OF"
+    "fSWhoxfu3Oum7sy5Hg1btGEwVaxMKM8re8pfdM4uaJa3NCg30wmC9ICW+70Nv65UV5t3CT"
+    "uCAi6ejs1D8oW6Lsv3CvcN/Z5qzzBFc4ufJWrFMrc2fcRYTvS9AQD2cq5i4CWTwSg5Bwv1"
+    "VUcHRdBJ7Gd8ItqmHFiGExbBjz8Mzc0FdVU0bgBaWBhwN54M29y6GYkVWCWCIii/23DNr3"
+    "A1aoCpMM13Gpixh1NoRIdHxx8+NijioRkxsquzgdko2VSAbEMCY9kZutUzwMaEdo40tm0W"
+    "AmSBWRbC3NiWnRfLUzCQ5AXwbDvaJAjhYVOv778+wGm+S+CfKQDbJbqJRzKjWep0w7m5G8"
+    "3MDWn3e+l/7rDFERvsn1TBAqsk9PtCcbwS7qpzGQsn4e/5yip651xWM7yIddNbC7SCquEY"
+    "F6kFyVWXvT3HsTSdDX+Re46w1yMHOlhc5nPZmWj/+K5mNNc1KbBhf0Su7y4vq7E2qdadhf"
+    "7GpCML/ikJ/FWgpXXtuiz88S5dpgLWpMLMqbXQ/6D2LUwGNGeXb6pMt5gSC0rj2bhQvCQt"
+    "doWqmJMfWRds3pEm4mvKMmSlpJCD4q/ON/PiZuvDYLH2r97VZXLPcLAtONQDgi6oRkWjOX"
+    "1mOnyKExRATVrMHnKWGItADliCS8tOxDQQ6wnWg294yIMLrz/xXOqcjk0C/9Onp+TW1hcq"
+    "WK0P9JlfDDWekuvgT97j+WeRCTUseClollwAH3tKcCs8eZpb4WIUaTlf4oCFUATEGytg2W"
+    "+4dPS5pySqcIK9jxxwE7pLnAX+/48PXWJZLvymrvb2TfS6/OmH94IdaNE78B5JnnT4FjP6"
+    "yv8bvYCvMdY+TolotxUSeU9z1Y2rn1rU4eJBpZ2GNexiz4VlOp5lQQ5QCBok5jH1ZRONwH"
+    "8J3VGW3sTQtVMSxQOET4PKeNQdHVo+C28xeEpU/wUiu+U0IlF9wZi14FdeuNwVF2YRzNDb"
+    "wgyawmiXEM3gUKoQU/zFunU6+KVQCMp+TykJEhWwWyE6opLR4yQrWiMrmgS5NIOUkNo5hf"
+    "TyAMOGlmZQF23dCZwcjP3BJHi5qrAevS+DK5TKBZbd2+eNwMEU1PT9wMHMmIU8/9SsuMyu"
+    "zswSw89m92gGZ5M8rgUxpTif69euhY2cnhXNnZlqeClIMpLbeabbzi+C9c/agMsDdmT0XP"
+    "c1Usuvr2IzVHLaHClpIaTFdkwrv2SykwOUY8axn1rMJyu2SJLuS5LNTgHn0QjKOWybNRDP"
+    "nMe6jmvcm0ZdliFN9/X9zTO5ftMui+kaCSjlVlThFsslruKnikPpdE00bpmmIeXM39a6Ox"
+    "9qWIvDj2A8ZPhwHrdZjwdko7suh9qcTj3Ab6Q6Dx2BeyNZoFvk23CCoooLZUs6NkL9BIUI"
+    "U5t1ZAhLobdgQFl3N9F3we+5yHn7uUahSjUPqwMuhW+HLglqP8LroBsiDGvF1SzzYeC7Bw"
+    "p4/lLB7kxykMxz6mt5Q6LRPVHif64tk6KD4wueZ32om+xlucMFWhqGw8B7gYk+peysL8NS"
+    "p/57u6rtessuweSqvukOJZEBnahO7iFgGSJbEHUe7ShkBLVJf3cV2zP9pX/srqSpV1pA5t"
+    "PULSVNy+Mn0yRuYkrdGgmKgxMHRdS9X07ylpDftQHU/ydY3Jd95fLm2yl5D3NG74yZ8crN"
+    "bf9aGdzcXJ2So7F5dtnvXd/dKqObu8F176p/PVLuhr1vfWi/Y7M3/Nf1WfwWKri5Gymg4v"
+    "ziGhR/KCh0ca3cDm6+DfrD4Sn5KCg4PLsZ9JWz3uXZ3WVvdHFzfUpOgmKXF7/0FXxn9r6n"
+    "5NPYHN72++ffelfwYOXi6vZmMDoln6MvuL2E0j/fXJ73B/AJ/QE89MfYZ9/eXF5G3w43fw"
+    "KNoBBu3Fwqg/7Xi8tLdGmAwrvhCNH56adKlmItWfH86XqdVpjRseuWCJ/ZH/zSu+TtbYDV"
+    "DG3r5rrPWgpgtXWYg7UQ5j22TNFSPH86F4jullfa2c5bzYaPpr/jUtQRzkcFu0Syoi2Zk7"
+    "axOSGyKHTRgqmYyc5KNykHXy1zf4PI6+CzC90SbF3AI4mq+FdTYrtysXb+cu+ZPFfsBM04"
+    "3XTe4mP/t7OR2t2UY7X92WfqQLdGLypL+RkZzlXGqJSoHKB2PEClOJAqVZkSlVXZhGS+WB"
+    "/VtzgKRFu5KKs/2i9EZrVDWBOSLYF029yLjMnZi9ANGZOzpxWbcWUG3W7yXC1GJCP3StmT"
+    "3ectayeGBTE1u8291ZyQg+6qqbfE/bsGKEsGyTQXwsyo1aTcZbFYEEEsQzJSpCCQAUooS5"
+    "/UKJGyDEOODqPYj8TeSBYZortsQ7KFIQWaocIcPRWkM1tJDTvBFYNoWCgBj6ohk2dyEIl3"
+    "w91+ylx15m/ekhELWuHXCF4jujM2NWux9MLgFQxsob/Dh0clPYfHQtiWYYSBL6DdInTK30"
+    "0dm37cG06YeO6PphrGM8YtLB1iGVP/Yxz+jAlFITweC/OCeC7fAMo/d6E+43eiNvsRX8qy"
+    "iRqFa/h7jBEyfJ2ggEm8JXwHqB2brAiLyDDovUs8M9Sl8x2E0N7gHbz7e3grrn5pLT1DDf"
+    "bGviU30JcBGI41LL9wT2Mi6gd+m/QR5KOPIOoMuk/puIzk3rNETeGF6Nk8SCO+/zl+T4Zo"
+    "rLQKkTsJm7OTMNP2y4KeEdw17sOfe4fHJ59wCzaOFJpqWiaOhNFQWn7nVRL1Tx9LoP7pYy"
+    "7qeCsV224bVbD2i7czEOmk1DbNk4JtmifZbZrY6Coe5RwTaSeQG/H2Lqm9UA3dfKgCZUKo"
+    "JYziFhqls7R0PC+1Yu9OiUk893NX8DC9og8eHS5sy81N23ZeB6mHq9RCXKaGWmiU/2EjIP"
+    "sAIEMiOv0q13bIyO062u5n64ng5ivflHWpjXkI/Odj3h3LesAMoWShG1D9URTbDgLIIksu"
+    "A/gLPp+EZJOczp0wU0+4PyZmJPPNcLhB5lHV2bOrbZNput+glItauvr2wiOUrdgm5Kpcve"
+    "OyLIJ8F2vYdVNEW7SXNUWk7WiHNifsqiGekNkx5LXvJtywgynaZLumP0SUPrG9qJd1oiSa"
+    "3sseqJzkoJXBXjU9aKOHkrKY52YO3bHP6hvbLuqbZB2B2ypZoFvkueJbT5W45fmy/4rrJ6"
+    "DV0DW+uzXkKaNcUQ/0+fBRNTxKlqpuC5KNrqamfMpP+OOU3PH8mL5ivPZOn+IZNwC2PTaZ"
+    "5lPiY0X4gw6ip/O3FaXQ/NmDCjrEFQlimU6k6UYOs4LMl9w5xJ7s7x9GfeiNMy3zUJ0udL"
+    "Mo+2UgWy79Zbx0mfyXKceT9BettOLI9xdBU6zCtPnFd3oaT5PIX9ZVswDmx5OGAm1h0Lcd"
+    "Ryo3SG8Q3P3IT9iwfTSSDtlTOkRGPu9FxYbZiDK20fatpnhIaoHtJCpWaEElIkSr2VE3oo"
+    "xAkQ3EEhNZj9S2wWLBqDR0SZjTIF1QeIxCxrCqSW95SyuOwSnxWQa8ja7C+NvEDLOh0CIL"
+    "DzRY0uSJD282Y6vtzLr6ngm5xgV++jgBaXTtkdGVnTik1dW8yVdaXXsErjQQ9mIdKQ2EPa"
+    "3YzNbI3W/t28G0vc9b+7YPZ+1b+3Zjr0Y5m5lLNIjA7Ahs1ryi3SK7NUourXBHZzXbNYwI"
+    "dbzJQmepyPwtUelzHQXJecvLst1qaOE5ZGmoz9Q+ZDIu3++mxXalMX9wSpw6b8ktE2MJes"
+    "cmF46EDP0hPBfOgZpnuZq6RPPAquTbYCz2xU6XnUDI3HYzeADufYudbkcmFB7PgmF1299p"
+    "NqEzTPeEW+ec2Gvipjvm8UTfNhiPYxOtR/Yp7OBrPTQ22bd/UTHgFp4wVOeqY6vzL5b7g0"
+    "OiGv+GhwKy6u0SMG+Xru8kx/JQ9vgHZ2wuoFvph2Djq3hin63NdRe+1LNzcwF/jwII8GsV"
+    "01tM8Pw6aZ1u1jqNg50BcLhQDSM/mDYpur1Q2qO14awl++c+hds3NtI7HHsrOrEScjIXnB"
+    "jTFWyZtKy0ZqSZKit2G6dqWS4VzDX5dF0oIIm6vPCIR9UQrRtfio4IxeS8kmbq9Sk3biun"
+    "3hPJyoYrbLi+LVex3cakZEyPENAVpsykZJN2ttXSehs0Q5baq7aLLU27WOTUvDEpWtNXTQ"
+    "8okHxNIBZQ4NveDrM7KqCGTS15jbEG/LZ+4GPt8An6WDOdBneOyvpUgbOAF+mWdBJ4YekX"
+    "fQMjuP3Azi7/wYlz8qqmUYcz9TbV8Ers5lzHSK7nrLdgLW3lY9jwAackPCCUa/dPCI0U87"
+    "LR79MYFc8D6zAALBDmpVki6+ASCOC5ga66WOI+oQVMusHr8yLZiDoF3zfudiMX5+H2t9g3"
+    "H0ypabHkNn/4ToAlte/xCnTKNwK9KJfSjJdKKYq1DK4mhkMJJbmOh+Bo2Uh/xu3wPX66ag"
+    "JcmdWudpdEEt+KK/KM8HZ4rLoh3lsaqxXRFk1ca+aCWPWcTqFwW0IltxBvmppmqkArEJXA"
+    "ioCt1PEzcq+128fWICWhi0nIyLQAkEZZlTuKRIs1jJdN8tjCeH3oRgllzeu0ZRHMjEpNMs"
+    "pZ+xRY4kG7zTe/sWGUjMdjhitTAeakf8Q97kc61x3NsqeHsAyc4yWNZaphirOm9ipKylvY"
+    "U66FmbO+RqYDzVl/21eXBO2NW4yGqtE5zwLPnvYmqQmvceszrs9kAXrxcvhfeBvdxDR+Ue"
+    "HEZTRY4ZP5p02ew0LwWfAJS5e9EGa8h7XaRDd09zn1Muoj2FAx7fw3y5afLEgXqm5E5dhP"
+    "Amt2O7T+Q5XMdAIL+YGaYKj3AP7jgPdgF9lLBYp6txc8Nw5LjpfUZNN7UD9PqfKvVtTFSu"
+    "MRtDoIs11wvfgrsRucTXBDqiOtCwMe8S5rDAP4gazI29ksv0GkBXm9p0U59ZAnUw7PuE4R"
+    "DqG6sqCWVlgHsu6TzhneUzJif74IqS/h0ziRDMfSsJ6oralOrhw0CwzNTcr7F30qCK7Nia"
+    "YudRfpIJUH2Yq1lasi/ykiMH09ZevmZU11VEoSozvOZWpzCwbYFFQwvBsOwYkH986mBzrM"
+    "f2laLIDZ17y0LdPyTCfUGlwgBzx0WTX8ks7celKi4mEWIit8g1CU1Reyiz7rGo2omD2bR2"
+    "z7XGl0gRj0kRphtiN++Gs82xFXh5UJD2EnY/AyUYKkaLiHhgTTPH4uy5KEZTOzQRAozfOu"
+    "DZeUTr+peJIH0RdLy/a5Wgevz9h11ini5XhI+TvQ8xRwqpkpJ1OX8c3CPf9b2LVEE8huFb"
+    "7EXcH8QrzY2DyL1jz+9HkYmytZZijLNNjhJtd3l5cIShIshAfhCoRHCBk1HQ/D5qE9YVYp"
+    "w/+aufpIActgnL8475KnuQ7zbUyfw85SgXaWw9LKMPDNcq5R5QvCSvRZLoRJuVoSVG4Jyp"
+    "+Ojz98+Hz8/sOnH08+fv588uP7ENPsrSJwv1x8Q3wTPEjWdk8Pq1VoJZGs5JUy0CbW1qvg"
+    "m1HQkgC0JMZlTl/JP3wlc/ZK0tZYBdZIspV4brTNMktsFVBDQYlppqXG1vNVQlDz5FuC8N"
+    "azSIjs/FXwziiQgBcCnrYOq7rIi/TIENYdh7DGWKoq00JKrJYetAcZWxPU3Up4rrXe3stp"
+    "VkhtVhn3cxW0BONtj/ti8nclxOVUWxHydefaQkVyst3xZBs6LioF+cSF5ESbQLJywFRSrC"
+    "Wj0fbwjDtxVsA1LS7xTeG76hImR7wl+G57NhX5R1dAWy5eKsG97tKlQI1cuOx44bLqvCAn"
+    "hNyDvf1AhCpoxmVaieRRqWOojwqOoT4SHEMdD/oQeJMLszalZWWqguz58zz2JYvshen2TW"
+    "+RicNNttmEgu1F0r/PINu5G/YHcGNsXt2c9we90c0AD0Yfm73zq4tr1jjH5vDuFm7xC8fv"
+    "33fKNfL6kryFUUUVG3JCTqaJSaXb0BX8bsXQF7qrQItUFrrpuQKMc+NOCnXs9pzULcf0JM"
+    "97iiKqqjfYlLAcelPzWiKqr0JbzQq+0gYqU+PvxZ7erDkicw7uRcVWPTsrOaUzokC04Pdl"
+    "v/5tQI0wh7t4c1hvqY8Cdqd5FZ23NSy5unGeTU35zVMNdrqUonpTWKAYlihRcCVoUO/fA7"
+    "U91HppzRo5b1TACf1jik0fdfpUKz64/6Xt2ERtCFHaBTyN7WN19anW9yIblvSKCvb8zMSt"
+    "qI6yUKciW7UCKPHkPFcUs7sP4CHthShYOyJUa7aXODTtBoW1m6Vl6JpOHcWHaD1wEJBb1P"
+    "jcXljYtvh6YcEta22HZarbVHNDYLYISFNnIEM3H2BMmXk6roXXwsPfF/cNVbUYEXW5tK1H"
+    "wAS3Nq6HyJmvoZ2dBb9fWbCJ05nryzVbR0ksmtoqeO5Pvul1TSRYJtTbSFNLEYnlDakFli"
+    "ifSvuxMS08klnjqcnWX95fx9SVW+W3AhjHm4RPqhGhYUxti6G6hzWbZ1Pl3lBnjkJNfN01"
+    "l3DxZf9Xrv4raN/mFNWJHKEsV6z/XSzFgf/F5XyjlUwm3XzUhaeOrIreBVPY4taVSJ5oU3"
+    "g3x63TqOQatwpQJ0xA7H+P36zSh3jWZXkysg8aF+jfKYIb65vBFzIU7eh9NtAEawSOUz0t"
+    "7pr8TE0W2uYs1ydMb5m660DbVhsU65HWEzyNHPhprB1Mq0Oij3tTY4sKtSpRdFC96N0moo"
+    "62PLTNbNX0BzWHktQn1jWqwUfayiO1w+VUDSwJsvT2LzGdLe6dwZKC99I1wRmo5pQflsvb"
+    "2Y7myyAZFI7zy/BFagbMVZ2HNeEaanM69WC5OAJd7SVWYpZzcI6qEh3nXJsZnTnQuqU9Tn"
+    "SQRh34hGd4tAgXjGHYVK7VHgzQGkZTZ7Kt+ne6RflW1ajMSwlX82GQCdO2njANpnpxFHb+"
+    "doGYiMzeFfcbVAHRL95OADey3wKe6ApTc+cfQx4TkaeQp8PmglPIKwTC1T+9/Pn/AUT5+N"
+    "U="
+)
@@ -0,0 +1,359 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `audit_logs` ADD INDEX `idx_audit_logs_organiz_d33e41` (`organization_id`, `created_at`, `id`);
+        ALTER TABLE `audit_logs` ADD INDEX `idx_audit_logs_user_id_4ce942` (`user_id`, `created_at`, `id`);
+        ALTER TABLE `audit_logs` ADD INDEX `idx_audit_logs_action_41fbb6` (`action`, `created_at`, `id`);
+        ALTER TABLE `audit_logs` ADD INDEX `idx_audit_logs_created_4a430b` (`created_at`, `id`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `audit_logs` DROP INDEX `idx_audit_logs_created_4a430b`;
+        ALTER TABLE `audit_logs` DROP INDEX `idx_audit_logs_action_41fbb6`;
+        ALTER TABLE `audit_logs` DROP INDEX `idx_audit_logs_user_id_4ce942`;
+        ALTER TABLE `audit_logs` DROP INDEX `idx_audit_logs_organiz_d33e41`;"""
+
+
+MODELS_STATE = (
+    "eJztfWtz20bS7l+Z4pfI51C2JVt2orPvW0VLtKNd3ZakshczhQLBEYkVCDC4SFG28t9P9w"
+    "zuGEAACZIANVu1jghMN4Bnrv10T89/OwtrSg3nbW+pj6wHanZOyX87prqg8EfmXpd01OUy"
+    "uoMXXHVisMLqUldcLMYuqxPHtVXNhTv3quFQuDSljmbrS1e38Cmd3u0FYeWJ6jiWpqsunZ"
+    "In3Z0TlXgOtd+imqmlgR7dnJWSGJtjc+haNnXgylx15sS6J+6c+lKPquHR/8cuLA1VN136"
+    "u+vf0h1imcYzcebWk0m8pWUSzaYqvit7D8/Uf/MofN+MgrgNb/P9V7ism1P6O3WCn8sH5V"
+    "6nxjQBoj5FBey64j4v2bUL0/3KCuInThTNMryFGRVePrtzywxLw5vi1Rk1qY3fDNdc20NI"
+    "Tc8wfPwDlPmbRkX4K8ZkpvRe9QysGJTO1EtwMQa8f0mzTKxTeBuHfeAMn3J4fPTx88cfP3"
+    "z6+CMUYW8SXvn8J/+86Nu5IEPgetT5k91XXZWXYDBGuLH/ZpA7m6u2GLqgfAo8eOU0eAFU"
+    "MfR8bELwgiIRelErrgm+hfq7YlBz5s7h59H79wVg/dIbnP3cGxxAqTf4MRb0LN7prv1bx/"
+    "weIhohyJq2gv2gCo5JqZXQ3H5bTID56WMJLD99zIUSbyWR1B0FxjL9UdAgv1iWQVUzpzvH"
+    "5VJQTkBwFSzLNM0Q3pXQLEDvy83NJb70wnF+M9iFi1EKxrurL31oqgxdKKS7NN7fI0zZ+E"
+    "qniupmQT2HO66+oGJUk5IpWKe+6Nvgj01hvGaLhW+Y3sCU49dWAeaji6v+cNS7uk0Af94b"
+    "9fHOMbv6nLp68CnVukMl5B8Xo58J/iT/vrnuMwQtx53Z7IlRudG/O/hOqudaimk9Keo01m"
+    "+DqwEwiYo1VMdVYD5epWrTsjVU7vaH9pbUZfDZhZVJf1/qoG6FqkxKyorccUXiAlmptBaN"
+    "Sby8IG3IqFrDmhQX8vcPwiUpIpIF8CsYHPrM/Bt9ZjhewBuppiaa8n176s5X0zz8/gzaQH"
+    "A16na2+hQaN/GmAZ8HH0X5LH/WG571zvsdBuJE1R6eVHuqJNDEO9axlboSls3eWhwv0ldU"
+    "U52x78evwHcODFXn2dT+7qmGDgJ2R2TKJkt0Cw1aLKv8FhQua9aiFAkfQZhigS0rLIYGLL"
+    "8TPZaohmE9ocX6jL9ci2jWYomIE3gTNHVRYG5bpuU5xnOXW8RU1eZjkwthOXgsWVJ7AVrN"
+    "B4fc29YC7GFbBxmyhJUoqHHRMtZtghbwEjS/JUON29I2HZuaamiewUzuiQoTNNjL5F43dT"
+    "CycfwmNoWbsNLFF1RB3uaXD9RHaOMzyixxa0lO3kh7+hXY07sY+xM24PHJSQkjEErlWoHs"
+    "XtJkib9ZBskR/T2nEabEWkJQFC1++v8cJdY9AWoHV71/vkmsfS5vrr8FxWMon13efJE29s"
+    "Zt7Lk+pQoM4fDGTkVY06JbRFY8szYM2qnuwOw4VbS5aprUEC6tv+iz3JlJLL/SQjs9Nmxp"
+    "pvrp+PjDh8/H7z98+vHk4+fPJz++D6es7K2iuevLxTfEN1EPWcBtz3QUWMIoS7/pJbEewt"
+    "LGyEU7I7w9i+ZobaA/HH/+FEKLP4rAHF71Li+z6OHkiLSZSxdL0VhQDF9Wenv4HTYDQJv+"
+    "5uk2DImwMsaVrXJv2Qo3EbBxVRxdS2iTA654wAUz0YS3ESD+1+HNdfFgG5dN4Xtnwld/n+"
+    "qa2yWG7ri/tm1Rhl9fvChLr7+6SZYJFaQXZWngYLqi2sNK1O4LqiRBuGOCUPpj9tQf4y2n"
+    "K1ZsUlJW7E4r1n/5qF4te6aa+h8sSKUasy+QlAx/BtMamP6blLrm4VmW8Rc0marMf4Sy6k"
+    "11VzEs0SLuiy/79W8DxigLOTMhm99DrZfWrF1AJ13n+iO3CWoF5hK0DlStoQN0KWCYi6JO"
+    "TG43aE5tAY/a20gL28f2PInhyPKiRzE+BpX2LCrJ8bCEjxHLEyhP7i2b+/8ihyFBNhzAEv"
+    "gcS4mhD3IEz39gnkfiwIQHBTTVdIMiRDfT0g5XqWmWZ8Jn6mDGP49N1ZySKZ14sxm8gfT7"
+    "7cbvxyutiucvkmin728jwbRT6qq6aA4q8vuFItLnJ/T5Sc5hL0zTLOfgWp6Nf5tuNcs0I/"
+    "ea7NLdhuvtYAvEZm35qC3VYMlnA8ea1wbL2vKZTia25NPNsQYUS0Y+7mzi24/Ax9Def9Fc"
+    "iTMD5c2VJEvxsrmCT2GxioQ+QqMTWR8Ca6WUFBorA7qEiQuK4K4/R5vTqWfQKRd9AiODMj"
+    "uGGvpMhw/C0ERX1/SligKsEG4IdACmselQEHT0BTQp1aQsnhLjHBGiEa4nZrO3ZMBjYjAq"
+    "kuAcuAA7W4MnPBObooOLTuGt7kxDfwCtoGYKteu/OI/XPIBmrD/qU/iKLjwbFwGHLKTyDX"
+    "oeH8OwTpuejs1DMgy/SHWJs6QaWmMsuNLB2zdLarKYy/g3RlZd/Gux+M8wz/PgzdhH+Zso"
+    "g48hPOyHYLU+YG1Iw20Xhhtd6g50xmqrgKRQm8KJals6hUPACmZFWlZ6pXfslYYBSZsrru"
+    "4alYKXU2ItMb9TIcylaIzjAhrjOEtjhAFHjuHNqiCaEawF0+1uDN4sojNLFcQllkA0EGxn"
+    "K91EoL1tWQvFgpWNEgyyVQbxrLQcxnc8jMNC2PUE5Gl+74gktkdCR9N/p67u8bFM7/iY3z"
+    "k+ZvqG5Ez3lDOVcVp7UbHZ2IVg22U1Sy4t9opI3XTkR0XgIonX6j3ApaXClkFL27rXjYok"
+    "Qp74K22C0pm1AoDSMbMVx4x4M9yaKLYvOC6NZGwOKIFhMNPWD2Rcc+PGydJgplYiLyOamU"
+    "BqQBb9FQNQeRtpbC2ieRPs6iHVMT9P/QHEJYNDm4P3FmNDoy7+orc1MRqUd7dGaVvKuVvD"
+    "x7xj7kzmN80EbLKkL1mnawVZdL32VW0epZUhGpSdcP/llEyeCfpR9aVBg+Q1b8loTqPcML"
+    "pDoqwyY1N1mCc2njCGpW5dkpN4phlHBpLuxh/p2ZXobb94O0NIT0p5Ck4KPAUnWU+Babmi"
+    "cTk/gDQUaIlnYNvhozCS5DgIvhqWmkcPxIRSuN6jVNuQPb+5+3LZJ7eD/tnF8MLfAx7SX+"
+    "wmXoq21g/6vUsBkKvTj1lp6W+Rm7kllyydBLJiSzsJJM29Nq8oubDVuLAy/MLOdyY3iFyQ"
+    "G3F3RrZgZ3yZZ/G7bAWKJdheXoJdgaLITcST6QpZEgG5UlqU5QGOES5IrMzVRxpjVPCNuw"
+    "R32AaZgRee40a5gVWiUduFahqbpreYgBJ4MuYW47l/KWNuAg5IwKZ8T7lpGOK/So5lsxyL"
+    "TNK7duygTNIrN+xK80Pala+yYjPrUxm7ssIMLWNXNha70gpbs0EwiwNV6k2FVSFIpUnIbM"
+    "/sLLeZuvpG6gp7qC/CPcN8zzKmYCphcpYTi6d8Ig6Ihi77H/BcGJb1G3cfq5Hp2gVVmuFN"
+    "8VwZmNfhP92xyfdscKsUk/3iTd0EG3chT1LdoVEZZF7me81XPqkgId6uUOAtH1XgI7XyBj"
+    "aRvHSp7til6lcKYm157jr1mlYhq3b3uxPt1Wo0KSkrctenlZrTlaoxLicrcfe9sQ17hWFy"
+    "nvrJcWoKOSwVcVgQcJjZRR+c2ENFK77i42kSkvIomsxRVPDlSuV4zrScdDIInQw+TI/WVK"
+    "kYc5yVbAnEW4g+RiOuWqRsKCHDZGMQrhEoK5KXy40dLzds+qjTJ6X6qiMj2OLFx3G5xEgF"
+    "eZGyiw9EZ6VukhKVPaQRPWSlBU9GsiXz8daXPHwswWMhKSboVCbPijjn7gvr9nw1chFfBD"
+    "keb+pUixjKVSDbuIwd2t8QExk7tKcVm38aWbXQobRYu1yF9SWu2mHar5bGXQntB1jCVEte"
+    "lRF8pQ1Qhv6tCeD2z2BpKWgyXnI7ub4akaeqwZhWT1S13XNtGgzdiwfbCBeGtTfEVm4ITW"
+    "OZXgCXyJcWrVm21xqbC2B2Cdeow5aKToMtd/7rWue9BsfyEOyzZU97FQuxfaYuiEw8lzqn"
+    "Y5PA//TpKbm19YVqP5MH+swvotgp8ZsiXsYzh7Chkae5hWHBGOVLpzyDF9PO5eLnhp+SG/"
+    "ZJqoGvFFcUPyedHLjUxNNmoZm49Hf3DVfElZ6SHvsvwSb/zmSHNuFd/6jNU/LX4c01YRXp"
+    "H2rEi/v3eeHE1HtKRuHP2Nvj0zVqmw450KyljrnQcNusr8d/J37KCOq4wr+qiutLtMXBXI"
+    "f3vrgl/t9B4jNEnJeL6C94WcyA5qqLZVAsOqz15cjq76Jj3JPkGlwDoe/x+UBcIHqu+H72"
+    "qozrXskekSf7bnzDcM7JvjiW5ITE557se2fCB36f6pqLh7k57q9NnohFIOJHF1P/aZa/m+"
+    "QdUUGa+t8tFfEyvo3s+OlDsCohFxd5naBFs2uVETIp1RJPnjxyRjp4VvLcCZaDJccXgeTr"
+    "HGbkQd1rc8TycOkVOLh4B6wBvJuUuqZ127IYCsalJnFHcZivKKblGlgM0AyTlFOyW8QrJT"
+    "5+wYQUG6RK0kxXqvl86FqH8PZ4mDXPIuDM9SWZUPeJUjPB5hD+AIft9mZPyXJQa2vkidD4"
+    "dUEWNFbI39Qe15Sf1Iyrwtsom0loFhZgHEZURPIWdfIWjgNj00rryZSoXFA2bEEZ1k/VqI"
+    "2s4CtaGyVsfT5sVzP24zKvKfAgeWZw5WPurPVOtmspaAUr8Wh2rHE5eRUqbR6eZZeViR5W"
+    "wp/rL9VqRDFY/bUXw1h3exnB2HwgTUPR9JiAcNgfkeu7y8smmDVlDJqKpkwFG2bALAJ0/W"
+    "atAnIwsdw5mXi64R6y21OieY5rLd5kTZdVFaHF8iW4we2TA91RWFnd/J8RVO6b07F5SHqw"
+    "jjr0+VHyNE/bQng4Fr+JhTFAS4c2AO2EQNvToSkQ3Hioa6phPKMFpAGG5MC0XPyBS++J6t"
+    "A3KHummnh5AnaTNcUom2kXbDGsHfjDsglvRlN4zXt4qmJY2gOd8hdF8SEUJKpmWw4YZoaR"
+    "eEsHv/aMfbngW79iFfGPPfO/c/Kc/Ep1utBRi/gLH3WV3FqGrj0P4Vspc9HbFJNRMZGvHn"
+    "47Bx4UTnibEpp9abZEmM06Wyz6GG4QCu5zuKSVKFNhr+W0OSq15f+oYMv/UXbLv0yFvcHt"
+    "bLGxIYNt4SbNpKDclpmB1R9SK6MayUlQpQP3VfBtcuvlXlRsZutl0O2q0qgZuVfKou4+sG"
+    "H/yMHdepwbTGyV9jmLe7jktwTjVmV6K+NB4ZQZcgZrZsvP98S3p8km9xEipaKve7oCgsDJ"
+    "mZZBsUkiNMVWdQQ8aLpIt4gGZVX1zHKM0bApVzotgGsgoQa+LaZ/f0819x3fTOO8G1DH8m"
+    "yNOu/OLBDN2VFUi1ZkDHHJhvtbpmxrklbMH77N8Kkg6ZOf7DyCNGvok6HsSWz8dBgFSdnL"
+    "nZJxp3d5efOPcQe5z3HnvH/9r3EHC/ibovw9RKptq8+4ycbf0MNhgBekb2dvu+T7OBacfs"
+    "qHrzEglrjM19jjzq+MSLUDONJPCG6QJWZdZZuGRA/5P1x/YkfVf+EXjJh/Bs/QQqD9h1iT"
+    "/8BX8+oJb0IFGtYM4Duw/A1Zb3KY0xRDKknOldal+SQnb5RVaM5Ioq1EZymes4DmTLOcfr"
+    "/Ngpi/fycmUsP+nd1NblvbwBOOXVVQTghJnMvgHI3fVYBOSskdaSWAlq4RmelPspKSbn6V"
+    "FRuawZkAoZe4FRbDVcMJhK0lDzJbv2oAA9m7VoKxSSYl1kIEJEqy/eTzJ6y9xvmul7mTS6"
+    "zQTNhRKkkJPj9LkJQXrYEFmVrmDy7fD+OzMX5oVP7mlyAsNc0qCSKh+NYXjHkSF5YsQI0s"
+    "gFwv7cW0ml0vSTfumjl0U2NPxVS6YunX5M6VG2RWAK3ABy43dqy7sSOznFgfTYFHrb1g5g"
+    "xaMqBg2wEFmzRuYhafwLhJ2oP5xg2zP6sZN+e6je5A32CIhUiglYL6wPaYPC/xhjnjhoZg"
+    "b8xKWthWfsOwnhxm72CxQ2dJNf0+5cdFX6XluXz7CypQmQpQMNSsJeaYtPCY+kC03L7/IM"
+    "dIOoiphCkkFJVGkDSCpBEkjSAZy9oOEKUl2eqcZy0FrcCSlCcP0NZlPWswiivFoEtbXNri"
+    "r94W/8L9bCPVebh5pLatT2lHYJSLinWLrHPff6e4IKFYvkhJM91/GEFZEsgS9pCsNV5UGI"
+    "3uoQstzgnvcPM7zF2BUmC3z1WXqDYVBFGfebYNbd94JhY6LB1vubRsMPWpCV8Kr/Buqjv8"
+    "L66rC7pdlqtvQgn93aXQ/qZjEx9qoT0evAjiRBzquiysGt9kTsm953o2zTPjZTTyZk1w1l"
+    "RF4OWHI8dE6olH3jiGmz9QQHcUDDB+FHgKXtrCHsltcQv7xoIL5Q52yQ51ZUjha6jYqiGF"
+    "m1zRnesOBkJ9gyVOcl0gul+4hpvyksoMi5Z2sTAZwtQTDA/0XRaCFMUpr0o5QVzTDegSao"
+    "q5XFQSCIKdAEsrvpabqw6svyg7iMqkmitU1R2bKnpk2NoNVl8Ti0WrWUvWS/iaDHT5etke"
+    "srh45L7xj+rKd7+k7XYGqBKcCiXXdJtb04VIZ9ci+iwXwLjUpgi7zQD50/Hxhw+fj99/+P"
+    "TjycfPn09+fB8imr1VBO2Xi2+IbmL4zK5LOFBVc5Ulpdq5kW8jS2e/3WnVjjVLSrVkU84W"
+    "0IRRm+V7VFiaxYrWSFZYZtVqt50XDrgNxhSWINAp7t0V7IGUaA0GQbN26jVo/R98dim/vz"
+    "TZW23ZSZN9Tys2s5+Nm5yV43TSYq/JwS/jdGTOufb4+8OeKgNPBOPWls+JiyUBesTYgijT"
+    "k2A7MR6kNrLw35LVEx1q30QnXEEVsfdXUoxt8mvYQXJ0GhYKWFqOY8TV3ls2q4kHinN19j"
+    "DpsKr8Ar6eOPflzm3Lm81T4llaWNh24LqSZhv/LMNcD7U5nXoGnfYfc5LIiQt2y3DZTiDD"
+    "8SrJao/g9oMTUc2BEsKVxOjqCCfCDqEWnQu4ljbkv3MlMYYBqWxTRQObXyXOs+PSBfLZSa"
+    "rcGZs88GG5pKodxCCMOwxNZ9yBYixR1FsymusOD6mA14D2Cv93WOEFyMJHjc3wQEPPJlf4"
+    "psF2bHY6iP/cH5z0G5OL89wN25mdCPFDvdMTANurHdaxq7qeIzcp1M6mpzpPZV5dLF/PYm"
+    "9L2G6ZYOc4OYY3q8IIJ6VayQh/LJMo72N+oryP2eNAkqNDBTizktvzWUR9plMXtMdloD3O"
+    "h/Y4A63kuvaCEpFc155WbIbrii+lSi6D4iKviZ6RHNeGD13FdlUDI3MV6GkegmUpmYSBIz"
+    "cDbZwc3E183plNnzoCUoNd7xZxGFpQ4iW+Ih9Sua1g60azOGkOWht901tkemcmBdF27Q0h"
+    "lp2zm6ur/vWoN7oZnBLNWiAjpbqWPTZHg97Z3/oDrBXoHRSuDGBtMuj3rvAiLFhcWEQtOF"
+    "neiFMhoXvZ1iOtesBeXExGAknzbw+tBGn+7WnFZsy/YDCrHOyQFXylWUmkAS1TZ8jUGS1K"
+    "nSFphhVphtiQv71W19xsDtkZsEncAm+dAnIhbLb57ELYQzZKL3zPBqJEXmG+Wgzc+ZmCsU"
+    "Wl9O1vzrdffbWflpWbD3a9+WBONYzu081VjPK0sKzOHVcnzKr2anZ4UlJW5I4r8l43dWe+"
+    "Uk2mRGVV7nqItcx73V6sRnumZGVl7rwyF+IMgPlnIcZEWhJgV1RhmzgH0dXdPM+XGNJQoC"
+    "WAbmEPO5RiI4Ays1SjCpYZQYlpBlPdfNRdlR8BXtEdmKtDbmgXY82GX+7uWxXqlAqJdNJG"
+    "WFI6nakLeBOFLnXHmlY87ihfQS0+nnbwI9KpvWe+T+nU3tOKzTi1eaSRos1V06RGxbFPJP"
+    "tKXdsZ2r0khhk56a9N4VmD/2y9jc3NcaNlGsvLjshkH60ByyFTeBbpa1zXLoumcPiq6pfM"
+    "7pSLdkinlusVTvfO3ardnrabXhY+KQu6mFB7TWSCeO+WArE01Oe1MWBu6dtIU1uxQPt1qj"
+    "hgQK0JyC3TNKQ80HhbA1KHb9l3cZs/fgR5Uh2ytOmhbRmGf0L7AUqyv3DjP3zPgky8+3tq"
+    "swVfTUAGByIojjcJTkRcD9BowmTfOPQf0LLGVilmJA6nMM7dF7sx6ciCf0p20203ynq7aM"
+    "gi2Za1qAOTga9w4OvbWl/tOY6l6SrPaZ1MD0IO9Huims/rdslVoo6CUTwv+Cg2yr8QgxSb"
+    "WeROp6YZOt2CECLuolZs1XyoAGBK6pVa3fwYYcqTTAh3dOb7ekSyrXT3nJTZ73WSv93rRG"
+    "am2E+yT7K4e1qxMjOF3FjTFKJWbhFZcYuI3JFUdkfSDneFMPM9zzgLbPsXLLOAT3g5YeY3"
+    "eAijkt4Nbq6IjudfLtjalDFIamCuHp0e8YOV2Fu8yabKXEOPNAC3bgB6dqUYNb94Ow8AOi"
+    "mVnOKkIDnFSTY5RfzNMkDmx6KmxFpi+207HlXagnthMkhbcE8rtpm2YBvm5IxRU2Wd+aIB"
+    "FPhENm3+7DDtfkXjp76leTIGRbA8zwSp5C/ReRRILD5Gek+a1lGLFs9VT9Gs9/zMPTh43o"
+    "+CqmiEJKVasnTeApryeEeZKE8uVDvSAnlFFZuxQGTCb3mo3dp4lrU7ashbnbLlaB3huY1c"
+    "ANUTKVnRWIttvhBYasmtGflmWnI/iLTRmjZ0dRtro+2FXSFdHBt0cUijrX6jzU9sr1ATv7"
+    "Rq3niBtMT3xRQRLEpftHipmigiUiST9qdgB2AUa0lNZaGbnksdZULvYfFdYWFQpGJ7xs6n"
+    "97teL8RApb95ug2tLmiKeJRr1Wacp0O24JyBw3/v1XMkpRW0ZHWxhdWaP4qKTk2u0KQLtM"
+    "hGnXJipDBacdlRpEauP5IGSeL89HvdcEXRrOXOa8rTtcXzYlWD1WZ60+Dl5SmBW2OTH86k"
+    "3Fxf/uuU+M4vyzSex+b1zXUfqsIy+Xft/FRZDuLUszkj5q8xKqxP8hVsb3VydNyg5Ukixd"
+    "dq44pYgxzFC4Be6QjvfA1ycZLJFoBR4Wx1sVCzGP91eHOdg3GOfArhOxM+/ftU19wuMXTH"
+    "/bWReBfAiwgUU01pVqmbdKShgjTVBE+H5q8UZTcqHEmE8nIcSZs45tRa6H/krUjy7Jq4VC"
+    "vHi/p3Ai+hLVMYRalBNbYcsGF5LFhN5A8X+RrkgFFiwJDBL3sRIyGDX/a0YmXwS2cTjLCq"
+    "cSeEsrSte92omJQ5T/yVZkkJGduJVTE7qUDy1WIYrA4Vf0VTEUix+CtCUwa3bTC4La+714"
+    "BmkLLti9XMtlkWS8FYVg7LxExSE6CY/+420thqUEUzbRlkUyNiLcgGOm9DlS2GVjxltCS6"
+    "tUGjapLRqCMDbxS12v40vJ6jzqjCIq5QV0243KHWlqGyZhR0nnN05umGKMPxlWo+jyz8t+"
+    "Tw5mcF/4b6VoF2h1uF2Rcoqdjv9PfY2L7oVEm6MiOum2No2aw2HuhzDGqGsT9AhhXmF8lk"
+    "zXfntuXN5ql7QaVF1SUcaeG6kgH+z5IR8AXpXoVDSpl4eJn4taVh8ZLa3QsGUFK7e1qxmZ"
+    "WSPONnpRFQ5tuUByM172AkmX6TNjr95rXl6ve6xgzOS2vWESyZ00UKF8xmrLBiWLNyC+YO"
+    "6CXWPXGgab1TXZculniERFyZk82/WUZobI7NERrdDkaYJm4SeHn9kdrPxBd2eN5Ob6pj5B"
+    "VRzSkUmXizGfwqmbXze9jgY4tHKPO9EzyM5cH3HH7RN72wrf8qF/41L/xj4JbHLyn0mibD"
+    "+Kid6MULaOxWlTaYI/1awfQjvaGZZjHMD+hKStUQxLVaxP5f7j2TBZSRiacbMC46b/Gx/9"
+    "tZe8bcWmxXeuQVNeQSuyeyWrbXoLNh+p3b/vX5xfU3uDc2h/3r0Sk5GptfexeX/XNoqWNz"
+    "0B8N/sUKfEhPnIXN/sPx509hi8cfRY19eNW7vBS0eNu2bOj5TsBOJ/HO30ifEWxJfOi2t9"
+    "Lb1IWWqFmeyDzJj45ISu2y+e5sMJZs4F6QRlk2EK2AFWo1JlZDlTZr5GlQDQafLQnd/e+b"
+    "Ate35CPX5SMlj9YeHm3oTeIQFBJqibLd0syaExMrSbFh1ZO4HHEtwqzMl3i20pJItmFhh2"
+    "iqGUhMKBZ3llTDkr4ca/2MYdPmluVQMreesBgU5irpFLQNrQXlAlDWpmQJqi1TNcgBfTt7"
+    "2/UP2AnTCTD6DtvHmy6xkKBjUmMzHt55+KRPaSAfO6LWX90R3SRQPPeQnojfSxJFOZRHIu"
+    "L211yuMMpwlWYFszfTQbyx25JBXMk4WJlBfJk0aBSb2Lkb9gfKbX9wdTEcXtxcK2CFXn9D"
+    "uuDo/fuxeTP41ru++HdvhLeu+rgJVOmdnzM6Ie/+oH918wsvcZQqIXrO8fvjsTm6uRtc96"
+    "761yPlbNCH1Qnc+IAPiN2A9cbAv3GUuNG/PueXk4rubs8DRR/G5lVvdPazMjz7uX9+x+iQ"
+    "j6ieXx30E9ePgutnN1e3l/0Rv3ocXu1dn/Uv/bKR5v5odHH9bagM775cXYx8oY9jc9A76y"
+    "cuHr33L/ZubwccqY9HR/61Qf+v/TO/HDzx8uIXuMY0xN7w6CR+Z3Bzc6Xc3Pav+b1PCakA"
+    "s49Hn+PXv15cXwx/5jd+jN+If9zRT2MTauMf8Rc9fu9fC2v54zG8+8X1LxcjfPuz/gW7eo"
+    "Lo+ld7Z2f92xG/Gi8bfOkJYutf7f/z9mLAL26foirLcL/cx5vJdnfOL4ZnN4Nz5fyKMYP9"
+    "q97FJSMG/9H/8vPNzd8AOZhgr4ZQq1sHX2aCrH83viS29sJ4lqzInlZsA3cwt3ODo2SWVg"
+    "BNMks1MEt5vbcG9CrupW3udroazonYJE0Xx/krLHs8m341VGHYW17RbhFJl/j8ey6l3INY"
+    "SZLOfxBBEUZnsTx2UDHvprrD/yIJOivk1fyHCei7GnQisdczDOvJIcM7sOx751cX14zW4/"
+    "mGHqnxzNVSok4fsa1PQ2n2zPgDnO7YXNqMG8Fn310QzfBcl9rZksSdqy7BFJBI7JGJ6qQ/"
+    "VUjSZXqnXxO4VSlLwxWWRs4tfgHuB7kFJeFWN+GWAnoFazylYddWeND39Ck2dvgee/vBOC"
+    "vl0mxS/szOP+asb8NgoDtB7yfwp/+SbNiAAiTdkZtim/vvuYIJl5RsUoQCVorJUA8q5EmN"
+    "auQAZYh+TzTPtqHpw/jNJxs6fbN2zTTJ0CsV2GBawtzA+XFwocBu4986N+wvlcXNo79uYn"
+    "kueZo/i+r8XVDB69fvJkLmJD+2FzSK5Mf2tGIz/Fgw9U2eqzE8GbndcmOdmMH0NLfCGTI2"
+    "c1ZaEtbGne2ef9w/Lk1mWOusSQuJR4Dt8ZPN6/dlIc6MewmAh/0Rub67vGwC8XZhPnJTqZ"
+    "Bz80t1y9JtelT+RZqN6yZ4eBUzHv9j6Sbf8pmwIbNcWhVBmetl6/xR5YMs1jm2YvvoJbLQ"
+    "H70vk4YeSuXmoWf3ZGTGptkfrDXPqXQ4UFzk9bp2nco73JJCr3KDG/19qYMNtgrXmJBsEt"
+    "f4KndDScJqL3gNSVjtacVmCKug21UlrDJyr4lMkYyUZKTaw0hFXXV7jFSDMcyMXE0N9RpQ"
+    "gM5xOy9QTkGxbukQL5tLlIzuukJtmSAnvvcQ/wi0ZXmn0pLJLZj+ZUY6hmWte2LSp1REFn"
+    "ma69qcLDwoPaFjE77fth7plEyeiRoP+ppQeAuaCbfAcAy/OfBoMRfefYJH2p6OTQL/06en"
+    "5NbWF6r9TB7oM7+IdXFKfNjhYQmNeJMXi8F4SuIVFr/Di9qBLmiUp4TtXEX2NbyceXEuxp"
+    "P6hK/i/yYHS2pOoQq6JMCjC6r+QzXQ9CZ44KNOn/znpTjf4B57qP8KcSmFudXhk5Ju9nvb"
+    "WgSydvqzVPeUhKEXQf2iG95HP/VWucWDEuWYyu+dOLDY21lgXDyXXfwVZWhc7dQm+28GuX"
+    "xqMyi/vdO9xW6Qgs5d0u+ZOsm73FHeRWd5Z1jP+CtnIM6P0kmJ7TpWJ2dcbGY4Tl4utgKu"
+    "Pi/v2gabdMcf/zu57ZpEr7X7Q+njs0qVhpyW23VLLpgOm9maE3NfBvhiUictK2mdhvF1sb"
+    "VU9bpNiEpOXXLqso9KTl1WbFlOPW11Ziq3INlpRnLXm4FKsBEl15F1n7obcRhVQU4LNivY"
+    "VkTAbA/iAlo+3jrbSCXX15bLcs2C/lzi9NOofW4P5Qa25vIgp/tzUxn9zgtUfnkOvxR1nz"
+    "8VyyjPV0aFbjfK8/jkpAxLdHKSTxPhvf3jO2uxXzfBBckQWpncTJp3HWm3v6KKDc/1zqwF"
+    "xavEqAGozrOpKb95qsGyY6x5YHwPtf09UNbMSs9biyf6BTuELjw/bw1AUI9/aF9TZ+ZiJG"
+    "yYMtcEIRHiA+pa3C5YjrKlZeiavi4qaM3eoqbnFuORPU1+dUDOua5vqGoPIAnT4is8g34t"
+    "4AwDpf3H1p1mm4o/gLl3oWhz1TR9dmB1cIZM2RnX1WJQovMQ1gSkrQcep7P2FBy4sTo4Rc"
+    "d/tHOOziQ6rGeuTmVdbGkz4vvSa4Ql2hjfUkQWdDFZe6kfR+SKKWwxIktqL3THWX9siaNy"
+    "GyptMzJgklJXwZ/OUtXW7Ue3TN11oG2r3pxEgKb1BE8lB35EP4m+r1p6vBdsJ1Co2Ja1UJ"
+    "a2da+vbUgNQN8A1N1ybS1uVoiMrTxSOzq9an1o7F9i+loODpJmysRadyE48FV9sdz2bh1L"
+    "Gg6hWeWqzsO6hkOgbAS62rv+gyEVMznXOHcNucaWtZNtOb/99c4LLvBoVVTOEb6Iykt3eI"
+    "3NZdPucMxBtZILJSEoPSjSNSYr9lWc+7OL6pQH/8jUELvGc6OpIeQxSnTtA7qTXl9FdRzA"
+    "rgZ3RHZV3EI38JrGRUmy8Uo1n0cW/rtCt1+Pcdz0OrygAbNvUQpsqeSX2djiYIElIrQtm1"
+    "UHnj+TGkoi3P3uEdadoDBX6Rd057blzeY5ZcTPyO1/cF3JVM2fpW3PGBIv2J9JzMrZoMn3"
+    "l3Zo05YT3QI7NNa+q0ZoC0R3nLeiPKqbT8orw7XluTDSzJb8yausWMmf1DV3SyqgjcfZlg"
+    "ibWctmWz12psn2WvRVaVstbf3m22sJE6zIVssYdhu110IyINdcSwe5COw0QRxMvoEmjMGp"
+    "ku2SK4gFuRQluMwWxnyS4as6RMWDiPE4YBv+NqfpA4MtMlcfWYJK3cYwGwITADukGHM9Wv"
+    "e+fuct6avaPHoMy5c5oSwwh2W9pDo7c1RlT4KHpM94GZsHE8/FHFVkYrnzN5XTXt6xjhR7"
+    "g+iQWHJA387edtmj8T7xw4TwvBI/7+RUd5aG+qxwXT970BoO722dmlN+1ibezE2hGSTYil"
+    "3FtKC4rzx8HS6HbxAT4FhEsUvQfh2eqisKYOKCcahiChJJAPODoHzwHGXpTQxdYzks/SNg"
+    "44hh9euuE9QpUW1KuASA8Kg7OrRgriparMfyYUaKMgk0ozVgbnlDdVwC3QVrrHQazYAd/R"
+    "VTZqZnF3Yx/GiZRFPuHOe5NooGCjYkpIfT3VEVsVGpCtBpuV1nLS0YT1fBWmYtzQ2KDXM9"
+    "hq278blLoxE6A/tLO/wjuV3v8A8PVY8NK05m8ly7AmQSAEnodCVT9xoqtoFMXUM3b7Q/Gq"
+    "o+YO9KWJTbQ7WAI91ugE8TAa4tAihvkNg+9dzQAWKL9PQGNiGmyMUd7UPshC+A3I1DSez7"
+    "8DgXWOS61nrVIdipuPZ+KXNqLfQ/qM1B3GoTjgOmB6QamVDDMmeMWD1AOUbSzgxrAkOI/8"
+    "3r7lnc5L6Z/Mb4Mi1eNoIpTZArqa60Dlceb7ZVaPOEHKOmkTZ3YgXYIMXqFQeMGbQwnwLt"
+    "+uxnl/GrfDQZm/HuAzIWMx45C/+kQ4Mxfco9fEBFQpzJnJLRnGa+JU5F433GQk8oHrw+s1"
+    "UTk8/G3s4nfFVT4Z8TkcdMDnl+fiOkjdm76076gaiCIyFQwW+UUcEBFKjgN15UIWKuo89l"
+    "VLSPQgF1nRIow11/70QNms8tIXmdobUTJRmNnSgrSewaSeyoZVfkn5KCWySgcga9M2FPDJ"
+    "tSo7incChYAfNIsBmYZ4euxmLuL2WrYx4JNgPz7FjfTMwlx7oPVJzkWPe0YrNJylJLtJLL"
+    "qbTYro9Gqc9Wbz+3WiOsjPsLTKQMso2gVRPT4JrkX/XsTo1swmXZv3Qn3t9NqrU05C1sYN"
+    "0kkZVOviWgrwT5ufJJK3FysJepqgH1HNRBAMh7febZnPL2lTAuCt9jBIsBgs8g+AwBdbWG"
+    "HiFZkXYkMGzSTIUkI1aaDpsaUbft7X3yNJa2be+Dqcx2cRBXBSeA5XbwlNT2lnFHJ7vu6r"
+    "Fs0JgC0NAXusBkzEUuKbQ94I4/Ngc4h6UDhycqeEibblPB3FJIYIkV7JzIqqOT18hVMbOY"
+    "9dSK8CYFdx2I2TRU0U0IYC3y8q4UIpsRlugm0J3rU7oquBlZOSCImu7Spsy00eYirrNE80"
+    "0rkE1YgPJCn66HclqBRFmAsgmIQG9H3mN1pEVKJNrpHR3BC1dDOCkoB2TpTdxDp5P0Ju5p"
+    "xTZwx8YuqlPmVtkExbfd4HVDf6SKvf4BMckTRC9B62DL58SsjXOSxNvJkW4NAmPTLrnkoS"
+    "85TrnMyTDFbjnByTQl/HIoSOKCKc/afTaHicArt4oWDPQ+p/e6SR3iM5asxbHCPETcteCO"
+    "RqE/EdVXT6fMr2cTTPaLEXH+GZOg7o7JLDzH5clcVGLo5gMIBB7Bt7MZUTXN8kyXBakvKH"
+    "XJQjf1hbfwvYWx9yjvNGTniPqDEctBLIh2lj7EFSbIboEPMQ56aoDSZ7kAxqU2tdTYDJA/"
+    "HR9/+PD5+P2HTz+efPz8+eTH9yGi2VtF0H65+IboJhaLWSssaMeV0I0JtWwdtwt0q3rBE0"
+    "LSFR4L+XbpzLKFZ1v/dXhznRfvHZdKwXlnwmd+n+qa24VJxHF/3RS4nb/ceyZLM0YmMDS5"
+    "uum8xQf+b2ftVY0IYYSj2Fuedox3k9YiKkh7y/0ZNG8hnTtaZOS2N2Y0yGHOliMKrHnuqV"
+    "7Zu5MVlmyiCN7pbysBy8UkpBneG2wKWJRXp70jOelLkKT3/nGjkvTe04qVpHddax9Jeu+Y"
+    "9GY7FWo8xBppt7YfZL1JvleMj4DzzQUyn/dldbky+XthTvVHfer5KZp/cHxqNUHkQi9zPc"
+    "FOjCrCSPWO4PaDQ578fBZ+huy56pAJpWbE7iIxG9uzw3jefCr2MQUV26skudcNc6+wkg/q"
+    "q7oNEJeUplXSDAiwWWG5mBKtYb3YrH0eDVoeBp9duPDncYpII1QYY5JC21sWvt/1WJOixv"
+    "0JoOLgkhaVo0s+tCuMMAJxOcrseJTBlFyKNqfaw0pVKhCXVdqYKlWobVuCrff52ztFsnKP"
+    "pzzCcX+JOcm47mnFZhjXNufU2dlqOs6PVANPIPmaQCygqdOc05o0dcu5026Kqxa0m/1NMV"
+    "Q7eg1OI4Rz3hfL7eREKwe3uy/FKbNkDxPLrRChzNL5gEgyqlgch5xTFinooQsNyiE3Pc+d"
+    "H2MSWXYiGjyWhRwH74ZRwiiv+80N6Wv4MH5OoJ/C/AAPcIx7ZQ4dzVrS6RuCpzv6h0Kqjg"
+    "OtF2lsK3ncZB6dLWnrzdLWfsifIKdLftBlXGa3B/qFjTt4JXawZ3Do5w+q4bpL+wf4y1n8"
+    "8eGHlU73Oylz4NxJ/nlzJ5nj5jRDhz4mXHkUYB4X2vWhfsFowd6JXJyvgutmwl45Sg6FgU"
+    "xg6rwIbyTYLIij92oEzC3NVdb5GhxDiS/EJjh2TsDEag60+5DDrCM6FrkcwttmvPYibrMT"
+    "nenMWzMeQElNfM50bdjrzNmjQueDtbxmwDKwyviREdzeQNIZqnMVlxk/83foZNG/ZS9D2M"
+    "vFRxY/26b/8uGipHc5Gt0OYipxfTK8ylz494f4pZXWLhsZoXj8inC13Te9RcYsTecD9IV3"
+    "6cjtnHm2jfMqoGfyE+1J9GalF+Ufjj9/Ctfj+KNoKT686l1eilLc4WOVBXUcMDOrDPlZyR"
+    "2P+r3pVPfHff5uYC5CT1j4J7nZhLlfSOyFmzcfcGcRbxVreA9TCprkP+ygvQT1s1gS654f"
+    "X+R4Gpj0zr1nxDrE+vXTICq9vJPR71XcX7hi9Qt0NL0F8P7K3vj1Vbx0e+6Fd0y6Pfe0Ys"
+    "Nw9Ay3/1Jc/6tP2pK7PYcT8TUgE/NztHdzSQInbtizEx1qwgaPktjqDA+VQZjjCk/2ZKyA"
+    "7b9CQzeE5LWiYsdausGVc7IpCcdTOY9bL+wuuGZSScKr5lovpwOqqiB20GzidbGs51DiLK"
+    "mGPmWUdwLCQYd/oxHvHUsikL9PxKc9EzvM5DaRzW8T2TfCMZpKkHeM3rIptGPgc15hGZgS"
+    "letAucCXFbuFuEacpSvNMJHAawrIk5vvNxvV6K+QaghmjEWCNQ/FsoF4USd7OXpR5i3IAb"
+    "GGvAXbMMSYyVpgfQUmbQmTKzSkS5hZbPEoOK5QYFDlFo3trEdem6LBZS2pGT/8kMAK1gQz"
+    "DH/hqtUnctFL9R9LhxVfd2xyIy34WMy6atnTWGFfSejohTv3uqk7c65HwxZtGEwVKxPK88"
+    "qe8hedswua5S0Nys10giA9oOV+b8OvK9XV5l3CjqCAi6dj85B8oa7L8r3CfUO/p9ozTNHc"
+    "4meJWrHMrU0fMZYTfW8AgL2cqxh4yWQwSs7BQn3V0UERdBL7GZ+ItikHluGERfDjD0Nzc0"
+    "FdFY0bgBYWBtyNJ8M2t25GYgVWiaAIyu82XPMrXI0aYCpM850GZuzhFBrR4dHxh48Ninho"
+    "Rozs6mxgNko2FSDbkMBYdoZu9QywMaGdI41tm4UAWWCWhTA3tmXnxfIUDCR5ATzbjjYJQn"
+    "jY1Ov7rw9wmu8S+GcKwHaJbuKRzGiWOt1wbu5GM3ND2v1e+p87bHHEBvsnVbDAKgn9vlAc"
+    "r4S76lzGwkn4e76yit45l9UML2Ld9NYCraBqOMZFakFy1WVvz3EsTWfDX+SeI+z1yIEOFp"
+    "f5XHYm2j++qxnNdU0KbNgfkeu7y8tqrE2qdWehvzHpyIJ/SgJ/FWhpXbsuC3+8S5epgDWp"
+    "MHNqLfQ/qH0LkwHN2eWbKtMtpsSC0ng2LhQvSYtdoSrm5EfWBZt3pIn4mrIMWSkp5KD4q/"
+    "PNvLjZ+jBYrP2rd3WZ3DMcbAsO9YCgC6pR0WhOn5kOn+IEBVCTFrOHnCXGIpADluDSshMx"
+    "DcR6gvXgGx7y4MLrTzyXOqdjk8D/9OkpubX1hQpW6wN95hdDjafkOviT93j+WWRCDQteCp"
+    "olF8DHnhLcCk+e5la4GEVazpc4YCEUAfHGClj2Gy4dfe4piSqcYO8jB9yE7hJngf//40OX"
+    "WJYLv6mrvX0TvS5/+uG9YAda9A68R5InHb7FjL7y/0Yv4GuMtY9TItpthUTe01x14+qnFn"
+    "W4eFBpp2ENu9hzYZmOZ1mQAxSCBol5TH3ZRCPwX0J3lKU3MXTtlETxAOHToDIedUeHls/C"
+    "WwyeEtV/gchuOY1IVF8wZi34lRcud8WFWQQz9LYwg6Yw2iVEMziUKsQUf7FunQ5+KRSCst"
+    "9TSoJEBexWiI6oZPQ4yYrWyIomQS7NICWkdk4hvTzAsKGlGdRFW3cCJwdjfzAJXq4qrEfv"
+    "y+AKpXKBZff2eSNwMAU1fT9wMDNmIc8/NSsus6szs8Tws9k9msHZJI9rQUwpzuf6tWthI6"
+    "dnRXNnphpeCpKM5Hae6bbzi2D9szbg8oAdGT3XfY3U8uur2AyVnDZHSloIabEd08ovmezk"
+    "AOWYceynFvPJii2SpPuSZLNTwHk0gnIO22YNxDPnsa7jGvemUZdlSNN9fX/zTK7ftMtiuk"
+    "YCSrkVVbjFcomr+KniUDpdE41bpmlIOfO3te7OhxrW4vAjGA8ZPpzHbdbjAdnorsuhNqdT"
+    "D/Abqc5DR+DeSBboFvk2nKCo4kLZko6NUD9BIcLUZh0ZwlLoLRhQ1t1N9F3wey5y3n6uUa"
+    "hSzcPqgEvh26FLgtqP8DrohgjDWnE1y3wY+O6BAp6/VLA7kxwk85z6Wt6QaHRPlPifa8uk"
+    "6OD4gudZH+ome1nucIGWhuEw8F5gok8pO+vLsNSp/96uarveskswuapvukNJZEAnqpN7CF"
+    "iGyBZEnUc7ChlBbdLfXcX2TH/pH7sraeqVFpD5NHVLSdPy+Mk0iZuYUrdGguLgxEERde+X"
+    "k7wl5HdtAPX/CRb3ZV+5vPl2St7DnNE7Y2a8cnPbv1YGNzdXp+RobJ5d9nvXd7fK6OZucN"
+    "276l+PlLth71sf2u/Y7A3/dX0Wv4UKbu5GCqg4v7gGxR8KCl1cK7eDm2+D/nB4Sj4KCg7P"
+    "bgZ95ax3eXZ32Rtd3FyfkpOg2OXFL30F35m97yn5NDaHt/3++bfeFTxYubi6vRmMTsnn6A"
+    "tuL6H0zzeX5/0BfEJ/AA/9MfbZtzeXl9G3w82fQCMohBs3l8qg//Xi8hJdGqDwbjhCdH76"
+    "qZKlWEtWPH+6XqcVZnTsuiXCZ/YHv/QueXsbYDVD27q57rOWAlhtHeZgLYR5jy1TtBTPn8"
+    "4ForvllXa281az4aPp77gUdYTzUcEukaxoS+akbWxOiCwKXbRgKmays9JNysFXy9zfIPI6"
+    "+OxCtwRbF/BIoir+1ZTYrlysnb/ceybPFTtBM043nbf42P/tbKR2N+VYbX/2mTrQrdGLyl"
+    "J+RoZzlTEqJSoHqB0PUCkOpEpVpkRlVTYhmS/WR/UtjgLRVi7K6o/2C5FZ7RDWhGRLIN02"
+    "9yJjcvYidEPG5OxpxWZcmUG3mzxXixHJyL1S9mT3ecvaiWFBTM1uc281J+Sgu2rqLXH/rg"
+    "HKkkEyzYUwM2o1KXdZLBZEEMuQjBQpCGSAEsrSJzVKpCzDkKPDKPYjsTeSRYboLtuQbGFI"
+    "gWaoMEdPBenMVlLDTnDFIBoWSsCjasjkmRxE4t1wt58yV535m7dkxIJW+DWC14jujE3NWi"
+    "y9MHgFA1vo7/DhUUnP4bEQtmUYYeALaLcInfJ3U8emH/eGEyae+6OphvGMcQtLh1jG1P8Y"
+    "hz9jQlEIj8fCvCCeyzeA8s9dqM/4najNfsSXsmyiRuEa/h5jhAxfJyhgEm8J3wFqxyYrwi"
+    "IyDHrvEs8Mdel8ByG0N3gH7/4e3oqrX1pLz1CDvbFvyQ30ZQCGYw3LL9zTmIj6gd8mfQT5"
+    "6COIOoPuUzouI7n3LFFTeCF6Ng/SiO9/jt+TIRorrULkTsLm7CTMtP2yoGcEd4378Ofe4f"
+    "HJJ9yCjSOFppqWiSNhNJSW33mVRP3TxxKof/qYizreSsW220YVrP3i7QxEOim1TfOkYJvm"
+    "SXabJja6ikc5x0TaCeRGvL1Lai9UQzcfqkCZEGoJo7iFRuksLR3PS63Yu1NiEs/93BU8TK"
+    "/og0eHC9tyc9O2nddB6uEqtRCXqaEWGuV/2AjIPgDIkIhOv8q1HTJyu462+9l6Irj5yjdl"
+    "XWpjHgL/+Zh3x7IeMEMoWegGVH8UxbaDALLIkssA/oLPJyHZJKdzJ8zUE+6PiRnJfDMcbp"
+    "B5VHX27GrbZJruNyjlopauvr3wCGUrtgm5KlfvuCyLIN/FGnbdFNEW7WVNEWk72qHNCbtq"
+    "iCdkdgx57bsJN+xgijbZrukPEaVPbC/qZZ0oiab3sgcqJzloZbBXTQ/a6KGkLOa5mUN37L"
+    "P6xraL+iZZR+C2ShboFnmu+NZTJW55vuy/4voJaDV0je9uDXnKKFfUA30+fFQNj5KlqtuC"
+    "ZKOrqSmf8hP+OCV3PD+mrxivvdOneMYNgG2PTab5lPhYEf6gg+jp/G1FKTR/9qCCDnFFgl"
+    "imE2m6kcOsIPMldw6xJ/v7h1EfeuNMyzxUpwvdLMp+GciWS38ZL10m/2XK8ST9RSutOPL9"
+    "RdAUqzBtfvGdnsbTJPKXddUsgPnxpKFAWxj0bceRyg3SGwR3P/ITNmwfjaRD9pQOkZHPe1"
+    "GxYTaijG20faspHpJaYDuJihVaUIkI0Wp21I0oI1BkA7HERNYjtW2wWDAqDV0S5jRIFxQe"
+    "o5AxrGrSW97SimNwSnyWAW+jqzD+NjHDbCi0yMIDDZY0eeLDm83Yajuzrr5nQq5xgZ8+Tk"
+    "AaXXtkdGUnDml1NW/ylVbXHoErDYS9WEdKA2FPKzazNXL3W/t2MG3v89a+7cNZ+9a+3dir"
+    "Uc5m5hINIjA7Aps1r2i3yG6Nkksr3NFZzXYNI0Idb7LQWSoyf0tU+lxHQXLe8rJstxpaeA"
+    "5ZGuoztQ+ZjMv3u2mxXWnMH5wSp85bcsvEWILescmFIyFDfwjPhXOg5lmupi7RPLAq+TYY"
+    "i32x02UnEDK33QwegHvfYqfbkQmFx7NgWN32d5pN6AzTPeHWOSf2mrjpjnk80bcNxuPYRO"
+    "uRfQo7+FoPjU327V9UDLiFJwzVuerY6vyL5f7gkKjGv+GhgKx6uwTM26XrO8mxPJQ9/sEZ"
+    "mwvoVvoh2Pgqnthna3PdhS/17NxcwN+jAAL8WsX0FhM8v05ap5u1TuNgZwAcLlTDyA+mTY"
+    "puL5T2aG04a8n+uU/h9o2N9A7H3opOrISczAUnxnQFWyYtK60ZaabKit3GqVqWSwVzTT5d"
+    "FwpIoi4vPOJRNUTrxpeiI0IxOa+kmXp9yo3byqn3RLKy4Qobrm/LVWy3MSkZ0yMEdIUpMy"
+    "nZpJ1ttbTeBs2Qpfaq7WJL0y4WOTVvTIrW9FXTAwokXxOIBRT4trfD7I4KqGFTS15jrAG/"
+    "rR/4WDt8gj7WTKfBnaOyPlXgLOBFuiWdBF5Y+kXfwAhuP7Czy39w4py8qmnU4Uy9TTW8Er"
+    "s51zGS6znrLVhLW/kYNnzAKQkPCOXa/RNCI8W8bPT7NEbF88A6DAALhHlplsg6uAQCeG6g"
+    "qy6WuE9oAZNu8Pq8SDaiTsH3jbvdyMV5uP0t9s0HU2paLLnNH74TYEnte7wCnfKNQC/KpT"
+    "TjpVKKYi2Dq4nhUEJJruMhOFo20p9xO3yPn66aAFdmtavdJZHEt+KKPCO8HR6rboj3lsZq"
+    "RbRFE9eauSBWPadTKNyWUMktxJumppkq0ApEJbAiYCt1/Izca+32sTVISehiEjIyLQCkUV"
+    "bljiLRYg3jZZM8tjBeH7pRQlnzOm1ZBDOjUpOMctY+BZZ40G7zzW9sGCXj8ZjhylSAOekf"
+    "cY/7kc51R7Ps6SEsA+d4SWOZapjirKm9ipLyFvaUa2HmrK+R6UBz1t/21SVBe+MWo6FqdM"
+    "6zwLOnvUlqwmvc+ozrM1mAXrwc/hfeRjcxjV9UOHEZDVb4ZP5pk+ewEHwWfMLSZS+EGe9h"
+    "rTbRDd19Tr2M+gg2VEw7/82y5ScL0oWqG1E59pPAmt0Orf9QJTOdwEJ+oCYY6j2A/zjgPd"
+    "hF9lKBot7tBc+Nw5LjJTXZ9B7Uz1Oq/KsVdbHSeAStDsJsF1wv/krsBmcT3JDqSOvCgEe8"
+    "yxrDAH4gK/J2NstvEGlBXu9pUU495MmUwzOuU4RDqK4sqKUV1oGs+6RzhveUjNifL0LqS/"
+    "g0TiTDsTSsJ2prqpMrB80CQ3OT8v5FnwqCa3OiqUvdRTpI5UG2Ym3lqsh/ighMX0/ZunlZ"
+    "Ux2VksTojnOZ2tyCATYFFQzvhkNw4sG9s+mBDvNfmhYLYPY1L23LtDzTCbUGF8gBD11WDb"
+    "+kM7eelKh4mIXICt8gFGX1heyiz7pGIypmz+YR2z5XGl0gBn2kRpjtiB/+Gs92xNVhZcJD"
+    "2MkYvEyUICka7qEhwTSPn8uyJGHZzGwQBErzvGvDJaXTbyqe5EH0xdKyfa7Wweszdp11in"
+    "g5HlL+DvQ8BZxqZsrJ1GV8s3DP/xZ2LdEEsluFL3FXML8QLzY2z6I1jz99HsbmSpYZyjIN"
+    "drjJ9d3lJYKSBAvhQbgC4RFCRk3Hw7B5aE+YVcrwv2auPlLAMhjnL8675Gmuw3wb0+ews1"
+    "SgneWwtDIMfLOca1T5grASfZYLYVKulgSVW4Lyp+PjDx8+H7//8OnHk4+fP5/8+D7ENHur"
+    "CNwvF98Q3wQPkrXd08NqFVpJJCt5pQy0ibX1KvhmFLQkAC2JcZnTV/IPX8mcvZK0NVaBNZ"
+    "JsJZ4bbbPMElsF1FBQYpppqbH1fJUQ1Dz5liC89SwSIjt/FbwzCiTghYCnrcOqLvIiPTKE"
+    "dcchrDGWqsq0kBKrpQftQcbWBHW3Ep5rrbf3cpoVUptVxv1cBS3BeNvjvpj8XQlxOdVWhH"
+    "zdubZQkZxsdzzZho6LSkE+cSE50SaQrBwwlRRryWi0PTzjTpwVcE2LS3xT+K66hMkRbwm+"
+    "255NRf7RFdCWi5dKcK+7dClQIxcuO164rDovyAkh92BvPxChCppxmVYieVTqGOqjgmOojw"
+    "THUMeDPgTe5MKsTWlZmaoge/48j33JInthun3TW2TicJNtNqFge5H07zPIdu6G/QHcGJtX"
+    "N+f9QW90M8CD0cdm7/zq4po1zrE5vLuFW/zC8fv3nXKNvL4kb2FUUcWGnJCTaWJS6TZ0Bb"
+    "9bMfSF7irQIpWFbnquAOPcuJNCHbs9J3XLMT3J856iiKrqDTYlLIfe1LyWiOqr0Fazgq+0"
+    "gcrU+Huxpzdrjsicg3tRsVXPzkpO6YwoEC34fdmvfxtQI8zhLt4c1lvqo4DdaV5F520NS6"
+    "5unGdTU37zVIOdLqWo3hQWKIYlShRcCRrU+/dAbQ+1XlqzRs4bFXBC/5hi00edPtWKD+5/"
+    "aTs2URtClHYBT2P7WF19qvW9yIYlvaKCPT8zcSuqoyzUqchWrQBKPDnPFcXs7gN4SHshCt"
+    "aOCNWa7SUOTbtBYe1maRm6plNH8SFaDxwE5BY1PrcXFrYtvl5YcMta22GZ6jbV3BCYLQLS"
+    "1BnI0M0HGFNmno5r4bXw8PfFfUNVLUZEXS5t6xEwwa2N6yFy5mtoZ2fB71cWbOJ05vpyzd"
+    "ZREoumtgqe+5Nvel0TCZYJ9TbS1FJEYnlDaoElyqfSfmxMC49k1nhqsvWX99cxdeVW+a0A"
+    "xvEm4ZNqRGgYU9tiqO5hzebZVLk31JmjUBNfd80lXHzZ/5Wr/wratzlFdSJHKMsV638XS3"
+    "Hgf3E532glk0k3H3XhqSOronfBFLa4dSWSJ9oU3s1x6zQqucatAtQJExD73+M3q/QhnnVZ"
+    "nozsg8YF+neK4Mb6ZvCFDEU7ep8NNMEageNUT4u7Jj9Tk4W2Ocv1CdNbpu460LbVBsV6pP"
+    "UETyMHfhprB9PqkOjj3tTYokKtShQdVC96t4mooy0PbTNbNf1BzaEk9Yl1jWrwkbbySO1w"
+    "OVUDS4Isvf1LTGeLe2ewpOC9dE1wBqo55Yfl8na2o/kySAaF4/wyfJGaAXNV52FNuIbanE"
+    "49WC6OQFd7iZWY5Ryco6pExznXZkZnDrRuaY8THaRRBz7hGR4twgVjGDaVa7UHA7SG0dSZ"
+    "bKv+nW5RvlU1KvNSwtV8GGTCtK0nTIOpXhyFnb9dICYis3fF/QZVQPSLtxPAjey3gCe6wt"
+    "Tc+ceQx0TkKeTpsLngFPIKgXD1Ty9//n9ctSC2"
+)
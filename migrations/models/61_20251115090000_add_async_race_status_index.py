@@ -0,0 +1,353 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `async_qualifier_races` ADD INDEX `idx_async_quali_status_1f37c6` (`status`, `discord_thread_id`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `async_qualifier_races` DROP INDEX `idx_async_quali_status_1f37c6`;"""
+
+
+MODELS_STATE = (
+    "eJztfWtz20bS7l+Z4pfI51C2JVt2orPvW0VLtKNd3ZakshczhQLBEYkVCDC4SFG28t9P9w"
+    "zuGEAACZIANVu1jghMN4Bnrv10T89/OwtrSg3nbW+pj6wHanZOyX87prqg8EfmXpd01OUy"
+    "uoMXXHVisMLqUldcLMYuqxPHtVXNhTv3quFQuDSljmbrS1e38Cmd3u0FYeWJ6jiWpqsunZ"
+    "In3Z0TlXgOtd+imqmlgR7dnJWSGJtjc+haNnXgylx15sS6J+6c+lKPquHR/8cuLA1VN136"
+    "u+vf0h1imcYzcebWk0m8pWUSzaYqvit7D8/Uf/MofN+MgrgNb/P9V7ism1P6O3WCn8sH5V"
+    "6nxjQBoj5FBey64j4v2bUL0/3KCuInThTNMryFGRVePrtzywxLw5vi1Rk1qY3fDNdc20NI"
+    "Tc8wfPwDlPmbRkX4K8ZkpvRe9QysGJTO1EtwMQa8f0mzTKxTeBuHfeAMn3J4fPTx88cfP3"
+    "z6+CMUYW8SXvn8J/+86Nu5IEPgetT5k91XXZWXYDBGuLH/ZpA7m6u2GLqgfAo8eOU0eAFU"
+    "MfR8bELwgiIRelErrgm+hfq7YlBz5s7h59H79wVg/dIbnP3cGxxAqTf4MRb0LN7prv1bx/"
+    "weIhohyJq2gv2gCo5JqZXQ3H5bTID56WMJLD99zIUSbyWR1B0FxjL9UdAgv1iWQVUzpzvH"
+    "5VJQTkBwFSzLNM0Q3pXQLEDvy83NJb70wnF+M9iFi1EKxrurL31oqgxdKKS7NN7fI0zZ+E"
+    "qniupmQT2HO66+oGJUk5IpWKe+6Nvgj01hvGaLhW+Y3sCU49dWAeaji6v+cNS7uk0Af94b"
+    "9fHOMbv6nLp68CnVukMl5B8Xo58J/iT/vrnuMwQtx53Z7IlRudG/O/hOqudaimk9Keo01m"
+    "+DqwEwiYo1VMdVYD5epWrTsjVU7vaH9pbUZfDZhZVJf1/qoG6FqkxKyorccUXiAlmptBaN"
+    "Sby8IG3IqFrDmhQX8vcPwiUpIpIF8CsYHPrM/Bt9ZjhewBuppiaa8n176s5X0zz8/gzaQH"
+    "A16na2+hQaN/GmAZ8HH0X5LH/WG571zvsdBuJE1R6eVHuqJNDEO9axlboSls3eWhwv0ldU"
+    "U52x78evwHcODFXn2dT+7qmGDgJ2R2TKJkt0Cw1aLKv8FhQua9aiFAkfQZhigS0rLIYGLL"
+    "8TPZaohmE9ocX6jL9ci2jWYomIE3gTNHVRYG5bpuU5xnOXW8RU1eZjkwthOXgsWVJ7AVrN"
+    "B4fc29YC7GFbBxmyhJUoqHHRMtZtghbwEjS/JUON29I2HZuaamiewUzuiQoTNNjL5F43dT"
+    "CycfwmNoWbsNLFF1RB3uaXD9RHaOMzyixxa0lO3kh7+hXY07sY+xM24PHJSQkjEErlWoHs"
+    "XtJkib9ZBskR/T2nEabEWkJQFC1++v8cJdY9AWoHV71/vkmsfS5vrr8FxWMon13efJE29s"
+    "Zt7Lk+pQoM4fDGTkVY06JbRFY8szYM2qnuwOw4VbS5aprUEC6tv+iz3JlJLL/SQjs9Nmxp"
+    "pvrp+PjDh8/H7z98+vHk4+fPJz++D6es7K2iuevLxTfEN1EPWcBtz3QUWMIoS7/pJbEewt"
+    "LGyEU7I7w9i+ZobaA/HH/+FEKLP4rAHF71Li+z6OHkiLSZSxdL0VhQDF9Wenv4HTYDQJv+"
+    "5uk2DImwMsaVrXJv2Qo3EbBxVRxdS2iTA654wAUz0YS3ESD+1+HNdfFgG5dN4Xtnwld/n+"
+    "qa2yWG7ri/tm1Rhl9fvChLr7+6SZYJFaQXZWngYLqi2sNK1O4LqiRBuGOCUPpj9tQf4y2n"
+    "K1ZsUlJW7E4r1n/5qF4te6aa+h8sSKUasy+QlAx/BtMamP6blLrm4VmW8Rc0marMf4Sy6k"
+    "11VzEs0SLuiy/79W8DxigLOTMhm99DrZfWrF1AJ13n+iO3CWoF5hK0DlStoQN0KWCYi6JO"
+    "TG43aE5tAY/a20gL28f2PInhyPKiRzE+BpX2LCrJ8bCEjxHLEyhP7i2b+/8ihyFBNhzAEv"
+    "gcS4mhD3IEz39gnkfiwIQHBTTVdIMiRDfT0g5XqWmWZ8Jn6mDGP49N1ZySKZ14sxm8gfT7"
+    "7cbvxyutiucvkmin728jwbRT6qq6aA4q8vuFItLnJ/T5Sc5hL0zTLOfgWp6Nf5tuNcs0I/"
+    "ea7NLdhuvtYAvEZm35qC3VYMlnA8ea1wbL2vKZTia25NPNsQYUS0Y+7mzi24/Ax9Def9Fc"
+    "iTMD5c2VJEvxsrmCT2GxioQ+QqMTWR8Ca6WUFBorA7qEiQuK4K4/R5vTqWfQKRd9AiODMj"
+    "uGGvpMhw/C0ERX1/SligKsEG4IdACmselQEHT0BTQp1aQsnhLjHBGiEa4nZrO3ZMBjYjAq"
+    "kuAcuAA7W4MnPBObooOLTuGt7kxDfwCtoGYKteu/OI/XPIBmrD/qU/iKLjwbFwGHLKTyDX"
+    "oeH8OwTpuejs1DMgy/SHWJs6QaWmMsuNLB2zdLarKYy/g3RlZd/Gux+M8wz/PgzdhH+Zso"
+    "g48hPOyHYLU+YG1Iw20Xhhtd6g50xmqrgKRQm8KJals6hUPACmZFWlZ6pXfslYYBSZsrru"
+    "4alYKXU2ItMb9TIcylaIzjAhrjOEtjhAFHjuHNqiCaEawF0+1uDN4sojNLFcQllkA0EGxn"
+    "K91EoL1tWQvFgpWNEgyyVQbxrLQcxnc8jMNC2PUE5Gl+74gktkdCR9N/p67u8bFM7/iY3z"
+    "k+ZvqG5Ez3lDOVcVp7UbHZ2IVg22U1Sy4t9opI3XTkR0XgIonX6j3ApaXClkFL27rXjYok"
+    "Qp74K22C0pm1AoDSMbMVx4x4M9yaKLYvOC6NZGwOKIFhMNPWD2Rcc+PGydJgplYiLyOamU"
+    "BqQBb9FQNQeRtpbC2ieRPs6iHVMT9P/QHEJYNDm4P3FmNDoy7+orc1MRqUd7dGaVvKuVvD"
+    "x7xj7kzmN80EbLKkL1mnawVZdL32VW0epZUhGpSdcP/llEyeCfpR9aVBg+Q1b8loTqPcML"
+    "pDoqwyY1N1mCc2njCGpW5dkpN4phlHBpLuxh/p2ZXobb94O0NIT0p5Ck4KPAUnWU+Babmi"
+    "cTk/gDQUaIlnYNvhozCS5DgIvhqWmkcPxIRSuN6jVNuQPb+5+3LZJ7eD/tnF8MLfAx7SX+"
+    "wmXoq21g/6vUsBkKvTj1lp6W+Rm7kllyydBLJiSzsJJM29Nq8oubDVuLAy/MLOdyY3iFyQ"
+    "G3F3RrZgZ3yZZ/G7bAWKJdheXoJdgaLITcST6QpZEgG5UlqU5QGOES5IrMzVRxpjVPCNuw"
+    "R32AaZgRee40a5gVWiUduFahqbpreYgBJ4MuYW47l/KWNuAg5IwKZ8T7lpGOK/So5lsxyL"
+    "TNK7duygTNIrN+xK80Pala+yYjPrUxm7ssIMLWNXNha70gpbs0EwiwNV6k2FVSFIpUnIbM"
+    "/sLLeZuvpG6gp7qC/CPcN8zzKmYCphcpYTi6d8Ig6Ihi77H/BcGJb1G3cfq5Hp2gVVmuFN"
+    "8VwZmNfhP92xyfdscKsUk/3iTd0EG3dR5STV77G9H0HSYL5NGkeWX6XNucKM1i2wObMYZw"
+    "eXEgcZJMTbFSm85ZMMfKRW3t8mkpce1x17XP1KQawtz12nXtMqZNXufvOivVqNJiVlRe76"
+    "MFNzulI1xuVkJe6+N7ZhKzFMzlM/d05NEYmlAhIL4hEzm+yDA32oaMVXfHpNQlKeVJM5qQ"
+    "q+XKkc7pmWkz4IoQ/Ch+nRmioVQ5Kzki2BeAvByWjEVQukDSVkFG0MwjXiaEXycrmx4+WG"
+    "TR91+qRUX3VkBFu8+DgulzepIG1SdvGB6KzUTVKisoc0ooestODJSLZkPt76koePJXhqJM"
+    "X8ncrkWRGn5H1h3Z6vRi7iiyDH00+dagFFuQpkG5ehRfsbgSJDi/a0YvMPK6sWWZQWa5er"
+    "sL68VjvMCtbSsCyh/QBLmGq5rTKCr7QBysjANQHc/hEtLQVNhlNuJxVYI9JYNRjT6nmstn"
+    "vsTYOhe/HcG+HCsPaG2Mr9omks0wvgEunUojXL9lpjcwHMLuEadRZT0WGx5Y6HXes42ODU"
+    "HoJ9tuxhsGIhtg3VBZGJ51LndGwS+J8+PSW3tr5Q7WfyQJ/5RRQ7JX5TxMt4JBE2NPI0tz"
+    "BqGIOA6ZQn+GLauVz8WPFTcsM+STXwleKK4seokwOXmngYLTQTl/7uvuGKuNJT0mP/Jdjk"
+    "35nsTCe865/EeUr+Ory5Jqwi/TOPeHH/Pi+cmHpPySj8GXt7fLpGbdMhB5q11DFVGu6q9f"
+    "X478QPIUEdV/hXVXF9ibY4mOvw3he3xP87yIuGiPNyEf0FL4sJ0lx1sQyKRWe5lgm8Fpzy"
+    "niTXMAC7S77H5wNxgei54vvZqzKueyV7RB78u/H9xDkH/+JYkhMSn3vw750JH/h9qmsunv"
+    "XmuL82eSIWgYgfXUz9p1n+bpJ3RAVp6n+3VMTL+Day46fPyKqEXFzkdYIWza5VRsikVEs8"
+    "efJEGungWclzJ1gOlhxfBJKvc5iR53ivzRHLs6dX4ODiHbAG8G5S6prWbctiKBiXmsQdxW"
+    "G+opi1a2AxQDNMUk7JbhGvlPj4BRNSbJAqSTNdqebzoWsdwtvjWdc8yYAz15dkQt0nSs0E"
+    "m0P4Axy2GZw9JctBra2R50nj1wVJ0lghf897XFN+zjOuCm+jbCbfWViAcRhREclb1MlbOA"
+    "6MTSutJ1OickHZsAVlWD9Vozaygq9obZSw9fmwXc3Yj8u8psCD5JHClU/Bs9Y7+K6loBWs"
+    "xKPZscbl5FWotHl4ll1WJnpYCX+uv1SrEcVg9ddeDGPd7WUEY/OBNA1F02MCwmF/RK7vLi"
+    "+bYNaUMWgqmjIVbJgBswjQ9Zu1CsjBxHLnZOLphnvIbk+J5jmutXiTNV1WVYQWy5fgBrdP"
+    "DnRHYWV1839GULlvTsfmIenBOurQ50fJ0zxtC+HZWfwmFsYALR3aALQTAm1Ph6ZAcOOhrq"
+    "mG8YwWkAYYkgPTcvEHLr0nqkPfoOyZauLlCdhN1hSjbKZdsMWwduAPyya8GU3hNe/hqYph"
+    "aQ90yl8UxYdQkKiabTlgmBlG4i0d/Noz9uWCb/2KVcQ/9sz/zslz8ivV6UJHLeIvfNRVcm"
+    "sZuvY8hG+lzEVvU0xGxUS+evjtHHhQOOFtSmj2pdkSYbLrbLHoY7hBKLjP4ZJWosyUvZbT"
+    "5qjUlv+jgi3/R9kt/zJT9ga3s8XGhgy2hZs0k4JyW2YGVn9IrYxqJCdBlQ7cV8G3ya2Xe1"
+    "Gxma2XQberSqNm5F4pi7r7wIb9Iwd363FuMLFV2ucs7uGS3xKMW5XprYwHhVNmyBmsmUw/"
+    "3xPfniab3EeIlIq+7uELCAInZ1oGxSaJ0BRb1RHwoOki3SIalFXVM8sxRsOmXOkwAa6BhB"
+    "r4tpj+/T3V3Hd8M43zbkAdy7M16rw7s0A0Z0dRLVqRMcQlG+5vmbKtSVoxf/g2w6eCpE9+"
+    "suMK0qyhT4ayJ7Hx02EUJGUvd0rGnd7l5c0/xh3kPsed8/71v8YdLOBvivL3EKm2rT7jJh"
+    "t/Qw+HAV6Qvp297ZLv41hw+ikfvsaAWOIyX2OPO78yItUO4Eg/IbhBlph1lW0aEj3k/3D9"
+    "iR1V/4VfMGL+GTxDC4H2H2JN/gNfzasnvAkVaFgzgO/A8jdkvclhTlMMqSQ5V1qX5pOcvF"
+    "FWoTkjibYSnaV4zgKaM81y+v02C2L+/p2YSA37d3Y3uW1tA084dlVBOSEkcS6DczR+VwE6"
+    "KSV3pJUAWrpGZKY/yUpKuvlVVmxoBmcChF7iVlgMVw0HFLaWPMhs/aoBDGTvWgnGJpmUWA"
+    "sRkCjJ9pPPn7D2Gue7XuZOLrFCM2FHqSQl+PwsQVJetAYWZGqZP7h8P4zPxvihUfmbX4Kw"
+    "1DSrJIiE4ltfMOZJXFiyADWyAHK9tBfTana9JN24a+bQTY09FVPpiqVfkztXbpBZAbQCH7"
+    "jc2LHuxo7McmJ9NAUetfaCmTNoyYCCbQcUbNK4iVl8AuMmaQ/mGzfM/qxm3JzrNroDfYMh"
+    "FiKBVgrqA9tj8rzEG+aMGxqCvTEraWFb+Q3DenKYvYPFDp0l1fT7lB8XfZWW5/LtL6hAZS"
+    "pAwVCzlphj0sJT7APRcvv+gxwj6SCmEqaQUFQaQdIIkkaQNIJkLGs7QJSWZKtznrUUtAJL"
+    "Up48QFuX9azBKK4Ugy5tcWmLv3pb/Av3s41U5+Hmkdq2PqUdgVEuKtYtss59/53igoRi+S"
+    "IlzXT/YQRlSSBL2EOy1nhRYTS6hy60OCe8w83vMHcFSoHdPlddotpUEER95tk2tH3jmVjo"
+    "sHS85dKywdSnJnwpvMK7qe7wv7iuLuh2Wa6+CSX0d5dC+5uOTXyohfZ48CKIE3Go67Kwan"
+    "yTOSX3nuvZNM+Ml9HImzXBWVMVgZcfjhwTqSceeeMYbv5AAd1RMMD4UeApeGkLeyS3xS3s"
+    "GwsulDvYJTvUlSGFr6Fiq4YUbnJFd647GAj1DZY4yXWB6H7hGm7KSyozLFraxcJkCFNPMD"
+    "zQd1kIUhSnvCrlBHFNN6BLqCnmclFJIAh2Aiyt+Fpurjqw/qLsICqTaq5QVXdsquiRYWs3"
+    "WH1NLBatZi1ZL+FrMtDl62V7yOLikfvGP6or3/2SttsZoEpwKpRc021uTRcinV2L6LNcAO"
+    "NSmyLsNgPkT8fHHz58Pn7/4dOPJx8/fz758X2IaPZWEbRfLr4huonhM7su4UBVzVWWlGrn"
+    "Rr6NLJ39dqdVO9YsKdWSTTlbQBNGbZbvUWFpFitaI1lhmVWr3XZeOOA2GFNYgkCnuHdXsA"
+    "dSojUYBM3aqdeg9X/w2aX8/tJkb7VlJ032Pa3YzH42bnJWjtNJi70mB7+M05E559rj7w97"
+    "qgw8EYxbWz4nLpYE6BFjC6JMT4LtxHiQ2sjCf0tWT3SofROdcAVVxN5fSTG2ya9hB8nRaV"
+    "goYGk5jhFXe2/ZrCYeKM7V2cOkw6ryC/h64tyXO7ctbzZPiWdpYWHbgetKmm38swxzPdTm"
+    "dOoZdNp/zEkiJy7YLcNlO4EMx6skqz2C2w9ORDUHSghXEqOrI5wIO4RadC7gWtqQ/86VxB"
+    "gGpLJNFQ1sfpU4z45LF8hnJ6lyZ2zywIflkqp2EIMw7jA0nXEHirFEUW/JaK47PKQCXgPa"
+    "K/zfYYUXIAsfNTbDAw09m1zhmwbbsdnpIP5zf3DSb0wuznM3bGd2IsQP9U5PAGyvdljHru"
+    "p6jtykUDubnuo8lXl1sXw9i70tYbtlgp3j5BjerAojnJRqJSP8sUyivI/5ifI+Zo8DSY4O"
+    "FeDMSm7PZxH1mU5d0B6XgfY4H9rjDLSS69oLSkRyXXtasRmuK76UKrkMiou8JnpGclwbPn"
+    "QV21UNjMxVoKd5CJalZBIGjtwMtHFycDfxeWc2feoISA12vVvEYWhBiZf4inxI5baCrRvN"
+    "4qQ5aG30TW+R6Z2ZFETbtTeEWHbObq6u+tej3uhmcEo0a4GMlOpa9tgcDXpnf+sPsFagd1"
+    "C4MoC1yaDfu8KLsGBxYRG14GR5I06FhO5lW4+06gF7cTEZCSTNvz20EqT5t6cVmzH/gsGs"
+    "crBDVvCVZiWRBrRMnSFTZ7QodYakGVakGWJD/vZaXXOzOWRnwCZxC7x1CsiFsNnmswthD9"
+    "kovfA9G4gSeYX5ajFw52cKxhaV0re/Od9+9dV+WlZuPtj15oM51TC6TzdXMcrTwrI6d1yd"
+    "MKvaq9nhSUlZkTuuyHvd1J35SjWZEpVVuesh1jLvdXuxGu2ZkpWVufPKXIgzAOafhRgTaU"
+    "mAXVGFbeIcRFd38zxfYkhDgZYAuoU97FCKjQDKzFKNKlhmBCWmGUx181F3VX4EeEV3YK4O"
+    "uaFdjDUbfrm7b1WoUyok0kkbYUnpdKYu4E0UutQda1rxuKN8BbX4eNrBj0in9p75PqVTe0"
+    "8rNuPU5pFGijZXTZMaFcc+kewrdW1naPeSGGbkpL82hWcN/rP1NjY3x42WaSwvOyKTfbQG"
+    "LIdM4Vmkr3FduyyawuGrql8yu1Mu2iGdWq5XON07d6t2e9pueln4pCzoYkLtNZEJ4r1bCs"
+    "TSUJ/XxoC5pW8jTW3FAu3XqeKAAbUmILdM05DyQONtDUgdvmXfxW3++BHkSXXI0qaHtmUY"
+    "/gntByjJ/sKN//A9CzLx7u+pzRZ8NQEZHIigON4kOBFxPUCjCZN949B/QMsaW6WYkTicwj"
+    "h3X+zGpCML/inZTbfdKOvtoiGLZFvWog5MBr7Cga9va3215ziWpqs8p3UyPQg50O+Jaj6v"
+    "2yVXiToKRvG84KPYKP9CDFJsZpE7nZpm6HQLQoi4i1qxVfOhAoApqVdqdfNjhClPMiHc0Z"
+    "nv6xHJttLdc1Jmv9dJ/navE5mZYj/JPsni7mnFyswUcmNNU4hauUVkxS0ickdS2R1JO9wV"
+    "wsz3POMssO1fsMwCPuHlhJnf4CGMSno3uLkiOp5/uWBrU8YgqYG5enR6xA9WYm/xJpsqcw"
+    "090gDcugHo2ZVi1Pzi7TwA6KRUcoqTguQUJ9nkFPE3ywCZH4uaEmuJ7bfteFRpC+6FySBt"
+    "wT2t2Gbagm2YkzNGTZV15osGUOAT2bT5s8O0+xWNn/qW5skYFMHyPBOkkr9E51EgsfgY6T"
+    "1pWkctWjxXPUWz3vMz9+DgeT8KqqIRkpRqydJ5C2jK4x1lojy5UO1IC+QVVWzGApEJv+Wh"
+    "dmvjWdbuqCFvdcqWo3WE5zZyAVRPpGRFYy22+UJgqSW3ZuSbacn9INJGa9rQ1W2sjbYXdo"
+    "V0cWzQxSGNtvqNNj+xvUJN/NKqeeMF0hLfF1NEsCh90eKlaqKISJFM2p+CHYBRrCU1lYVu"
+    "ei51lAm9h8V3hYVBkYrtGTuf3u96vRADlf7m6Ta0uqAp4lGuVZtxng7ZgnMGDv+9V8+RlF"
+    "bQktXFFlZr/igqOjW5QpMu0CIbdcqJkcJoxWVHkRq5/kgaJInz0+91wxVFs5Y7rylP1xbP"
+    "i1UNVpvpTYOXl6cEbo1NfjiTcnN9+a9T4ju/LNN4HpvXN9d9qArL5N+181NlOYhTz+aMmL"
+    "/GqLA+yVewvdXJ0XGDlieJFF+rjStiDXIULwB6pSO88zXIxUkmWwBGhbPVxULNYvzX4c11"
+    "DsY58imE70z49O9TXXO7xNAd99dG4l0ALyJQTDWlWaVu0pGGCtJUEzwdmr9SlN2ocCQRys"
+    "txJG3imFNrof+RtyLJs2viUq0cL+rfCbyEtkxhFKUG1dhywIblsWA1kT9c5GuQA0aJAUMG"
+    "v+xFjIQMftnTipXBL51NMMKqxp0QytK27nWjYlLmPPFXmiUlZGwnVsXspALJV4thsDpU/B"
+    "VNRSDF4q8ITRnctsHgtrzuXgOaQcq2L1Yz22ZZLAVjWTksEzNJTYBi/rvbSGOrQRXNtGWQ"
+    "TY2ItSAb6LwNVbYYWvGU0ZLo1gaNqklGo44MvFHUavvT8HqOOqMKi7hCXTXhcodaW4bKml"
+    "HQec7RmacbogzHV6r5PLLw35LDm58V/BvqWwXaHW4VZl+gpGK/099jY/uiUyXpyoy4bo6h"
+    "ZbPaeKDPMagZxv4AGVaYXySTNd+d25Y3m6fuBZUWVZdwpIXrSgb4P0tGwBekexUOKWXi4W"
+    "Xi15aGxUtqdy8YQEnt7mnFZlZK8oyflUZAmW9THozUvIORZPpN2uj0m9eWq9/rGjM4L61Z"
+    "R7BkThcpXDCbscKKYc3KLZg7oJdY98SBpvVOdV26WOIREnFlTjb/ZhmhsTk2R2h0Oxhhmr"
+    "hJ4OX1R2o/E1/Y4Xk7vamOkVdENadQZOLNZvCrZNbO72GDjy0eocz3TvAwlgffc/hF3/TC"
+    "tv6rXPjXvPCPgVsev6TQa5oM46N2ohcvoLFbVdpgjvRrBdOP9IZmmsUwP6ArKVVDENdqEf"
+    "t/ufdMFlBGJp5uwLjovMXH/m9n7Rlza7Fd6ZFX1JBL7J7Iatleg86G6Xdu+9fnF9ff4N7Y"
+    "HPavR6fkaGx+7V1c9s+hpY7NQX80+Bcr8CE9cRY2+w/Hnz+FLR5/FDX24VXv8lLQ4m3bsq"
+    "HnOwE7ncQ7fyN9RrAl8aHb3kpvUxdaomZ5IvMkPzoiKbXL5ruzwViygXtBGmXZQLQCVqjV"
+    "mFgNVdqskadBNRh8tiR0979vClzfko9cl4+UPFp7eLShN4lDUEioJcp2SzNrTkysJMWGVU"
+    "/icsS1CLMyX+LZSksi2YaFHaKpZiAxoVjcWVINS/pyrPUzhk2bW5ZDydx6wmJQmKukU9A2"
+    "tBaUC0BZm5IlqLZM1SAH9O3sbdc/YCdMJ8DoO2wfb7rEQoKOSY3NeHjn4ZM+pYF87Ihaf3"
+    "VHdJNA8dxDeiJ+L0kU5VAeiYjbX3O5wijDVZoVzN5MB/HGbksGcSXjYGUG8WXSoFFsYudu"
+    "2B8ot/3B1cVweHFzrYAVev0N6YKj9+/H5s3gW+/64t+9Ed666uMmUKV3fs7ohLz7g/7VzS"
+    "+8xFGqhOg5x++Px+bo5m5w3bvqX4+Us0EfVidw4wM+IHYD1hsD/8ZR4kb/+pxfTiq6uz0P"
+    "FH0Ym1e90dnPyvDs5/75HaNDPqJ6fnXQT1w/Cq6f3VzdXvZH/OpxeLV3fda/9MtGmvuj0c"
+    "X1t6EyvPtydTHyhT6OzUHvrJ+4ePTev9i7vR1wpD4eHfnXBv2/9s/8cvDEy4tf4BrTEHvD"
+    "o5P4ncHNzZVyc9u/5vc+JaQCzD4efY5f/3pxfTH8md/4MX4j/nFHP41NqI1/xF/0+L1/La"
+    "zlj8fw7hfXv1yM8O3P+hfs6gmi61/tnZ31b0f8arxs8KUniK1/tf/P24sBv7h9iqosw/1y"
+    "H28m2905vxie3QzOlfMrxgz2r3oXl4wY/Ef/y883N38D5GCCvRpCrW4dfJkJsv7d+JLY2g"
+    "vjWbIie1qxDdzB3M4NjpJZWgE0ySzVwCzl9d4a0Ku4l7a52+lqOCdikzRdHOevsOzxbPrV"
+    "UIVhb3lFu0UkXeLz77mUcg9iJUk6/0EERRidxfLYQcW8m+oO/4sk6KyQV/MfJqDvatCJxF"
+    "7PMKwnhwzvwLLvnV9dXDNaj+cbeqTGM1dLiTp9xLY+DaXZM+MPcLpjc2kzbgSffXdBNMNz"
+    "XWpnSxJ3rroEU0AisUcmqpP+VCFJl+mdfk3gVqUsDVdYGjm3+AW4H+QWlIRb3YRbCugVrP"
+    "GUhl1b4UHf06fY2OF77O0H46yUS7NJ+TM7/5izvg2Dge4EvZ/An/5LsmEDCpB0R26Kbe6/"
+    "5womXFKySREKWCkmQz2okCc1qpEDlCH6PdE824amD+M3n2zo9M3aNdMkQ69UYINpCXMD58"
+    "fBhQK7jX/r3LC/VBY3j/66ieW55Gn+LKrzd0EFr1+/mwiZk/zYXtAokh/b04rN8GPB1Dd5"
+    "rsbwZOR2y411YgbT09wKZ8jYzFlpSVgbd7Z7/nH/uDSZYa2zJi0kHgG2x082r9+XhTgz7i"
+    "UAHvZH5Pru8rIJxNuF+chNpULOzS/VLUu36VH5F2k2rpvg4VXMePyPpZt8y2fChsxyaVUE"
+    "Za6XrfNHlQ+yWOfYiu2jl8hCf/S+TBp6KJWbh57dk5EZm2Z/sNY8p9LhQHGR1+vadSrvcE"
+    "sKvcoNbvT3pQ422CpcY0KySVzjq9wNJQmrveA1JGG1pxWbIayCbleVsMrIvSYyRTJSkpFq"
+    "DyMVddXtMVINxjAzcjU11GtAATrH7bxAOQXFuqVDvGwuUTK66wq1ZYKc+N5D/CPQluWdSk"
+    "smt2D6lxnpGJa17olJn1IRWeRprmtzsvCg9ISOTfh+23qkUzJ5Jmo86GtC4S1oJtwCwzH8"
+    "5sCjxVx49wkeaXs6Ngn8T5+ekltbX6j2M3mgz/wi1sUp8WGHhyU04k1eLAbjKYlXWPwOL2"
+    "oHuqBRnhK2cxXZ1/By5sW5GE/qE76K/5scLKk5hSrokgCPLqj6D9VA05vggY86ffKfl+J8"
+    "g3vsof4rxKUU5laHT0q62e9taxHI2unPUt1TEoZeBPWLbngf/dRb5RYPSpRjKr934sBib2"
+    "eBcfFcdvFXlKFxtVOb7L8Z5PKpzaD89k73FrtBCjp3Sb9n6iTvckd5F53lnWE946+cgTg/"
+    "SicltutYnZxxsZnhOHm52Aq4+ry8axts0h1//O/ktmsSvdbuD6WPzypVGnJabtctuWA6bG"
+    "ZrTsx9GeCLSZ20rKR1GsbXxdZS1es2ISo5dcmpyz4qOXVZsWU59bTVmancgmSnGcldbwYq"
+    "wUaUXEfWfepuxGFUBTkt2KxgWxEBsz2IC2j5eOtsI5VcX1suyzUL+nOJ00+j9rk9lBvYms"
+    "uDnO7PTWX0Oy9Q+eU5/FLUff5ULKM8XxkVut0oz+OTkzIs0clJPk2E9/aP76zFft0EFyRD"
+    "aGVyM2nedaTd/ooqNjzXO7MWFK8SowagOs+mpvzmqQbLjrHmgfE91Pb3QFkzKz1vLZ7oF+"
+    "wQuvD8vDUAQT3+oX1NnZmLkbBhylwThESID6hrcbtgOcqWlqFr+rqooDV7i5qeW4xH9jT5"
+    "1QE557q+oao9gCRMi6/wDPq1gDMMlPYfW3eabSr+AObehaLNVdP02YHVwRkyZWdcV4tBic"
+    "5DWBOQth54nM7aU3DgxurgFB3/0c45OpPosJ65OpV1saXNiO9LrxGWaGN8SxFZ0MVk7aV+"
+    "HJErprDFiCypvdAdZ/2xJY7Kbai0zciASUpdBX86S1Vbtx/dMnXXgbatenMSAZrWEzyVHP"
+    "gR/ST6vmrp8V6wnUChYlvWQlna1r2+tiE1AH0DUHfLtbW4WSEytvJI7ej0qvWhsX+J6Ws5"
+    "OEiaKRNr3YXgwFf1xXLbu3UsaTiEZpWrOg/rGg6BshHoau/6D4ZUzORc49w15Bpb1k625f"
+    "z21zsvuMCjVVE5R/giKi/d4TU2l027wzEH1UoulISg9KBI15is2Fdx7s8uqlMe/CNTQ+wa"
+    "z42mhpDHKNG1D+hOen0V1XEAuxrcEdlVcQvdwGsaFyXJxivVfB5Z+O8K3X49xnHT6/CCBs"
+    "y+RSmwpZJfZmOLgwWWiNC2bFYdeP5MaiiJcPe7R1h3gsJcpV/QnduWN5vnlBE/I7f/wXUl"
+    "UzV/lrY9Y0i8YH8mMStngybfX9qhTVtOdAvs0Fj7rhqhLRDdcd6K8qhuPimvDNeW58JIM1"
+    "vyJ6+yYiV/UtfcLamANh5nWyJsZi2bbfXYmSbba9FXpW21tPWbb68lTLAiWy1j2G3UXgvJ"
+    "gFxzLR3kIrDTBHEw+QaaMAanSrZLriAW5FKU4DJbGPNJhq/qEBUPIsbjgG3425ymDwy2yF"
+    "x9ZAkqdRvDbAhMAOyQYsz1aN37+p23pK9q8+gxLF/mhLLAHJb1kurszFGVPQkekj7jZWwe"
+    "TDwXc1SRieXO31ROe3nHOlLsDaJDYskBfTt722WPxvvEDxPC80r8vJNT3Vka6rPCdf3sQW"
+    "s4vLd1ak75WZt4MzeFZpBgK3YV04LivvLwdbgcvkFMgGMRxS5B+3V4qq4ogIkLxqGKKUgk"
+    "AcwPgvLBc5SlNzF0jeWw9I+AjSOG1a+7TlCnRLUp4RIAwqPu6NCCuaposR7LhxkpyiTQjN"
+    "aAueUN1XEJdBessdJpNAN29FdMmZmeXdjF8KNlEk25c5zn2igaKNiQkB5Od0dVxEalKkCn"
+    "5XadtbRgPF0Fa5m1NDcoNsz1GLbuxucujUboDOwv7fCP5Ha9wz88VD02rDiZyXPtCpBJAC"
+    "Sh05VM3Wuo2AYydQ3dvNH+aKj6gL0rYVFuD9UCjnS7AT5NBLi2CKC8QWL71HNDB4gt0tMb"
+    "2ISYIhd3tA+xE74AcjcOJbHvw+NcYJHrWutVh2Cn4tr7pcyptdD/oDYHcatNOA6YHpBqZE"
+    "INy5wxYvUA5RhJOzOsCQwh/jevu2dxk/tm8hvjy7R42QimNEGupLrSOlx5vNlWoc0Tcoya"
+    "RtrciRVggxSrVxwwZtDCfAq067OfXcav8tFkbMa7D8hYzHjkLPyTDg3G9Cn38AEVCXEmc0"
+    "pGc5r5ljgVjfcZCz2hePD6zFZNTD4bezuf8FVNhX9ORB4zOeT5+Y2QNmbvrjvpB6IKjoRA"
+    "Bb9RRgUHUKCC33hRhYi5jj6XUdE+CgXUdUqgDHf9vRM1aD63hOR1htZOlGQ0dqKsJLFrJL"
+    "Gjll2Rf0oKbpGAyhn0zoQ9MWxKjeKewqFgBcwjwWZgnh26Gou5v5Stjnkk2AzMs2N9MzGX"
+    "HOs+UHGSY93Tis0mKUst0Uoup9Jiuz4apT5bvf3cao2wMu4vMJEyyDaCVk1Mg2uSf9WzOz"
+    "WyCZdl/9KdeH83qdbSkLewgXWTRFY6+ZaAvhLk58onrcTJwV6mqgbUc1AHASDv9Zlnc8rb"
+    "V8K4KHyPESwGCD6D4DME1NUaeoRkRdqRwLBJMxWSjFhpOmxqRN22t/fJ01jatr0PpjLbxU"
+    "FcFZwAltvBU1LbW8Ydney6q8eyQWMKQENf6AKTMRe5pND2gDv+2BzgHJYOHJ6o4CFtuk0F"
+    "c0shgSVWsHMiq45OXiNXxcxi1lMrwpsU3HUgZtNQRTchgLXIy7tSiGxGWKKbQHeuT+mq4G"
+    "Zk5YAgarpLmzLTRpuLuM4SzTetQDZhAcoLfboeymkFEmUByiYgAr0deY/VkRYpkWind3QE"
+    "L1wN4aSgHJClN3EPnU7Sm7inFdvAHRu7qE6ZW2UTFN92g9cN/ZEq9voHxCRPEL0ErYMtnx"
+    "OzNs5JEm8nR7o1CIxNu+SSh77kOOUyJ8MUu+UEJ9OU8MuhIIkLpjxr99kcJgKv3CpaMND7"
+    "nN7rJnWIz1iyFscK8xBx14I7GoX+RFRfPZ0yv55NMNkvRsT5Z0yCujsms/AclydzUYmhmw"
+    "8gEHgE385mRNU0yzNdFqS+oNQlC93UF97C9xbG3qO805CdI+oPRiwHsSDaWfoQV5gguwU+"
+    "xDjoqQFKn+UCGJfa1FJjM0D+dHz84cPn4/cfPv148vHz55Mf34eIZm8VQfvl4huim1gsZq"
+    "2woB1XQjcm1LJ13C7QreoFTwhJV3gs5NulM8sWnm391+HNdV68d1wqBeedCZ/5faprbhcm"
+    "Ecf9dVPgdv5y75kszRiZwNDk6qbzFh/4v521VzUihBGOYm952jHeTVqLqCDtLfdn0LyFdO"
+    "5okZHb3pjRIIc5W44osOa5p3pl705WWLKJIninv60ELBeTkGZ4b7ApYFFenfaO5KQvQZLe"
+    "+8eNStJ7TytWkt51rX0k6b1j0pvtVKjxEGuk3dp+kPUm+V4xPgLONxfIfN6X1eXK5O+FOd"
+    "Uf9annp2j+wfGp1QSRC73M9QQ7MaoII9U7gtsPDnny81n4GbLnqkMmlJoRu4vEbGzPDuN5"
+    "86nYxxRUbK+S5F43zL3CSj6or+o2QFxSmlZJMyDAZoXlYkq0hvVis/Z5NGh5GHx24cKfxy"
+    "kijVBhjEkKbW9Z+H7XY02KGvcngIqDS1pUji750K4wwgjE5Siz41EGU3Ip2pxqDytVqUBc"
+    "VmljqlShtm0Jtt7nb+8Uyco9nvIIx/0l5iTjuqcVm2Fc25xTZ2er6Tg/Ug08geRrArGApk"
+    "5zTmvS1C3nTrsprlrQbvY3xVDt6DU4jRDOeV8st5MTrRzc7r4Up8ySPUwst0KEMkvnAyLJ"
+    "qGJxHHJOWaSghy40KIfc9Dx3foxJZNmJaPBYFnIcvBtGCaO87jc3pK/hw/g5gX4K8wM8wD"
+    "HulTl0NGtJp28Inu7oHwqpOg60XqSxreRxk3l0tqStN0tb+yF/gpwu+UGXcZndHugXNu7g"
+    "ldjBnsGhnz+ohusu7R/gL2fxx4cfVjrd76TMgXMn+efNnWSOm9MMHfqYcOVRgHlcaNeH+g"
+    "WjBXsncnG+Cq6bCXvlKDkUBjKBqfMivJFgsyCO3qsRMLc0V1nna3AMJb4Qm+DYOQETqznQ"
+    "7kMOs47oWORyCG+b8dqLuM1OdKYzb814ACU18TnTtWGvM2ePCp0P1vKaAcvAKuNHRnB7A0"
+    "lnqM5VXGb8zN+hk0X/lr0MYS8XH1n8bJv+y4eLkt7laHQ7iKnE9cnwKnPh3x/il1Zau2xk"
+    "hOLxK8LVdt/0FhmzNJ0P0BfepSO3c+bZNs6rgJ7JT7Qn0ZuVXpR/OP78KVyP44+ipfjwqn"
+    "d5KUpxh49VFtRxwMysMuRnJXc86vemU90f9/m7gbkIPWHhn+RmE+Z+IbEXbt58wJ1FvFWs"
+    "4T1MKWiS/7CD9hLUz2JJrHt+fJHjaWDSO/eeEesQ69dPg6j08k5Gv1dxf+GK1S/Q0fQWwP"
+    "sre+PXV/HS7bkX3jHp9tzTig3D0TPc/ktx/a8+aUvu9hxOxNeATMzP0d7NJQmcuGHPTnSo"
+    "CRs8SmKrMzxUBmGOKzzZk7ECtv8KDd0QkteKih1r6QZXzsmmJBxP5TxuvbC74JpJJQmvmm"
+    "u9nA6oqoLYQbOJ18WynkOJs6Qa+pRR3gkIBx3+jUa8dyyJQP4+EZ/2TOwwk9tENr9NZN8I"
+    "x2gqQd4xesum0I6Bz3mFZWBKVK4D5QJfVuwW4hpxlq40w0QCrykgT26+32xUo79CqiGYMR"
+    "YJ1jwUywbiRZ3s5ehFmbcgB8Qa8hZswxBjJmuB9RWYtCVMrtCQLmFmscWj4LhCgUGVWzS2"
+    "sx55bYoGl7WkZvzwQwIrWBPMMPyFq1afyEUv1X8sHVZ83bHJjbTgYzHrqmVPY4V9JaGjF+"
+    "7c66buzLkeDVu0YTBVrEwozyt7yl90zi5olrc0KDfTCYL0gJb7vQ2/rlRXm3cJO4ICLp6O"
+    "zUPyhbouy/cK9w39nmrPMEVzi58lasUytzZ9xFhO9L0BAPZyrmLgJZPBKDkHC/VVRwdF0E"
+    "nsZ3wi2qYcWIYTFsGPPwzNzQV1VTRuAFpYGHA3ngzb3LoZiRVYJYIiKL/bcM2vcDVqgKkw"
+    "zXcamLGHU2hEh0fHHz42KOKhGTGyq7OB2SjZVIBsQwJj2Rm61TPAxoR2jjS2bRYCZIFZFs"
+    "Lc2JadF8tTMJDkBfBsO9okCOFhU6/vvz7Aab5L4J8pANsluolHMqNZ6nTDubkbzcwNafd7"
+    "6X/usMURG+yfVMECqyT0+0JxvBLuqnMZCyfh7/nKKnrnXFYzvIh101sLtIKq4RgXqQXJVZ"
+    "e9PcexNJ0Nf5F7jrDXIwc6WFzmc9mZaP/4rmY01zUpsGF/RK7vLi+rsTap1p2F/sakIwv+"
+    "KQn8VaClde26LPzxLl2mAtakwsyptdD/oPYtTAY0Z5dvqky3mBILSuPZuFC8JC12haqYkx"
+    "9ZF2zekSbia8oyZKWkkIPir8438+Jm68Ngsfav3tVlcs9wsC041AOCLqhGRaM5fWY6fIoT"
+    "FEBNWswecpYYi0AOWIJLy07ENBDrCdaDb3jIgwuvP/Fc6pyOTQL/06en5NbWFypYrQ/0mV"
+    "8MNZ6S6+BP3uP5Z5EJNSx4KWiWXAAfe0pwKzx5mlvhYhRpOV/igIVQBMQbK2DZb7h09Lmn"
+    "JKpwgr2PHHATukucBf7/jw9dYlku/Kau9vZN9Lr86Yf3gh1o0TvwHkmedPgWM/rK/xu9gK"
+    "8x1j5OiWi3FRJ5T3PVjaufWtTh4kGlnYY17GLPhWU6nmVBDlAIGiTmMfVlE43AfwndUZbe"
+    "xNC1UxLFA4RPg8p41B0dWj4LbzF4SlT/BSK75TQiUX3BmLXgV1643BUXZhHM0NvCDJrCaJ"
+    "cQzeBQqhBT/MW6dTr4pVAIyn5PKQkSFbBbITqiktHjJCtaIyuaBLk0g5SQ2jmF9PIAw4aW"
+    "ZlAXbd0JnByM/cEkeLmqsB69L4MrlMoFlt3b543AwRTU9P3AwcyYhTz/1Ky4zK7OzBLDz2"
+    "b3aAZnkzyuBTGlOJ/r166FjZyeFc2dmWp4KUgyktt5ptvOL4L1z9qAywN2ZPRc9zVSy6+v"
+    "YjNUctocKWkhpMV2TCu/ZLKTA5RjxrGfWswnK7ZIku5Lks1OAefRCMo5bJs1EM+cx7qOa9"
+    "ybRl2WIU339f3NM7l+0y6L6RoJKOVWVOEWyyWu4qeKQ+l0TTRumaYh5czf1ro7H2pYi8OP"
+    "YDxk+HAet1mPB2Sjuy6H2pxOPcBvpDoPHYF7I1mgW+TbcIKiigtlSzo2Qv0EhQhTm3VkCE"
+    "uht2BAWXc30XfB77nIefu5RqFKNQ+rAy6Fb4cuCWo/wuugGyIMa8XVLPNh4LsHCnj+UsHu"
+    "THKQzHPqa3lDotE9UeJ/ri2TooPjC55nfaib7GW5wwVaGobDwHuBiT6l7Kwvw1Kn/nu7qu"
+    "16yy7B5Kq+6Q4lkQGdqE7uIWAZIlsQdR7tKGQEtUl/dxXbM/2lf+yupKlXWkDm09QtJU3L"
+    "4yfTJG5iSt0aCYqDEwdF1L1fTvKWkN+1AdT/J1jcl33l8ubbKXkPc0bvjJnxys1t/1oZ3N"
+    "xcnZKjsXl22e9d390qo5u7wXXvqn89Uu6GvW99aL9jszf81/VZ/BYquLkbKaDi/OIaFH8o"
+    "KHRxrdwObr4N+sPhKfkoKDg8uxn0lbPe5dndZW90cXN9Sk6CYpcXv/QVfGf2vqfk09gc3v"
+    "b75996V/Bg5eLq9mYwOiWfoy+4vYTSP99cnvcH8An9ATz0x9hn395cXkbfDjd/Ao2gEG7c"
+    "XCqD/teLy0t0aYDCu+EI0fnpp0qWYi1Z8fzpep1WmNGx65YIn9kf/NK75O1tgNUMbevmus"
+    "9aCmC1dZiDtRDmPbZM0VI8fzoXiO6WV9rZzlvNho+mv+NS1BHORwW7RLKiLZmTtrE5IbIo"
+    "dNGCqZjJzko3KQdfLXN/g8jr4LML3RJsXcAjiar4V1Niu3Kxdv5y75k8V+wEzTjddN7iY/"
+    "+3s5Ha3ZRjtf3ZZ+pAt0YvKkv5GRnOVcaolKgcoHY8QKU4kCpVmRKVVdmEZL5YH9W3OApE"
+    "W7koqz/aL0RmtUNYE5ItgXTb3IuMydmL0A0Zk7OnFZtxZQbdbvJcLUYkI/dK2ZPd5y1rJ4"
+    "YFMTW7zb3VnJCD7qqpt8T9uwYoSwbJNBfCzKjVpNxlsVgQQSxDMlKkIJABSihLn9QokbIM"
+    "Q44Oo9iPxN5IFhmiu2xDsoUhBZqhwhw9FaQzW0kNO8EVg2hYKAGPqiGTZ3IQiXfD3X7KXH"
+    "Xmb96SEQta4dcIXiO6MzY1a7H0wuAVDGyhv8OHRyU9h8dC2JZhhIEvoN0idMrfTR2bftwb"
+    "Tph47o+mGsYzxi0sHWIZU/9jHP6MCUUhPB4L84J4Lt8Ayj93oT7jd6I2+xFfyrKJGoVr+H"
+    "uMETJ8naCASbwlfAeoHZusCIvIMOi9Szwz1KXzHYTQ3uAdvPt7eCuufmktPUMN9sa+JTfQ"
+    "lwEYjjUsv3BPYyLqB36b9BHko48g6gy6T+m4jOTes0RN4YXo2TxII77/OX5PhmistAqROw"
+    "mbs5Mw0/bLgp4R3DXuw597h8cnn3ALNo4UmmpaJo6E0VBafudVEvVPH0ug/uljLup4KxXb"
+    "bhtVsPaLtzMQ6aTUNs2Tgm2aJ9ltmtjoKh7lHBNpJ5Ab8fYuqb1QDd18qAJlQqgljOIWGq"
+    "WztHQ8L7Vi706JSTz3c1fwML2iDx4dLmzLzU3bdl4HqYer1EJcpoZaaJT/YSMg+wAgQyI6"
+    "/SrXdsjI7Tra7mfrieDmK9+UdamNeQj852PeHct6wAyhZKEbUP1RFNsOAsgiSy4D+As+n4"
+    "Rkk5zOnTBTT7g/JmYk881wuEHmUdXZs6ttk2m636CUi1q6+vbCI5St2Cbkqly947IsgnwX"
+    "a9h1U0RbtJc1RaTtaIc2J+yqIZ6Q2THkte8m3LCDKdpku6Y/RJQ+sb2ol3WiJJreyx6onO"
+    "SglcFeNT1oo4eSspjnZg7dsc/qG9su6ptkHYHbKlmgW+S54ltPlbjl+bL/iusnoNXQNb67"
+    "NeQpo1xRD/T58FE1PEqWqm4Lko2upqZ8yk/445Tc8fyYvmK89k6f4hk3ALY9NpnmU+JjRf"
+    "iDDqKn87cVpdD82YMKOsQVCWKZTqTpRg6zgsyX3DnEnuzvH0Z96I0zLfNQnS50syj7ZSBb"
+    "Lv1lvHSZ/Jcpx5P0F6204sj3F0FTrMK0+cV3ehpPk8hf1lWzAObHk4YCbWHQtx1HKjdIbx"
+    "Dc/chP2LB9NJIO2VM6REY+70XFhtmIMrbR9q2meEhqge0kKlZoQSUiRKvZUTeijECRDcQS"
+    "E1mP1LbBYsGoNHRJmNMgXVB4jELGsKpJb3lLK47BKfFZBryNrsL428QMs6HQIgsPNFjS5I"
+    "kPbzZjq+3MuvqeCbnGBX76OAFpdO2R0ZWdOKTV1bzJV1pdewSuNBD2Yh0pDYQ9rdjM1sjd"
+    "b+3bwbS9z1v7tg9n7Vv7dmOvRjmbmUs0iMDsCGzWvKLdIrs1Si6tcEdnNds1jAh1vMlCZ6"
+    "nI/C1R6XMdBcl5y8uy3Wpo4TlkaajP1D5kMi7f76bFdqUxf3BKnDpvyS0TYwl6xyYXjoQM"
+    "/SE8F86Bmme5mrpE88Cq5NtgLPbFTpedQMjcdjN4AO59i51uRyYUHs+CYXXb32k2oTNM94"
+    "Rb55zYa+KmO+bxRN82GI9jE61H9ins4Gs9NDbZt39RMeAWnjBU56pjq/MvlvuDQ6Ia/4aH"
+    "ArLq7RIwb5eu7yTH8lD2+AdnbC6gW+mHYOOreGKfrc11F77Us3NzAX+PAgjwaxXTW0zw/D"
+    "ppnW7WOo2DnQFwuFANIz+YNim6vVDao7XhrCX75z6F2zc20jsceys6sRJyMhecGNMVbJm0"
+    "rLRmpJkqK3Ybp2pZLhXMNfl0XSggibq88IhH1RCtG1+KjgjF5LySZur1KTduK6feE8nKhi"
+    "tsuL4tV7HdxqRkTI8Q0BWmzKRkk3a21dJ6GzRDltqrtostTbtY5NS8MSla01dNDyiQfE0g"
+    "FlDg294OszsqoIZNLXmNsQb8tn7gY+3wCfpYM50Gd47K+lSBs4AX6ZZ0Enhh6Rd9AyO4/c"
+    "DOLv/BiXPyqqZRhzP1NtXwSuzmXMdIruest2AtbeVj2PABpyQ8IJRr908IjRTzstHv0xgV"
+    "zwPrMAAsEOalWSLr4BII4LmBrrpY4j6hBUy6wevzItmIOgXfN+52Ixfn4fa32DcfTKlpse"
+    "Q2f/hOgCW17/EKdMo3Ar0ol9KMl0opirUMriaGQwkluY6H4GjZSH/G7fA9frpqAlyZ1a52"
+    "l0QS34or8ozwdnisuiHeWxqrFdEWTVxr5oJY9ZxOoXBbQiW3EG+ammaqQCsQlcCKgK3U8T"
+    "Nyr7Xbx9YgJaGLScjItACQRlmVO4pEizWMl03y2MJ4fehGCWXN67RlEcyMSk0yyln7FFji"
+    "QbvNN7+xYZSMx2OGK1MB5qR/xD3uRzrXHc2yp4ewDJzjJY1lqmGKs6b2KkrKW9hTroWZs7"
+    "5GpgPNWX/bV5cE7Y1bjIaq0TnPAs+e9iapCa9x6zOuz2QBevFy+F94G93ENH5R4cRlNFjh"
+    "k/mnTZ7DQvBZ8AlLl70QZryHtdpEN3T3OfUy6iPYUDHt/DfLlp8sSBeqbkTl2E8Ca3Y7tP"
+    "5Dlcx0Agv5gZpgqPcA/uOA92AX2UsFinq3Fzw3DkuOl9Rk03tQP0+p8q9W1MVK4xG0Ogiz"
+    "XXC9+CuxG5xNcEOqI60LAx7xLmsMA/iBrMjb2Sy/QaQFeb2nRTn1kCdTDs+4ThEOobqyoJ"
+    "ZWWAey7pPOGd5TMmJ/vgipL+HTOJEMx9KwnqitqU6uHDQLDM1NyvsXfSoIrs2Jpi51F+kg"
+    "lQfZirWVqyL/KSIwfT1l6+ZlTXVUShKjO85lanMLBtgUVDC8Gw7BiQf3zqYHOsx/aVosgN"
+    "nXvLQt0/JMJ9QaXCAHPHRZNfySztx6UqLiYRYiK3yDUJTVF7KLPusajaiYPZtHbPtcaXSB"
+    "GPSRGmG2I374azzbEVeHlQkPYSdj8DJRgqRouIeGBNM8fi7LkoRlM7NBECjN864Nl5ROv6"
+    "l4kgfRF0vL9rlaB6/P2HXWKeLleEj5O9DzFHCqmSknU5fxzcI9/1vYtUQTyG4VvsRdwfxC"
+    "vNjYPIvWPP70eRibK1lmKMs02OEm13eXlwhKEiyEB+EKhEcIGTUdD8PmoT1hVinD/5q5+k"
+    "gBy2Ccvzjvkqe5DvNtTJ/DzlKBdpbD0sow8M1yrlHlC8JK9FkuhEm5WhJUbgnKn46PP3z4"
+    "fPz+w6cfTz5+/nzy4/sQ0+ytInC/XHxDfBM8SNZ2Tw+rVWglkazklTLQJtbWq+CbUdCSAL"
+    "QkxmVOX8k/fCVz9krS1lgF1kiylXhutM0yS2wVUENBiWmmpcbW81VCUPPkW4Lw1rNIiOz8"
+    "VfDOKJCAFwKetg6rusiL9MgQ1h2HsMZYqirTQkqslh60BxlbE9TdSniutd7ey2lWSG1WGf"
+    "dzFbQE422P+2LydyXE5VRbEfJ159pCRXKy3fFkGzouKgX5xIXkRJtAsnLAVFKsJaPR9vCM"
+    "O3FWwDUtLvFN4bvqEiZHvCX4bns2FflHV0BbLl4qwb3u0qVAjVy47Hjhsuq8ICeE3IO9/U"
+    "CEKmjGZVqJ5FGpY6iPCo6hPhIcQx0P+hB4kwuzNqVlZaqC7PnzPPYli+yF6fZNb5GJw022"
+    "2YSC7UXSv88g27kb9gdwY2xe3Zz3B73RzQAPRh+bvfOri2vWOMfm8O4WbvELx+/fd8o18v"
+    "qSvIVRRRUbckJOpolJpdvQFfxuxdAXuqtAi1QWuum5Aoxz404Kdez2nNQtx/Qkz3uKIqqq"
+    "N9iUsBx6U/NaIqqvQlvNCr7SBipT4+/Fnt6sOSJzDu5FxVY9Oys5pTOiQLTg92W//m1AjT"
+    "CHu3hzWG+pjwJ2p3kVnbc1LLm6cZ5NTfnNUw12upSielNYoBiWKFFwJWhQ798DtT3UemnN"
+    "GjlvVMAJ/WOKTR91+lQrPrj/pe3YRG0IUdoFPI3tY3X1qdb3IhuW9IoK9vzMxK2ojrJQpy"
+    "JbtQIo8eQ8VxSzuw/gIe2FKFg7IlRrtpc4NO0GhbWbpWXomk4dxYdoPXAQkFvU+NxeWNi2"
+    "+HphwS1rbYdlqttUc0NgtghIU2cgQzcfYEyZeTquhdfCw98X9w1VtRgRdbm0rUfABLc2ro"
+    "fIma+hnZ0Fv19ZsInTmevLNVtHSSya2ip47k++6XVNJFgm1NtIU0sRieUNqQWWKJ9K+7Ex"
+    "LTySWeOpydZf3l/H1JVb5bcCGMebhE+qEaFhTG2LobqHNZtnU+XeUGeOQk183TWXcPFl/1"
+    "eu/ito3+YU1YkcoSxXrP9dLMWB/8XlfKOVTCbdfNSFp46sit4FU9ji1pVInmhTeDfHrdOo"
+    "5Bq3ClAnTEDsf4/frNKHeNZleTKyDxoX6N8pghvrm8EXMhTt6H020ARrBI5TPS3umvxMTR"
+    "ba5izXJ0xvmbrrQNtWGxTrkdYTPI0c+GmsHUyrQ6KPe1Njiwq1KlF0UL3o3SaijrY8tM1s"
+    "1fQHNYeS1CfWNarBR9rKI7XD5VQNLAmy9PYvMZ0t7p3BkoL30jXBGajmlB+Wy9vZjubLIB"
+    "kUjvPL8EVqBsxVnYc14Rpqczr1YLk4Al3tJVZilnNwjqoSHedcmxmdOdC6pT1OdJBGHfiE"
+    "Z3i0CBeMYdhUrtUeDNAaRlNnsq36d7pF+VbVqMxLCVfzYZAJ07aeMA2menEUdv52gZiIzN"
+    "4V9xtUAdEv3k4AN7LfAp7oClNz5x9DHhORp5Cnw+aCU8grBMLVP738+f8BBtsr0Q=="
+)
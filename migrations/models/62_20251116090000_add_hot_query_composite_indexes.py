@@ -0,0 +1,366 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `match` ADD INDEX `idx_match_tournam_362f15` (`tournament_id`, `finished_at`, `scheduled_at`);
+        ALTER TABLE `match` ADD INDEX `idx_match_finishe_86dc83` (`finished_at`, `scheduled_at`);
+        ALTER TABLE `async_qualifier_races` ADD INDEX `idx_async_quali_tournam_07849c` (`tournament_id`, `user_id`, `status`);
+        ALTER TABLE `async_qualifier_races` ADD INDEX `idx_async_quali_permali_120214` (`permalink_id`, `status`, `reattempted`);
+        ALTER TABLE `async_qualifier_races` ADD INDEX `idx_async_quali_tournam_b1204a` (`tournament_id`, `created_at`);
+        ALTER TABLE `notification_logs` ADD INDEX `idx_notificatio_deliver_5dbdeb` (`delivery_status`, `created_at`);
+        ALTER TABLE `notification_logs` DROP INDEX `idx_notificatio_deliver_9c1610`;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `notification_logs` ADD INDEX `idx_notificatio_deliver_9c1610` (`delivery_status`);
+        ALTER TABLE `notification_logs` DROP INDEX `idx_notificatio_deliver_5dbdeb`;
+        ALTER TABLE `async_qualifier_races` DROP INDEX `idx_async_quali_tournam_b1204a`;
+        ALTER TABLE `async_qualifier_races` DROP INDEX `idx_async_quali_permali_120214`;
+        ALTER TABLE `async_qualifier_races` DROP INDEX `idx_async_quali_tournam_07849c`;
+        ALTER TABLE `match` DROP INDEX `idx_match_finishe_86dc83`;
+        ALTER TABLE `match` DROP INDEX `idx_match_tournam_362f15`;"""
+
+
+MODELS_STATE = (
+    "eJztfWtz20bS7l+Z4pfI51C2JVt2orPvW0VLtKNd3ZakshczhQLBEYkVCDC4SFG28t9P9w"
+    "zuGEAACZIANVu1jghMN4Bnrv1MT/d/OwtrSg3nbW+pj6wHanZOyX87prqg8EfmXpd01OUy"
+    "uoMXXHVisMLqUldcLMYuqxPHtVXNhTv3quFQuDSljmbrS1e38Cmd3u0FYeWJ6jiWpqsunZ"
+    "In3Z0TlXgOtd+imqmlgR7dnJWSGJtjc+haNnXgylx15sS6J+6c+lKPquHR/8cuLA1VN136"
+    "u+vf0h1imcYzcebWk0m8pWUSzaYqvit7D8/Uf/MofN+MgrgNb/P9V7ism1P6O3WCn8sH5V"
+    "6nxjQBoj5FBey64j4v2bUL0/3KCuInThTNMryFGRVePrtzywxLw5vi1Rk1qY3fDNdc20NI"
+    "Tc8wfPwDlPmbRkX4K8ZkpvRe9QysGJTO1EtwMQa8f0mzTKxTeBuHfeAMn3J4fPTx88cfP3"
+    "z6+CMUYW8SXvn8J/+86Nu5IEPgetT5k91XXZWXYDBGuLH/ZpA7m6u2GLqgfAo8eOU0eAFU"
+    "MfR8bELwgiIRelErrgm+hfq7YlBz5s7h59H79wVg/dIbnP3cGxxAqTf4MRb0LN7prv1bx/"
+    "weIhohyJq2gv2gCo5JqZXQ3H5bTID56WMJLD99zIUSbyWR1B0FxjL9UdAgv1iWQVUzpzvH"
+    "5VJQTkBwFSzLNM0Q3pXQLEDvy83NJb70wnF+M9iFi1EKxrurL31oqgxdKKS7NN7fI0zZ+E"
+    "qniupmQT2HO66+oGJUk5IpWKe+6Nvgj01hvGaLhW+Y3sCU49dWAeaji6v+cNS7uk0Af94b"
+    "9fHOMbv6nLp68CnVukMl5B8Xo58J/iT/vrnuMwQtx53Z7IlRudG/O/hOqudaimk9Keo01m"
+    "+DqwEwiYo1VMdVYD5epWrTsjVU7vaH9pbUZfDZhZVJf1/qoG6FqkxKyorccUXiAlmptBaN"
+    "Sby8IG3IqFrDmhQX8vcPwiUpIpIF8CsYHPrM/Bt9ZjhewBuppiaa8n176s5X0zz8/gzaQH"
+    "A16na2+hQaN/GmAZ8HH0X5LH/WG571zvsdBuJE1R6eVHuqJNDEO9axlboSls3eWhwv0ldU"
+    "U52x78evwHcODFXn2dT+7qmGDgJ2R2TKJkt0Cw1aLKv8FhQua9aiFAkfQZhigS0rLIYGLL"
+    "8TPZaohmE9ocX6jL9ci2jWYomIE3gTNHVRYG5bpuU5xnOXW8RU1eZjkwthOXgsWVJ7AVrN"
+    "B4fc29YC7GFbBxmyhJUoqHHRMtZtghbwEjS/JUON29I2HZuaamiewUzuiQoTNNjL5F43dT"
+    "CycfwmNoWbsNLFF1RB3uaXD9RHaOMzyixxa0lO3kh7+hXY07sY+xM24PHJSQkjEErlWoHs"
+    "XtJkib9ZBskR/T2nEabEWkJQFC1++v8cJdY9AWoHV71/vkmsfS5vrr8FxWMon13efJE29s"
+    "Zt7Lk+pQoM4fDGTkVY06JbRFY8szYM2qnuwOw4VbS5aprUEC6tv+iz3JlJLL/SQjs9Nmxp"
+    "pvrp+PjDh8/H7z98+vHk4+fPJz++D6es7K2iuevLxTfEN1EPWcBtz3QUWMIoS7/pJbEewt"
+    "LGyEU7I7w9i+ZobaA/HH/+FEKLP4rAHF71Li+z6OHkiLSZSxdL0VhQDF9Wenv4HTYDQJv+"
+    "5uk2DImwMsaVrXJv2Qo3EbBxVRxdS2iTA654wAUz0YS3ESD+1+HNdfFgG5dN4Xtnwld/n+"
+    "qa2yWG7ri/tm1Rhl9fvChLr7+6SZYJFaQXZWngYLqi2sNK1O4LqiRBuGOCUO7H7Ol+jLec"
+    "rlixSUlZsTutWP/lo3q17Jlq6n8wJ5VqzL5AUjL8GUxrYPpvUuqah2dZxl/QZKoy/xHKqj"
+    "fVXcWwRIu4L77s178NGKMs5MyEbH4PtV5as3YBndw61x+5TVArMJegdaBqDR2gSwHDtijq"
+    "xOR2g+bUFvCovY20sH1sbycxHFle3FGMj0GldxaV5HhYYo8RyxMoT+4tm+//RRuGBNlwAE"
+    "uw51hKDPcgR/D8B7bzSByY8KCApppuUIToZlra4So1zfJM+EwdzPjnsamaUzKlE282gzeQ"
+    "+3672ffjlVZl5y+SaOfe30acaafUVXXRHFS07xeKyD0/4Z6f5Bz2wjTNcg6u5dn4t+lWs0"
+    "wzcq/JLt2tu94OjkBs1paP2lINlnzWcax5bbCsLZ/pZGJLPt0ca0CxpOfjzia+/XB8DO39"
+    "F82VODNQ3lxJshQvmyv4FOarSOgjNDqR9SGwVkpJobEyoEuYuKAInvpztDmdegadctEnMD"
+    "Ios2Oooc90+CB0TXR1TV+qKMAK4YFAB2Aamw4FQUdfQJNSTcr8KdHPESEa4XpiNntLBtwn"
+    "Br0iCc6BC7CzNXjCM7EpbnDRKbzVnWnoD6AV1Eyhdv0X5/6aB9CM9Ud9Cl/RhWfjIuCQuV"
+    "S+wZ3Hx9Ct06anY/OQDMMvUl3iLKmG1hhzrnTw9s2SmsznMv6NkVUX/1os/jPM89x5M/ZR"
+    "/iHK4GMId/shWK0PWBvScNuF4UaXugOdsdoqICnUJnei2pZO4RCwglmRlpW70jvelYYBSZ"
+    "srru4alZyXU2ItMb9TLsylaIzjAhrjOEtjhA5HjuHNqiCaEawF0+0eDN4sojNLFfgllkA0"
+    "EGxnK92Eo71tWQvFgpWNEgyyVQbxrLQcxnc8jMNC2PUE5Gl+74gktkdCR9N/p67u8bFM7/"
+    "iY3zk+ZvqG5Ez3lDOVflp7UbFZ34Xg2GU1Sy4t9opI3bTnR0XgIonXunuAS0uFLYOWtnWv"
+    "GxVJhDzxV9oE5WbWCgDKjZmtbMyID8OtiWL7nOPSSMbmgBIYBjNt/UDGNTdunCwNZmol8j"
+    "KimQmkBmRxv2IAKm8jja1FNG+CXd2lOrbPU78DcUnn0ObgvUXf0KiLv7jbmhgNym+3RmFb"
+    "ym23ho95x7Yz2b5pxmGTBX3JbrpWkMWt176qzaOwMkSDshO+fzklk2eC+6j60qBB8Jq3ZD"
+    "SnUWwY3SFRVJmxqTpsJzYeMIaFbl2Sk3ikGUc6ku5mP9KzK9HbfvF2upCelNopOCnYKTjJ"
+    "7hSYlisal/MdSEOBluwMbNt9FEaSnA2Cr4al5tEDMaEUrvco1TZkz2/uvlz2ye2gf3YxvP"
+    "DPgIf0F7uJl6Kj9YN+71IA5Or0Y1Za7rfIw9ySS5abBLJiS28SSJp7bV5RcmGrcWFl+IWd"
+    "n0xuELkgD+LujGzBzvgyz+J32QoUS3C8vAS7AkWRm4gH0xWyJAJypbQoiwMcI1yQWJmrjz"
+    "TGqOAbdwmesA0iAy88x41iA6tEo7YL1TQ2TW8xASXwZIwtxmP/UsbcBByQgE35ntqmYYj/"
+    "KjmWzXIsMkjv2r6DMkivPLArzQ9pV77Kis2sT6XvygoztPRd2ZjvSitszQbBLHZUqTcUVg"
+    "UnlSYhsz2zs9xh6uoHqSucob4IzwzzM8sYgqmEyVlOLB7yiTggGm7Z/4B5YVjUbzx9rEam"
+    "axdUaYY3xbwyMK/Df7pjk5/Z4FYpBvvFm7oJNu6iSibV77GzH0HQYH5MGkcWKPw9O9jEzu"
+    "X7wqxc2nMpUhxGM6d5KmML1l+lnbvCLNotsHOz9Zod0EokT0iIt8s7ecvZE3ykVj5TJ5KX"
+    "u7w73uX1KwWxtjx3nXpNq5BVu/sDk/ZqNZqUlBW56wSq5nSlaozLyUrcfW9sw/FlmJynfr"
+    "yemrwgSzlBFvhAZg72x5bd2RVfccachKTMjpPJjgVfrlR2MU3LyX0P4b6HD9OjNVUqukFn"
+    "JVsC8RYcotGIq+a8G0pIz90YhGv47ork5XJjx8sNmz7q9EmpvurICLZ48XFcLlZTQaim7O"
+    "ID0Vmpm6REZQ9pRA9ZacGTkWzJfLz1JQ8fSzBTJcWYocrkWRGHAX5h3Z6vRi7iiyDHjKtO"
+    "NSemXAWyjUt3pv31epHuTHtasfkJ0qp5M6XF2rVVWF8srR1GImupK5jQfoAlTLV4WhnBV9"
+    "oApTfimgBuPy1MS0GTLpzbCT/WiNBZDca0euys7abaaTB0L+baES4Ma2+IrTyjmsYyvQAu"
+    "EcItWrNsrzU2F8DsEq5R+Z+KEtSWS0m7VgraIFMQwT5bNgGtWIgdfXVBZOK51DkdmwT+p0"
+    "9Pya2tL1T7mTzQZ34RxU6J3xTxMqZBwoZGnuYWeiqj4zGd8qBiTDuXi6cyPyU37JNUA18p"
+    "riieup0cuNTEBLjQTFz6u/uGK+JKT0mP/Zdgk39nsjxSeNfP/nlK/jq8uSasIv08S7y4f5"
+    "8XTky9p2QU/oy9PT5do7bpkAPNWuoYng1P8vp6/HfiiU9QxxX+VVVcX6ItDuY6vPfFLfH/"
+    "DmKxIeK8XER/wctiUDZXXSyDYlH+2DLO3oLM8klyLXD6js0H4gLRc8X3s1elX/dK9ohMNr"
+    "zxM8w5yYZxLMlxic9NNnxnwgd+n+qai/nlHPfXJk/EIhDxo4up/zTL303yjqggTf3vlop4"
+    "Gd9Gdvx0Xq5KyMVFXido0exaZYRMSrVkJ09mwZEbPCvt3AmWgyXHF4Hk6xxmZO7wtTlime"
+    "96BQ4u3gFrAO8mpa5p3bYshoJxqUncURzmK4qRwgYWAzTDJOWU7BbxSomPXzAhxQapkjTT"
+    "lWo+H7rWIbw95tfmgQ2cub4kE+o+UWom2BzCH+CwA+jsKVkOam2NPDYbvy4IzMYK+efs45"
+    "ry46xxVXgbZTMx1sICjMOIikjeok7ewnFgbFppPZkSlQvKhi0ow/qp6rWRFXxFa6OErc+H"
+    "7WrGflzmNTkeJNMYV868Z62XbK+loBWsxKPZscbl5FWotHl4ll1WJnpYif1cf6lWI4rB6q"
+    "+9GMa628sIxuYDaRqKpscEhMP+iFzfXV42wawpY9BUNGUq2DADZhHg1m/WKiAHE8udk4mn"
+    "G+4huz0lmue41uJN1nRZVRFaLF+CG9w+OdAdhZXVzf8ZQeW+OR2bh6QH66hDnx8lT/O0LY"
+    "T5uvhNLIwOWjq0AWgnBNqeDk2B4MFDXVMN4xktIA0wJAem5eIPXHpPVIe+Qdkz1cTLE7Cb"
+    "rCl62Uy7YIth7cAflk14M5rCa97DUxXD0h7olL8oig+hIFE123LAMDOMxFs6+LVn7MsF3/"
+    "oVq4h/7Jn/nZPn5Feq04WOWsRf+Kir5NYydO15CN9K2Ra9TTEYFRP56uG3c+BB4YS3KaHZ"
+    "l2ZLhAG2s8Wij+EGoeA+h0taiTI691qbNkeljvwfFRz5P8oe+ZfRuTd4nC02NmSwLTykmR"
+    "SUxzIzsPpDamVUIzkJqtzAfRV8mzx6uRcVmzl6GXS7qjRqRu6Vsqi7d2zYP3JwtzvODSa2"
+    "Su85i3u45LcE41Zleiuzg8IpM+QM1gzgn78T354mmzxHiJSKvm7CBwSBkzMtg2KTRGiKre"
+    "oIeNB0kW4RDcqq6pnFGKNhU66UwIBrIKEGfiymf39PNfcdP0zjvBtQx/JsjTrvziwQzTlR"
+    "VItWZAxxyYbnW6bsaJJWzB++zfCpIOmTnyxFQpo19MlQ9iQ2fjqMgqTs5U7JuNO7vLz5x7"
+    "iD3Oe4c96//te4gwX8Q1H+GSLVttVnPGTjH+jhMMAL0rezt13yfRxzTj/lw9cYEEtc5mvs"
+    "cedXRqTaARzpJwQ3yBKjrrJDQ6KH/B+uP3Gi6r/wC0bMP4NnaCHQ/kOsyX/gq3n1hDehAg"
+    "1rBvAdWP6BrDc5zGmKIZUk50rr0nySkzfKKjRnJNFWorMUz1lAc6ZZTr/fZkHMP78TE6nh"
+    "/M7uJretHeAJx64qKCeEJM5lcI7G7ypAJ6XkibQSQMutERnpT7KSkm5+lRUbmsEZB6GXuB"
+    "Xmw1VDUsTWkgeZo181gIHsXSvB2CSTEmshAhIl2X7y+RPWXuN818vcySVWaMbtKBWkBJ+f"
+    "JUjKi9bAgkwt8weXn4fx2RjfNSr/8EvglppmlQSeUPzoC0vrKCwsWYAaWQC5XtqLaTW7Xp"
+    "LbuGvG0E2NPRVD6YqlX9N2rjwgswJoBXvg8mDHugc7MsuJ9dEU7Ki1F8ycQUs6FGzboWCT"
+    "xk3M4hMYN0l7MN+4YfZnNePmXLdxO9A3GGIuEmiloD6wPSbPS7xhzrihITgbs5IWdpTfMK"
+    "wnh9k7WOzQWVJNv0/t4+JepeW5/PgLKlCZClAw1Kwlxpi04FIoWu7cfxBjJO3EVMIUEopK"
+    "I0gaQdIIkkaQ9GVtB4jSkmx1zLOWglZgScrMA7R1Uc8ajOJKPujSFpe2+Ku3xb/wfbaR6j"
+    "zcPFLb1qe0IzDKRcW6Rda5v3+nuCChWL5ISTPdfxhBWRLIEvaQrDVeVBiN7qELLc4J73Dz"
+    "O4xdgVJgt89Vl6g2FThRn3m2DW3feCYWblg63nJp2WDqUxO+FF7h3VR3+F9cVxd0uyxW34"
+    "QS+rtLof1NxyY+1EJ7PHgRxIk41HWZWzW+yZySe8/1bJpnxktv5M2a4KypisDLd0eOidTj"
+    "j7xxDDefUEB3FHQwfhTsFLx0hD2S2+IR9o05F8oT7JId6kqXwtdQsVVdCje5ojvXHXSE+g"
+    "ZLnOS6QHS/cA035SWVGRYtvcXCZAhTT9A90N+yEIQoTu2qlBPENd2ALqGm2JaLSgJBsBNg"
+    "acXXcnPVgfUXZYmoTKq5QlXdsanijgxbu8Hqa2IxbzVryXoJX5OBLl8vO0MWF4+2b/xUXf"
+    "nbL2m7nQGqBFmh5Jpuc2u6EOnsWkSf5QIYl9oUYbcZIH86Pv7w4fPx+w+ffjz5+PnzyY/v"
+    "Q0Szt4qg/XLxDdFNDJ/ZdQkHqmqssqRUOw/ybWTp7Lc7rVpas6RUSw7lbAFNGLVZvEeFhV"
+    "msaI1khWVUrXbbeeGA22BMYQkCneLeXcEeSInWYBA066Reg9b/wWeX2veXJnurLTtpsu9p"
+    "xWbOs3GTs7KfTlrsNW3wSz8dGXOuPfv9YU+VjieCcWvLeeJiQYAe0bcgivQkOE6MidRGFv"
+    "5bsnqipPZN3IQrqCL2/kqKsU1+DUskR6dhoYCl5ThGXO29ZbOaeKA4V2eTSYdV5Rfw9cS5"
+    "L3duW95snhLP0sLCtgPXlTTb+GcZ5nqozenUM+i0/5gTRE5csFuGy3YCGY5XSVZ7BLcfnI"
+    "hqDpQQriRGV0c4EZaEWpQXcC1tyH/nSqIPA1LZpooGNr9KnGfHpQvks5NUuTM2uePDcklV"
+    "O/BBGHcYms64A8VYoKi3ZDTXHe5SAa8B7RX+77DCC5CFjxqbYUJDzyZX+KbBcWyWHcR/7g"
+    "9O+o3JxXnuge3MSYR4Uu/0BMDOaod17Kqu58hDCrWz6anOU5lXF8vXs9jbErZbJtg5To7h"
+    "zaowwkmpVjLCH8sEyvuYHyjvYzYdSHJ0qABnVnJ7exZRn+nUBe1xGWiP86E9zkArua69oE"
+    "Qk17WnFZvhuuJLqZLLoLjIa6JnJMe14aSr2K5qYGSuAj3NQ7AsJZMwcORhoI2Tg7vxzzuz"
+    "6VNHQGqw690iDkMLSrzEV+RDKo8VbN1oFgfNQWujb3qLTO/MhCDarr0hxLJzdnN11b8e9U"
+    "Y3g1OiWQtkpFTXssfmaNA7+1t/gLUCvYPClQGsTQb93hVehAWLC4uoBSfLG5EVErqXbT3S"
+    "qgn24mLSE0iaf3toJUjzb08rNmP+BYNZZWeHrOArjUoiDWgZOkOGzmhR6AxJM6xIM8SG/O"
+    "21uuZGc8jOgE3iFnjrFJALYbPNZxfCHrJReuF71hEl2hXmq8VgOz9TMLaoFBe4103dmYeK"
+    "EoqZRGEByXysNLuXcReobkCkZeV5hl2fZ5hTDR0GdXMVOz8tLKtzx9UJE7W9mmmflJQVue"
+    "OKTE1pVWoyJSqrctdDrGXe6/ZiNSY1JSsrc+eVuRAHFcxPrxgTaYnPXlGFbSK1oqu7eZtp"
+    "YkhDgZYAuoVj8VCKjQDKzFKNKlhmBCWmGUx181F3VZ5VvOIOY64OeUZejDUbfvkO4qpQp1"
+    "RIpJM2wpLS6UxdwJsodKk71rRiBqV8BbVsG7WDH5H75Hu2nSr3yfe0YjP75Nx5SdHmqmlS"
+    "o+LYJ5J9pbvlAqK+FIYZObkFnMKzhi259c5KN2dnLtNYXt7bTPbRGrAcMoVnkb7Gde2yaA"
+    "qHr6pbndnDd9Gh69RyvULC8NzT3+1pu+ll4ZOyoIsJtddEJnAhbykQS0N9XhsDttN9G2lq"
+    "KxZov04VBwyoNQG5ZZqGlPsub2tA6vAoAC5GDsCPIE+qQ5Y2PbQtw/CTvh+gJPsLYwnA9y"
+    "zIxLu/pzZb8NUEZJBjQXG8SZBkcT1AowmTfePQf0DLGlslN5Q4nELXeV/sxqQjC/4p2U23"
+    "3Sjr7aIhi2Rb1qIOTAa+woGvb2t9tec4lqarPEx2MuIIOdDviWo+r9slV3FkCkbxPH+m2C"
+    "j/gltTbGaRh6eaZuh0C1yI+Ba1YqvmQwUAU1Kv1OrmmYkpj1shPCSav9cjkm3lds9JmSNk"
+    "J/knyE5ksIv9JPski7unFSuDXcizOk0hauWpkxVPnchDTmUPOe3woAkz3/OMs8C2f8EyC/"
+    "iEl2NwfoOHMCrp3eDmiuiYUnPB1qaMQVIDc/Xo9IjnamJv8SYbfXMNPdIA3LoB6NmVfNT8"
+    "4u3MKXRSKt7FSUG8i5NsvIv4m2WAzPdFTYm1xPbbtj+qtAX3wmSQtuCeVmwzbcE2zMkZo6"
+    "bKOvNFAyjYE9m0+bPDSP4VjZ/6luZJHxTB8jzjpJK/ROdeIDH/GLl70rSOWrR4rpqYs96U"
+    "nHuQy973gqpohCSlWrJ03gKaMmOkjL0nF6odaYG8oorNWCAyhrjMk7c2nmXtjhpCYadsOV"
+    "qHe24jF0D1eEpWNNZihy8EllryaEa+mZY8DyJttKYNXd3G2mh7YVfILY4NbnFIo61+o82P"
+    "la9QE7+0aih6gbTE98UQEcxLX7R4qRooIlIk8wCkYAdgFGtJTWWhm55LHWVC72HxXWFhUK"
+    "Rie8bOp/e7Xi/EQKW/eboNrS5oipgdtmozztMhW3DOwOG/9+oxktIKWrK62MJqzR9FRYmY"
+    "KzTpAi2yUac2MVIYrbjsKFIj1x9JgySRkv1eN1yRN2u5FFB5uraYglY1WG2mDw1eXp4SuD"
+    "U2eb4n5eb68l+nxN/8skzjeWxe31z3oSosk3/XzhPVchCnns0ZMX+NUWF9kq9ge6uTo+MG"
+    "LU8SIb5WG1fEGuQoXgD0SlnB8zXIxUkmWgB6hbPVxULNYvzX4c11DsY58imE70z49O9TXX"
+    "O7xNAd99dG4l0ALyJQTDWlWaVuciMNFaSpJng6NH+lKLpR4UgilJfjSNrEMafWQv8jb0WS"
+    "Z9fEpVo5XtR/EngJbZnCKEoNqrHlgA3LY8FqIn+4yNcgB4wSA4Z0ftkLHwnp/LKnFSudXz"
+    "qbYIRVjW9CKEvbuteNikGZ88RfaZSUkLGdWBWjkwokXy2GwepQ8Vc0FYEUi78iNKVz2wad"
+    "2/K6ew1oBiHbvljNbJtlsRSMZeWwTMwkNQGK8e9uI42tBlU005ZBNjUi1oJsoPM2VNliaM"
+    "VTRku8Wxs0qiYZjToi8EZeq+0Pw+s56owqzOMKddWEyx1qbRkqa3pB522OzjzdEEU4vlLN"
+    "55GF/5Yc3vyo4N9Q3yrQ7vCoMPsCJeX7nf4eG9sXnSrJrcyI6+YYWjarjQf6HIOaYewPkG"
+    "GF+UUyUfPduW15s3nqXlBpUXUJR1q4rmSA/7OkB3xBuFfhkFLGH14Gfm2pW7ykdveCAZTU"
+    "7p5WbGalJHP8rDQCynibMjFS8xIjyfCbtNHhN68tV7/XNWZwXlqzjmDJnC5SuGA2Y4UVw5"
+    "qVWzB3QC+x7okDTeud6rp0scQUEnFlTjb+ZhmhsTk2R2h0O+hhmrhJ4OX1R2o/E1/Y4XE7"
+    "vamOnldENadQZOLNZvCrZNTO72GDjy0eocz3TvAwFgffc0RFfEMMW/6v0gyo2QyIgVsev6"
+    "TQa5oa42N4ok8voOlbVdpgjvRrBdP3+4ZmmsUw370rKVWDS9dq/vt/ufdM5l5GJp5uwCjp"
+    "vMXH/m9n7flza55egnE405BLnKXIatleg8467Xdu+9fnF9ff4N7YHPavR6fkaGx+7V1c9s"
+    "+hpY7NQX80+Bcr8CE9jRY2+w/Hnz+FLR5/FDX24VXv8lLQ4m3bsqHnOwFXncQ7/1h9RrAl"
+    "3qLbPlhvUxdaomZ5ImMl31ciKbXL5ruzwVhyg3tBIWW5QbQJVqjVmFgNVdqskadBNRh8tq"
+    "R3979vCjbCJTu5LjspWbX2sGpDbxKHoJBeS5TtlubZnJhYScINq57E5YhrEWZlvsS6lZZE"
+    "6g0LO0RTzUBiQrG4s6QalvTlWOtnfJs2tyyHkrn1hMWgMFdJp6BtaC0oF4CyNiVLUG2Zqk"
+    "EO6NvZ266fbicMLsDIPGwfb7rEQrqOSY3NuLPn4ZM+pYF8LGGtv7ojukmgeG7KnojtSxJF"
+    "OZRHwv/211zmMIp3lWYFszfTLr2x25JBXMk4WJlBfJk0aBSb2Lkb9gfKbX9wdTEcXtxcK2"
+    "CFXn9DuuDo/fuxeTP41ru++HdvhLeu+ngkVOmdnzM6Ie/+oH918wsvcZQqIXrO8fvjsTm6"
+    "uRtc96761yPlbNCH1Qnc+IAPiN2A9cbAv3GUuNG/PueXk4rubs8DRR/G5lVvdPazMjz7uX"
+    "9+x+iQj6ieXx30E9ePgutnN1e3l/0Rv3ocXu1dn/Uv/bKR5v5odHH9bagM775cXYx8oY9j"
+    "c9A76ycuHr33L/ZubwccqY9HR/61Qf+v/TO/HDzx8uIXuMY0xN7w6CR+Z3Bzc6Xc3Pav+b"
+    "1PCakAs49Hn+PXv15cXwx/5jd+jN+If9zRT2MTauMf8Rc9fu9fC2v54zG8+8X1LxcjfPuz"
+    "/gW7eoLo+ld7Z2f92xG/Gi8bfOkJYutf7f/z9mLAL26foirLcL/cx5vJdnfOL4ZnN4Nz5f"
+    "yKMYP9q97FJSMG/9H/8vPNzd8AOZhgr4ZQq1sHX8aFrP9sviS29sJ4lqzInlZsA88zt/O4"
+    "o2SWVgBNMks1MEt5vbcG9CqerG3u4boaskZskqaL4/wVlj2eTb8aqtAJLq9ot4ikS3z+PZ"
+    "dS7kGsJEnnP4igCKOzWFQ7qJh3U93hf5EEnRXyav7DBPRdDTqR2OsZhvXkkOEdWPa986uL"
+    "a0br8ehDj9R45mopUaeP2NanoTR7ZvwBTndsLm3GjeCz7y6IZniuS+1sSeLOVZdgQEgk9s"
+    "hEddKfKiTpMr3Trwk8uJSl4QpLI+cWvwD3g0iDknCrm3BLAb2CNZ7SsGsrPOh7+hQbO3yP"
+    "vX1nnJUiazYpmmbnH3PWt2Ew0J2g9xP4039JNmxAAZLuyE2xzf33XMGES0o2yUMBK8VkqA"
+    "cV8qRGNXKAMkS/J5pn29D0Yfzmkw2dvlm7Zppk6JVybDAtYaTgfD+4UGC3/m+dG/aXyrzo"
+    "cb9uYnkueZo/i+r8XVDB69fvJlzmJD+2FzSK5Mf2tGIz/Fgw9U2eqzE8GbndcmOdmMH0NL"
+    "fCGTI2c1ZaEtbGne2ef9w/Lk3GW+usSQuJR4Dt8ZPN6/dlIc6MewmAh/0Rub67vGwC8XZh"
+    "PnJTqZBz80t1y9JtelT+RZqN6yaYyooZj/+xdJMfAE3YkFkurYqgjPyydf6oclqLdZJYbB"
+    "+9REz6o/dlgtJDqdyo9Oye9MzYNPuDteY5lVIFxUVe79auU/mEW1LoVR5wo78vdbDBVuEa"
+    "E5JN4hpf5WkoSVjtBa8hCas9rdgMYRV0u6qEVUbuNZEpkpGSjFR7GKmoq26PkWowhpmRq6"
+    "muXgMK0Dlu5wXKKSjWLe3iZXOJkt5dV6gt4+TEzx7iH4G2LO9UWjJ5BNO/zEjHsKx1T0z6"
+    "lPLIIk9zXZuThQelJ3Rswvfb1iOdkskzUeNOXxMKb0Ez7hbojuE3B+4t5sK7TzDB7enYJP"
+    "A/fXpKbm19odrP5IE+84tYF6fEhx0eltCIN3mxGIynJF5h8Tu8qB3ogkZ5StjJVWRfw8uZ"
+    "F+diPKhP+Cr+b3KwpOYUqqBLAjy6oOo/VANNb4IHPur0yX9eivMN7rGH+q8Ql1LYtjp8Un"
+    "Kb/d62FoGsnf4s1T0loetFUL+4De+jn3qr3OJBiXJM5fdOHFjs7cwxzo+FxP6Ov6J0jaud"
+    "2mT/zSCXT20G5beX61u8DVLQuUvue6byepdL7F2U2TvDesZfOQNxvpdOSmzXvjo542Iz3X"
+    "HyYrEVcPV5cdc22KQ7/vjfyW3XJHqt3aeoj88qVRpyWm7XLblgOmxma07MfRngi0mdtKyk"
+    "dRrG18XWUtXrNiEqOXXJqcs+Kjl1WbFlOfW01Zmp3IJgpxnJXR8GKsFGlFxH1p2DN+Iwqo"
+    "KcFmyWs62IgNkexAW0fLx1tpFKrq8tl+WaBf25RC7UqH1uD+UGtubyIKf7c1MZ/c4LVH55"
+    "Dr8UdZ8/FUsvz1dGhW7Xy/P45KQMS3Rykk8T4b394ztrsV83wQVJF1oZ3Eyadx1pt7+iig"
+    "2zfGfWguJVYtQAVOfZ1JTfPNVg0THWTB/fQ21/D5Q1s9Lz1uKJfsFS0oXZ9NYABPX4Kfya"
+    "OjMXI2HDlLkmCAkXH1DX4nbBYpQtLUPX9HVRQWv2FjU9txiPbG751QE557q+oao9gCQMi6"
+    "/wCPq1gDMMlPYfW5fbNuV/AHPvQtHmqmn67MDq4AyZsjOuq8WgRPkQ1gSkremP01F7ChJu"
+    "rA5OUfqPds7RmUCH9czVqaiLLW1G/Fx6jbBEB+NbisiCLiZrL/XjiFwxhS1GZEnthe4464"
+    "8tcVRuQ6VtRgZMUuoq+NNZqtq6/eiWqbsOtG11NyfhoGk9wVPJge/RT6LvqxYe7wXbCRQq"
+    "tmUtlKVt3etrG1ID0DcAdbdcW4ubFSJjK4/UjrJXrQ+N/UtMX8vBQdJMmVjrLgQHvqovlt"
+    "veo2NJwyE0q1zVeVjXcAiUjUBXe9d/MKRiJOca564h19iydrKtzW9/vfPCFni0Kiq3Eb6I"
+    "ysvt8Bqby6a3wzEG1UpbKAlBuYMit8Zkxb6KvD+7qE6Z+EeGhtg1nhsNDSHTKNG1E3Qnd3"
+    "0V1XEAuxq2I7Kr4hZuA69pXJQkG69U83lk4b8rdPv1GMdNr8MLGjD7FqXAlkp+mY0tDhZY"
+    "IkLbsll1YP6Z1FAS4e53j7DuBIW5Sr+gO7ctbzbPKSN+Rm7/g+tKpmr+LG17xpB4wf5MYl"
+    "bOBk2+v7RDm7ac6BbYobH2XdVDWyC647gV5VHdfFBe6a4t88JIM1vyJ6+yYiV/UtfcLamA"
+    "NqazLeE2s5bNtrrvTJPtteir0rZa2vrNt9cSJliRrZYx7DZqr4VkQK65lnZyEdhpAj+YfA"
+    "NN6INTJdolVxBzcikKcJktjPEkw1d1iIqJiDEdsA1/m9N0wmCLzNVHFqBSt9HNhsAEwJIU"
+    "Y6xH697X77wlfVWbR49h8TInlDnmsKiXVGc5R1X2JHhIOsfL2DyYeC7GqCITy52/qRz28o"
+    "51pNgbREliyQF9O3vbZY/G+8R3E8J8JX7cyanuLA31WeG6fvagNRze2zo1pzzXJt7MDaEZ"
+    "BNiKXcWwoHiuPHwdLodvEBPgWES+S9B+HR6qK3Jg4oJxqGIKEkEA852gfPAcZelNDF1jMS"
+    "z9FLBxxLD6ddcJ6pSoNiVcAkB41B0dWjBXFS3WY/EwI0WZAJrRGjC3vKE6LoHugjVWOoxm"
+    "wI7+iiEz07MLuxh+tAyiKU+O81gbRQMFGxLSw+nuqIrYqFQF6LTcrqOWFoynq2Ato5bmOs"
+    "WGsR7D1t342KXRCJ2B/aUT/pHcrk/4h0nVY8OKk5k8164AGQRAEjpdydS9hoptIFPX0MMb"
+    "7feGqg/YuxIW5fZQLeBIt+vg00SAa/MAyhsktk89N3SA2CI9vYFDiClycUfnEDvhCyB341"
+    "AS+z5M5wKLXNdarzoEJxXXPi9lTq2F/ge1OYhbbcJxwPSAVCMTaljmjBGrByjHSNqZYU1g"
+    "CPG/ed0zi5s8N5PfGF+mxct6MKUJciXVldbhyuPNtgptnpBj1DTS5k6sABukWL3igDGDFu"
+    "ZToF2f/ewyfpWPJmMz3n1AxmLGI2fhn3RoMKZPuYcPqEiIM5lTMprTzLfEqWi8z1joCcXE"
+    "6zNbNTH4bOztfMJXNRX+ORF5zOSQ5+c3QtqYvbvupB+IKjgSAhX8RhkVHECBCn7jRRUi5j"
+    "r6XEZF+ygUUNcpgTLc9fdO1KD53BKS1xlaO1GS0diJspLErpHEjlp2Rf4pKbhFAipn0DsT"
+    "9sSwKTWKewqHghUwjwSbgXl26Gos5v5StjrmkWAzMM+O9c3EXHKs+0DFSY51Tys2G6QstU"
+    "QruZxKi+06NUp9tnr7udUaYWXcX2AiZZBtBK2amAbXJP+qR3dqZBMuy/6lO/H+HlKtpSFv"
+    "4QDrJomsdPAtAX0liM+VT1qJg4O9TFUNqOegDgJA3uszz+aUt6+EcVH4HiNYDBB8BsFnCK"
+    "irNfQIyYr0RgLDJs1USDJipemwqR512z7eJ7OxtO14H0xltouDuCrIAJbbwVNS21vGHZ3s"
+    "uqvHokFjCEBDX+gCkzEXuaTQ9oA7/tgc4BwWDhyeqGCSNt2mgrmlkMASK9g5kVVHJ6+Rq2"
+    "JmMeupFeFNCu7aEbNpqOI2IYC1yIu7UohsRliim0B3rk/pquBmZOWAIGq6S5sy00abi7jO"
+    "Es03rUA2YQHKC326HsppBRJlAcomIAK9HXmP1ZEWKZFop090BC9cDeGkoByQ5W7iHm46yd"
+    "3EPa3YBp7Y2EV1ytgqm6D4tuu8buiPVLHXTxCTzCB6CVoHW84TszbOSRJvJyndGgTGprfk"
+    "kklfcjblMplhirflBJlpSuzLoSCJC6Z21u6zMUwEu3KraEFH73N6r5vUIT5jyVocK8xdxF"
+    "0L7mgU+hNRffV0yvb1bILBftEjzs8xCerumMzCc1wezEUlhm4+gECwI/h2NiOqplme6TIn"
+    "9QWlLlnopr7wFv5uYew9ym8asjyi/mDEYhALvJ3lHuIKE2S3YA8xDnpqgNJnuQDGpTa11N"
+    "gMkD8dH3/48Pn4/YdPP558/Pz55Mf3IaLZW0XQfrn4hugmFotZKyxox5XQjQm1bB23C3Sr"
+    "7oInhORWeMzl26Uzyxbmtv7r8OY6z987LpWC886Ez/w+1TW3C5OI4/66KXA7f7n3TBZmjE"
+    "xgaHJ103mLD/zfztqrGhHCCEfxbnl6Y7ybtBZRQXq33J9B8xbSuaNFRm57Y0aDNszZckSB"
+    "Nc891Svv7mSFJZsognf620rAcjEJaYb3BpsCFuXVae9ITu4lSNJ7/7hRSXrvacVK0ruutY"
+    "8kvXdMerOTCjUmsUbare2JrDfJ94rxEXC+uUDm876sLlcmfy/Mqf6oTz0/RPMPjk+tJohc"
+    "6GWuJziJUUUYqd4R3H5wyJMfz8KPkD1XHTKh1IzYXSRmY2d2GM+bT8U+pqBiZ5Uk97ph7h"
+    "VW8kF9VbcB4pLStEqaAQE2KywXU6I1rBebdc6jQcvD4LMLF/7cTxFphApjTFJoe8vC97se"
+    "a1LUuD8BVBxc0qJydMmHdoURRiAuR5kdjzIYkkvR5lR7WKlKBeKyShtTpQq1bUtw9D7/eK"
+    "dIVp7xlCkc95eYk4zrnlZshnFtc0ydna2m4/xINfAEkq8JxAKaOs05rUlTt5w77aa4akG7"
+    "2d8QQ7Wj1+AwQjjnfbHcTo63cnC7+5KfMgv2MLHcCh7KLJwPiCS9isV+yDllkYIeutCgHH"
+    "LT89z5MQaRZRnR4LHM5Th4N/QSRnndb25IX8OH8TyBfgjzA0zgGN+VOXQ0a0mnbwhmd/ST"
+    "QqqOA60XaWwrmW4yj86WtPVmaWvf5U8Q0yXf6TIus9uEfmHjDl6JJfYMkn7+oBquu7R/gL"
+    "+cxR8fflgpu99JmYRzJ/n55k4y6eY0Q4c+Jlx5FGAeF9p1Ur9gtGDvRC7OV8F1M26vHCWH"
+    "wkAmMHVehDcSbBbE0Xs1AuaWxirrfA3SUOILsQmO5QmYWM2Bdh9imHVEaZHLIbxtxmsv/D"
+    "Y7UU5n3poxASU18TnTtWGvM2aPCp0P1vKaAcvAKuNHRnB7A0lnqM5VXGb8zN+hk0X/lr0M"
+    "YS8XH1n8aJv+y4eLkt7laHQ7iKnE9cnwKnPh3x/il1Zau2xkhOL+K8LVdt/0FhmzNB0P0B"
+    "fe5UZu58yzbZxXAT2TZ7Qn0ZuVXpR/OP78KVyP44+ipfjwqnd5KQpxh49VFtRxwMysMuRn"
+    "JXc86vemU90f9/m7gbkIPWHhZ3KzCdt+IbEXbt58wDeLeKtYY/cwpaBJ+4cdtJegfhZLYt"
+    "3z9EWOp4FJ79x7RqxDrF8/DaLSy28y+r2K7xeuWP0CHU1vAby/sjd+fRUvtz33YndMbnvu"
+    "acWG7ugZbv8lv/5XH7Ql93gOJ+JrQCa2z9HewyUJnLhhzzI61IQNppLY6gwPlUHYxhVm9m"
+    "SsgO2/QkMPhOS1ouKNtXSDK7fJpiQ2nsrtuPXC7oJrJpUkdtVc6+VwQFUVxBLNJl4Xy3oO"
+    "Jc6SarinjPJOQDjo8G804r1jQQTyz4n4tGfihJk8JrL5YyL7RjhGUwnyjtFbNoV2DPacV1"
+    "gGpkTlOlAu8GXFbsGvEWfpSjNMJPCaHPLk4fvNejX6K6QanBljnmDNQ7GsI17UyV72XpRx"
+    "C3JArCFuwTYMMWayFlhfgUlbwuQKDekSZhZbPArSFQoMqtyisZP1yGtTNLisJTXjyQ8JrG"
+    "BNMMPwF65afSIXd6n+Y+mw4uuOTW6kBR+LUVctexor7CsJN3rhzr1u6s6c69GwRRsGU8XK"
+    "hPK8sqf8RefsgmZ5S4NyM50gSA9oud/b8OtKdbV5l7AUFHDxdGweki/UdVm8V7hv6PdUe4"
+    "Ypmlv8LFArlrm16SP6cuLeGwBgL+cqOl4yGfSSc7BQX3V0UASdxH7GJ6JtyoFlOGER/PjD"
+    "0NxcUFdF4waghYUB38aTbptbNyOxAqt4UATld+uu+RWuRg0w5ab5TgMz9nAKjejw6PjDxw"
+    "Z5PDTDR3Z1NjDrJZtykG2IYyzLoVs9AmxMaOdIY9tmLkAWmGUhzI1t2Xm+PAUDSZ4Dz7a9"
+    "TQIXHjb1+vvXBzjNdwn8MwVgu0Q3MSUzmqVON5ybu9HM3JB2v5f7zx22OGKD/ZMqWGCVhH"
+    "5fKI5Xwl11LmPuJPw9X1lF75zLasYuYt301gKtoGo4xkVqQXLVZW/PcSxNZ8NftD1H2OuR"
+    "Ax0sLvO57Ey0f3xXM5rrmhTYsD8i13eXl9VYm1TrzkJ/Y9KRBf+UBP4q0NK6dl0W/niXLl"
+    "MBa1Jh5tRa6H9Q+xYmA5pzyjdVpltMiQWlMTcuFC9Ji12hKrbJj6wLNu9IE/E1ZRmyUlLI"
+    "QfFX54d58bD1YbBY+1fv6jJ5Zjg4FhzqAUEXVKOi0Zw+Mx0+xQkKoCYtZg85S/RFIAcswK"
+    "VlJ3waiPUE68E33OXBhdefeC51Tscmgf/p01Nya+sLFazWB/rML4YaT8l18Cfv8fyzyIQa"
+    "FrwUNEsugI89JXgUnjzNrXAxirScL3HAXCgC4o0VsOw3XDr63FMSVTjB3kcOuAndJc4C//"
+    "/Hhy6xLBd+U1d7+yZ6Xf70w3vBCbToHXiPJE86fIsZfeX/jV7A1xhrH6dEdNoKibynuerG"
+    "1U8t6nDxoNJOwxp2sefCMh1zWZADFIIGiXFMfdlEI/BfQneUpTcxdO2URP4A4dOgMh51R4"
+    "eWz9xbDB4S1X+ByG45jUhUXzBmLfiVFy53xYWZBzP0tjCCptDbJUQzSEoVYoq/WLdOO78U"
+    "CkHZ7yklQaACditER1QyepxkRWtkRZMgl2aQElI7p5BeHmDY0NIM6qKtJ4GTg7E/mAQvVx"
+    "XWo/dlcIVSucCye/t8EDiYgpp+HjiYGbOQ52fNisvsKmeWGH42u0czOJvkcS2IIcX5XL92"
+    "LWwke1Y0d2aq4SUnyUhu55FuO78I1j9rAy4T7Ejvue5rpJZfX8VmqOS0OVLSQkiL7ZhWfs"
+    "lkJwcox4xjP7SYT1ZskSTdlyCbnQLOoxGUc9g2ayCeOY91Hde4N426LEOa7uv7G2dy/aZd"
+    "FtM1AlDKo6jCI5ZLXMVPFYfS6Zpo3DJNQ8qZv611dz7UsBaHH8F4yPDh3G+znh2QjZ66HG"
+    "pzOvUAv5HqPHQE2xvJAt2ivQ0nKKq4ULbkxkaon6AQYWqzGxnCUrhbMKCsu5u4d8Hvuch5"
+    "+7FGoUo1D6sDLoVvh1sS1H6E18FtiNCtFVezbA8D3z1QwOOXCk5nkoNknFNfyxsSje6JEv"
+    "9zbZkUNzi+YD7rQ91kL8s3XKCloTsMvBeY6FPKcn0Zljr139tVbddbdgkGV/VNdyiJDOhE"
+    "dXKTgGWIbIHXeXSikBHUJv3dVWzP9Jf+sbuSpl5pAZlPU7eUNC2PnwyTuIkpdWskKA5OHB"
+    "RR9345yFtCftcGUP+fYHFf9pXLm2+n5D3MGb0zZsYrN7f9a2Vwc3N1So7G5tllv3d9d6uM"
+    "bu4G172r/vVIuRv2vvWh/Y7N3vBf12fxW6jg5m6kgIrzi2tQ/KGg0MW1cju4+TboD4en5K"
+    "Og4PDsZtBXznqXZ3eXvdHFzfUpOQmKXV780lfwndn7npJPY3N42++ff+tdwYOVi6vbm8Ho"
+    "lHyOvuD2Ekr/fHN53h/AJ/QH8NAfY599e3N5GX073PwJNIJCuHFzqQz6Xy8uL3FLAxTeDU"
+    "eIzk8/VbIUa4mK50/X67TCjI5dt0T4zP7gl94lb28DrGZoWzfXfdZSAKutwxyshTDusWWK"
+    "luL507lAdLe80s5O3mo2fDT9HZeijnA+KjglkhVtyZy0jcMJkUWhixZMxUx2VrpJMfhqmf"
+    "sbRF4Hn124LcHWBdyTqMr+akpsV1usnb/ceyaPFTtBM043nbf42P/tbKR2N7Wx2v7oM3Wg"
+    "W+MuKgv5GRnOVcaolKgcoHY8QKU4kCpVmRKVVdmEYL5YH9WPOApEW7koq9/bL0RmtSSsCc"
+    "mWQLpt7kX65OyF64b0ydnTis1sZQbdbvJczUckI/dK2ZPdxy1rJ4YFPjW7jb3VHJeD7qqh"
+    "t8T9uwYoSzrJNBfCzKjVpNhlMV8QgS9D0lOkwJEBSihLn9QoEbIMXY4OI9+PxNlI5hmiu+"
+    "xAsoUuBZqhwhw9FYQzW0kNy+CKTjTMlYB71ZDJMzmIxLvhaT9lrjrzN2/JiDmt8GsErxHd"
+    "GZuatVh6ofMKOrbQ3+HDo5Kew30hbMswQscX0G4ROuXvpo5N3+8NJ0zM+6OphvGMfgtLh1"
+    "jG1P8Yhz9jQlEI02NhXBDP5QdA+ecu1Gf8TtRmP+JLWTZRI3cN/4wxQoavExQwibeE7wC1"
+    "Y5MVYR4ZBr13iWeGunR+ghDaG7yDd38Pb8XVL62lZ6jB2di35Ab6MgDDsYblF55pTHj9wG"
+    "+TPoJ89BFEnUH3Ke2XkTx7lqgpvBA9mztpxM8/x+9JF42VViHyJGFzThJm2n5Z0DOCu8Z9"
+    "+HPv8PjkEx7BxpFCU03LxJEwGkrLn7xKov7pYwnUP33MRR1vpXzbbaMK1n7xdjoinZQ6pn"
+    "lScEzzJHtMExtdxVTOMZF2ArmR3d4ltReqoZsPVaBMCLWEUdxCo3SWlo75Uiv27pSYxHM/"
+    "TwUP0yv64NHhwrbc3LTtzesg9HCVWojL1FALjdp/2AjIPgDIkIiyX+XaDhm5XXvb/Ww9ET"
+    "x85ZuyLrUxDoH/fIy7Y1kPGCGULHQDqj/yYtuBA1lkyWUAf2HPJyHZpE3nThipJzwfEzOS"
+    "+WE4PCDzqOrs2dWOyTR936DUFrXc6tuLHaFsxTYhVuXqHZdFEeSnWMOumyLaorOsKSJtRy"
+    "e0OWFXDfGEzI4hr/004YY3mKJDtmvuh4jCJ7YX9bKbKImm9/IOVE5w0MpgrxoetNFDSVnM"
+    "cyOH7njP6hs7LuqbZB3BtlWyQLdo54ofPVXilufL+1dcPwGthq7x060hTxnFinqgz4ePqu"
+    "FRslR1WxBsdDU15UN+wh+n5I7Hx/QV47V3+hRz3ADY9thkmk+JjxXhDzqIns7fVhRC82cP"
+    "KugQVySIZTqQphttmBVEvuSbQ+zJ/vlh1Ie7caZlHqrThW4WRb8MZMuFv4yXLhP/MrXxJP"
+    "eLVlpx5O8XQVOswrT5xXeajadJ5C/rqlkA8/1JQ4G2MOjb9iOVB6Q3CO5+xCds2DkaSYfs"
+    "KR0iPZ/3omLDaEQZ22j7VlPcJbXAdhIVK7SgEh6i1eyoG1FEoMgGYoGJrEdq22CxoFcabk"
+    "mY0yBcUJhGIWNY1aS3vKUVx+CU+CwD3satwvjbxAyzodAiCxMaLGky48ObzdhqO7Ouvmdc"
+    "rnGBn04nII2uPTK6shOHtLqaN/lKq2uPwJUGwl6sI6WBsKcVmzkaufujfTuYtvf5aN/24a"
+    "z9aN9u7NUoZjPbEg08MDsCmzWvaLfIbo2CSyt8o7Oa7Rp6hDreZKGzUGT+kah0XkdBcN7y"
+    "suy0Glp4Dlka6jO1D5mMy8+7abFTaWw/OCVOnbfklomxAL1jkwtHQob+EOaFc6DmWaymLt"
+    "E8sCr5MRiLfbHTZRkI2bbdDB6AZ99i2e3IhMLjmTOsbvsnzSZ0huGe8OicE3tNPHTHdjxx"
+    "bxuMx7GJ1iP7FJb4Wg+NTfbtX1R0uIUnDNW56tjq/Ivl/uCQqMa/YVJAVr1dAubt0vU3yb"
+    "E8lD3+wRmbC+hW+iHY+Cpm7LO1ue7Cl3p2bizg75EDAX6tYnqLCeavk9bpZq3TONgZAIcL"
+    "1TDynWmTottzpT1aG85aon/uk7t9Yz29w7G34iZWQk7GghNjuoItk5aV1ow0U2XFbiOrlu"
+    "VSwVyTT9eFApKoy3OPeFQN0brxJe+IUEzOK2mmXp9y47Zy6D2RrGy4wobr23IV221MSvr0"
+    "CAFdYcpMSjbpZFstrbdBM2Sps2q7ONK0i0VOzQeTojV91fCAAsnXBGIBBb7t4zC7owJqON"
+    "SS1xhrwG/rCR9rh0/Qx5q5aXDnqKxPFWwW8CLdkpsEXlj6xb2BEdx+YLnLf3DinLyqadTh"
+    "TL1NNbwSuznX0ZPrObtbsJa28j5s+IBTEiYI5dr9DKGRYl42+n0ao+K5Yx06gAXCvDQLZB"
+    "1cAgHMG+iqiyWeE1rApBu8Pi+S9ahT8H3j227k4jw8/hb75oMpNS0W3OYPfxNgSe17vAKd"
+    "8o1AL8qlNOOlUopiLYOrieFQQknuxkOQWjbSn9l2+B7PrpoAV0a1q31LIolvxRV5Rng7PF"
+    "bdEO8tjdUKb4smrjVzQayap1Mo3BZXyS34m6ammSrQCkQlsCJgK3X8jNxr7faxNUhJ6GIS"
+    "0jMtAKRRVuWOPNFiDeNlkzy2MF4fulFCWfM6bVkEM6NSk4xy1j4FlnjQbvPNb2wYJf3xmO"
+    "HKVIA56ae4x/NI57qjWfb0EJaBc7yksUg1THHW1F5FSXkLe8q1MHPW18h0oDnrH/vqkqC9"
+    "cYvRUDU651Hg2dPeJDXhNW59xvWZzEEvXg7/C2+jmxjGLyqcuIwGK3wy/7TJc1gIPgs+Ye"
+    "myF8KI97BWm+iG7j6nXkZ9BBsqpp3/ZtHykwXpQtWNqBz7SWDNbofWf6iSmU5gIT9QEwz1"
+    "HsB/HPAe7CJ7qUBR7/aCx8ZhwfGSmmx6D+rnKVX+1Yq6WGlMQauDMDsF14u/ErvB2QQ3pD"
+    "rSutDhEe+yxjCAH8iKvJ3N8htEWpDXe1qUUw95MuXwjOsU4RCqKwtqaYV1IOs+6ZzhPSUj"
+    "9ueLkPoSPo0TyXAsDeuJ2prq5MpBs0DX3KS8f9GnguDanGjqUneRDlK5k61YW7kq8p8iAt"
+    "PXU7ZuXtZUR6UkMbrjXKY2t2CATUEFw7vhEJx48OxseqDD+JemxRyYfc1L2zItz3RCrcEF"
+    "csBdl1XDL+nMrSclKh5GIbLCNwhFWX0hu+izrtGIitGzuce2z5VGF4hBH6kRRjviyV/j0Y"
+    "64OqxMeAjLjMHLRAGSouEeGhJM8/i5LEoSls3MBoGjNI+7NlxSOv2mYiYPoi+Wlu1ztQ5e"
+    "n7HrrFPEy3GX8neg5yngVDNTTqYu44eFe/63sGuJJpA9KnyJp4L5hXixsXkWrXn86fMwNl"
+    "eyyFCWabDkJtd3l5cIShIshAfhCoRHCBk1HQ/d5qE9YVQpw/+aufpIActgnL8475KnuQ7z"
+    "bUyfw3KpQDvLYWmlG/hmOdeo8gVuJfosF8KkXC0BKrcE5U/Hxx8+fD5+/+HTjycfP38++f"
+    "F9iGn2VhG4Xy6+Ib4JHiRru6eH1Sq0kkhW8koZaBNr61XwzShoiQNaEuMy2Vfyk69kcq8k"
+    "bY1VYI0kW4nnRtsss8RWATUUlJhmWmpsPV/FBTVPviUIbz2KhMjOXwXvjAIJeCHgaeuw6h"
+    "Z5kR7pwrpjF9YYS1VlWkiJ1dKD9iBia4K6WwnPtdbbeznNCqnNKuN+roKWYLztcV9M/q6E"
+    "uJxqK0K+7lxbqEhOtjuebMONi0pOPnEhOdEmkKzsMJUUa8lotD0845s4K+CaFpf4pvBddQ"
+    "mTI94SfLc9m4r2R1dAWy5eKsG97tKlQI1cuOx44bLqvCAnhNzE3r4jQhU04zKtRPKoVBrq"
+    "o4I01EeCNNRxpw/BbnJh1Ka0rAxVkM0/z31fsshemG7f9BYZP9xkm00o2J4n/fsMsp27YX"
+    "8AN8bm1c15f9Ab3QwwMfrY7J1fXVyzxjk2h3e3cItfOH7/vlOukdcX5C30KqrYkBNyMkxM"
+    "KtyGruB3K4a+0F0FWqSy0E3PFWCc63dSqGO3eVK37NOTzPcUeVRVb7ApYTn0pua1hFdfhb"
+    "aaFXylDVSGxt+LM71Zc0TGHNyLiq2aOys5pTOiQLTg92W//m1AjTCGu/hwWG+pjwJ2p3kV"
+    "nXc0LLm6cZ5NTfnNUw2WXUpRvSksUAxLFCi4EjSo9++B2h5qvbRmjZw3KuCE+2OKTR91+l"
+    "QrPnj+pe3YRG0IUdoFPI3tY3X1qdb3IhuW9IoK9vzMxKOojrJQpyJbtQIo8eA8VxSjuw/g"
+    "Ie2FKFg7IlRrtpc4NO0GhbWbpWXomk4dxYdoPXAQkFvU+NxeWNix+HphwSNrbYdlqttUc0"
+    "NgtghIU2cgQzcfYEyZeTquhdfCwz8X9w1VtRgRdbm0rUfABI82rofIma+hnZ0Fv19ZsInT"
+    "mevLNVtHSSya2ip47E9+6HVNJFgk1NtIU0sRicUNqQWWKJ5K+7ExLUzJrPHQZOsv769j6s"
+    "qt8lsBjONNwifViNAwprbFUN3Dms2zqXJvqDNHoSa+7ppLuPiy/ytX/xW0b3OK6kQboSxW"
+    "rP9dLMSB/8Xl9kYrmUy6+agLs46sit4FU9ji1pUInmhTeDfHrdOo5Bq3ClAnDEDsf4/frN"
+    "JJPOuyPBnZB40L9O8UwY31zeALGYp29D4baII1AsepnhZ3TZ5Tk7m2Ocv1CdNbpu460LbV"
+    "BsV6pPUETyMHfhhrB8PqkOjj3tTYokKtSuQdVC96twmvoy0PbTNbNf1BzaEk9Yl1jWrwkb"
+    "bySO1wOVUDS4Isvf1LTGeLe2ewpOC9dE1wBqo55clyeTvb0XwZBIPCcX4ZvkjNgLmq87Am"
+    "XENtTqceLBdHoKu9xErMcg7yqCpROufazOhMQuuW9jhRIo068AlzeLQIF/Rh2FSs1R4M0B"
+    "p6U2eirfp3ukXxVtWozEsBV/NhkAHTth4wDaZ6sRd2/nGBmIiM3hXfN6gCol+8nQBu5LwF"
+    "PNEVhubOT0MeE5FZyNNuc0EW8gqOcPVPL3/+f/1wdFM="
+)
@@ -0,0 +1,388 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `async_qualifier_participant_stats` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `score` DOUBLE NOT NULL DEFAULT 0,
+    `estimate` DOUBLE NOT NULL DEFAULT 0,
+    `finished_race_count` INT NOT NULL DEFAULT 0,
+    `forfeited_race_count` INT NOT NULL DEFAULT 0,
+    `unattempted_race_count` INT NOT NULL DEFAULT 0,
+    `active_race_count` INT NOT NULL DEFAULT 0,
+    `reattempted_race_count` INT NOT NULL DEFAULT 0,
+    `total_score` DOUBLE NOT NULL DEFAULT 0,
+    `best_elapsed_seconds` DOUBLE,
+    `pool_progress` JSON NOT NULL,
+    `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `best_race_id` INT,
+    `tournament_id` INT NOT NULL,
+    `user_id` INT NOT NULL,
+    UNIQUE KEY `uid_async_quali_tournam_5e97af` (`tournament_id`, `user_id`),
+    CONSTRAINT `fk_async_qu_async_qu_a7e5d96e` FOREIGN KEY (`best_race_id`) REFERENCES `async_qualifier_races` (`id`) ON DELETE SET NULL,
+    CONSTRAINT `fk_async_qu_async_qu_a60b04da` FOREIGN KEY (`tournament_id`) REFERENCES `async_qualifiers` (`id`) ON DELETE CASCADE,
+    CONSTRAINT `fk_async_qu_users_148f06c9` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE,
+    KEY `idx_async_quali_tournam_3122a5` (`tournament_id`, `score`)
+) CHARACTER SET utf8mb4 COMMENT='Materialized per-qualifier statistics for one participant.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `async_qualifier_participant_stats`;"""
+
+
+MODELS_STATE = (
+    "eJztfXlz2zi271dB6Z923pPTiRMnPX5zp0qxlbRnvF1J7lmiLl6KgiSOKVLNxW7Prf7u7x"
+    "yAO0GalCiJlDFVk7ZInEPwBxDA2f+3s7Sm1HDe9lb6yHqgZueM/G/HVJcU/sjc65KOulpF"
+    "d/CCq04M1lhd6YqLzdhldeK4tqq5cGemGg6FS1PqaLa+cnULn9Lp3V0S1p6ojmNpuurSKX"
+    "nS3QVRiedQ+y2ymVoa8NHNeSmKsTk2h65lUweuLFRnQawZcRfUp3pUDY/+P3ZhZai66dLf"
+    "Xf+W7hDLNJ6Js7CeTOKtLJNoNlWxr6wfnqn/5lF4vzkFcht68/1XuKybU/o7dYKfqwdlpl"
+    "NjmgBRnyIDdl1xn1fs2qXpfmUN8RUnimYZ3tKMGq+e3YVlhq2hp3h1Tk1q4zvDNdf2EFLT"
+    "Mwwf/wBl3tOoCe9ijGZKZ6pn4MAgdWZcgosx4P1LmmXimEJvHPaCc3zK8cn7j58//vTh08"
+    "efoAnrSXjl8x/89aJ354QMgZtR5w92X3VV3oLBGOHG/ptB7nyh2mLogvYp8KDLafACqGLo"
+    "+diE4AVNIvSiWVwTfEv1d8Wg5txdwM/3794VgPVLb3D+c29wBK3e4MtY8GXxj+7Gv3XC7y"
+    "GiEYJsaiv4HVTBMUm1Fpq7n4sJMD99LIHlp4+5UOKtJJK6o8Bapj8KJuQXyzKoauZ8znG6"
+    "FJQTIFwHyzJTM4R3LTQL0Ptye3uFnV46zm8Gu3A5SsF4f/2lD1OVoQuNdJfGv/cIU7a+0q"
+    "miullQL+COqy+pGNUkZQrWqU/6NvhjWxhvOGPhHaa3sOX4o1WA+ejyuj8c9a7vEsBf9EZ9"
+    "vHPCrj6nrh59Ss3ukAn5++XoZ4I/yb9ub/oMQctx5zZ7YtRu9K8O9kn1XEsxrSdFnca+2+"
+    "BqAExiYA3VcRXYj9cZ2jRtDYO7+6W9JWMZvHbhYNLfVzqwW2Mok5RyIPc8kHhAViqdRWMU"
+    "Lx9IG7Kq1nAmxYP87EF4JEVEsgB+BYFDn5t/o88Mx0vokWpqoi3fl6fufTbNw++PYA4EV6"
+    "PPzlafQuEmPjXg9eClKN/lz3vD895Fv8NAnKjaw5NqT5UEmnjHOrFSV8K22VvLk2X6imqq"
+    "c/b++BbY50BQdZ5N7b891dCBwO6IRNlki26hQIttld+CxmXFWqQi4SMIYyyQZYXNUIDld6"
+    "LHEtUwrCeUWJ/xl2sRzVquEHECPUFRFwkWtmVanmM8d7lETFVtMTY5EbaDx5IVtZfA1Xxw"
+    "yMy2liAP2zrQkBWcRIGNi5KxbhOUgFfA+S0ZalyWtunY1FRD8wwmck9U2KBBXiYz3dRByM"
+    "b1m9gUbsJJFzuoAr3NLx+pjzDH55RJ4taKnL6R8vQrkKf3sfYnZMCT09MSQiC0ypUC2b2k"
+    "yBLvWQbJEf09ZxKmyFqioCg6/PT/MUqcewLUjq57/3iTOPtc3d58C5rHUD6/uv0iZeyty9"
+    "gLfUoVWMKhx05FWNOkO0RWvLM2DNqp7sDuOFW0hWqa1BAerb/o89ydSUy/1kE7vTbsaKf6"
+    "08nJhw+fT959+PTT6cfPn09/ehduWdlbRXvXl8tviG9iHLKA257pKHCEUVb+1EtiPYSjjZ"
+    "GLdoZ4dxLN+42B/nDy+VMILf4oAnN43bu6yqKHmyOqzVy6XInWgmL4stS7w++4GQDa9DdP"
+    "t2FJhJMxnmyVmWUrXETAyVVxdS3BTS644gUXxEQTeiNA/K/D25vixTZOm8L33oS3/j7VNb"
+    "dLDN1xf23boQzfvvhQlj5/dZNaJmSQPpSlgYPtimoPa6l2X2AlFYR7VhBKe8yB2mO81XTN"
+    "gU1SyoHd68D6nY/G1bLnqqn/hzmpVNPsCyilhj+DaQ2a/tsUu+bhWVbjL5gyVTX/EcqqN9"
+    "VdxbBEh7gvPu3Xvw2YRlmoMxNq83vI9cqatwvopOlcf+QyQa3AXAHXgao1dIEuBQwzUdSJ"
+    "yd0Wxakd4FH7HGn7/FBtV9f0lWq6CizKQm3n+nMlYj4MeLcIp91ZXMMV+EXLa3ytLm2BVZ"
+    "L7RglbLLYn0J7MLJvbSSPDKkGrAYAlsM2WIkNb7Qie/8AstMSBgwE00GCSBE2IbqapHc5S"
+    "0yzPhNfUDd19HpuqOSVTOvHmc+iBtI/uxz7KB62KhTSiaKeNdCtOx1Pqqrpory6yj4Yk0j"
+    "YqtI1K3cxBiPBZ3YxreTb+DceWSut2hu41ye/7dWvcQ6jIdnUe0VyqQeORdbBr3hwsq/PI"
+    "fGRijUd6OtaAYkkP0b1tfIfhIBrqRV4UV+IalPLiSlKb87K4gk9hPp2EPsKkE0kfAmmlFB"
+    "UKKwO6go0LmmB0pKMt6NQz6JSTPoGQQZkcQw19rsMLkZhI7fBGGDjpAExj06FA6OhLmFKq"
+    "SZnfKfqDIkQjPE/M52/JgPsOofcowT1wCTK3Bk94JjZFQyCdQq/uTUN/AK7AZgqj63ec+7"
+    "UewTTWH/UpvEUXno2HgGPmevoGLbSPofurTc/G5jEZhm+kusRZUQ2lMeaE6uDt2xU1mW9q"
+    "/B0jqS7+ttj8Z9jnuZNr7KX8YNPgZQh3jyI4rA84GlJw24fgRle6Ax9jtVNAkqhNble1HZ"
+    "3CJWANsSJNK633e7bew4KkLRRXd41KTt4pspaI3ylX71JqjJMCNcZJVo0ROmY5hjevgmiG"
+    "sBZMdxtAvV1E55Yq8N8sgWhA2M5Zuo2ABNuylooFJxslWGSrLOJZarmM73kZR9uVJ1Ce5n"
+    "8dEcXulNDR9t+p6/P4WObr+Jj/cXzMfBtSZ3qgOlPpz3YQA5u14QfhqdUkuTTZK1Lqpj1k"
+    "KgIXUbxW6wEeLRV2DFrZ1kw3KioR8shf6RSUxqw1AJSGmZ0YZsRBgxui2D4nwjSSsT2gBI"
+    "bBTls/kHHOjVsnS4OZOom8jGhmA6kBWbRXDIDlXcSxtYjmbbDru57HHUX35UTbHLx36Bsa"
+    "feIvWlsTq0F5c2uU3qacuTV8zI/MnMnsphmHTZYcJ2t0rUCLpte+qi2i9DtEg7YTbr+cks"
+    "kzQTuqvjJokOTnLRktaJRDR3dIlH1nbKoOs8TGE+uwFLcrchrPyONIR9L92CM9u5J622/e"
+    "ThfS01KWgtMCS8Fp1lJgWq5oXc53IA0JWmIZ2LX7KKwkOQaCr4al5qkHYkQpXGdI1TZkL2"
+    "7vv1z1yd2gf345vPRj5UP1F7uJl6IUBIN+70oA5Prqxyy1tLfIoHepS5ZGAjmwpY0EUs29"
+    "sV5R6sLW04WV0S/sPYK7QcoFGbC8N2ULfowv61n8T7aCiiUIwy+hXYGmqJuIJx0WakkEyp"
+    "XSpCxfckzhgoqVhfpIYxoV7HGXYIRtkEF56TlulENZJRq1XRimsWl6ywkwgSdjDjaeI5ky"
+    "zU2gAxJoU76nzDQM8V+ljmW7OhaZzHhj30GZzFgG7ErxQ8qVr3JgM+dT6buyxg4tfVe25r"
+    "vSClmzQTCLHVXqTQNVwUmlScjsTuwsF0xdPZC6Qgz1ZRgzzGOWMQVTCZGzHFk85RNxgDQ0"
+    "2f+A9XNYdnSMPlYj0bULrDTDm2L9HdjX4T/dscljNrhUikmR8aZugoy7rFJx9nss9iNIrs"
+    "zDpHFlgcbfs4tNLC7fJ2bt0p5LEeMw6zvNYxk7sP4q5dw1dtFugZybHdfsglaiyESCvF3e"
+    "yTuuMuEjtXZMnYheWnn3bOX1BwWxtjx3k3FNs5BDu/+ASXu9EU1SyoHcd6FZc7rWMMbp5C"
+    "Du/2tsQ/gybM5TP19PTV6QpZwgC3wgM4H9sWN39sRXXFkoQSmrCGWqiMGbK5VdTNN00u4h"
+    "tHv4MD1aU6WiG3SWsiUQ78AhGoW4as67IYX03I1BuIHvroheHjf2fNyw6aNOn5Tqp44MYY"
+    "sPHyflcjUVpGrKHj4QnbU+kxSp/EIa8YWsdeDJULZkP975kYevJVjRk2LOUGXyrIjTAL9w"
+    "bs9nIw/xRZBjZVqnmhNTLgM5x6U70+F6vUh3pgMd2PxCctW8mdJk7TIV1pdLa4+ZyFrqCi"
+    "aUH+AIUy2fVobwlU5A6Y24IYC7LwvTUtCkC+du0o81InVWgzGtnjtrt6V2Ggzdi7V2hAfD"
+    "2idiK2NU01imD8AlUrhFZ5bdzcbmApg9wjWq/lNRgdpyJWk3KkEbVAoi+M2WLUArJmKhry"
+    "6QTDyXOmdjk8D/9OkZubP1pWo/kwf6zC8i2RnxpyJexjJIONHI08JCT2V0PKZTnlSMced0"
+    "8ZLvZ+SWvZJqYJfijOIl7smRS00sgAvTxKW/u284I870jPTYfwlO+R9NVkcK7/rVP8/IX4"
+    "e3N4QNpF9niTf37/PGia33jIzCn7He49M1apsOOdKslY7p2TCS1+fj94kXPkEe1/hXVXJ9"
+    "hbI4iOvQ78s74v8d5GJDxHm7SP0FncWkbK66XAXNovqxZZy948ORdb3uMrdp5qEd2w/EDa"
+    "Lniu9nr0q/7rXkEVlseOsxzDnFhnEtyXGJzy02fG/CC36f6pqL9eUc99cmb8QiEPGli1X/"
+    "aS1/N6l3RAZp1f9+VREv49vIDz9dl6sScnGS1wlatLtWWSGTVC2x5MkqONLAs5blTnAcLL"
+    "m+CChf5zIja4dvrCOW9a7X0MHFP8AawLtNsWvaZ1sWQ8G61CTdURzma4qZwgYWAzSjScpp"
+    "2S3SKyVefsmIFBuoSqqZrlXz+di1jqH3WF+bJzZwFvqKTKj7RKmZ0OYQ/gCHBaCzp2R1UB"
+    "tz5LnZ+HVBYjbWyI+zj3PKz7PGWeFtpM3kWAsbMB1G1ETqLerUWzgOrE1rnSdTpPJA2bAD"
+    "ZTg+Vb02soSv6GyUkPX5sl1N2I/TvCbHg2QZ48qV96zNiu21FLSCk3i0O9Z4nLwOmTYPz7"
+    "LHysQXVsKe6x/VakQxOP21F8PY5/YygrH9QIqGou0xAeGwPyI391dXTRBrygg0FUWZCjLM"
+    "gEkEaPrNSgXkaGK5CzLxdMM9ZrenRPMc11q+yYou6zJCieVLcIPLJ0e6o7C2uvlfIxjcN2"
+    "dj85j04Bx17OtHydMiLQthvS5+Exujg5YOcwDmCYG5p8NUIBh4qGuqYTyjBKQBhuTItFz8"
+    "gUfvierQN0h7rpp4eQJykzVFL5tpF2QxHB34w7IJn0ZT6OYMnqoYlvZAp7yjSD6EhkTVbM"
+    "sBwcwwEr108G3P2ZsL3vUrDhF/2XP/PSfPybdUp0sduYjf8FFXyZ1l6NrzEN6VMhO9TTEZ"
+    "FSP56uG7c+CB4YTPKaHYl9aWCBNsZ5tFL8MFQsF9DpeUEmV27o2MNu9Lhfy/Lwj5f58N+Z"
+    "fZubcYzhZbGzLYFgZpJgllWGYGVn9JrYxqRCdBlQbcV6Fvk6GXBzGwmdDL4LOrqkbN0L1S"
+    "Ler+HRsOTzm4X4tzgxVbpW3O4i9c6rcE61Zl9VbGgsJVZqgz2DCBf74lvj1TNhlHiCoVfd"
+    "OCDwgCV860DIptKkJT2qqOQA+abtItUoOyoXpmOcZoOJUrFTDgHEjIgYfF9Gczqrk/8mAa"
+    "58cBdSzP1qjz47kFpDkRRbVwRY0hHtkwvmXKQpO0Yv3h24w+FSh95ScrkZDWGvrKUPYktn"
+    "46TAVJWefOyLjTu7q6/fu4g7rPceeif/PPcQcb+EFRfgyRatvqMwbZ+AE9HAboIH07f9sl"
+    "38cx5/QzvnyNAbHEZX7GHnd+ZYpUO4Aj/YTgBllh1lUWNCR6yP/h/BMRVf8Lv2DF/CN4hh"
+    "YC7T/Emvwb3poPT3gTBtCw5gDfkeUHZL3J0ZymNKRSybnWuTRfycknZRU1Z0TRVkVnKT1n"
+    "gZozreX0v9ssiPnxOzGSGuJ39re57SyAJ1y7qqCcIJI4l8E5Wr+rAJ2kkhFpJYCWphGZ6U"
+    "9qJaW6+VUObCgGZxyEXtKtMB+uGooitlZ5kAn9qgEM1N61EoxtalJiM0SgREnOn3z9CZuv"
+    "cX3Xy7qTKxzQjNtRKkkJPj+rIClPWoMWZGqZP7g8HsbXxviuUfnBL4FbalqrJPCE4qEvrK"
+    "yjsLHUAtSoBZDnpYPYVrPnJWnG3TCHbmrtqZhKV0z9msy5MkBmDdAKbOAysGPTwI7McWJz"
+    "NAUWtfaCmbNoSYeCXTsUbFO4iUl8AuEmKQ/mCzdM/qwm3FzoNpoDfYEh5iKBUgryA9lj8r"
+    "zCG+acCxqC2Ji1uLBQfsOwnhwm72CzY2dFNX2WsuOirdLyXB7+ggxUxgIYDDVrhTkmLbgU"
+    "kpaL+w9yjKSdmEqIQkJSKQRJIUgKQVIIkr6s7QBRSpKtznnWUtAKJElZeYC2LutZg1Fcyw"
+    "ddyuJSFn/1svgXbmcbqc7D7SO1bX1KOwKhXNSsWySd+/Y7xQUKxfJJSorp/sMI0pKAlrCH"
+    "ZKXxosYodA9dmHFOeIeL32HuCqQCuX2hukS1qcCJ+tyzbZj7xjOx0GDpeKuVZYOoT014U+"
+    "jCj1Pd4X9xXl3g7bJcfRNK6O8uhfk3HZv4UAvl8aAjiBNxqOsyt2rsyYKSmed6Ns0T46U3"
+    "8nZFcDZVReDluyPHSOrxR946htsvKKA7CjoYPwosBS+FsEd0Owxh35pzoYxgl9qhrnQpfA"
+    "0DW9WlcJsnugvdQUeob3DESZ4LRPcLz3BT3lKZY9PSJhZGQxh7gu6BvslCkKI4ZVUpR4hn"
+    "ugFdwUgxk4tKAkKQE+Boxc9yC9WB8xdlhahMqrlCVt2xqaJFhp3d4PQ1sZi3mrViXwk/kw"
+    "Evny+LIYuTR+Ybv1RXvvklLbczQJWgKpQ8023vTBcinT2L6PNcAONU21LYbQfIP52cfPjw"
+    "+eTdh08/nX78/Pn0p3chotlbRdB+ufyG6CaWz+y5hANVNVdZkqqdgXxbOTr7806rVtYsSd"
+    "WSoJwdoAmrNsv3qLA0ixWlkSyxzKrVbjkvXHAbjCkcQeCjmLlryAMp0hoEgmZF6jXo/B+8"
+    "dim7vxTZWy3ZSZH9QAc2E8/GRc7Kfjppstdk4Jd+OjLnXHvs/eGXKh1PBOvWjuvExZIAPa"
+    "JvQZTpSRBOjIXURhb+W3J4oqL2TTTCFQwR67+S0tgm34YVkqPTsFGgpeU4RrramWWzkXig"
+    "uFdni0mHQ+U38PnEdV/uwra8+SJFnlULC+cOXFfS2sY/ymiuh9qCTj2DTvuPOUnkxA27ZX"
+    "TZTkDD8Sqp1R7B7QcnUjUHTAhnElNXRzgRVoRaVBdwI26o/86lRB8GVGWbKgrY/Cpxnh2X"
+    "LlGfnVSVO2OTOz6sVlS1Ax+EcYeh6Yw70IwlinpLRgvd4S4V0A2Yr/B/hzVeAi281NgMCx"
+    "p6NrnGngbh2Kw6iP/cH5x0j8nlRW7AdiYSIV7UO70BsFjtcIxd1fUcGaRQuzY99fFU1quL"
+    "6es57O0I2x0r2DlOjuHNq2iEk1St1Ah/LJMo72N+oryP2XIgydWhApxZyt3ZLKJvplMXtC"
+    "dloD3Jh/YkA63UdR2ESkTqug50YDO6rvhRquQxKE7ymtQzUse15aKrOK9q0MhcB3yah2BZ"
+    "lUxCwJHBQFtXDu7HP+/cpk8dgVKDXe8W6TC0oMVL+op8SGVYwc6FZnHSHJQ2+qa3zHydmR"
+    "REu5U3hFh2zm+vr/s3o97odnBGNGuJGinVteyxORr0zv/WH+CowNdB4coAziaDfu8aL8KB"
+    "xYVD1JIryxtRFRI+L9t6pFUL7MXJpCeQFP8OUEqQ4t+BDmxG/AsWs8rODlnCV5qVRArQMn"
+    "WGTJ3RotQZUs2wppohtuTvbtY1N5tDdgdskm6Bz06BciGctvnahfAL2ap64XvWESWyCvPT"
+    "YmDOzzSMHSrFDWa6qTuLkFGCMaMobCA1H2vt7mXcBaoLEGlaGc+w73iGBdXQYVA315Hz08"
+    "RyOPc8nLBR2+uJ9klKOZB7HsjUllZlJFOkcij3vcRa5ky3l+tpUlO0cjD3PphLcVLB/PKK"
+    "MZKW+OwVDdg2Siu6uptnTBNDGhK0BNAdhMVDK7YCKHNLNapgmSGUmGYw1c1H3VV5VfGKFs"
+    "ZcHjJGXow1W365BXFdqFMsJNJJGWFF6XSuLqEnCl3pjjWtWEEpn0EtZqN26EeknfzAzKnS"
+    "Tn6gA5uxk3PnJUVbqKZJjYprn4j2lVrLBYr6Uhhm6KQJOIVnDSa5zWKlm2OZy0yWl22byW"
+    "+0BiyHjOF5xK9xn3ZZNIXLV1VTZzb4Lgq6Th3XKxQMz43+bs/cTR8Ln5QlXU6ovSEygQt5"
+    "S4FYGerzxhgwS/ddxKmtWKD8OlUcEKA2BOSOcRpS7ru8qwWpw7MAuJg5AF+CPKkOWdn02L"
+    "YMwy/6foSU7C/MJQDvsyQTbzajNjvw1QRkUGNBcbxJUGRxM0CjDZO949B/QMsmWyU3lDic"
+    "Qtd5n+zWpCML/in5me56Utb7iYZaJNuylnVgMvAZDnx+O/tWe45jabrK02QnM46QI31GVP"
+    "N5009yHUemYBXP82eKrfIvuDXFdhYZPNU0Qadb4ELETdSKrZoPFQBMUb1SqZtXJqY8b4Uw"
+    "SDTf1iOibaW557RMCNlpfgTZqUx2cZjKPqnFPdCBlckuZKxOUxS1MupkzagTGeRUNshpj4"
+    "EmTHzPE84C2f4FySzQJ7ycg/MbPISpkn4c3F4THUtqLtnZlGmQ1EBcfX/2ntdqYr14k82+"
+    "uQEfKQDuXAD07Eo+an7zdtYUOi2V7+K0IN/FaTbfRbxnGSDzfVFTZC2R/XbtjyplwYMQGa"
+    "QseKAD20xZsA17ckaoqXLOfFEACmwi2xZ/9pjJv6LwU9/RPOmDIjieZ5xU8o/o3Ask5h8j"
+    "rSdN+1CLDs9VC3PWW5LzAGrZ+15QFYWQJFVLjs47QFNWjJS59+RBtSMlkFc0sBkJROYQl3"
+    "XyNsazrNxRQyrslCxH63DPbeQBqB5PyYrCWiz4QiCpJUMz8sW0ZDyIlNGatnR1GyujHYRc"
+    "IU0cWzRxSKGtfqHNz5WvUBPftGoqegG1xPfFFBHMS190eKmaKCJiJOsApGAHYBRrRU1lqZ"
+    "ueSx1lQmdw+K5wMChisTth59O7fZ8XYqDS3zzdhlkXTEWsDlt1GufxkDM4Z+Hw+71+jqQ0"
+    "g5acLnZwWvNXUVEh5gpTuoCLnNQpI0YKozWPHUVs5PkjKZAkSrLPdMMVebOWKwGVx2uHJW"
+    "hVg41mOmjw6uqMwK2xyes9Kbc3V/88I77xyzKN57F5c3vTh6GwTP5eey9Uy0GcejbXiPln"
+    "jArnk3wGuzudvD9p0PEkkeJrvXVFzEGu4gVAr1UVPJ+DPJxksgWgVzg7XSzVLMZ/Hd7e5G"
+    "CcQ59C+N6EV/8+1TW3SwzdcX9tJN4F8CICxaqmtFapmzSkIYO0qgmeDtNfKcpuVLiSCOnl"
+    "OpIWccyptdT/k3ciyZNr4lStXC/qjwRewVymsIpSg2rsOGDD8VhwmshfLvI5yAWjxIIhnV"
+    "8OwkdCOr8c6MBK55fONjTCqsaNEMrKtma6UTEpcx75K82SEmpsJ1bF7KQCyleLYXA6VPwT"
+    "TUUgxeSvCE3p3LZF57a8z70GNIOUbV+sZs7NslgK1rJyWCZ2kpoAxfx3dxHHVoMq2mnLIJ"
+    "taEWtBNuB5F7JsMbTiLaMl3q0NWlWTGo06MvBGXqvtT8PrOeqcKszjCnnVhMs9cm0ZKht6"
+    "QecZR+eebogyHF+r5vPIwn9LLm9+VvBvyG8daPcYKszeQEn5fqffx8b5RadK0pQZ6bo5hp"
+    "bNRuOBPsegZhj7C2Q4YH6TTNZ8d2Fb3nyRuhcMWjRcwpUWrisZ4P8o6QFfkO5VuKSU8YeX"
+    "iV9b6hYvVbsHoQGUqt0DHdjMSUnW+FlrBZT5NmVhpOYVRpLpN2mj02/eWK4+0zUmcF5Z84"
+    "7gyJxuUnhgNmONFcOalzswd4AvsWbEgan1o+q6dLnCEhJxZk42/2YZorE5NkcodDvoYZq4"
+    "SaDz+iO1n4lP7PC8nd5UR88roppTaDLx5nP4VTJr5/dwwscOj9Dmeyd4GMuD7zmiJr4ghj"
+    "P/VykG1CwGxMAtj1+S6DVtjfE1PPFNL2HqW1XmYA71awXT9/uGaZrFMN+9K0lVg0vXev77"
+    "f555JnMvIxNPN2CVdN7iY//S2Xj/3Jmnl2AdzkzkErEUWS67m9BZp/3OXf/m4vLmG9wbm8"
+    "P+zeiMvB+bX3uXV/0LmKljc9AfDf7JGnxIb6OF0/7DyedP4YzHH0WTfXjdu7oSzHjbtmz4"
+    "8p1AV53EOz+sPkPYEm/RXQfW29SFmahZnkhYyfeVSFLtc/rubTGWusGDUCFldYMoE6wxqj"
+    "GyGoa0WStPg0YweG2p3j38b1NgCJfayU21k1Kr1h6t2tCbxCEoVK8l2nZL69mcGFlJhRsO"
+    "PYnTEdciTMp8SetWmhJVb9jYIZpqBhQTis2dFdWwpU/HZj/Tt2kLy3IoWVhP2Awac5Z0Ct"
+    "yG1pJyAmhrU7IC1papGuSIvp2/7frldsLkAkyZh/PjTZdYqK5jVGMz7ux5/KRPaUAfK1jr"
+    "n+6IbhJonluyJ9L2JRVFOSqPhP/tr7mawyjfVVormL2ZdumN3ZYaxLWEg7U1iC8rDRqlTe"
+    "zcD/sD5a4/uL4cDi9vbxSQQm++obrg/bt3Y/N28K13c/mv3ghvXfcxJFTpXVwwdULe/UH/"
+    "+vYX3uJ9qoXoOSfvTsbm6PZ+cNO77t+MlPNBH04ncOMDPiB2A84bA//G+8SN/s0Fv5xkdH"
+    "93ETD6MDave6Pzn5Xh+c/9i3umDvmI7PnVQT9x/X1w/fz2+u6qP+JXT8KrvZvz/pXfNuLc"
+    "H40ub74NleH9l+vLkU/0cWwOeuf9xMX37/yLvbu7AUfq4/v3/rVB/6/9c78dPPHq8he4xj"
+    "jEevj+NH5ncHt7rdze9W/4vU8JqgCzj+8/x69/vby5HP7Mb/wUvxF/ufd/GpswGn+Pd/Tk"
+    "nX8tHOWPJ9D3y5tfLkfY+/P+Jbt6iuj6V3vn5/27Eb8abxu86Sli61/t/+PucsAv7l5FVV"
+    "bD/fI33kxtd+ficnh+O7hQLq6ZZrB/3bu8YorBv/e//Hx7+zdADjbY6yGM6s7Bl3kh64/N"
+    "l4qtgxCepVbkQAe2gfHM7Qx3lJqlNUCTmqUaNEt5X28N6FWMrG1ucF0NVSO2qaaL4/wVjj"
+    "2eTb8aqtAJLq9pt0hJl3j9GadSZkBWUknnP4ggCVNnsax2MDA/TnWH/0US6qxQr+Y/TKC+"
+    "q4EnKvZ6hmE9OWR4D5J97+L68oap9Xj2oUdqPHO2lKjTR5zr05CaPTP+AKc7Nlc2043gs+"
+    "8viWZ4rkvtbEviLlSXYEJIVOyRieqkX1WopMt8nf5IYOBSVg1X2Bp1bvELcD/INCgVbnUr"
+    "3FJAryGNpzjsWwoPvj19ipMd3sfevTPOWpk1m5RNs/P3Bfu2YTHQneDrJ/Cn30m2bEADkv"
+    "6QmyKb+/1cQ4RLUjbJQwEHxWSoBwPypEYjcoQ0RJ8RzbNtmPqwfvPNhk7fbDwyTRL0Sjk2"
+    "mJYwU3C+H1xIsF//t84t+0tlXvRor5tYnkueFs+iMf8xGODNx3cbLnNSP3YQahSpHzvQgc"
+    "3ox4Ktb/JcTcOToduvbqwTE5ieFla4Q8Z2zkpHwtp0Z/vXPx6eLk3mW+tsqBYSrwC70082"
+    "77svC3Fm3UsAPOyPyM391VUTFG+X5iMXlQp1bn6rbll1mx61f1HNxnkTLGXFhMd/W7rJA0"
+    "ATMmRWl1aFUGZ+2bn+qHJZi02KWOwevURO+vfvyiSlh1a5WenZPemZsW3tD46a51QqFRQn"
+    "eb2mXadyhFuS6FUGuNHfVzrIYOvoGhOUTdI1vspoKKmwOgi9hlRYHejAZhRWwWdXVWGVoX"
+    "tNyhSpkZIaqfZopKJPdXcaqQZjmFm5murqNaAAneN2XlA5Bc26pV28bE5R0rvrGrllnJx4"
+    "7CH+EXDL6p1KUyZDMP3LTOkYtrVmxKRPKY8s8rTQtQVZetB6QscmvL9tPdIpmTwTNe70Na"
+    "HQC5pxt0B3DH86cG8xF/o+wQK3Z2OTwP/06Rm5s/Wlaj+TB/rML+JYnBEfdnhYgiPe5M1i"
+    "MJ6R+IDF7/CmdsALJuUZYZGrqH0NL2c6zsl4Up+wK/5vcrSi5hSGoEsCPLrA6t9UA05vgg"
+    "c+6vTJf15K5xvcYw/1uxCnUphZHV4paWaf2dYyoLXTr6W6ZyR0vQjGF83wPvqpXuU2D1qU"
+    "01R+78SBxa+dOcb5uZDY3/EuSte42lWb7L8Z5PJVm0H73dX6FptBCj7uknbPVF3vcoW9iy"
+    "p7Z7Se8S5nIM730kmR7dtXJ2ddbKY7Tl4utgJdfV7etS1O6Y6//ndy5zWJurX/EvXxXaXK"
+    "RE7T7XsmF2yHzZzNib0vA3yxUidNK9U6DdPXxc5S1cc2QSp16lKnLr9RqVOXA1tWp56WOj"
+    "ODW5DsNEO572CgEtqIkufIumvwRjqMqiCnCZvlbCtSwOwO4gK1fHx2tlGVXN9cLqtrFnzP"
+    "JWqhRvNzdyg3cDaXBzn9PTdVo995QZVfXodfSnWfvxVLL89XpgrdrZfnyelpGS3R6Wm+mg"
+    "jvHZ6+sxb5dRu6IOlCK5ObSfGuI+X2VzSwYZXvzFlQfEqMJoDqPJua8punGiw7xobl43vI"
+    "7b8DZs0c9LyzeOK7YCXpwmp6GwCCfPwSfk3dmYuRsGHL3BCEhIsPsGvxvGA5ylaWoWv6pq"
+    "igNHuHnJ5bjEe2tvz6gFxwXt+Q1QFAEqbFV3gG/VrAGQZM+4+tq22b8j+AvXepaAvVNH3t"
+    "wPrgDBmzc86rxaBE9RA2BKSt5Y/TWXsKCm6sD05R+Y927tGZRIf17NWprIstnUY8Lr1GWK"
+    "LA+JYisqTLycZH/Tgi14xhixFZUXupO87ma0sclbuQaZuRAZGUugr+dFaqtul3dMfY3QTc"
+    "dmrNSThoWk/wVHLke/ST6P2qpcd7QXYChoptWUtlZVszfWNBagD8BsDujnNr8bRCZGzlkd"
+    "pR9arNobF/ifFrOTioNFMm1qYHwYHP6ovltjd0LCk4hGKVqzoPmwoOAbMR8Grv+Q+WVMzk"
+    "XOPeNeQcWzZPdmX89s87L5jAo1NROUP4MmovzeE1Tpdtm8MxB9VaJpQEobSgSNOYHNhXUf"
+    "dnH8MpC//I1BD7xnOrqSFkGSW6cYHupNVXUR0HsKvBHJE9FbfQDLyhcFFS2Xitms8jC/9d"
+    "47PfTOO47XN4wQRm76IUyFLJN7NxxsEBS6TQtmw2HFh/JrWURLj7n0c4doLGnKXf0F3Ylj"
+    "df5LQRPyP3+4PrSmZo/igte8aQeEH+TGJWTgZN9l/KoU07TnQL5NDY/K7qoS0g3XPeivKo"
+    "bj8pr3TXlnVhpJgt9SevcmCl/qSuvVuqAtpYzraE28xGMtv6vjNNlteit0rLamnpN19eS4"
+    "hgRbJaRrDbqrwWKgNyxbW0k4tAThP4weQLaEIfnCrZLjmDmJNLUYLLbGPMJxl21SEqFiLG"
+    "csA2/G1O0wWDLbJQH1mCSt1GNxsCGwArUoy5Hq2Zz995S/qqtogew/JlTihzzGFZL6nOao"
+    "6q7EnwkHSNl7F5NPFczFFFJpa7eFM57eU9+5BiPYiKxJIj+nb+tssejfeJ7yaE9Ur8vJNT"
+    "3VkZ6rPCef3swWw4ntk6Nae81ibezE2hGSTYil3FtKAYVx52h9NhD2IEHIvIdwnmr8NTdU"
+    "UOTJwwDlWMQSIJYL4TlA+eo6y8iaFrLIelXwI2jhgOv+46wZgS1aaEUwAIj7qjwwzmrKLD"
+    "eiwfZsQok0AzOgPmtjdUxyXwueCIlU6jGWhHf8WUmendhV0MX1om0ZSR4zzXRtFCwZaE9H"
+    "K6P1VFbFWqAnSabt9ZSwvW03WwlllLc51iw1yP4exufO7SaIXOwP5ShH9Et+8I/7CoemxZ"
+    "cTKb58YDIJMASIVOV2rqXsPANlBT19DgjfZ7Q9UH7H0JiXJ3qBboSHfr4NNEgGvzAMpbJH"
+    "avem7oArFD9fQWghBTysU9xSF2wg6g7sahJPZ+WM4FDrmutdlwCCIVN46XMqfWUv8PtTmI"
+    "O53CccD0QKlGJtSwzDlTrB4hHVPSzg1rAkuI/86bxixuM24mfzK+rBYv68GUVpArqU9pE1"
+    "15fNpWUZsn6JhqGtXmTqwBW6TYuOKCMYcZ5qtAu772s8v0q3w1GZvxzwdoLCY8ci38kw4T"
+    "xvRV7uEDKirEGc0ZGS1o5l3iqmi8z7TQE4qF1+e2amLy2VjvfIWvair8dSLlMaNDPT+/Ea"
+    "qNWd91J/1AZMGRELDgN8qw4AAKWPAbL7IQaa6j12WqaB+FAtV1iqCM7vp7J5rQfG8JldcZ"
+    "tXaiJVNjJ9pKJXaNSuxoZlfUPyUJd6iAyln0zoVfYjiVGqV7CpeCNTCPCJuBeXbpaizm/l"
+    "G2OuYRYTMwz671zcRc6lgPQRUndawHOrDZJGWpI1rJ41SabN+lUeqT1duvW60RVqb7C0Sk"
+    "DLKNUKsmtsENlX/Vszs1cgqX1f6lP+LDDVKtZSLvIIB1m4qsdPItgfpKkJ8rX2klTg72sq"
+    "pqQD0HeRAAcqbPPZurvH0mTBeF/RjBYYDgMwg+Q6C62oCPUFmRNiQwbNKaCqmMWGs7bKpH"
+    "3a7D+2Q1lraF98FWZru4iKuCCmC5H3iKanfHuPen+/7UY9mgMQWgoS91gciYi1ySaHfAnX"
+    "xsDnAOSwcOT1SwSJtuU8HeUqjAEjPYuyKrjo+8Rl0VE4vZl1oR3iThvh0xm4YqmgkBrGVe"
+    "3pVCZDPEEt0Eugt9StcFN0MrFwTR1F3ZlIk22kKk6ywxfdMM5BQWoLzUp5uhnGYgURagbA"
+    "Ii8LWj3mN9pEVMJNrpiI6gw9UQThLKBVlaEw/Q6CStiQc6sA2M2NjHcMrcKttQ8e3Wed3Q"
+    "H6lib14gJllB9Aq4DnZcJ2ZjnJNKvL2UdGsQGNs2ySWLvuQY5TKVYYrNcoLKNCXsckhI4o"
+    "Qpy9osm8NEYJVbhws6el/QmW5Sh/gaSzbjWGPuIu5acEej8D0R1WdPp8yuZxNM9osecX6N"
+    "SWB3z2iWnuPyZC4qMXTzAQgCi+Db+ZyommZ5psuc1JeUumSpm/rSW/rWwlg/yhsNWR1Rfz"
+    "FiOYgF3s7ShrjGBtktsCHGQU8tUPo8F8A41baOGtsB8k8nJx8+fD559+HTT6cfP38+/eld"
+    "iGj2VhG0Xy6/IbqJw2JWCgvmcSV0Y0QtO8ftA92qVvAEkTSFx1y+XTq3bGFt678Ob2/y/L"
+    "3jVCk47014ze9TXXO7sIk47q/bArfz55lnsjRjZAJLk6ubzlt84F86G59qRAgjHMXW8rRh"
+    "vJuUFpFB2lru76B5B+nc1SJDt7s1o0EGc3YcUeDMM6N6ZetOllhqE0XwTn9bC1hOJiHN6L"
+    "1BpoBDeXW1d0QnbQlS6X14ulGp9D7QgZVK77rOPlLpvWelN4tUqLGINard2l7Iepv6XjE+"
+    "Ap1vLpD5el82lmsrfy/Nqf6oTz0/RfMPjq9aTShy4StzPUEkRhViVPWO4PaDQ578fBZ+hu"
+    "yF6pAJpWak3UXFbCxmh+l581WxjymoWKyS1L1uWfcKJ/lgvKrLAHFKKVolxYAAmzWOiynS"
+    "Gs6LzYrzaNDxMHjtwoM/91NENUKFNSZJtLtj4bt9rzUp1bi/AVRcXNKkcnXJh3aNFUZALl"
+    "eZPa8ymJJL0RZUe1hrSAXkckgbM6QKtW1LEHqfH94popUxnrKE4+Eq5qTG9UAHNqNxbXNO"
+    "nb2dpuP6kWrgCShfE4gFauq0zmlDNXXLdafdlK5aMG8ON8VQ7eg1OI0Q7nlfLLeT460c3O"
+    "6+5KfMkj1MLLeChzJL5wMkSa9isR9yTltUQQ9dmFAOue157uIEk8iyimjwWOZyHPQNvYSR"
+    "XvenG6qv4cV4nUA/hfkRFnCMW2WOHc1a0ekbgtUd/aKQquPA7EU1tpUsN5mnzpZq6+2qrX"
+    "2XP0FOl3ynyzjNfgv6hZM76BIr7BkU/fxBNVx3Zf8AfznL/3z4Ya3qfqdlCs6d5tebO82U"
+    "m9MMHb4x4cmjAPM40b6L+gWrBesTubxYB9ftuL1ylBwKC5lA1HkR3oiwWRBH/WoEzC3NVd"
+    "b5GpShxA6xDY7VCZhYzYH2EHKYdURlkcshvGuN10H4bXaims58NmMBSmric6Ybw15nzh4V"
+    "Pj44y2sGHAOrrB8Zwt0tJJ2hulDxmPEz70Mni/4d6wxhnYuvLH62Tb/z4aGkdzUa3Q1iLP"
+    "F8MrzOXPjXh/iltc4uW1mhuP+K8LTdN71lRixN5wP0ifdpyO2ce7aN+yqgZ/KK9iTqWelD"
+    "+YeTz5/C8zj+KDqKD697V1eiFHf4WGVJHQfEzCpLfpZyz6t+bzrV/XWf9w3ERfgSln4lN5"
+    "sw8wuJdbh5+wE3FvFZsYH1MMWgSfbDDspLMD7LFbFmvHyR42kg0jszz4h9EJuPT4NU6eWN"
+    "jP5Xxe2Faw6/gEfTZwD/XlmPX9/AS7PnQVjHpNnzQAc2dEfP6PZf8ut/9UlbcsNzuCK+Bm"
+    "Rido72BpckcOKCPavoUBM2WEpipzs8DAZhhius7Mm0ArbfhYYGhOTNomLDWnrClTOyKQnD"
+    "UzmLWy/8XPDMpJKEVc21Xk4HVJVBrNBsorvY1nMocVZUQ5sy0juBwkGHf6MV70eWRCA/Ts"
+    "RXeyYizGSYyPbDRA5N4RhtJah3jHrZFLVjYHNe4xiYIpXnQHnAlwO7A79G3KUr7TARwWty"
+    "yJPB99v1avRPSDU4M8Y8wZqHYllHvOgje9l7UeYtyAGxhrwFuxDEmMhaIH0FIm0JkSsUpE"
+    "uIWezwKChXKBCocpvGIutRr01R4LJW1IwXPyRwgjVBDMNfeGr1Fblopfq3pcOJrzs2uZAW"
+    "vCxmXbXsaayxzyQ09MKdmW7qzoLz0XBGGwZjxdqE9Hywp7yjC3ZBs7yVQbmYThCkB5TcZz"
+    "b8ulZdbdElrAQFXDwbm8fkC3Vdlu8V7hv6jGrPsEVziZ8lasU2dzZ9RF9OtL0BAPZqoaLj"
+    "JaNBLzkHG/VVRwdG8JHYz/hElE05sAwnbIIvfxyKm0vqqijcALRwMOBmPOm2uXMxEgewig"
+    "dF0H6/7ppf4Wo0AVNumj9qIMYeT2ESHb8/+fCxQR4PzfCRXV8bmPWSTTnINsQxltXQrZ4B"
+    "Nka0d6RxbjMXIAvEshDmxs7sPF+egoUkz4Fn194mgQsP23p9+/URbvNdAv9MAdgu0U0syY"
+    "xiqdMN9+ZutDM3ZN4fpP25ww5HbLF/UgUHrJLQH4qK45XorjpXMXcS3s9XNtB712U1w4pY"
+    "t3priVJQNRzjJLUgue6xt+c4lqaz5S8yzxHWPXKkg8RlPpfdiQ5P39WM6bqhCmzYH5Gb+6"
+    "uralqb1OzOQn9r0pEF/5QE/jrg0rp5XRb++CddZgA2VIWZU2up/4fad7AZ0Jwo31SbbrFK"
+    "LGiNtXGheUm12DWyYkZ+1Lrg9I44EZ9TVkNWigp1ULzrPJgXg62Pg8PaP3vXV8mY4SAsOO"
+    "QDhC6wRkajBX1mPHwVJzCAkbSYPOSs0BeBHLEEl5ad8Gkg1hOcB99wlwcXuj/xXOqcjU0C"
+    "/9OnZ+TO1pcqSK0P9JlfDDmekZvgT/7F89ciE2pY0CmYlpwAH3tGMBSePC2s8DCKajmf4o"
+    "i5UASKN9bAst9w6uh1z0g04AS/PnLERegucZb4//986BLLcuE3dbW3b6Lu8qcfzwQRaFEf"
+    "+BdJnnR4FzN6y/8bdcDnGJsfZ0QUbYWKvKeF6sbZTy3qcPJg0M7CEXbxy4VjOtayIEdIBB"
+    "MS85j6tIlJ4HdCd5SVNzF07YxE/gDh02AwHnVHh5nP3FsMnhLV70Akt5xFSlSfMCYt+IMX"
+    "HnfFjZkHM3xtYQZNobdLiGZQlCrEFH+xzzrt/FJIBG2/p5gEiQrYrRAdUcvocVIrWqNWNA"
+    "lyaQ1SgmrvKqSXFxi2tDRDddHWSODkYuwvJkHnqsL6/l0ZXKFVLrDs3iEHAgdbUNPjgYOd"
+    "MQt5ftWsOM2+amaJ4We7e7SDs00ez4KYUpzv9RuPwlaqZ0V7Z2YYXnKSjOj2num284vg/L"
+    "Mx4LLAjvSe675G1fLrG9iMKjktjpSUENJke1YrvySykyOkY8Kxn1rMV1bsUEl6KEk2OwU6"
+    "j0aonMO5WYPimeuxbuIcD2ZSl9WQpr/1w80zufnULovpBgkoZSiqMMRyhaf4qeJQOt0QjT"
+    "vGaUi55m9nnztfatiMw5dgesjw4dxvsx4LyFajLofagk49wG+kOg8dgXkj2aBbZNtwgqaK"
+    "C21LGjZC/gSJCGObNWQIW6G1YEDZ526i7YLfc1Hn7ecahSHVPBwOuBT2Dk0S1H6E7qAZIn"
+    "RrxdMss2Fg3wMGPH+pIDqTHCXznPpc3pBodU+0+K8by6Ro4PiC9ayPdZN1lhtcYKahOwz0"
+    "C0T0KWW1vgxLnfr9dlXb9VZdgslVfdEdWqIGdKI6uUXAMopsgdd5FFHIFNQm/d1VbM/0j/"
+    "6xu1JNvdYBMl9N3VKlaXn8ZJrEbWypO1OC4uLEQRF93i8neUvQ71sA6v8DJO6rvnJ1++2M"
+    "vIM9o3fOxHjl9q5/owxub6/PyPuxeX7V793c3ymj2/vBTe+6fzNS7oe9b32Yv2OzN/znzX"
+    "n8FjK4vR8pwOLi8gYYfyhodHmj3A1uvw36w+EZ+ShoODy/HfSV897V+f1Vb3R5e3NGToNm"
+    "V5e/9BXsM+vvGfk0Nod3/f7Ft941PFi5vL67HYzOyOfoDe6uoPXPt1cX/QG8Qn8AD/0p9t"
+    "p3t1dX0bvDzT8BR2AIN26vlEH/6+XVFZo0gOH9cITo/OlPlSTFWrLi+dv1JrMww2PfMxFe"
+    "sz/4pXfF59sAhxnm1u1Nn80UwGrnMAdnIcx7bJmio3j+di4g3a9eaW+Rt5oNL01/x6OoI9"
+    "yPCqJEsqQt2ZN2EZwQSRS66MBUrMnOUjcpB18te3+DlNfBaxeaJdi5gHsSVbGvpsj2ZWLt"
+    "/HnmmTxX7ATFON103uJj/9LZyuhuy7Da/uwzdaBboxWVpfyMBOcqa1SKVC5Qe16gUjqQKk"
+    "OZIpVD2YRkvjge1UMcBaStPJTV7+0XIrNeEdYEZUsg3bXuRfrkHITrhvTJOdCBzZgyg89u"
+    "8lzNRyRD90q1J/vPW9ZODAt8avabe6s5LgfddVNvib/vGqAs6STTXAgzq1aTcpfFfEEEvg"
+    "xJT5ECRwZooax8pUaJlGXocnQc+X4kYiOZZ4jusoBkC10KNEOFPXoqSGe2FhtWwRWdaJgr"
+    "AfeqIZNnchSRd8NoP2WhOos3b8mIOa3wawSvEd0Zm5q1XHmh8wo6ttDf4cWjlp7DfSFsyz"
+    "BCxxfgbhE65X1Tx6bv94YbJtb90VTDeEa/hZVDLGPqv4zDnzGhSITlsTAviOfyAFD+ukv1"
+    "Gd8TudmP2CnLJmrkruHHGCNk2J2ggUm8FbwHsB2brAnzyDDozCWeGfLSeQQhzDfogzebQa"
+    "84+5W18gw1iI19S27hWwZgONZw/MKYxoTXD/w26SPQRy9B1Dl8PqX9MpKxZ4mRwgvRs7mT"
+    "Rjz+OX5PumisdQqRkYTNiSTMzP2yoGcI94378Ofe8cnpJwzBxpVCU03LxJUwWkrLR14lUf"
+    "/0sQTqnz7moo63Ur7ttlEFa795Ox2RTkuFaZ4WhGmeZsM0cdJVLOUcI2knkFux9q6ovVQN"
+    "3XyoAmWCqCUaxR1MSmdl6VgvteLXnSKTeB5mVPAwfaIPHh0ebMvtTbs2Xgeph6uMQpymhl"
+    "FolP1hKyD7AKCGRFT9Kld2yNDt29vuZ+uJYPCVL8q61MY8BP7zMe+OZT1ghlCy1A0Y/siL"
+    "bQ8OZJEklwH8BZtPgrJJRudOmKknjI+JCck8GA4DZB5VnT27WphM0+0GpUzU0tR3EBah7M"
+    "A2IVfl+h8uyyLIo1jDTzelaItiWVOKtD1FaHOFXTXEEzR7hrz2aMItG5iiINsN7SGi9Int"
+    "Rb2sESUx9V62QOUkB60M9rrpQRu9lJTFPDdz6J5tVt9YuKgvknUEZqtkg26R5YqHnipxyf"
+    "Nl+xXnT4CroWs8ujXUU0a5oh7o8/GjaniUrFTdFiQbXY9N+ZSf8McZuef5MX3GeO1HfYo1"
+    "bgBse2wyzmfEx4rwBx1FT+e9FaXQ/NmDATrGEwlimU6k6UYGs4LMl9w4xJ7sxw8jP7TGmZ"
+    "Z5rE6XulmU/TKgLZf+Mt66TP7LlOFJ2ovWOnHk24tgKlbRtPnN91qNp0nKX/apZgHM9ycN"
+    "CdqiQd+1H6kMkN4iuIeRn7BhcTRSHXKg6hDp+XwQAxtmI8rIRruXmuIuqQWyk6hZoQSV8B"
+    "CtJkfdijICRTIQS0xkPVLbBokFvdLQJGFOg3RBYRmFjGBVE9/yklYcgzPiaxnwNpoK472J"
+    "CWZDoUQWFjRY0WTFhzfbkdX2Jl19z7hc4wE/XU5ACl0HJHRlNw4pdTVv85VS1wGBKwWEgz"
+    "hHSgHhQAc2Exq5/9C+PWzbhxzat3s4aw/t24+8GuVsZibRwAOzI5BZ85p2i+TWKLm0wg2d"
+    "1WTX0CPU8SZLnaUi80Oi0nUdBcl5y9OyaDWU8ByyMtRnah8zGpfHu2mxqDRmD06RU+ctuW"
+    "NkLEHv2OTEEZGhP4R14RwYeZarqUs0D6RKHgZjsTd2uqwCITPbzeEBGPsWq25HJhQez5xh"
+    "dduPNJvQOaZ7wtA5J9ZNDLpjFk+0bYPwODZRemSvwgpf66Gwyd79i4oOt/CEobpQHVtdfL"
+    "HcHxwSjfg3LArIhrdLQLxdub6RHNtD25MfnLG5hM9KPwYZX8WKfba20F14U8/OzQX8PXIg"
+    "wLdVTG85wfp1UjrdrnQaBzsD4HCpGka+M22SdHeutO83hrOW7J+H5G7fWE/vcO2taMRK0M"
+    "lccGJM15Bl0rRSmpFiqhzYXVTVslwq2Gvy1XUhgVTU5blHPKqG6Nz4kndESCb3lbSmXp9y"
+    "4bZy6j0RrZy4wonry3IV522MSvr0CAFdY8tMUjYpsq2W2dugHbJUrNo+Qpr2ccipOTApOt"
+    "NXTQ8ooHxNIBaowHcdDrM/VUANQS15k7EG/HZe8LF2+ATfWDONBveOyr6pAmMBb9ItaSTw"
+    "wtYv2gZGcPuB1S7/wYnr5FVNow7X1NtUwyuxmwsdPbmes9aCjbiV92HDB5yRsEAo5+5XCI"
+    "0Y87bR77OYKp471qEDWEDMW7NE1sElIMC6ga66XGGc0BI23aD7vEnWo07B/sbNbuTyIgx/"
+    "i73z0ZSaFktu8x/fCLCi9gyvwEf5RsAX6VKc8VIpRrGZwdnEcCjBJNfwEJSWjfhnzA7f49"
+    "VVE+DKrHa1mySS+FY8kWeId6PHqhvig1VjtcLboolnzVwQq9bpFBK3xVVyB/6mqW2mCrQC"
+    "UgmsCNhKH36G7rV+9rEzSEnoYhTSMy0ApFFS5Z480WIT42WRPHYw3hy6UYJZ8z7asghmVq"
+    "UmCeVsfgok8WDe5ovfODFK+uMxwZWxAHHSL3GP8UgXuqNZ9vQYjoELvKSxTDWMcVbUXodJ"
+    "eQl7yrkwcdbnyHigOOuHfXVJMN+4xGioGl3wLPDsaW+SnPAalz7j/EzmoBdvh/+F3ugmpv"
+    "GLGicuo8AKr8xfbfIcNoLXgldYuaxDmPEezmoT3dDd51Rn1EeQoWLc+W+WLT/ZkC5V3Yja"
+    "sZ8Ezux2KP2HLJnoBBLyAzVBUO8B/CeB3oNdZJ0KGPXuLnluHJYcL8nJpjNgv0ix8q9W5M"
+    "VaYwlaHYhZFFwv3iV2g2sT3FDVkeaFDo94l02GAfxArcjb+Tx/QqQJ+binSbnqIY+mHJ5x"
+    "niIcQnZlQS3NsA5k3Seda3jPyIj9+SKkPoWvxoloOJaG9URtTXVy6WBaoGtukt6/6KuC4N"
+    "qCaOpKd1EdpHInWzG3ckPkP0UEps+n7Ni8zKmOQUlidM91mdrCggU2BRUs74ZDcOPB2Nn0"
+    "Qof5L02LOTD7nFe2ZVqe6YRcgwvkiLsuq4bf0llYT0rUPMxCZIU9CEnZeKF20de6RisqZs"
+    "/mHtu+rjS6QAz6SI0w2xEv/hrPdsTZ4WDCQ1hlDN4mSpAULfcwkWCbx9dlWZKwbWY3CByl"
+    "ed614YrS6TcVK3kQfbmybF9X6+D1ObvOPop4O+5S/iPweQp0qpktJzOW8WDhnv8u7FpiCm"
+    "RDha8wKphfiDcbm+fRmcffPo9jeyXLDGWZBitucnN/dYWgJMFCeBCugHiEkFHT8dBtHuYT"
+    "ZpUy/LdZqI8UsAzW+cuLLnla6LDfxvg5rJYKzLMcLa10A9+uzjUafIFbiT7PhTBJV0uCyh"
+    "1B+aeTkw8fPp+8+/Dpp9OPnz+f/vQuxDR7qwjcL5ffEN+EHiQru6eX1SpqJRGt1CtloE2c"
+    "rdfBN8OgJQ5oSYzLVF/JL76Sqb2SlDXWgTWibCWeW52zTBJbB9SQUGKamamx83wVF9Q8+p"
+    "YgvPMsEiI5fx28Mwwk4IWAp6XDqibyIj7ShXXPLqwxLVWVbSFFVssXdAAZWxOqu7Xw3Oi8"
+    "fZDbrFC1WWXdz2XQEox3ve6Llb9rIS632oqQb7rXFjKSm+2eN9vQcFHJySdOJDfaBJKVHa"
+    "aSZC1ZjXaHZ9yIswauaXKJbwrfdY8wOeQtwXfXu6nIProG2vLwUgnuTY8uBWzkwWXPB5d1"
+    "9wW5IeQW9vYdEaqgGadpJZLvS5Whfl9Qhvq9oAx13OlDYE0uzNqUppWpCrL157nvSxbZS9"
+    "Ptm94y44ebnLMJBrvzpH+XQbZzP+wP4MbYvL696A96o9sBFkYfm72L68sbNjnH5vD+Dm7x"
+    "Cyfv3nXKTfL6kryFXkUVJ3KCTqaJSaXb0BV8b8XQl7qrwIxUlrrpuQKMc/1OCnnst07qjn"
+    "16kvWeIo+q6hM2RSyX3tS+lvDqqzBXs4SvdILK1PgHEdObFUdkzsGDGNiqtbOSWzpTFIgO"
+    "/D7t178NqBHmcBcHh/VW+ijQ7jRvoPNCw5KnG+fZ1JTfPNVg1aUU1ZvCAcWwRImCK0GDfP"
+    "87YNtDrlfWvJH7RgWc0D6m2PRRp0+14oPxL23HJppDiNI+4GnsN1bXN9X6r8iGI72igjw/"
+    "NzEU1VGW6lQkq1YAJZ6c55pidvcBPKS9EAVnR4Rqw/kSh6bdoLB5s7IMXdOpo/gQbQYOAn"
+    "KHHJ/bCwsLi68XFgxZazssU92mmhsCs0NAmroDGbr5AGvK3NPxLLwRHn5c3Ddk1WJE1NXK"
+    "th4BEwxt3AyRc59DOz8WfH9lyTZOZ6GvNpwdJbFo6qzguT950OuGSLBMqHcRp5YiEssbUg"
+    "ssUT6V9mNjWliSWeOpyTY/3t/E2JU75bcCGMebhE+qEaFhjG2LoZrBmc2zqTIz1LmjUBO7"
+    "u+ERLn7s/8rZfwXuu9yiOpEhlOWK9d+LpTjw37icbbSSyKSbj7qw6si66F0yhi2eXYnkiT"
+    "aFvjlunUIl57hTgDphAmL/ffxplS7iWZfkyZR9MLmA/14R3Nq3GbwhQ9GO+rOFKVgjcFzV"
+    "0+JPk9fUZK5tzmpzhekdY3cTcNvphGJfpPUETyNHfhprB9PqkOjl3tQ4o0KuSuQdVC96dw"
+    "mvox0vbXNbNf1FzaEk9Yp1rWrwkrbySO3wOFWDlgS19PYvMZ4t/jqDIwX/SjcEZ6CaU14s"
+    "l8+zPe2XQTIoXOdXYUdqBsxVnYcN4RpqCzr14Lg4Al7tVazEJOegjqoSlXOuTYzOFLRu6R"
+    "cnKqRRBz5hDY+W4pI2rjquuul6lDSu3qm2q2v6CnadYcC7RVihv8e28tK+AJQgY+3L0Obn"
+    "sk2P9Cqijkb95Ty3sCDAHuxXFYHjw3HIkSAX3QGmvCiMZcJGED0km+12fVaYtW9AMRmsF+"
+    "YfZPtO1OYHh6X1dFiRd/pIORML8xnSeJX37hidw238i8x0U3cW7C/LnlGdXQwEGPxLdV26"
+    "ZCXeWdEbNFXgDcdCrmPToOqU2hNLxeyz5pRMVWfBfjlIO2U9sK0nfFeeQFGHZ7MbM790PX"
+    "Z5bAbFc7B2PWEJDuGJ/G1UXuWeOJiMEvg57Ff8waxTzhnv0QSkLfI//2N7psPcgleWZfzP"
+    "/7A0upicGfpuWuZx/MX4Y6BDVNUWBNvnF6lPpsJm2cSztWIyqaFZB2WlmNqzFnJcM9B9NS"
+    "w1zxc3oEjhN0OSbS3U2diHqqu0CJ6L2/svV31yN+ifXw4v/dLrofMgu8nmXujSPOj3rlIe"
+    "ufCt6EtV5HlfgGGcSMLIXttfRbk7G1u+KnzQOdT7jM3Z8RceQzLYhdaEMof8VWLpmeEetx"
+    "6a+QxeJZ48oGs9KIW0rxLF2MlrPSjzGbxKPF3LVQ2l+kkoRSc3cryEwoMC4v7KgcnlgLhl"
+    "iry7ClDNY7AmvI3KklAHwChdYYA3xqgIkP3r8PYmJ9Y+TZhC9N6EF/0+1TW3SwwQJn/d1u"
+    "Tt/HnmmRrLvD/xdMMFgfYtPvYvna2AjogwoHMzhKSTgXSTUUDIIJ0hRMZrHU68Vmb5Ynti"
+    "JY1CmuyVhqfK+oSbChxNrE/YRNAyMZZbqrWXVJ43E888O0R3vXp76flYA4r1FXvcF3aVqj"
+    "2Gu0HtE7B1QZlpHNMbZQLMYX/EiiXtq+Zjj9q6tuiIbGj8TrfQVha1eckglg+rLNy0cxPI"
+    "I7XF2aDy05bFSGQVoXj8UhUQ/ebtBHAred/gia7w2JIv1MdI9iXOb01bUpvgXiEhR/3byx"
+    "//H+rCMwc="
+)
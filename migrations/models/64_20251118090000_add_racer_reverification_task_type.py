@@ -0,0 +1,367 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `scheduled_tasks` MODIFY COLUMN `task_type` SMALLINT NOT NULL COMMENT 'EXAMPLE_LOG: 0\nRACETIME_OPEN_ROOM: 1\nCLEANUP_TOURNAMENT_USAGE: 2\nASYNC_TOURNAMENT_TIMEOUT_PENDING: 3\nASYNC_TOURNAMENT_TIMEOUT_IN_PROGRESS: 4\nASYNC_TOURNAMENT_SCORE_CALCULATION: 5\nASYNC_LIVE_RACE_OPEN: 6\nSPEEDGAMING_IMPORT: 7\nCLEANUP_PLACEHOLDER_USERS: 8\nRACETIME_POLL_OPEN_ROOMS: 9\nSEED_POOL_REFILL: 10\nRACER_REVERIFICATION: 11\nCUSTOM: 99';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `scheduled_tasks` MODIFY COLUMN `task_type` SMALLINT NOT NULL COMMENT 'EXAMPLE_LOG: 0\nRACETIME_OPEN_ROOM: 1\nCLEANUP_TOURNAMENT_USAGE: 2\nASYNC_TOURNAMENT_TIMEOUT_PENDING: 3\nASYNC_TOURNAMENT_TIMEOUT_IN_PROGRESS: 4\nASYNC_TOURNAMENT_SCORE_CALCULATION: 5\nASYNC_LIVE_RACE_OPEN: 6\nSPEEDGAMING_IMPORT: 7\nCLEANUP_PLACEHOLDER_USERS: 8\nRACETIME_POLL_OPEN_ROOMS: 9\nSEED_POOL_REFILL: 10\nCUSTOM: 99';"""
+
+
+MODELS_STATE = (
+    "eJztfWlz2zjW7l9B6Us798pJ7MRJt++8U6XYStoz3l5J7lmiLg5FQRbHFKnmYrdnqv/7PQ"
+    "fgTpAmJUoiZUzVpC0S5xB8AAI4+387C2tKDedtb6mPrAdqdk7JfzumuqDwR+Zel3TU5TK6"
+    "gxdcdWKwxupSV1xsxi6rE8e1Vc2FOzPVcChcmlJHs/Wlq1v4lE7v9oKw9kR1HEvTVZdOyZ"
+    "PuzolKPIfab5HN1NKAj27el6IYm2Nz6Fo2deDKXHXmxJoRd059qkfV8Oj/YxeWhqqbLv3d"
+    "9W/pDrFM45k4c+vJJN7SMolmUxX7yvrhmfpvHoX3u6dAbkNvvv8Kl3VzSn+nTvBz+aDMdG"
+    "pMEyDqU2TArivu85JduzDdr6whvuJE0SzDW5hR4+WzO7fMsDX0FK/eU5Pa+M5wzbU9hNT0"
+    "DMPHP0CZ9zRqwrsYo5nSmeoZODBInRmX4GIMeP+SZpk4ptAbh73gPT7l8Pjo4+ePP3749P"
+    "FHaMJ6El75/Ad/vejdOSFD4HrU+YPdV12Vt2AwRrix/2aQO5urthi6oH0KPOhyGrwAqhh6"
+    "PjYheEGTCL1oFtcE30L9XTGoee/O4efR+/cFYP3SG5z93BscQKs3+DIWfFn8o7v2bx3ze4"
+    "hohCCb2gp+B1VwTFKthOb252ICzE8fS2D56WMulHgriaTuKLCW6Y+CCfnFsgyqmjmfc5wu"
+    "BeUECFfBsszUDOFdCc0C9L7c3FxipxeO85vBLlyMUjDeXX3pw1Rl6EIj3aXx7z3ClK2vdK"
+    "qobhbUc7jj6gsqRjVJmYJ16pO+Df7YFMZrzlh4h+kNbDn+aBVgPrq46g9HvavbBPDnvVEf"
+    "7xyzq8+pqwefUrM7ZEL+djH6meBP8s+b6z5D0HLce5s9MWo3+mcH+6R6rqWY1pOiTmPfbX"
+    "A1ACYxsIbquArsx6sMbZq2hsHd/tLekrEMXrtwMOnvSx3YrTCUSUo5kDseSDwgK5XOojGK"
+    "lw+kDVlVaziT4kF+9iA8kiIiWQC/gsCh35t/pc8MxwvokWpqoi3fl6fufDbNw++PYA4EV6"
+    "PPzlafQuEmPjXg9eClKN/lz3rDs955v8NAnKjaw5NqT5UEmnjHOrZSV8K22VuL40X6imqq"
+    "9+z98S2wz4Gg6jyb2v96qqEDgd0RibLJFt1CgRbbKr8FjcuKtUhFwkcQxlggywqboQDL70"
+    "SPJaphWE8osT7jL9cimrVYIuIEeoKiLhLMbcu0PMd47nKJmKrafGxyImwHjyVLai+Aq/ng"
+    "kJltLUAetnWgIUs4iQIbFyVj3SYoAS+B81sy1LgsbdOxqamG5hlM5J6osEGDvExmuqmDkI"
+    "3rN7Ep3ISTLnZQBXqbXz5QH2GO31MmiVtLcvJGytOvQJ7exdqfkAGPT05KCIHQKlcKZPeS"
+    "Iku8ZxkkR/T3nEmYImuJgqLo8NP/+yhx7glQO7jq/f1N4uxzeXP9LWgeQ/ns8uaLlLE3Lm"
+    "PP9SlVYAmHHjsVYU2TbhFZ8c7aMGinugO741TR5qppUkN4tP6i3+fuTGL6lQ7a6bVhSzvV"
+    "T8fHHz58Pn7/4dOPJx8/fz758X24ZWVvFe1dXy6+Ib6JccgCbnumo8ARRln6Uy+J9RCONk"
+    "Yu2hni7Uk0R2sD/eH486cQWvxRBObwqnd5mUUPN0dUm7l0sRStBcXwZam3h99hMwC06W+e"
+    "bsOSCCdjPNkqM8tWuIiAk6vi6lqCm1xwxQsuiIkm9EaA+F+GN9fFi22cNoXvnQlv/X2qa2"
+    "6XGLrj/tq2Qxm+ffGhLH3+6ia1TMggfShLAwfbFdUeVlLtvsBKKgh3rCCU9pg9tcd4y+mK"
+    "A5uklAO704H1Ox+Nq2Xfq6b+H+akUk2zL6CUGv4MpjVo+m9S7JqHZ1mNv2DKVNX8Ryir3l"
+    "R3FcMSHeK++LRf/zpgGmWhzkyoze8h10vrvl1AJ03n+iOXCWoF5hK4DlStoQt0KWCYiaJO"
+    "TG43KE5tAY/a50jb54dqu7qmL1XTVWBRFmo7V58rEfNhwLtFOG3P4hquwC9aXuNrdWkLrJ"
+    "LcN0rYYrE9gfZkZtncThoZVglaDQAsgW22FBnaakfw/AdmoSUOHAyggQaTJGhCdDNN7XCW"
+    "mmZ5Jrymbuju89hUzSmZ0ol3fw89kPbR3dhH+aBVsZBGFO20kW7E6XhKXVUX7dVF9tGQRN"
+    "pGhbZRqZvZCxE+q5txLc/Gv+HYUmndztC9Jvl9t26NOwgV2azOI5pLNWg8sg52zZuDZXUe"
+    "mY9MrPFIT8caUCzpIbqzjW8/HERDvciL4kpcg1JeXElqc14WV/ApzKeT0EeYdCLpQyCtlK"
+    "JCYWVAl7BxQROMjnS0OZ16Bp1y0icQMiiTY6ih3+vwQiQmUju8EQZOOgDT2HQoEDr6AqaU"
+    "alLmd4r+oAjRCM8T9/dvyYD7DqH3KME9cAEytwZPeCY2RUMgnUKv7kxDfwCuwGYKo+t3nP"
+    "u1HsA01h/1KbxFF56Nh4BD5nr6Bi20j6H7q01Px+YhGYZvpLrEWVINpTHmhOrg7ZslNZlv"
+    "avwdI6ku/rbY/GfY57mTa+yl/GDT4GUId48iOKwPOBpScNuF4EaXugMfY7VTQJKoTW5XtR"
+    "2dwiVgBbEiTSut9zu23sOCpM0VV3eNSk7eKbKWiN8pV+9SaozjAjXGcVaNETpmOYZ3XwXR"
+    "DGEtmG43gHqziN5bqsB/swSiAWE7Z+kmAhJsy1ooFpxslGCRrbKIZ6nlMr7jZRxtV55AeZ"
+    "r/dUQU21NCR9t/p67P42OZr+Nj/sfxMfNtSJ3pnupMpT/bXgxs1oYfhKdWk+TSZK9IqZv2"
+    "kKkIXETxWq0HeLRU2DFoaVsz3aioRMgjf6VTUBqzVgBQGma2YpgRBw2uiWL7nAjTSMb2gB"
+    "IYBjtt/UDGOTdunSwNZuok8jKimQ2kBmTRXjEAlrcRx9YimrfBru56HncU3ZUTbXPw3qJv"
+    "aPSJv2htTawG5c2tUXqbcubW8DHvmDmT2U0zDpssOU7W6FqBFk2vfVWbR+l3iAZtJ9x+OS"
+    "WTZ4J2VH1p0CDJz1symtMoh47ukCj7zthUHWaJjSfWYSlul+QknpHHkY6ku7FHenYl9bbf"
+    "vJ0upCelLAUnBZaCk6ylwLRc0bqc70AaErTEMrBt91FYSXIMBF8NS81TD8SIUrjOkKptyJ"
+    "7f3H257JPbQf/sYnjhx8qH6i92Ey9FKQgG/d6lAMjV1Y9ZamlvkUHvUpcsjQRyYEsbCaSa"
+    "e229otSFraYLK6Nf2HkEd4OUCzJgeWfKFvwYX9az+J9sBRVLEIZfQrsCTVE3EU86LNSSCJ"
+    "QrpUlZvuSYwgUVK3P1kcY0KtjjLsEI2yCD8sJz3CiHsko0arswTGPT9BYTYAJPxhxsPEcy"
+    "ZZqbQAck0KZ8T5lpGOK/Sh3LZnUsMpnx2r6DMpmxDNiV4oeUK1/lwGbOp9J3ZYUdWvqubM"
+    "x3pRWyZoNgFjuq1JsGqoKTSpOQ2Z7YWS6YunogdYUY6oswZpjHLGMKphIiZzmyeMon4gBp"
+    "aLL/AevnsOzoGH2sRqJrF1hphjfF+juwr8N/umOTx2xwqRSTIuNN3QQZd1Gl4uz3WOxHkF"
+    "yZh0njygKNv2cXm1hcvk/M2qU9lyLGYdZ3mscydmD9Vcq5K+yi3QI5Nzuu2QWtRJGJBHm7"
+    "vJO3XGXCR2rlmDoRvbTy7tjK6w8KYm157jrjmmYhh3b3AZP2aiOapJQDuetCs+Z0pWGM08"
+    "lB3P3X2IbwZdicp36+npq8IEs5QRb4QGYC+2PH7uyJr7iyUIJSVhHKVBGDN1cqu5im6aTd"
+    "Q2j38GF6tKZKRTfoLGVLIN6CQzQKcdWcd0MK6bkbg3AN310RvTxu7Pi4YdNHnT4p1U8dGc"
+    "IWHz6Oy+VqKkjVlD18IDorfSYpUvmFNOILWenAk6FsyX689SMPX0uwoifFnKHK5FkRpwF+"
+    "4dyez0Ye4osgx8q0TjUnplwGco5Ld6b99XqR7kx7OrD5heSqeTOlydplKqwvl9YOM5G11B"
+    "VMKD/AEaZaPq0M4SudgNIbcU0At18WpqWgSRfO7aQfa0TqrAZjWj131nZL7TQYuhdr7QgP"
+    "hrVPxFbGqKaxTB+AS6Rwi84s25uNzQUwe4RrVP2nogK15UrSrlWCNqgURPCbLVuAVkzEQl"
+    "9dIJl4LnVOxyaB/+nTU3Jr6wvVfiYP9JlfRLJT4k9FvIxlkHCikae5hZ7K6HhMpzypGOPO"
+    "6eIl30/JDXsl1cAuxRnFS9yTA5eaWAAXpolLf3ffcEac6Snpsf8SnPLvTFZHCu/61T9PyV"
+    "+GN9eEDaRfZ4k39+/zxomt95SMwp+x3uPTNWqbDjnQrKWO6dkwktfn4/eJFz5BHlf4V1Vy"
+    "fYmyOIjr0O+LW+L/HeRiQ8R5u0j9BZ3FpGyuulgGzaL6sWWcvePDkXW97jK3aeahHdsPxA"
+    "2i54rvZ69Kv+6V5BFZbHjjMcw5xYZxLclxic8tNnxnwgt+n+qai/XlHPfXJm/EIhDxpYtV"
+    "/2ktfzepd0QGadX/blURL+PbyA8/XZerEnJxktcJWrS7Vlkhk1QtseTJKjjSwLOS5U5wHC"
+    "y5vggoX+cyI2uHr60jlvWuV9DBxT/AGsC7SbFr2mdbFkPButQk3VEc5iuKmcIGFgM0o0nK"
+    "adkt0islXn7BiBQbqEqqma5U8/nQtQ6h91hfmyc2cOb6kkyo+0SpmdDmEP4AhwWgs6dkdV"
+    "Brc+S52fh1QWI21siPs49zys+zxlnhbaTN5FgLGzAdRtRE6i3q1Fs4DqxNK50nU6TyQNmw"
+    "A2U4PlW9NrKEr+hslJD1+bJdTdiP07wmx4NkGePKlfes9YrttRS0gpN4tDvWeJy8Cpk2D8"
+    "+yx8rEF1bCnusf1WpEMTj9tRfD2Of2MoKx/UCKhqLtMQHhsD8i13eXl00Qa8oINBVFmQoy"
+    "zIBJBGj6zUoF5GBiuXMy8XTDPWS3p0TzHNdavMmKLqsyQonlS3CDyycHuqOwtrr5PyMY3D"
+    "enY/OQ9OAcdejrR8nTPC0LYb0ufhMbo4OWDnMA5gmBuafDVCAYeKhrqmE8owSkAYbkwLRc"
+    "/IFH74nq0DdIe6aaeHkCcpM1RS+baRdkMRwd+MOyCZ9GU+jmDJ6qGJb2QKe8o0g+hIZE1W"
+    "zLAcHMMBK9dPBtz9ibC971Kw4Rf9kz/z0nz8m3VKcLHbmI3/BRV8mtZeja8xDelTITvU0x"
+    "GRUj+erhu3PggeGEzymh2JfWlggTbGebRS/DBULBfQ6XlBJldu61jDZHpUL+jwpC/o+yIf"
+    "8yO/cGw9lia0MG28IgzSShDMvMwOovqZVRjegkqNKA+yr0bTL0ci8GNhN6GXx2VdWoGbpX"
+    "qkXdvWPD/ikHd2txbrBiq7TNWfyFS/2WYN2qrN7KWFC4ygx1Bmsm8M+3xLdnyibjCFGloq"
+    "9b8AFB4MqZlkGxSUVoSlvVEehB0026RWpQNlTPLMcYDadypQIGnAMJOfCwmP5sRjX3HQ+m"
+    "cd4NqGN5tkadd2cWkOZEFNXCFTWGeGTD+JYpC03SivWHbzP6VKD0lZ+sREJaa+grQ9mT2P"
+    "rpMBUkZZ07JeNO7/Ly5m/jDuo+x53z/vU/xh1s4AdF+TFEqm2rzxhk4wf0cBigg/Tt/dsu"
+    "+T6OOaef8uVrDIglLvMz9rjzK1Ok2gEc6ScEN8gSs66yoCHRQ/4P55+IqPov/IIV84/gGV"
+    "oItP8Qa/JveGs+POFNGEDDugf4Diw/IOtNjuY0pSGVSs6VzqX5Sk4+KauoOSOKtio6S+k5"
+    "C9ScaS2n/91mQcyP34mR1BC/s7vNbWsBPOHaVQXlBJHEuQzO0fpdBegklYxIKwG0NI3ITH"
+    "9SKynVza9yYEMxOOMg9JJuhflw1VAUsbXKg0zoVw1goPaulWBsUpMSmyECJUpy/uTrT9h8"
+    "jeu7XtadXOKAZtyOUklK8PlZBUl50hq0IFPL/MHl8TC+NsZ3jcoPfgncUtNaJYEnFA99YW"
+    "UdhY2lFqBGLYA8L+3Ftpo9L0kz7po5dFNrT8VUumLq12TOlQEyK4BWYAOXgR3rBnZkjhPr"
+    "oymwqLUXzJxFSzoUbNuhYJPCTUziEwg3SXkwX7hh8mc14eZct9Ec6AsMMRcJlFKQH8gek+"
+    "cl3jDvuaAhiI1ZiQsL5TcM68lh8g42O3SWVNNnKTsu2iotz+XhL8hAZSyAwVCzlphj0oJL"
+    "IWm5uP8gx0jaiamEKCQklUKQFIKkECSFIOnL2g4QpSTZ6pxnLQWtQJKUlQdo67KeNRjFlX"
+    "zQpSwuZfFXL4t/4Xa2keo83DxS29antCMQykXNukXSuW+/U1ygUCyfpKSY7j+MIC0JaAl7"
+    "SFYaL2qMQvfQhRnnhHe4+B3mrkAqkNvnqktUmwqcqM8824a5bzwTCw2WjrdcWjaI+tSEN4"
+    "UuvJvqDv+L8+oCb5fl6ptQQn93Kcy/6djEh1oojwcdQZyIQ12XuVVjT+aUzDzXs2meGC+9"
+    "kTcrgrOpKgIv3x05RlKPP/LGMdx8QQHdUdDB+FFgKXgphD2i22II+8acC2UEu9QOdaVL4W"
+    "sY2KouhZs80Z3rDjpCfYMjTvJcILpfeIab8pbKPTYtbWJhNISxJ+ge6JssBCmKU1aVcoR4"
+    "phvQJYwUM7moJCAEOQGOVvwsN1cdOH9RVojKpJorZNUdmypaZNjZDU5fE4t5q1lL9pXwMx"
+    "nw8vmyGLI4eWS+8Ut15Ztf0nI7A1QJqkLJM93mznQh0tmziH6fC2CcalMKu80A+dPx8YcP"
+    "n4/ff/j048nHz59PfnwfIpq9VQTtl4tviG5i+cyeSzhQVXOVJanaGci3kaOzP++0amXNkl"
+    "QtCcrZApqwarN8jwpLs1hRGskSy6xa7ZbzwgW3wZjCEQQ+ipm7gjyQIq1BIGhWpF6Dzv/B"
+    "a5ey+0uRvdWSnRTZ93RgM/FsXOSs7KeTJntNBn7ppyNzzrXH3h9+qdLxRLBubblOXCwJ0C"
+    "P6FkSZngThxFhIbWThvyWHJypq30QjXMEQsf4rKY1t8m1YITk6DRsFWlqOY6SrnVk2G4kH"
+    "int1tph0OFR+A59PXPflzm3Lu5+nyLNqYeHcgetKWtv4RxnN9VCb06ln0Gn/MSeJnLhht4"
+    "wu2wloOF4ltdojuP3gRKrmgAnhTGLq6ggnwopQi+oCrsUN9d+5lOjDgKpsU0UBm18lzrPj"
+    "0gXqs5OqcmdscseH5ZKqduCDMO4wNJ1xB5qxRFFvyWiuO9ylAroB8xX+77DGC6CFlxqbYU"
+    "FDzyZX2NMgHJtVB/Gf+4OT7jG5OM8N2M5EIsSLeqc3ABarHY6xq7qeI4MUatempz6eynp1"
+    "MX09h70tYbtlBTvHyTG8+yoa4SRVKzXCH8skyvuYnyjvY7YcSHJ1qABnlnJ7Novom+nUBe"
+    "1xGWiP86E9zkArdV17oRKRuq49HdiMrit+lCp5DIqTvCb1jNRxbbjoKs6rGjQyVwGf5iFY"
+    "ViWTEHBkMNDGlYO78c87s+lTR6DUYNe7RToMLWjxkr4iH1IZVrB1oVmcNAeljb7pLTJfZy"
+    "YF0XblDSGWnbObq6v+9ag3uhmcEs1aoEZKdS17bI4GvbO/9gc4KvB1ULgygLPJoN+7wotw"
+    "YHHhELXgyvJGVIWEz8u2HmnVAntxMukJJMW/PZQSpPi3pwObEf+Cxayys0OW8JVmJZECtE"
+    "ydIVNntCh1hlQzrKhmiC3525t1zc3mkN0Bm6Rb4LNToFwIp22+diH8QjaqXviedUSJrML8"
+    "tBiY8zMNY4dKcYOZburOPGSUYMwoChtIzcdKu3sZd4HqAkSaVsYz7DqeYU41dBjUzVXk/D"
+    "SxHM4dDyds1PZqon2SUg7kjgcytaVVGckUqRzKXS+xljnT7cVqmtQUrRzMnQ/mQpxUML+8"
+    "YoykJT57RQO2idKKru7mGdPEkIYELQF0C2Hx0IqtAMq9pRpVsMwQSkwzmOrmo+6qvKp4RQ"
+    "tjLg8ZIy/Gmi2/3IK4KtQpFhLppIywpHR6ry6gJwpd6o41rVhBKZ9BLWajduhHpJ18z8yp"
+    "0k6+pwObsZNz5yVFm6umSY2Ka5+I9pVaywWK+lIYZuikCTiFZw0mufVipZtjmctMlpdtm8"
+    "lvtAYsh4zhWcSvcZ92WTSFy1dVU2c2+C4Kuk4d1ysUDM+N/m7P3E0fC5+UBV1MqL0mMoEL"
+    "eUuBWBrq89oYMEv3bcSprVig/DpVHBCg1gTklnEaUu67vK0FqcOzALiYOQBfgjypDlna9N"
+    "C2DMMv+n6AlOwvzCUA77MgE282ozY78NUEZFBjQXG8SVBkcT1Aow2TvePQf0DLJlslN5Q4"
+    "nELXeZ/sxqQjC/4p+Zlue1LW+4mGWiTbshZ1YDLwGQ58flv7VnuOY2m6ytNkJzOOkAN9Rl"
+    "Tzed1PchVHpmAVz/Nniq3yL7g1xXYWGTzVNEGnW+BCxE3Uiq2aDxUATFG9UqmbVyamPG+F"
+    "MEg039Yjom2lueekTAjZSX4E2YlMdrGfyj6pxd3TgZXJLmSsTlMUtTLqZMWoExnkVDbIaY"
+    "eBJkx8zxPOAtn+Bcks0Ce8nIPzGzyEqZLeDW6uiI4lNRfsbMo0SGogrh6dHvFaTawXb7LZ"
+    "N9fgIwXArQuAnl3JR81v3s6aQiel8l2cFOS7OMnmu4j3LANkvi9qiqwlst+2/VGlLLgXIo"
+    "OUBfd0YJspC7ZhT84INVXOmS8KQIFNZNPizw4z+VcUfuo7mid9UATH84yTSv4RnXuBxPxj"
+    "pPWkaR9q0eG5amHOekty7kEte98LqqIQkqRqydF5C2jKipEy9548qHakBPKKBjYjgcgc4r"
+    "JO3tp4lpU7akiFnZLlaB3uuY08ANXjKVlRWIsFXwgktWRoRr6YlowHkTJa05aubmNltL2Q"
+    "K6SJY4MmDim01S+0+bnyFWrim1ZNRS+glvi+mCKCeemLDi9VE0VEjGQdgBTsAIxiLampLH"
+    "TTc6mjTOgMDt8VDgZFLLYn7Hx6v+vzQgxU+pun2zDrgqmI1WGrTuM8HnIG5ywcfr9Xz5GU"
+    "ZtCS08UWTmv+KioqxFxhShdwkZM6ZcRIYbTisaOIjTx/JAWSREn2mW64Im/WciWg8nhtsQ"
+    "StarDRTAcNXl6eErg1Nnm9J+Xm+vIfp8Q3flmm8Tw2r2+u+zAUlsnfa+eFajmIU8/mGjH/"
+    "jFHhfJLPYHunk6PjBh1PEim+VltXxBzkKl4A9EpVwfM5yMNJJlsAeoWz08VCzWL8l+HNdQ"
+    "7GOfQphO9MePXvU11zu8TQHffXRuJdAC8iUKxqSmuVuklDGjJIq5rg6TD9laLsRoUriZBe"
+    "riNpEcecWgv9P3knkjy5Jk7VyvWi/kjgJcxlCqsoNajGjgM2HI8Fp4n85SKfg1wwSiwY0v"
+    "llL3wkpPPLng6sdH7pbEIjrGrcCKEsbWumGxWTMueRv9IsKaHGdmJVzE4qoHy1GAanQ8U/"
+    "0VQEUkz+itCUzm0bdG7L+9xrQDNI2fbFaubcLIulYC0rh2ViJ6kJUMx/dxtxbDWoop22DL"
+    "KpFbEWZAOetyHLFkMr3jJa4t3aoFU1qdGoIwNv5LXa/jS8nqPeU4V5XCGvmnC5Q64tQ2VN"
+    "L+g84+i9pxuiDMdXqvk8svDfksubnxX8G/JbBdodhgqzN1BSvt/p97FxftGpkjRlRrpujq"
+    "Fls9F4oM8xqBnG/gIZDpjfJJM1353blnc/T90LBi0aLuFKC9eVDPB/lPSAL0j3KlxSyvjD"
+    "y8SvLXWLl6rdvdAAStXung5s5qQka/ystALKfJuyMFLzCiPJ9Ju00ek3ry1Xn+kaEzgvrf"
+    "uO4MicblJ4YDZjjRXDui93YO4AX2LNiANT653qunSxxBIScWZONv9mGaKxOTZHKHQ76GGa"
+    "uEmg8/ojtZ+JT+zwvJ3eVEfPK6KaU2gy8e7v4VfJrJ3fwwkfOzxCm++d4GEsD77niJr4gh"
+    "jO/F+lGFCzGBADtzx+SaLXtDXG1/DEN72AqW9VmYM51K8VTN/vG6ZpFsN8964kVQ0uXav5"
+    "7/9p5pnMvYxMPN2AVdJ5i4/9c2ft/XNrnl6CdTgzkUvEUmS5bG9CZ532O7f96/OL629wb2"
+    "wO+9ejU3I0Nr/2Li775zBTx+agPxr8gzX4kN5GC6f9h+PPn8IZjz+KJvvwqnd5KZjxtm3Z"
+    "8OU7ga46iXd+WH2GsCXeotsOrLepCzNRszyRsJLvK5Gk2uX03dliLHWDe6FCyuoGUSZYYV"
+    "RjZDUMabNWngaNYPDaUr27/9+mwBAutZPraielVq09WrWhN4lDUKheS7TtltazOTGykgo3"
+    "HHoSpyOuRZiU+ZLWrTQlqt6wsUM01QwoJhSbO0uqYUufjs1+pm/T5pblUDK3nrAZNOYs6R"
+    "S4Da0F5QTQ1qZkCawtUzXIAX17/7brl9sJkwswZR7OjzddYqG6jlGNzbiz5+GTPqUBfaxg"
+    "rX+6I7pJoHluyZ5I25dUFOWoPBL+t7/mag6jfFdprWD2ZtqlN3ZbahBXEg5W1iC+rDRolD"
+    "axczfsD5Tb/uDqYji8uLlWQAq9/obqgqP378fmzeBb7/rin70R3rrqY0io0js/Z+qEvPuD"
+    "/tXNL7zFUaqF6DnH74/H5ujmbnDdu+pfj5SzQR9OJ3DjAz4gdgPOGwP/xlHiRv/6nF9OMr"
+    "q7PQ8YfRibV73R2c/K8Ozn/vkdU4d8RPb86qCfuH4UXD+7ubq97I/41ePwau/6rH/pt404"
+    "90eji+tvQ2V49+XqYuQTfRybg95ZP3Hx6L1/sXd7O+BIfTw68q8N+n/pn/nt4ImXF7/ANc"
+    "Yh1sOjk/idwc3NlXJz27/m9z4lqALMPh59jl//enF9MfyZ3/gxfiP+ckc/jU0Yjb/FO3r8"
+    "3r8WjvLHY+j7xfUvFyPs/Vn/gl09QXT9q72zs/7tiF+Ntw3e9ASx9a/2/357MeAXt6+iKq"
+    "vhfvkbb6a2u3N+MTy7GZwr51dMM9i/6l1cMsXg3/pffr65+SsgBxvs1RBGdevgy7yQ9cfm"
+    "S8XWXgjPUiuypwPbwHjmdoY7Ss3SCqBJzVINmqW8r7cG9CpG1jY3uK6GqhGbVNPFcf4Kxx"
+    "7Ppl8NVegEl9e0W6SkS7z+jFMpMyArqaTzH0SQhKmzWFY7GJh3U93hf5GEOivUq/kPE6jv"
+    "auCJir2eYVhPDhnegWTfO7+6uGZqPZ596JEaz5wtJer0Eef6NKRmz4w/wOmOzaXNdCP47L"
+    "sLohme61I725K4c9UlmBASFXtkojrpVxUq6TJfpz8SGLiUVcMVtkadW/wC3A8yDUqFW90K"
+    "txTQK0jjKQ67lsKDb0+f4mSH97G374yzUmbNJmXT7Pxtzr5tWAx0J/j6Cfzpd5ItG9CApD"
+    "/kpsjmfj9XEOGSlE3yUMBBMRnqwYA8qdGIHCAN0WdE82wbpj6s33yzodM3a49MkwS9Uo4N"
+    "piXMFJzvBxcS7Nb/rXPD/lKZFz3a6yaW55Kn+bNozN8FA7z++G7CZU7qx/ZCjSL1Y3s6sB"
+    "n9WLD1TZ6raXgydLvVjXViAtPT3Ap3yNjOWelIWJvubPf6x/3Tpcl8a5011ULiFWB7+snm"
+    "ffdlIc6sewmAh/0Rub67vGyC4u3CfOSiUqHOzW/VLatu06P2L6rZOG+CpayY8PhvSzd5AG"
+    "hChszq0qoQyswvW9cfVS5rsU4Ri+2jl8hJf/S+TFJ6aJWblZ7dk54Zm9b+4Kh5TqVSQXGS"
+    "12vadSpHuCWJXmWAG/19qYMMtoquMUHZJF3jq4yGkgqrvdBrSIXVng5sRmEVfHZVFVYZut"
+    "ekTJEaKamRao9GKvpUt6eRajCGmZWrqa5eAwrQOW7nBZVT0Kxb2sXL5hQlvbuukFvGyYnH"
+    "HuIfAbes3qk0ZTIE07/MlI5hW2tGTPqU8sgiT3Ndm5OFB60ndGzC+9vWI52SyTNR405fEw"
+    "q9oBl3C3TH8KcD9xZzoe8TLHB7OjYJ/E+fnpJbW1+o9jN5oM/8Io7FKfFhh4clOOJN3iwG"
+    "4ymJD1j8Dm9qB7xgUp4SFrmK2tfwcqbjnIwn9Qm74v8mB0tqTmEIuiTAowus/k014PQmeO"
+    "CjTp/856V0vsE99lC/C3EqhZnV4ZWSZvaZbS0CWjv9Wqp7SkLXi2B80Qzvo5/qVW7zoEU5"
+    "TeX3ThxY/NqZY5yfC4n9He+idI2rXbXJ/ptBLl+1GbTfXq1vsRmk4OMuafdM1fUuV9i7qL"
+    "J3RusZ73IG4nwvnRTZrn11ctbFZrrj5OViK9DV5+Vd2+CU7vjrfyd3XpOoW7svUR/fVapM"
+    "5DTdrmdywXbYzNmc2PsywBcrddK0Uq3TMH1d7CxVfWwTpFKnLnXq8huVOnU5sGV16mmpMz"
+    "O4BclOM5S7DgYqoY0oeY6suwZvpMOoCnKasFnOtiIFzPYgLlDLx2dnG1XJ9c3lsrpmwfdc"
+    "ohZqND+3h3IDZ3N5kNPfc1M1+p0XVPnldfilVPf5W7H08nxlqtDtenken5yU0RKdnOSrif"
+    "De/uk7a5FfN6ELki60MrmZFO86Um5/RQMbVvnOnAXFp8RoAqjOs6kpv3mqwbJjrFk+vofc"
+    "/jdg1sxBzzuLJ74LVpIurKa3BiDIxy/h19SduRgJG7bMNUFIuPgAuxbPC5ajbGkZuqaviw"
+    "pKs7fI6bnFeGRry68OyDnn9Q1Z7QEkYVp8hWfQrwWcYcC0/9i62rYp/wPYexeKNldN09cO"
+    "rA7OkDE747xaDEpUD2FNQNpa/jidtaeg4Mbq4BSV/2jnHp1JdFjPXp3KutjSacTj0muEJQ"
+    "qMbykiC7qYrH3UjyNyxRi2GJEltRe646y/tsRRuQ2ZthkZEEmpq+BPZ6lq635Ht4zddcBt"
+    "q9achIOm9QRPJQe+Rz+J3q9aerwXZCdgqNiWtVCWtjXT1xakBsBvAOxuObcWTytExlYeqR"
+    "1Vr1ofGvuXGL+Wg4NKM2VirXsQHPisvlhue0PHkoJDKFa5qvOwruAQMBsBr/ae/2BJxUzO"
+    "Ne5dQ86xZfNkW8Zv/7zzggk8OhWVM4QvovbSHF7jdNm0ORxzUK1kQkkQSguKNI3JgX0VdX"
+    "92MZyy8I9MDbFrPDeaGkKWUaJrF+hOWn0V1XEAuxrMEdlTcQvNwGsKFyWVjVeq+Tyy8N8V"
+    "Pvv1NI6bPocXTGD2LkqBLJV8MxtnHBywRApty2bDgfVnUktJhLv/eYRjJ2jMWfoN3bltef"
+    "fznDbiZ+R+f3BdyQzNH6VlzxgSL8ifSczKyaDJ/ks5tGnHiW6BHBqb31U9tAWkO85bUR7V"
+    "zSflle7asi6MFLOl/uRVDqzUn9S1d0tVQBvL2ZZwm1lLZlvdd6bJ8lr0VmlZLS395strCR"
+    "GsSFbLCHYblddCZUCuuJZ2chHIaQI/mHwBTeiDUyXbJWcQc3IpSnCZbYz5JMOuOkTFQsRY"
+    "DtiGv81pumCwRebqI0tQqdvoZkNgA2BFijHXozXz+TtvSV/V5tFjWL7MCWWOOSzrJdVZzV"
+    "GVPQkekq7xMjYPJp6LOarIxHLnbyqnvbxjH1KsB1GRWHJA396/7bJH433iuwlhvRI/7+RU"
+    "d5aG+qxwXj97MBsOZ7ZOzSmvtYk3c1NoBgm2YlcxLSjGlYfd4XTYgxgBxyLyXYL56/BUXZ"
+    "EDEyeMQxVjkEgCmO8E5YPnKEtvYugay2Hpl4CNI4bDr7tOMKZEtSnhFADCo+7oMIM5q+iw"
+    "HsuHGTHKJNCMzoC57Q3VcQl8LjhipdNoBtrRXzFlZnp3YRfDl5ZJNGXkOM+1UbRQsCUhvZ"
+    "zuTlURW5WqAJ2m23XW0oL1dBWsZdbSXKfYMNdjOLsbn7s0WqEzsL8U4R/R7TrCPyyqHltW"
+    "nMzmufYAyCQAUqHTlZq61zCwDdTUNTR4o/3eUPUBe1dCotweqgU60u06+DQR4No8gPIWie"
+    "2rnhu6QGxRPb2BIMSUcnFHcYidsAOou3Eoib0flnOBQ65rrTccgkjFteOlzKm10P9DbQ7i"
+    "VqdwHDA9UKqRCTUs854pVg+Qjilp7w1rAkuI/87rxixuMm4mfzK+rBYv68GUVpArqU9pHV"
+    "15fNpWUZsn6JhqGtXmTqwBW6TYuOKCcQ8zzFeBdn3tZ5fpV/lqMjbjnw/QWEx45Fr4Jx0m"
+    "jOmr3MMHVFSIM5pTMprTzLvEVdF4n2mhJxQLr9/bqonJZ2O98xW+qqnw14mUx4wO9fz8Rq"
+    "g2Zn3XnfQDkQVHQsCC3yjDggMoYMFvvMhCpLmOXpepon0UClTXKYIyuuvvnWhC870lVF5n"
+    "1NqJlkyNnWgrldg1KrGjmV1R/5Qk3KICKmfROxN+ieFUapTuKVwKVsA8ImwG5tmlq7GY+0"
+    "fZ6phHhM3APLvWNxNzqWPdB1Wc1LHu6cBmk5Sljmglj1Npsl2XRqlPVm+/brVGWJnuLxCR"
+    "Msg2Qq2a2AbXVP5Vz+7UyClcVvuX/oj3N0i1lom8hQDWTSqy0sm3BOorQX6ufKWVODnYy6"
+    "qqAfUc5EEAyJl+79lc5e0zYboo7McIDgMEn0HwGQLV1Rp8hMqKtCGBYZPWVEhlxErbYVM9"
+    "6rYd3iersbQtvA+2MtvFRVwVVADL/cBTVNs7xh2d7PpTj2WDxhSAhr7QBSJjLnJJou0Bd/"
+    "yxOcA5LB04PFHBIm26TQV7S6ECS8xg54qsOj7yGnVVTCxmX2pFeJOEu3bEbBqqaCYEsBZ5"
+    "eVcKkc0QS3QT6M71KV0V3AytXBBEU3dpUybaaHORrrPE9E0zkFNYgPJCn66HcpqBRFmAsg"
+    "mIwNeOeo/VkRYxkWinIzqCDldDOEkoF2RpTdxDo5O0Ju7pwDYwYmMXwylzq2xCxbdd53VD"
+    "f6SKvX6BmGQF0UvgOthynZi1cU4q8XZS0q1BYGzaJJcs+pJjlMtUhik2ywkq05SwyyEhiR"
+    "OmLGuzbA4TgVVuFS7o6H1OZ7pJHeJrLNmMY425i7hrwR2NwvdEVJ89nTK7nk0w2S96xPk1"
+    "JoHdHaNZeI7Lk7moxNDNByAILIJv7++JqmmWZ7rMSX1BqUsWuqkvvIVvLYz1o7zRkNUR9R"
+    "cjloNY4O0sbYgrbJDdAhtiHPTUAqXf5wIYp9rUUWMzQP50fPzhw+fj9x8+/Xjy8fPnkx/f"
+    "h4hmbxVB++XiG6KbOCxmpbBgHldCN0bUsnPcLtCtagVPEElTeMzl26X3li2sbf2X4c11nr"
+    "93nCoF550Jr/l9qmtuFzYRx/11U+B2/jTzTJZmjExgaXJ103mLD/xzZ+1TjQhhhKPYWp42"
+    "jHeT0iIySFvL/R007yCdu1pk6La3ZjTIYM6OIwqceWZUr2zdyRJLbaII3ulvKwHLySSkGb"
+    "03yBRwKK+u9o7opC1BKr33Tzcqld57OrBS6V3X2UcqvXes9GaRCjUWsUa1W9sLWW9S3yvG"
+    "R6DzzQUyX+/LxnJl5e+FOdUf9annp2j+wfFVqwlFLnxlrieIxKhCjKreEdx+cMiTn8/Cz5"
+    "A9Vx0yodSMtLuomI3F7DA9b74q9jEFFYtVkrrXDete4SQfjFd1GSBOKUWrpBgQYLPCcTFF"
+    "WsN5sVlxHg06HgavXXjw536KqEaosMYkibZ3LHy/67UmpRr3N4CKi0uaVK4u+dCusMIIyO"
+    "Uqs+NVBlNyKdqcag8rDamAXA5pY4ZUobZtCULv88M7RbQyxlOWcNxfxZzUuO7pwGY0rm3O"
+    "qbOz03RcP1INPAHlawKxQE2d1jmtqaZuue60m9JVC+bN/qYYqh29BqcRwj3vi+V2cryVg9"
+    "vdl/yUWbKHieVW8FBm6XyAJOlVLPZDzmmLKuihCxPKITc9z50fYxJZVhENHstcjoO+oZcw"
+    "0uv+dEP1NbwYrxPopzA/wAKOcavMoaNZSzp9Q7C6o18UUnUcmL2oxraS5Sbz1NlSbb1Ztb"
+    "Xv8ifI6ZLvdBmn2W1Bv3ByB11ihT2Dop8/qIbrLu0f4C9n8Z8PP6xU3e+kTMG5k/x6cyeZ"
+    "cnOaocM3Jjx5FGAeJ9p1Ub9gtWB9Ihfnq+C6GbdXjpJDYSETiDovwhsRNgviqF+NgLmluc"
+    "o6X4MylNghtsGxOgETqznQ7kMOs46oLHI5hLet8doLv81OVNOZz2YsQElNfM50bdjrzNmj"
+    "wscHZ3nNgGNglfUjQ7i9haQzVOcqHjN+5n3oZNG/ZZ0hrHPxlcXPtul3PjyU9C5Ho9tBjC"
+    "WeT4ZXmQv//BC/tNLZZSMrFPdfEZ62+6a3yIil6XyAPvEuDbmdM8+2cV8F9Exe0Z5EPSt9"
+    "KP9w/PlTeB7HH0VH8eFV7/JSlOIOH6ssqOOAmFllyc9S7njV702nur/u876BuAhfwsKv5G"
+    "YTZn4hsQ43bz/gxiI+K9awHqYYNMl+2EF5CcZnsSTWjJcvcjwNRHpn5hmxD2L98WmQKr28"
+    "kdH/qri9cMXhF/Bo+gzg3yvr8esbeGn23AvrmDR77unAhu7oGd3+S379rz5pS254DlfE14"
+    "BMzM7R3uCSBE5csGcVHWrCBktJbHWHh8EgzHCFlT2ZVsD2u9DQgJC8WVRsWEtPuHJGNiVh"
+    "eCpnceuFnwuemVSSsKq51svpgKoyiBWaTXQX23oOJc6SamhTRnonUDjo8G+04r1jSQTy40"
+    "R8tWciwkyGiWw+TGTfFI7RVoJ6x6iXTVE7BjbnFY6BKVJ5DpQHfDmwW/BrxF260g4TEbwm"
+    "hzwZfL9Zr0b/hFSDM2PME6x5KJZ1xIs+spe9F2XeghwQa8hbsA1BjImsBdJXINKWELlCQb"
+    "qEmMUOj4JyhQKBKrdpLLIe9doUBS5rSc148UMCJ1gTxDD8hadWX5GLVqp/Wzqc+Lpjkwtp"
+    "wcti1lXLnsYa+0xCQy/cmemm7sw5Hw1ntGEwVqxNSM8He8o7OmcXNMtbGpSL6QRBekDJfW"
+    "bDryvV1eZdwkpQwMXTsXlIvlDXZfle4b6hz6j2DFs0l/hZolZsc2vTR/TlRNsbAGAv5yo6"
+    "XjIa9JJzsFFfdXRgBB+J/YxPRNmUA8twwib48oehuLmgrorCDUALBwNuxpNum1sXI3EAq3"
+    "hQBO136675Fa5GEzDlpvlOAzH2cAqT6PDo+MPHBnk8NMNHdnVtYNZLNuUg2xDHWFZDt3oG"
+    "2BjRzpHGuc1cgCwQy0KYGzuz83x5ChaSPAeebXubBC48bOv17dcHuM13CfwzBWC7RDexJD"
+    "OKpU433Ju70c7ckHm/l/bnDjscscX+SRUcsEpCvy8qjleiu+pcxtxJeD9f2UDvXJfVDCti"
+    "3eqtBUpB1XCMk9SC5KrH3p7jWJrOlr/IPEdY98iBDhKX+Vx2J9o/fVczpuuaKrBhf0Su7y"
+    "4vq2ltUrM7C/2NSUcW/FMS+KuAS+vmdVn44590mQFYUxVmTq2F/h9q38JmQHOifFNtusUq"
+    "saA11saF5iXVYlfIihn5UeuC0zviRHxOWQ1ZKSrUQfGu82BeDLY+DA5r/+hdXSZjhoOw4J"
+    "APELrAGhmN5vSZ8fBVnMAARtJi8pCzRF8EcsASXFp2wqeBWE9wHnzDXR5c6P7Ec6lzOjYJ"
+    "/E+fnpJbW1+oILU+0Gd+MeR4Sq6DP/kXz1+LTKhhQadgWnICfOwpwVB48jS3wsMoquV8ig"
+    "PmQhEo3lgDy37DqaPXPSXRgBP8+sgBF6G7xFng///zoUssy4Xf1NXevom6y59+OBNEoEV9"
+    "4F8kedLhXczoLf9v1AGfY2x+nBJRtBUq8p7mqhtnP7Wow8mDQTsNR9jFLxeO6VjLghwgEU"
+    "xIzGPq0yYmgd8J3VGW3sTQtVMS+QOET4PBeNQdHWY+c28xeEpUvwOR3HIaKVF9wpi04A9e"
+    "eNwVN2YezPC1hRk0hd4uIZpBUaoQU/zFPuu080shEbT9nmISJCpgt0J0RC2jx0mtaI1a0S"
+    "TIpTVICaqdq5BeXmDY0tIM1UVbI4GTi7G/mASdqwrr0fsyuEKrXGDZvX0OBA62oKbHAwc7"
+    "Yxby/KpZcZpd1cwSw89292gHZ5s8ngUxpTjf69cehY1Uz4r2zswwvOQkGdHtPNNt5xfB+W"
+    "dtwGWBHek9132NquXXN7AZVXJaHCkpIaTJdqxWfklkJwdIx4RjP7WYr6zYopJ0X5Jsdgp0"
+    "Ho1QOYdzswbFM9djXcc57s2kLqshTX/r+5tncv2pXRbTNRJQylBUYYjlEk/xU8WhdLomGr"
+    "eM05Byzd/WPne+1LAZhy/B9JDhw7nfZj0WkI1GXQ61OZ16gN9IdR46AvNGskG3yLbhBE0V"
+    "F9qWNGyE/AkSEcY2a8gQtkJrwYCyz91E2wW/56LO2881CkOqeTgccCnsHZokqP0I3UEzRO"
+    "jWiqdZZsPAvgcMeP5SQXQmOUjmOfW5vCHR6p5o8T/XlknRwPEF61kf6ibrLDe4wExDdxjo"
+    "F4joU8pqfRmWOvX77aq26y27BJOr+qI7tEQN6ER1couAZRTZAq/zKKKQKahN+rur2J7pH/"
+    "1jd6WaeqUDZL6auqVK0/L4yTSJm9hSt6YExcWJgyL6vF9O8pag37UA1P87SNyXfeXy5tsp"
+    "eQ97Ru+MifHKzW3/Whnc3FydkqOxeXbZ713f3Sqjm7vBde+qfz1S7oa9b32Yv2OzN/zH9V"
+    "n8FjK4uRspwOL84hoYfyhodHGt3A5uvg36w+Ep+ShoODy7GfSVs97l2d1lb3Rxc31KToJm"
+    "lxe/9BXsM+vvKfk0Noe3/f75t94VPFi5uLq9GYxOyefoDW4vofXPN5fn/QG8Qn8AD/0x9t"
+    "q3N5eX0bvDzZ+AIzCEGzeXyqD/9eLyEk0anGQAV37pDy6+Xpz5PTtCsO6GI8Ttp58qyZC1"
+    "5MvzN/J15meGx67nKLxmf/BL75LPxAHCDLPu5rrP5hBgtXWYg1MSZkS2TNEhPX+jF5DuVu"
+    "O0s5hczYaXpr/jIdUR7lQF8SNZ0pbsVtsIW4hkDV10lCrWcWepm5Sdr5ZTQYPU2sFrFxos"
+    "2ImB+xhVsbymyHZlfO38aeaZPIvsBAU83XTe4mP/3NnI6G7K5Nr+vDR1oFujfZUlA41E6i"
+    "prVIpULlA7XqBS2pEqQ5kilUPZhDS/OB7Vgx8FpK08lNXvBxgis1p51gRlSyDdtlZGeuvs"
+    "hVOH9NbZ04HNGDmDz27yXM17JEP3SrUnu89o1k4MC7xtdpuVqznOCN1Vk3KJv+8aoCzpPt"
+    "NcCDOrVpOymsW8RAReDkkfkgIXB2ihLH2lRolkZuiMdBh5hSSiJpnPiO6yUGULnQ00Q4U9"
+    "eipIdLYSG1bbFd1rmJMB97chk2dyEJF3wzhAZa468zdvyYi5s/BrBK8R3RmbmrVYeqFbC7"
+    "q80N/hxaOWnsO9JGzLMEKXGOBuETrlfVPHpu8RhxsmVgTSVMN4Ro+GpUMsY+q/jMOfMaFI"
+    "hIWzMGOI5/LQUP66C/UZ3xO52Y/YKcsmauTI4UcfI2TYnaCBSbwlvAewHZusCfPVMOjMJZ"
+    "4Z8tJ5bCHMN+iDN5tBrzj7pbX0DDWImn1LbuBbBmA41nD8wmjHhD8Q/DbpI9BHL0HUe/h8"
+    "SntsJKPSEiOFF6Jnc/eNeGR0/J503ljpFCJjDJsTY5iZ+2VBzxDuGvfhz73D45NPGJyNK4"
+    "WmmpaJK2G0lJaPyUqi/uljCdQ/fcxFHW+lvN5towrWfvN2uiidlArgPCkI4DzJBnDipKtY"
+    "5DlG0k4gN2LtXVJ7oRq6+VAFygRRSzSKW5iUztLSsZJqxa87RSbx3M944WH6RB88OjzYlt"
+    "ubtm28DpISVxmFOE0No9Ao+8NGQPYBQA2JqC5WruyQodu1t93P1hPBsCxflHWpjRkK/Odj"
+    "Rh7LesDcoWShGzD8kRfbDhzIIkkuA/gLNp8EZZOMzp0wh08YORMTknmYHIbOPKo6e3a1AJ"
+    "qm2w1KmailqW8vLELZgW1CFsvVP1yWX5DHt4afbkrRFkW5phRpO4rd5gq7aognaHYMee1x"
+    "hhs2MEXht2vaQ0SJFduLelkjSmLqvWyBykkbWhnsVROHNnopKYt5bk7RHdusvrFAUl8k6w"
+    "jMVskG3SLLFQ9KVeKS58v2K86fAFdD13jca6injLJIPdDnw0fV8ChZqrotSEO6GpvyyUDh"
+    "j1NyxzNn+ozx2jt9itVvAGx7bDLOp8THivAHHURP570VJdf82YMBOsQTCWKZTrHpRgazgp"
+    "yY3DjEnuxHFiM/tMaZlnmoThe6WZQXM6Atlxgz3rpMZsyU4Unai1Y6ceTbi2AqVtG0+c13"
+    "WqenScpf9qlmAcz3Jw0J2qJB37YfqQyd3iC4+5G5sGFxNFIdsqfqEOn5vBcDG+YpyshG25"
+    "ea4i6pBbKTqFmhBJXwEK0mR92IcgVFMhBLWWQ9UtsGiQW90tAkYU6DREJhgYWMYFUT3/KS"
+    "VhyDU+JrGfA2mgrjvYkJZkOhRBaWOljSZC2IN5uR1XYmXX3PuFzjAT9daEAKXXskdGU3Di"
+    "l1NW/zlVLXHoErBYS9OEdKAWFPBzYTGrn70L4dbNv7HNq3fThrD+3bjbwaZXNmJtHAA7Mj"
+    "kFnzmnaL5NYo7bTCDZ3VZNfQI9TxJgudpSLzQ6LSFR8FaXvL07JoNZTwHLI01GdqHzIal8"
+    "e7abGoNGYPTpFT5y25ZWQsde/Y5MQRkaE/hBXjHBh5lqupSzQPpEoeBmOxN3a6rDYhM9vd"
+    "wwMw9i1W945MKDyeOcPqth9pNqH3mO4JQ+ecWDcx6I5ZPNG2DcLj2ETpkb0KK4mth8Ime/"
+    "cvKjrcwhOG6lx1bHX+xXJ/cEg04t+wXCAb3i4B8Xbp+kZybA9tj39wxuYCPiv9EGR8FWv5"
+    "2dpcd+FNPTs3S/D3yIEA31YxvcUEK9tJ6XSz0mkc7AyAw4VqGPnOtEnS7bnSHq0NZy3ZP/"
+    "fJ3b6xnt7h2lvRiJWgk7ngxJiuIMukaaU0I8VUObDbqLdluVSw1+Sr60ICqajLc494VA3R"
+    "ufEl74iQTO4raU29PuXCbeXUeyJaOXGFE9eX5SrO2xiV9OkRArrClpmkbFJkWy2zt0E7ZK"
+    "lYtV2ENO3ikFNzYFJ0pq+aHlBA+ZpALFCBbzscZneqgBqCWvImYw34bb0UZO3wCb6xZhoN"
+    "7hyVfVMFxgLepFvSSOCFrV+0DYzg9gOrav6DE9fJq5pGHa6pt6mGV2I35zp6cj1nrQVrcS"
+    "vvw4YPOCVh6VDO3a8dGjHmbaPfpzFVPHesQwewgJi3Zomsg0tAgBUFXXWxxDihBWy6Qfd5"
+    "k6xHnYL9jZvdyMV5GP4We+eDKTUtltzmP74RYEntGV6Bj/KNgC/SpTjjpVKMYjODs4nhUI"
+    "JJruEhKDob8c+YHb7H664mwJVZ7Wo3SSTxrXgizxBvR49VN8R7q8ZqhbdFE8+auSBWreAp"
+    "JG6Lq+QW/E1T20wVaAWkElgRsJU+/Azda/3sY2eQktDFKKRnWgBIo6TKHXmixSbGyyJ57G"
+    "C8PnSjBLPmfbRlEcysSk0Sytn8FEjiwbzNF79xYpT0x2OCK2MB4iTzaDNZPNK57miWPT2E"
+    "Y+AcL2ksUw1jnBW1V2FSXsKeci5MnPU5Mh4ozvphX10SzDcuMRqqRuc8Czx72pskJ7zGpc"
+    "84P5M56MXb4X+hN7qJafyixonLKLDCK/NXmzyHjeC14BWWLusQZryHs9pEN3T3OdUZ9RFk"
+    "qBh3/ptly082pAtVN6J27CeBM7sdSv8hSyY6gYT8QE0Q1HsA/3Gg92AXWacCRr3bC54bhy"
+    "XHS3Ky6QzYz1Os/KsVebHWWIJWB2IWBdeLd4nd4NoEN1R1pHmhwyPeZZNhAD9QK/L2/j5/"
+    "QqQJ+binSbnqIY+mHJ5xniIcQnZlQS3NsA5k3Seda3hPyYj9+SKkPoWvxoloOJaG9URtTX"
+    "Vy6WBaoGtukt6/6KuC4NqcaOpSd1EdpHInWzG3ckPkP0UEps+n7Ni8zKmOQUlidMd1mdrc"
+    "ggU2BRUs74ZDcOPB2Nn0Qof5L02LOTD7nJe2ZVqe6YRcgwvkgLsuq4bf0plbT0rUPMxCZI"
+    "U9CEnZeKF20de6RisqZs/mHtu+rjS6QAz6SI0w2xEv/hrPdsTZ4WDCQ1hlDN4mSpAULfcw"
+    "kWCbx9dlWZKwbWY3CByled614ZLS6TcVK3kQfbG0bF9X6+D1e3adfRTxdtyl/B3weQp0qp"
+    "ktJzOW8WDhnv8u7FpiCmRDhS8xKphfiDcbm2fRmcffPg9jeyXLDGWZBitucn13eYmgJMFC"
+    "eBCugHiEkFHT8dBtHuYTZpUy/LeZq48UsAzW+YvzLnma67Dfxvg5rJYKzLMcLa10A9+szj"
+    "UafIFbiX6fC2GSrpYElVuC8qfj4w8fPh+///Dpx5OPnz+f/Pg+xDR7qwjcLxffEN+EHiQr"
+    "u6eX1SpqJRGt1CtloE2crVfBN8OgJQ5oSYzLVF/JL76Sqb2SlDVWgTWibCWeG52zTBJbBd"
+    "SQUGKamamx83wVF9Q8+pYgvPUsEiI5fxW8Mwwk4IWAp6XDqibyIj7ShXXHLqwxLVWVbSFF"
+    "VssXtAcZWxOqu5XwXOu8vZfbrFC1WWXdz2XQEoy3ve6Llb8rIS632oqQr7vXFjKSm+2ON9"
+    "vQcFHJySdOJDfaBJKVHaaSZC1ZjbaHZ9yIswKuaXKJbwrfVY8wOeQtwXfbu6nIProC2vLw"
+    "UgnudY8uBWzkwWXHB5dV9wW5IeQW9vYdEaqgGadpJZJHpcpQHxWUoT4SlKGOO30IrMmFWZ"
+    "vStDJVQbb+PPd9ySJ7Ybp901tk/HCTczbBYHue9O8zyHbuhv0B3BibVzfn/UFvdDPAwuhj"
+    "s3d+dXHNJufYHN7dwi1+4fj9+065SV5fkrfQq6jiRE7QyTQxqXQbuoLvrRj6QncVmJHKQj"
+    "c9V4Bxrt9JIY/d1kndsk9Pst5T5FFVfcKmiOXSm9rXEl59FeZqlvCVTlCZGn8vYnqz4ojM"
+    "ObgXA1u1dlZyS2eKAtGB36f9+tcBNcIc7uLgsN5SHwXaneYNdF5oWPJ04zybmvKbpxqsup"
+    "SielM4oBiWKFFwJWiQ7/8GbHvI9dK6b+S+UQEntI8pNn3U6VOt+GD8S9uxieYQorQLeBr7"
+    "jdX1TbX+K7LhSK+oIM/fmxiK6igLdSqSVSuAEk/Oc0Uxu/sAHtJeiIKzI0K15nyJQ9NuUN"
+    "i8WVqGrunUUXyI1gMHAblFjs/thYWFxdcLC4astR2WqW5TzQ2B2SIgTd2BDN18gDXl3tPx"
+    "LLwWHn5c3Ddk1WJE1OXSth4BEwxtXA+RM59DOz8WfH9lwTZOZ64v15wdJbFo6qzguT950O"
+    "uaSLBMqLcRp5YiEssbUgssUT6V9mNjWliSWeOpydY/3l/H2JU75bcCGMebhE+qEaFhjG2L"
+    "oZrBmc2zqTIz1HtHoSZ2d80jXPzY/5Wz/wrct7lFdSJDKMsV678XS3Hgv3E522glkUk3H3"
+    "Vh1ZFV0btgDFs8uxLJE20KfXPcOoVKznGrAHXCBMT++/jTKl3Esy7Jkyn7YHIB/50iuLFv"
+    "M3hDhqId9WcDU7BG4Liqp8WfJq+pyVzbnOX6CtNbxu464LbVCcW+SOsJnkYO/DTWDqbVId"
+    "HLvalxRoVclcg7qF70bhNeR1te2u5t1fQXNYeS1CvWtarBS9rKI7XD41QNWhLU0tu/xHi2"
+    "+OsMjhT8K10TnIFqTnmxXD7PdrRfBsmgcJ1fhh2pGTBXdR7WhGuozenUg+PiCHi1V7ESk5"
+    "yDOqpKVM65NjE6U9C6pV+cqJBGHfiENTxaikvauOq46rrrUdK4eqvarq7pS9h1hgHvFmGF"
+    "/h6bykv7AlCCjLUvQ5ufyzY90suIOhr1l/PcwoIAe7BfVQSOD4chR4JcdAeY8qIwlgkbQf"
+    "SQbLbb1Vlh1r4BxWSwXph/kO07UZsfHJbW02FF3ukj5UwszGdI41Xeu2N0DrfxLzLTTd2Z"
+    "s78se0Z1djEQYPAv1XXpgpV4Z0Vv0FSBNxwLuY5Ng6pTak8sFbPPmlMyVZ05++Ug7ZT1wL"
+    "ae8F15AkUdns1uzPzS9djlsRkUz8Ha9YQlOIQn8rdReZV74mAySuDnsF/xB7NOOae8RxOQ"
+    "tsi//mV7psPcgpeWZfzrXyyNLiZnhr6blnkYfzH+GOgQVbU5wfb5ReqTqbBZNvFsrZhMam"
+    "jWQVkppvashRzXDHRfDUvN88UNKFL4zZBkUwt1Nvah6iotguf85u7LZZ/cDvpnF8MLv/R6"
+    "6DzIbrK5F7o0D/q9y5RHLnwr+kIVed4XYBgnkjCy1/ZXUe7OxpavCh90DvUuY3O2/IXHkA"
+    "x2oRWhzCF/lVh6ZrjHrYZmPoNXiScP6FoNSiHtq0QxdvJaDcp8Bq8ST9dyVUOpfhJK0cmN"
+    "HC+h8KCAuL90YHI5IG6ZIu+uAlTzGKwIb6OyJNQBMEpXGOCNMSoCZP8yvLnOibVPE6YQvT"
+    "PhRb9Pdc3tEgOEyV83NXk7f5p5psYy70883XBBoH2Lj/1zZyOgIyIM6NwMIelkIN1kFBAy"
+    "SGcIkfFa+xOvlVm+2J5YSaOQJnul4amyPuG6AkcT6xM2EbRMjOWGau0llefNxDPPDtFdrd"
+    "5eej7WgGJ9xR53hV2lao/hblD7BGxdUGYax/RGmQBz2B+xYkm7qvnYo7auzTsiGxq/0y20"
+    "lUVtXjKI5cMqCzdt3QTySG1xNqj8tGUxEllFKB6/VAVEv3k7AdxI3jd4ois8tuQL9TGSXY"
+    "nzG9OW1Ca4V0jIUf/28sf/B5c5OnM="
+)
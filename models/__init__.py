@@ -33,6 +33,7 @@ from modules.async_qualifier.models import (
     AsyncQualifierPermalink,
     AsyncQualifierRace,
     AsyncQualifierLiveRace,
+    AsyncQualifierParticipantStats,
     AsyncQualifierAuditLog,
 )
 from models.organizations import (
@@ -61,6 +62,7 @@ from models.notification_subscription import (
 from models.notification_log import NotificationLog, NotificationDeliveryStatus
 from models.discord_scheduled_event import DiscordScheduledEvent
 from models.organization_feature_flag import OrganizationFeatureFlag, FeatureFlag
+from models.seed_pool import PooledSeed
 from models.authorization import (
     OrganizationRole,
     OrganizationMemberRole,
@@ -97,6 +99,7 @@ __all__ = [
     "AsyncQualifierPermalink",
     "AsyncQualifierRace",
     "AsyncQualifierLiveRace",
+    "AsyncQualifierParticipantStats",
     "AsyncQualifierAuditLog",
     "ScheduledTask",
     "TaskType",
@@ -121,6 +124,7 @@ __all__ = [
     "DiscordScheduledEvent",
     "OrganizationFeatureFlag",
     "FeatureFlag",
+    "PooledSeed",
     # Authorization models
     "OrganizationRole",
     "OrganizationMemberRole",
@@ -19,6 +19,8 @@ class AuditLog(Model):
         organization: Optional foreign key to Organization (tenant context)
         action: Action type/name
         details: JSON field with action details
+        tournament_id: Tournament the action concerns (copied from details)
+        match_id: Match the action concerns (copied from details)
         ip_address: IP address of the user
         created_at: Timestamp of the action
     """
@@ -30,12 +32,23 @@ class AuditLog(Model):
     )
     action = fields.CharField(max_length=255)
     details = fields.JSONField(null=True)
+    # Promoted from details so they can be filtered on (plain integers, not
+    # foreign keys: audit entries outlive the rows they describe)
+    tournament_id = fields.IntField(null=True, index=True)
+    match_id = fields.IntField(null=True, index=True)
     ip_address = fields.CharField(max_length=45, null=True)
     created_at = fields.DatetimeField(auto_now_add=True)
 
     class Meta:
         table = "audit_logs"
         ordering = ["-created_at"]
+        # Keyset pagination: newest first per filter, (created_at, id) as the key
+        indexes = (
+            ("organization_id", "created_at", "id"),
+            ("user_id", "created_at", "id"),
+            ("action", "created_at", "id"),
+            ("created_at", "id"),
+        )
 
     def __str__(self) -> str:
         """String representation of audit log entry."""
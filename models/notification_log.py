@@ -59,7 +59,8 @@ class NotificationLog(Model):
         table = "notification_logs"
         indexes = (
             ("user", "created_at"),
-            ("delivery_status",),
+            # Pending queue polled oldest first by the notification processor
+            ("delivery_status", "created_at"),
             ("event_type",),
         )
         ordering = ["-created_at"]
@@ -30,6 +30,8 @@ class TaskType(IntEnum):
     SPEEDGAMING_IMPORT = 7  # Import SpeedGaming episodes into matches
     CLEANUP_PLACEHOLDER_USERS = 8  # Clean up abandoned placeholder users
     RACETIME_POLL_OPEN_ROOMS = 9  # Poll RaceTime.gg for open race rooms and join them
+    SEED_POOL_REFILL = 10  # Pre-generate seeds for upcoming matches and popular presets
+    RACER_REVERIFICATION = 11  # Re-check verified racers and retry failed role grants
     CUSTOM = 99  # Custom task type
 
 
@@ -0,0 +1,76 @@
+"""
+Seed pool model.
+
+Stores pre-generated randomizer seeds so they can be handed out instantly
+instead of calling an external generator when a race room opens.
+"""
+
+from __future__ import annotations
+from tortoise import fields
+from tortoise.models import Model
+
+
+class PooledSeed(Model):
+    """
+    A pre-generated randomizer seed waiting to be claimed.
+
+    Seeds are pooled by (randomizer, settings_hash). The settings hash is
+    computed from the exact settings used to roll the seed, so editing a
+    preset automatically stops older seeds from being handed out.
+
+    A seed may be reserved for a specific match (pre-rolled for an upcoming
+    match) or left unreserved in the warm buffer for a popular preset. Once
+    claimed_at is set the seed is never handed out again.
+    """
+
+    id = fields.IntField(pk=True)
+
+    # Pool key
+    randomizer = fields.CharField(
+        max_length=50, description="Randomizer type (alttpr, sm, smz3, etc.)"
+    )
+    settings_hash = fields.CharField(
+        max_length=64, description="SHA-256 of the canonical settings JSON"
+    )
+    preset = fields.ForeignKeyField(
+        "models.RandomizerPreset",
+        related_name="pooled_seeds",
+        null=True,
+        on_delete=fields.CASCADE,
+        description="Preset the seed was generated from (if any)",
+    )
+    match = fields.ForeignKeyField(
+        "models.Match",
+        related_name="pooled_seeds",
+        null=True,
+        on_delete=fields.CASCADE,
+        description="Match this seed was pre-rolled for (null for the warm buffer)",
+    )
+
+    # Generated seed
+    url = fields.CharField(max_length=500)
+    hash_id = fields.CharField(max_length=255)
+    permalink = fields.CharField(max_length=500, null=True)
+    spoiler_url = fields.CharField(max_length=500, null=True)
+    settings = fields.JSONField(description="Settings used to generate the seed")
+    metadata = fields.JSONField(null=True)
+    generation_ms = fields.IntField(
+        description="How long the external generator took, in milliseconds"
+    )
+
+    # Lifecycle
+    claimed_at = fields.DatetimeField(
+        null=True, description="When the seed was handed out (null if available)"
+    )
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "seed_pool"
+        indexes = (
+            ("randomizer", "settings_hash", "claimed_at"),  # Claiming from a pool
+            ("match_id", "claimed_at"),  # Claiming a match reservation
+        )
+
+    def __str__(self) -> str:
+        """String representation of the pooled seed."""
+        return f"{self.randomizer}/{self.hash_id}"
@@ -6,6 +6,7 @@ from modules.async_qualifier.models.async_qualifier import (
     AsyncQualifierPermalink,
     AsyncQualifierRace,
     AsyncQualifierLiveRace,
+    AsyncQualifierParticipantStats,
     AsyncQualifierAuditLog,
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "AsyncQualifierPermalink",
     "AsyncQualifierRace",
     "AsyncQualifierLiveRace",
+    "AsyncQualifierParticipantStats",
     "AsyncQualifierAuditLog",
 ]
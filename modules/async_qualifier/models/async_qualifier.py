@@ -62,6 +62,7 @@ class AsyncQualifier(Model):
     pools: fields.ReverseRelation["AsyncQualifierPool"]
     races: fields.ReverseRelation["AsyncQualifierRace"]
     live_races: fields.ReverseRelation["AsyncQualifierLiveRace"]
+    participant_stats: fields.ReverseRelation["AsyncQualifierParticipantStats"]
     audit_logs: fields.ReverseRelation["AsyncQualifierAuditLog"]
 
     class Meta:
@@ -190,6 +191,16 @@ class AsyncQualifierRace(Model):
 
     class Meta:
         table = "async_qualifier_races"
+        indexes = (
+            # Active races are loaded by status to arm their timeout timers
+            ("status", "discord_thread_id"),
+            # A racer's races in a qualifier (active race checks, leaderboard)
+            ("tournament_id", "user_id", "status"),
+            # Permalink par time and score recalculation
+            ("permalink_id", "status", "reattempted"),
+            # Review queue, newest first
+            ("tournament_id", "created_at"),
+        )
 
     @property
     def elapsed_time(self) -> Optional[timedelta]:
@@ -240,6 +251,69 @@ class AsyncQualifierRace(Model):
         return status_map.get(self.review_status, self.review_status.title())
 
 
+class AsyncQualifierParticipantStats(Model):
+    """
+    Materialized per-qualifier statistics for one participant.
+
+    Recomputed from the participant's races whenever one of them is created,
+    started, finished, forfeited, reviewed, reattempted or rescored, so the
+    leaderboard and dashboards read one row per user instead of their race
+    history. The counted races are the same ones the leaderboard scores: the
+    best ``runs_per_pool`` completed, non-reattempted races of each pool.
+    """
+
+    id = fields.IntField(pk=True)
+    tournament = fields.ForeignKeyField(
+        "models.AsyncQualifier", related_name="participant_stats"
+    )
+    user = fields.ForeignKeyField("models.User", related_name="async_qualifier_stats")
+
+    # Leaderboard values (over the counted races)
+    score = fields.FloatField(default=0)  # Average, unattempted races count as 0
+    estimate = fields.FloatField(default=0)  # Average of finished races only
+    finished_race_count = fields.IntField(default=0)
+    forfeited_race_count = fields.IntField(default=0)  # Forfeit or disqualified
+    unattempted_race_count = fields.IntField(default=0)
+
+    # Dashboard values (over all of the participant's races)
+    active_race_count = fields.IntField(default=0)  # Pending or in progress
+    reattempted_race_count = fields.IntField(default=0)
+    total_score = fields.FloatField(default=0)  # Sum over finished races
+    best_race = fields.ForeignKeyField(
+        "models.AsyncQualifierRace",
+        related_name=False,
+        null=True,
+        on_delete=fields.SET_NULL,
+    )  # Fastest finished race
+    best_elapsed_seconds = fields.FloatField(null=True)
+    pool_progress = fields.JSONField(
+        default=dict
+    )  # Pool ID (as string) -> finished, non-reattempted races
+
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "async_qualifier_participant_stats"
+        unique_together = (("tournament", "user"),)
+        indexes = (
+            # Leaderboard, best score first
+            ("tournament_id", "score"),
+        )
+
+    @property
+    def best_elapsed_time_formatted(self) -> str:
+        """Get formatted personal best time (HH:MM:SS)."""
+        if self.best_elapsed_seconds is None:
+            return "N/A"
+        hours, remainder = divmod(int(self.best_elapsed_seconds), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    def pool_finished_count(self, pool_id: int) -> int:
+        """Get the number of finished, non-reattempted races in a pool."""
+        return (self.pool_progress or {}).get(str(pool_id), 0)
+
+
 class AsyncQualifierLiveRace(Model):
     """
     Live race event for async qualifiers.
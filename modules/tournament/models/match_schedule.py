@@ -147,6 +147,16 @@ class Match(Model):
     settings_submissions: fields.ReverseRelation["TournamentMatchSettings"]
     racetime_room: fields.OneToOneRelation["RacetimeRoom"]  # Active RaceTime room (if any)
 
+    class Meta:
+        indexes = (
+            ("tournament_id", "scheduled_at", "id"),  # Keyset-paginated schedule listing
+            ("tournament_id", "updated_at"),  # Delta sync (updated_since)
+            # Unfinished matches of a tournament (Discord scheduled event sync)
+            ("tournament_id", "finished_at", "scheduled_at"),
+            # Unfinished matches in a time window (seed pool prefill)
+            ("finished_at", "scheduled_at"),
+        )
+
 
 class MatchSeed(Model):
     """Game seed/ROM information for a match (1:1 with Match)."""
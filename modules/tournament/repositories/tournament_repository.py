@@ -4,10 +4,12 @@ Enforces organization scoping for all reads and writes.
 """
 
 from __future__ import annotations
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Tuple, TYPE_CHECKING
 from datetime import datetime
 import logging
 
+from tortoise.expressions import Q
+
 from modules.tournament.models.match_schedule import Tournament, Match, MatchPlayers, TournamentPlayers
 
 if TYPE_CHECKING:
@@ -15,6 +17,37 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Relations the event schedule renders for each match
+MATCH_LIST_RELATIONS = (
+    "tournament",
+    "stream_channel",
+    "crew_members__user",
+    "seed",
+    "players__user",
+    "racetime_room",
+)
+
+# Match state filters (a match is in the latest state it has reached)
+MATCH_STATE_FILTERS = {
+    "finished": Q(finished_at__isnull=False),
+    "in_progress": Q(finished_at__isnull=True, started_at__isnull=False),
+    "checked_in": Q(
+        finished_at__isnull=True, started_at__isnull=True, checked_in_at__isnull=False
+    ),
+    "scheduled": Q(
+        finished_at__isnull=True,
+        started_at__isnull=True,
+        checked_in_at__isnull=True,
+        scheduled_at__isnull=False,
+    ),
+    "pending": Q(
+        finished_at__isnull=True,
+        started_at__isnull=True,
+        checked_in_at__isnull=True,
+        scheduled_at__isnull=True,
+    ),
+}
+
 
 class TournamentRepository:
     """Data access methods for Tournament model."""
@@ -118,17 +151,94 @@ class TournamentRepository:
         """List all matches for tournaments in an organization, ordered by scheduled date."""
         return (
             await Match.filter(tournament__organization_id=organization_id)
-            .prefetch_related(
-                "tournament",
-                "stream_channel",
-                "crew_members__user",
-                "seed",
-                "players__user",
-                "racetime_room",
-            )
+            .prefetch_related(*MATCH_LIST_RELATIONS)
             .order_by("scheduled_at")
         )
 
+    async def list_matches_page(
+        self,
+        organization_id: int,
+        states: Optional[List[str]] = None,
+        tournament_ids: Optional[List[int]] = None,
+        updated_since: Optional[datetime] = None,
+        after: Optional[Tuple[Optional[datetime], int]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        prefetch: bool = True,
+    ) -> List[Match]:
+        """List one page of organization matches ordered by (scheduled_at, id).
+
+        Unscheduled matches sort first (NULL scheduled_at), as in MySQL and
+        SQLite. Pages are keyset-based: pass the (scheduled_at, id) of the
+        last match of the previous page as ``after``.
+
+        Args:
+            organization_id: Organization ID
+            states: Only include matches in these states (see MATCH_STATE_FILTERS)
+            tournament_ids: Only include matches from these tournaments
+            updated_since: Only include matches updated at or after this time
+            after: Keyset of the last match on the previous page
+            limit: Maximum matches to return (None for all)
+            offset: Matches to skip (for UI page jumps; API clients use ``after``)
+            prefetch: Whether to prefetch the relations the schedule renders
+        """
+        query = Match.filter(
+            self._match_filter(organization_id, states, tournament_ids, updated_since)
+        )
+
+        if after is not None:
+            after_scheduled_at, after_id = after
+            if after_scheduled_at is None:
+                query = query.filter(
+                    Q(scheduled_at__isnull=True, id__gt=after_id)
+                    | Q(scheduled_at__isnull=False)
+                )
+            else:
+                query = query.filter(
+                    Q(scheduled_at__gt=after_scheduled_at)
+                    | Q(scheduled_at=after_scheduled_at, id__gt=after_id)
+                )
+
+        query = query.order_by("scheduled_at", "id")
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        if prefetch:
+            query = query.prefetch_related(*MATCH_LIST_RELATIONS)
+        return await query
+
+    async def count_matches_for_org(
+        self,
+        organization_id: int,
+        states: Optional[List[str]] = None,
+        tournament_ids: Optional[List[int]] = None,
+    ) -> int:
+        """Count organization matches, optionally filtered by state and tournament."""
+        return await Match.filter(
+            self._match_filter(organization_id, states, tournament_ids)
+        ).count()
+
+    @staticmethod
+    def _match_filter(
+        organization_id: int,
+        states: Optional[List[str]] = None,
+        tournament_ids: Optional[List[int]] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> Q:
+        """Build the filter shared by match listing and counting."""
+        condition = Q(tournament__organization_id=organization_id)
+        if states:
+            condition &= Q(
+                *(MATCH_STATE_FILTERS[state] for state in states),
+                join_type=Q.OR,
+            )
+        if tournament_ids:
+            condition &= Q(tournament_id__in=tournament_ids)
+        if updated_since is not None:
+            condition &= Q(updated_at__gte=updated_since)
+        return condition
+
     async def list_matches_for_user(
         self, organization_id: int, user_id: int
     ) -> List[MatchPlayers]:
@@ -192,6 +302,47 @@ class TournamentRepository:
         )
         return registration
 
+    async def register_users_for_tournament(
+        self, organization_id: int, tournament_id: int, user_ids: List[int]
+    ) -> int:
+        """Register several users for a tournament in bulk.
+
+        Users that are already registered are skipped. Returns the number of new
+        registrations (0 if the tournament doesn't belong to the organization).
+        """
+        tournament = await self.get_for_org(organization_id, tournament_id)
+        if not tournament:
+            logger.warning(
+                "Cannot register users for tournament %s - tournament not found in org %s",
+                tournament_id,
+                organization_id,
+            )
+            return 0
+
+        if not user_ids:
+            return 0
+
+        registered = set(
+            await TournamentPlayers.filter(
+                tournament_id=tournament_id, user_id__in=user_ids
+            ).values_list("user_id", flat=True)
+        )
+        to_register = [uid for uid in dict.fromkeys(user_ids) if uid not in registered]
+        if to_register:
+            await TournamentPlayers.bulk_create(
+                [
+                    TournamentPlayers(tournament_id=tournament_id, user_id=uid)
+                    for uid in to_register
+                ]
+            )
+            logger.info(
+                "Registered %s users for tournament %s in org %s",
+                len(to_register),
+                tournament_id,
+                organization_id,
+            )
+        return len(to_register)
+
     async def unregister_user_from_tournament(
         self, organization_id: int, tournament_id: int, user_id: int
     ) -> bool:
@@ -5,6 +5,10 @@ This repository handles data access for tournament usage history.
 """
 
 import logging
+from typing import Any, Dict, Iterable
+
+from tortoise import Tortoise
+
 from models import TournamentUsage, User, Tournament
 
 logger = logging.getLogger(__name__)
@@ -56,6 +60,38 @@ class TournamentUsageRepository:
 
         return usage
 
+    async def upsert_usage_batch(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update many usage records in one statement.
+
+        Each entry has user_id, tournament_id, organization_id,
+        organization_name and tournament_name. Existing (user, tournament)
+        rows are updated in place; last_accessed is set to the write time.
+
+        Args:
+            entries: Usage entries (at most one per user-tournament pair)
+
+        Returns:
+            int: Number of entries written
+        """
+        usages = [TournamentUsage(**entry) for entry in entries]
+        if not usages:
+            return 0
+
+        await TournamentUsage.bulk_create(
+            usages,
+            on_conflict=["user_id", "tournament_id"],
+            update_fields=[
+                "organization_id",
+                "organization_name",
+                "tournament_name",
+                "last_accessed",
+            ],
+        )
+
+        logger.debug("Upserted %d tournament usage records", len(usages))
+        return len(usages)
+
     async def get_recent_tournaments(
         self, user: User, limit: int = 5
     ) -> list[TournamentUsage]:
@@ -151,6 +187,7 @@ class TournamentUsageRepository:
         Remove excess tournament usage entries per user, keeping only the most recent N.
 
         This prevents users with high activity from accumulating too many records.
+        Runs as a single windowed DELETE rather than one query per user.
 
         Args:
             keep_per_user: Number of most recent entries to keep per user (default 10)
@@ -158,32 +195,19 @@ class TournamentUsageRepository:
         Returns:
             int: Number of records deleted
         """
-        # Get all users with usage records
-        users_with_usage = (
-            await TournamentUsage.all().distinct().values_list("user_id", flat=True)
+        # The derived table lets MySQL delete from the table it ranks
+        keep = int(keep_per_user)
+        table = TournamentUsage._meta.db_table
+        conn = Tortoise.get_connection("default")
+        total_deleted, _ = await conn.execute_query(
+            f"DELETE FROM {table} WHERE id IN ("
+            f"SELECT id FROM ("
+            f"SELECT id, ROW_NUMBER() OVER ("
+            f"PARTITION BY user_id ORDER BY last_accessed DESC, id DESC"
+            f") AS usage_rank FROM {table}"
+            f") ranked WHERE usage_rank > {keep})"
         )
 
-        total_deleted = 0
-        for user_id in users_with_usage:
-            # Get all usage records for this user, ordered by most recent first
-            all_usage = (
-                await TournamentUsage.filter(user_id=user_id)
-                .order_by("-last_accessed")
-                .values_list("id", flat=True)
-            )
-
-            # If user has more than keep_per_user records, delete the excess
-            if len(all_usage) > keep_per_user:
-                ids_to_delete = all_usage[keep_per_user:]  # Get IDs beyond the limit
-                deleted = await TournamentUsage.filter(id__in=ids_to_delete).delete()
-                total_deleted += deleted
-
-                logger.debug(
-                    "Cleaned up %d excess tournament usage entries for user %s",
-                    deleted,
-                    user_id,
-                )
-
         logger.info(
             "Cleaned up %d excess tournament usage entries across all users (keeping %d per user)",
             total_deleted,
@@ -3,15 +3,27 @@ Preset Selection Service - Rule Evaluation Engine.
 
 Safely evaluates declarative rules to determine which randomizer preset
 to use for a tournament match based on match properties and player settings.
+
+Rules are compiled once into closures (with regexes and comparison values
+prepared up front) and cached by the content of the rules configuration, so
+editing a tournament's rules produces a new compiled program automatically.
+Compilation also records which fields the rules reference, so evaluation
+only queries the data it actually needs.
 """
 
 from __future__ import annotations
-from typing import Optional, Any, Dict, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Any, Callable, Dict, FrozenSet, List, Tuple
+import json
+import operator as op
 import re
 import logging
 from datetime import datetime
 
-from modules.tournament.models.match_schedule import Match, Tournament
+from tortoise.functions import Count
+
+from modules.tournament.models.match_schedule import Match, MatchPlayers, Tournament
 from modules.tournament.models.tournament_match_settings import (
     TournamentMatchSettings,
 )
@@ -19,28 +31,71 @@ from models.randomizer_preset import RandomizerPreset
 
 logger = logging.getLogger(__name__)
 
+# Compiled predicate: evaluation context -> bool
+Predicate = Callable[[Dict[str, Any]], bool]
+
+# Numeric comparison operators
+_NUMERIC_OPERATORS = {
+    '>': op.gt,
+    '>=': op.ge,
+    '<': op.lt,
+    '<=': op.le,
+}
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A single rule compiled into a predicate."""
+
+    name: str
+    preset_id: Optional[int]
+    predicate: Optional[Predicate]
+    error: Optional[str] = None  # Set (and predicate None) if the rule is invalid
+
+
+@dataclass(frozen=True)
+class CompiledRuleSet:
+    """Compiled rules for a tournament, in evaluation order."""
+
+    rules: Tuple[CompiledRule, ...]
+    fields: FrozenSet[str]
+
+    @property
+    def needs_player_count(self) -> bool:
+        """Whether any rule references match.player_count (requires a query)."""
+        return 'match.player_count' in self.fields
+
+
+@lru_cache(maxsize=256)
+def _compile_rules_json(rules_json: str) -> CompiledRuleSet:
+    """Compile a canonical rules JSON string (cached by content)."""
+    return PresetSelectionService.compile_rules(json.loads(rules_json))
+
 
 class PresetSelectionService:
     """
     Service for evaluating preset selection rules.
-    
+
     Provides safe, declarative rule evaluation without code execution.
     Rules are JSON configurations that specify conditions and resulting presets.
     """
-    
+
     # Maximum rules to prevent performance issues
     MAX_RULES = 20
-    
+
     # Maximum condition nesting depth
     MAX_CONDITION_DEPTH = 5
-    
+
+    # Maximum regex pattern length (prevents catastrophic backtracking)
+    MAX_REGEX_LENGTH = 200
+
     # Whitelisted field prefixes that can be accessed
     ALLOWED_FIELD_PREFIXES = {
         'match.',
         'settings.',
         'tournament.',
     }
-    
+
     # Supported operators
     OPERATORS = {
         # Equality
@@ -52,10 +107,10 @@ class PresetSelectionService:
         # List operations
         'in', 'not_in',
     }
-    
+
     # Logical operators
     LOGICAL_OPERATORS = {'AND', 'OR', 'NOT'}
-    
+
     async def select_preset_for_match(
         self,
         match: Match,
@@ -65,13 +120,13 @@ class PresetSelectionService:
     ) -> Optional[int]:
         """
         Evaluate rules and return preset_id to use for a match.
-        
+
         Args:
             match: Match to select preset for
             tournament: Tournament configuration
             game_number: Game number in best-of-N series
             player_settings: Optional player-submitted settings
-            
+
         Returns:
             preset_id to use, or None to use tournament default
         """
@@ -82,50 +137,148 @@ class PresetSelectionService:
                 tournament.id
             )
             return tournament.randomizer_preset_id
-        
-        rules_config = tournament.preset_selection_rules
-        rules = rules_config.get('rules', [])
-        
-        # Validate rule count
-        if len(rules) > self.MAX_RULES:
-            logger.warning(
-                "Tournament %s has %d rules (max %d), truncating",
-                tournament.id,
-                len(rules),
-                self.MAX_RULES
+
+        rule_set = self.get_compiled_rules(tournament)
+
+        player_count = None
+        if rule_set.needs_player_count:
+            player_count = await MatchPlayers.filter(match_id=match.id).count()
+
+        context = self._build_context(
+            match, tournament, game_number, player_settings, player_count
+        )
+        return self._select(rule_set, context, match, tournament)
+
+    async def select_presets_for_matches(
+        self,
+        matches: List[Match],
+        game_number: int = 1,
+        player_settings: Optional[Dict[int, TournamentMatchSettings]] = None,
+    ) -> Dict[int, Optional[int]]:
+        """
+        Select presets for many matches in one pass.
+
+        Rules are compiled once per tournament and player counts (only if a
+        rule references them) are loaded with a single grouped query.
+
+        Args:
+            matches: Matches to select presets for (tournaments are loaded if
+                they were not prefetched)
+            game_number: Game number in best-of-N series
+            player_settings: Optional player-submitted settings by match ID
+
+        Returns:
+            Dictionary of match ID -> preset_id (or None for no preset)
+        """
+        if not matches:
+            return {}
+
+        unloaded = [m for m in matches if not isinstance(m.tournament, Tournament)]
+        if unloaded:
+            await Match.fetch_for_list(unloaded, 'tournament')
+
+        rule_sets = {
+            match.id: self.get_compiled_rules(match.tournament)
+            for match in matches
+            if match.tournament.preset_selection_rules
+        }
+
+        counted_ids = [
+            match_id
+            for match_id, rule_set in rule_sets.items()
+            if rule_set.needs_player_count
+        ]
+        player_counts: Dict[int, int] = {}
+        if counted_ids:
+            player_counts = dict(
+                await MatchPlayers.filter(match_id__in=counted_ids)
+                .group_by('match_id')
+                .annotate(player_count=Count('id'))
+                .values_list('match_id', 'player_count')
             )
-            rules = rules[:self.MAX_RULES]
-        
-        # Build evaluation context
-        context = await self._build_context(
-            match, tournament, game_number, player_settings
+
+        player_settings = player_settings or {}
+        selections: Dict[int, Optional[int]] = {}
+        for match in matches:
+            tournament = match.tournament
+            rule_set = rule_sets.get(match.id)
+            if rule_set is None:
+                selections[match.id] = tournament.randomizer_preset_id
+                continue
+
+            context = self._build_context(
+                match,
+                tournament,
+                game_number,
+                player_settings.get(match.id),
+                player_counts.get(match.id, 0) if rule_set.needs_player_count else None,
+            )
+            selections[match.id] = self._select(rule_set, context, match, tournament)
+
+        return selections
+
+    def get_compiled_rules(self, tournament: Tournament) -> CompiledRuleSet:
+        """
+        Get the compiled rules for a tournament.
+
+        Compiled programs are cached by the canonical JSON of the rules, so a
+        tournament is compiled once per version of its rules.
+
+        Args:
+            tournament: Tournament with preset_selection_rules
+
+        Returns:
+            CompiledRuleSet for the tournament's rules
+        """
+        rules_json = json.dumps(
+            tournament.preset_selection_rules or {}, sort_keys=True, default=str
         )
-        
-        # Evaluate rules in order (first match wins)
-        for idx, rule in enumerate(rules):
-            rule_name = rule.get('name', f'Rule {idx + 1}')
-            
+        return _compile_rules_json(rules_json)
+
+    def _select(
+        self,
+        rule_set: CompiledRuleSet,
+        context: Dict[str, Any],
+        match: Match,
+        tournament: Tournament,
+    ) -> Optional[int]:
+        """
+        Run compiled rules against a context (first match wins).
+
+        Args:
+            rule_set: Compiled rules
+            context: Evaluation context
+            match: Match being evaluated (for logging)
+            tournament: Tournament (for the default preset)
+
+        Returns:
+            preset_id of the first matching rule, or the tournament default
+        """
+        for rule in rule_set.rules:
+            # Invalid rules were logged when compiled
+            if rule.predicate is None:
+                continue
+
             try:
-                if self._evaluate_rule(rule, context):
-                    preset_id = rule.get('preset_id')
+                if rule.predicate(context):
                     logger.info(
                         "Match %s matched rule '%s', using preset %s",
                         match.id,
-                        rule_name,
-                        preset_id
+                        rule.name,
+                        rule.preset_id
                     )
-                    return preset_id
+                    return rule.preset_id
             except Exception as e:
                 logger.error(
                     "Error evaluating rule '%s' for match %s: %s",
-                    rule_name,
+                    rule.name,
                     match.id,
                     e,
                     exc_info=True
                 )
                 # Continue to next rule on error
                 continue
-        
+
         # No rules matched - use tournament default
         logger.debug(
             "No rules matched for match %s, using tournament default preset %s",
@@ -133,311 +286,321 @@ class PresetSelectionService:
             tournament.randomizer_preset_id
         )
         return tournament.randomizer_preset_id
-    
-    async def _build_context(
+
+    def _build_context(
         self,
         match: Match,
         tournament: Tournament,
         game_number: int,
         player_settings: Optional[TournamentMatchSettings],
+        player_count: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
-        Build evaluation context with all available data.
-        
+        Build evaluation context from already-loaded data.
+
         Args:
             match: Match instance
             tournament: Tournament instance
             game_number: Game number in series
             player_settings: Optional player settings
-            
+            player_count: Number of players (None if no rule needs it)
+
         Returns:
             Dictionary of context data for rule evaluation
         """
-        # Ensure match has required relations loaded
-        await match.fetch_related('players__user', 'tournament')
-        
         # Build match context
         match_context = {
             'id': match.id,
             'title': match.title or '',
-            'round_number': match.round_number or 0,
+            'round_number': getattr(match, 'round_number', None) or 0,
             'game_number': game_number,
             'scheduled_at': match.scheduled_at,
-            'player_count': await match.players.all().count(),
+            'player_count': player_count,
         }
-        
+
         # Add datetime properties if scheduled
         if match.scheduled_at:
             match_context['scheduled_at.day_of_week'] = match.scheduled_at.strftime('%A')
             match_context['scheduled_at.hour'] = match.scheduled_at.hour
             match_context['scheduled_at.day'] = match.scheduled_at.day
-        
+
         # Build settings context (from player submission)
         settings_context = {}
         if player_settings and player_settings.settings:
             settings_context = player_settings.settings.copy()
-        
+
         # Build tournament context
         tournament_context = {
             'id': tournament.id,
             'name': tournament.name,
             # Add more tournament fields as needed
         }
-        
+
         # Combine into full context
         context = {
             'match': match_context,
             'settings': settings_context,
             'tournament': tournament_context,
         }
-        
+
         return context
-    
-    def _evaluate_rule(self, rule: Dict[str, Any], context: Dict[str, Any]) -> bool:
+
+    @classmethod
+    def compile_rules(cls, rules_config: Dict[str, Any]) -> CompiledRuleSet:
         """
-        Evaluate a single rule against context.
-        
+        Compile a rules configuration into predicates.
+
+        Invalid rules (unknown field/operator, bad regex or comparison value,
+        excessive nesting) are logged once here and skipped at evaluation.
+        Prefer get_compiled_rules(), which caches the result.
+
         Args:
-            rule: Rule configuration dictionary
-            context: Evaluation context
-            
+            rules_config: Rules configuration ({'rules': [...]})
+
         Returns:
-            True if rule matches, False otherwise
+            CompiledRuleSet
         """
-        conditions = rule.get('conditions')
-        if not conditions:
-            logger.warning("Rule has no conditions: %s", rule.get('name', 'Unknown'))
-            return False
-        
-        return self._evaluate_condition(conditions, context, depth=0)
-    
-    def _evaluate_condition(
-        self,
+        rules = rules_config.get('rules', [])
+
+        # Validate rule count
+        if len(rules) > cls.MAX_RULES:
+            logger.warning(
+                "Rules configuration has %d rules (max %d), truncating",
+                len(rules),
+                cls.MAX_RULES
+            )
+            rules = rules[:cls.MAX_RULES]
+
+        compiled = []
+        fields: set[str] = set()
+        for idx, rule in enumerate(rules):
+            rule_name = rule.get('name', f'Rule {idx + 1}')
+            conditions = rule.get('conditions')
+
+            if not conditions:
+                logger.warning("Rule has no conditions: %s", rule_name)
+                predicate, error = (lambda context: False), None
+            else:
+                try:
+                    predicate = cls._compile_condition(conditions, fields, depth=0)
+                    error = None
+                except (ValueError, re.error) as e:
+                    logger.error("Error compiling rule '%s': %s", rule_name, e)
+                    predicate, error = None, str(e)
+
+            compiled.append(
+                CompiledRule(
+                    name=rule_name,
+                    preset_id=rule.get('preset_id'),
+                    predicate=predicate,
+                    error=error,
+                )
+            )
+
+        return CompiledRuleSet(rules=tuple(compiled), fields=frozenset(fields))
+
+    @classmethod
+    def _compile_condition(
+        cls,
         condition: Dict[str, Any],
-        context: Dict[str, Any],
+        fields: set[str],
         depth: int = 0,
-    ) -> bool:
+    ) -> Predicate:
         """
-        Recursively evaluate a condition (may contain nested conditions).
-        
+        Recursively compile a condition (may contain nested conditions).
+
         Args:
             condition: Condition configuration
-            context: Evaluation context
+            fields: Set collecting the fields referenced by the condition
             depth: Current recursion depth
-            
+
         Returns:
-            True if condition is satisfied
-            
+            Predicate evaluating the condition against a context
+
         Raises:
             ValueError: If condition is malformed or exceeds max depth
         """
         # Check depth limit
-        if depth > self.MAX_CONDITION_DEPTH:
-            raise ValueError(f"Condition nesting exceeds maximum depth of {self.MAX_CONDITION_DEPTH}")
-        
-        # Check if this is a logical operator (AND/OR/NOT)
+        if depth > cls.MAX_CONDITION_DEPTH:
+            raise ValueError(f"Condition nesting exceeds maximum depth of {cls.MAX_CONDITION_DEPTH}")
+
         condition_type = condition.get('type')
-        
-        if condition_type in self.LOGICAL_OPERATORS:
-            return self._evaluate_logical_condition(condition, context, depth)
-        
-        # Otherwise, this is a leaf condition - evaluate it
-        return self._evaluate_leaf_condition(condition, context)
-    
-    def _evaluate_logical_condition(
-        self,
-        condition: Dict[str, Any],
-        context: Dict[str, Any],
-        depth: int,
-    ) -> bool:
-        """
-        Evaluate a logical condition (AND/OR/NOT).
-        
-        Args:
-            condition: Logical condition configuration
-            context: Evaluation context
-            depth: Current recursion depth
-            
-        Returns:
-            Result of logical operation
-        """
-        condition_type = condition['type']
-        conditions = condition.get('conditions', [])
-        
-        if condition_type == 'AND':
-            # All conditions must be true
-            return all(
-                self._evaluate_condition(cond, context, depth + 1)
-                for cond in conditions
-            )
-        
-        elif condition_type == 'OR':
-            # At least one condition must be true
-            return any(
-                self._evaluate_condition(cond, context, depth + 1)
-                for cond in conditions
-            )
-        
-        elif condition_type == 'NOT':
-            # Negate the result of a single condition
-            if len(conditions) != 1:
+
+        if condition_type in cls.LOGICAL_OPERATORS:
+            children = [
+                cls._compile_condition(cond, fields, depth + 1)
+                for cond in condition.get('conditions', [])
+            ]
+
+            if condition_type == 'AND':
+                return lambda context: all(child(context) for child in children)
+
+            if condition_type == 'OR':
+                return lambda context: any(child(context) for child in children)
+
+            # NOT negates a single condition
+            if len(children) != 1:
                 raise ValueError("NOT operator requires exactly one condition")
-            return not self._evaluate_condition(conditions[0], context, depth + 1)
-        
-        else:
-            raise ValueError(f"Unknown logical operator: {condition_type}")
-    
-    def _evaluate_leaf_condition(
-        self,
-        condition: Dict[str, Any],
-        context: Dict[str, Any],
-    ) -> bool:
-        """
-        Evaluate a leaf condition (no nested conditions).
-        
-        Args:
-            condition: Leaf condition configuration
-            context: Evaluation context
-            
-        Returns:
-            Result of comparison
-        """
+            child = children[0]
+            return lambda context: not child(context)
+
+        # Otherwise, this is a leaf condition
         field = condition.get('field')
         operator = condition.get('operator')
-        expected_value = condition.get('value')
-        
+
         if not field or not operator:
             raise ValueError("Condition missing 'field' or 'operator'")
-        
+
         # Validate field is allowed
-        if not any(field.startswith(prefix) for prefix in self.ALLOWED_FIELD_PREFIXES):
+        if not any(field.startswith(prefix) for prefix in cls.ALLOWED_FIELD_PREFIXES):
             raise ValueError(f"Field '{field}' is not allowed")
-        
+
         # Validate operator is supported
-        if operator not in self.OPERATORS:
+        if operator not in cls.OPERATORS:
             raise ValueError(f"Operator '{operator}' is not supported")
-        
-        # Get actual value from context
-        actual_value = self._get_field_value(field, context)
-        
-        # Perform comparison
-        return self._compare_values(actual_value, operator, expected_value)
-    
-    def _get_field_value(self, field: str, context: Dict[str, Any]) -> Any:
+
+        fields.add(field)
+        get_value = cls._compile_field(field)
+        expected = condition.get('value')
+        try:
+            compare = cls._compile_comparison(operator, expected)
+        except (ValueError, TypeError, re.error) as e:
+            # Like a failed comparison, an invalid value only makes this
+            # condition false; the rest of the rule still applies
+            logger.warning(
+                "Invalid value for %s %s %r: %s", field, operator, expected, e
+            )
+            return lambda context: False
+        return lambda context: compare(get_value(context))
+
+    @staticmethod
+    def _compile_field(field: str) -> Callable[[Dict[str, Any]], Any]:
         """
-        Get field value from context using dot notation.
-        
+        Compile a dotted field path into a context accessor.
+
+        The remainder after the scope is tried as a flat key first (e.g.
+        'scheduled_at.hour' in the match context) before walking nested dicts.
+
         Args:
             field: Field path (e.g., 'match.title', 'settings.preset')
-            context: Evaluation context
-            
+
         Returns:
-            Field value or None if not found
+            Callable returning the field value or None if not found
         """
-        parts = field.split('.')
-        value = context
-        
-        for part in parts:
-            if isinstance(value, dict):
+        scope, _, path = field.partition('.')
+        parts = path.split('.')
+
+        def get_value(context: Dict[str, Any]) -> Any:
+            value = context.get(scope)
+            if not isinstance(value, dict):
+                return None
+            if path in value:
+                return value[path]
+            for part in parts:
+                if not isinstance(value, dict):
+                    return None
                 value = value.get(part)
                 if value is None:
                     return None
-            else:
-                return None
-        
-        return value
-    
-    def _compare_values(
-        self,
-        actual: Any,
+            return value
+
+        return get_value
+
+    @classmethod
+    def _compile_comparison(
+        cls,
         operator: str,
         expected: Any,
-    ) -> bool:
+    ) -> Callable[[Any], bool]:
         """
-        Compare two values using the specified operator.
-        
+        Compile a comparison against an expected value.
+
+        Expected values are converted once here (lower-cased strings, compiled
+        regexes, floats, sets) rather than on every evaluation.
+
         Args:
-            actual: Actual value from context
             operator: Comparison operator
             expected: Expected value from rule
-            
+
         Returns:
-            Comparison result
+            Callable comparing an actual value to the expected value
+
+        Raises:
+            ValueError: If the expected value is invalid for the operator
+            TypeError: If the expected value has the wrong type
+            re.error: If a regex pattern does not compile
         """
-        # Handle None/null values
-        if actual is None:
-            return operator == 'equals' and expected is None
-        
-        try:
-            # Equality operators
-            if operator == 'equals':
-                return actual == expected
-            
-            elif operator == 'not_equals':
-                return actual != expected
-            
-            # String operators
-            elif operator == 'contains':
-                return str(expected).lower() in str(actual).lower()
-            
+        # Equality operators
+        if operator == 'equals':
+            test = lambda actual: actual == expected
+
+        elif operator == 'not_equals':
+            test = lambda actual: actual != expected
+
+        # String operators
+        elif operator in ('contains', 'starts_with', 'ends_with'):
+            needle = str(expected).lower()
+            if operator == 'contains':
+                test = lambda actual: needle in str(actual).lower()
             elif operator == 'starts_with':
-                return str(actual).lower().startswith(str(expected).lower())
-            
-            elif operator == 'ends_with':
-                return str(actual).lower().endswith(str(expected).lower())
-            
-            elif operator == 'matches_regex':
-                # Limited regex support - validate pattern first
-                pattern = str(expected)
-                if len(pattern) > 200:  # Prevent catastrophic backtracking
-                    raise ValueError("Regex pattern too long")
-                return bool(re.search(pattern, str(actual), re.IGNORECASE))
-            
-            # Numeric comparison operators
-            elif operator in ('>', '>=', '<', '<='):
-                actual_num = float(actual) if actual is not None else 0
-                expected_num = float(expected)
-                
-                if operator == '>':
-                    return actual_num > expected_num
-                elif operator == '>=':
-                    return actual_num >= expected_num
-                elif operator == '<':
-                    return actual_num < expected_num
-                elif operator == '<=':
-                    return actual_num <= expected_num
-            
-            elif operator == 'between':
-                # expected should be [min, max]
-                if not isinstance(expected, (list, tuple)) or len(expected) != 2:
-                    raise ValueError("'between' operator requires [min, max] array")
-                actual_num = float(actual) if actual is not None else 0
-                return expected[0] <= actual_num <= expected[1]
-            
-            # List operators
-            elif operator == 'in':
-                if not isinstance(expected, (list, tuple)):
-                    raise ValueError("'in' operator requires array value")
-                return actual in expected
-            
-            elif operator == 'not_in':
-                if not isinstance(expected, (list, tuple)):
-                    raise ValueError("'not_in' operator requires array value")
-                return actual not in expected
-            
+                test = lambda actual: str(actual).lower().startswith(needle)
             else:
-                raise ValueError(f"Operator '{operator}' not implemented")
-        
-        except (ValueError, TypeError) as e:
-            logger.warning(
-                "Comparison failed for %s %s %s: %s",
-                actual,
-                operator,
-                expected,
-                e
-            )
-            return False
-    
+                test = lambda actual: str(actual).lower().endswith(needle)
+
+        elif operator == 'matches_regex':
+            pattern = str(expected)
+            if len(pattern) > cls.MAX_REGEX_LENGTH:
+                raise ValueError("Regex pattern too long")
+            regex = re.compile(pattern, re.IGNORECASE)
+            test = lambda actual: bool(regex.search(str(actual)))
+
+        # Numeric comparison operators
+        elif operator in _NUMERIC_OPERATORS:
+            compare = _NUMERIC_OPERATORS[operator]
+            expected_num = float(expected)
+            test = lambda actual: compare(float(actual), expected_num)
+
+        elif operator == 'between':
+            # expected should be [min, max]
+            if not isinstance(expected, (list, tuple)) or len(expected) != 2:
+                raise ValueError("'between' operator requires [min, max] array")
+            low, high = expected
+            test = lambda actual: low <= float(actual) <= high
+
+        # List operators
+        elif operator in ('in', 'not_in'):
+            if not isinstance(expected, (list, tuple)):
+                raise ValueError(f"'{operator}' operator requires array value")
+            try:
+                members = frozenset(expected)
+            except TypeError:
+                members = tuple(expected)
+            if operator == 'in':
+                test = lambda actual: actual in members
+            else:
+                test = lambda actual: actual not in members
+
+        else:
+            raise ValueError(f"Operator '{operator}' not implemented")
+
+        def compare_value(actual: Any) -> bool:
+            # Handle None/null values
+            if actual is None:
+                return operator == 'equals' and expected is None
+            try:
+                return test(actual)
+            except (ValueError, TypeError) as e:
+                logger.warning(
+                    "Comparison failed for %s %s %s: %s",
+                    actual,
+                    operator,
+                    expected,
+                    e
+                )
+                return False
+
+        return compare_value
+
     async def validate_rules(
         self,
         rules_config: Dict[str, Any],
@@ -4,10 +4,11 @@ Contains org-scoped business logic and authorization checks.
 """
 
 from __future__ import annotations
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Tuple, TYPE_CHECKING
 from datetime import datetime, timezone
 import logging
 
+from config import settings
 from models import User, SYSTEM_USER_ID
 from modules.tournament.models.match_schedule import (
     Tournament,
@@ -17,11 +18,20 @@ from modules.tournament.models.match_schedule import (
     Crew,
 )
 from models.racetime_room import RacetimeRoom
-from modules.tournament.repositories.tournament_repository import TournamentRepository
+from modules.tournament.repositories.tournament_repository import (
+    MATCH_STATE_FILTERS,
+    TournamentRepository,
+)
 from application.services.organizations.organization_service import OrganizationService
 from application.services.authorization.authorization_service_v2 import (
     AuthorizationServiceV2,
 )
+from application.utils.aiohttp_pool import create_session, get_session
+from application.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    parse_cursor_datetime,
+)
 from application.events import (
     EventBus,
     CrewAddedEvent,
@@ -363,6 +373,79 @@ class TournamentService:
         """
         return await self.repo.list_matches_for_org(organization_id)
 
+    async def list_org_matches_page(
+        self,
+        organization_id: int,
+        states: Optional[List[str]] = None,
+        tournament_ids: Optional[List[int]] = None,
+        updated_since: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        prefetch: bool = True,
+    ) -> Tuple[List[Match], Optional[str]]:
+        """List one keyset page of organization matches.
+
+        No special authorization - any member can view the event schedule.
+
+        Args:
+            organization_id: Organization ID
+            states: Only include matches in these states (pending, scheduled,
+                checked_in, in_progress, finished)
+            tournament_ids: Only include matches from these tournaments
+            updated_since: Delta mode - only matches updated at or after this time
+            cursor: Cursor returned with the previous page
+            limit: Page size (None for all remaining matches)
+            offset: Matches to skip (for UI page jumps; API clients use cursor)
+            prefetch: Whether to prefetch the relations the schedule renders
+
+        Returns:
+            Tuple of (matches, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If a state or the cursor is invalid
+        """
+        unknown = set(states or []) - set(MATCH_STATE_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown match state(s): {', '.join(sorted(unknown))}")
+
+        after = None
+        if cursor:
+            scheduled_at, match_id = decode_cursor(cursor, 2)
+            if not isinstance(match_id, int):
+                raise ValueError("Invalid cursor")
+            after = (parse_cursor_datetime(scheduled_at), match_id)
+
+        # Fetch one extra row to know whether another page exists
+        matches = await self.repo.list_matches_page(
+            organization_id,
+            states=states,
+            tournament_ids=tournament_ids,
+            updated_since=updated_since,
+            after=after,
+            limit=limit + 1 if limit is not None else None,
+            offset=offset,
+            prefetch=prefetch,
+        )
+
+        next_cursor = None
+        if limit is not None and len(matches) > limit:
+            matches = matches[:limit]
+            last = matches[-1]
+            next_cursor = encode_cursor([last.scheduled_at, last.id])
+        return matches, next_cursor
+
+    async def count_org_matches(
+        self,
+        organization_id: int,
+        states: Optional[List[str]] = None,
+        tournament_ids: Optional[List[int]] = None,
+    ) -> int:
+        """Count organization matches, optionally filtered by state and tournament."""
+        return await self.repo.count_matches_for_org(
+            organization_id, states=states, tournament_ids=tournament_ids
+        )
+
     async def list_user_matches(
         self, organization_id: int, user_id: int
     ) -> List[MatchPlayers]:
@@ -1265,25 +1348,19 @@ class TournamentService:
             logger.warning("Match %s has no RaceTime room to sync", match_id)
             raise ValueError(error_msg)
 
-        # Query RaceTime API for race status
-        import aiohttp
-        from config import Settings
-
-        settings = Settings()
-
+        # Query RaceTime API for race status (shared keep-alive connection pool)
         category = room.category
         room_name = room.room_name
 
-        async with aiohttp.ClientSession() as session:
-            url = f"{settings.RACETIME_URL}/{category}/{room_name}/data"
+        url = f"{settings.RACETIME_URL}/{category}/{room_name}/data"
 
-            async with session.get(url) as response:
-                if response.status != 200:
-                    raise ValueError(
-                        f"Failed to fetch RaceTime data: HTTP {response.status}"
-                    )
+        async with get_session().get(url) as response:
+            if response.status != 200:
+                raise ValueError(
+                    f"Failed to fetch RaceTime data: HTTP {response.status}"
+                )
 
-                race_data = await response.json()
+            race_data = await response.json()
 
         # Get race status
         race_status = race_data.get("status", {}).get("value") if race_data else None
@@ -1463,7 +1540,6 @@ class TournamentService:
         # Create room via RaceTime bot
         try:
             from racetime.client import RacetimeBot
-            import aiohttp
 
             # Get bot credentials
             bot_config = match.tournament.racetime_bot
@@ -1484,7 +1560,7 @@ class TournamentService:
             )
 
             # Initialize the bot's HTTP session and get access token
-            racetime_bot.http = aiohttp.ClientSession()
+            racetime_bot.http = create_session()
             try:
                 logger.info("Authorizing bot with RaceTime API...")
                 # Call authorize() directly (not reauthorize which runs in a loop)
@@ -0,0 +1,190 @@
+"""
+Write-behind buffer for tournament usage tracking.
+
+Tournament pages record an access on every view. Instead of writing each
+access to the database on the page-render path, accesses are collected in
+memory (last write wins per user-tournament pair) and flushed periodically as
+one batched upsert. Runs as a background task in the application lifecycle.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from application.utils.background_worker import BackgroundWorker
+from config import settings
+from modules.tournament.repositories.tournament_usage_repository import (
+    TournamentUsageRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TournamentUsageBuffer(BackgroundWorker):
+    """
+    In-memory buffer of tournament accesses flushed as batched upserts.
+
+    Accesses recorded while a flush is running are kept for the next flush.
+    """
+
+    name = "Tournament usage buffer"
+
+    def __init__(self, flush_interval: Optional[float] = None):
+        """
+        Initialize the buffer.
+
+        Args:
+            flush_interval: Seconds between flushes
+                (default: TOURNAMENT_USAGE_FLUSH_SECONDS)
+        """
+        super().__init__()
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.TOURNAMENT_USAGE_FLUSH_SECONDS
+        )
+        self.repository = TournamentUsageRepository()
+        self._pending: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of user-tournament pairs waiting to be flushed."""
+        return len(self._pending)
+
+    def record(
+        self,
+        user_id: int,
+        tournament_id: int,
+        organization_id: int,
+        organization_name: str,
+        tournament_name: str,
+    ) -> None:
+        """
+        Record an access (replaces any pending access for the same pair).
+
+        Args:
+            user_id: ID of the user
+            tournament_id: ID of the tournament
+            organization_id: ID of the organization
+            organization_name: Name of the organization
+            tournament_name: Name of the tournament
+        """
+        self._pending[(user_id, tournament_id)] = {
+            "user_id": user_id,
+            "tournament_id": tournament_id,
+            "organization_id": organization_id,
+            "organization_name": organization_name,
+            "tournament_name": tournament_name,
+        }
+
+    async def flush(self) -> int:
+        """
+        Write all pending accesses in one batched upsert.
+
+        If the batched upsert fails, entries are written one by one so a
+        single bad entry (e.g. for a user or tournament deleted meanwhile) is
+        dropped instead of blocking every later flush. If none can be
+        written, the entries are put back (unless a newer access for the same
+        pair was recorded meanwhile) and retried on the next flush.
+
+        Returns:
+            int: Number of records written
+        """
+        async with self._lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, {}
+            try:
+                written = await self.repository.upsert_usage_batch(batch.values())
+            except Exception as e:
+                logger.warning(
+                    "Batched tournament usage upsert of %d record(s) failed, "
+                    "writing individually: %s",
+                    len(batch),
+                    e,
+                )
+                written = await self._write_individually(batch)
+
+            logger.debug("Flushed %d tournament usage record(s)", written)
+            return written
+
+    async def _write_individually(
+        self, batch: Dict[Tuple[int, int], Dict[str, Any]]
+    ) -> int:
+        """Upsert entries one at a time, dropping those that fail."""
+        written = 0
+        failed: List[Dict[str, Any]] = []
+        last_error: Optional[Exception] = None
+        for entry in batch.values():
+            try:
+                written += await self.repository.upsert_usage_batch([entry])
+            except Exception as e:
+                failed.append(entry)
+                last_error = e
+
+        if failed and not written:
+            # Most likely the database is unavailable; keep everything
+            for key, entry in batch.items():
+                self._pending.setdefault(key, entry)
+            raise last_error
+
+        for entry in failed:
+            logger.error(
+                "Dropped tournament usage record: user_id=%s, tournament_id=%s",
+                entry["user_id"],
+                entry["tournament_id"],
+            )
+        return written
+
+    def next_delay(self) -> float:
+        """Seconds between flushes."""
+        return self.flush_interval
+
+    async def run_once(self):
+        """Flush pending accesses."""
+        await self.flush()
+
+    async def start(self) -> bool:
+        """Start the background flush loop."""
+        if not await super().start():
+            return False
+        logger.info(
+            "Tournament usage buffer started (flush interval: %ss)", self.flush_interval
+        )
+        return True
+
+    async def stop(self) -> bool:
+        """Stop the background flush loop and flush remaining accesses."""
+        if not await super().stop():
+            return False
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error("Error flushing tournament usage on shutdown: %s", e)
+        logger.info("Tournament usage buffer stopped")
+        return True
+
+
+# Global buffer instance
+_buffer: Optional[TournamentUsageBuffer] = None
+
+
+def get_usage_buffer() -> TournamentUsageBuffer:
+    """Get the global tournament usage buffer instance."""
+    global _buffer
+    if _buffer is None:
+        _buffer = TournamentUsageBuffer()
+    return _buffer
+
+
+async def start_usage_buffer():
+    """Start the tournament usage buffer (called from app lifespan)."""
+    await get_usage_buffer().start()
+
+
+async def stop_usage_buffer():
+    """Stop the tournament usage buffer (called from app lifespan)."""
+    await get_usage_buffer().stop()
@@ -9,6 +9,7 @@ from models import User, Tournament
 from modules.tournament.repositories.tournament_usage_repository import (
     TournamentUsageRepository,
 )
+from modules.tournament.services.tournament_usage_buffer import get_usage_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +31,9 @@ class TournamentUsageService:
         """
         Track that a user accessed a tournament.
 
-        This updates or creates a usage record with the current timestamp.
+        The access is recorded in the write-behind usage buffer and persisted
+        with the next batched flush. When the buffer's background loop is not
+        running (e.g. scripts and tests), it is flushed immediately.
         Should be called whenever a user views tournament details or interacts with it.
 
         Args:
@@ -39,12 +42,16 @@ class TournamentUsageService:
             organization_id: ID of the organization
             organization_name: Name of the organization
         """
-        await self.repository.record_usage(
-            user=user,
-            tournament=tournament,
+        buffer = get_usage_buffer()
+        buffer.record(
+            user_id=user.id,
+            tournament_id=tournament.id,
             organization_id=organization_id,
             organization_name=organization_name,
+            tournament_name=tournament.name,
         )
+        if not buffer.running:
+            await buffer.flush()
 
         logger.debug(
             "Tracked tournament access: user=%s, tournament=%s",
@@ -11,7 +11,7 @@ from nicegui import ui
 from models import Organization, User, CrewRole
 from models.user import Permission
 from modules.tournament.models.match_schedule import Match
-from components.data_table import ResponsiveTable, TableColumn
+from components.data_table import CallbackDataProvider, PaginatedTable, TableColumn
 from components.tournaments import MatchCellRenderers, MatchActions, CrewManagement
 from components.dialogs import (
     EditMatchDialog,
@@ -32,6 +32,9 @@ logger = logging.getLogger(__name__)
 class EventScheduleView:
     """View for displaying event schedule."""
 
+    # Matches rendered per table page
+    PAGE_SIZE = 50
+
     def __init__(self, organization: Organization, user: User) -> None:
         self.organization = organization
         self.user = user
@@ -53,47 +56,12 @@ class EventScheduleView:
             False  # Set during render (admin, tournament manager, or moderator)
         )
         self._filters_loaded = False  # Track if we've loaded filters from localStorage
-        self.all_matches = []  # Cache all matches to avoid re-fetching on filter change
+        self.total_matches = 0  # Unfiltered match count for the header
 
         # Initialize component helpers (will be configured after permissions are set)
         self.match_actions = None
         self.crew_management = None
 
-    def _get_match_state(self, match: Match) -> str:
-        """Get the state of a match."""
-        if match.finished_at:
-            return "finished"
-        elif match.started_at:
-            return "in_progress"
-        elif match.checked_in_at:
-            return "checked_in"
-        elif match.scheduled_at:
-            return "scheduled"
-        else:
-            return "pending"
-
-    def _filter_matches(self, matches):
-        """Filter matches based on current filter states and selected tournaments."""
-        filtered = []
-
-        for match in matches:
-            # Filter by state (if any states are selected)
-            if self.filter_states:
-                state = self._get_match_state(match)
-                if state not in self.filter_states:
-                    continue
-
-            # Filter by tournament selection
-            if (
-                self.selected_tournaments
-                and match.tournament_id not in self.selected_tournaments
-            ):
-                continue
-
-            filtered.append(match)
-
-        return filtered
-
     async def _on_filter_change(self, new_states) -> None:
         """Handle filter state change."""
         self.filter_states = new_states if new_states else []
@@ -229,8 +197,8 @@ class EventScheduleView:
             on_refresh=self._refresh,
         )
 
-        # Get all matches for this organization's tournaments via service (cache for filter updates)
-        self.all_matches = await self.service.list_org_matches(self.organization.id)
+        # Unfiltered total for the header (filtered matches are queried per table render)
+        self.total_matches = await self.service.count_org_matches(self.organization.id)
 
         # Get all tournaments for filter
         all_tournaments = await self.service.list_all_org_tournaments(
@@ -275,8 +243,8 @@ class EventScheduleView:
 
     async def _render_matches_table(self) -> None:
         """Render just the matches table (called when filters change)."""
-        # Apply filter
-        matches = self._filter_matches(self.all_matches)
+        # Filters are applied in the database query; rows are fetched per page
+        match_count = await self._count_filtered_matches()
 
         # Custom card with header action button
         with ui.element("div").classes("card"):
@@ -284,7 +252,7 @@ class EventScheduleView:
             with ui.element("div").classes("card-header"):
                 with ui.row().classes("items-center justify-between w-full"):
                     ui.label(
-                        f"Event Schedule - {self.organization.name} ({len(matches)}/{len(self.all_matches)})"
+                        f"Event Schedule - {self.organization.name} ({match_count}/{self.total_matches})"
                     ).classes("text-xl font-bold")
                     # Show "Create Match" button for tournament admins and admins
                     if self.can_manage_tournaments or self.user.has_permission(
@@ -298,7 +266,7 @@ class EventScheduleView:
 
             # Card body
             with ui.element("div").classes("card-body"):
-                if not matches:
+                if not match_count:
                     with ui.element("div").classes("text-center mt-4"):
                         ui.icon("event").classes("text-secondary icon-large")
                         ui.label("No upcoming events").classes("text-secondary")
@@ -708,9 +676,32 @@ class EventScheduleView:
                         TableColumn("Actions", cell_render=render_actions),
                     ]
 
-                    table = ResponsiveTable(columns, matches)
+                    provider = CallbackDataProvider(
+                        count=self._count_filtered_matches,
+                        fetch=self._fetch_filtered_matches,
+                    )
+                    table = PaginatedTable(columns, provider, page_size=self.PAGE_SIZE)
                     await table.render()
 
+    async def _count_filtered_matches(self) -> int:
+        """Count matches matching the current filters."""
+        return await self.service.count_org_matches(
+            self.organization.id,
+            states=self.filter_states,
+            tournament_ids=self.selected_tournaments,
+        )
+
+    async def _fetch_filtered_matches(self, offset: int, limit: int) -> list[Match]:
+        """Fetch one page of matches matching the current filters."""
+        matches, _ = await self.service.list_org_matches_page(
+            self.organization.id,
+            states=self.filter_states,
+            tournament_ids=self.selected_tournaments,
+            limit=limit,
+            offset=offset,
+        )
+        return matches
+
     async def _create_match(self) -> None:
         """Open dialog to create a new match."""
         # Get list of active tournaments
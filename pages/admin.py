@@ -13,9 +13,12 @@ from views.admin import (
     PresetNamespacesView,
     OrgRequestsView,
     ScheduledTasksView,
+    SeedPoolView,
     RacetimeAccountsView,
     AdminAuditLogsView,
     AdminLogsView,
+    AdminQueryStatsView,
+    AdminRaceHandlersView,
 )
 
 
@@ -30,12 +33,15 @@ def _create_admin_sidebar(base: BasePage, active: str):
         base.create_nav_link("Org Requests", "how_to_reg", "/admin/org-requests", active=(active == "org-requests")),
         base.create_separator(),
         base.create_nav_link("RaceTime Bots", "smart_toy", "/admin/racetime-bots", active=(active == "racetime-bots")),
+        base.create_nav_link("Race Handlers", "speed", "/admin/racetime-handlers", active=(active == "racetime-handlers")),
         base.create_nav_link("Presets", "tune", "/admin/presets", active=(active == "presets")),
         base.create_nav_link("Namespaces", "folder", "/admin/namespaces", active=(active == "namespaces")),
+        base.create_nav_link("Seed Pool", "casino", "/admin/seed-pool", active=(active == "seed-pool")),
         base.create_separator(),
         base.create_nav_link("Scheduled Tasks", "schedule", "/admin/scheduled-tasks", active=(active == "scheduled-tasks")),
         base.create_nav_link("Audit Logs", "history", "/admin/audit-logs", active=(active == "audit-logs")),
         base.create_nav_link("Application Logs", "description", "/admin/logs", active=(active == "logs")),
+        base.create_nav_link("Query Stats", "query_stats", "/admin/query-stats", active=(active == "query-stats")),
         base.create_separator(),
         base.create_nav_link("Settings", "settings", "/admin/settings", active=(active == "settings")),
     ]
@@ -112,6 +118,19 @@ def register():
         sidebar_items = _create_admin_sidebar(base, "racetime-bots")
         await base.render(content, sidebar_items)
 
+    @ui.page("/admin/racetime-handlers")
+    async def admin_racetime_handlers_page():
+        """Admin RaceTime race handler throughput page."""
+        base = BasePage.admin_page(title="Race Handlers")
+
+        async def content(page: BasePage):
+            """Render race handler metrics content."""
+            view = AdminRaceHandlersView(page.user)
+            await view.render()
+
+        sidebar_items = _create_admin_sidebar(base, "racetime-handlers")
+        await base.render(content, sidebar_items)
+
     @ui.page("/admin/presets")
     async def admin_presets_page():
         """Admin presets management page."""
@@ -140,6 +159,19 @@ def register():
         sidebar_items = _create_admin_sidebar(base, "namespaces")
         await base.render(content, sidebar_items)
 
+    @ui.page("/admin/seed-pool")
+    async def admin_seed_pool_page():
+        """Admin seed pool page."""
+        base = BasePage.admin_page(title="Seed Pool")
+
+        async def content(page: BasePage):
+            """Render seed pool content."""
+            view = SeedPoolView(page.user)
+            await view.render()
+
+        sidebar_items = _create_admin_sidebar(base, "seed-pool")
+        await base.render(content, sidebar_items)
+
     @ui.page("/admin/scheduled-tasks")
     async def admin_scheduled_tasks_page():
         """Admin scheduled tasks page."""
@@ -179,6 +211,19 @@ def register():
         sidebar_items = _create_admin_sidebar(base, "logs")
         await base.render(content, sidebar_items)
 
+    @ui.page("/admin/query-stats")
+    async def admin_query_stats_page():
+        """Admin SQL query statistics page."""
+        base = BasePage.admin_page(title="Query Statistics")
+
+        async def content(page: BasePage):
+            """Render query statistics content."""
+            view = AdminQueryStatsView(page.user)
+            await view.render()
+
+        sidebar_items = _create_admin_sidebar(base, "query-stats")
+        await base.render(content, sidebar_items)
+
     @ui.page("/admin/settings")
     async def admin_settings_page():
         """Admin settings page."""
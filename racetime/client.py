@@ -16,8 +16,11 @@ SahaBot2 uses the upstream racetime-bot library (v2.3.0), so we implement our ow
 simplified versions of the fork-specific methods (startrace, join_race_room) to maintain
 compatibility with the original workflow.
 
-We also create our own aiohttp.ClientSession (self.http) for efficient connection pooling,
-rather than using aiohttp.request() directly like the base Bot class does.
+We also give each bot its own aiohttp.ClientSession (self.http) on top of the shared
+keep-alive connector from application.utils.aiohttp_pool, rather than using
+aiohttp.request() directly like the base Bot class does. OAuth2 client-credentials
+tokens are fetched asynchronously through the same pool so bot startup and token
+refresh never block the event loop.
 
 RACE ROOM JOINING BEHAVIOR:
 - The upstream racetime-bot library has automatic race room polling/joining via refresh_races()
@@ -32,7 +35,8 @@ RACE ROOM JOINING BEHAVIOR:
 
 import asyncio
 import logging
-from typing import Optional
+from functools import partial
+from typing import Optional, Tuple
 
 import aiohttp
 from racetime_bot import Bot
@@ -41,6 +45,7 @@ from config import settings
 from models import BotStatus
 from racetime.handlers.base_handler import SahaRaceHandler
 from application.repositories.racetime_bot_repository import RacetimeBotRepository
+from application.utils.aiohttp_pool import create_session, get_session
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -68,6 +73,7 @@ class RacetimeBot(Bot):
         client_secret: str,
         bot_id: Optional[int] = None,
         handler_class_name: str = "SahaRaceHandler",
+        access_token: Optional[Tuple[str, int]] = None,
     ):
         """
         Initialize the racetime bot with configuration.
@@ -78,7 +84,11 @@ class RacetimeBot(Bot):
             client_secret: OAuth2 client secret for this category
             bot_id: Optional database ID for status tracking
             handler_class_name: Name of the handler class to use (e.g., 'ALTTPRRaceHandler')
+            access_token: Optional pre-fetched (token, expires_in) tuple from
+                fetch_access_token(); skips the blocking authorize() call
         """
+        # Consumed by authorize() during base class initialization
+        self._initial_token = access_token
         logger.info(
             "Initializing racetime bot with category=%s, client_id=%s, client_secret=%s..., handler=%s (host: %s, secure: %s)",
             category_slug,
@@ -108,7 +118,7 @@ class RacetimeBot(Bot):
         self.bot_id = bot_id
         self.handler_class_name = handler_class_name
 
-        # Create our own aiohttp session for efficient connection pooling
+        # Own aiohttp session on top of the shared connector
         # (The base Bot class uses aiohttp.request() directly without a session)
         self.http: Optional[aiohttp.ClientSession] = None
 
@@ -118,6 +128,93 @@ class RacetimeBot(Bot):
             handler_class_name,
         )
 
+    @classmethod
+    async def fetch_access_token(
+        cls, client_id: str, client_secret: str
+    ) -> Tuple[str, int]:
+        """
+        Get an OAuth2 client-credentials token without blocking the event loop.
+
+        Async equivalent of Bot.authorize(), using the shared aiohttp pool.
+
+        Args:
+            client_id: OAuth2 client ID for the category
+            client_secret: OAuth2 client secret for the category
+
+        Returns:
+            Tuple of (access_token, expires_in seconds)
+
+        Raises:
+            aiohttp.ClientResponseError: If the token endpoint rejects the request
+            Exception: If no access token is returned
+        """
+        scheme = "https" if cls.racetime_secure else "http"
+        url = f"{scheme}://{cls.racetime_host}/o/token"
+        async with get_session().post(
+            url,
+            data={
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "grant_type": "client_credentials",
+            },
+        ) as resp:
+            resp.raise_for_status()
+            data = await resp.json(content_type=None)
+        if not data.get("access_token"):
+            raise Exception("Unable to retrieve access token.")
+        return data.get("access_token"), data.get("expires_in", 36000)
+
+    def authorize(self):
+        """
+        Get an OAuth2 token, using a pre-fetched token if one was supplied.
+
+        Override of Bot.authorize() so bots created by start_racetime_bot()
+        don't make a blocking HTTP call from the constructor.
+        """
+        if self._initial_token is not None:
+            token, self._initial_token = self._initial_token, None
+            return token
+        return super().authorize()
+
+    async def reauthorize(self):
+        """
+        Refresh the access token before it expires (runs forever).
+
+        Override of Bot.reauthorize() that fetches the token asynchronously
+        through the shared connection pool instead of a blocking request.
+        """
+        while True:
+            # Divide the reauthorization interval by 2 to avoid token expiration
+            await asyncio.sleep(self.reauthorize_every / 2)
+            logger.info("Get new access token for category %s", self.category_slug)
+            self.access_token, self.reauthorize_every = (
+                await self.fetch_access_token(self.client_id, self.client_secret)
+            )
+
+    def attach_handler(self, handler: SahaRaceHandler) -> asyncio.Task:
+        """
+        Start a handler's websocket task and register it with the bot.
+
+        Mirrors how the upstream refresh_races() tracks handlers, so
+        bot.handlers always reflects the rooms this bot is attached to.
+
+        Args:
+            handler: Handler returned by join_race_room()
+
+        Returns:
+            The running handler task
+        """
+        race_name = handler.data.get("name")
+
+        def done(name, *args):
+            self.handlers.pop(name, None)
+
+        task = asyncio.create_task(handler.handle())
+        task.handler = handler
+        self.handlers[race_name] = task
+        task.add_done_callback(partial(done, race_name))
+        return task
+
     def should_handle(self, race_data: dict) -> bool:
         """
         Determine if this bot should handle a specific race.
@@ -631,6 +728,41 @@ class RacetimeBot(Bot):
 _racetime_bots: dict[str, RacetimeBot] = {}
 _racetime_bot_tasks: dict[str, asyncio.Task] = {}
 
+# Startup readiness: bots expected vs started, and per-category open rooms
+# expected vs handlers attached after a restart
+_readiness: dict = {"bots_expected": 0, "categories": {}}
+
+
+def set_expected_bot_count(count: int) -> None:
+    """
+    Record how many bots startup is expected to bring up (for readiness).
+
+    Args:
+        count: Number of configured bots
+    """
+    _readiness["bots_expected"] = count
+
+
+def get_racetime_readiness() -> dict:
+    """
+    Get startup readiness for RaceTime bots and room rejoin.
+
+    Returns:
+        Dictionary with bots_expected, bots_running, rooms_expected,
+        rooms_attached, rejoin_complete and per-category details
+    """
+    categories = {
+        category: dict(stats) for category, stats in _readiness["categories"].items()
+    }
+    return {
+        "bots_expected": _readiness["bots_expected"],
+        "bots_running": len(_racetime_bots),
+        "rooms_expected": sum(c["expected"] for c in categories.values()),
+        "rooms_attached": sum(c["attached"] for c in categories.values()),
+        "rejoin_complete": all(c["complete"] for c in categories.values()),
+        "categories": categories,
+    }
+
 
 async def rejoin_open_racetime_rooms(bot: RacetimeBot) -> int:
     """
@@ -638,6 +770,8 @@ async def rejoin_open_racetime_rooms(bot: RacetimeBot) -> int:
 
     Queries the database for all matches with active RaceTime rooms (not finished),
     and attempts to rejoin those rooms using match-aware handlers, syncing their status.
+    Rooms are rejoined concurrently, bounded by RACETIME_REJOIN_CONCURRENCY, and
+    progress is recorded for get_racetime_readiness().
 
     Note: The join_race_room() method automatically detects if a room is associated
     with a match and uses the appropriate handler (match handler vs. base handler).
@@ -653,6 +787,9 @@ async def rejoin_open_racetime_rooms(bot: RacetimeBot) -> int:
 
     logger.info("Rejoining open RaceTime rooms for category: %s", bot.category_slug)
 
+    readiness = {"expected": 0, "attached": 0, "complete": False}
+    _readiness["categories"][bot.category_slug] = readiness
+
     try:
         # Find all RaceTime rooms for this category with unfinished matches
         rooms = (
@@ -669,56 +806,66 @@ async def rejoin_open_racetime_rooms(bot: RacetimeBot) -> int:
             bot.category_slug,
         )
 
-        rejoined_count = 0
+        rooms = [room for room in rooms if room.match]
+        readiness["expected"] = len(rooms)
+
         service = TournamentService()
+        semaphore = asyncio.Semaphore(max(1, settings.RACETIME_REJOIN_CONCURRENCY))
 
-        for room in rooms:
+        async def rejoin_room(room) -> bool:
             match = room.match
-            if not match:
-                logger.warning("Room %s has no match associated, skipping", room.slug)
-                continue
-
-            try:
-                logger.info(
-                    "Attempting to rejoin room %s for match %s", room.slug, match.id
-                )
+            async with semaphore:
+                try:
+                    logger.info(
+                        "Attempting to rejoin room %s for match %s", room.slug, match.id
+                    )
 
-                # Try to join the race room
-                # join_race_room will automatically detect the match association
-                # and use a match-aware handler (combining MatchRaceMixin with
-                # the bot's configured handler class)
-                handler = await bot.join_race_room(room.slug, force=True)
+                    # join_race_room will automatically detect the match association
+                    # and use a match-aware handler (combining MatchRaceMixin with
+                    # the bot's configured handler class)
+                    handler = await bot.join_race_room(room.slug, force=True)
+                    if not handler:
+                        logger.warning("Failed to rejoin room %s", room.slug)
+                        return False
+
+                    if room.slug not in bot.handlers:
+                        bot.attach_handler(handler)
+                    readiness["attached"] += 1
+                    logger.info(
+                        "Successfully rejoined room %s with match handler", room.slug
+                    )
 
-                if handler:
-                    rejoined_count += 1
-                    logger.info("Successfully rejoined room %s with match handler", room.slug)
+                except Exception as e:
+                    logger.error(
+                        "Error rejoining room %s for match %s: %s",
+                        room.slug,
+                        match.id,
+                        e,
+                    )
+                    return False
 
-                    # Sync the room status to the match
-                    try:
-                        await service.sync_racetime_room_status(
-                            user=None,  # System action
-                            organization_id=match.tournament.organization_id,
-                            match_id=match.id,
-                        )
-                        logger.info(
-                            "Synced status for match %s from room %s",
-                            match.id,
-                            room.slug,
-                        )
-                    except Exception as sync_error:
-                        logger.warning(
-                            "Failed to sync status for match %s: %s",
-                            match.id,
-                            sync_error,
-                        )
-                else:
-                    logger.warning("Failed to rejoin room %s", room.slug)
+                # Sync the room status to the match
+                try:
+                    await service.sync_racetime_room_status(
+                        user=None,  # System action
+                        organization_id=match.tournament.organization_id,
+                        match_id=match.id,
+                    )
+                    logger.info(
+                        "Synced status for match %s from room %s",
+                        match.id,
+                        room.slug,
+                    )
+                except Exception as sync_error:
+                    logger.warning(
+                        "Failed to sync status for match %s: %s",
+                        match.id,
+                        sync_error,
+                    )
+                return True
 
-            except Exception as e:
-                logger.error(
-                    "Error rejoining room %s for match %s: %s", room.slug, match.id, e
-                )
-                continue
+        results = await asyncio.gather(*(rejoin_room(room) for room in rooms))
+        rejoined_count = sum(1 for joined in results if joined)
 
         logger.info(
             "Rejoined %d out of %d open RaceTime rooms for category %s",
@@ -737,6 +884,9 @@ async def rejoin_open_racetime_rooms(bot: RacetimeBot) -> int:
         )
         return 0
 
+    finally:
+        readiness["complete"] = True
+
 
 async def start_racetime_bot(
     category: str,
@@ -776,6 +926,10 @@ async def start_racetime_bot(
     )
 
     try:
+        # Fetch the OAuth2 token asynchronously so the constructor doesn't block
+        # the event loop (and other bots can start concurrently)
+        access_token = await RacetimeBot.fetch_access_token(client_id, client_secret)
+
         # Create bot instance with category-specific credentials
         bot = RacetimeBot(
             category_slug=category,
@@ -783,6 +937,7 @@ async def start_racetime_bot(
             client_secret=client_secret,
             bot_id=bot_id,
             handler_class_name=handler_class_name,
+            access_token=access_token,
         )
 
         # Store the bot instance
@@ -795,8 +950,8 @@ async def start_racetime_bot(
             retry_count = 0
             backoff_delay = initial_backoff
 
-            # Create HTTP session for the bot
-            bot.http = aiohttp.ClientSession()
+            # Create HTTP session for the bot on the shared keep-alive connector
+            bot.http = create_session()
 
             try:
                 while True:
@@ -0,0 +1,211 @@
+"""
+Throughput metrics for RaceTime.gg race handlers.
+
+SahaRaceHandler processes every websocket message inline: race.data frames
+trigger user lookups, match queries, event listeners and join request
+handling before the next frame is read. During large races the handler can
+fall behind the room. This module records, per handler class:
+
+- Message counts by type and the message rate over the last minute
+- Processing latency per message
+- Time spent in database lookups and in event listeners
+- Websocket backlog (frames received but not yet processed)
+
+and, per room while its handler is running, the message count and current
+backlog. The metrics are process-wide and are reported on /api/health and
+the admin Race Handlers page.
+"""
+
+import time
+from collections import Counter, deque
+from typing import Any, Dict, Optional
+
+from application.utils.http_client import LatencyHistogram
+
+# Processing latency histogram bucket upper bounds, in milliseconds
+PROCESSING_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 1000, 5000)
+
+# Window for the message rate, in seconds
+RATE_WINDOW_SECONDS = 60.0
+
+
+def queued_frames(ws) -> Optional[int]:
+    """
+    Count frames received on a websocket but not yet read by the handler.
+
+    Args:
+        ws: Open websockets connection (None before the handler connects)
+
+    Returns:
+        Number of queued frames, or None if the connection does not expose
+        its receive queue
+    """
+    if ws is None:
+        return None
+    # websockets >= 14 (asyncio implementation)
+    assembler = getattr(ws, "recv_messages", None)
+    frames = getattr(assembler, "frames", None)
+    if frames is not None:
+        return len(frames)
+    # Legacy websockets implementation
+    messages = getattr(ws, "messages", None)
+    if messages is not None:
+        return len(messages)
+    return None
+
+
+class _HandlerStats:
+    """Counters and latency for one handler class."""
+
+    def __init__(self):
+        self.messages = 0
+        self.errors = 0
+        self.by_type: Counter = Counter()
+        self.recent: deque = deque()
+        self.processing = LatencyHistogram(PROCESSING_BUCKETS_MS)
+        self.db_ms = 0.0
+        self.listener_ms = 0.0
+        self.max_backlog = 0
+
+
+class _RoomStats:
+    """Message count and backlog of one room with a running handler."""
+
+    def __init__(self, handler: str):
+        self.handler = handler
+        self.messages = 0
+        self.backlog: Optional[int] = None
+        self.last_message_at: Optional[float] = None
+
+
+class RaceHandlerMetrics:
+    """Per-handler-class message throughput and per-room backlog."""
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._handlers: Dict[str, _HandlerStats] = {}
+        self._rooms: Dict[str, _RoomStats] = {}
+
+    def room_started(self, room: str, handler: str) -> None:
+        """
+        Start tracking a room.
+
+        Args:
+            room: Room slug (e.g. "alttpr/cool-doge-1234")
+            handler: Handler class name
+        """
+        self._rooms[room] = _RoomStats(handler)
+
+    def room_stopped(self, room: str) -> None:
+        """
+        Stop tracking a room whose handler has finished.
+
+        Args:
+            room: Room slug
+        """
+        self._rooms.pop(room, None)
+
+    def observe(
+        self,
+        handler: str,
+        room: Optional[str],
+        msg_type: Optional[str],
+        elapsed_ms: float,
+        db_ms: float = 0.0,
+        listener_ms: float = 0.0,
+        backlog: Optional[int] = None,
+        failed: bool = False,
+    ) -> None:
+        """
+        Record one processed websocket message.
+
+        Args:
+            handler: Handler class name
+            room: Room slug
+            msg_type: Message type (e.g. "race.data")
+            elapsed_ms: Milliseconds spent processing the message
+            db_ms: Milliseconds of that spent in database lookups
+            listener_ms: Milliseconds of that spent in event listeners
+            backlog: Frames still queued on the websocket afterwards
+            failed: Whether processing raised
+        """
+        now = time.monotonic()
+        stats = self._handlers.setdefault(handler, _HandlerStats())
+        stats.messages += 1
+        stats.errors += int(failed)
+        stats.by_type[msg_type or "unknown"] += 1
+        stats.processing.observe(elapsed_ms)
+        stats.db_ms += db_ms
+        stats.listener_ms += listener_ms
+        stats.recent.append(now)
+        while stats.recent and now - stats.recent[0] > RATE_WINDOW_SECONDS:
+            stats.recent.popleft()
+        if backlog is not None:
+            stats.max_backlog = max(stats.max_backlog, backlog)
+
+        room_stats = self._rooms.get(room) if room else None
+        if room_stats is not None:
+            room_stats.messages += 1
+            room_stats.backlog = backlog
+            room_stats.last_message_at = now
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable view of the metrics.
+
+        Returns:
+            Dictionary with "handlers" (per handler class: message counts,
+            rate, processing latency, database and listener time, maximum
+            backlog) and "rooms" (per running room: handler, messages,
+            backlog, seconds since the last message)
+        """
+        now = time.monotonic()
+        handlers = {}
+        for name, stats in sorted(self._handlers.items()):
+            recent = sum(1 for at in stats.recent if now - at <= RATE_WINDOW_SECONDS)
+            total_ms = stats.processing.total_ms
+            handlers[name] = {
+                "messages": stats.messages,
+                "errors": stats.errors,
+                "by_type": dict(stats.by_type),
+                "rate_per_minute": recent,
+                "avg_ms": (
+                    round(total_ms / stats.messages, 3) if stats.messages else None
+                ),
+                "processing": stats.processing.snapshot(),
+                "total_ms": round(total_ms, 1),
+                "db_ms": round(stats.db_ms, 1),
+                "listener_ms": round(stats.listener_ms, 1),
+                "other_ms": round(
+                    max(total_ms - stats.db_ms - stats.listener_ms, 0.0), 1
+                ),
+                "max_backlog": stats.max_backlog,
+            }
+        rooms = {
+            room: {
+                "handler": stats.handler,
+                "messages": stats.messages,
+                "backlog": stats.backlog,
+                "last_message_seconds_ago": (
+                    round(now - stats.last_message_at, 1)
+                    if stats.last_message_at is not None
+                    else None
+                ),
+            }
+            for room, stats in sorted(self._rooms.items())
+        }
+        return {"handlers": handlers, "rooms": rooms}
+
+    def reset(self) -> None:
+        """Clear recorded handler metrics (running rooms stay tracked)."""
+        self._handlers.clear()
+        for room, stats in list(self._rooms.items()):
+            self._rooms[room] = _RoomStats(stats.handler)
+
+
+_metrics = RaceHandlerMetrics()
+
+
+def get_race_handler_metrics() -> RaceHandlerMetrics:
+    """Get the global race handler metrics."""
+    return _metrics
@@ -5,6 +5,8 @@ This module provides the default race handler with common commands and event tra
 """
 
 import logging
+import time
+from contextlib import contextmanager
 from typing import Optional
 
 from racetime_bot import RaceHandler
@@ -22,6 +24,7 @@ from application.events import (
     RacetimeBotActionEvent,
 )
 from models import SYSTEM_USER_ID
+from racetime.handler_metrics import get_race_handler_metrics, queued_frames
 from modules.tournament.models.match_schedule import Match
 
 logger = logging.getLogger(__name__)
@@ -49,6 +52,81 @@ class SahaRaceHandler(RaceHandler):
         self._bot_created_room: bool = False
         # Repository for user lookups
         self._user_repository = UserRepository()
+        # Milliseconds spent in database lookups and event listeners while
+        # processing the current message (reported to the handler metrics)
+        self._phase_ms: dict[str, float] = {"db": 0.0, "listeners": 0.0}
+
+    @contextmanager
+    def _timed(self, phase: str):
+        """
+        Attribute the time spent in the block to a processing phase.
+
+        Args:
+            phase: "db" or "listeners"
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phase_ms[phase] += (time.perf_counter() - started) * 1000
+
+    async def _emit(self, event) -> None:
+        """
+        Emit an event, counting listener time against the current message.
+
+        Args:
+            event: Event to emit
+        """
+        with self._timed("listeners"):
+            await EventBus.emit(event)
+
+    async def handle(self):
+        """
+        Process the race room websocket, tracking the room in the metrics.
+
+        Overrides the base RaceHandler.handle() so the room's message count
+        and backlog are reported while the handler runs.
+        """
+        room = self.data.get("name") if self.data else None
+        metrics = get_race_handler_metrics()
+        if room:
+            metrics.room_started(room, type(self).__name__)
+        try:
+            await super().handle()
+        finally:
+            if room:
+                metrics.room_stopped(room)
+
+    async def consume(self, data):
+        """
+        Process one websocket message, recording throughput metrics.
+
+        Overrides the base RaceHandler.consume() to measure processing time
+        (split into database, listener and other time) and the number of
+        frames still waiting on the websocket.
+
+        Args:
+            data: Decoded websocket message
+        """
+        self._phase_ms = {"db": 0.0, "listeners": 0.0}
+        started = time.perf_counter()
+        failed = False
+        try:
+            await super().consume(data)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            get_race_handler_metrics().observe(
+                type(self).__name__,
+                self.data.get("name") if self.data else None,
+                data.get("type"),
+                (time.perf_counter() - started) * 1000,
+                db_ms=self._phase_ms["db"],
+                listener_ms=self._phase_ms["listeners"],
+                backlog=queued_frames(self.ws),
+                failed=failed,
+            )
 
     async def _get_user_id_from_racetime_id(
         self, racetime_user_id: str
@@ -63,7 +141,10 @@ class SahaRaceHandler(RaceHandler):
             Optional[int]: Application user ID if found, None if racetime account not linked
         """
         try:
-            user = await self._user_repository.get_by_racetime_id(racetime_user_id)
+            with self._timed("db"):
+                user = await self._user_repository.get_by_racetime_id(
+                    racetime_user_id
+                )
             return user.id if user else None
         except Exception as e:
             logger.warning(
@@ -107,9 +188,10 @@ class SahaRaceHandler(RaceHandler):
             )
 
             service = RacetimeRoomService()
-            is_match_player, match_id = await service.is_player_on_match(
-                room_slug=room_slug, racetime_user_id=racetime_user_id
-            )
+            with self._timed("db"):
+                is_match_player, match_id = await service.is_player_on_match(
+                    room_slug=room_slug, racetime_user_id=racetime_user_id
+                )
 
             if match_id is None:
                 logger.debug(
@@ -345,7 +427,7 @@ class SahaRaceHandler(RaceHandler):
         # Emit appropriate event based on whether bot created or joined the room
         if self._bot_created_room:
             logger.info("Bot created race room: %s", room_slug)
-            await EventBus.emit(
+            await self._emit(
                 RacetimeBotCreatedRaceEvent(
                     user_id=SYSTEM_USER_ID,  # System automation action
                     entity_id=room_slug,
@@ -359,7 +441,7 @@ class SahaRaceHandler(RaceHandler):
             )
         else:
             logger.info("Bot joined existing race room: %s", room_slug)
-            await EventBus.emit(
+            await self._emit(
                 RacetimeBotJoinedRaceEvent(
                     user_id=SYSTEM_USER_ID,  # System automation action
                     entity_id=room_slug,
@@ -415,7 +497,8 @@ class SahaRaceHandler(RaceHandler):
             if match_id:
                 # Query tournament_id from match
                 try:
-                    match = await Match.filter(id=match_id).select_related("tournament").first()
+                    with self._timed("db"):
+                        match = await Match.filter(id=match_id).first()
                     if match:
                         tournament_id = match.tournament_id
                 except Exception as e:
@@ -424,7 +507,7 @@ class SahaRaceHandler(RaceHandler):
                     )
 
             # Emit race status changed event
-            await EventBus.emit(
+            await self._emit(
                 RacetimeRaceStatusChangedEvent(
                     user_id=SYSTEM_USER_ID,  # System automation (race status changes are automated)
                     entity_id=room_slug,
@@ -446,9 +529,11 @@ class SahaRaceHandler(RaceHandler):
         current_entrant_statuses = {}
         current_entrant_ids = set()
         current_entrant_names = {}
+        current_entrants = {}
 
         for entrant in new_entrants:
             user_id = entrant.get("user", {}).get("id", "")
+            current_entrants[user_id] = entrant
             user_name = entrant.get("user", {}).get("name", "")
             entrant_status = entrant.get("status", {}).get("value", "")
 
@@ -474,7 +559,7 @@ class SahaRaceHandler(RaceHandler):
                     initial_status,
                 )
 
-                await EventBus.emit(
+                await self._emit(
                     RacetimeEntrantJoinedEvent(
                         user_id=app_user_id,  # Application user ID (None if not linked)
                         entity_id=f"{room_slug}/{user_id}",
@@ -514,7 +599,7 @@ class SahaRaceHandler(RaceHandler):
                     last_status,
                 )
 
-                await EventBus.emit(
+                await self._emit(
                     RacetimeEntrantLeftEvent(
                         user_id=app_user_id,  # Application user ID (None if not linked)
                         entity_id=f"{room_slug}/{user_id}",
@@ -535,14 +620,10 @@ class SahaRaceHandler(RaceHandler):
             if old_entrant_status and old_entrant_status != entrant_status:
                 user_name = current_entrant_names.get(user_id, "")
 
-                # Find full entrant data for finish_time and place
-                finish_time = None
-                place = None
-                for entrant in new_entrants:
-                    if entrant.get("user", {}).get("id") == user_id:
-                        finish_time = entrant.get("finish_time")
-                        place = entrant.get("place")
-                        break
+                # Full entrant data for finish_time and place
+                entrant = current_entrants[user_id]
+                finish_time = entrant.get("finish_time")
+                place = entrant.get("place")
 
                 # Look up application user ID
                 app_user_id = await self._get_user_id_from_racetime_id(user_id)
@@ -557,7 +638,7 @@ class SahaRaceHandler(RaceHandler):
                 )
 
                 # Emit entrant status changed event
-                await EventBus.emit(
+                await self._emit(
                     RacetimeEntrantStatusChangedEvent(
                         user_id=app_user_id,  # Application user ID (None if not linked)
                         entity_id=f"{room_slug}/{user_id}",
@@ -605,7 +686,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit invite event
         logger.info("Bot inviting user %s to race %s", user_id, room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeEntrantInvitedEvent(
                 user_id=app_user_id,  # Application user ID (None if not linked)
                 entity_id=f"{room_slug}/{user_id}",
@@ -632,7 +713,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot force-starting race %s", room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=SYSTEM_USER_ID,
                 entity_id=room_slug,
@@ -664,7 +745,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot force-unreadying user %s in race %s", user_id, room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=app_user_id,  # Application user ID (None if not linked)
                 entity_id=f"{room_slug}/{user_id}",
@@ -697,7 +778,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot removing entrant %s from race %s", user_id, room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=app_user_id,  # Application user ID (None if not linked)
                 entity_id=f"{room_slug}/{user_id}",
@@ -724,7 +805,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot cancelling race %s", room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=SYSTEM_USER_ID,
                 entity_id=room_slug,
@@ -756,7 +837,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot adding monitor %s to race %s", user_id, room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=app_user_id,  # Application user ID (None if not linked)
                 entity_id=f"{room_slug}/{user_id}",
@@ -789,7 +870,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot removing monitor %s from race %s", user_id, room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=app_user_id,  # Application user ID (None if not linked)
                 entity_id=f"{room_slug}/{user_id}",
@@ -819,7 +900,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot pinning message %s in race %s", message_id, room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=SYSTEM_USER_ID,
                 entity_id=f"{room_slug}/message/{message_id}",
@@ -849,7 +930,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot unpinning message %s in race %s", message_id, room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=SYSTEM_USER_ID,
                 entity_id=f"{room_slug}/message/{message_id}",
@@ -888,7 +969,7 @@ class SahaRaceHandler(RaceHandler):
             overwrite,
             prefix,
         )
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=SYSTEM_USER_ID,
                 entity_id=room_slug,
@@ -918,7 +999,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot setting bot race info for %s", room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=SYSTEM_USER_ID,
                 entity_id=room_slug,
@@ -944,7 +1025,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot setting race %s to open", room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=SYSTEM_USER_ID,
                 entity_id=room_slug,
@@ -970,7 +1051,7 @@ class SahaRaceHandler(RaceHandler):
 
         # Emit action event
         logger.info("Bot setting race %s to invitational", room_slug)
-        await EventBus.emit(
+        await self._emit(
             RacetimeBotActionEvent(
                 user_id=SYSTEM_USER_ID,
                 entity_id=room_slug,
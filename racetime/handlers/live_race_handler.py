@@ -81,10 +81,11 @@ class AsyncLiveRaceHandler(SahaRaceHandler):
 
                 # Call service to create race records
                 service = AsyncLiveRaceService()
-                await service.process_race_start(
-                    live_race_id=self.live_race_id,
-                    participant_racetime_ids=participant_racetime_ids,
-                )
+                with self._timed("db"):
+                    await service.process_race_start(
+                        live_race_id=self.live_race_id,
+                        participant_racetime_ids=participant_racetime_ids,
+                    )
             except Exception as e:
                 logger.error(
                     "Failed to process live race start for race %s: %s",
@@ -124,10 +125,11 @@ class AsyncLiveRaceHandler(SahaRaceHandler):
 
                 # Call service to record results
                 service = AsyncLiveRaceService()
-                await service.process_race_finish(
-                    live_race_id=self.live_race_id,
-                    results=results,
-                )
+                with self._timed("db"):
+                    await service.process_race_finish(
+                        live_race_id=self.live_race_id,
+                        results=results,
+                    )
             except Exception as e:
                 logger.error(
                     "Failed to process live race finish for race %s: %s",
@@ -30,6 +30,7 @@ class MatchRaceMixin:
     The mixin expects the following attributes to be available from the base handler:
     - self.data: Race data dictionary
     - self.bot: Bot instance reference
+    - self._timed(): Processing phase timer (from SahaRaceHandler)
     """
 
     def __init__(
@@ -108,10 +109,11 @@ class MatchRaceMixin:
 
                 # Call service to record results
                 service = TournamentService()
-                await service.process_match_race_finish(
-                    match_id=self.match_id,
-                    results=results,
-                )
+                with self._timed("db"):
+                    await service.process_match_race_finish(
+                        match_id=self.match_id,
+                        results=results,
+                    )
             except Exception as e:
                 logger.error(
                     "Failed to process match race finish for match %s: %s",
@@ -0,0 +1,332 @@
+"""
+Offline replay of race room websocket traffic into race handlers.
+
+Feeds recorded (or generated) racetime.gg websocket messages through a
+handler's real message loop, with an in-memory websocket instead of a
+network connection, and measures how many frames per second the handler
+processes. Database lookups and event listeners run as in production, so
+point Tortoise at a database before replaying.
+
+Usage:
+    frames = generate_race_frames(entrants=150, status_flips=500)
+    result = await replay_frames(SahaRaceHandler, frames)
+    print(result.frames_per_second)
+
+    MatchHandler = create_match_handler_class(ALTTPRRaceHandler)
+    result = await replay_frames(MatchHandler, frames, match_id=12)
+
+Recorded traffic is stored as JSON lines, one websocket message per line
+(see load_frames() and save_frames()). See tools/replay_race_handlers.py for
+the command line harness.
+"""
+
+import copy
+import json
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from racetime.handler_metrics import get_race_handler_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def generate_race_frames(
+    entrants: int = 120,
+    status_flips: int = 300,
+    join_requests: int = 5,
+    category: str = "alttpr",
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Generate the race.data frames of a large race, start to finish.
+
+    The race opens empty, entrants join one per frame (some as join
+    requests), entrants flip between ready and not ready, the race starts,
+    and every entrant finishes or forfeits one per frame. Output is
+    deterministic for a given seed.
+
+    Args:
+        entrants: Number of entrants
+        status_flips: Number of ready/not ready flips before the start
+        join_requests: Number of extra users who request to join
+        category: Category slug
+        seed: Random seed
+
+    Returns:
+        List of race.data websocket messages
+    """
+    rng = random.Random(seed)
+    slug = f"{category}/replay-race-{seed:04d}"
+    race: Dict[str, Any] = {
+        "name": slug,
+        "category": {"slug": category, "name": category.upper()},
+        "status": {"value": "open"},
+        "goal": {"name": "Beat the game"},
+        "info": "",
+        "unlisted": False,
+        "entrants": [],
+        "started_at": None,
+        "ended_at": None,
+        "version": 1,
+    }
+    frames: List[Dict[str, Any]] = []
+
+    def emit_frame() -> None:
+        race["version"] += 1
+        frames.append({"type": "race.data", "race": copy.deepcopy(race)})
+
+    def entrant(index: int, status: str) -> Dict[str, Any]:
+        return {
+            "user": {"id": f"replay{index:05d}", "name": f"Racer{index}"},
+            "status": {"value": status},
+            "finish_time": None,
+            "place": None,
+        }
+
+    emit_frame()
+
+    # Entrants join one at a time; requesters join as join requests
+    racers = [entrant(index, "not_ready") for index in range(entrants)]
+    requesters = [
+        entrant(entrants + index, "requested") for index in range(join_requests)
+    ]
+    joining = racers + requesters
+    rng.shuffle(joining)
+    for joined in joining:
+        race["entrants"].append(joined)
+        emit_frame()
+
+    # Rapid ready / not ready flips
+    for _ in range(status_flips if racers else 0):
+        flipped = rng.choice(racers)
+        flipped["status"]["value"] = (
+            "ready" if flipped["status"]["value"] == "not_ready" else "not_ready"
+        )
+        emit_frame()
+
+    # Unanswered join requests are dropped at the start
+    race["entrants"] = racers
+    race["status"]["value"] = "pending"
+    emit_frame()
+    race["status"]["value"] = "in_progress"
+    race["started_at"] = "2025-01-01T12:00:00Z"
+    for racer in racers:
+        racer["status"]["value"] = "in_progress"
+    emit_frame()
+
+    # Entrants finish (or forfeit) one at a time
+    finish_order = list(racers)
+    rng.shuffle(finish_order)
+    place = 0
+    for finisher in finish_order:
+        if rng.random() < 0.9:
+            place += 1
+            finisher["status"]["value"] = "done"
+            finisher["place"] = place
+            finisher["finish_time"] = f"PT1H{place // 60:02d}M{place % 60:02d}S"
+        else:
+            finisher["status"]["value"] = "dnf"
+        emit_frame()
+
+    race["status"]["value"] = "finished"
+    race["ended_at"] = "2025-01-01T14:00:00Z"
+    emit_frame()
+    return frames
+
+
+def load_frames(path: Path) -> List[Dict[str, Any]]:
+    """
+    Load recorded websocket messages.
+
+    Args:
+        path: JSON lines file, one websocket message per line
+
+    Returns:
+        List of websocket messages
+    """
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_frames(frames: Iterable[Dict[str, Any]], path: Path) -> None:
+    """
+    Save websocket messages for later replay.
+
+    Args:
+        frames: Websocket messages
+        path: JSON lines file to write
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for frame in frames:
+            f.write(json.dumps(frame) + "\n")
+
+
+class ReplayWebSocket:
+    """
+    In-memory stand-in for a race room websocket.
+
+    Yields the queued messages in order and records what the handler sends.
+    Every remaining message counts as already received, so the backlog
+    reported to the handler metrics is the number of frames left.
+    """
+
+    def __init__(self, messages: Iterable[str]):
+        """
+        Initialize the websocket.
+
+        Args:
+            messages: Encoded websocket messages to deliver
+        """
+        self.messages = deque(messages)
+        self.sent: List[str] = []
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        if not self.messages:
+            raise StopAsyncIteration
+        return self.messages.popleft()
+
+    async def send(self, message: str) -> None:
+        """Record a message sent by the handler."""
+        self.sent.append(message)
+
+
+class ReplayConnection:
+    """Stand-in for websockets.connect() returning a ReplayWebSocket."""
+
+    def __init__(self, ws: ReplayWebSocket):
+        self.ws = ws
+
+    async def __aenter__(self) -> ReplayWebSocket:
+        return self.ws
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+
+class ReplayBot:
+    """Minimal stand-in for the RacetimeBot a handler is created by."""
+
+    def __init__(self, category: str):
+        self.category_slug = category
+        self.bot_id = None
+        self.handlers: Dict[str, Any] = {}
+        self.state: Dict[str, Any] = {}
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of replaying frames into one handler."""
+
+    handler: str
+    frames: int
+    elapsed_seconds: float
+    messages_sent: int
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def frames_per_second(self) -> float:
+        """Frames processed per second of wall time."""
+        if not self.elapsed_seconds:
+            return float("inf")
+        return self.frames / self.elapsed_seconds
+
+
+async def replay_frames(
+    handler_class: Type, frames: List[Dict[str, Any]], **handler_kwargs: Any
+) -> ReplayResult:
+    """
+    Replay websocket messages through a handler's message loop.
+
+    The handler is created the way RacetimeBot.create_handler() creates it
+    (initial data from the first race.data frame) and runs handle() until
+    the race ends or the frames run out.
+
+    Args:
+        handler_class: SahaRaceHandler or a subclass (including the classes
+            returned by create_match_handler_class)
+        frames: Websocket messages, e.g. from generate_race_frames()
+        **handler_kwargs: Extra handler arguments (e.g. match_id=12)
+
+    Returns:
+        ReplayResult with the wall time and the handler class's metrics
+    """
+    first_race = next(
+        (frame["race"] for frame in frames if frame.get("type") == "race.data"), {}
+    )
+    category = first_race.get("category", {}).get("slug", "")
+    ws = ReplayWebSocket(json.dumps(frame) for frame in frames)
+    handler = handler_class(
+        bot_instance=ReplayBot(category),
+        logger=logger,
+        conn=ReplayConnection(ws),
+        state={},
+        **handler_kwargs,
+    )
+    handler.data = copy.deepcopy(first_race)
+
+    started = time.perf_counter()
+    await handler.handle()
+    elapsed = time.perf_counter() - started
+
+    name = type(handler).__name__
+    return ReplayResult(
+        handler=name,
+        frames=len(frames) - len(ws.messages),
+        elapsed_seconds=elapsed,
+        messages_sent=len(ws.sent),
+        metrics=get_race_handler_metrics().snapshot()["handlers"].get(name, {}),
+    )
+
+
+def replay_handler_classes() -> Dict[str, Type]:
+    """
+    Get the handler classes a RacetimeBot can run, by class name.
+
+    Returns:
+        Mapping of class name to class for the category handlers and their
+        match variants (AsyncLiveRaceHandler needs a live race and is not
+        included)
+    """
+    from racetime.handlers.alttpr_handler import ALTTPRRaceHandler
+    from racetime.handlers.base_handler import SahaRaceHandler
+    from racetime.handlers.match_race_handler import create_match_handler_class
+    from racetime.handlers.sm_race_handler import SMRaceHandler
+    from racetime.handlers.smz3_race_handler import SMZ3RaceHandler
+
+    classes: Dict[str, Type] = {}
+    for base in (SahaRaceHandler, ALTTPRRaceHandler, SMRaceHandler, SMZ3RaceHandler):
+        classes[base.__name__] = base
+        match_class = create_match_handler_class(base)
+        classes[match_class.__name__] = match_class
+    return classes
+
+
+def is_match_handler(handler_class: Type) -> bool:
+    """Check whether a handler class needs a match_id."""
+    return any(cls.__name__ == "MatchRaceMixin" for cls in handler_class.__mro__)
+
+
+def default_handler_kwargs(
+    handler_class: Type, match_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get the extra arguments a handler class needs for a replay.
+
+    Args:
+        handler_class: Handler class
+        match_id: Match ID for match handlers (default: 0, no such match)
+
+    Returns:
+        Keyword arguments for replay_frames()
+    """
+    if is_match_handler(handler_class):
+        return {"match_id": match_id or 0}
+    return {}
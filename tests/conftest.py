@@ -9,6 +9,9 @@ import pytest
 from typing import AsyncGenerator
 from tortoise import Tortoise
 from migrations.tortoise_config import get_model_modules
+from application.utils.request_scope import install_query_counter
+from application.utils.versioned_cache import clear_all_caches
+from application.services.core.token_manager import get_token_manager
 
 
 # Configure pytest-asyncio
@@ -49,6 +52,11 @@ async def db() -> AsyncGenerator:
         }
     )
     await Tortoise.generate_schemas()
+    # Count and time statements, so tests can use assert_max_queries()
+    install_query_counter()
+    # Cached rows from a previous test's database must not leak into this one
+    clear_all_caches()
+    get_token_manager().reset()
 
     yield
 
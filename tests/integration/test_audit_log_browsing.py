@@ -0,0 +1,171 @@
+"""
+Tests for keyset-paginated audit log browsing and NDJSON export.
+
+Verifies that:
+1. Pages follow (created_at, id) newest-first order, ties broken by id
+2. Malformed cursors are rejected
+3. Totals are cached per filter combination
+4. The export streams every matching entry as NDJSON, in chunks
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from api.routes.audit_logs import export_audit_logs, list_audit_logs
+from application.repositories.audit_repository import AuditRepository
+from application.services.core.audit_service import AuditService
+from application.utils.pagination import encode_cursor
+from models import AuditLog, Permission
+
+
+@pytest.fixture
+async def audit_logs(db, sample_user, sample_organization):
+    """Seven entries; the last three share a timestamp."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    repo = AuditRepository()
+    entries = [
+        repo.build(
+            action="login" if i % 2 else "update",
+            user_id=sample_user.id,
+            organization_id=sample_organization.id if i < 4 else None,
+            created_at=now - timedelta(minutes=max(4 - i, 0)),
+        )
+        for i in range(7)
+    ]
+    await repo.create_many(entries)
+    return await AuditLog.all().order_by("-created_at", "-id")
+
+
+@pytest.fixture
+async def superadmin(admin_user):
+    """A user allowed to browse every audit log."""
+    admin_user.permission = Permission.SUPERADMIN
+    await admin_user.save()
+    return admin_user
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestAuditLogPages:
+    """Test keyset pagination and approximate totals."""
+
+    async def test_keyset_pages_cover_all_logs_in_order(self, audit_logs):
+        """Walking next_cursor returns every entry exactly once, newest first."""
+        service = AuditService()
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = await service.list_audit_logs_page(cursor=cursor, limit=2)
+            seen.extend(log.id for log in page)
+            if cursor is None:
+                break
+
+        assert seen == [log.id for log in audit_logs]
+
+    async def test_filters_apply_to_pages(self, audit_logs, sample_organization):
+        """Organization and action filters narrow every page."""
+        page, cursor = await AuditService().list_audit_logs_page(
+            limit=10, action="login", organization_id=sample_organization.id
+        )
+        assert cursor is None
+        assert [log.id for log in page] == [
+            log.id
+            for log in audit_logs
+            if log.action == "login" and log.organization_id == sample_organization.id
+        ]
+
+    async def test_invalid_cursor_rejected(self, audit_logs):
+        """Malformed cursors raise ValueError."""
+        service = AuditService()
+        for cursor in ("not-a-cursor", encode_cursor([None, 1]), encode_cursor([1])):
+            with pytest.raises(ValueError):
+                await service.list_audit_logs_page(cursor=cursor)
+
+    async def test_totals_are_cached(self, audit_logs, sample_user):
+        """Counts are served from the cache until it expires."""
+        service = AuditService()
+        assert await service.count_audit_logs(action="login") == 3
+
+        await service.record("login", user_id=sample_user.id)
+        assert await service.count_audit_logs(action="login") == 3
+        assert await service.count_audit_logs() == 8
+
+    async def test_api_page_and_invalid_cursor(self, audit_logs, superadmin):
+        """The API returns next_cursor and rejects bad cursors with 400."""
+
+        async def call(cursor=None):
+            return await list_audit_logs(
+                limit=5,
+                offset=0,
+                cursor=cursor,
+                user_id=None,
+                action=None,
+                organization_id=None,
+                current_user=superadmin,
+            )
+
+        first = await call()
+        assert (first.count, first.total) == (5, 7)
+        second = await call(first.next_cursor)
+        assert second.count == 2
+        assert second.next_cursor is None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await call("garbage")
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestAuditLogExport:
+    """Test the streaming NDJSON export."""
+
+    async def test_export_reads_in_chunks(self, audit_logs):
+        """Small chunks still yield every entry once, in order."""
+        rows = [row async for row in AuditRepository().iter_export(chunk_size=2)]
+        assert [row["id"] for row in rows] == [log.id for log in audit_logs]
+
+    async def test_export_range(self, audit_logs):
+        """since/until bound the exported range."""
+        newest = audit_logs[0].created_at
+        rows = [
+            row
+            async for row in AuditService().export_audit_logs(
+                since=newest - timedelta(minutes=1), until=newest
+            )
+        ]
+        assert [row["id"] for row in rows] == [audit_logs[3].id]
+
+    async def test_api_streams_ndjson(self, audit_logs, superadmin, sample_user):
+        """The export endpoint streams one JSON object per line."""
+        response = await export_audit_logs(
+            user_id=None,
+            action="update",
+            organization_id=None,
+            since=None,
+            until=None,
+            current_user=superadmin,
+        )
+        assert response.media_type == "application/x-ndjson"
+
+        body = "".join([chunk async for chunk in response.body_iterator])
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert [line["id"] for line in lines] == [
+            log.id for log in audit_logs if log.action == "update"
+        ]
+        assert all(line["user_id"] == sample_user.id for line in lines)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await export_audit_logs(
+                user_id=None,
+                action=None,
+                organization_id=None,
+                since=None,
+                until=None,
+                current_user=sample_user,
+            )
+        assert exc_info.value.status_code == 403
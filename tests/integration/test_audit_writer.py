@@ -0,0 +1,166 @@
+"""
+Tests for the buffered audit log writer and promoted detail columns.
+
+Verifies that:
+1. Recorded actions are queued while the writer runs and inserted in one batch
+2. Reaching the row limit flushes early; stopping waits for a running flush
+   and flushes the rest
+3. A bad entry is dropped without blocking the rest of the batch; an entry
+   of a deleted user is kept without the user
+4. tournament_id/match_id are promoted to columns and used by the
+   SpeedGaming sync log query
+"""
+
+import asyncio
+
+import pytest
+
+from application.repositories.audit_repository import AuditRepository
+from application.services.core import audit_writer
+from application.services.core.audit_service import AuditService
+from application.services.core.audit_writer import AuditLogWriter
+from models import AuditLog
+from models.user import SYSTEM_USER_ID
+
+
+@pytest.fixture
+async def writer(db, monkeypatch):
+    """A running audit writer installed as the global instance."""
+    instance = AuditLogWriter(flush_interval=60, max_rows=3)
+    monkeypatch.setattr(audit_writer, "_writer", instance)
+    await instance.start()
+    yield instance
+    await instance.stop()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestAuditWriter:
+    """Test batched audit log writes."""
+
+    async def test_record_is_buffered_until_flush(self, writer, sample_user):
+        """Entries wait in memory and are written together."""
+        service = AuditService()
+        await service.record("first", user_id=sample_user.id)
+        await service.record("second", user_id=SYSTEM_USER_ID)
+
+        assert writer.pending_count == 2
+        assert await AuditLog.all().count() == 0
+
+        assert await writer.flush() == 2
+        logs = await AuditLog.all().order_by("id")
+        assert [(log.action, log.user_id) for log in logs] == [
+            ("first", sample_user.id),
+            ("second", None),
+        ]
+        assert all(log.created_at is not None for log in logs)
+
+    async def test_row_limit_and_stop_flush(self, writer, sample_user):
+        """A full queue wakes the writer; stop() writes what is left."""
+        service = AuditService()
+        for i in range(3):
+            await service.record(f"action_{i}", user_id=sample_user.id)
+
+        for _ in range(50):
+            if writer.pending_count == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert await AuditLog.all().count() == 3
+
+        await service.record("last", user_id=sample_user.id)
+        await writer.stop()
+        assert await AuditLog.filter(action="last").exists()
+
+    async def test_bad_entry_is_dropped(self, writer, sample_user):
+        """An entry that cannot be written does not block the batch."""
+        service = AuditService()
+        await service.record("valid", user_id=sample_user.id)
+        await service.record("orphan", user_id=sample_user.id, organization_id=987654)
+
+        assert await writer.flush() == 1
+        assert writer.pending_count == 0
+        assert await AuditLog.filter(action="valid").exists()
+        assert not await AuditLog.filter(action="orphan").exists()
+
+    async def test_deleted_user_entry_is_kept_without_user(self, writer, sample_user):
+        """An entry of a user deleted meanwhile is stored without the user."""
+        service = AuditService()
+        await service.record("valid", user_id=sample_user.id)
+        await service.record("user_deleted", user_id=987654)
+
+        assert await writer.flush() == 2
+        log = await AuditLog.get(action="user_deleted")
+        assert log.user_id is None
+
+    async def test_stop_completes_flush_in_progress(self, db, sample_user):
+        """Stopping while a flush is writing waits for it instead of dropping it."""
+        writer = AuditLogWriter(flush_interval=60, max_rows=100)
+        create_many = writer.repository.create_many
+        writing = asyncio.Event()
+
+        async def slow_create_many(entries):
+            writing.set()
+            await asyncio.sleep(0.1)
+            return await create_many(entries)
+
+        writer.repository.create_many = slow_create_many
+        await writer.start()
+        writer.enqueue(writer.repository.build("slow", user_id=sample_user.id))
+        writer.wake()
+        await writing.wait()
+        assert writer.pending_count == 0
+
+        await writer.stop()
+        assert await AuditLog.filter(action="slow").exists()
+
+    async def test_record_writes_immediately_when_not_running(self, db, sample_user):
+        """Without the background loop, record() writes through."""
+        await AuditService().record(
+            "race_submitted",
+            user_id=sample_user.id,
+            details={"tournament_id": 7, "match_id": "not-an-id"},
+        )
+        log = await AuditLog.get(action="race_submitted")
+        assert log.tournament_id == 7
+        assert log.match_id is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestPromotedColumns:
+    """Test the denormalized tournament_id/match_id columns."""
+
+    async def test_speedgaming_sync_logs_filter_by_column(self, sample_organization):
+        """Sync logs are filtered by tournament in SQL, newest first."""
+        repo = AuditRepository()
+        entries = [
+            repo.build(
+                action="speedgaming_sync",
+                organization_id=sample_organization.id,
+                details={"tournament_id": tournament_id, "run": run},
+            )
+            for run in range(60)
+            for tournament_id in (1, 2)
+        ]
+        await repo.create_many(entries)
+
+        logs = await repo.get_speedgaming_sync_logs_for_tournament(
+            sample_organization.id, 1, limit=5
+        )
+        assert len(logs) == 5
+        assert {log.tournament_id for log in logs} == {1}
+
+        # Not capped by a scan of the organization's most recent sync logs
+        logs = await repo.get_speedgaming_sync_logs_for_tournament(
+            sample_organization.id, 2, limit=100
+        )
+        assert len(logs) == 60
+
+    async def test_create_promotes_details(self, sample_user):
+        """log_action() fills the promoted columns too."""
+        log = await AuditService().log_action(
+            user=sample_user,
+            action="match_finished",
+            details={"match_id": 42, "tournament_id": 3},
+        )
+        assert (log.match_id, log.tournament_id) == (42, 3)
@@ -74,12 +74,12 @@ class TestBuiltinTaskOverrideIntegration:
         service = TaskSchedulerService()
 
         # Get a built-in task
-        task = get_builtin_task("async_tournament_timeout_pending")
+        task = get_builtin_task("async_tournament_score_calculation")
         assert task is not None
 
         # Disable it via override
         await service.set_builtin_task_active(
-            admin_user, "async_tournament_timeout_pending", False
+            admin_user, "async_tournament_score_calculation", False
         )
 
         # Verify effective status is False
@@ -97,7 +97,7 @@ class TestBuiltinTaskOverrideIntegration:
 
         # This is verified by the service layer check in execute_builtin_task_now
         can_execute = await TaskSchedulerService.execute_builtin_task_now(
-            admin_user, "async_tournament_timeout_pending"
+            admin_user, "async_tournament_score_calculation"
         )
         # Should fail because task is not active (override = False)
         assert can_execute is False
@@ -145,7 +145,7 @@ class TestBuiltinTaskOverrideIntegration:
         # Disable multiple tasks
         task_ids = [
             "cleanup_tournament_usage",
-            "async_tournament_timeout_pending",
+            "async_tournament_score_calculation",
             "cleanup_placeholder_users",
         ]
 
@@ -0,0 +1,157 @@
+"""
+Tests for keyset-paginated organization match listing.
+
+Verifies that:
+1. Pages follow (scheduled_at, id) order, unscheduled matches first
+2. State and tournament filters are applied in the query
+3. updated_since returns only recently changed matches
+4. The API returns a weak ETag and 304 for unchanged pages
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException, Response
+
+from api.routes.tournaments import list_matches
+from application.utils.pagination import decode_cursor, encode_cursor
+from modules.tournament.models.match_schedule import Match, Tournament
+from modules.tournament.services.tournament_service import TournamentService
+
+
+@pytest.fixture
+async def schedule(db, sample_organization):
+    """Two tournaments with matches in every state."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    first = await Tournament.create(organization=sample_organization, name="First")
+    second = await Tournament.create(organization=sample_organization, name="Second")
+
+    matches = {
+        "pending": await Match.create(tournament=first),
+        "scheduled_a": await Match.create(tournament=first, scheduled_at=now),
+        # Same scheduled time: ordered by id
+        "scheduled_b": await Match.create(tournament=second, scheduled_at=now),
+        "checked_in": await Match.create(
+            tournament=first,
+            scheduled_at=now + timedelta(hours=1),
+            checked_in_at=now,
+        ),
+        "finished": await Match.create(
+            tournament=second,
+            scheduled_at=now - timedelta(days=1),
+            started_at=now - timedelta(days=1),
+            finished_at=now - timedelta(days=1),
+        ),
+    }
+    return sample_organization, first, second, matches
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestMatchListing:
+    """Test keyset pagination, filters and delta sync."""
+
+    async def test_keyset_pages_cover_all_matches_in_order(self, schedule):
+        """Walking next_cursor returns every match exactly once, in order."""
+        organization, _, _, matches = schedule
+        service = TournamentService()
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = await service.list_org_matches_page(
+                organization.id, cursor=cursor, limit=2, prefetch=False
+            )
+            seen.extend(match.id for match in page)
+            if cursor is None:
+                break
+
+        assert seen == [
+            matches["pending"].id,
+            matches["finished"].id,
+            matches["scheduled_a"].id,
+            matches["scheduled_b"].id,
+            matches["checked_in"].id,
+        ]
+
+    async def test_state_and_tournament_filters(self, schedule):
+        """Filters select matches by derived state and tournament."""
+        organization, first, _, matches = schedule
+        service = TournamentService()
+
+        page, _ = await service.list_org_matches_page(
+            organization.id, states=["pending", "scheduled"]
+        )
+        assert {m.id for m in page} == {
+            matches["pending"].id,
+            matches["scheduled_a"].id,
+            matches["scheduled_b"].id,
+        }
+
+        page, _ = await service.list_org_matches_page(
+            organization.id, states=["scheduled", "finished"], tournament_ids=[first.id]
+        )
+        assert [m.id for m in page] == [matches["scheduled_a"].id]
+        assert await service.count_org_matches(organization.id) == 5
+
+        with pytest.raises(ValueError):
+            await service.list_org_matches_page(organization.id, states=["bogus"])
+
+    async def test_updated_since_returns_changed_matches(self, schedule):
+        """Delta mode only returns matches updated at or after the timestamp."""
+        organization, _, _, matches = schedule
+        since = datetime.now(timezone.utc)
+        changed = matches["scheduled_b"]
+        changed.title = "Renamed"
+        await changed.save()
+
+        page, _ = await TournamentService().list_org_matches_page(
+            organization.id, updated_since=since
+        )
+        assert [m.id for m in page] == [changed.id]
+
+    async def test_invalid_cursor_rejected(self, schedule):
+        """Malformed cursors raise ValueError."""
+        organization, *_ = schedule
+        service = TournamentService()
+
+        for cursor in ("not-a-cursor", encode_cursor(["x"]), encode_cursor([1, "a"])):
+            with pytest.raises(ValueError):
+                await service.list_org_matches_page(organization.id, cursor=cursor)
+        assert decode_cursor(encode_cursor([None, 3]), 2) == [None, 3]
+
+    async def test_api_etag_and_not_modified(self, schedule, sample_user):
+        """Unchanged pages return 304 for a matching If-None-Match."""
+        organization, *_ = schedule
+
+        async def call(if_none_match=None, cursor=None):
+            response = Response()
+            result = await list_matches(
+                response=response,
+                organization_id=organization.id,
+                state=None,
+                tournament_id=None,
+                updated_since=None,
+                cursor=cursor,
+                limit=3,
+                if_none_match=if_none_match,
+                current_user=sample_user,
+            )
+            return response, result
+
+        response, result = await call()
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert result.count == 3
+        assert result.next_cursor is not None
+
+        _, not_modified = await call(if_none_match=etag)
+        assert not_modified.status_code == 304
+
+        _, next_page = await call(if_none_match=etag, cursor=result.next_cursor)
+        assert next_page.count == 2
+        assert next_page.next_cursor is None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await call(cursor="garbage")
+        assert exc_info.value.status_code == 400
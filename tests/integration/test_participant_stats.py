@@ -0,0 +1,292 @@
+"""
+Tests for materialized async qualifier participant stats.
+
+Verifies that:
+1. Race lifecycle events (create, start, finish, forfeit, reattempt) keep the
+   participant's row in sync with their races
+2. Rescoring a permalink refreshes every participant whose score changed
+3. The leaderboard reads one row per participant, best score first
+4. rebuild() reports and repairs missing, stale and orphaned rows
+5. Races from before the stats existed are backfilled on startup or first read
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from application.services.async_qualifiers.async_qualifier_service import (
+    AsyncQualifierService,
+)
+from application.services.async_qualifiers.participant_stats_service import (
+    ParticipantStatsService,
+    compute_participant_stats,
+)
+from application.utils.query_stats import assert_max_queries
+from models import User
+from models.organizations import OrganizationMember
+from modules.async_qualifier.models.async_qualifier import (
+    AsyncQualifier,
+    AsyncQualifierParticipantStats,
+    AsyncQualifierPermalink,
+    AsyncQualifierPool,
+    AsyncQualifierRace,
+)
+
+
+@pytest.fixture
+async def qualifier(db, sample_user, sample_organization):
+    """A qualifier with two pools of one permalink each, two runs per pool."""
+    await OrganizationMember.create(organization=sample_organization, user=sample_user)
+    qualifier = await AsyncQualifier.create(
+        organization=sample_organization, name="Qualifier", runs_per_pool=2
+    )
+    for name in ("Pool A", "Pool B"):
+        pool = await AsyncQualifierPool.create(tournament=qualifier, name=name)
+        await AsyncQualifierPermalink.create(pool=pool, url=f"https://{name}")
+    return qualifier
+
+
+async def _permalinks(qualifier):
+    """Permalinks of a qualifier, in pool order."""
+    return await AsyncQualifierPermalink.filter(
+        pool__tournament_id=qualifier.id
+    ).order_by("pool_id")
+
+
+async def _finished_race(qualifier, permalink, user, minutes: int, **fields):
+    """A finished race of the given duration."""
+    end = datetime.now(timezone.utc)
+    return await AsyncQualifierRace.create(
+        tournament=qualifier,
+        permalink=permalink,
+        user=user,
+        status="finished",
+        start_time=end - timedelta(minutes=minutes),
+        end_time=end,
+        **fields,
+    )
+
+
+async def _stats(qualifier, user) -> AsyncQualifierParticipantStats:
+    return await AsyncQualifierParticipantStats.get(
+        tournament_id=qualifier.id, user_id=user.id
+    )
+
+
+async def _other_user(discord_id: int) -> User:
+    return await User.create(discord_id=discord_id, discord_username=f"u{discord_id}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestParticipantStats:
+    """Test incremental maintenance and rebuilds."""
+
+    async def test_compute_counts_best_runs_per_pool(self, qualifier, sample_user):
+        """Only the best runs of each pool count; reattempts never do."""
+        pool_a, pool_b = await _permalinks(qualifier)
+        races = [
+            await _finished_race(qualifier, pool_a, sample_user, 60, score=90.0),
+            await _finished_race(qualifier, pool_a, sample_user, 50, score=100.0),
+            await _finished_race(qualifier, pool_a, sample_user, 40, score=30.0),
+            await _finished_race(
+                qualifier, pool_b, sample_user, 10, score=105.0, reattempted=True
+            ),
+            await AsyncQualifierRace.create(
+                tournament=qualifier,
+                permalink=pool_b,
+                user=sample_user,
+                status="forfeit",
+                score=0.0,
+            ),
+            await AsyncQualifierRace.create(
+                tournament=qualifier, permalink=pool_b, user=sample_user
+            ),
+        ]
+        for race in races:
+            await race.fetch_related("permalink")
+
+        values = compute_participant_stats(
+            races, [pool_a.pool_id, pool_b.pool_id], runs_per_pool=2
+        )
+
+        # Pool A counts 100 and 90, pool B the forfeit and one unattempted run
+        assert values["score"] == pytest.approx(190 / 4)
+        assert values["estimate"] == pytest.approx(95)
+        assert values["finished_race_count"] == 2
+        assert values["forfeited_race_count"] == 1
+        assert values["unattempted_race_count"] == 1
+        assert values["active_race_count"] == 1
+        assert values["reattempted_race_count"] == 1
+        assert values["total_score"] == pytest.approx(220)
+        assert values["best_race_id"] == races[2].id
+        assert values["best_elapsed_seconds"] == pytest.approx(40 * 60)
+        assert values["pool_progress"] == {str(pool_a.pool_id): 3}
+
+    async def test_race_lifecycle_updates_row(
+        self, qualifier, sample_user, sample_organization
+    ):
+        """Creating, starting, finishing and forfeiting races refresh the row."""
+        service = AsyncQualifierService()
+        pool_a, pool_b = await _permalinks(qualifier)
+
+        race = await service.create_race(
+            sample_user, sample_organization.id, qualifier.id, pool_a.id
+        )
+        stats = await _stats(qualifier, sample_user)
+        assert stats.active_race_count == 1
+        assert stats.unattempted_race_count == 4
+
+        await service.start_race(sample_user, sample_organization.id, race.id)
+        await service.finish_race(sample_user, sample_organization.id, race.id)
+        stats = await _stats(qualifier, sample_user)
+        assert stats.active_race_count == 0
+        assert stats.finished_race_count == 1
+        assert stats.unattempted_race_count == 3
+        assert stats.best_race_id == race.id
+        assert stats.pool_finished_count(pool_a.pool_id) == 1
+        # Sole finisher: par time is their own time
+        assert stats.total_score == pytest.approx(100)
+        assert stats.score == pytest.approx(25)
+
+        other = await service.create_race(
+            sample_user, sample_organization.id, qualifier.id, pool_b.id
+        )
+        await service.forfeit_race(sample_user, sample_organization.id, other.id)
+        stats = await _stats(qualifier, sample_user)
+        assert stats.forfeited_race_count == 1
+        assert stats.unattempted_race_count == 2
+
+    async def test_rescoring_refreshes_other_participants(
+        self, qualifier, sample_user, sample_organization
+    ):
+        """A faster finish lowers the score of everyone else on the permalink."""
+        service = AsyncQualifierService()
+        other_user = await _other_user(42)
+        pool_a, _ = await _permalinks(qualifier)
+
+        await _finished_race(qualifier, pool_a, other_user, 60)
+        await service.calculate_permalink_scores(pool_a.id, sample_organization.id)
+        assert (await _stats(qualifier, other_user)).total_score == pytest.approx(100)
+
+        await _finished_race(qualifier, pool_a, sample_user, 30)
+        await service.calculate_permalink_scores(pool_a.id, sample_organization.id)
+
+        # Par is now 45 minutes: 60 minutes scores (2 - 60/45) * 100
+        assert (await _stats(qualifier, other_user)).total_score == pytest.approx(
+            (2 - 60 / 45) * 100
+        )
+        assert (await _stats(qualifier, sample_user)).total_score == pytest.approx(105)
+
+    async def test_reattempt_excludes_race(
+        self, qualifier, sample_user, sample_organization
+    ):
+        """A reattempted race no longer counts."""
+        service = AsyncQualifierService()
+        pool_a, _ = await _permalinks(qualifier)
+        race = await _finished_race(qualifier, pool_a, sample_user, 30)
+        await service.calculate_permalink_scores(pool_a.id, sample_organization.id)
+        assert (await _stats(qualifier, sample_user)).finished_race_count == 1
+
+        await service.mark_race_as_reattempted(
+            sample_user, sample_organization.id, race.id
+        )
+
+        stats = await _stats(qualifier, sample_user)
+        assert stats.finished_race_count == 0
+        assert stats.reattempted_race_count == 1
+        assert stats.best_race_id is None
+
+    async def test_leaderboard_reads_stats_rows(
+        self, qualifier, sample_user, sample_organization
+    ):
+        """The leaderboard is one query over the stats after the access checks."""
+        service = AsyncQualifierService()
+        pool_a, pool_b = await _permalinks(qualifier)
+        users = [sample_user] + [await _other_user(100 + i) for i in range(5)]
+        for i, user in enumerate(users):
+            await _finished_race(qualifier, pool_a, user, 30 + i)
+            await _finished_race(qualifier, pool_b, user, 30 + i)
+        await service.calculate_tournament_scores(
+            None, sample_organization.id, qualifier.id, system_task=True
+        )
+
+        with assert_max_queries(5):
+            leaderboard = await service.get_leaderboard(
+                sample_user, sample_organization.id, qualifier.id
+            )
+
+        assert [entry.user.id for entry in leaderboard] == [u.id for u in users]
+        assert leaderboard[0].finished_race_count == 2
+        assert leaderboard[0].unattempted_race_count == 2
+        assert leaderboard[0].score > leaderboard[-1].score
+
+    async def test_layout_changes_refresh_every_participant(
+        self, qualifier, sample_user
+    ):
+        """A tournament-wide refresh picks up new pools and runs per pool."""
+        stats_service = ParticipantStatsService()
+        pool_a, _ = await _permalinks(qualifier)
+        await _finished_race(qualifier, pool_a, sample_user, 30)
+        await stats_service.refresh(qualifier.id)
+        assert (await _stats(qualifier, sample_user)).unattempted_race_count == 3
+
+        await AsyncQualifierPool.create(tournament=qualifier, name="Pool C")
+        await AsyncQualifier.filter(id=qualifier.id).update(runs_per_pool=1)
+        assert await stats_service.refresh(qualifier.id) == [sample_user.id]
+        assert (await _stats(qualifier, sample_user)).unattempted_race_count == 2
+
+    async def test_rebuild_reports_and_repairs_drift(self, qualifier, sample_user):
+        """Missing, stale and orphaned rows are reported once, then repaired."""
+        stats_service = ParticipantStatsService()
+        pool_a, _ = await _permalinks(qualifier)
+        other_user = await _other_user(42)
+        gone_user = await _other_user(43)
+        await _finished_race(qualifier, pool_a, sample_user, 30, score=100.0)
+        await _finished_race(qualifier, pool_a, other_user, 30, score=100.0)
+        await AsyncQualifierRace.create(
+            tournament=qualifier, permalink=pool_a, user=gone_user
+        )
+        await stats_service.refresh(qualifier.id)
+
+        # Stale row, missing row, row without races
+        await AsyncQualifierParticipantStats.filter(user_id=sample_user.id).update(
+            finished_race_count=7
+        )
+        await AsyncQualifierParticipantStats.filter(user_id=other_user.id).delete()
+        await AsyncQualifierRace.filter(user_id=gone_user.id).delete()
+
+        result = await stats_service.rebuild()
+        assert result.drifted == {
+            qualifier.id: sorted([sample_user.id, other_user.id, gone_user.id])
+        }
+        assert result.participants == 2
+        assert (await _stats(qualifier, sample_user)).finished_race_count == 1
+
+        result = await stats_service.rebuild(qualifier.id)
+        assert result.drift_count == 0
+
+    async def test_missing_rows_are_backfilled(
+        self, qualifier, sample_user, sample_organization
+    ):
+        """Tournaments without rows are materialized on backfill or first read."""
+        stats_service = ParticipantStatsService()
+        pool_a, _ = await _permalinks(qualifier)
+        other_user = await _other_user(42)
+        await _finished_race(qualifier, pool_a, sample_user, 30, score=100.0)
+        await _finished_race(qualifier, pool_a, other_user, 30, score=90.0)
+
+        # Races created before the stats table: the leaderboard fills it
+        leaderboard = await AsyncQualifierService().get_leaderboard(
+            sample_user, sample_organization.id, qualifier.id
+        )
+        assert [entry.user.id for entry in leaderboard] == [
+            sample_user.id,
+            other_user.id,
+        ]
+
+        # Partially materialized: the startup backfill completes it
+        await AsyncQualifierParticipantStats.filter(user_id=other_user.id).delete()
+        assert await stats_service.backfill_missing() == [qualifier.id]
+        assert await stats_service.backfill_missing() == []
+        assert (await _stats(qualifier, other_user)).finished_race_count == 1
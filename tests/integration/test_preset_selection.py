@@ -0,0 +1,213 @@
+"""
+Tests for compiled preset selection rules.
+
+Verifies that:
+1. Rules compile once per rules version and are cached by content
+2. Compiled rules select the same presets as the declarative rules describe
+3. Player counts are only queried when a rule references them
+4. Batch selection handles many matches across tournaments in one pass
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from modules.tournament.models.match_schedule import Match, MatchPlayers, Tournament
+from modules.tournament.services.preset_selection_service import (
+    PresetSelectionService,
+)
+
+
+def _rules(*rules):
+    return {"rules": list(rules)}
+
+
+TITLE_RULE = {
+    "name": "Finals",
+    "conditions": {
+        "type": "OR",
+        "conditions": [
+            {"field": "match.title", "operator": "matches_regex", "value": "^final"},
+            {"field": "match.title", "operator": "contains", "value": "grand"},
+        ],
+    },
+    "preset_id": 10,
+}
+
+PLAYER_COUNT_RULE = {
+    "name": "Three-way",
+    "conditions": {"field": "match.player_count", "operator": ">=", "value": 3},
+    "preset_id": 20,
+}
+
+
+@pytest.mark.unit
+class TestRuleCompilation:
+    """Test compiling rules without a database."""
+
+    def test_compiled_rules_are_cached_by_content(self):
+        """Equal rules share one compiled program; edited rules recompile."""
+        service = PresetSelectionService()
+        first = Tournament(id=1, name="A", preset_selection_rules=_rules(TITLE_RULE))
+        second = Tournament(id=2, name="B", preset_selection_rules=_rules(TITLE_RULE))
+        edited = Tournament(
+            id=1, name="A", preset_selection_rules=_rules(PLAYER_COUNT_RULE)
+        )
+
+        compiled = service.get_compiled_rules(first)
+        assert service.get_compiled_rules(second) is compiled
+        assert service.get_compiled_rules(edited) is not compiled
+        assert compiled.fields == frozenset({"match.title"})
+        assert not compiled.needs_player_count
+
+    def test_invalid_rule_is_skipped(self):
+        """A malformed rule is skipped; an invalid value only fails its leaf."""
+        rule_set = PresetSelectionService.compile_rules(
+            _rules(
+                {
+                    "name": "Bad",
+                    "conditions": {
+                        "field": "user.email",
+                        "operator": "equals",
+                        "value": 1,
+                    },
+                    "preset_id": 1,
+                },
+                {
+                    "name": "Bad regex",
+                    "conditions": {
+                        "type": "OR",
+                        "conditions": [
+                            {
+                                "field": "match.title",
+                                "operator": "matches_regex",
+                                "value": "(",
+                            },
+                            {
+                                "field": "match.game_number",
+                                "operator": ">",
+                                "value": "many",
+                            },
+                            {
+                                "field": "match.title",
+                                "operator": "contains",
+                                "value": "final",
+                            },
+                        ],
+                    },
+                    "preset_id": 2,
+                },
+                TITLE_RULE,
+            )
+        )
+
+        assert [rule.predicate is None for rule in rule_set.rules] == [
+            True,
+            False,
+            False,
+        ]
+        assert rule_set.rules[0].error == "Field 'user.email' is not allowed"
+        bad_regex = rule_set.rules[1].predicate
+        assert bad_regex({"match": {"title": "Grand Final", "game_number": 2}})
+        assert not bad_regex({"match": {"title": "Round 1", "game_number": 2}})
+
+    def test_leaf_operators(self):
+        """Compiled comparisons match the documented operator semantics."""
+        context = {
+            "match": {
+                "title": "Grand Final",
+                "game_number": 2,
+                "scheduled_at.hour": 18,
+            },
+            "settings": {"mode": {"name": "open"}},
+            "tournament": {"id": 1, "name": "Test"},
+        }
+
+        def check(field, operator, value):
+            predicate = PresetSelectionService._compile_condition(
+                {"field": field, "operator": operator, "value": value}, set()
+            )
+            return predicate(context)
+
+        assert check("match.title", "starts_with", "grand")
+        assert check("match.title", "ends_with", "FINAL")
+        assert check("match.game_number", "between", [1, 3])
+        assert check("match.game_number", "in", [2, 4])
+        assert check("match.game_number", "not_in", [1, 3])
+        assert check("match.scheduled_at.hour", ">", 17)
+        assert check("settings.mode.name", "equals", "open")
+        assert check("match.missing", "equals", None)
+        assert not check("match.missing", "not_equals", 1)
+        assert not check("match.title", "<", 5)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestPresetSelection:
+    """Test preset selection against the database."""
+
+    async def _tournament(self, organization, rules=None, name="Rules"):
+        return await Tournament.create(
+            organization=organization,
+            name=name,
+            preset_selection_rules=rules,
+        )
+
+    async def test_select_preset_for_match(self, db, sample_organization):
+        """The first matching rule wins; no match falls back to the default."""
+        tournament = await self._tournament(sample_organization, _rules(TITLE_RULE))
+        final = await Match.create(tournament=tournament, title="Finals Game")
+        other = await Match.create(tournament=tournament, title="Round 1")
+
+        service = PresetSelectionService()
+        assert await service.select_preset_for_match(final, tournament) == 10
+        assert await service.select_preset_for_match(other, tournament) is None
+
+    async def test_player_count_only_queried_when_referenced(
+        self, db, sample_organization, sample_user, admin_user
+    ):
+        """Rules without match.player_count issue no player queries."""
+        title_only = await self._tournament(sample_organization, _rules(TITLE_RULE))
+        counted = await self._tournament(
+            sample_organization, _rules(PLAYER_COUNT_RULE), name="Counted"
+        )
+        match = await Match.create(tournament=counted, title="Race")
+        await MatchPlayers.create(match=match, user=sample_user)
+        await MatchPlayers.create(match=match, user=admin_user)
+
+        service = PresetSelectionService()
+        with patch.object(MatchPlayers, "filter") as mock_filter:
+            await service.select_preset_for_match(match, title_only)
+        mock_filter.assert_not_called()
+
+        assert await service.select_preset_for_match(match, counted) is None
+        await MatchPlayers.create(match=match, user=sample_user)
+        assert await service.select_preset_for_match(match, counted) == 20
+
+    async def test_select_presets_for_matches(
+        self, db, sample_organization, sample_user
+    ):
+        """Batch selection covers matches from several tournaments."""
+        ruled = await self._tournament(
+            sample_organization, _rules(TITLE_RULE, PLAYER_COUNT_RULE)
+        )
+        plain = await self._tournament(sample_organization, name="Plain")
+        now = datetime.now(timezone.utc)
+        final = await Match.create(tournament=ruled, title="Grand final")
+        crowded = await Match.create(tournament=ruled, title="Heat", scheduled_at=now)
+        quiet = await Match.create(tournament=ruled, title="Heat")
+        default = await Match.create(tournament=plain, title="Final")
+        for _ in range(3):
+            await MatchPlayers.create(match=crowded, user=sample_user)
+
+        matches = await Match.filter(
+            id__in=[final.id, crowded.id, quiet.id, default.id]
+        )
+        selections = await PresetSelectionService().select_presets_for_matches(matches)
+
+        assert selections == {
+            final.id: 10,
+            crowded.id: 20,
+            quiet.id: None,
+            default.id: None,
+        }
@@ -0,0 +1,161 @@
+"""
+Tests for SQL statement statistics and query budgets.
+
+Verifies that:
+1. Statements differing only in values share a fingerprint
+2. Executions are timed and attributed to the innermost caller, falling back
+   to the request scope label
+3. Slow SELECTs are sampled with EXPLAIN
+4. assert_max_queries() fails with the repeated statements when over budget
+"""
+
+import asyncio
+
+import pytest
+
+from application.utils import query_stats
+from application.utils.query_stats import (
+    UNSCOPED_CALLER,
+    assert_max_queries,
+    capture_queries,
+    fingerprint,
+    get_query_stats,
+    query_caller,
+    track_queries,
+)
+from application.utils.request_scope import request_scope
+from models import User
+
+
+@pytest.fixture
+def stats(db):
+    """The global registry, emptied for the test."""
+    registry = get_query_stats()
+    registry.reset()
+    yield registry
+    registry.reset()
+
+
+@track_queries
+async def _load_users():
+    """A decorated loader."""
+    return await User.all()
+
+
+def _callers_of(stats, table: str) -> dict:
+    """Caller counts of every SELECT on a table."""
+    callers = {}
+    for row in stats.fingerprints(limit=1000):
+        if (
+            row["fingerprint"].startswith("SELECT")
+            and f'"{table}"' in row["fingerprint"]
+        ):
+            for caller, count in row["callers"]:
+                callers[caller] = callers.get(caller, 0) + count
+    return callers
+
+
+class TestFingerprint:
+    """Test statement normalization."""
+
+    def test_literals_and_placeholders_are_normalized(self):
+        """Values, placeholders and whitespace do not split fingerprints."""
+        assert fingerprint("SELECT * FROM t WHERE id=5 AND name='x'") == fingerprint(
+            "SELECT  *\nFROM t WHERE id=17 AND name='it''s'"
+        )
+        assert fingerprint("SELECT * FROM t WHERE id=%s") == fingerprint(
+            "SELECT * FROM t WHERE id=?"
+        )
+
+    def test_value_lists_collapse(self):
+        """IN lists and multi-row VALUES collapse to one element."""
+        assert fingerprint("SELECT * FROM t WHERE id IN (1,2,3)") == (
+            "SELECT * FROM t WHERE id IN (?)"
+        )
+        assert fingerprint("INSERT INTO t (a,b) VALUES (?,?),(?,?),(?,?)") == (
+            "INSERT INTO t (a,b) VALUES (?)"
+        )
+
+    def test_identifiers_keep_digits(self):
+        """Digits inside identifiers are not literals."""
+        assert fingerprint("SELECT col1 FROM t2") == "SELECT col1 FROM t2"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestQueryStats:
+    """Test recording, attribution and budgets."""
+
+    async def test_statements_are_recorded_per_caller(self, stats, sample_user):
+        """Decorators and query_caller() override the request scope label."""
+        with request_scope("GET /test"):
+            await User.get(id=sample_user.id)
+            await _load_users()
+            with query_caller("task:Nightly"):
+                await User.filter(id=sample_user.id).first()
+        await User.all().count()
+
+        callers = _callers_of(stats, "users")
+        assert callers["GET /test"] == 1
+        assert callers["_load_users"] == 1
+        assert callers["task:Nightly"] == 1
+        assert callers[UNSCOPED_CALLER] == 1
+
+        summary = stats.summary()
+        assert summary["count"] >= 4
+        assert summary["total_ms"] > 0
+        assert {row["caller"] for row in stats.callers()} >= set(callers)
+
+    async def test_repeated_statement_percentiles(self, stats, sample_user):
+        """Executions with different values share one fingerprint."""
+        for _ in range(5):
+            await User.get(id=sample_user.id)
+
+        row = next(
+            r
+            for r in stats.fingerprints(order_by="count")
+            if r["fingerprint"].startswith("SELECT") and '"users"' in r["fingerprint"]
+        )
+        assert row["count"] == 5
+        assert 0 < row["p50_ms"] <= row["p99_ms"] <= row["max_ms"]
+
+    async def test_slow_select_is_explained(self, stats, sample_user, monkeypatch):
+        """Slow SELECTs are counted and get an EXPLAIN plan in the background."""
+        monkeypatch.setattr(query_stats.settings, "SLOW_QUERY_MS", 0.0001)
+        await User.get(id=sample_user.id)
+
+        for _ in range(50):
+            slow = stats.slow_queries()
+            if slow and slow[0]["explain"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert slow[0]["slow_count"] == 1
+        assert slow[0]["explain"]
+        # The EXPLAIN itself is not recorded
+        assert not any(
+            row["fingerprint"].startswith("EXPLAIN") for row in stats.fingerprints()
+        )
+
+    async def test_disabled_collection(self, stats, sample_user, monkeypatch):
+        """Nothing is aggregated when collection is disabled; capture still works."""
+        monkeypatch.setattr(query_stats.settings, "QUERY_STATS_ENABLED", False)
+        stats.reset()
+        with capture_queries() as recorder:
+            await User.get(id=sample_user.id)
+
+        assert recorder.count == 1
+        assert stats.summary()["count"] == 0
+
+    async def test_query_budget(self, stats, sample_user):
+        """assert_max_queries passes within budget and reports N+1 patterns."""
+        with assert_max_queries(1) as recorder:
+            await User.filter(id=sample_user.id).first()
+        assert recorder.count == 1
+
+        with pytest.raises(AssertionError) as exc_info:
+            with assert_max_queries(2):
+                for _ in range(3):
+                    await User.get(id=sample_user.id)
+        assert "Issued 3 queries (budget 2)" in str(exc_info.value)
+        assert "3x SELECT" in str(exc_info.value)
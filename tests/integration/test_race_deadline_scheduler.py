@@ -0,0 +1,283 @@
+"""
+Tests for the async qualifier race deadline scheduler.
+
+Verifies that:
+1. Deadlines are derived from thread_timeout_time / start_time
+2. A timer forfeits its race when the deadline passes
+3. Re-arming after an extension moves the deadline; a timer whose race
+   changed without re-arming re-arms instead of forfeiting
+4. Startup arms every active race from one query and forfeits overdue races
+5. Nothing is forfeited while the bot is disabled or the thread is unknown;
+   an armed forfeit is retried until the thread can be resolved
+6. Stopping waits for a deadline being handled instead of cancelling it
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from application.services.async_qualifiers import race_deadline_scheduler
+from application.services.async_qualifiers.race_deadline_scheduler import (
+    FORFEIT,
+    WARNING,
+    RaceDeadlineScheduler,
+)
+from modules.async_qualifier.models.async_qualifier import (
+    AsyncQualifier,
+    AsyncQualifierAuditLog,
+    AsyncQualifierPermalink,
+    AsyncQualifierPool,
+    AsyncQualifierRace,
+)
+
+
+@pytest.fixture
+async def make_race(db, sample_user, sample_organization):
+    """Factory for races in a fresh qualifier."""
+    qualifier = await AsyncQualifier.create(
+        organization=sample_organization, name="Qualifier"
+    )
+    pool = await AsyncQualifierPool.create(tournament=qualifier, name="Pool")
+    permalink = await AsyncQualifierPermalink.create(pool=pool, url="https://x")
+
+    async def make(**fields):
+        fields.setdefault("discord_thread_id", 1234)
+        return await AsyncQualifierRace.create(
+            tournament=qualifier, permalink=permalink, user=sample_user, **fields
+        )
+
+    return make
+
+
+class FakeThread:
+    """Race thread recording the messages sent to it."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, message, **kwargs):
+        self.messages.append(message)
+
+
+class FakeBot:
+    """Ready Discord bot that knows a set of threads."""
+
+    def __init__(self, threads):
+        self.threads = threads
+
+    def is_ready(self):
+        return True
+
+    def get_channel(self, channel_id):
+        return self.threads.get(channel_id)
+
+    async def fetch_channel(self, channel_id):
+        raise discord.NotFound(MagicMock(status=404), "Unknown Channel")
+
+
+@pytest.fixture
+def thread(monkeypatch):
+    """Install a ready bot that resolves thread 1234."""
+    fake_thread = FakeThread()
+    bot = FakeBot({1234: fake_thread})
+    monkeypatch.setattr(race_deadline_scheduler, "get_bot_instance", lambda: bot)
+    return fake_thread
+
+
+@pytest.fixture
+async def scheduler(db, monkeypatch, thread):
+    """A scheduler (not yet started) installed as the global instance."""
+    instance = RaceDeadlineScheduler(
+        warning_minutes=10, pending_timeout_minutes=20, max_hours=12
+    )
+    monkeypatch.setattr(race_deadline_scheduler, "_scheduler", instance)
+    yield instance
+    await instance.stop()
+
+
+async def _wait_for_status(race_id: int, status: str) -> bool:
+    """Poll until a race reaches a status (or give up after ~2s)."""
+    for _ in range(100):
+        race = await AsyncQualifierRace.get(id=race_id)
+        if race.status == status:
+            return True
+        await asyncio.sleep(0.02)
+    return False
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestRaceDeadlineScheduler:
+    """Test timer arming and firing."""
+
+    async def test_deadlines_for_race_states(self, scheduler, make_race):
+        """Pending races warn then forfeit; in-progress races only forfeit."""
+        now = datetime.now(timezone.utc)
+        pending = await make_race(thread_timeout_time=now)
+        assert scheduler.deadlines_for(pending) == [
+            race_deadline_scheduler.RaceDeadline(now - timedelta(minutes=10), WARNING),
+            race_deadline_scheduler.RaceDeadline(now, FORFEIT),
+        ]
+
+        opened = await make_race(thread_open_time=now)
+        assert scheduler.deadlines_for(opened)[-1].when == now + timedelta(minutes=20)
+
+        running = await make_race(status="in_progress", start_time=now)
+        assert scheduler.deadlines_for(running) == [
+            race_deadline_scheduler.RaceDeadline(now + timedelta(hours=12), FORFEIT)
+        ]
+
+        assert scheduler.deadlines_for(await make_race(discord_thread_id=None)) == []
+        assert scheduler.deadlines_for(await make_race(status="finished")) == []
+
+    async def test_timer_forfeits_on_deadline(self, scheduler, make_race):
+        """An armed race is forfeited once its timeout passes."""
+        await scheduler.start()
+        race = await make_race(
+            thread_timeout_time=datetime.now(timezone.utc) + timedelta(seconds=0.2)
+        )
+        scheduler.arm(race)
+        assert scheduler.armed_count == 1
+
+        assert await _wait_for_status(race.id, "forfeit")
+        log = await AsyncQualifierAuditLog.get(action="auto_forfeit")
+        assert log.user_id is None
+        assert "pending timeout" in log.details
+        await asyncio.sleep(0)
+        assert scheduler.armed_count == 0
+
+    async def test_rearm_after_extension(self, scheduler, make_race):
+        """Extending the timeout and re-arming keeps the race alive."""
+        await scheduler.start()
+        race = await make_race(
+            thread_timeout_time=datetime.now(timezone.utc) + timedelta(seconds=0.2)
+        )
+        scheduler.arm(race)
+
+        race.thread_timeout_time += timedelta(hours=1)
+        await race.save()
+        scheduler.arm(race)
+
+        await asyncio.sleep(0.4)
+        assert (await AsyncQualifierRace.get(id=race.id)).status == "pending"
+        assert scheduler.armed_count == 1
+
+    async def test_stale_timer_rearms(self, scheduler, make_race):
+        """A race started elsewhere is re-armed for its new deadline."""
+        await scheduler.start()
+        race = await make_race(
+            thread_timeout_time=datetime.now(timezone.utc) + timedelta(seconds=0.2)
+        )
+        scheduler.arm(race)
+
+        await AsyncQualifierRace.filter(id=race.id).update(
+            status="in_progress", start_time=datetime.now(timezone.utc)
+        )
+        await asyncio.sleep(0.4)
+
+        assert (await AsyncQualifierRace.get(id=race.id)).status == "in_progress"
+        assert scheduler.armed_count == 1
+
+    async def test_start_arms_active_races(self, scheduler, make_race):
+        """Startup arms active races and forfeits overdue ones right away."""
+        now = datetime.now(timezone.utc)
+        await make_race(thread_timeout_time=now + timedelta(hours=1))
+        await make_race(status="in_progress", start_time=now)
+        overdue = await make_race(
+            status="in_progress", start_time=now - timedelta(hours=13)
+        )
+        await make_race(status="finished")
+        await make_race(discord_thread_id=None)
+
+        await scheduler.start()
+        assert await _wait_for_status(overdue.id, "forfeit")
+        log = await AsyncQualifierAuditLog.get(action="auto_forfeit")
+        assert "12 hour timeout" in log.details
+
+        await asyncio.sleep(0)
+        assert scheduler.armed_count == 2
+
+    async def test_sweep_overdue_without_running(self, scheduler, make_race):
+        """The legacy task sweep forfeits overdue races only."""
+        now = datetime.now(timezone.utc)
+        overdue = await make_race(thread_timeout_time=now - timedelta(minutes=1))
+        upcoming = await make_race(thread_timeout_time=now + timedelta(minutes=5))
+
+        assert await scheduler.sweep_overdue() == 1
+        assert (await AsyncQualifierRace.get(id=overdue.id)).status == "forfeit"
+        assert (await AsyncQualifierRace.get(id=upcoming.id)).status == "pending"
+
+        # Not running: arm() does nothing
+        scheduler.arm(upcoming)
+        assert scheduler.armed_count == 0
+
+    async def test_sweep_skips_without_bot(self, scheduler, make_race, monkeypatch):
+        """With the bot disabled overdue races are left alone."""
+        monkeypatch.setattr(race_deadline_scheduler, "get_bot_instance", lambda: None)
+        overdue = await make_race(
+            thread_timeout_time=datetime.now(timezone.utc) - timedelta(minutes=1)
+        )
+
+        assert await scheduler.sweep_overdue() == 0
+        assert (await AsyncQualifierRace.get(id=overdue.id)).status == "pending"
+
+    async def test_unknown_thread_is_not_forfeited(self, scheduler, make_race, thread):
+        """A race whose thread cannot be resolved is not forfeited silently."""
+        now = datetime.now(timezone.utc)
+        lost = await make_race(
+            discord_thread_id=999, thread_timeout_time=now - timedelta(minutes=1)
+        )
+        known = await make_race(thread_timeout_time=now - timedelta(minutes=1))
+
+        assert await scheduler.sweep_overdue() == 1
+        assert (await AsyncQualifierRace.get(id=lost.id)).status == "pending"
+        assert (await AsyncQualifierRace.get(id=known.id)).status == "forfeit"
+        assert len(thread.messages) == 1
+
+    async def test_forfeit_retried_until_thread_resolves(
+        self, scheduler, make_race, thread, monkeypatch
+    ):
+        """An armed forfeit whose thread is unknown is deferred, then retried."""
+        monkeypatch.setattr(race_deadline_scheduler, "THREAD_RETRY_SECONDS", 0.2)
+        await scheduler.start()
+        race = await make_race(
+            discord_thread_id=999,
+            thread_timeout_time=datetime.now(timezone.utc) - timedelta(minutes=1),
+        )
+        scheduler.arm(race)
+
+        await asyncio.sleep(0.1)
+        assert (await AsyncQualifierRace.get(id=race.id)).status == "pending"
+        assert scheduler.armed_count == 1
+
+        race_deadline_scheduler.get_bot_instance().threads[999] = thread
+        assert await _wait_for_status(race.id, "forfeit")
+        assert len(thread.messages) == 1
+
+    async def test_stop_completes_deadline_in_progress(
+        self, scheduler, make_race, thread, monkeypatch
+    ):
+        """Stopping while a forfeit is being handled waits for it to finish."""
+        sending = asyncio.Event()
+        send = thread.send
+
+        async def slow_send(message, **kwargs):
+            sending.set()
+            await asyncio.sleep(0.1)
+            await send(message, **kwargs)
+
+        monkeypatch.setattr(thread, "send", slow_send)
+        await scheduler.start()
+        race = await make_race(
+            thread_timeout_time=datetime.now(timezone.utc) - timedelta(minutes=1)
+        )
+        scheduler.arm(race)
+        await sending.wait()
+
+        await scheduler.stop()
+        assert len(thread.messages) == 1
+        assert await AsyncQualifierAuditLog.filter(action="auto_forfeit").exists()
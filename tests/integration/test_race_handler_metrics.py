@@ -0,0 +1,112 @@
+"""
+Tests for RaceTime race handler throughput metrics and the replay harness.
+
+Verifies that:
+1. Replayed frames run through the handler's message loop in order
+2. Messages, backlog and database time are recorded per handler class
+3. Rooms are tracked only while their handler is running
+4. Websocket receive queues are read from both websockets implementations
+"""
+
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+from racetime.handler_metrics import get_race_handler_metrics, queued_frames
+from racetime.handlers.alttpr_handler import ALTTPRRaceHandler
+from racetime.handlers.base_handler import SahaRaceHandler
+from racetime.handlers.match_race_handler import create_match_handler_class
+from racetime.replay import (
+    default_handler_kwargs,
+    generate_race_frames,
+    replay_frames,
+)
+
+
+@pytest.fixture
+def metrics(db):
+    """The global metrics, emptied for the test."""
+    registry = get_race_handler_metrics()
+    registry.reset()
+    yield registry
+    registry.reset()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestRaceHandlerMetrics:
+    """Test handler metrics collected while replaying a race."""
+
+    async def test_generated_race_is_deterministic(self):
+        """The same seed produces the same frames, ending with a finished race."""
+        frames = generate_race_frames(entrants=10, status_flips=20, join_requests=2)
+
+        assert frames == generate_race_frames(
+            entrants=10, status_flips=20, join_requests=2
+        )
+        # Opening frame, joins, flips, pending, start, finishes, finished
+        assert len(frames) == 1 + 12 + 20 + 2 + 10 + 1
+        assert frames[-1]["race"]["status"]["value"] == "finished"
+
+    async def test_replay_records_handler_metrics(self, metrics):
+        """Every frame is processed and counted with its backlog."""
+        frames = generate_race_frames(entrants=8, status_flips=10)
+
+        result = await replay_frames(SahaRaceHandler, frames)
+
+        assert result.frames == len(frames)
+        stats = result.metrics
+        assert stats["messages"] == len(frames)
+        assert stats["by_type"] == {"race.data": len(frames)}
+        assert stats["errors"] == 0
+        # The first frame is read with every other frame still queued
+        assert stats["max_backlog"] == len(frames) - 1
+        assert stats["processing"]["count"] == len(frames)
+        assert stats["db_ms"] > 0
+
+    async def test_room_is_tracked_while_running(self, metrics):
+        """The room disappears from the snapshot once its handler finishes."""
+        frames = generate_race_frames(entrants=3, status_flips=0, join_requests=0)
+        room = frames[0]["race"]["name"]
+        seen = []
+        original_observe = metrics.observe
+
+        def observe(*args, **kwargs):
+            original_observe(*args, **kwargs)
+            seen.append(metrics.snapshot()["rooms"].get(room))
+
+        metrics.observe = observe
+        try:
+            await replay_frames(SahaRaceHandler, frames)
+        finally:
+            del metrics.observe
+
+        assert seen[0]["handler"] == "SahaRaceHandler"
+        assert seen[-1]["messages"] == len(frames)
+        assert seen[-1]["backlog"] == 0
+        assert room not in metrics.snapshot()["rooms"]
+
+    async def test_match_handler_is_recorded_by_class(self, metrics):
+        """Match variants are reported separately from their base handler."""
+        handler_class = create_match_handler_class(ALTTPRRaceHandler)
+        frames = generate_race_frames(entrants=4, status_flips=4)
+
+        result = await replay_frames(
+            handler_class, frames, **default_handler_kwargs(handler_class)
+        )
+
+        handlers = metrics.snapshot()["handlers"]
+        assert result.handler == handler_class.__name__
+        assert list(handlers) == [handler_class.__name__]
+        assert handlers[handler_class.__name__]["messages"] == len(frames)
+
+    async def test_queued_frames(self):
+        """Receive queues are counted for new and legacy websockets."""
+        current = SimpleNamespace(recv_messages=SimpleNamespace(frames=deque([1, 2])))
+        legacy = SimpleNamespace(messages=deque([1, 2, 3]))
+
+        assert queued_frames(current) == 2
+        assert queued_frames(legacy) == 3
+        assert queued_frames(SimpleNamespace()) is None
+        assert queued_frames(None) is None
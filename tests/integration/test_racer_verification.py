@@ -0,0 +1,228 @@
+"""
+Tests for racer verification eligibility checks.
+
+Verifies that:
+1. A user's race history is streamed once for all categories and only until
+   the minimum is reached
+2. Later checks reuse the cached history, resuming where it stopped without
+   counting races shifted onto later pages twice
+3. Forfeits and disqualifications only count when configured
+4. Guild re-verification checks each user once for every verification and
+   retries failed role grants
+"""
+
+import itertools
+
+import pytest
+
+from application.services.racetime.racer_verification_service import (
+    RacerVerificationService,
+)
+from models import RacerVerification, User, UserRacerVerification
+
+RACETIME_ID = "rt-player"
+PAGE_SIZE = 10
+
+_race_numbers = itertools.count(1)
+
+
+def _race(category: str, status: str, racetime_id: str = RACETIME_ID) -> dict:
+    """A race as returned by /user/{id}/races/data with entrants."""
+    return {
+        "name": f"{category}/race-{next(_race_numbers)}",
+        "category": {"slug": category},
+        "entrants": [
+            {"user": {"id": "someone-else"}, "status": {"value": "done"}},
+            {"user": {"id": racetime_id}, "status": {"value": status}},
+        ],
+    }
+
+
+class FakeRacetimeApi:
+    """Serves a fixed race history per RaceTime user, recording fetched pages."""
+
+    def __init__(self, histories: dict[str, list[dict]]):
+        self.histories = histories
+        self.fetched: list[tuple[str, int]] = []
+
+    async def iter_user_race_pages(self, user, start_page=1, show_entrants=True):
+        races = self.histories[user.racetime_id]
+        num_pages = max(1, -(-len(races) // PAGE_SIZE))
+        for page in range(start_page, num_pages + 1):
+            self.fetched.append((user.racetime_id, page))
+            yield page, num_pages, races[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+
+
+def _service(histories: dict[str, list[dict]]) -> RacerVerificationService:
+    service = RacerVerificationService()
+    service.racetime_api = FakeRacetimeApi(histories)
+    return service
+
+
+async def _verification(organization, **fields) -> RacerVerification:
+    values = {
+        "guild_id": 1,
+        "role_id": 10,
+        "role_name": "Racer",
+        "categories": ["alttpr"],
+        "minimum_races": 5,
+    }
+    values.update(fields)
+    return await RacerVerification.create(organization=organization, **values)
+
+
+async def _racer(discord_id: int, racetime_id: str | None) -> User:
+    return await User.create(
+        discord_id=discord_id,
+        discord_username=f"u{discord_id}",
+        racetime_id=racetime_id,
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestRacerVerification:
+    """Test eligibility checks and guild re-verification."""
+
+    async def test_history_streams_until_minimum(self, db, sample_organization):
+        """Categories are counted together and later pages are not fetched."""
+        user = await _racer(1, RACETIME_ID)
+        races = [
+            race
+            for _ in range(10)
+            for race in (_race("alttpr", "done"), _race("smz3", "done"))
+        ]
+        service = _service({RACETIME_ID: races})
+        verification = await _verification(
+            sample_organization, categories=["alttpr", "smz3"], minimum_races=8
+        )
+
+        eligibility = await service.check_user_eligibility(user, verification.id)
+
+        assert eligibility["is_eligible"] is True
+        assert eligibility["race_count"] == 10
+        assert eligibility["error"] is None
+        assert service.racetime_api.fetched == [(RACETIME_ID, 1)]
+
+    async def test_cached_history_is_resumed(self, db, sample_organization):
+        """A stricter check resumes the cached history; a met one fetches nothing."""
+        user = await _racer(1, RACETIME_ID)
+        races = [_race("alttpr", "done") for _ in range(25)]
+        service = _service({RACETIME_ID: races})
+        lenient = await _verification(sample_organization, minimum_races=3)
+        strict = await _verification(sample_organization, role_id=11, minimum_races=30)
+
+        assert (await service.check_user_eligibility(user, lenient.id))[
+            "race_count"
+        ] == 10
+        eligibility = await service.check_user_eligibility(user, strict.id)
+        assert eligibility["is_eligible"] is False
+        assert eligibility["race_count"] == 25
+
+        # Another service instance shares the now complete history
+        other = _service({RACETIME_ID: races})
+        assert (await other.check_user_eligibility(user, strict.id))["race_count"] == 25
+        assert service.racetime_api.fetched == [
+            (RACETIME_ID, 1),
+            (RACETIME_ID, 2),
+            (RACETIME_ID, 3),
+        ]
+        assert other.racetime_api.fetched == []
+
+    async def test_resume_skips_races_shifted_by_new_races(
+        self, db, sample_organization
+    ):
+        """Races pushed onto a later page by newer races are not counted twice."""
+        user = await _racer(1, RACETIME_ID)
+        races = [_race("alttpr", "done") for _ in range(25)]
+        service = _service({RACETIME_ID: races})
+        lenient = await _verification(sample_organization, minimum_races=3)
+        strict = await _verification(sample_organization, role_id=11, minimum_races=30)
+
+        assert (await service.check_user_eligibility(user, lenient.id))[
+            "race_count"
+        ] == 10
+
+        # Three races finished since page 1 was loaded; page 2 now starts
+        # with the last three races of the old page 1
+        races[:0] = [_race("alttpr", "done") for _ in range(3)]
+        eligibility = await service.check_user_eligibility(user, strict.id)
+        assert eligibility["race_count"] == 25
+
+    async def test_counting_rules(self, db, sample_organization):
+        """Forfeits and disqualifications only count when enabled."""
+        user = await _racer(1, RACETIME_ID)
+        races = [
+            _race("alttpr", "done"),
+            _race("alttpr", "dnf"),
+            _race("alttpr", "dq"),
+            _race("smz3", "done"),
+            _race("alttpr", "done", racetime_id="someone-else"),
+        ]
+        service = _service({RACETIME_ID: races})
+        strict = await _verification(sample_organization, minimum_races=1)
+        lenient = await _verification(
+            sample_organization,
+            role_id=11,
+            minimum_races=1,
+            count_forfeits=True,
+            count_dq=True,
+        )
+
+        counts = await service.count_races(user, [strict, lenient])
+
+        assert counts == {strict.id: 1, lenient.id: 3}
+
+    async def test_unlinked_user_is_not_eligible(self, db, sample_organization):
+        """Users without a RaceTime account never reach the API."""
+        user = await _racer(1, None)
+        service = _service({})
+        verification = await _verification(sample_organization)
+
+        eligibility = await service.check_user_eligibility(user, verification.id)
+
+        assert eligibility["has_racetime_account"] is False
+        assert service.racetime_api.fetched == []
+
+    async def test_reverify_guild(self, db, sample_organization, monkeypatch):
+        """Each user is fetched once for all verifications; grants are retried."""
+        racer = await _racer(1, RACETIME_ID)
+        unlinked = await _racer(2, None)
+        service = _service(
+            {RACETIME_ID: [_race("alttpr", "done") for _ in range(15)]}
+        )
+        first = await _verification(sample_organization, minimum_races=2)
+        second = await _verification(sample_organization, role_id=11, minimum_races=12)
+        await _verification(sample_organization, guild_id=2, role_id=12)
+        for verification in (first, second):
+            await UserRacerVerification.create(
+                verification=verification, user=racer, is_verified=True
+            )
+        await UserRacerVerification.create(
+            verification=first, user=unlinked, is_verified=True, role_granted=True
+        )
+
+        granted = []
+
+        async def grant(user, guild_id, role_id):
+            granted.append((user.id, role_id))
+            return True
+
+        monkeypatch.setattr(service, "_grant_discord_role", grant)
+
+        result = await service.reverify_guild(1)
+
+        assert result.verifications == 2
+        assert result.users == 2
+        assert result.records == 3
+        assert result.roles_granted == 2
+        assert result.errors == 1
+        assert sorted(granted) == [(racer.id, 10), (racer.id, 11)]
+        assert service.racetime_api.fetched == [(RACETIME_ID, 1), (RACETIME_ID, 2)]
+
+        record = await UserRacerVerification.get(verification=second, user=racer)
+        assert record.race_count == 15
+        assert record.role_granted is True
+        assert record.last_checked_at is not None
+        record = await UserRacerVerification.get(user=unlinked)
+        assert record.last_check_error == "No RaceTime account linked"
@@ -0,0 +1,133 @@
+"""
+Tests for the request-scoped identity cache and query counter.
+
+Verifies that:
+1. Identity lookups are memoized inside a scope and uncached outside it
+2. Repeated policy checks in one request load member/role rows once
+3. Membership writes invalidate the scoped lookups
+4. The middleware reports query counts in debug mode
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from application.repositories.user_repository import UserRepository
+from application.services.authorization.authorization_service_v2 import (
+    AuthorizationServiceV2,
+)
+from application.services.organizations.organization_service import (
+    OrganizationService,
+)
+from application.utils.request_scope import (
+    get_request_scope,
+    install_query_counter,
+    request_scope,
+)
+from middleware.request_scope import RequestScopeMiddleware
+
+
+@pytest.fixture
+def counted_db(db):
+    """Database with the per-request query counter installed."""
+    install_query_counter()
+    return db
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestRequestScope:
+    """Test request-scoped memoization and query budgets."""
+
+    async def test_user_lookup_memoized_within_scope(self, counted_db, sample_user):
+        """The same user is loaded once per scope and fresh outside it."""
+        repo = UserRepository()
+
+        with request_scope("test") as scope:
+            first = await repo.get_by_id(sample_user.id)
+            second = await repo.get_by_id(sample_user.id)
+            assert await repo.get_by_id(-1) is None
+            assert await repo.get_by_id(-1) is None
+
+        assert first is second
+        assert scope.query_count == 2
+        assert scope.cache_hits == 2
+
+        outside = await repo.get_by_id(sample_user.id)
+        assert outside is not first
+        assert get_request_scope() is None
+
+    async def test_policy_checks_share_membership_load(
+        self, counted_db, sample_user, sample_organization
+    ):
+        """Several permission checks in one request stay within a query budget."""
+        service = OrganizationService()
+        await service.add_member(sample_organization.id, sample_user.id)
+        auth = AuthorizationServiceV2()
+        actions = ["tournament:create", "tournament:update", "member:manage"]
+
+        with request_scope("budget") as single:
+            await auth.can(
+                sample_user, actions[0], "tournament:*", sample_organization.id
+            )
+
+        with request_scope("budget") as repeated:
+            for action in actions:
+                await auth.can(
+                    sample_user, action, "tournament:*", sample_organization.id
+                )
+
+        # User, member and role assignments load once; only the direct user
+        # policy query runs per action
+        assert single.query_count <= 4
+        assert repeated.query_count <= single.query_count + len(actions) - 1
+
+    async def test_membership_write_invalidates_scope(
+        self, counted_db, sample_user, sample_organization
+    ):
+        """Adding a member is visible to later checks in the same request."""
+        service = OrganizationService()
+
+        with request_scope("invalidate"):
+            assert not await service.is_member(sample_user, sample_organization.id)
+            await service.add_member(sample_organization.id, sample_user.id)
+            assert await service.is_member(sample_user, sample_organization.id)
+
+    async def test_closed_scope_not_used_by_late_tasks(self, counted_db, sample_user):
+        """Tasks outliving the request stop using its scope."""
+        release = asyncio.Event()
+
+        async def late_lookup():
+            await release.wait()
+            return get_request_scope()
+
+        with request_scope("render"):
+            task = asyncio.create_task(late_lookup())
+            await asyncio.sleep(0)
+
+        release.set()
+        assert await task is None
+
+    async def test_middleware_reports_query_count(self, counted_db, sample_user):
+        """Debug responses carry the request's query count."""
+        app = FastAPI()
+        app.add_middleware(RequestScopeMiddleware)
+
+        @app.get("/user")
+        async def user_endpoint():
+            repo = UserRepository()
+            await repo.get_by_id(sample_user.id)
+            await repo.get_by_id(sample_user.id)
+            return {"ok": True}
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get("/user")
+
+        assert response.status_code == 200
+        assert response.headers["X-Query-Count"] == "1"
+        assert response.headers["X-Identity-Cache-Hits"] == "1"
@@ -0,0 +1,208 @@
+"""
+Integration tests for the pre-generated seed pool.
+
+Uses a local stub generator so no external randomizer API is called.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from models import PooledSeed, RandomizerPreset
+from modules.tournament.models.match_schedule import Tournament, Match
+from application.services.randomizer.randomizer_service import RandomizerResult
+from application.services.randomizer.seed_pool_service import SeedPoolService
+
+
+class StubGenerator:
+    """Local seed generator that records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, randomizer, settings_dict):
+        self.calls.append((randomizer, dict(settings_dict)))
+        hash_id = f"stub{len(self.calls)}"
+        return RandomizerResult(
+            url=f"https://example.com/{randomizer}/{hash_id}",
+            hash_id=hash_id,
+            settings=settings_dict,
+            randomizer=randomizer,
+            permalink=f"https://example.com/{randomizer}/{hash_id}",
+        )
+
+
+@pytest.fixture
+async def preset(db, sample_user):
+    """Create a public ALTTPR preset."""
+    return await RandomizerPreset.create(
+        user=sample_user,
+        randomizer="alttpr",
+        name="open",
+        settings={"settings": {"mode": "open", "goal": "ganon"}},
+        is_public=True,
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSeedPoolService:
+    """Test seed pool filling and claiming."""
+
+    async def test_claim_from_pool_then_live_fallback(self, db):
+        """Pooled seeds are handed out once, then generation falls back to live."""
+        generator = StubGenerator()
+        service = SeedPoolService(generator=generator)
+        settings = {"mode": "open"}
+
+        assert await service.fill("alttpr", settings, 2) == 2
+        first = await service.get_seed("alttpr", settings)
+        second = await service.get_seed("alttpr", settings)
+        third = await service.get_seed("alttpr", settings)
+
+        assert {first.hash_id, second.hash_id} == {"stub1", "stub2"}
+        assert third.hash_id == "stub3"
+        assert len(generator.calls) == 3
+        assert await PooledSeed.filter(claimed_at__isnull=True).count() == 0
+
+    async def test_settings_hash_separates_pools(self, db):
+        """Seeds are only claimed by requests with identical settings."""
+        service = SeedPoolService(generator=StubGenerator())
+        await service.fill("alttpr", {"mode": "open", "goal": "ganon"}, 1)
+
+        assert SeedPoolService.settings_hash(
+            {"goal": "ganon", "mode": "open"}
+        ) == SeedPoolService.settings_hash({"mode": "open", "goal": "ganon"})
+        assert (
+            await service.repository.claim(
+                "alttpr", SeedPoolService.settings_hash({"mode": "std"})
+            )
+            is None
+        )
+        assert (
+            await service.repository.claim(
+                "sm", SeedPoolService.settings_hash({"mode": "open"})
+            )
+            is None
+        )
+
+    async def test_concurrent_claims_never_share_a_seed(self, db):
+        """Concurrent claimers each receive a distinct seed."""
+        service = SeedPoolService(generator=StubGenerator())
+        settings = {"mode": "open"}
+        await service.fill("alttpr", settings, 3)
+        settings_hash = SeedPoolService.settings_hash(settings)
+
+        claimed = await asyncio.gather(
+            *(
+                service.repository.claim("alttpr", settings_hash=settings_hash)
+                for _ in range(5)
+            )
+        )
+
+        ids = [seed.id for seed in claimed if seed is not None]
+        assert len(ids) == 3
+        assert len(set(ids)) == 3
+
+    async def test_prefill_upcoming_matches(self, db, sample_organization, preset):
+        """Upcoming matches get a reserved seed using the selected preset."""
+        generator = StubGenerator()
+        service = SeedPoolService(generator=generator)
+        tournament = await Tournament.create(
+            organization=sample_organization,
+            name="Pooled",
+            randomizer="alttpr",
+            randomizer_preset=preset,
+        )
+        now = datetime.now(timezone.utc)
+        soon = await Match.create(
+            tournament=tournament, scheduled_at=now + timedelta(hours=1)
+        )
+        await Match.create(
+            tournament=tournament, scheduled_at=now + timedelta(hours=48)
+        )
+
+        assert await service.prefill_upcoming_matches(lookahead_hours=6) == 1
+        # Already reserved: nothing new is generated
+        assert await service.prefill_upcoming_matches(lookahead_hours=6) == 0
+        assert generator.calls == [("alttpr", {"mode": "open", "goal": "ganon"})]
+
+        # The match claims its reservation for the same settings
+        result = await service.get_seed(
+            "alttpr", {"goal": "ganon", "mode": "open"}, match_id=soon.id
+        )
+        assert result.hash_id == "stub1"
+        assert len(generator.calls) == 1
+
+    async def test_reservation_requires_matching_settings(
+        self, db, sample_organization, preset
+    ):
+        """A reservation rolled with other settings is released, not handed out."""
+        generator = StubGenerator()
+        service = SeedPoolService(generator=generator)
+        tournament = await Tournament.create(
+            organization=sample_organization,
+            name="Pooled",
+            randomizer="alttpr",
+            randomizer_preset=preset,
+        )
+        match = await Match.create(
+            tournament=tournament,
+            scheduled_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        assert await service.prefill_upcoming_matches(lookahead_hours=6) == 1
+
+        result = await service.get_seed("alttpr", {"mode": "std"}, match_id=match.id)
+        assert result.hash_id == "stub2"
+        assert await PooledSeed.filter(match_id=match.id).count() == 0
+
+    async def test_prefill_rerolls_after_preset_edit(
+        self, db, sample_organization, preset
+    ):
+        """Editing the preset replaces the stale reservation on the next prefill."""
+        generator = StubGenerator()
+        service = SeedPoolService(generator=generator)
+        tournament = await Tournament.create(
+            organization=sample_organization,
+            name="Pooled",
+            randomizer="alttpr",
+            randomizer_preset=preset,
+        )
+        match = await Match.create(
+            tournament=tournament,
+            scheduled_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        assert await service.prefill_upcoming_matches(lookahead_hours=6) == 1
+
+        preset.settings = {"settings": {"mode": "inverted", "goal": "ganon"}}
+        await preset.save()
+        assert await service.prefill_upcoming_matches(lookahead_hours=6) == 1
+
+        reserved = await PooledSeed.filter(match_id=match.id, claimed_at__isnull=True)
+        assert [seed.hash_id for seed in reserved] == ["stub2"]
+        assert generator.calls[-1] == ("alttpr", {"mode": "inverted", "goal": "ganon"})
+
+    async def test_top_up_popular_presets_and_stats(
+        self, db, sample_organization, preset, admin_user, sample_user
+    ):
+        """Popular public presets are kept warm and reported in pool stats."""
+        service = SeedPoolService(generator=StubGenerator())
+        await Tournament.create(
+            organization=sample_organization,
+            name="Uses preset",
+            randomizer="alttpr",
+            randomizer_preset=preset,
+        )
+
+        assert await service.top_up_popular_presets(preset_limit=5, depth=2) == 2
+        assert await service.top_up_popular_presets(preset_limit=5, depth=2) == 0
+
+        await service.get_seed("alttpr", {"mode": "open", "goal": "ganon"})
+
+        assert await service.get_pool_stats(sample_user) == []
+        stats = await service.get_pool_stats(admin_user)
+        assert len(stats) == 1
+        assert stats[0]["preset_name"] == "open"
+        assert stats[0]["available"] == 1
+        assert stats[0]["claimed"] == 1
+        assert stats[0]["avg_generation_ms"] >= 0
@@ -0,0 +1,119 @@
+"""
+Tests for cached settings and feature flag reads.
+
+Verifies that:
+1. Repeated reads are served from the cache
+2. Writes through the service invalidate the cache immediately
+3. Out-of-band edits show up once the TTL expires
+4. A load racing an invalidation does not store the stale value
+"""
+
+import asyncio
+
+import pytest
+
+from application.services.core.settings_service import SettingsService
+from application.services.organizations.feature_flag_service import (
+    FeatureFlagService,
+)
+from application.utils.feature_flags import is_enabled
+from application.utils.versioned_cache import VersionedCache
+from models import FeatureFlag, GlobalSetting
+from models.user import Permission
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestVersionedCache:
+    """Test the cache without a database."""
+
+    async def test_invalidation_during_load_is_not_stored(self):
+        """A value loaded before an invalidation is returned but not cached."""
+        cache = VersionedCache("test", ttl_seconds=60)
+        loads = []
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader():
+            loads.append(1)
+            started.set()
+            await release.wait()
+            return "stale"
+
+        task = asyncio.create_task(cache.get_or_load("global", "key", slow_loader))
+        await started.wait()
+        cache.invalidate("global")
+        release.set()
+        assert await task == "stale"
+
+        async def fresh_loader():
+            return "fresh"
+
+        assert await cache.get_or_load("global", "key", fresh_loader) == "fresh"
+        assert await cache.get_or_load("global", "key", slow_loader) == "fresh"
+        assert len(loads) == 1
+
+    async def test_ttl_expiry_reloads(self):
+        """Expired entries are reloaded; a zero TTL disables caching."""
+        values = iter(["first", "second", "third"])
+
+        async def loader():
+            return next(values)
+
+        cache = VersionedCache("test", ttl_seconds=60)
+        assert await cache.get_or_load(1, "key", loader) == "first"
+        assert await cache.get_or_load(1, "key", loader) == "first"
+        cache.ttl_seconds = 0
+        assert await cache.get_or_load(1, "key", loader) == "second"
+        assert cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSettingsCache:
+    """Test cached settings and feature flags against the database."""
+
+    async def test_global_setting_write_invalidates(self, db):
+        """set_global is visible immediately; direct edits wait for the TTL."""
+        service = SettingsService()
+        await service.set_global("motd_text", "Hello")
+        assert (await service.get_global("motd_text"))["value"] == "Hello"
+
+        # Out-of-band edit: served from cache until invalidated
+        await GlobalSetting.filter(key="motd_text").update(value="Edited")
+        assert (await service.get_global("motd_text"))["value"] == "Hello"
+
+        await service.set_global("motd_text", "Updated")
+        assert (await service.get_global("motd_text"))["value"] == "Updated"
+
+        await service.delete_global("motd_text")
+        assert await service.get_global("motd_text") is None
+
+    async def test_org_setting_falls_back_to_global(self, db, sample_organization):
+        """Org overrides are cached per organization and invalidated on write."""
+        service = SettingsService()
+        await service.set_global("theme", "dark")
+        assert await service.get_effective("theme", sample_organization.id) == "dark"
+
+        await service.set_org(sample_organization.id, "theme", "light")
+        assert await service.get_effective("theme", sample_organization.id) == "light"
+
+        await service.delete_org(sample_organization.id, "theme")
+        assert await service.get_effective("theme", sample_organization.id) == "dark"
+
+    async def test_feature_flag_toggle_invalidates(
+        self, db, sample_organization, admin_user
+    ):
+        """Enabling and disabling a flag is reflected in cached checks."""
+        admin_user.permission = Permission.SUPERADMIN
+        service = FeatureFlagService()
+        org_id = sample_organization.id
+
+        assert not await is_enabled(org_id, FeatureFlag.LIVE_RACES)
+
+        await service.enable_feature(org_id, FeatureFlag.LIVE_RACES, admin_user)
+        assert await is_enabled(org_id, FeatureFlag.LIVE_RACES)
+        assert await service.get_enabled_features(org_id) == [FeatureFlag.LIVE_RACES]
+
+        await service.disable_feature(org_id, FeatureFlag.LIVE_RACES, admin_user)
+        assert not await is_enabled(org_id, FeatureFlag.LIVE_RACES)
@@ -0,0 +1,199 @@
+"""
+Integration tests for batched SpeedGaming identity resolution.
+
+Covers the resolution priority (Discord ID, username, placeholder upgrade,
+creation), bulk membership creation and the per-run identity map, plus a full
+episode import through SpeedGamingETLService.
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from models import User
+from models.organizations import OrganizationMember
+from modules.tournament.models.match_schedule import (
+    Tournament,
+    MatchPlayers,
+    TournamentPlayers,
+    Crew,
+    CrewRole,
+)
+from application.services.speedgaming.speedgaming_identity_resolver import (
+    SpeedGamingIdentityResolver,
+    parse_discord_username,
+)
+from application.services.speedgaming.speedgaming_etl_service import (
+    SpeedGamingETLService,
+)
+from application.services.speedgaming.speedgaming_service import (
+    SpeedGamingEpisode,
+    SpeedGamingPlayer,
+    SpeedGamingCrewMember,
+    SpeedGamingMatch,
+    SpeedGamingEvent,
+)
+
+
+def make_player(sg_id, discord_id=None, discord_tag=None, name=None):
+    """Build a SpeedGaming player for tests."""
+    return SpeedGamingPlayer(
+        id=sg_id,
+        display_name=name or f"player{sg_id}",
+        discord_id=discord_id,
+        discord_tag=discord_tag,
+        public_stream=None,
+        streaming_from=None,
+    )
+
+
+def make_crew(sg_id, discord_id=None, approved=True):
+    """Build a SpeedGaming crew member for tests."""
+    return SpeedGamingCrewMember(
+        id=sg_id,
+        display_name=f"crew{sg_id}",
+        discord_id=discord_id,
+        discord_tag=None,
+        language="en",
+        ready=True,
+        approved=approved,
+        public_stream=None,
+    )
+
+
+def test_parse_discord_username():
+    """Discord tags are reduced to their username portion."""
+    assert parse_discord_username("Synack#1337") == "Synack"
+    assert parse_discord_username("synack") == "synack"
+    assert parse_discord_username("#0000") is None
+    assert parse_discord_username(None) is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSpeedGamingIdentityResolver:
+    """Test batched identity resolution."""
+
+    async def test_resolution_priority(self, db, sample_organization):
+        """Each person resolves via the same priority as the per-person lookup."""
+        by_discord = await User.create(discord_id=1001, discord_username="byid")
+        by_name = await User.create(discord_id=1002, discord_username="Named")
+        placeholder = await User.create(
+            discord_id=None,
+            discord_username="sg_30",
+            display_name="old",
+            is_placeholder=True,
+            speedgaming_id=30,
+        )
+
+        resolver = SpeedGamingIdentityResolver(sample_organization.id)
+        players = [
+            make_player(10, discord_id="1001"),
+            make_player(20, discord_tag="Named#1234"),
+            make_player(30, discord_id="1003", discord_tag="Upgraded#0001"),
+            make_player(40),
+            make_player(50, discord_id="1005", discord_tag="Fresh#0001"),
+        ]
+        await resolver.resolve(players=players)
+
+        assert resolver.get_user(resolver.PLAYER, players[0]).id == by_discord.id
+        assert resolver.get_user(resolver.PLAYER, players[1]).id == by_name.id
+
+        upgraded = await User.get(id=placeholder.id)
+        assert resolver.get_user(resolver.PLAYER, players[2]).id == placeholder.id
+        assert upgraded.discord_id == 1003
+        assert upgraded.discord_username == "Upgraded"
+        assert upgraded.is_placeholder is False
+
+        new_placeholder = resolver.get_user(resolver.PLAYER, players[3])
+        assert new_placeholder.id is not None
+        assert new_placeholder.is_placeholder is True
+        assert new_placeholder.discord_username == "sg_40"
+
+        new_full = resolver.get_user(resolver.PLAYER, players[4])
+        assert new_full.discord_id == 1005
+        assert new_full.discord_username == "Fresh"
+
+        member_ids = set(
+            await OrganizationMember.filter(
+                organization_id=sample_organization.id
+            ).values_list("user_id", flat=True)
+        )
+        assert member_ids == {resolver.get_user(resolver.PLAYER, p).id for p in players}
+
+    async def test_identity_map_and_duplicates(self, db, sample_organization):
+        """A person seen twice in a run is only created and added once."""
+        resolver = SpeedGamingIdentityResolver(sample_organization.id)
+        player = make_player(60, discord_id="2001")
+        crew = make_crew(60, discord_id="2001")
+
+        await resolver.resolve(players=[player, player], crew=[crew])
+        first = resolver.get_user(resolver.PLAYER, player)
+        assert resolver.get_user(resolver.CREW, crew).id == first.id
+
+        await resolver.resolve(players=[player])
+        assert resolver.get_user(resolver.PLAYER, player) is first
+
+        assert await User.filter(discord_id=2001).count() == 1
+        assert (
+            await OrganizationMember.filter(
+                organization_id=sample_organization.id, user_id=first.id
+            ).count()
+            == 1
+        )
+
+    async def test_placeholder_display_name_refresh(self, db, sample_organization):
+        """Existing placeholders get their display name refreshed."""
+        placeholder = await User.create(
+            discord_id=None,
+            discord_username="sg_crew_70",
+            display_name="stale",
+            is_placeholder=True,
+            speedgaming_id=70,
+        )
+        resolver = SpeedGamingIdentityResolver(sample_organization.id)
+        crew = make_crew(70)
+
+        user = await resolver.get_or_resolve(resolver.CREW, crew)
+
+        assert user.id == placeholder.id
+        assert (await User.get(id=placeholder.id)).display_name == "crew70"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_import_episode_uses_batched_resolution(db, sample_organization):
+    """Importing a new episode creates match players, crew and registrations."""
+    tournament = await Tournament.create(
+        organization=sample_organization, name="SG Tournament"
+    )
+    episode = SpeedGamingEpisode(
+        id=777,
+        title="Batched",
+        when=datetime(2030, 1, 1, 18, 0, 0, tzinfo=timezone.utc),
+        approved=True,
+        length=60,
+        match1=SpeedGamingMatch(
+            id=1,
+            title="Standard",
+            players=[make_player(1, discord_id="3001"), make_player(2)],
+        ),
+        match2=None,
+        event=SpeedGamingEvent(
+            id=1, name="Event", slug="event", game="Game", active=True
+        ),
+        channels=[],
+        commentators=[make_crew(3, discord_id="3003"), make_crew(4, approved=False)],
+        trackers=[make_crew(1, discord_id="3001")],
+        broadcasters=[],
+    )
+
+    match = await SpeedGamingETLService().import_episode(tournament, episode)
+
+    assert match is not None
+    assert await MatchPlayers.filter(match=match).count() == 2
+    assert await TournamentPlayers.filter(tournament=tournament).count() == 2
+    crew = await Crew.filter(match=match).order_by("role")
+    assert [c.role for c in crew] == [CrewRole.COMMENTATOR, CrewRole.TRACKER]
+    # The tracker is the same person as the first player
+    player_user = await User.get(discord_id=3001)
+    assert crew[1].user_id == player_user.id
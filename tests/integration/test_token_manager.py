@@ -0,0 +1,179 @@
+"""
+Tests for the OAuth token manager.
+
+Verifies that:
+1. Concurrent refreshes of the same token share one provider round trip
+2. A caller holding a user loaded before a refresh picks up the new tokens
+   instead of refreshing again
+3. When running, tokens close to expiry are refreshed in the background and
+   callers do not wait
+4. Failed background refreshes are recorded until new tokens are stored
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from application.services.core.token_manager import DISCORD, TokenManager
+from application.services.core.user_service import UserService
+from models import User
+
+
+class FakeRefresh:
+    """Stands in for UserService.refresh_discord_token, counting calls."""
+
+    def __init__(self, delay: float = 0.01, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, service, user):
+        self.calls += 1
+        await self.release.wait()
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        user.discord_access_token = f"access-{self.calls}"
+        user.discord_refresh_token = f"refresh-{self.calls}"
+        user.discord_token_expires_at = datetime.now(timezone.utc) + timedelta(days=7)
+        await user.save(
+            update_fields=[
+                "discord_access_token",
+                "discord_refresh_token",
+                "discord_token_expires_at",
+            ]
+        )
+        return user
+
+    def install(self, monkeypatch) -> "FakeRefresh":
+        monkeypatch.setattr(
+            UserService,
+            "refresh_discord_token",
+            lambda service, user: self(service, user),
+        )
+        return self
+
+
+@pytest.fixture
+def fake_refresh(monkeypatch):
+    return FakeRefresh().install(monkeypatch)
+
+
+@pytest.fixture
+async def expiring_user(sample_user):
+    """A user whose Discord token expires in two minutes."""
+    sample_user.discord_access_token = "access-0"
+    sample_user.discord_refresh_token = "refresh-0"
+    sample_user.discord_token_expires_at = datetime.now(timezone.utc) + timedelta(
+        minutes=2
+    )
+    await sample_user.save()
+    return sample_user
+
+
+@pytest.fixture
+async def manager():
+    manager = TokenManager(lead_seconds=600)
+    yield manager
+    await manager.stop()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestTokenManager:
+    """Test single-flight and proactive refresh."""
+
+    async def test_concurrent_refreshes_share_one_call(
+        self, manager, expiring_user, fake_refresh
+    ):
+        """Five page loads with their own User copies refresh once."""
+        copies = [await User.get(id=expiring_user.id) for _ in range(5)]
+
+        await asyncio.gather(*(manager.ensure_valid(DISCORD, u) for u in copies))
+
+        assert fake_refresh.calls == 1
+        assert {u.discord_access_token for u in copies} == {"access-1"}
+        stats = manager.get_stats()
+        assert stats["refreshes"] == 1
+        assert stats["coalesced"] == 4
+
+    async def test_stale_user_reloads_rotated_tokens(
+        self, manager, expiring_user, fake_refresh
+    ):
+        """A user loaded before a refresh never refreshes with the old token."""
+        stale = await User.get(id=expiring_user.id)
+        await manager.ensure_valid(DISCORD, expiring_user)
+
+        await manager.ensure_valid(DISCORD, stale)
+
+        assert fake_refresh.calls == 1
+        assert stale.discord_refresh_token == "refresh-1"
+
+    async def test_background_refresh_does_not_block(
+        self, manager, expiring_user, fake_refresh
+    ):
+        """While running, a token inside the lead time is refreshed behind the caller."""
+        await manager.start()
+        fake_refresh.release.clear()
+
+        user = await asyncio.wait_for(
+            manager.ensure_valid(DISCORD, expiring_user), timeout=1
+        )
+        assert user.discord_access_token == "access-0"
+        assert manager.get_stats()["in_flight"] == 1
+
+        fake_refresh.release.set()
+        for _ in range(50):
+            if manager.get_stats()["refreshes"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert fake_refresh.calls == 1
+        assert (await User.get(id=user.id)).discord_access_token == "access-1"
+
+    async def test_refresh_due_skips_idle_and_refreshed_tokens(
+        self, manager, expiring_user, fake_refresh, monkeypatch
+    ):
+        """The background scan refreshes tokens in use and drops idle ones."""
+        manager.track(DISCORD, expiring_user)
+        assert await manager.refresh_due() == 1
+        await asyncio.sleep(0.05)
+        assert fake_refresh.calls == 1
+
+        # Fresh token: nothing to do
+        assert await manager.refresh_due() == 0
+
+        # Idle token inside the lead time leaves the index
+        monkeypatch.setattr(
+            "application.services.core.token_manager.settings.TOKEN_REFRESH_ACTIVE_SECONDS",
+            -1,
+        )
+        expiring_user.discord_token_expires_at = datetime.now(timezone.utc) + timedelta(
+            minutes=1
+        )
+        manager.track(DISCORD, expiring_user)
+        assert await manager.refresh_due() == 0
+        assert manager.get_stats()["tracked"][DISCORD] == 0
+
+    async def test_failed_refresh_is_recorded(
+        self, manager, expiring_user, monkeypatch
+    ):
+        """A failed refresh is reported until new tokens are stored."""
+        FakeRefresh(error=ValueError("revoked")).install(monkeypatch)
+        await manager.start()
+
+        manager.refresh_soon(DISCORD, expiring_user)
+        for _ in range(50):
+            if manager.refresh_error(DISCORD, expiring_user.id):
+                break
+            await asyncio.sleep(0.01)
+
+        assert manager.refresh_error(DISCORD, expiring_user.id) == "revoked"
+        # No retry storm while the failure stands
+        assert manager.refresh_soon(DISCORD, expiring_user) is False
+
+        manager.track(DISCORD, expiring_user)
+        assert manager.refresh_error(DISCORD, expiring_user.id) is None
@@ -0,0 +1,152 @@
+"""
+Tests for buffered tournament usage tracking and retention cleanup.
+
+Verifies that:
+1. Buffered accesses collapse to one pending entry per user-tournament pair
+2. A flush upserts existing rows instead of creating duplicates
+3. Excess-per-user cleanup keeps only the most recent N rows per user
+4. A bad entry is dropped alone; stopping never loses a flush in progress
+"""
+
+import asyncio
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from models import TournamentUsage
+from modules.tournament.models.match_schedule import Tournament
+from modules.tournament.repositories.tournament_usage_repository import (
+    TournamentUsageRepository,
+)
+from modules.tournament.services.tournament_usage_buffer import TournamentUsageBuffer
+from modules.tournament.services.tournament_usage_service import (
+    TournamentUsageService,
+)
+
+
+async def _tournaments(organization, count):
+    return [
+        await Tournament.create(organization=organization, name=f"Tournament {i}")
+        for i in range(count)
+    ]
+
+
+def _record(buffer, user, tournament, organization, organization_name=None):
+    buffer.record(
+        user_id=user.id,
+        tournament_id=tournament.id,
+        organization_id=organization.id,
+        organization_name=organization_name or organization.name,
+        tournament_name=tournament.name,
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestTournamentUsage:
+    """Test the write-behind usage buffer and set-based cleanup."""
+
+    async def test_buffer_flush_upserts_last_write(
+        self, db, sample_user, sample_organization
+    ):
+        """Repeated accesses collapse in the buffer and update in place."""
+        first, second = await _tournaments(sample_organization, 2)
+        buffer = TournamentUsageBuffer(flush_interval=60)
+
+        _record(buffer, sample_user, first, sample_organization, "Old Name")
+        _record(buffer, sample_user, first, sample_organization, "New Name")
+        _record(buffer, sample_user, second, sample_organization)
+        assert buffer.pending_count == 2
+
+        assert await buffer.flush() == 2
+        assert buffer.pending_count == 0
+        assert await buffer.flush() == 0
+
+        _record(buffer, sample_user, first, sample_organization, "Renamed")
+        assert await buffer.flush() == 1
+
+        usages = await TournamentUsage.filter(user=sample_user).order_by(
+            "tournament_id"
+        )
+        assert [u.tournament_id for u in usages] == [first.id, second.id]
+        assert usages[0].organization_name == "Renamed"
+
+    async def test_bad_entry_is_dropped(self, db, sample_user, sample_organization):
+        """An entry for a deleted tournament does not block the others."""
+        kept, deleted = await _tournaments(sample_organization, 2)
+        buffer = TournamentUsageBuffer(flush_interval=60)
+        _record(buffer, sample_user, kept, sample_organization)
+        _record(buffer, sample_user, deleted, sample_organization)
+        await deleted.delete()
+
+        assert await buffer.flush() == 1
+        assert buffer.pending_count == 0
+        usages = await TournamentUsage.filter(user=sample_user)
+        assert [u.tournament_id for u in usages] == [kept.id]
+
+    async def test_stop_completes_flush_in_progress(
+        self, db, sample_user, sample_organization
+    ):
+        """Stopping while a flush is writing waits for it instead of dropping it."""
+        (tournament,) = await _tournaments(sample_organization, 1)
+        buffer = TournamentUsageBuffer(flush_interval=60)
+        upsert = buffer.repository.upsert_usage_batch
+        writing = asyncio.Event()
+
+        async def slow_upsert(entries):
+            writing.set()
+            await asyncio.sleep(0.1)
+            return await upsert(entries)
+
+        buffer.repository.upsert_usage_batch = slow_upsert
+        await buffer.start()
+        _record(buffer, sample_user, tournament, sample_organization)
+        buffer.wake()
+        await writing.wait()
+        assert buffer.pending_count == 0
+
+        await buffer.stop()
+        assert await TournamentUsage.filter(user=sample_user).count() == 1
+
+    async def test_track_access_flushes_when_buffer_not_running(
+        self, db, sample_user, sample_organization
+    ):
+        """Without the background loop, tracking writes through immediately."""
+        (tournament,) = await _tournaments(sample_organization, 1)
+        service = TournamentUsageService()
+
+        await service.track_tournament_access(
+            sample_user, tournament, sample_organization.id, sample_organization.name
+        )
+
+        recent = await service.get_recent_tournaments(sample_user)
+        assert [r["tournament_id"] for r in recent] == [tournament.id]
+
+    async def test_cleanup_keeps_most_recent_per_user(
+        self, db, sample_user, admin_user, sample_organization
+    ):
+        """Only the newest keep_per_user rows survive for each user."""
+        tournaments = await _tournaments(sample_organization, 4)
+        now = datetime.now(timezone.utc)
+        for user in (sample_user, admin_user):
+            for age, tournament in enumerate(tournaments):
+                usage = await TournamentUsage.create(
+                    user=user,
+                    tournament=tournament,
+                    organization_id=sample_organization.id,
+                    organization_name=sample_organization.name,
+                    tournament_name=tournament.name,
+                )
+                # auto_now overrides last_accessed on save, so age it directly
+                await TournamentUsage.filter(id=usage.id).update(
+                    last_accessed=now - timedelta(hours=age)
+                )
+
+        deleted = await TournamentUsageRepository().cleanup_excess_per_user(2)
+
+        assert deleted == 4
+        for user in (sample_user, admin_user):
+            kept = await TournamentUsage.filter(user=user).values_list(
+                "tournament_id", flat=True
+            )
+            assert sorted(kept) == sorted(t.id for t in tournaments[:2])
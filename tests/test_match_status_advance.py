@@ -252,10 +252,11 @@ async def test_sync_racetime_room_status(db):
 
     mock_session = AsyncMock()
     mock_session.get = lambda url: mock_get
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=None)
 
-    with patch("aiohttp.ClientSession", return_value=mock_session):
+    with patch(
+        "modules.tournament.services.tournament_service.get_session",
+        return_value=mock_session,
+    ):
         # Sync status from RaceTime
         result = await service.sync_racetime_room_status(
             user=admin_user, organization_id=org.id, match_id=match.id
@@ -322,10 +323,11 @@ async def test_sync_racetime_cancelled_unlinks_room(db):
 
     mock_session = AsyncMock()
     mock_session.get = lambda url: mock_get
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=None)
 
-    with patch("aiohttp.ClientSession", return_value=mock_session):
+    with patch(
+        "modules.tournament.services.tournament_service.get_session",
+        return_value=mock_session,
+    ):
         # Sync status from RaceTime - race is cancelled
         result = await service.sync_racetime_room_status(
             user=admin_user, organization_id=org.id, match_id=match.id
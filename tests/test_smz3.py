@@ -23,8 +23,10 @@ async def test_smz3_service_generate():
         "goal": "defeatBoth",
     }
 
-    # Mock the httpx client
-    with patch("httpx.AsyncClient") as mock_client:
+    # Mock the shared randomizer HTTP client
+    with patch(
+        "application.services.randomizer.smz3_service.get_randomizer_client"
+    ) as mock_client:
         mock_response = MagicMock()
         mock_response.json.return_value = {
             "slug": "test-slug-123",
@@ -32,11 +34,7 @@ async def test_smz3_service_generate():
         }
         mock_response.raise_for_status = MagicMock()
 
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
-        mock_client.return_value = mock_context
+        mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
         result = await service.generate(
             settings=settings, tournament=True, spoilers=False
@@ -59,8 +57,10 @@ async def test_smz3_service_generate_with_spoiler():
         "goal": "defeatBoth",
     }
 
-    # Mock the httpx client
-    with patch("httpx.AsyncClient") as mock_client:
+    # Mock the shared randomizer HTTP client
+    with patch(
+        "application.services.randomizer.smz3_service.get_randomizer_client"
+    ) as mock_client:
         mock_response = MagicMock()
         mock_response.json.return_value = {
             "slug": "test-slug-123",
@@ -68,11 +68,7 @@ async def test_smz3_service_generate_with_spoiler():
         }
         mock_response.raise_for_status = MagicMock()
 
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
-        mock_client.return_value = mock_context
+        mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
         result = await service.generate(
             settings=settings, tournament=False, spoilers=True, spoiler_key="test-key"
@@ -0,0 +1,78 @@
+"""
+Tests for the static asset manifest.
+
+Verifies that:
+1. Every static file gets a content hash and versioned URL
+2. A written manifest is loaded instead of re-hashing
+3. Watching manifests pick up edited files
+"""
+
+import json
+import os
+
+import pytest
+
+from application.utils import asset_manifest
+from application.utils.asset_manifest import (
+    FALLBACK_VERSION,
+    AssetManifest,
+    hash_file,
+)
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """A small static directory."""
+    (tmp_path / "css").mkdir()
+    (tmp_path / "js" / "core").mkdir(parents=True)
+    (tmp_path / "css" / "main.css").write_text("body { color: red; }")
+    (tmp_path / "js" / "core" / "dark-mode.js").write_text("console.log(1);")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestAssetManifest:
+    """Test building, loading and watching the manifest."""
+
+    def test_build_hashes_all_files(self, static_dir):
+        """Versions are content hashes; unknown files fall back."""
+        manifest = AssetManifest(static_dir)
+
+        versions = manifest.build()
+
+        assert set(versions) == {"css/main.css", "js/core/dark-mode.js"}
+        assert versions["css/main.css"] == hash_file(static_dir / "css" / "main.css")
+        assert manifest.url("css/main.css") == (
+            f"/static/css/main.css?v={versions['css/main.css']}"
+        )
+        assert manifest.version("missing.js") == FALLBACK_VERSION
+        assert manifest.is_current("css/main.css", versions["css/main.css"])
+        assert not manifest.is_current("css/main.css", "stale")
+
+    def test_written_manifest_is_loaded(self, static_dir, monkeypatch):
+        """A prebuilt manifest is used without hashing files at runtime."""
+        assert AssetManifest(static_dir).write() == 2
+        written = json.loads((static_dir / "manifest.json").read_text())
+
+        def fail(path):
+            raise AssertionError("files should not be hashed")
+
+        monkeypatch.setattr(asset_manifest, "hash_file", fail)
+        manifest = AssetManifest(static_dir)
+        assert manifest.version("css/main.css") == written["css/main.css"]
+
+    def test_watch_rehashes_changed_files(self, static_dir, monkeypatch):
+        """In watch mode edits are picked up after the recheck interval."""
+        monkeypatch.setattr(asset_manifest, "DEV_RECHECK_SECONDS", 0)
+        manifest = AssetManifest(static_dir, watch=True)
+        before = manifest.version("css/main.css")
+        unchanged = manifest.version("js/core/dark-mode.js")
+
+        css = static_dir / "css" / "main.css"
+        css.write_text("body { color: blue; }")
+        stat = css.stat()
+        # Ensure the mtime differs even on coarse-grained filesystems
+        os.utime(css, (stat.st_atime, stat.st_mtime + 5))
+
+        assert manifest.version("css/main.css") != before
+        assert manifest.version("js/core/dark-mode.js") == unchanged
@@ -56,9 +56,11 @@ class TestAvianartService:
         self, service, mock_generate_response, mock_permlink_response_finished
     ):
         """Test successful seed generation."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(
+            "application.services.randomizer.avianart_service.get_randomizer_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             # Mock the post request (initial generation)
             mock_post_response = AsyncMock()
@@ -103,9 +105,11 @@ class TestAvianartService:
         self, service, mock_generate_response, mock_permlink_response_failure
     ):
         """Test handling of failure status from API."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(
+            "application.services.randomizer.avianart_service.get_randomizer_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             # Mock the post request
             mock_post_response = AsyncMock()
@@ -129,9 +133,11 @@ class TestAvianartService:
         self, service, mock_generate_response, mock_permlink_response_generating
     ):
         """Test timeout when seed generation takes too long."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(
+            "application.services.randomizer.avianart_service.get_randomizer_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             # Mock the post request
             mock_post_response = AsyncMock()
@@ -157,9 +163,11 @@ class TestAvianartService:
         self, service, mock_generate_response, mock_permlink_response_finished
     ):
         """Test generation with race=False."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(
+            "application.services.randomizer.avianart_service.get_randomizer_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             # Mock the post request
             mock_post_response = AsyncMock()
@@ -0,0 +1,59 @@
+"""
+Tests for the table data providers used by PaginatedTable.
+
+Rendering requires a NiceGUI client, so these tests cover the provider
+contract and page arithmetic only.
+"""
+
+import pytest
+
+from components.data_table import (
+    CallbackDataProvider,
+    ListDataProvider,
+    PaginatedTable,
+    TableColumn,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDataProviders:
+    """Test count/fetch windows."""
+
+    async def test_list_provider_windows(self):
+        """ListDataProvider slices in-memory rows."""
+        provider = ListDataProvider(range(7))
+
+        assert await provider.count() == 7
+        assert list(await provider.fetch(0, 3)) == [0, 1, 2]
+        assert list(await provider.fetch(6, 3)) == [6]
+        assert list(await provider.fetch(9, 3)) == []
+
+    async def test_callback_provider_delegates(self):
+        """CallbackDataProvider forwards offset and limit to its callables."""
+        calls = []
+
+        async def count():
+            return 120
+
+        async def fetch(offset, limit):
+            calls.append((offset, limit))
+            return [offset]
+
+        provider = CallbackDataProvider(count=count, fetch=fetch)
+
+        assert await provider.count() == 120
+        assert await provider.fetch(50, 25) == [50]
+        assert calls == [(50, 25)]
+
+
+@pytest.mark.unit
+def test_page_count():
+    """Page count rounds up and is never below one."""
+    table = PaginatedTable([TableColumn("ID", key="id")], ListDataProvider([]), 25)
+
+    assert table.page_count == 1
+    table.total = 25
+    assert table.page_count == 1
+    table.total = 26
+    assert table.page_count == 2
@@ -0,0 +1,135 @@
+"""
+Tests for the shared Discord interaction helpers.
+
+Verifies that:
+1. Slow handlers are deferred automatically before Discord's deadline
+2. respond() switches to a followup once the interaction is acknowledged
+3. Per-command latency is recorded
+4. Qualifier context (qualifier, user, membership) is loaded together
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from application.services.organizations.organization_service import (
+    OrganizationService,
+)
+from discordbot import interactions
+from discordbot.interactions import (
+    InteractionMetrics,
+    defer,
+    interaction_handler,
+    load_qualifier_context,
+    respond,
+)
+from models.organizations import Organization
+from modules.async_qualifier.models.async_qualifier import AsyncQualifier
+
+
+def make_interaction(channel_id: int = 1, user_id: int = 1) -> MagicMock:
+    """Create a mock interaction whose response tracks acknowledgement."""
+    interaction = MagicMock(spec=discord.Interaction)
+    interaction.channel_id = channel_id
+    interaction.user = MagicMock(id=user_id)
+    interaction.followup = AsyncMock()
+
+    response = MagicMock()
+    done = {"value": False}
+    response.is_done = lambda: done["value"]
+
+    async def acknowledge(*args, **kwargs):
+        done["value"] = True
+
+    response.defer = AsyncMock(side_effect=acknowledge)
+    response.send_message = AsyncMock(side_effect=acknowledge)
+    interaction.response = response
+    return interaction
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Fresh interaction metrics."""
+    fresh = InteractionMetrics()
+    monkeypatch.setattr(interactions, "_metrics", fresh)
+    return fresh
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInteractionHandler:
+    """Test deferral, responses and metrics."""
+
+    async def test_slow_handler_is_auto_deferred(self, monkeypatch, metrics):
+        """A handler that has not answered in time is deferred for it."""
+        monkeypatch.setattr(interactions, "DEFER_AFTER_SECONDS", 0.01)
+        interaction = make_interaction()
+
+        @interaction_handler("slow")
+        async def handler(interaction):
+            await asyncio.sleep(0.05)
+            await respond(interaction, "done", ephemeral=True)
+
+        await handler(interaction)
+
+        interaction.response.defer.assert_awaited_once()
+        interaction.response.send_message.assert_not_awaited()
+        interaction.followup.send.assert_awaited_once_with("done", ephemeral=True)
+        stats = metrics.snapshot()["slow"]
+        assert stats["invocations"] == 1
+        assert stats["auto_deferred"] == 1
+
+    async def test_fast_handler_answers_directly(self, metrics):
+        """Handlers that answer in time use the initial response."""
+        interaction = make_interaction()
+
+        @interaction_handler("fast")
+        async def handler(interaction):
+            await respond(interaction, "hello", ephemeral=True)
+
+        await handler(interaction)
+        await defer(interaction)
+
+        interaction.response.send_message.assert_awaited_once_with(
+            "hello", ephemeral=True
+        )
+        interaction.response.defer.assert_not_awaited()
+        assert metrics.snapshot()["fast"]["auto_deferred"] == 0
+
+    async def test_errors_are_counted(self, metrics):
+        """Failing handlers are recorded and re-raised."""
+
+        @interaction_handler("broken")
+        async def handler(interaction):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await handler(make_interaction())
+        assert metrics.snapshot()["broken"]["errors"] == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_load_qualifier_context(db, sample_user):
+    """The channel's qualifier, the user and membership load together."""
+    org = await Organization.create(name="Test Org", slug="test-org")
+    await AsyncQualifier.create(
+        organization=org,
+        name="Qualifier",
+        discord_channel_id=555,
+        runs_per_pool=1,
+    )
+    interaction = make_interaction(channel_id=555, user_id=sample_user.discord_id)
+
+    context = await load_qualifier_context(interaction)
+    assert context.qualifier.name == "Qualifier"
+    assert context.user.id == sample_user.id
+    assert not context.is_member
+
+    await OrganizationService().add_member(org.id, sample_user.id)
+    assert (await load_qualifier_context(interaction)).is_member
+
+    missing = await load_qualifier_context(make_interaction(channel_id=1))
+    assert missing.qualifier is None
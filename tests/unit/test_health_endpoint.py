@@ -59,6 +59,7 @@ async def test_health_endpoint_with_valid_secret(db, mock_settings, client):
         assert data["services"]["discord"]["status"] == "ok"
         assert "racetime" in data["services"]
         assert data["services"]["racetime"]["status"] == "ok"
+        assert data["startup"]["first_health_ok_ms"] is not None
 
 
 @pytest.mark.asyncio
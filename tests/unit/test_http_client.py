@@ -0,0 +1,201 @@
+"""
+Tests for the shared randomizer HTTP client layer.
+
+Verifies that:
+1. 5xx responses and transport errors are retried; non-idempotent requests
+   only when the upstream cannot have accepted them
+2. The circuit breaker opens after consecutive failures and fails fast
+3. Per-request cookies are sent without leaking into the shared client
+4. Latency histograms report bucketed percentiles
+"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from application.utils import http_client
+from application.utils.http_client import (
+    CircuitOpenError,
+    LatencyHistogram,
+    get_randomizer_client,
+    get_randomizer_http_stats,
+)
+
+BASE_URL = "https://randomizer.example"
+
+
+@pytest.fixture
+async def mock_upstream():
+    """Route the shared pool for BASE_URL to a scripted mock transport."""
+    responses = []
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    http_client._stats.clear()
+    pool = http_client._get_host_pool(BASE_URL)
+    cookie_jar = pool.client.cookies.jar
+    await pool.client.aclose()
+    pool.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), cookies=cookie_jar
+    )
+
+    with patch.object(
+        http_client.settings, "RANDOMIZER_HTTP_RETRY_BACKOFF_SECONDS", 0
+    ), patch.object(
+        http_client.settings, "RANDOMIZER_HTTP_MAX_RETRIES", 2
+    ), patch.object(
+        http_client.settings, "RANDOMIZER_HTTP_BREAKER_THRESHOLD", 3
+    ):
+        yield responses, requests
+
+    await http_client.close_http_clients()
+    http_client._stats.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRandomizerHttpClient:
+    """Test retry, circuit breaking and metrics."""
+
+    async def test_retries_5xx_then_succeeds(self, mock_upstream):
+        """A 5xx followed by a 200 returns the successful response."""
+        responses, requests = mock_upstream
+        responses.extend([httpx.Response(503), httpx.Response(200, json={"ok": 1})])
+
+        response = await get_randomizer_client("alttpr").post(
+            f"{BASE_URL}/api/randomizer", json={}
+        )
+
+        assert response.status_code == 200
+        assert len(requests) == 2
+        stats = get_randomizer_http_stats()["alttpr"]
+        assert stats["requests"] == 2
+        assert stats["retries"] == 1
+        assert stats["failures"] == 1
+        assert stats["latency"]["count"] == 2
+
+    async def test_returns_last_5xx_after_retries(self, mock_upstream):
+        """Exhausted retries return the last 5xx so callers can raise_for_status."""
+        responses, requests = mock_upstream
+        responses.extend([httpx.Response(503)] * 3)
+
+        response = await get_randomizer_client("sm").get(f"{BASE_URL}/seed")
+
+        assert response.status_code == 503
+        assert len(requests) == 3
+
+    async def test_transport_error_raised_after_retries(self, mock_upstream):
+        """Transport errors are retried and re-raised on the final attempt."""
+        responses, _ = mock_upstream
+        responses.extend([httpx.ConnectError("refused")] * 3)
+
+        with pytest.raises(httpx.ConnectError):
+            await get_randomizer_client("ootr").get(f"{BASE_URL}/seed")
+
+    async def test_post_not_retried_after_upstream_accepted(self, mock_upstream):
+        """Read timeouts and 500s on a POST are not retried (no duplicate seeds)."""
+        responses, requests = mock_upstream
+        responses.extend([httpx.ReadTimeout("slow"), httpx.Response(500)])
+        client = get_randomizer_client("alttpr")
+
+        with pytest.raises(httpx.ReadTimeout):
+            await client.post(f"{BASE_URL}/api/randomizer", json={})
+        response = await client.post(f"{BASE_URL}/api/randomizer", json={})
+
+        assert response.status_code == 500
+        assert len(requests) == 2
+        assert get_randomizer_http_stats()["alttpr"]["retries"] == 0
+
+    async def test_post_not_retried_on_gateway_errors(self, mock_upstream):
+        """502 and 504 may hide an accepted request, so a POST is not repeated."""
+        responses, requests = mock_upstream
+        responses.extend([httpx.Response(502), httpx.Response(504)])
+        client = get_randomizer_client("smz3")
+
+        assert (await client.post(f"{BASE_URL}/seed")).status_code == 502
+        assert (await client.post(f"{BASE_URL}/seed")).status_code == 504
+        assert len(requests) == 2
+
+    async def test_post_retried_on_connect_errors(self, mock_upstream):
+        """A POST that never reached the upstream (or got a 503) is retried."""
+        responses, requests = mock_upstream
+        responses.extend(
+            [httpx.ConnectError("refused"), httpx.Response(503), httpx.Response(200)]
+        )
+
+        response = await get_randomizer_client("sm").post(f"{BASE_URL}/seed")
+
+        assert response.status_code == 200
+        assert len(requests) == 3
+
+    async def test_idempotent_post_opt_in(self, mock_upstream):
+        """Callers can opt a POST into full retry."""
+        responses, requests = mock_upstream
+        responses.extend([httpx.ReadTimeout("slow"), httpx.Response(200)])
+
+        response = await get_randomizer_client("ootr").post(
+            f"{BASE_URL}/seed", idempotent=True
+        )
+
+        assert response.status_code == 200
+        assert len(requests) == 2
+
+    async def test_circuit_opens_and_rejects(self, mock_upstream):
+        """Once the threshold is reached further requests fail fast."""
+        responses, requests = mock_upstream
+        responses.extend([httpx.Response(500)] * 3)
+
+        await get_randomizer_client("smz3").get(f"{BASE_URL}/seed", retries=2)
+        assert http_client.get_circuit_states()[BASE_URL]["open"] is True
+
+        with pytest.raises(CircuitOpenError):
+            await get_randomizer_client("smz3").post(f"{BASE_URL}/seed")
+        assert len(requests) == 3
+        assert get_randomizer_http_stats()["smz3"]["rejected"] == 1
+
+    async def test_cookies_are_per_request(self, mock_upstream):
+        """Cookies passed explicitly are sent; response cookies are not stored."""
+        responses, requests = mock_upstream
+        responses.extend(
+            [
+                httpx.Response(200, headers={"Set-Cookie": "sessionid=abc; Path=/"}),
+                httpx.Response(200),
+            ]
+        )
+        client = get_randomizer_client("bingosync")
+
+        await client.get(f"{BASE_URL}/", cookies={"csrftoken": "xyz"})
+        await client.get(f"{BASE_URL}/")
+
+        assert requests[0].headers["Cookie"] == "csrftoken=xyz"
+        assert "Cookie" not in requests[1].headers
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Test histogram bucketing."""
+
+    def test_percentiles_use_bucket_bounds(self):
+        """Percentiles report the upper bound of the containing bucket."""
+        histogram = LatencyHistogram()
+        for elapsed_ms in (50, 80, 300, 900, 70000):
+            histogram.observe(elapsed_ms)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 5
+        assert snapshot["p50_ms"] == 500
+        assert snapshot["p95_ms"] == 70000
+        assert snapshot["max_ms"] == 70000
+        assert snapshot["buckets"]["<=100ms"] == 2
+
+    def test_empty_histogram(self):
+        """An empty histogram reports no percentiles."""
+        snapshot = LatencyHistogram().snapshot()
+        assert snapshot["count"] == 0
+        assert snapshot["p95_ms"] is None
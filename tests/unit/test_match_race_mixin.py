@@ -139,6 +139,7 @@ class TestMatchRaceMixin:
         handler._first_data_update = True
         handler._bot_created_room = False
         handler._user_repository = MagicMock()
+        handler._phase_ms = {"db": 0.0, "listeners": 0.0}
 
         # Verify match_id is set
         assert handler.match_id == 123
@@ -0,0 +1,109 @@
+"""
+Tests for the pooled OAuth provider clients.
+
+Verifies that:
+1. Requests to a provider share one long-lived client
+2. Connection failures are retried, other transport errors are not
+3. Request, error and retry counts and latency are recorded per provider
+"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from application.utils import oauth_clients
+from application.utils.oauth_clients import (
+    DISCORD,
+    TWITCH,
+    get_oauth_client,
+    get_oauth_http_stats,
+)
+
+TOKEN_URL = "https://discord.example/api/oauth2/token"
+
+
+@pytest.fixture
+async def mock_provider():
+    """Route the pooled Discord client to a scripted mock transport."""
+    responses = []
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    oauth_clients._stats.clear()
+    await oauth_clients._get_pooled_client(DISCORD).aclose()
+    oauth_clients._clients.pooled[DISCORD] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    with patch.object(
+        oauth_clients.settings, "OAUTH_HTTP_RETRY_BACKOFF_SECONDS", 0
+    ), patch.object(oauth_clients.settings, "OAUTH_HTTP_CONNECT_RETRIES", 2):
+        yield responses, requests
+
+    await oauth_clients.close_oauth_clients()
+    oauth_clients._stats.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestOAuthClients:
+    """Test pooling, retry and metrics."""
+
+    async def test_provider_client_is_reused(self):
+        """Every call for a provider goes through the same pooled client."""
+        first = oauth_clients._get_pooled_client(DISCORD)
+
+        assert oauth_clients._get_pooled_client(DISCORD) is first
+        assert oauth_clients._get_pooled_client(TWITCH) is not first
+        await oauth_clients.close_oauth_clients()
+        assert first.is_closed
+
+    async def test_connect_errors_are_retried(self, mock_provider):
+        """A request that never reached the provider is sent again."""
+        responses, requests = mock_provider
+        responses.extend(
+            [
+                httpx.ConnectError("refused"),
+                httpx.Response(200, json={"access_token": "abc"}),
+            ]
+        )
+
+        response = await get_oauth_client(DISCORD).post(
+            TOKEN_URL, data={"code": "single-use"}
+        )
+
+        assert response.json() == {"access_token": "abc"}
+        assert len(requests) == 2
+        stats = get_oauth_http_stats()[DISCORD]
+        assert stats["requests"] == 2
+        assert stats["retries"] == 1
+        assert stats["errors"] == 1
+        assert stats["latency"]["count"] == 2
+
+    async def test_other_errors_are_not_retried(self, mock_provider):
+        """A request that may have reached the provider is never repeated."""
+        responses, requests = mock_provider
+        responses.append(httpx.ReadTimeout("slow"))
+
+        with pytest.raises(httpx.ReadTimeout):
+            await get_oauth_client(DISCORD).post(TOKEN_URL, data={"code": "once"})
+
+        assert len(requests) == 1
+        assert get_oauth_http_stats()[DISCORD]["retries"] == 0
+
+    async def test_retries_are_bounded(self, mock_provider):
+        """Connection failures are raised once retries are exhausted."""
+        responses, requests = mock_provider
+        responses.extend([httpx.ConnectError("refused")] * 3)
+
+        with pytest.raises(httpx.ConnectError):
+            await get_oauth_client(DISCORD).get(TOKEN_URL)
+
+        assert len(requests) == 3
+        assert get_oauth_http_stats()[DISCORD]["errors"] == 3
@@ -0,0 +1,101 @@
+"""
+Tests for parallel RaceTime bot startup and readiness reporting.
+
+Verifies that:
+1. start_all() starts bots concurrently, bounded by RACETIME_STARTUP_CONCURRENCY
+2. A failing bot does not prevent the others from starting
+3. get_racetime_readiness() reports rooms attached vs expected
+4. The shared aiohttp pool hands out sessions on a single connector
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from application.services.racetime.racetime_service import RacetimeService
+from application.utils import aiohttp_pool
+from racetime import client as racetime_client
+
+
+@pytest.fixture
+def clean_readiness():
+    """Reset module-level readiness state around each test."""
+    racetime_client._readiness["bots_expected"] = 0
+    racetime_client._readiness["categories"].clear()
+    yield racetime_client._readiness
+    racetime_client._readiness["bots_expected"] = 0
+    racetime_client._readiness["categories"].clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_start_all_runs_bots_concurrently(clean_readiness):
+    """Bots start in parallel but never exceed the configured concurrency."""
+    running = 0
+    peak = 0
+
+    async def fake_start(category, client_id, client_secret, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if category == "broken":
+            raise RuntimeError("auth failed")
+
+    configs = [(f"cat{i}", "id", "secret") for i in range(5)]
+    configs.append(("broken", "id", "secret"))
+
+    with patch("racetime.client.start_racetime_bot", side_effect=fake_start), patch(
+        "application.services.racetime.racetime_service.settings.RACETIME_STARTUP_CONCURRENCY",
+        3,
+    ):
+        started = await RacetimeService.start_all(configs)
+
+    assert started == 5
+    assert peak == 3
+    assert clean_readiness["bots_expected"] == 6
+
+
+@pytest.mark.unit
+def test_readiness_reports_rooms_attached(clean_readiness):
+    """Readiness aggregates per-category rejoin progress."""
+    clean_readiness["bots_expected"] = 2
+    clean_readiness["categories"]["alttpr"] = {
+        "expected": 3,
+        "attached": 3,
+        "complete": True,
+    }
+    clean_readiness["categories"]["smz3"] = {
+        "expected": 2,
+        "attached": 1,
+        "complete": False,
+    }
+
+    readiness = racetime_client.get_racetime_readiness()
+
+    assert readiness["bots_expected"] == 2
+    assert readiness["rooms_expected"] == 5
+    assert readiness["rooms_attached"] == 4
+    assert readiness["rejoin_complete"] is False
+    assert readiness["categories"]["smz3"]["attached"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shared_pool_reuses_connector():
+    """Sessions created from the pool share one connector and do not own it."""
+    try:
+        session = aiohttp_pool.create_session()
+        shared = aiohttp_pool.get_session()
+
+        assert session.connector is aiohttp_pool.get_connector()
+        assert shared.connector is session.connector
+        assert aiohttp_pool.get_session() is shared
+
+        # Closing a bot session leaves the pooled connector usable
+        await session.close()
+        assert not aiohttp_pool.get_connector().closed
+    finally:
+        await aiohttp_pool.close_pool()
@@ -34,8 +34,8 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -63,8 +63,8 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -91,9 +91,9 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             await sm_service.generate_varia(settings=settings, tournament=True)
 
@@ -118,8 +118,8 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -148,9 +148,9 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             result = await sm_service.generate_dash(settings=settings, tournament=False)
 
@@ -172,9 +172,9 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             result = await sm_service.generate(
                 settings=settings, randomizer_type="total", tournament=True
@@ -202,9 +202,9 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             result = await sm_service.generate(
                 settings=settings, randomizer_type="multiworld", tournament=True
@@ -228,8 +228,8 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -252,8 +252,8 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -286,8 +286,8 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -308,8 +308,8 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -332,8 +332,8 @@ class TestSMService:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("application.services.randomizer.sm_service.get_randomizer_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Build the static asset manifest.
+
+Hashes every file under static/ and writes static/manifest.json, which the
+application loads at startup instead of hashing the files itself. Run as part
+of deployment, after static files change:
+
+    python tools/build_asset_manifest.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from application.utils.asset_manifest import AssetManifest  # noqa: E402
+
+
+def main() -> int:
+    """Build and write the manifest."""
+    manifest = AssetManifest()
+    count = manifest.write()
+    print(f"Wrote {manifest.manifest_file} ({count} files)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
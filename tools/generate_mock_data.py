@@ -8,28 +8,45 @@ Generates realistic mock data for testing purposes:
 - Tournaments (async and scheduled)
 - Matches (with players and crew)
 - Async tournament data (pools, permalinks, races)
+- Notification delivery history (optional)
 
 Usage:
     python tools/generate_mock_data.py --help
     python tools/generate_mock_data.py --users 50 --orgs 5 --tournaments 10
     python tools/generate_mock_data.py --preset small
     python tools/generate_mock_data.py --preset large --clear-existing
+    python tools/generate_mock_data.py --preset production --db-url sqlite://bench.db \
+        --export-snapshot snapshots/production.db
+
+Rows are inserted with bulk_create in chunks, using explicitly allocated
+primary keys, so production-scale datasets take minutes rather than hours.
+Generation is deterministic for a given --seed and configuration. SQLite
+snapshots let benchmark suites start from an identical dataset in seconds.
 """
 
 import asyncio
 import argparse
+import json
 import logging
 import random
+import sqlite3
 import sys
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Type
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from tortoise import Tortoise
+from tortoise.models import Model
+
+from migrations.tortoise_config import get_model_modules
+from application.services.async_qualifiers.participant_stats_service import (
+    ParticipantStatsService,
+)
 
 # Import models
 from models import (
@@ -42,6 +59,7 @@ from models import (
     AsyncQualifierPool,
     AsyncQualifierPermalink,
     AsyncQualifierRace,
+    AsyncQualifierParticipantStats,
     Tournament,
     Match,
     MatchPlayers,
@@ -49,6 +67,10 @@ from models import (
     TournamentPlayers,
     Crew,
     CrewRole,
+    NotificationLog,
+    NotificationDeliveryStatus,
+    NotificationEventType,
+    NotificationMethod,
     SYSTEM_USER_ID,
 )
 
@@ -58,6 +80,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seed used when none is given, so default runs are reproducible
+DEFAULT_SEED = 42
+
 
 # Realistic test data
 FIRST_NAMES = [
@@ -187,6 +212,121 @@ RACE_GOALS = [
 ]
 
 
+class BulkWriter:
+    """
+    Buffers model instances and inserts them with bulk_create in chunks.
+
+    Rows reference each other by explicit primary keys (see IdAllocator), so
+    nothing has to be saved individually to learn its ID. When any buffer is
+    full, every buffer is flushed in the order the models were first seen,
+    which keeps parents ahead of the rows referencing them.
+    """
+
+    def __init__(self, chunk_size: int = 1000):
+        """
+        Initialize the writer.
+
+        Args:
+            chunk_size: Rows per INSERT statement and flush threshold
+        """
+        self.chunk_size = chunk_size
+        self.counts: Dict[str, int] = {}
+        self._buffers: Dict[Type[Model], List[Model]] = {}
+        self._links: Dict[Tuple[str, str, str], List[Tuple[int, int]]] = {}
+
+    async def add(self, obj: Model) -> Model:
+        """
+        Queue a model instance for insertion.
+
+        Args:
+            obj: Unsaved instance with its primary key already assigned
+
+        Returns:
+            The same instance
+        """
+        buffer = self._buffers.setdefault(type(obj), [])
+        buffer.append(obj)
+        if len(buffer) >= self.chunk_size:
+            await self.flush()
+        return obj
+
+    async def add_link(
+        self, model: Type[Model], field: str, obj_id: int, target_id: int
+    ):
+        """
+        Queue a many-to-many link row.
+
+        Args:
+            model: Model declaring the ManyToManyField
+            field: Name of the ManyToManyField
+            obj_id: Primary key of the model instance
+            target_id: Primary key of the related instance
+        """
+        m2m = model._meta.fields_map[field]
+        key = (m2m.through, m2m.backward_key, m2m.forward_key)
+        links = self._links.setdefault(key, [])
+        links.append((obj_id, target_id))
+        if len(links) >= self.chunk_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Insert every buffered row."""
+        for model, buffer in self._buffers.items():
+            if buffer:
+                await model.bulk_create(buffer, batch_size=self.chunk_size)
+                name = model.__name__
+                self.counts[name] = self.counts.get(name, 0) + len(buffer)
+                buffer.clear()
+
+        conn = Tortoise.get_connection("default")
+        for (table, backward, forward), links in self._links.items():
+            for start in range(0, len(links), self.chunk_size):
+                # Values are integer primary keys, so they can be inlined
+                values = ", ".join(
+                    f"({a}, {b})" for a, b in links[start : start + self.chunk_size]
+                )
+                await conn.execute_script(
+                    f"INSERT INTO {table} ({backward}, {forward}) VALUES {values}"
+                )
+            if links:
+                self.counts[table] = self.counts.get(table, 0) + len(links)
+                links.clear()
+
+
+class IdAllocator:
+    """Hands out primary keys above the current maximum of each table."""
+
+    def __init__(self):
+        self._next: Dict[Type[Model], int] = {}
+
+    async def prepare(self, *models: Type[Model]) -> None:
+        """
+        Read the current maximum ID of each model's table.
+
+        Args:
+            *models: Models IDs will be allocated for
+        """
+        for model in models:
+            ids = (
+                await model.all().order_by("-id").limit(1).values_list("id", flat=True)
+            )
+            self._next[model] = (ids[0] if ids else 0) + 1
+
+    def next(self, model: Type[Model]) -> int:
+        """
+        Allocate the next ID for a model.
+
+        Args:
+            model: Model to allocate an ID for (must have been prepared)
+
+        Returns:
+            Unused primary key
+        """
+        value = self._next[model]
+        self._next[model] = value + 1
+        return value
+
+
 class MockDataGenerator:
     """Generates realistic mock data for testing."""
 
@@ -197,7 +337,12 @@ class MockDataGenerator:
         num_tournaments: int = 5,
         num_async_tournaments: int = 3,
         num_matches_per_tournament: int = 10,
+        max_racers_per_permalink: int = 10,
+        notifications_per_user: int = 0,
         clear_existing: bool = False,
+        seed: int = DEFAULT_SEED,
+        chunk_size: int = 1000,
+        reference_time: Optional[datetime] = None,
     ):
         """
         Initialize mock data generator.
@@ -208,42 +353,100 @@ class MockDataGenerator:
             num_tournaments: Number of scheduled tournaments to create
             num_async_tournaments: Number of async tournaments to create
             num_matches_per_tournament: Number of matches per tournament
+            max_racers_per_permalink: Upper bound of async races per permalink
+            notifications_per_user: Average notification log entries per user
             clear_existing: Whether to clear existing data before generating
+            seed: Random seed; the same seed and configuration produce the
+                same dataset
+            chunk_size: Rows per bulk INSERT
+            reference_time: "Now" for generated schedules (default: start of
+                the current UTC day)
         """
         self.num_users = num_users
         self.num_orgs = num_orgs
         self.num_tournaments = num_tournaments
         self.num_async_tournaments = num_async_tournaments
         self.num_matches_per_tournament = num_matches_per_tournament
+        self.max_racers_per_permalink = max_racers_per_permalink
+        self.notifications_per_user = notifications_per_user
         self.clear_existing = clear_existing
+        self.seed = seed
+
+        self.rng = random.Random(seed)
+        self.writer = BulkWriter(chunk_size)
+        self.ids = IdAllocator()
+        self.now = reference_time or datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
 
         # Will be populated during generation
-        self.users = []
-        self.orgs = []
-        self.tournaments = []
-        self.async_tournaments = []
+        self.users: List[User] = []
+        self.orgs: List[Organization] = []
+        self.tournaments: List[Tournament] = []
+        self.async_tournaments: List[AsyncQualifier] = []
+        # Organization ID -> users who are members
+        self.org_members: Dict[int, List[User]] = {}
+
+    async def generate_all(self, print_summary: bool = True) -> Dict[str, int]:
+        """
+        Generate all mock data.
+
+        Args:
+            print_summary: Whether to print the summary report
 
-    async def generate_all(self):
-        """Generate all mock data."""
-        logger.info("Starting mock data generation...")
+        Returns:
+            Number of rows inserted per model (and link table)
+        """
+        logger.info("Starting mock data generation (seed %s)...", self.seed)
+        started = time.monotonic()
 
         if self.clear_existing:
             await self._clear_existing_data()
 
+        await self._tune_connection()
+        await self.ids.prepare(
+            User,
+            Organization,
+            OrganizationMember,
+            OrganizationPermission,
+            Tournament,
+            TournamentPlayers,
+            Match,
+            MatchPlayers,
+            MatchSeed,
+            Crew,
+            AsyncQualifier,
+            AsyncQualifierPool,
+            AsyncQualifierPermalink,
+            AsyncQualifierRace,
+            NotificationLog,
+        )
+
         await self._generate_users()
         await self._generate_organizations()
         await self._generate_tournaments()
         await self._generate_async_tournaments()
+        await self._generate_notification_logs()
+        await self.writer.flush()
+        await self._generate_participant_stats()
+
+        logger.info(
+            "Mock data generation complete in %.1fs: %s",
+            time.monotonic() - started,
+            ", ".join(f"{n}={c}" for n, c in sorted(self.writer.counts.items())),
+        )
 
-        await self._print_summary()
+        if print_summary:
+            await self._print_summary()
 
-        logger.info("Mock data generation complete!")
+        return dict(self.writer.counts)
 
     async def _clear_existing_data(self):
         """Clear existing data from database."""
         logger.warning("Clearing existing data from database...")
 
         # Delete in reverse dependency order
+        await NotificationLog.all().delete()
         await MatchSeed.all().delete()
         await Crew.all().delete()
         await MatchPlayers.all().delete()
@@ -251,6 +454,7 @@ class MockDataGenerator:
         await TournamentPlayers.all().delete()
         await Tournament.all().delete()
 
+        await AsyncQualifierParticipantStats.all().delete()
         await AsyncQualifierRace.all().delete()
         await AsyncQualifierPermalink.all().delete()
         await AsyncQualifierPool.all().delete()
@@ -265,9 +469,16 @@ class MockDataGenerator:
 
         logger.info("Existing data cleared")
 
+    async def _tune_connection(self):
+        """Relax SQLite durability while bulk loading (file is rebuilt on failure)."""
+        conn = Tortoise.get_connection("default")
+        if conn.capabilities.dialect == "sqlite":
+            await conn.execute_script("PRAGMA synchronous = OFF")
+
     async def _generate_users(self):
         """Generate mock users with various permission levels."""
         logger.info("Generating %s users...", self.num_users)
+        rng = self.rng
 
         # Distribution of permission levels
         # 1 SUPERADMIN, 2-3 ADMIN, ~10% MODERATOR, rest USER
@@ -282,25 +493,28 @@ class MockDataGenerator:
             + [Permission.MODERATOR] * num_moderator
             + [Permission.USER] * num_user
         )
-        random.shuffle(permissions)
+        rng.shuffle(permissions)
 
         for i in range(self.num_users):
-            first_name = random.choice(FIRST_NAMES)
-            last_name = random.choice(LAST_NAMES)
-            username = f"{first_name}{last_name}{random.randint(1, 999)}"
-
-            # Generate realistic Discord IDs (18-digit snowflakes)
-            discord_id = random.randint(100000000000000000, 999999999999999999)
-
-            user = await User.create(
-                discord_id=discord_id,
-                discord_username=username,
-                discord_discriminator=str(random.randint(1, 9999)).zfill(4),
-                discord_email=f"{username.lower()}@example.com",
-                permission=permissions[i],
-                is_active=True,
+            user_id = self.ids.next(User)
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            username = f"{first_name}{last_name}{user_id}"
+
+            # Realistic 18-digit snowflakes, unique by construction
+            discord_id = 100000000000000000 + user_id * 1000 + rng.randint(0, 999)
+
+            user = await self.writer.add(
+                User(
+                    id=user_id,
+                    discord_id=discord_id,
+                    discord_username=username,
+                    discord_discriminator=str(rng.randint(1, 9999)).zfill(4),
+                    discord_email=f"{username.lower()}@example.com",
+                    permission=permissions[i],
+                    is_active=True,
+                )
             )
-
             self.users.append(user)
 
         logger.info(
@@ -315,6 +529,7 @@ class MockDataGenerator:
     async def _generate_organizations(self):
         """Generate organizations with members and permissions."""
         logger.info("Generating %s organizations...", self.num_orgs)
+        rng = self.rng
 
         # Standard organization permissions
         org_permission_names = [
@@ -329,50 +544,67 @@ class MockDataGenerator:
         ]
 
         for i in range(self.num_orgs):
-            adj = random.choice(ORG_ADJECTIVES)
-            org_type = random.choice(ORG_TYPES)
+            adj = rng.choice(ORG_ADJECTIVES)
+            org_type = rng.choice(ORG_TYPES)
             name = f"{adj} {org_type} {i + 1}"
 
-            org = await Organization.create(
-                name=name,
-                description=f"A {org_type.lower()} for competitive gaming and racing events.",
-                is_active=True,
+            org = await self.writer.add(
+                Organization(
+                    id=self.ids.next(Organization),
+                    name=name,
+                    description=f"A {org_type.lower()} for competitive gaming and racing events.",
+                    is_active=True,
+                )
             )
 
             # Create organization permissions
-            permissions = []
+            permission_ids = []
             for perm_name in org_permission_names:
-                perm = await OrganizationPermission.create(
-                    organization=org,
-                    permission_name=perm_name,
-                    description=f"{perm_name} permission for {name}",
+                perm = await self.writer.add(
+                    OrganizationPermission(
+                        id=self.ids.next(OrganizationPermission),
+                        organization_id=org.id,
+                        permission_name=perm_name,
+                        description=f"{perm_name} permission for {name}",
+                    )
                 )
-                permissions.append(perm)
+                permission_ids.append(perm.id)
 
             # Add members (30-70% of users)
-            num_members = random.randint(
+            num_members = rng.randint(
                 int(self.num_users * 0.3), int(self.num_users * 0.7)
             )
-            members_to_add = random.sample(self.users, num_members)
+            members_to_add = rng.sample(self.users, num_members)
 
             for user in members_to_add:
-                member = await OrganizationMember.create(organization=org, user=user)
+                member = await self.writer.add(
+                    OrganizationMember(
+                        id=self.ids.next(OrganizationMember),
+                        organization_id=org.id,
+                        user_id=user.id,
+                    )
+                )
 
                 # Assign permissions based on user level
                 if user.permission >= Permission.ADMIN:
                     # Admins get all permissions
-                    await member.permissions.add(*permissions)
+                    perms_to_add = permission_ids
                 elif user.permission == Permission.MODERATOR:
                     # Moderators get some permissions
-                    perms_to_add = random.sample(permissions, random.randint(2, 5))
-                    await member.permissions.add(*perms_to_add)
+                    perms_to_add = rng.sample(permission_ids, rng.randint(2, 5))
+                elif rng.random() < 0.3:
+                    # Regular users might get 1-2 permissions (30% chance)
+                    perms_to_add = rng.sample(permission_ids, rng.randint(1, 2))
                 else:
-                    # Regular users might get 0-2 permissions
-                    if random.random() < 0.3:  # 30% chance
-                        perms_to_add = random.sample(permissions, random.randint(1, 2))
-                        await member.permissions.add(*perms_to_add)
+                    perms_to_add = []
+
+                for perm_id in perms_to_add:
+                    await self.writer.add_link(
+                        OrganizationMember, "permissions", member.id, perm_id
+                    )
 
             self.orgs.append(org)
+            self.org_members[org.id] = members_to_add
 
         logger.info(
             "Created %s organizations with members and permissions", len(self.orgs)
@@ -381,40 +613,43 @@ class MockDataGenerator:
     async def _generate_tournaments(self):
         """Generate scheduled tournaments with matches."""
         logger.info("Generating %s tournaments...", self.num_tournaments)
+        rng = self.rng
 
         for org in self.orgs:
             num_for_org = max(1, self.num_tournaments // len(self.orgs))
 
             for i in range(num_for_org):
-                tournament_type = random.choice(TOURNAMENT_TYPES)
-                category = random.choice(GAME_CATEGORIES)
+                tournament_type = rng.choice(TOURNAMENT_TYPES)
+                category = rng.choice(GAME_CATEGORIES)
                 name = f"{org.name} - {category.upper()} {tournament_type} {i + 1}"
 
-                tournament = await Tournament.create(
-                    organization=org,
-                    name=name,
-                    description=f"A competitive {tournament_type.lower()} for {category}.",
-                    is_active=random.random() > 0.2,  # 80% active
-                    tracker_enabled=True,
-                    racetime_auto_create_rooms=random.random() > 0.5,
-                    room_open_minutes_before=random.choice([30, 60, 90, 120]),
-                    require_racetime_link=random.random() > 0.7,
-                    racetime_default_goal=random.choice(RACE_GOALS),
+                tournament = await self.writer.add(
+                    Tournament(
+                        id=self.ids.next(Tournament),
+                        organization_id=org.id,
+                        name=name,
+                        description=f"A competitive {tournament_type.lower()} for {category}.",
+                        is_active=rng.random() > 0.2,  # 80% active
+                        tracker_enabled=True,
+                        racetime_auto_create_rooms=rng.random() > 0.5,
+                        room_open_minutes_before=rng.choice([30, 60, 90, 120]),
+                        require_racetime_link=rng.random() > 0.7,
+                        racetime_default_goal=rng.choice(RACE_GOALS),
+                    )
                 )
 
                 # Add tournament players (subset of org members)
-                org_members = (
-                    await OrganizationMember.filter(organization=org)
-                    .prefetch_related("user")
-                    .all()
-                )
-
-                num_players = min(len(org_members), random.randint(4, 20))
-                players = random.sample(org_members, num_players)
-
-                for member in players:
-                    await TournamentPlayers.create(
-                        tournament=tournament, user=member.user
+                org_members = self.org_members[org.id]
+                num_players = min(len(org_members), rng.randint(4, 20))
+                players = rng.sample(org_members, num_players)
+
+                for user in players:
+                    await self.writer.add(
+                        TournamentPlayers(
+                            id=self.ids.next(TournamentPlayers),
+                            tournament_id=tournament.id,
+                            user_id=user.id,
+                        )
                     )
 
                 # Generate matches
@@ -424,7 +659,7 @@ class MockDataGenerator:
 
         logger.info("Created %s tournaments with matches", len(self.tournaments))
 
-    async def _generate_matches(self, tournament: Tournament, players: list):
+    async def _generate_matches(self, tournament: Tournament, players: List[User]):
         """Generate matches for a tournament."""
         # Need at least 2 players for matches
         if len(players) < 2:
@@ -433,179 +668,144 @@ class MockDataGenerator:
             )
             return
 
-        num_matches = self.num_matches_per_tournament
-
-        for i in range(num_matches):
+        rng = self.rng
+        for i in range(self.num_matches_per_tournament):
             # Schedule matches across next 30 days
-            scheduled_at = datetime.now(timezone.utc) + timedelta(
-                days=random.randint(0, 30),
-                hours=random.randint(0, 23),
-                minutes=random.choice([0, 15, 30, 45]),
+            scheduled_at = self.now + timedelta(
+                days=rng.randint(0, 30),
+                hours=rng.randint(0, 23),
+                minutes=rng.choice([0, 15, 30, 45]),
             )
 
             # Some matches are in the past (for testing completed states)
-            if random.random() < 0.3:
-                scheduled_at = datetime.now(timezone.utc) - timedelta(
-                    days=random.randint(1, 60)
+            if rng.random() < 0.3:
+                scheduled_at = self.now - timedelta(days=rng.randint(1, 60))
+
+            # Past matches are started and finished
+            started_at = finished_at = None
+            completed = scheduled_at < self.now
+            if completed:
+                started_at = scheduled_at + timedelta(minutes=rng.randint(5, 15))
+                finished_at = started_at + timedelta(minutes=rng.randint(30, 180))
+
+            match = await self.writer.add(
+                Match(
+                    id=self.ids.next(Match),
+                    tournament_id=tournament.id,
+                    scheduled_at=scheduled_at,
+                    started_at=started_at,
+                    finished_at=finished_at,
+                    title=f"Match {i + 1}",
+                    racetime_goal=tournament.racetime_default_goal,
+                    racetime_invitational=True,
+                    racetime_auto_create=tournament.racetime_auto_create_rooms,
                 )
-
-            match = await Match.create(
-                tournament=tournament,
-                scheduled_at=scheduled_at,
-                title=f"Match {i + 1}",
-                racetime_goal=tournament.racetime_default_goal,
-                racetime_invitational=True,
-                racetime_auto_create=tournament.racetime_auto_create_rooms,
             )
 
             # Add 2-4 players to match (but not more than available)
             max_players = min(4, len(players))
-            num_match_players = random.randint(2, max_players)
-            match_players = random.sample(players, num_match_players)
-
-            for j, player_member in enumerate(match_players):
-                await MatchPlayers.create(
-                    match=match,
-                    user=player_member.user,
-                    finish_rank=None,  # Not finished yet
-                    assigned_station=f"Station {j + 1}",
-                )
-
-            # Some matches are completed (past matches)
-            if scheduled_at < datetime.now(timezone.utc):
-                # Set match as started and finished
-                match.started_at = scheduled_at + timedelta(
-                    minutes=random.randint(5, 15)
-                )
-                match.finished_at = match.started_at + timedelta(
-                    minutes=random.randint(30, 180)
+            match_players = rng.sample(players, rng.randint(2, max_players))
+
+            # Completed matches get finish ranks in random order
+            ranks = list(range(1, len(match_players) + 1))
+            rng.shuffle(ranks)
+
+            for j, user in enumerate(match_players):
+                await self.writer.add(
+                    MatchPlayers(
+                        id=self.ids.next(MatchPlayers),
+                        match_id=match.id,
+                        user_id=user.id,
+                        finish_rank=ranks[j] if completed else None,
+                        assigned_station=f"Station {j + 1}",
+                    )
                 )
 
-                # Assign finish ranks
-                players_list = await MatchPlayers.filter(match=match).all()
-                random.shuffle(players_list)
-                for rank, player in enumerate(players_list, start=1):
-                    player.finish_rank = rank
-                    await player.save()
-
-                # Maybe add seed
-                if random.random() > 0.3:
-                    await MatchSeed.create(
-                        match=match,
-                        url=f"https://example.com/seed/{random.randint(100000, 999999)}",
+            # Maybe add seed to completed matches
+            if completed and rng.random() > 0.3:
+                await self.writer.add(
+                    MatchSeed(
+                        id=self.ids.next(MatchSeed),
+                        match_id=match.id,
+                        url=f"https://example.com/seed/{rng.randint(100000, 999999)}",
                         description="Randomizer seed for this match",
                     )
-
-                await match.save()
+                )
 
             # Add crew members (commentators, trackers)
-            if random.random() > 0.5:
-                num_crew = random.randint(1, 3)
+            if rng.random() > 0.5:
+                num_crew = rng.randint(1, 3)
                 available_users = [p for p in players if p not in match_players]
                 if available_users:
-                    crew_members = random.sample(
+                    crew_members = rng.sample(
                         available_users, min(num_crew, len(available_users))
                     )
-                    for crew_member in crew_members:
-                        await Crew.create(
-                            match=match,
-                            user=crew_member.user,
-                            role=random.choice(list(CrewRole)),
+                    for user in crew_members:
+                        await self.writer.add(
+                            Crew(
+                                id=self.ids.next(Crew),
+                                match_id=match.id,
+                                user_id=user.id,
+                                role=rng.choice(list(CrewRole)),
+                            )
                         )
 
     async def _generate_async_tournaments(self):
         """Generate async tournaments with pools, permalinks, and races."""
         logger.info("Generating %s async tournaments...", self.num_async_tournaments)
+        rng = self.rng
 
         for org in self.orgs:
             num_for_org = max(1, self.num_async_tournaments // len(self.orgs))
+            org_members = self.org_members[org.id]
 
             for i in range(num_for_org):
-                category = random.choice(GAME_CATEGORIES)
+                category = rng.choice(GAME_CATEGORIES)
                 name = f"{org.name} - Async {category.upper()} {i + 1}"
 
-                async_tournament = await AsyncQualifier.create(
-                    organization=org,
-                    name=name,
-                    description=f"Asynchronous racing tournament for {category}.",
-                    is_active=random.random() > 0.2,
-                    hide_results=random.random() > 0.6,
-                    runs_per_pool=random.randint(1, 3),
+                async_tournament = await self.writer.add(
+                    AsyncQualifier(
+                        id=self.ids.next(AsyncQualifier),
+                        organization_id=org.id,
+                        name=name,
+                        description=f"Asynchronous racing tournament for {category}.",
+                        is_active=rng.random() > 0.2,
+                        hide_results=rng.random() > 0.6,
+                        runs_per_pool=rng.randint(1, 3),
+                    )
                 )
 
                 # Generate 2-5 pools
-                num_pools = random.randint(2, 5)
+                num_pools = rng.randint(2, 5)
                 for pool_idx in range(num_pools):
-                    pool = await AsyncQualifierPool.create(
-                        tournament=async_tournament,
-                        name=f"Pool {pool_idx + 1}",
-                        description=f"Collection of seeds for pool {pool_idx + 1}",
+                    pool = await self.writer.add(
+                        AsyncQualifierPool(
+                            id=self.ids.next(AsyncQualifierPool),
+                            tournament_id=async_tournament.id,
+                            name=f"Pool {pool_idx + 1}",
+                            description=f"Collection of seeds for pool {pool_idx + 1}",
+                        )
                     )
 
                     # Generate 3-8 permalinks per pool
-                    num_permalinks = random.randint(3, 8)
+                    num_permalinks = rng.randint(3, 8)
                     for perm_idx in range(num_permalinks):
-                        permalink = await AsyncQualifierPermalink.create(
-                            pool=pool,
-                            url=f"https://alttpr.com/h/{self._random_hash()}",
-                            notes=f"Seed {perm_idx + 1} for {pool.name}",
+                        permalink = await self.writer.add(
+                            AsyncQualifierPermalink(
+                                id=self.ids.next(AsyncQualifierPermalink),
+                                pool_id=pool.id,
+                                url=f"https://alttpr.com/h/{self._random_hash()}",
+                                notes=f"Seed {perm_idx + 1} for {pool.name}",
+                            )
                         )
 
                         # Generate races for some permalinks
-                        org_members = (
-                            await OrganizationMember.filter(organization=org)
-                            .prefetch_related("user")
-                            .all()
+                        num_racers = rng.randint(
+                            0, min(self.max_racers_per_permalink, len(org_members))
                         )
-
-                        num_racers = random.randint(0, min(10, len(org_members)))
-                        racers = random.sample(org_members, num_racers)
-
-                        for racer in racers:
-                            # Some races are completed, some are in progress
-                            # Status values: 'pending', 'in_progress', 'finished', 'forfeit', 'disqualified'
-                            # Review status values: 'pending', 'accepted', 'rejected'
-                            status = random.choice(
-                                ["finished", "finished", "in_progress", "pending"]
-                            )
-
-                            review_status = "pending"
-                            if status == "finished":
-                                review_status = random.choice(
-                                    ["pending", "accepted", "rejected"]
-                                )
-
-                            if status == "finished" and review_status == "accepted":
-                                # Completed and accepted races have times
-                                start_time = datetime.now(timezone.utc) - timedelta(
-                                    days=random.randint(1, 30)
-                                )
-                                elapsed = timedelta(
-                                    hours=random.randint(1, 3),
-                                    minutes=random.randint(0, 59),
-                                    seconds=random.randint(0, 59),
-                                )
-                                end_time = start_time + elapsed
-                                vod_url = f"https://twitch.tv/videos/{random.randint(1000000000, 9999999999)}"
-                            else:
-                                start_time = None
-                                end_time = None
-                                vod_url = None
-
-                            await AsyncQualifierRace.create(
-                                tournament=async_tournament,
-                                permalink=permalink,
-                                user=racer.user,
-                                status=status,
-                                review_status=review_status,
-                                start_time=start_time,
-                                end_time=end_time,
-                                runner_vod_url=vod_url,
-                                runner_notes=(
-                                    f"Race by {racer.user.discord_username}"
-                                    if random.random() > 0.5
-                                    else None
-                                ),
+                        for user in rng.sample(org_members, num_racers):
+                            await self._generate_race(
+                                async_tournament.id, permalink.id, user
                             )
 
                 self.async_tournaments.append(async_tournament)
@@ -615,15 +815,112 @@ class MockDataGenerator:
             len(self.async_tournaments),
         )
 
+    async def _generate_participant_stats(self):
+        """Materialize participant stats of the generated async tournaments."""
+        stats_service = ParticipantStatsService()
+        for async_tournament in self.async_tournaments:
+            await stats_service.refresh(async_tournament.id)
+        self.writer.counts[AsyncQualifierParticipantStats.__name__] = (
+            await AsyncQualifierParticipantStats.all().count()
+        )
+
+    async def _generate_race(self, tournament_id: int, permalink_id: int, user: User):
+        """Generate one async race submission."""
+        rng = self.rng
+
+        # Some races are completed, some are in progress
+        # Status values: 'pending', 'in_progress', 'finished', 'forfeit', 'disqualified'
+        # Review status values: 'pending', 'accepted', 'rejected'
+        status = rng.choice(["finished", "finished", "in_progress", "pending"])
+
+        review_status = "pending"
+        if status == "finished":
+            review_status = rng.choice(["pending", "accepted", "rejected"])
+
+        if status == "finished" and review_status == "accepted":
+            # Completed and accepted races have times
+            start_time = self.now - timedelta(days=rng.randint(1, 30))
+            elapsed = timedelta(
+                hours=rng.randint(1, 3),
+                minutes=rng.randint(0, 59),
+                seconds=rng.randint(0, 59),
+            )
+            end_time = start_time + elapsed
+            vod_url = f"https://twitch.tv/videos/{rng.randint(1000000000, 9999999999)}"
+        else:
+            start_time = None
+            end_time = None
+            vod_url = None
+
+        await self.writer.add(
+            AsyncQualifierRace(
+                id=self.ids.next(AsyncQualifierRace),
+                tournament_id=tournament_id,
+                permalink_id=permalink_id,
+                user_id=user.id,
+                status=status,
+                review_status=review_status,
+                start_time=start_time,
+                end_time=end_time,
+                runner_vod_url=vod_url,
+                runner_notes=(
+                    f"Race by {user.discord_username}" if rng.random() > 0.5 else None
+                ),
+            )
+        )
+
+    async def _generate_notification_logs(self):
+        """Generate notification delivery history spread over the last 90 days."""
+        if not self.notifications_per_user:
+            return
+        logger.info(
+            "Generating ~%s notification logs per user...", self.notifications_per_user
+        )
+        rng = self.rng
+        event_types = list(NotificationEventType)
+
+        # Almost everything was delivered; a small tail is still queued or failed
+        statuses = [NotificationDeliveryStatus.SENT] * 95 + [
+            NotificationDeliveryStatus.PENDING,
+            NotificationDeliveryStatus.RETRYING,
+            NotificationDeliveryStatus.FAILED,
+            NotificationDeliveryStatus.FAILED,
+            NotificationDeliveryStatus.FAILED,
+        ]
+
+        for user in self.users:
+            for _ in range(rng.randint(0, 2 * self.notifications_per_user)):
+                created_at = self.now - timedelta(minutes=rng.randint(0, 90 * 24 * 60))
+                status = rng.choice(statuses)
+                sent = status == NotificationDeliveryStatus.SENT
+                await self.writer.add(
+                    NotificationLog(
+                        id=self.ids.next(NotificationLog),
+                        user_id=user.id,
+                        event_type=rng.choice(event_types),
+                        notification_method=NotificationMethod.DISCORD_DM,
+                        event_data={},
+                        delivery_status=status,
+                        error_message=(
+                            "Cannot send messages to this user"
+                            if status == NotificationDeliveryStatus.FAILED
+                            else None
+                        ),
+                        retry_count=0 if sent else rng.randint(0, 3),
+                        created_at=created_at,
+                        sent_at=created_at + timedelta(seconds=5) if sent else None,
+                    )
+                )
+
     def _random_hash(self) -> str:
         """Generate random hash string for permalinks."""
         chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-        return "".join(random.choice(chars) for _ in range(10))
+        return "".join(self.rng.choice(chars) for _ in range(10))
 
     def _random_seed_code(self) -> str:
         """Generate random seed code."""
         chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-        return "".join(random.choice(chars) for _ in range(8))
+        return "".join(self.rng.choice(chars) for _ in range(8))
 
     async def _print_summary(self):
         """Print summary of generated data."""
@@ -678,6 +975,13 @@ class MockDataGenerator:
         print(f"  - Total permalinks: {total_permalinks}")
         print(f"  - Total races: {total_races}")
         print(f"  - Approved races: {approved_races}")
+        print(
+            f"  - Participants: {await AsyncQualifierParticipantStats.all().count()}"
+        )
+
+        total_notifications = await NotificationLog.all().count()
+        if total_notifications:
+            print(f"\nNOTIFICATION LOGS: {total_notifications} total")
 
         print("\n" + "=" * 60)
 
@@ -693,39 +997,20 @@ class MockDataGenerator:
         print("\n" + "=" * 60 + "\n")
 
 
-async def init_db():
-    """Initialize database connection."""
+async def init_db(db_url: Optional[str] = None):
+    """
+    Initialize database connection.
+
+    Args:
+        db_url: Database URL (default: the configured database)
+    """
     from config import settings
 
     await Tortoise.init(
-        db_url=settings.database_url,
-        modules={
-            "models": [
-                "models.user",
-                "models.organizations",
-                "modules.async_qualifier.models.async_qualifier",
-                "modules.tournament.models.match_schedule",
-                "models.audit_log",
-                "models.api_token",
-                "models.organization_invite",
-                "models.organization_request",
-                "models.racer_verification",
-                "models.preset_namespace",
-                "models.preset_namespace_permission",
-                "models.randomizer_preset",
-                "models.race_room_profile",
-                "models.racetime_bot",
-                "models.racetime_chat_command",
-                "models.scheduled_task",
-                "models.settings",
-                "modules.tournament.models.tournament_usage",
-                "models.notification_subscription",
-                "models.notification_log",
-                "models.discord_guild",
-                "models.discord_scheduled_event",
-                "models.organization_feature_flag",
-            ]
-        },
+        db_url=db_url or settings.database_url,
+        modules={"models": get_model_modules()},
+        use_tz=True,
+        timezone="UTC",
     )
     await Tortoise.generate_schemas()
 
@@ -735,6 +1020,69 @@ async def close_db():
     await Tortoise.close_connections()
 
 
+def sqlite_path(db_url: str) -> Path:
+    """
+    Get the file behind a SQLite database URL.
+
+    Args:
+        db_url: Database URL (e.g. "sqlite://bench.db")
+
+    Returns:
+        Path of the database file
+
+    Raises:
+        ValueError: If the URL is not a file-backed SQLite database
+    """
+    if not db_url.startswith("sqlite://") or db_url.endswith(":memory:"):
+        raise ValueError(f"Snapshots require a file-backed SQLite database: {db_url}")
+    return Path(db_url[len("sqlite://") :].split("?", 1)[0])
+
+
+def _copy_sqlite(source: Path, destination: Path) -> None:
+    """Copy a SQLite database consistently using the online backup API."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    src = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True)
+    dst = sqlite3.connect(destination)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+
+
+def export_snapshot(db_url: str, snapshot: Path, metadata: Optional[dict] = None):
+    """
+    Save a generated SQLite database as a snapshot file.
+
+    Args:
+        db_url: SQLite database URL the data was generated into
+        snapshot: Snapshot file to write
+        metadata: Description of the dataset (seed, configuration, row
+            counts), written next to the snapshot as JSON
+    """
+    _copy_sqlite(sqlite_path(db_url), snapshot)
+    if metadata is not None:
+        snapshot.with_name(snapshot.name + ".json").write_text(
+            json.dumps(metadata, indent=2, sort_keys=True, default=str) + "\n",
+            encoding="utf-8",
+        )
+    logger.info("Exported snapshot to %s", snapshot)
+
+
+def import_snapshot(snapshot: Path, db_url: str):
+    """
+    Restore a snapshot into a SQLite database, replacing its contents.
+
+    Args:
+        snapshot: Snapshot file written by export_snapshot()
+        db_url: SQLite database URL to restore into
+    """
+    if not snapshot.is_file():
+        raise FileNotFoundError(f"Snapshot not found: {snapshot}")
+    _copy_sqlite(snapshot, sqlite_path(db_url))
+    logger.info("Imported snapshot %s into %s", snapshot, db_url)
+
+
 # Preset configurations
 PRESETS = {
     "tiny": {
@@ -743,6 +1091,7 @@ PRESETS = {
         "num_tournaments": 1,
         "num_async_tournaments": 1,
         "num_matches_per_tournament": 3,
+        "max_racers_per_permalink": 10,
     },
     "small": {
         "num_users": 20,
@@ -750,6 +1099,7 @@ PRESETS = {
         "num_tournaments": 5,
         "num_async_tournaments": 3,
         "num_matches_per_tournament": 10,
+        "max_racers_per_permalink": 10,
     },
     "medium": {
         "num_users": 50,
@@ -757,6 +1107,7 @@ PRESETS = {
         "num_tournaments": 10,
         "num_async_tournaments": 5,
         "num_matches_per_tournament": 15,
+        "max_racers_per_permalink": 10,
     },
     "large": {
         "num_users": 100,
@@ -764,6 +1115,17 @@ PRESETS = {
         "num_tournaments": 20,
         "num_async_tournaments": 10,
         "num_matches_per_tournament": 20,
+        "max_racers_per_permalink": 10,
+    },
+    # Production scale: ~50k users, ~200k matches, ~1M async races
+    "production": {
+        "num_users": 50000,
+        "num_orgs": 20,
+        "num_tournaments": 1000,
+        "num_async_tournaments": 300,
+        "num_matches_per_tournament": 200,
+        "max_racers_per_permalink": 350,
+        "notifications_per_user": 20,
     },
 }
 
@@ -784,17 +1146,27 @@ Examples:
   # Clear existing data and use large preset
   python tools/generate_mock_data.py --preset large --clear-existing
 
+  # Build a production-scale benchmark snapshot
+  python tools/generate_mock_data.py --preset production \\
+      --db-url sqlite://bench.db --export-snapshot snapshots/production.db
+
+  # Restore it (seconds instead of minutes)
+  python tools/generate_mock_data.py --db-url sqlite://bench.db \\
+      --import-snapshot snapshots/production.db
+
 Available presets:
-  tiny   - 5 users, 1 org, minimal data (quick testing)
-  small  - 20 users, 3 orgs, moderate data (default)
-  medium - 50 users, 5 orgs, substantial data
-  large  - 100 users, 10 orgs, extensive data (stress testing)
+  tiny       - 5 users, 1 org, minimal data (quick testing)
+  small      - 20 users, 3 orgs, moderate data (default)
+  medium     - 50 users, 5 orgs, substantial data
+  large      - 100 users, 10 orgs, extensive data (stress testing)
+  production - 50k users, ~200k matches, ~1M async races,
+               ~1M notification logs (benchmarks)
         """,
     )
 
     parser.add_argument(
         "--preset",
-        choices=["tiny", "small", "medium", "large"],
+        choices=list(PRESETS),
         help="Use preset configuration",
     )
     parser.add_argument("--users", type=int, help="Number of users to generate")
@@ -806,6 +1178,41 @@ Available presets:
         "--async-tournaments", type=int, help="Number of async tournaments to generate"
     )
     parser.add_argument("--matches", type=int, help="Number of matches per tournament")
+    parser.add_argument(
+        "--racers-per-permalink",
+        type=int,
+        help="Maximum async races per permalink",
+    )
+    parser.add_argument(
+        "--notifications-per-user",
+        type=int,
+        help="Average notification log entries per user",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Random seed for reproducible datasets (default: {DEFAULT_SEED})",
+    )
+    parser.add_argument(
+        "--reference-date",
+        type=lambda value: datetime.fromisoformat(value).replace(tzinfo=timezone.utc),
+        help="Date generated schedules are relative to (default: today, UTC)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=1000, help="Rows per bulk insert"
+    )
+    parser.add_argument("--db-url", help="Database URL (default: configured database)")
+    parser.add_argument(
+        "--export-snapshot",
+        type=Path,
+        help="After generating, copy the SQLite database to this snapshot file",
+    )
+    parser.add_argument(
+        "--import-snapshot",
+        type=Path,
+        help="Restore a snapshot into the SQLite --db-url instead of generating",
+    )
     parser.add_argument(
         "--clear-existing",
         action="store_true",
@@ -814,11 +1221,14 @@ Available presets:
 
     args = parser.parse_args()
 
+    if args.import_snapshot:
+        from config import settings
+
+        import_snapshot(args.import_snapshot, args.db_url or settings.database_url)
+        return
+
     # Determine configuration
-    if args.preset:
-        config = PRESETS[args.preset]
-    else:
-        config = PRESETS["small"]  # Default
+    config = dict(PRESETS[args.preset or "small"])  # Default: small
 
     # Override with command-line arguments
     if args.users is not None:
@@ -831,6 +1241,10 @@ Available presets:
         config["num_async_tournaments"] = args.async_tournaments
     if args.matches is not None:
         config["num_matches_per_tournament"] = args.matches
+    if args.racers_per_permalink is not None:
+        config["max_racers_per_permalink"] = args.racers_per_permalink
+    if args.notifications_per_user is not None:
+        config["notifications_per_user"] = args.notifications_per_user
 
     # Warning for clear-existing
     if args.clear_existing:
@@ -844,20 +1258,37 @@ Available presets:
 
     # Run generator
     async def run():
-        await init_db()
+        from config import settings
+
+        db_url = args.db_url or settings.database_url
+        if args.export_snapshot:
+            sqlite_path(db_url)  # Fail before generating, not after
+
+        await init_db(db_url)
         try:
             generator = MockDataGenerator(
-                num_users=config["num_users"],
-                num_orgs=config["num_orgs"],
-                num_tournaments=config["num_tournaments"],
-                num_async_tournaments=config["num_async_tournaments"],
-                num_matches_per_tournament=config["num_matches_per_tournament"],
+                **config,
                 clear_existing=args.clear_existing,
+                seed=args.seed,
+                chunk_size=args.chunk_size,
+                reference_time=args.reference_date,
             )
-            await generator.generate_all()
+            counts = await generator.generate_all()
         finally:
             await close_db()
 
+        if args.export_snapshot:
+            export_snapshot(
+                db_url,
+                args.export_snapshot,
+                metadata={
+                    "seed": args.seed,
+                    "reference_time": generator.now.isoformat(),
+                    "config": config,
+                    "counts": counts,
+                },
+            )
+
     asyncio.run(run())
 
 
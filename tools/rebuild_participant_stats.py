@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Rebuild Async Qualifier Participant Stats
+
+Recomputes the materialized per-qualifier participant stats from the races
+and reports every row that had drifted (missing, stale, or left behind after
+its races were deleted). Drifted rows are repaired.
+
+Exits with status 1 when drift was found, so it can be scheduled as a
+consistency check.
+
+Usage:
+    python tools/rebuild_participant_stats.py
+    python tools/rebuild_participant_stats.py --tournament 12
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tortoise import Tortoise
+from config import settings
+from migrations.tortoise_config import get_model_modules
+from application.services.async_qualifiers.participant_stats_service import (
+    ParticipantStatsService,
+)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def init_database():
+    """Initialize database connection."""
+    await Tortoise.init(
+        db_url=settings.database_url,
+        modules={"models": get_model_modules()},
+    )
+
+
+async def close_database():
+    """Close database connection."""
+    await Tortoise.close_connections()
+
+
+async def main(tournament_id=None) -> int:
+    """Main entry point."""
+    try:
+        await init_database()
+
+        result = await ParticipantStatsService().rebuild(tournament_id)
+
+        logger.info("=" * 60)
+        logger.info("Participant stats rebuild complete")
+        logger.info("  - Tournaments: %s", result.tournaments)
+        logger.info("  - Participants: %s", result.participants)
+        logger.info("  - Drifted rows: %s", result.drift_count)
+        for qualifier_id, user_ids in sorted(result.drifted.items()):
+            logger.info("    tournament %s: users %s", qualifier_id, user_ids)
+        logger.info("=" * 60)
+
+        return 1 if result.drift_count else 0
+
+    except Exception as e:
+        logger.error("Error during rebuild: %s", str(e), exc_info=True)
+        return 2
+    finally:
+        await close_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild async qualifier participant stats and report drift"
+    )
+    parser.add_argument(
+        "--tournament",
+        type=int,
+        default=None,
+        help="Only rebuild this async qualifier (default: all)",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.tournament)))
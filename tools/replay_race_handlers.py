@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Replay RaceTime Race Frames
+
+Feeds race.data websocket frames into the RaceTime race handlers without a
+network connection and reports how many frames per second each handler
+processes, with the time spent in database lookups and event listeners.
+
+Frames are generated (a large race with rapid status flips) unless a
+recording is given: a JSON lines file with one websocket message per line.
+Handlers run against an empty in-memory SQLite database unless --db-url
+points elsewhere (e.g. a copy of a benchmark snapshot).
+
+Usage:
+    python tools/replay_race_handlers.py
+    python tools/replay_race_handlers.py --entrants 200 --flips 1000
+    python tools/replay_race_handlers.py --frames recorded.jsonl --handler SahaRaceHandler
+    python tools/replay_race_handlers.py --save-frames large-race.jsonl
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tortoise import Tortoise
+from migrations.tortoise_config import get_model_modules
+from racetime.handler_metrics import get_race_handler_metrics
+from racetime.replay import (
+    default_handler_kwargs,
+    generate_race_frames,
+    load_frames,
+    replay_frames,
+    replay_handler_classes,
+    save_frames,
+)
+
+# Importing the listeners registers them, as at application startup
+import application.events.listeners  # noqa: F401,E402
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def init_database(db_url: str):
+    """Initialize database connection (creating the schema in memory)."""
+    await Tortoise.init(db_url=db_url, modules={"models": get_model_modules()})
+    if db_url == "sqlite://:memory:":
+        await Tortoise.generate_schemas()
+
+
+async def close_database():
+    """Close database connection."""
+    await Tortoise.close_connections()
+
+
+async def main(args) -> int:
+    """Main entry point."""
+    handler_classes = replay_handler_classes()
+    names = args.handler or list(handler_classes)
+    unknown = [name for name in names if name not in handler_classes]
+    if unknown:
+        print(f"Unknown handler(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(handler_classes)}")
+        return 2
+
+    if args.frames:
+        frames = load_frames(args.frames)
+    else:
+        frames = generate_race_frames(
+            entrants=args.entrants, status_flips=args.flips, seed=args.seed
+        )
+    if args.save_frames:
+        save_frames(frames, args.save_frames)
+        print(f"Saved {len(frames)} frames to {args.save_frames}")
+
+    try:
+        await init_database(args.db_url)
+
+        print(f"Replaying {len(frames)} frames")
+        print(
+            f"{'handler':<24} {'frames':>7} {'seconds':>8} {'frames/s':>9} "
+            f"{'avg ms':>7} {'p95 ms':>7} {'db ms':>8} {'listen ms':>9}"
+        )
+        for name in names:
+            handler_class = handler_classes[name]
+            get_race_handler_metrics().reset()
+            result = await replay_frames(
+                handler_class,
+                frames,
+                **default_handler_kwargs(handler_class, args.match_id),
+            )
+            metrics = result.metrics
+            print(
+                f"{result.handler:<24} {result.frames:>7} "
+                f"{result.elapsed_seconds:>8.3f} {result.frames_per_second:>9.0f} "
+                f"{metrics['avg_ms']:>7.3f} {metrics['processing']['p95_ms']:>7} "
+                f"{metrics['db_ms']:>8.1f} {metrics['listener_ms']:>9.1f}"
+            )
+        return 0
+
+    except Exception as e:
+        logger.error("Error during replay: %s", str(e), exc_info=True)
+        return 1
+    finally:
+        await close_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replay race.data frames into RaceTime race handlers"
+    )
+    parser.add_argument(
+        "--frames",
+        type=Path,
+        default=None,
+        help="Recorded websocket messages (JSON lines) instead of generated frames",
+    )
+    parser.add_argument(
+        "--save-frames",
+        type=Path,
+        default=None,
+        help="Write the replayed frames to this JSON lines file",
+    )
+    parser.add_argument(
+        "--entrants", type=int, default=120, help="Generated entrants (default: 120)"
+    )
+    parser.add_argument(
+        "--flips",
+        type=int,
+        default=300,
+        help="Generated ready/not ready flips (default: 300)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed for generated frames"
+    )
+    parser.add_argument(
+        "--handler",
+        action="append",
+        default=None,
+        help="Handler class to replay (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--match-id",
+        type=int,
+        default=None,
+        help="Match ID passed to match handlers (default: none)",
+    )
+    parser.add_argument(
+        "--db-url",
+        default="sqlite://:memory:",
+        help="Database to run against (default: empty in-memory SQLite)",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
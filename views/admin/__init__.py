@@ -12,9 +12,12 @@ from views.admin.presets import PresetsView
 from views.admin.preset_namespaces import PresetNamespacesView
 from views.admin.org_requests import OrgRequestsView
 from views.admin.scheduled_tasks import ScheduledTasksView
+from views.admin.seed_pool import SeedPoolView
 from views.admin.racetime_accounts import RacetimeAccountsView
 from views.admin.audit_logs import AdminAuditLogsView
 from views.admin.admin_logs import AdminLogsView
+from views.admin.query_stats import AdminQueryStatsView
+from views.admin.racetime_handlers import AdminRaceHandlersView
 
 __all__ = [
     "AdminUsersView",
@@ -25,7 +28,10 @@ __all__ = [
     "PresetNamespacesView",
     "OrgRequestsView",
     "ScheduledTasksView",
+    "SeedPoolView",
     "RacetimeAccountsView",
     "AdminAuditLogsView",
     "AdminLogsView",
+    "AdminQueryStatsView",
+    "AdminRaceHandlersView",
 ]
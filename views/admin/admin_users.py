@@ -5,7 +5,7 @@ Provides a comprehensive interface for viewing, editing, and managing user accou
 """
 
 from nicegui import ui
-from components.data_table import ResponsiveTable, TableColumn
+from components.data_table import ListDataProvider, PaginatedTable, TableColumn
 from components.badge import Badge
 from components.empty_state import EmptyState
 from models import User
@@ -330,7 +330,9 @@ class AdminUsersView:
                     TableColumn(label="Actions", cell_render=render_actions_cell),
                 ]
 
-                table = ResponsiveTable(columns=columns, rows=self.users)
+                table = PaginatedTable(
+                    columns=columns, provider=ListDataProvider(self.users), page_size=50
+                )
                 await table.render()
 
     async def _render_user_row(self, _user: User):
@@ -34,6 +34,9 @@ class AdminAuditLogsView:
         self.total_count = 0
         self.current_page = 0
         self.page_size = 50
+        # Cursor of every page visited so far (None for the first page)
+        self.page_cursors = [None]
+        self.next_cursor = None
         self.action_filter = None
         self.user_filter = None
         self.org_filter = None
@@ -81,10 +84,16 @@ class AdminAuditLogsView:
             return
 
         # Fetch audit logs
-        offset = self.current_page * self.page_size
-        self.audit_logs, self.total_count = await self.audit_service.list_audit_logs(
-            limit=self.page_size,
-            offset=offset,
+        self.audit_logs, self.next_cursor = (
+            await self.audit_service.list_audit_logs_page(
+                cursor=self.page_cursors[self.current_page],
+                limit=self.page_size,
+                action=self.action_filter,
+                user_id=self.user_filter,
+                organization_id=self.org_filter,
+            )
+        )
+        self.total_count = await self.audit_service.count_audit_logs(
             action=self.action_filter,
             user_id=self.user_filter,
             organization_id=self.org_filter,
@@ -140,22 +149,17 @@ class AdminAuditLogsView:
 
     def _render_pagination(self):
         """Render pagination controls."""
-        if self.total_count <= self.page_size:
+        if self.current_page == 0 and self.next_cursor is None:
             return
 
-        total_pages = (self.total_count + self.page_size - 1) // self.page_size
-        current_page = self.current_page + 1
-
         with ui.element("div").classes("card"):
             with ui.element("div").classes("card-body"):
                 with ui.row().classes("items-center justify-between full-width"):
-                    # Page info
+                    # Page info (the total is cached, so it is approximate)
                     start = self.current_page * self.page_size + 1
-                    end = min(
-                        (self.current_page + 1) * self.page_size, self.total_count
-                    )
+                    end = self.current_page * self.page_size + len(self.audit_logs)
                     ui.label(
-                        f"Showing {start}-{end} of {self.total_count} logs"
+                        f"Showing {start}-{end} of about {self.total_count} logs"
                     ).classes("text-secondary")
 
                     # Navigation buttons
@@ -166,18 +170,19 @@ class AdminAuditLogsView:
                             self.current_page > 0
                         )
 
-                        ui.label(f"Page {current_page} of {total_pages}")
+                        ui.label(f"Page {self.current_page + 1}")
 
                         ui.button(
                             icon="chevron_right", on_click=self._next_page
                         ).classes("btn").props("flat").set_enabled(
-                            self.current_page < total_pages - 1
+                            self.next_cursor is not None
                         )
 
     async def _on_action_filter(self, value: str):
         """Handle action filter change."""
         self.action_filter = value.strip() if value and value.strip() else None
         self.current_page = 0
+        self.page_cursors = [None]
         await self._refresh_logs()
 
     async def _previous_page(self):
@@ -188,7 +193,8 @@ class AdminAuditLogsView:
 
     async def _next_page(self):
         """Navigate to next page."""
-        total_pages = (self.total_count + self.page_size - 1) // self.page_size
-        if self.current_page < total_pages - 1:
+        if self.next_cursor is not None:
+            del self.page_cursors[self.current_page + 1 :]
+            self.page_cursors.append(self.next_cursor)
             self.current_page += 1
             await self._refresh_logs()
@@ -0,0 +1,232 @@
+"""
+Admin query statistics view - SQL statements by fingerprint and caller.
+
+Shows the process-wide statistics collected by application.utils.query_stats:
+the most expensive normalized statements, the callers that issue them, and
+slow statements with their sampled EXPLAIN plans.
+"""
+
+import logging
+from datetime import datetime, timezone
+from nicegui import ui
+from components.data_table import ResponsiveTable, TableColumn
+from components.empty_state import EmptyState
+from models import User
+from application.utils.query_stats import get_query_stats
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdminQueryStatsView:
+    """Admin dashboard of SQL statement statistics."""
+
+    SORT_OPTIONS = {
+        "total_ms": "Total time",
+        "count": "Executions",
+        "p95_ms": "p95 latency",
+        "max_ms": "Max latency",
+    }
+
+    def __init__(self, current_user: User):
+        """
+        Initialize the query statistics view.
+
+        Args:
+            current_user: Currently authenticated admin user
+        """
+        self.current_user = current_user
+        self.stats = get_query_stats()
+
+        # State
+        self.order_by = "total_ms"
+        self.container = None
+        self.timer = None
+
+    async def render(self):
+        """Render the query statistics interface."""
+        with ui.column().classes("full-width gap-md"):
+            # Header section
+            with ui.element("div").classes("card"):
+                with ui.element("div").classes("card-header"):
+                    ui.label("Query Statistics").classes("text-xl font-bold")
+                with ui.element("div").classes("card-body"):
+                    ui.label(
+                        "SQL statements issued by this process, grouped by normalized statement. "
+                        f"Statements slower than {settings.SLOW_QUERY_MS:g}ms are logged and "
+                        "sampled with EXPLAIN."
+                    ).classes("text-secondary")
+                    if not settings.QUERY_STATS_ENABLED:
+                        ui.label(
+                            "Collection is disabled (QUERY_STATS_ENABLED=false)."
+                        ).classes("text-warning")
+
+            # Controls section
+            with ui.element("div").classes("card"):
+                with ui.element("div").classes("card-body"):
+                    with ui.row().classes("full-width gap-4 items-center flex-wrap"):
+                        sort_select = ui.select(
+                            label="Sort by",
+                            options=self.SORT_OPTIONS,
+                            value=self.order_by,
+                        ).classes("w-40")
+                        sort_select.on_value_change(self._on_sort_change)
+
+                        with ui.row().classes("gap-2"):
+                            ui.button(
+                                "Refresh", icon="refresh", on_click=self._refresh
+                            ).classes("btn").props("flat")
+
+                            ui.button(
+                                "Reset",
+                                icon="restart_alt",
+                                on_click=self._reset,
+                            ).classes("btn").props("flat color=warning")
+
+            self.container = ui.column().classes("full-width gap-md")
+            await self._refresh()
+
+            # Set up periodic refresh (every 10 seconds)
+            self.timer = ui.timer(10.0, self._refresh)
+
+    async def _refresh(self):
+        """Re-render all statistics sections."""
+        if not self.container:
+            return
+
+        self.container.clear()
+        with self.container:
+            self._render_summary()
+            await self._render_fingerprints()
+            await self._render_callers()
+            await self._render_slow_queries()
+
+    def _render_summary(self):
+        """Render collection totals."""
+        summary = self.stats.summary()
+        started = datetime.fromtimestamp(summary["started_at"], timezone.utc)
+        with ui.element("div").classes("card"):
+            with ui.element("div").classes("card-body"):
+                with ui.row().classes("full-width gap-8 flex-wrap"):
+                    for label, value in (
+                        ("Statements", f"{summary['count']:,}"),
+                        ("Total time", f"{summary['total_ms'] / 1000:,.1f}s"),
+                        ("Distinct statements", f"{summary['fingerprints']:,}"),
+                        ("Slow executions", f"{summary['slow_count']:,}"),
+                    ):
+                        with ui.column().classes("gap-0"):
+                            ui.label(value).classes("text-xl font-bold")
+                            ui.label(label).classes("text-sm text-secondary")
+                ui.label(
+                    f"Collecting since {started.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+                ).classes("text-xs text-secondary mt-2")
+
+    async def _render_fingerprints(self):
+        """Render the most expensive statements."""
+        rows = self.stats.fingerprints(order_by=self.order_by, limit=50)
+        with ui.element("div").classes("card"):
+            with ui.element("div").classes("card-header"):
+                ui.label("Top Statements").classes("text-lg font-bold")
+            with ui.element("div").classes("card-body"):
+                if not rows:
+                    EmptyState.no_items(
+                        item_name="statements",
+                        message="No statements recorded yet",
+                        icon="storage",
+                    )
+                    return
+
+                columns = [
+                    TableColumn(
+                        label="Statement",
+                        cell_render=self._render_statement,
+                    ),
+                    TableColumn(label="Count", key="count"),
+                    TableColumn(label="Total ms", key="total_ms"),
+                    TableColumn(label="Avg ms", key="avg_ms"),
+                    TableColumn(label="p50 ms", key="p50_ms"),
+                    TableColumn(label="p95 ms", key="p95_ms"),
+                    TableColumn(label="p99 ms", key="p99_ms"),
+                    TableColumn(label="Max ms", key="max_ms"),
+                    TableColumn(label="Callers", cell_render=self._render_top_callers),
+                ]
+                await ResponsiveTable(columns=columns, rows=rows).render()
+
+    async def _render_callers(self):
+        """Render per-caller totals."""
+        rows = self.stats.callers(limit=50)
+        if not rows:
+            return
+        with ui.element("div").classes("card"):
+            with ui.element("div").classes("card-header"):
+                ui.label("Callers").classes("text-lg font-bold")
+            with ui.element("div").classes("card-body"):
+                columns = [
+                    TableColumn(
+                        label="Caller",
+                        cell_render=lambda row: ui.label(row["caller"]).classes(
+                            "font-mono text-sm"
+                        ),
+                    ),
+                    TableColumn(label="Statements", key="count"),
+                    TableColumn(label="Total ms", key="total_ms"),
+                ]
+                await ResponsiveTable(columns=columns, rows=rows).render()
+
+    async def _render_slow_queries(self):
+        """Render statements with slow executions and their plans."""
+        rows = self.stats.slow_queries(limit=20)
+        if not rows:
+            return
+        with ui.element("div").classes("card"):
+            with ui.element("div").classes("card-header"):
+                ui.label("Slow Statements").classes("text-lg font-bold")
+            with ui.element("div").classes("card-body"):
+                for row in rows:
+                    with ui.expansion(
+                        f"{row['max_ms']}ms max, {row['slow_count']} slow - "
+                        f"{row['fingerprint'][:120]}"
+                    ).classes("full-width"):
+                        ui.label(row["example"]).classes(
+                            "font-mono text-xs whitespace-pre-wrap"
+                        )
+                        if row["explain"]:
+                            ui.label("EXPLAIN").classes("text-sm font-bold mt-2")
+                            for plan_row in row["explain"]:
+                                ui.label(
+                                    ", ".join(
+                                        f"{key}={value}"
+                                        for key, value in plan_row.items()
+                                    )
+                                ).classes("font-mono text-xs")
+                        else:
+                            ui.label("No plan captured yet").classes(
+                                "text-secondary italic text-sm mt-2"
+                            )
+
+    @staticmethod
+    def _render_statement(row: dict):
+        """Render a fingerprint, truncated with the full text as tooltip."""
+        text = row["fingerprint"]
+        label = ui.label(text if len(text) <= 160 else f"{text[:160]}...").classes(
+            "font-mono text-xs"
+        )
+        label.tooltip(text[:2000])
+
+    @staticmethod
+    def _render_top_callers(row: dict):
+        """Render the top callers of a fingerprint."""
+        with ui.column().classes("gap-0"):
+            for caller, count in row["callers"]:
+                ui.label(f"{caller} ({count})").classes("text-xs")
+
+    async def _on_sort_change(self, e):
+        """Handle sort order change."""
+        self.order_by = e.value or "total_ms"
+        await self._refresh()
+
+    async def _reset(self):
+        """Discard collected statistics."""
+        self.stats.reset()
+        await self._refresh()
+        ui.notify("Query statistics reset", type="positive")
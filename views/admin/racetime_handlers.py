@@ -0,0 +1,168 @@
+"""
+Admin race handler metrics view - RaceTime websocket throughput.
+
+Shows the process-wide metrics collected by racetime.handler_metrics: message
+rate, processing latency and database/listener time per handler class, and
+the backlog of every room with a running handler.
+"""
+
+import logging
+from nicegui import ui
+from components.data_table import ResponsiveTable, TableColumn
+from components.empty_state import EmptyState
+from models import User
+from racetime.handler_metrics import get_race_handler_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class AdminRaceHandlersView:
+    """Admin dashboard of RaceTime race handler throughput."""
+
+    def __init__(self, current_user: User):
+        """
+        Initialize the race handler metrics view.
+
+        Args:
+            current_user: Currently authenticated admin user
+        """
+        self.current_user = current_user
+        self.metrics = get_race_handler_metrics()
+
+        # State
+        self.container = None
+        self.timer = None
+
+    async def render(self):
+        """Render the race handler metrics interface."""
+        with ui.column().classes("full-width gap-md"):
+            # Header section
+            with ui.element("div").classes("card"):
+                with ui.element("div").classes("card-header"):
+                    ui.label("Race Handlers").classes("text-xl font-bold")
+                with ui.element("div").classes("card-body"):
+                    ui.label(
+                        "Websocket messages processed by the RaceTime race handlers in "
+                        "this process. Backlog is the number of frames received but not "
+                        "yet processed; a growing backlog means a handler is falling "
+                        "behind its room."
+                    ).classes("text-secondary")
+
+            # Controls section
+            with ui.element("div").classes("card"):
+                with ui.element("div").classes("card-body"):
+                    with ui.row().classes("gap-2"):
+                        ui.button(
+                            "Refresh", icon="refresh", on_click=self._refresh
+                        ).classes("btn").props("flat")
+
+                        ui.button(
+                            "Reset",
+                            icon="restart_alt",
+                            on_click=self._reset,
+                        ).classes("btn").props("flat color=warning")
+
+            self.container = ui.column().classes("full-width gap-md")
+            await self._refresh()
+
+            # Set up periodic refresh (every 5 seconds)
+            self.timer = ui.timer(5.0, self._refresh)
+
+    async def _refresh(self):
+        """Re-render all metrics sections."""
+        if not self.container:
+            return
+
+        snapshot = self.metrics.snapshot()
+        self.container.clear()
+        with self.container:
+            await self._render_handlers(snapshot["handlers"])
+            await self._render_rooms(snapshot["rooms"])
+
+    async def _render_handlers(self, handlers: dict):
+        """Render per-handler-class throughput."""
+        rows = [{"handler": name, **stats} for name, stats in handlers.items()]
+        with ui.element("div").classes("card"):
+            with ui.element("div").classes("card-header"):
+                ui.label("Handlers").classes("text-lg font-bold")
+            with ui.element("div").classes("card-body"):
+                if not rows:
+                    EmptyState.no_items(
+                        item_name="messages",
+                        message="No race handler messages recorded yet",
+                        icon="sports_score",
+                    )
+                    return
+
+                columns = [
+                    TableColumn(label="Handler", key="handler"),
+                    TableColumn(label="Messages", key="messages"),
+                    TableColumn(label="Last minute", key="rate_per_minute"),
+                    TableColumn(label="Errors", key="errors"),
+                    TableColumn(label="Avg ms", key="avg_ms"),
+                    TableColumn(
+                        label="p95 ms",
+                        cell_render=lambda row: ui.label(
+                            str(row["processing"]["p95_ms"])
+                        ),
+                    ),
+                    TableColumn(
+                        label="Max ms",
+                        cell_render=lambda row: ui.label(
+                            str(row["processing"]["max_ms"])
+                        ),
+                    ),
+                    TableColumn(label="DB ms", key="db_ms"),
+                    TableColumn(label="Listener ms", key="listener_ms"),
+                    TableColumn(label="Other ms", key="other_ms"),
+                    TableColumn(label="Max backlog", key="max_backlog"),
+                ]
+                await ResponsiveTable(columns=columns, rows=rows).render()
+
+    async def _render_rooms(self, rooms: dict):
+        """Render rooms with a running handler."""
+        rows = [{"room": room, **stats} for room, stats in rooms.items()]
+        with ui.element("div").classes("card"):
+            with ui.element("div").classes("card-header"):
+                ui.label("Active Rooms").classes("text-lg font-bold")
+            with ui.element("div").classes("card-body"):
+                if not rows:
+                    EmptyState.no_items(
+                        item_name="rooms",
+                        message="No race handlers running",
+                        icon="meeting_room",
+                    )
+                    return
+
+                columns = [
+                    TableColumn(
+                        label="Room",
+                        cell_render=lambda row: ui.label(row["room"]).classes(
+                            "font-mono text-sm"
+                        ),
+                    ),
+                    TableColumn(label="Handler", key="handler"),
+                    TableColumn(label="Messages", key="messages"),
+                    TableColumn(
+                        label="Backlog",
+                        cell_render=self._render_backlog,
+                    ),
+                    TableColumn(
+                        label="Last message (s ago)", key="last_message_seconds_ago"
+                    ),
+                ]
+                await ResponsiveTable(columns=columns, rows=rows).render()
+
+    @staticmethod
+    def _render_backlog(row: dict):
+        """Render a room's backlog, highlighted when frames are queued."""
+        backlog = row["backlog"]
+        label = ui.label("-" if backlog is None else str(backlog))
+        if backlog:
+            label.classes("text-warning font-bold")
+
+    async def _reset(self):
+        """Discard collected metrics."""
+        self.metrics.reset()
+        await self._refresh()
+        ui.notify("Race handler metrics reset", type="positive")
@@ -0,0 +1,145 @@
+"""
+Seed pool administration view.
+
+Shows pre-generated seed pool depth and generation latency per pool, plus
+request latency and error counters for the randomizer HTTP clients.
+"""
+
+from nicegui import ui
+from components.data_table import ResponsiveTable, TableColumn
+from components.empty_state import EmptyState
+from models import User
+from application.services.randomizer.seed_pool_service import SeedPoolService
+from application.utils.http_client import get_randomizer_http_stats
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SeedPoolView:
+    """Seed pool monitoring view."""
+
+    # Window for claimed-seed and latency statistics
+    STATS_DAYS = 7
+
+    def __init__(self, current_user: User):
+        """
+        Initialize the seed pool view.
+
+        Args:
+            current_user: Currently authenticated admin user
+        """
+        self.current_user = current_user
+        self.service = SeedPoolService()
+        self.table_container = None
+
+    async def render(self):
+        """Render the seed pool monitoring interface."""
+        with ui.column().classes("full-width gap-md"):
+            # Header section
+            with ui.element("div").classes("card"):
+                with ui.element("div").classes("card-header"):
+                    with ui.row().classes("full-width items-center justify-between"):
+                        ui.label("Seed Pool").classes("text-xl font-bold")
+                        ui.button(icon="refresh", on_click=self._refresh).classes(
+                            "btn"
+                        ).props("flat")
+                with ui.element("div").classes("card-body"):
+                    ui.label(
+                        "Pre-generated seeds for upcoming matches and popular presets. "
+                        f"Claimed counts and latency cover the last {self.STATS_DAYS} days."
+                    ).classes("text-secondary")
+
+            self.table_container = ui.column().classes("full-width")
+            await self._refresh()
+
+    async def _refresh(self):
+        """Reload pool stats and re-render the table."""
+        if self.table_container:
+            self.table_container.clear()
+            with self.table_container:
+                await self._render_table()
+                await self._render_http_table()
+
+    async def _render_table(self):
+        """Render the pool stats table."""
+        stats = await self.service.get_pool_stats(
+            self.current_user, since_days=self.STATS_DAYS
+        )
+        if not stats:
+            EmptyState.no_items(
+                item_name="pooled seeds",
+                message="Seeds appear here once the Seed Pool Refill task runs",
+                icon="casino",
+                in_card=True,
+            )
+            return
+
+        def render_preset(row):
+            if row["preset_name"]:
+                ui.label(row["preset_name"])
+            else:
+                ui.label(row["settings_hash"][:12]).classes("text-secondary")
+
+        def render_available(row):
+            color = "positive" if row["available"] or row["reserved"] else "warning"
+            ui.badge(str(row["available"]), color=color)
+
+        def render_latency(row):
+            ui.label(
+                f"{row['avg_generation_ms'] / 1000:.1f}s avg / "
+                f"{row['max_generation_ms'] / 1000:.1f}s max"
+            )
+
+        columns = [
+            TableColumn(label="Randomizer", key="randomizer"),
+            TableColumn(label="Preset", cell_render=render_preset),
+            TableColumn(label="Available", cell_render=render_available),
+            TableColumn(label="Reserved for Matches", key="reserved"),
+            TableColumn(label="Claimed", key="claimed"),
+            TableColumn(label="Generation Time", cell_render=render_latency),
+        ]
+
+        with ui.element("div").classes("card"):
+            with ui.element("div").classes("card-body"):
+                table = ResponsiveTable(columns=columns, rows=stats)
+                await table.render()
+
+    async def _render_http_table(self):
+        """Render randomizer HTTP latency and error counters (since startup)."""
+        rows = [
+            {"randomizer": name, **stats}
+            for name, stats in get_randomizer_http_stats().items()
+        ]
+
+        def render_failures(row):
+            color = "negative" if row["failures"] else "positive"
+            ui.badge(str(row["failures"]), color=color)
+
+        def render_percentiles(row):
+            latency = row["latency"]
+            ui.label(
+                f"{latency['p50_ms']}ms p50 / {latency['p95_ms']}ms p95 / "
+                f"{latency['max_ms']}ms max"
+            )
+
+        columns = [
+            TableColumn(label="Randomizer", key="randomizer"),
+            TableColumn(label="Requests", key="requests"),
+            TableColumn(label="Failures", cell_render=render_failures),
+            TableColumn(label="Retries", key="retries"),
+            TableColumn(label="Rejected (Circuit Open)", key="rejected"),
+            TableColumn(label="Latency", cell_render=render_percentiles),
+        ]
+
+        with ui.element("div").classes("card"):
+            with ui.element("div").classes("card-header"):
+                ui.label("Generator HTTP Latency").classes("text-lg font-bold")
+            with ui.element("div").classes("card-body"):
+                if not rows:
+                    ui.label("No randomizer API requests since startup").classes(
+                        "text-secondary"
+                    )
+                    return
+                table = ResponsiveTable(columns=columns, rows=rows)
+                await table.render()
@@ -5,9 +5,14 @@ Shows a player's own races in an async qualifier with stats and progress.
 """
 
 from __future__ import annotations
+from typing import Optional
 from nicegui import ui
 from models import User
-from modules.async_qualifier.models.async_qualifier import AsyncQualifier, AsyncQualifierRace
+from modules.async_qualifier.models.async_qualifier import (
+    AsyncQualifier,
+    AsyncQualifierParticipantStats,
+    AsyncQualifierRace,
+)
 from components.card import Card
 from components.data_table import ResponsiveTable, TableColumn
 from components.badge import Badge
@@ -32,6 +37,9 @@ class AsyncDashboardView:
         races = await self.service.get_user_races(
             self.user, self.tournament.organization_id, self.tournament.id
         )
+        stats = await self.service.get_participant_stats(
+            self.user, self.tournament.organization_id, self.tournament.id, self.user.id
+        )
 
         # Get pools
         await self.tournament.fetch_related("pools")
@@ -41,10 +49,10 @@ class AsyncDashboardView:
         await self._render_tournament_header()
 
         # Render player stats
-        await self._render_player_stats(races, pools)
+        await self._render_player_stats(stats)
 
         # Render pool progress
-        await self._render_pool_progress(races, pools)
+        await self._render_pool_progress(stats, pools)
 
         # Render races table
         if races:
@@ -77,65 +85,56 @@ class AsyncDashboardView:
                     ).classes("btn-link")
 
     async def _render_player_stats(
-        self, races: list[AsyncQualifierRace], pools
-    ):  # noqa: ARG002
+        self, stats: Optional[AsyncQualifierParticipantStats]
+    ):
         """Render player statistics card."""
-        # Calculate stats
-        completed_races = [
-            r for r in races if r.status == "finished" and not r.reattempted
-        ]
-        forfeited_races = [r for r in races if r.status == "forfeit"]
-        active_races = [r for r in races if r.status in ("pending", "in_progress")]
-        reattempted = any(r.reattempted for r in races)
-
-        # Total score
-        total_score = sum(r.score or 0 for r in completed_races)
-
-        # Best race
-        best_race = (
-            min(completed_races, key=lambda r: r.elapsed_time.total_seconds())
-            if completed_races
-            else None
-        )
+        completed = sum((stats.pool_progress or {}).values()) if stats else 0
 
         with Card.create(title="My Statistics"):
-            stats = [
-                {"value": str(len(completed_races)), "label": "Completed"},
+            stat_items = [
+                {"value": str(completed), "label": "Completed"},
                 {
-                    "value": str(len(forfeited_races)),
+                    "value": str(stats.forfeited_race_count if stats else 0),
                     "label": "Forfeited",
                     "color": "danger",
                 },
-                {"value": str(len(active_races)), "label": "Active", "color": "info"},
                 {
-                    "value": f"{total_score:.1f}",
+                    "value": str(stats.active_race_count if stats else 0),
+                    "label": "Active",
+                    "color": "info",
+                },
+                {
+                    "value": f"{stats.total_score if stats else 0:.1f}",
                     "label": "Total Score",
                     "color": "success",
                 },
             ]
-            StatGrid.render(stats, columns=4)
+            StatGrid.render(stat_items, columns=4)
 
             # Best time
-            if best_race:
+            if stats and stats.best_race_id:
                 with ui.element("div").classes("mt-4"):
                     ui.label("🏆 Personal Best: ").classes("font-bold inline-block")
-                    ui.label(f"{best_race.elapsed_time_formatted}").classes(
+                    ui.label(f"{stats.best_elapsed_time_formatted}").classes(
                         "inline-block text-success"
                     )
-                    await best_race.fetch_related("permalink", "permalink__pool")
-                    ui.label(f" on {best_race.permalink.pool.name}").classes(
-                        "inline-block text-sm"
-                    )
+                    await stats.fetch_related("best_race__permalink__pool")
+                    if stats.best_race:
+                        ui.label(f" on {stats.best_race.permalink.pool.name}").classes(
+                            "inline-block text-sm"
+                        )
 
             # Reattempt status
-            if reattempted:
+            if stats and stats.reattempted_race_count:
                 with ui.element("div").classes("mt-2"):
                     ui.icon("refresh").classes("inline-block text-warning mr-1")
                     ui.label("You have used your reattempt").classes(
                         "text-warning inline-block"
                     )
 
-    async def _render_pool_progress(self, races: list[AsyncQualifierRace], pools: list):
+    async def _render_pool_progress(
+        self, stats: Optional[AsyncQualifierParticipantStats], pools: list
+    ):
         """Render pool completion progress."""
         if not pools:
             return
@@ -144,15 +143,7 @@ class AsyncDashboardView:
             # Calculate pool completion
             pool_stats = {}
             for pool in pools:
-                completed = len(
-                    [
-                        r
-                        for r in races
-                        if not r.reattempted
-                        and r.status == "finished"
-                        and r.permalink.pool_id == pool.id
-                    ]
-                )
+                completed = stats.pool_finished_count(pool.id) if stats else 0
                 total = self.tournament.runs_per_pool
                 pool_stats[pool.id] = {
                     "pool": pool,
@@ -7,12 +7,14 @@ Shows tournament leaderboard with player scores and filtering options.
 from __future__ import annotations
 from nicegui import ui
 from models import User
-from modules.async_qualifier.models.async_qualifier import AsyncQualifier
+from modules.async_qualifier.models.async_qualifier import (
+    AsyncQualifier,
+    AsyncQualifierParticipantStats,
+)
 from components.card import Card
 from components.data_table import ResponsiveTable, TableColumn
 from application.services.async_qualifiers.async_qualifier_service import (
     AsyncQualifierService,
-    LeaderboardEntry,
 )
 
 
@@ -68,7 +70,7 @@ class AsyncLeaderboardView:
                     "Player results will be visible after the tournament ends"
                 ).classes("text-secondary mt-2")
 
-    async def _render_header(self, leaderboard: list[LeaderboardEntry]):
+    async def _render_header(self, leaderboard: list[AsyncQualifierParticipantStats]):
         """Render tournament header with stats."""
         with Card.create(title=f"{self.tournament.name} - Leaderboard"):
             with ui.element("div").classes(
@@ -104,7 +106,7 @@ class AsyncLeaderboardView:
                 )
 
     async def _render_leaderboard_table(
-        self, leaderboard: list[LeaderboardEntry], pools: list
+        self, leaderboard: list[AsyncQualifierParticipantStats], pools: list
     ):
         """Render leaderboard table with filtering."""
         # Sort by score descending
@@ -148,7 +150,7 @@ class AsyncLeaderboardView:
 
     async def _render_filtered_leaderboard(
         self,
-        leaderboard: list[LeaderboardEntry],
+        leaderboard: list[AsyncQualifierParticipantStats],
         pools: list,
         search_term: str,
         min_races: int,
@@ -181,7 +183,7 @@ class AsyncLeaderboardView:
             await self._render_mobile_leaderboard(filtered)
 
     async def _render_desktop_leaderboard(
-        self, leaderboard: list[LeaderboardEntry], pools
+        self, leaderboard: list[AsyncQualifierParticipantStats], pools
     ):  # noqa: ARG002
         """Render desktop leaderboard table."""
         # Create leaderboard with rank data
@@ -240,33 +242,37 @@ class AsyncLeaderboardView:
             rank_display = "🥉 3rd"
         ui.label(rank_display)
 
-    def _render_player(self, entry: LeaderboardEntry):
+    def _render_player(self, entry: AsyncQualifierParticipantStats):
         """Render player cell."""
         player_name = entry.user.get_display_name()
         if entry.user.id == self.user.id:
             player_name += " (You)"
         ui.label(player_name).classes("font-bold")
 
-    def _render_score(self, entry: LeaderboardEntry):
+    def _render_score(self, entry: AsyncQualifierParticipantStats):
         """Render score cell."""
         ui.label(f"{entry.score:.1f}")
 
-    def _render_forfeit(self, entry: LeaderboardEntry):
+    def _render_forfeit(self, entry: AsyncQualifierParticipantStats):
         """Render forfeit cell."""
         forfeit_class = "text-danger" if entry.forfeited_race_count > 0 else ""
         ui.label(str(entry.forfeited_race_count)).classes(forfeit_class)
 
-    def _render_actions(self, entry: LeaderboardEntry):
+    def _render_actions(self, entry: AsyncQualifierParticipantStats):
         """Render actions cell."""
         player_link = f"/org/{self.tournament.organization_id}/async/{self.tournament.id}/player/{entry.user.id}"
         ui.link("View History", player_link).classes("btn-link")  # Internal link
 
-    async def _render_mobile_leaderboard(self, leaderboard: list[LeaderboardEntry]):
+    async def _render_mobile_leaderboard(
+        self, leaderboard: list[AsyncQualifierParticipantStats]
+    ):
         """Render mobile leaderboard cards."""
         for rank, entry in enumerate(leaderboard, 1):
             await self._render_mobile_card(rank, entry)
 
-    async def _render_mobile_card(self, rank: int, entry: LeaderboardEntry):
+    async def _render_mobile_card(
+        self, rank: int, entry: AsyncQualifierParticipantStats
+    ):
         """Render mobile leaderboard card."""
         # Highlight current user
         card_class = "border-primary" if entry.user.id == self.user.id else ""
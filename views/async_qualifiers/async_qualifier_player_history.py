@@ -9,6 +9,7 @@ from nicegui import ui
 from models import User
 from modules.async_qualifier.models.async_qualifier import AsyncQualifier
 from components.card import Card
+from components.stat_card import StatGrid
 from components.data_table import ResponsiveTable, TableColumn
 from components.dialogs.async_qualifiers import RaceReattemptDialog
 from application.services.async_qualifiers.async_qualifier_service import (
@@ -71,9 +72,45 @@ class AsyncPlayerHistoryView:
                     ui.label("No race history").classes("text-secondary")
                 return
 
+            # Player summary
+            stats = await self.service.get_participant_stats(
+                self.current_user,
+                self.tournament.organization_id,
+                self.tournament.id,
+                player.id,
+            )
+            if stats:
+                self._render_stats(stats)
+
             # Races table
             await self._render_races_table(races)
 
+    def _render_stats(self, stats):
+        """Render the player's summary from their participant stats."""
+        with ui.element("div").classes("mb-4"):
+            StatGrid.render(
+                [
+                    {
+                        "value": f"{stats.score:.1f}",
+                        "label": "Score",
+                        "color": "success",
+                    },
+                    {"value": f"{stats.estimate:.1f}", "label": "Estimate"},
+                    {"value": str(stats.finished_race_count), "label": "Completed"},
+                    {
+                        "value": str(stats.forfeited_race_count),
+                        "label": "Forfeited",
+                        "color": "danger",
+                    },
+                    {"value": str(stats.unattempted_race_count), "label": "Remaining"},
+                    {
+                        "value": stats.best_elapsed_time_formatted,
+                        "label": "Personal Best",
+                    },
+                ],
+                columns=3,
+            )
+
     async def _render_races_table(self, races):
         """Render table of races."""
         # Define columns
@@ -12,7 +12,7 @@ from models import User
 from modules.async_qualifier.models.async_qualifier import AsyncQualifier
 from components.card import Card
 from components.empty_state import EmptyState
-from components.data_table import ResponsiveTable, TableColumn
+from components.data_table import ListDataProvider, PaginatedTable, TableColumn
 from components.dialogs.async_qualifiers import RaceReviewDialog
 
 
@@ -193,8 +193,13 @@ class AsyncReviewQueueView:
                     }
                 )
 
-            # Render the responsive table
-            table = ResponsiveTable(columns=columns, rows=rows, table_classes="mt-4")
+            # Render the responsive table (one page of rows at a time)
+            table = PaginatedTable(
+                columns=columns,
+                provider=ListDataProvider(rows),
+                page_size=50,
+                table_classes="mt-4",
+            )
 
             # Run the render in an async context
             async def render_table():